@@ -8,6 +8,7 @@ environment-driven security settings.
 from pathlib import Path
 import os
 import sys
+import tempfile
 from urllib.parse import urlparse
 
 import dj_database_url
@@ -75,13 +76,16 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "phonics.compression.CompressionMiddleware",
     "phonics.middleware.RequestIDMiddleware",
     "phonics.middleware.RequestTimingMiddleware",
+    "phonics.query_audit.QueryAuditMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "phonics.middleware.EntitlementMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -91,7 +95,7 @@ ROOT_URLCONF = "abcz.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "phonics.template_backend.TimedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -184,6 +188,27 @@ else:
 SUBSCRIPTION_CACHE_TIMEOUT = 0 if TESTING else int(os.getenv("SUBSCRIPTION_CACHE_TIMEOUT", "300"))
 STATIC_CONTENT_CACHE_TIMEOUT = 0 if TESTING else int(os.getenv("STATIC_CONTENT_CACHE_TIMEOUT", "1800"))
 PUBLIC_PAGE_CACHE_TIMEOUT = int(os.getenv("PUBLIC_PAGE_CACHE_TIMEOUT", "600"))
+# Per-worker LRU in front of the shared cache for static content keys.
+LOCAL_CACHE_TIMEOUT = int(os.getenv("LOCAL_CACHE_TIMEOUT", "60"))
+LOCAL_CACHE_MAX_ENTRIES = int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", "512"))
+LOCAL_CACHE_GENERATION_CHECK_SECONDS = 0 if TESTING else float(os.getenv("LOCAL_CACHE_GENERATION_CHECK_SECONDS", "2"))
+# Sorted-set leaderboard index on the Redis cache connection; build it with `manage.py rebuild_leaderboard`
+# (boards that reads flag are rebuilt by the `--repair-index` cron in render.yaml).
+LEADERBOARD_REDIS_ENABLED = bool(REDIS_URL) and env_bool("LEADERBOARD_REDIS_ENABLED", "True")
+# Static markup of the learning pages is rendered once per plan variant; the version is part of
+# every fragment key, so a new deploy (RENDER_GIT_COMMIT) or an explicit bump drops the old ones.
+PAGE_FRAGMENT_CACHE_TIMEOUT = 0 if DEBUG or TESTING else int(os.getenv("PAGE_FRAGMENT_CACHE_TIMEOUT", "86400"))
+PAGE_FRAGMENT_CACHE_VERSION = (
+    os.getenv("PAGE_FRAGMENT_CACHE_VERSION", "").strip() or os.getenv("RENDER_GIT_COMMIT", "").strip()[:12] or "v1"
+)
+# Rendered HTML/JSON responses are gzip- (or Brotli-, when installed) compressed above this size;
+# bodies shared by every user (public cache_page views, CVC API pages) are compressed once per cache fill.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_CACHE_TIMEOUT = 0 if TESTING else int(os.getenv("COMPRESSION_CACHE_TIMEOUT", "3600"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+# How long `/api/progress/batch/` remembers an idempotency key; the daily `abcz-purge-batch-receipts` cron
+# (render.yaml) runs `manage.py purge_progress_batch_receipts`.
+PROGRESS_BATCH_RECEIPT_RETENTION_DAYS = int(os.getenv("PROGRESS_BATCH_RECEIPT_RETENTION_DAYS", "14"))
 
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -205,6 +230,27 @@ STATIC_ROOT = Path(os.getenv("STATIC_ROOT", str(BASE_DIR / "staticfiles")))
 STATICFILES_DIRS = [BASE_DIR / "static"]
 MEDIA_URL = "/media/"
 MEDIA_ROOT = Path(os.getenv("MEDIA_ROOT", str(BASE_DIR / "media")))
+# Generated downloads (worksheet book PDF/DOCX, emoji atlas). `build_artifacts` and `build_emoji_atlas` write
+# them into ARTIFACTS_BUILD_ROOT inside the code checkout during build.sh (the media disk is not mounted then);
+# anything missing there is built at runtime under ARTIFACTS_ROOT.
+ARTIFACTS_BUILD_ROOT = Path(
+    os.getenv("ARTIFACTS_BUILD_ROOT", "")
+    or (Path(tempfile.gettempdir()) / "abcz-test-artifacts-build" if TESTING else BASE_DIR / "build" / "artifacts")
+)
+ARTIFACTS_ROOT = Path(
+    os.getenv("ARTIFACTS_ROOT", "")
+    or (Path(tempfile.gettempdir()) / "abcz-test-artifacts" if TESTING else MEDIA_ROOT / "artifacts")
+)
+ARTIFACT_VERSION = os.getenv("ARTIFACT_VERSION", "").strip() or os.getenv("RENDER_GIT_COMMIT", "").strip()[:12] or "v1"
+# Certificates and worksheet books are built by `manage.py run_document_jobs`; views answer 202 until the file
+# is ready. Eager mode (tests, the dev server) builds them inline on the request instead.
+DOCUMENT_JOBS_EAGER = TESTING or env_bool("DOCUMENT_JOBS_EAGER", "True" if DEBUG else "False")
+DOCUMENT_JOB_POLL_SECONDS = int(os.getenv("DOCUMENT_JOB_POLL_SECONDS", "2"))
+DOCUMENT_JOB_STALE_SECONDS = int(os.getenv("DOCUMENT_JOB_STALE_SECONDS", "300"))
+DOCUMENT_JOB_MAX_ATTEMPTS = int(os.getenv("DOCUMENT_JOB_MAX_ATTEMPTS", "3"))
+DOCUMENT_JOB_RETENTION_DAYS = int(os.getenv("DOCUMENT_JOB_RETENTION_DAYS", "7"))
+# "reportlab" draws certificates from a layout compiled once per process; "html" always uses the xhtml2pdf template.
+CERTIFICATE_RENDERER = os.getenv("CERTIFICATE_RENDERER", "reportlab").strip().lower()
 STATICFILES_BACKEND = (
     "django.contrib.staticfiles.storage.StaticFilesStorage"
     if DEBUG or TESTING
@@ -261,6 +307,16 @@ LOGOUT_REDIRECT_URL = "/"
 DISABLE_AUTO_SEED = env_bool("DISABLE_AUTO_SEED", "False")
 REQUEST_LOG_ENABLED = (not TESTING) and env_bool("REQUEST_LOG_ENABLED", "True")
 ENABLE_SERVER_TIMING_HEADER = env_bool("ENABLE_SERVER_TIMING_HEADER", "False")
+# Staff always get the db/cache/tmpl Server-Timing breakdown; this fraction (0-1) of other requests gets it too.
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv("SERVER_TIMING_SAMPLE_RATE", "0"))
+# Staging: log requests that repeat one SQL statement more than QUERY_AUDIT_THRESHOLD times (N+1 queries).
+QUERY_AUDIT_ENABLED = env_bool("QUERY_AUDIT_ENABLED", "False")
+QUERY_AUDIT_THRESHOLD = int(os.getenv("QUERY_AUDIT_THRESHOLD", "5"))
+# Per-view latency histograms plus DB/cache counters on /metrics (Prometheus text format). Workers flush their
+# increments into one Redis hash every METRICS_FLUSH_SECONDS; scrape with `Authorization: Bearer $METRICS_TOKEN`.
+METRICS_ENABLED = env_bool("METRICS_ENABLED", "True")
+METRICS_FLUSH_SECONDS = 0 if TESTING else float(os.getenv("METRICS_FLUSH_SECONDS", "10"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "").strip()
 
 
 # Payment integration placeholders. Keep real secrets in environment variables only.
@@ -407,7 +463,8 @@ LOGGING = {
         "request": {
             "format": (
                 "%(asctime)s %(levelname)s %(name)s request_id=%(request_id)s "
-                "method=%(method)s path=%(path)s status=%(status_code)s duration_ms=%(duration_ms)s"
+                "method=%(method)s path=%(path)s status=%(status_code)s duration_ms=%(duration_ms)s "
+                "db_queries=%(db_queries)s db_ms=%(db_ms)s cache_ms=%(cache_ms)s tmpl_ms=%(tmpl_ms)s pdf_ms=%(pdf_ms)s"
             )
         },
         "standard": {
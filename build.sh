@@ -9,6 +9,8 @@ case "$(printf '%s' "$RUN_MIGRATIONS" | tr '[:upper:]' '[:lower:]')" in
   1|true|yes|on)
     echo "==> Running database migrations..."
     python manage.py migrate --noinput
+    echo "==> Rebuilding leaderboard entries..."
+    python manage.py rebuild_leaderboard
     ;;
   *)
     echo "==> Skipping database migrations during build."
@@ -18,4 +20,10 @@ esac
 echo "==> Collecting static files..."
 python manage.py collectstatic --noinput
 
+echo "==> Building worksheet emoji atlas..."
+python manage.py build_emoji_atlas
+
+echo "==> Building worksheet book downloads..."
+python manage.py build_artifacts
+
 echo "==> Build finished successfully."
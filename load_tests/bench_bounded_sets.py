@@ -0,0 +1,70 @@
+"""Microbenchmark: plain JSON lists versus ``BoundedSet`` for progress list columns.
+
+Simulates a stream of progress events against one capped list the way the
+progress writers use it: a membership check, an append, the cap, and the JSON
+encode done on save. The list version scans and re-encodes on every event; the
+``BoundedSet`` version uses set membership and only encodes when ``dirty``.
+
+    python -m load_tests.bench_bounded_sets --limit 300 --events 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+
+from phonics.fields import BoundedSet
+
+
+def _events(count: int, vocabulary: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [f"word-{rng.randrange(vocabulary)}" for _ in range(count)]
+
+
+def run_list(events: list[str], limit: int) -> int:
+    values = []
+    writes = 0
+    for item in events:
+        if item not in values:
+            values.append(item)
+        values = values[:limit]
+        json.dumps(values)
+        writes += 1
+    return writes
+
+
+def run_bounded_set(events: list[str], limit: int) -> int:
+    values = BoundedSet((), limit)
+    writes = 0
+    for item in events:
+        values.add(item)
+        if values.dirty:
+            json.dumps(values)
+            values.dirty = False
+            writes += 1
+    return writes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=300)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--vocabulary", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    events = _events(args.events, args.vocabulary, args.seed)
+    results = {}
+    for name, runner in (("list", run_list), ("bounded_set", run_bounded_set)):
+        seconds = min(timeit.repeat(lambda: runner(events, args.limit), number=1, repeat=args.repeat))
+        results[name] = (seconds, runner(events, args.limit))
+
+    for name, (seconds, writes) in results.items():
+        print(f"{name:12s} {seconds * 1000:9.2f} ms  {seconds / args.events * 1e6:8.2f} us/event  writes={writes}")
+    print(f"speedup      {results['list'][0] / results['bounded_set'][0]:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
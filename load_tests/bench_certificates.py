@@ -0,0 +1,46 @@
+"""Microbenchmark: ReportLab compiled-layout certificates versus the xhtml2pdf template path.
+
+Renders the same certificate through both paths and prints the time per PDF.
+Needs no database.
+
+    python -m load_tests.bench_certificates --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+from datetime import date
+
+import django
+
+
+def _setup():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "abcz.settings")
+    django.setup()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--name", default="Benchmark Student")
+    args = parser.parse_args(argv)
+
+    _setup()
+    from phonics.certificates import render_certificate_html, render_certificate_reportlab
+
+    today = date.today()
+    results = {}
+    for label, render in (("html", render_certificate_html), ("reportlab", render_certificate_reportlab)):
+        def build():
+            return render(args.name, today, 2400)
+
+        size = len(build())
+        seconds = min(timeit.repeat(build, number=args.repeat, repeat=3)) / args.repeat
+        results[label] = seconds
+        print(f"{label:10s} {size / 1024:7.1f} KB  {seconds * 1000:8.3f} ms per certificate")
+    print(f"speedup {results['html'] / results['reportlab']:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Microbenchmark: full template render versus fragment-cached render of the learning pages.
+
+Renders each page template with a representative context, once with the
+fragment cache disabled (every request renders all of the static markup) and
+once with it warm (only the per-user parts are rendered). Uses the local
+in-memory cache unless REDIS_URL is set, and needs no database.
+
+    python -m load_tests.bench_page_fragments --repeat 200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import timeit
+
+import django
+
+
+def _setup():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "abcz.settings")
+    django.setup()
+
+
+def _contexts():
+    from phonics.json_bundles import bundle_json
+    from phonics.views import SOUNDS_PAGE_BUNDLES
+
+    features = {
+        "wordwall": True,
+        "letterWorksheets": True,
+        "worksheetBook": True,
+        "leaderboard": True,
+        "smartBird": True,
+        "parentReport": True,
+        "certificate": True,
+    }
+    return {
+        "letters.html": ("letters", {
+            "is_authenticated": False,
+            "is_premium_user": False,
+            "is_vip_user": False,
+            "level_one_plan": "free",
+            "level_one_disabled_features": features,
+            "is_developer_vip_preview": False,
+            "student_profile_json": "{}",
+            "bird_lottie_files_json": bundle_json("bird_lottie_files"),
+        }, {"level_one_disabled_features": features, "is_vip_user": False}),
+        "sounds.html": ("sounds", {
+            **{f"{name}_json": bundle_json(name) for name in SOUNDS_PAGE_BUNDLES},
+            "sound_progress_json": json.dumps({"completed_items": []}),
+        }, {}),
+        "phonics/cvc_reading.html": ("cvc_reading", {"cvc_progress_json": "{}"}, {}),
+        "level_four.html": ("level_four", {"section_mode": "overview"}, {"section_mode": "overview"}),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    _setup()
+    from django.conf import settings
+    from django.contrib.auth.models import AnonymousUser
+    from django.template.loader import render_to_string
+    from django.test import RequestFactory, override_settings
+
+    from phonics.page_fragments import fragment_context
+
+    request = RequestFactory().get("/")
+    request.user = AnonymousUser()
+    # Plain static storage so the benchmark does not need a collectstatic manifest.
+    storages = {**settings.STORAGES, "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"}}
+
+    for template, (page, context, variant) in _contexts().items():
+        results = {}
+        for label, timeout in (("full", 0), ("fragment", 300)):
+            with override_settings(
+                STORAGES=storages,
+                PAGE_FRAGMENT_CACHE_TIMEOUT=timeout,
+                PAGE_FRAGMENT_CACHE_VERSION=f"bench-{os.getpid()}",
+            ):
+                full_context = {**context, **fragment_context(page, **variant)}
+
+                def render():
+                    return render_to_string(template, full_context, request=request)
+
+                size = len(render().encode("utf-8"))
+                seconds = min(timeit.repeat(render, number=args.repeat, repeat=3)) / args.repeat
+                results[label] = seconds
+        print(f"{template:28s} {size / 1024:7.1f} KB  full {results['full'] * 1000:7.3f} ms"
+              f"  fragment {results['fragment'] * 1000:7.3f} ms  speedup {results['full'] / results['fragment']:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
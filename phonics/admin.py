@@ -7,8 +7,8 @@ from .admin_audit import log_admin_action
 from .models import (
     Student, StudentProfile, LetterProgress,
     BirdTutorProgress, BirdReviewItem, SoundPracticeProgress, ExternalGame,
-    CVCWord, CVCSentence, CVCStory, CVCProgress, CVCReadingProgress,
-    EnglishFoundationProgress, UserSubscription, PaymentOrder, PaymentWebhookEvent,
+    CVCWord, CVCSentence, CVCStory, CVCProgress, CVCReadingProgress, CVCProgressEvent, ProgressBatchReceipt,
+    EnglishFoundationProgress, LeaderboardEntry, DocumentJob, UserSubscription, PaymentOrder, PaymentWebhookEvent,
     PaymentActivationReview, AdminAuditLog,
     TopGoalUnit, TopGoalVocabulary, TopGoalSentence, TopGoalQuiz
 )
@@ -279,6 +279,43 @@ class CVCReadingProgressAdmin(ViewOnlyAdminMixin, admin.ModelAdmin):
     list_per_page = 50
 
 
+@admin.register(CVCProgressEvent)
+class CVCProgressEventAdmin(ViewOnlyAdminMixin, admin.ModelAdmin):
+    list_display = ['id', 'user', 'event_type', 'created_at']
+    list_filter = ['event_type']
+    search_fields = ['user__username', 'user__email']
+    readonly_fields = [field.name for field in CVCProgressEvent._meta.fields]
+    list_select_related = ['user']
+    list_per_page = 50
+
+
+@admin.register(ProgressBatchReceipt)
+class ProgressBatchReceiptAdmin(ViewOnlyAdminMixin, admin.ModelAdmin):
+    list_display = ['id', 'user', 'idempotency_key', 'created_at']
+    search_fields = ['user__username', 'user__email', 'idempotency_key']
+    readonly_fields = [field.name for field in ProgressBatchReceipt._meta.fields]
+    list_select_related = ['user']
+    list_per_page = 50
+
+
+@admin.register(LeaderboardEntry)
+class LeaderboardEntryAdmin(ViewOnlyAdminMixin, admin.ModelAdmin):
+    list_display = ['display_name', 'grade', 'total_points', 'completed_letters', 'week_points', 'month_points', 'last_activity_at']
+    list_filter = ['grade']
+    search_fields = ['display_name', 'user__username', 'student__name']
+    list_select_related = ['user', 'student']
+    list_per_page = 50
+
+
+@admin.register(DocumentJob)
+class DocumentJobAdmin(ViewOnlyAdminMixin, admin.ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['kind', 'status']
+    search_fields = ['job_key']
+    readonly_fields = [field.name for field in DocumentJob._meta.fields]
+    list_per_page = 50
+
+
 @admin.register(LetterProgress)
 class LetterProgressAdmin(ViewOnlyAdminMixin, admin.ModelAdmin):
     list_display = ['user', 'student', 'letter', 'total_score', 'score', 'completed', 'passed', 'attempts', 'completed_at', 'last_updated_at']
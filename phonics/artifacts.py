@@ -0,0 +1,150 @@
+"""Generated download files (the letters worksheet book PDF/DOCX), built once per content version.
+
+Each registered artifact names an ``inputs`` callable that returns everything the
+output depends on, and a ``build`` callable that turns those inputs into bytes.
+The file is named ``<name>-<digest><suffix>``, where the digest hashes the inputs
+and ``ARTIFACT_VERSION`` (the deployed commit by default). A download therefore
+only recomputes the inputs and then streams an existing file. Files are written
+atomically, so concurrent builders and readers never see a partial one.
+
+``manage.py build_artifacts`` builds every artifact during ``build.sh`` into
+``ARTIFACTS_BUILD_ROOT``, a directory inside the deployed code, and removes older
+versions there. At runtime that directory is only read. A file missing from it
+(the build step did not run, or the inputs changed since) is built under
+``ARTIFACTS_ROOT`` on the persistent disk, which is not mounted during the build;
+the first download queues that build as a document job (see ``document_jobs``).
+Requests never delete files, so instances on different versions can share one
+disk during a rolling deploy.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from django.conf import settings
+from django.http import FileResponse
+
+from . import metrics
+from .conditional import not_modified, with_etag
+
+
+@dataclass(frozen=True)
+class ArtifactSpec:
+    name: str
+    filename: str
+    content_type: str
+    inputs: Callable[[], Any]
+    # ``build(inputs, root)``: ``root`` is the directory passed to ``ensure_artifact`` (``None`` at
+    # runtime), so intermediate files such as the emoji atlas land beside the artifact.
+    build: Callable[[Any, Path | None], bytes]
+
+
+@dataclass(frozen=True)
+class BuiltArtifact:
+    spec: ArtifactSpec
+    path: Path
+    digest: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+
+_specs: dict[str, ArtifactSpec] = {}
+_locks: dict[str, threading.Lock] = {}
+
+
+def register_artifact(spec: ArtifactSpec) -> None:
+    _specs[spec.name] = spec
+    _locks.setdefault(spec.name, threading.Lock())
+
+
+def registered_artifacts() -> list[str]:
+    return list(_specs)
+
+
+def artifacts_root() -> Path:
+    """Writable directory for files built at runtime."""
+    return Path(settings.ARTIFACTS_ROOT)
+
+
+def prebuilt_root() -> Path:
+    """Directory ``build.sh`` fills; read-only at runtime."""
+    return Path(settings.ARTIFACTS_BUILD_ROOT)
+
+
+def artifact_path(filename: str, root: Path | None = None) -> Path:
+    """``filename`` under ``root``; by default the prebuilt copy if there is one, else the runtime one."""
+    if root is not None:
+        return Path(root) / filename
+    prebuilt = prebuilt_root() / filename
+    return prebuilt if prebuilt.exists() else artifacts_root() / filename
+
+
+def artifact_digest(spec: ArtifactSpec, inputs) -> str:
+    payload = json.dumps([spec.name, settings.ARTIFACT_VERSION, inputs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def write_atomically(path: Path, content: bytes) -> None:
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(handle, "wb") as output:
+            output.write(content)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def locate_artifact(name: str, root: Path | None = None) -> tuple[BuiltArtifact, Any]:
+    """Where artifact ``name`` lives for the current inputs, plus those inputs; the file may not exist yet."""
+    spec = _specs[name]
+    inputs = spec.inputs()
+    digest = artifact_digest(spec, inputs)
+    path = artifact_path(f"{name}-{digest}{Path(spec.filename).suffix}", root)
+    return BuiltArtifact(spec, path, digest), inputs
+
+
+def ensure_artifact(name: str, root: Path | None = None) -> BuiltArtifact:
+    """The current file for artifact ``name``, building it under ``root`` (default: runtime) if missing."""
+    artifact, inputs = locate_artifact(name, root)
+    if not artifact.path.exists():
+        with _locks[name]:
+            if not artifact.path.exists():
+                artifact.path.parent.mkdir(parents=True, exist_ok=True)
+                with metrics.timed("pdf"):
+                    content = artifact.spec.build(inputs, root)
+                write_atomically(artifact.path, content)
+    return artifact
+
+
+def prune_artifact(artifact: BuiltArtifact) -> list[Path]:
+    """Delete the files of every other version of ``artifact`` in its directory; returns what was removed."""
+    removed = []
+    for stale in artifact.path.parent.glob(f"{artifact.spec.name}-*{artifact.path.suffix}"):
+        if stale != artifact.path:
+            stale.unlink(missing_ok=True)
+            removed.append(stale)
+    return removed
+
+
+def serve_artifact(request, artifact: BuiltArtifact):
+    """Stream a built artifact as an attachment with a strong ETag and Content-Length."""
+    unchanged = not_modified(request, artifact.etag)
+    if unchanged is not None:
+        return unchanged
+    response = FileResponse(
+        artifact.path.open("rb"),
+        as_attachment=True,
+        filename=artifact.spec.filename,
+        content_type=artifact.spec.content_type,
+    )
+    return with_etag(response, artifact.etag)
+
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from collections.abc import Callable, Iterable
 from typing import TypeVar
 
 from django.conf import settings
 from django.core.cache import cache
 
+from .metrics import cache_event_totals, record_cache_event, record_cache_lookup, record_cache_write, registry
+
 
 T = TypeVar("T")
 USER_CACHE_VERSION = "v1"
 STATIC_CACHE_VERSION = "v1"
 
+# Single-flight tuning: the lease bounds how long one recomputation may hold a key,
+# waiters poll for at most WAIT seconds before computing themselves, and BETA scales
+# how early (relative to the last compute time) a fresh value may be refreshed.
+SINGLE_FLIGHT_LEASE_SECONDS = 30
+SINGLE_FLIGHT_WAIT_SECONDS = 2.0
+SINGLE_FLIGHT_POLL_SECONDS = 0.05
+SINGLE_FLIGHT_BETA = 1.0
+_ENVELOPE_MARKER = "single-flight:v1"
+
 
 def user_cache_key(kind: str, user_id: int) -> str:
     return f"user:{kind}:{USER_CACHE_VERSION}:{user_id}"
@@ -28,18 +45,37 @@ def static_content_cache_timeout() -> int:
     return int(getattr(settings, "STATIC_CONTENT_CACHE_TIMEOUT", 1800))
 
 
+def local_cache_timeout() -> int:
+    return int(getattr(settings, "LOCAL_CACHE_TIMEOUT", 60))
+
+
+def local_cache_max_entries() -> int:
+    return int(getattr(settings, "LOCAL_CACHE_MAX_ENTRIES", 512))
+
+
+def local_cache_generation_check_seconds() -> float:
+    return float(getattr(settings, "LOCAL_CACHE_GENERATION_CHECK_SECONDS", 2))
+
+
 def safe_cache_get(key: str):
+    started_at = time.perf_counter()
     try:
-        return cache.get(key)
+        value = cache.get(key)
     except Exception:
+        record_cache_lookup(False, time.perf_counter() - started_at)
         return None
+    record_cache_lookup(value is not None, time.perf_counter() - started_at)
+    return value
 
 
 def safe_cache_set(key: str, value, timeout: int | None = None) -> None:
+    started_at = time.perf_counter()
     try:
         cache.set(key, value, timeout=timeout)
     except Exception:
         return
+    finally:
+        record_cache_write(time.perf_counter() - started_at)
 
 
 def safe_cache_delete(key: str) -> None:
@@ -57,62 +93,281 @@ def safe_cache_delete_many(keys: Iterable[str]) -> None:
             safe_cache_delete(key)
 
 
-def get_cached_user_group_slugs(user, calculator: Callable[[], set[str]]) -> set[str]:
-    return set(_get_cached_user_list(user.pk, "group-slugs", calculator))
-
-
-def get_cached_active_plan_codes(user, calculator: Callable[[], set[str]]) -> set[str]:
-    return set(_get_cached_user_list(user.pk, "active-plan-codes", calculator))
+def single_flight_counters() -> dict[str, int]:
+    """Totals of every ``metrics.CACHE_EVENTS`` outcome, as exported on ``/metrics``."""
+    return cache_event_totals()
+
+
+def reset_single_flight_counters() -> None:
+    """Clear the metrics registry, cache counters included (tests)."""
+    registry.reset()
+
+
+def cache_tier_stats() -> dict[str, dict[str, float]]:
+    """Hit ratios for the per-worker tier and the shared cache tier behind it."""
+    counters = single_flight_counters()
+
+    def tier(hits: int, misses: int) -> dict[str, float]:
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_ratio": round(hits / total, 4) if total else 0.0}
+
+    return {
+        "local": tier(counters["local_hits"], counters["local_misses"]),
+        "shared": tier(counters["hits"] + counters["stale_serves"], counters["misses"] + counters["waits"]),
+    }
+
+
+class LocalCacheTier:
+    """Bounded per-worker LRU with TTL for values that rarely change.
+
+    Entries are dropped as a whole whenever the shared generation token changes,
+    which is how ``invalidate_static_cache`` (or a cleared shared cache) reaches
+    every gunicorn worker; each worker re-reads the token at most once per
+    ``LOCAL_CACHE_GENERATION_CHECK_SECONDS``.
+    """
+
+    generation_key = "local-tier:generation"
+
+    def __init__(self):
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = None
+        self._checked_at = 0.0
+
+    def get(self, key: str):
+        self._sync_generation()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, timeout: int) -> None:
+        max_entries = local_cache_max_entries()
+        if timeout <= 0 or max_entries <= 0:
+            return
+        self._sync_generation()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def bump_generation(self) -> None:
+        """Make every worker drop its local entries on its next generation check."""
+        self.clear()
+        token = uuid.uuid4().hex
+        safe_cache_set(self.generation_key, token, timeout=None)
+        self._generation = token
+        self._checked_at = time.monotonic()
+
+    def _sync_generation(self) -> None:
+        now = time.monotonic()
+        if self._generation is not None and now - self._checked_at < local_cache_generation_check_seconds():
+            return
+        token = safe_cache_get(self.generation_key)
+        if token is None:
+            try:
+                cache.add(self.generation_key, uuid.uuid4().hex, timeout=None)
+            except Exception:
+                pass
+            token = safe_cache_get(self.generation_key)
+        if token != self._generation:
+            self.clear()
+            self._generation = token
+        self._checked_at = now
+
+
+local_cache = LocalCacheTier()
+
+
+def _unwrap(stored, validate: Callable[[object], bool]):
+    """Return ``(value, soft_expiry, compute_seconds)`` for a valid envelope, else ``None``."""
+    if not isinstance(stored, dict) or stored.get("marker") != _ENVELOPE_MARKER:
+        return None
+    value = stored.get("value")
+    if not validate(value):
+        return None
+    return value, stored.get("soft_expiry"), float(stored.get("compute_seconds") or 0)
+
+
+def _compute_and_store(
+    key: str,
+    calculator: Callable[[], T],
+    timeout: int | None,
+    *,
+    ttl_for: Callable[[T], int | None] | None = None,
+    serve_stale: bool = True,
+) -> T:
+    record_cache_event("recomputes")
+    started = time.monotonic()
+    value = calculator()
+    compute_seconds = time.monotonic() - started
+    if ttl_for is not None:
+        value_ttl = ttl_for(value)
+        if value_ttl is not None:
+            timeout = value_ttl if timeout is None else min(timeout, value_ttl)
+    if timeout is not None and timeout <= 0:
+        return value
+    envelope = {
+        "marker": _ENVELOPE_MARKER,
+        "value": value,
+        "soft_expiry": None if timeout is None else time.time() + timeout,
+        "compute_seconds": compute_seconds,
+    }
+    # Keep the value past its soft expiry so concurrent readers can be served stale
+    # while the lease holder recomputes.
+    hard_timeout = timeout * 2 if timeout is not None and serve_stale else timeout
+    safe_cache_set(key, envelope, timeout=hard_timeout)
+    return value
 
 
-def get_cached_feature_keys(user, calculator: Callable[[], set[str]]) -> set[str]:
-    return set(_get_cached_user_list(user.pk, "feature-keys", calculator))
+def _acquire_lease(key: str) -> str | None:
+    token = uuid.uuid4().hex
+    try:
+        return token if cache.add(f"{key}:lease", token, timeout=SINGLE_FLIGHT_LEASE_SECONDS) else None
+    except Exception:
+        return token
 
 
-def get_cached_subscription_plan(user, calculator: Callable[[], str]) -> str:
-    key = user_cache_key("subscription-plan", user.pk)
-    cached = safe_cache_get(key)
-    if isinstance(cached, str):
-        return cached
-    value = calculator()
-    safe_cache_set(key, value, timeout=subscription_cache_timeout())
-    return value
+def _release_lease(key: str, token: str) -> None:
+    lease_key = f"{key}:lease"
+    if safe_cache_get(lease_key) == token:
+        safe_cache_delete(lease_key)
 
 
-def _get_cached_user_list(user_id: int, kind: str, calculator: Callable[[], set[str]]) -> list[str]:
-    key = user_cache_key(kind, user_id)
-    cached = safe_cache_get(key)
-    if isinstance(cached, list):
-        return [str(item) for item in cached]
-    values = sorted(str(item) for item in calculator())
-    safe_cache_set(key, values, timeout=subscription_cache_timeout())
-    return values
+def _compute_under_lease(key: str, store: Callable[[], T], token: str) -> T:
+    try:
+        return store()
+    finally:
+        _release_lease(key, token)
+
+
+def get_or_compute(
+    key: str,
+    calculator: Callable[[], T],
+    *,
+    timeout: int | None,
+    validate: Callable[[object], bool] | None = None,
+    local: bool = False,
+    ttl_for: Callable[[T], int | None] | None = None,
+    serve_stale: bool = True,
+) -> T:
+    """Read-through cache where one caller per key recomputes and the rest wait or serve stale.
+
+    Fresh values are refreshed early with probability rising towards expiry
+    (scaled by how long the last computation took). Past the soft expiry the
+    lease holder recomputes while other callers keep receiving the stale value.
+    On a cold miss, callers without the lease poll briefly for the winner's value
+    before computing themselves. A ``timeout`` of 0 disables caching.
+
+    ``local=True`` puts the per-worker LRU tier in front, for content keys that
+    only change through ``invalidate_static_cache``; callers must treat the
+    returned value as read-only because it is shared between requests.
+
+    ``ttl_for`` may shorten the timeout per value (e.g. to a subscription's
+    expiry); with ``serve_stale=False`` a value is never returned past it.
+    """
+    validate = validate or (lambda value: value is not None)
+    if timeout == 0:
+        record_cache_event("misses")
+        return calculator()
+
+    if local:
+        value = local_cache.get(key)
+        if value is not None and validate(value):
+            record_cache_event("local_hits")
+            return value
+        record_cache_event("local_misses")
+        value = get_or_compute(key, calculator, timeout=timeout, validate=validate)
+        local_cache.set(key, value, local_cache_timeout() if timeout is None else min(timeout, local_cache_timeout()))
+        return value
+
+    def store():
+        return _compute_and_store(key, calculator, timeout, ttl_for=ttl_for, serve_stale=serve_stale)
+
+    def usable(envelope):
+        return envelope is not None and (
+            serve_stale or envelope[1] is None or time.time() < envelope[1]
+        )
+
+    cached = _unwrap(safe_cache_get(key), validate)
+    if usable(cached):
+        value, soft_expiry, compute_seconds = cached
+        now = time.time()
+        if soft_expiry is None:
+            record_cache_event("hits")
+            return value
+        expired = now >= soft_expiry
+        early = not expired and (
+            now - compute_seconds * SINGLE_FLIGHT_BETA * math.log(random.random() or 1e-12) >= soft_expiry
+        )
+        if not expired and not early:
+            record_cache_event("hits")
+            return value
+        token = _acquire_lease(key)
+        if token is None:
+            record_cache_event("stale_serves" if expired else "hits")
+            return value
+        record_cache_event("misses" if expired else "early_refreshes")
+        return _compute_under_lease(key, store, token)
+
+    record_cache_event("misses")
+    token = _acquire_lease(key)
+    if token is not None:
+        return _compute_under_lease(key, store, token)
+
+    record_cache_event("waits")
+    deadline = time.monotonic() + SINGLE_FLIGHT_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(SINGLE_FLIGHT_POLL_SECONDS)
+        cached = _unwrap(safe_cache_get(key), validate)
+        if usable(cached):
+            return cached[0]
+    return store()
+
+
+def get_cached_entitlements(
+    user_id: int,
+    calculator: Callable[[], dict],
+    *,
+    ttl_for: Callable[[dict], int | None],
+) -> dict:
+    """One compact entitlement blob per user, never served past ``ttl_for(blob)``."""
+    return get_or_compute(
+        user_cache_key("entitlements", user_id),
+        calculator,
+        timeout=subscription_cache_timeout(),
+        validate=lambda value: isinstance(value, dict),
+        ttl_for=ttl_for,
+        serve_stale=False,
+    )
 
 
 def invalidate_user_subscription_cache(user_id: int | None) -> None:
     if not user_id:
         return
-    safe_cache_delete_many([
-        user_cache_key("group-slugs", user_id),
-        user_cache_key("active-plan-codes", user_id),
-        user_cache_key("subscription-plan", user_id),
-        user_cache_key("feature-keys", user_id),
-    ])
+    safe_cache_delete(user_cache_key("entitlements", user_id))
 
 
 def get_cached_static_value(kind: str, calculator: Callable[[], T], *, timeout: int | None = None) -> T:
-    key = static_cache_key(kind)
-    cached = safe_cache_get(key)
-    if cached is not None:
-        return cached
-    value = calculator()
-    safe_cache_set(
-        key,
-        value,
+    return get_or_compute(
+        static_cache_key(kind),
+        calculator,
         timeout=static_content_cache_timeout() if timeout is None else timeout,
+        local=True,
     )
-    return value
 
 
 def invalidate_static_cache(kind: str) -> None:
     safe_cache_delete(static_cache_key(kind))
+    local_cache.bump_generation()
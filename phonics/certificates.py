@@ -0,0 +1,206 @@
+"""A-Z completion certificate rendering.
+
+The ReportLab path draws the layout of ``phonics/certificate_template.html``
+directly on a canvas. The static part of the page (background, borders, corner
+blocks, headings, stars, badge, signature lines) is compiled once per process
+into a tuple of canvas calls, and each certificate replays those calls and
+fills in the name, date and score slots. Nothing is parsed per request, unlike
+the xhtml2pdf path, which parses the template's HTML and CSS on every render.
+
+The xhtml2pdf path stays as the fallback. It is used when
+``CERTIFICATE_RENDERER`` is ``"html"``, when the name needs glyphs outside the
+built-in PDF fonts (for example Arabic), or when the ReportLab path fails.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from math import cos, pi, sin
+
+from django.conf import settings
+from django.template.loader import get_template
+from django.utils.formats import date_format
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
+from xhtml2pdf import pisa
+
+logger = logging.getLogger("abcz.performance")
+
+PAGE_SIZE = landscape(A4)
+BLUE = colors.HexColor("#4361ee")
+PINK = colors.HexColor("#f72585")
+GOLD = colors.HexColor("#ffd700")
+INK = colors.HexColor("#333333")
+MUTED = colors.HexColor("#666666")
+BODY = colors.HexColor("#555555")
+SOFT_BLUE = colors.HexColor("#f0f9ff")
+
+NAME_FONT = ("Times-Bold", 44)
+SLOT_FONT = ("Helvetica-Bold", 15)
+
+
+@dataclass(frozen=True)
+class Slot:
+    x: float
+    y: float
+    font: str
+    size: float
+    color: colors.Color
+
+
+@dataclass(frozen=True)
+class CertificateLayout:
+    ops: tuple
+    name: Slot
+    name_rule_y: float
+    date: Slot
+    score: Slot
+
+
+def _star(cx, cy, outer, inner):
+    path = PDFPathObject()
+    for point in range(10):
+        radius = outer if point % 2 == 0 else inner
+        angle = pi / 2 + point * pi / 5
+        x, y = cx + radius * cos(angle), cy + radius * sin(angle)
+        if point == 0:
+            path.moveTo(x, y)
+        else:
+            path.lineTo(x, y)
+    path.close()
+    return path
+
+
+@lru_cache(maxsize=1)
+def compiled_layout() -> CertificateLayout:
+    """The static certificate page as ``(canvas method, args, kwargs)`` calls, built once per process."""
+    width, height = PAGE_SIZE
+    center = width / 2
+    ops = []
+
+    def op(method, *args, **kwargs):
+        ops.append((method, args, kwargs))
+
+    def centered(y, text, font, size, color):
+        op("setFillColor", color)
+        op("setFont", font, size)
+        op("drawCentredString", center, y, text)
+
+    op("setFillColor", SOFT_BLUE)
+    op("rect", 0, 0, width, height, stroke=0, fill=1)
+
+    op("setStrokeColor", BLUE)
+    op("setLineWidth", 2)
+    op("roundRect", 20, 20, width - 40, height - 40, 20, stroke=1, fill=0)
+    op("roundRect", 26, 26, width - 52, height - 52, 15, stroke=1, fill=0)
+
+    op("setFillColor", BLUE)
+    for x, y in ((20, height - 90), (width - 90, height - 90), (20, 20), (width - 90, 20)):
+        op("roundRect", x, y, 70, 70, 15, stroke=0, fill=1)
+
+    centered(height - 110, "CERTIFICATE OF COMPLETION", "Helvetica-Bold", 38, BLUE)
+    centered(height - 145, "Phonics Game Lab Master", "Helvetica", 22, PINK)
+
+    op("setFillColor", GOLD)
+    for index in range(5):
+        op("drawPath", _star(center + (index - 2) * 36, height - 182, 15, 6), stroke=0, fill=1)
+
+    centered(height - 225, "This certificate is proudly presented to", "Helvetica", 16, MUTED)
+
+    achievement = (
+        "For successfully mastering all the letters of the English alphabet!",
+        "You have shown great dedication, learning skills, and enthusiasm.",
+        "You are now a Reading Hero!",
+    )
+    for line_number, line in enumerate(achievement):
+        centered(height - 330 - line_number * 22, line, "Helvetica", 16, BODY)
+
+    op("setFillColor", PINK)
+    op("circle", center, 95, 42, stroke=0, fill=1)
+    centered(100, "OFFICIAL", "Helvetica-Bold", 12, colors.white)
+    centered(84, "AWARD", "Helvetica-Bold", 12, colors.white)
+
+    op("setStrokeColor", INK)
+    op("setLineWidth", 2)
+    signature_y = 105
+    for x in (width * 0.22, width * 0.78):
+        op("line", x - 110, signature_y, x + 110, signature_y)
+    op("setFillColor", INK)
+    op("setFont", "Helvetica", 13)
+    op("drawCentredString", width * 0.22, signature_y - 20, "Date")
+    op("drawCentredString", width * 0.78, signature_y - 20, "Instructor")
+    op("setFont", *SLOT_FONT)
+    op("drawCentredString", width * 0.78, signature_y + 8, "Phonics Game Lab")
+
+    return CertificateLayout(
+        ops=tuple(ops),
+        name=Slot(center, height - 275, *NAME_FONT, INK),
+        name_rule_y=height - 290,
+        date=Slot(width * 0.22, signature_y + 8, *SLOT_FONT, INK),
+        score=Slot(center, height - 410, "Helvetica-Bold", 16, BLUE),
+    )
+
+
+def _fill(pdf, slot: Slot, text: str) -> None:
+    pdf.setFillColor(slot.color)
+    pdf.setFont(slot.font, slot.size)
+    pdf.drawCentredString(slot.x, slot.y, text)
+
+
+def render_certificate_reportlab(name, date, total_score) -> bytes:
+    layout = compiled_layout()
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=PAGE_SIZE)
+    pdf.setTitle("Certificate of Completion")
+    for method, args, kwargs in layout.ops:
+        getattr(pdf, method)(*args, **kwargs)
+
+    name = str(name)
+    _fill(pdf, layout.name, name)
+    half = max(stringWidth(name, layout.name.font, layout.name.size) / 2 + 40, 120)
+    pdf.setStrokeColor(BLUE)
+    pdf.setLineWidth(3)
+    pdf.line(layout.name.x - half, layout.name_rule_y, layout.name.x + half, layout.name_rule_y)
+    # Same formatting as ``{{ date }}`` in the HTML template.
+    _fill(pdf, layout.date, date_format(date) if hasattr(date, "year") else str(date))
+    _fill(pdf, layout.score, f"Total score: {total_score}")
+
+    pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def render_certificate_html(name, date, total_score) -> bytes:
+    html = get_template("phonics/certificate_template.html").render({
+        "name": name,
+        "date": date,
+        "total_score": total_score,
+    })
+    buffer = BytesIO()
+    pisa_status = pisa.CreatePDF(html, dest=buffer)
+    if pisa_status.err:
+        raise RuntimeError("PDF generation failed")
+    return buffer.getvalue()
+
+
+def reportlab_can_render(name) -> bool:
+    """The built-in PDF fonts only cover cp1252, so other scripts go through the HTML path."""
+    try:
+        str(name).encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def render_certificate(name, date, total_score) -> bytes:
+    if settings.CERTIFICATE_RENDERER == "reportlab" and reportlab_can_render(name):
+        try:
+            return render_certificate_reportlab(name, date, total_score)
+        except Exception:
+            logger.exception("certificate_reportlab_failed fallback=html")
+    return render_certificate_html(name, date, total_score)
@@ -0,0 +1,195 @@
+"""Brotli/gzip compression for rendered HTML and JSON API responses.
+
+WhiteNoise already serves precompressed static files; ``CompressionMiddleware``
+covers everything the views render. It only touches allowlisted content types
+and bodies of at least ``COMPRESSION_MIN_SIZE`` bytes. It prefers Brotli when
+the optional ``brotli`` package is installed and the client accepts it, and
+falls back to gzip.
+
+Responses that are identical for every user are compressed once per cache fill
+instead of once per request. That covers public ``cache_page`` views (detected
+from their ``Cache-Control`` header) and payloads marked with
+``share_compressed`` such as the ``cvc-api:*`` pages. The compressed bytes are
+stored in the shared cache under a digest of the uncompressed body, so a stale
+entry can never be served for changed content.
+
+Streaming responses are compressed chunk by chunk and flushed after every
+chunk, so incremental output (NDJSON exports) still reaches the client as it
+is produced.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+
+from django.conf import settings
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from .cache_helpers import safe_cache_get, safe_cache_set
+
+try:
+    import brotli
+except ImportError:  # Optional: without it every client gets gzip.
+    brotli = None
+
+
+COMPRESSIBLE_CONTENT_TYPES = frozenset({
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "application/json",
+    "application/x-ndjson",
+})
+_MAX_AGE_RE = re.compile(r"\bmax-age\s*=\s*(\d+)")
+# Django's GZipMiddleware pads per-request gzip output the same way to blunt length-based attacks.
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def compression_min_size() -> int:
+    return int(getattr(settings, "COMPRESSION_MIN_SIZE", 1024))
+
+
+def compression_cache_timeout() -> int:
+    return int(getattr(settings, "COMPRESSION_CACHE_TIMEOUT", 3600))
+
+
+def brotli_quality() -> int:
+    return int(getattr(settings, "COMPRESSION_BROTLI_QUALITY", 5))
+
+
+def share_compressed(response):
+    """Mark ``response`` as the same for every user so its compressed bytes are cached and reused."""
+    response.compression_shared = True
+    return response
+
+
+def accepted_encoding(accept_encoding: str) -> str | None:
+    """Best encoding the client accepts: ``"br"`` (when available), ``"gzip"`` or ``None``."""
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    for encoding in (("br", "gzip") if brotli is not None else ("gzip",)):
+        if weights.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress_bytes(content: bytes, encoding: str, *, padded: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(content, quality=brotli_quality())
+    return compress_string(content, max_random_bytes=GZIP_MAX_RANDOM_BYTES if padded else None)
+
+
+def _stream_compressor(encoding: str):
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=brotli_quality())
+        return compressor.process, compressor.flush, compressor.finish
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def compress_stream(chunks, encoding: str):
+    process, flush, finish = _stream_compressor(encoding)
+    for chunk in chunks:
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
+
+
+async def compress_async_stream(chunks, encoding: str):
+    process, flush, finish = _stream_compressor(encoding)
+    async for chunk in chunks:
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
+
+
+def is_shared(response) -> bool:
+    """True for responses that are the same for every user."""
+    if getattr(response, "compression_shared", False):
+        return True
+    cache_control = response.get("Cache-Control", "").lower()
+    if "private" in cache_control or "no-store" in cache_control or "no-cache" in cache_control:
+        return False
+    max_age = _MAX_AGE_RE.search(cache_control)
+    return bool(max_age and int(max_age.group(1)) > 0)
+
+
+def _cached_compress(content: bytes, encoding: str) -> bytes:
+    timeout = compression_cache_timeout()
+    if timeout <= 0:
+        return compress_bytes(content, encoding)
+    key = f"compressed:{encoding}:{hashlib.blake2b(content, digest_size=16).hexdigest()}"
+    compressed = safe_cache_get(key)
+    if not isinstance(compressed, bytes):
+        compressed = compress_bytes(content, encoding)
+        safe_cache_set(key, compressed, timeout)
+    return compressed
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.compress_response(request, response)
+
+    def compress_response(self, request, response):
+        if response.has_header("Content-Encoding") or isinstance(response, FileResponse):
+            return response
+        if response.status_code < 200 or response.status_code in (204, 304):
+            return response
+        content_type = response.get("Content-Type", "").split(";", 1)[0].strip().lower()
+        if content_type not in COMPRESSIBLE_CONTENT_TYPES:
+            return response
+        if not response.streaming and len(response.content) < compression_min_size():
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = accepted_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compress_async_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response["Content-Length"]
+        else:
+            content = response.content
+            if is_shared(response):
+                compressed = _cached_compress(content, encoding)
+            else:
+                compressed = compress_bytes(content, encoding, padded=True)
+            if len(compressed) >= len(content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            # The compressed body is a different byte sequence; keep If-None-Match working with a weak tag.
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
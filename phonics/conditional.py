@@ -0,0 +1,68 @@
+"""Strong ETags and ``If-None-Match`` handling for the polled JSON read endpoints.
+
+The CVC content pages are tagged from their cache key, which already carries
+``CVC_CONTENT_CACHE_VERSION`` and every page parameter, so a revalidation costs no
+database work at all. A progress GET is tagged from the row's ``updated_at``; the
+304 check reads just that column, and the full row is loaded and serialized only
+when the client's copy is stale. Every progress write (including
+``increment_counters`` and batch flushes) refreshes ``updated_at``.
+
+Responses are ``private, no-cache``: browsers keep the body but revalidate
+on each poll, and shared caches never store a user's copy. ``If-None-Match`` is
+compared weakly as RFC 9110 requires, so the ``W/`` tag that
+``CompressionMiddleware`` sends for a compressed body still validates.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+
+CONDITIONAL_CACHE_CONTROL = {"private": True, "no_cache": True}
+
+
+def strong_etag(*parts) -> str:
+    """Quoted strong ETag for the JSON-serializable ``parts``."""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return '"%s"' % hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def etag_matches(request, etag: str) -> bool:
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def with_etag(response, etag: str):
+    response["ETag"] = etag
+    patch_cache_control(response, **CONDITIONAL_CACHE_CONTROL)
+    return response
+
+
+def not_modified(request, etag: str):
+    """A 304 for ``request`` if it already holds ``etag``, else ``None``."""
+    if request.method not in ("GET", "HEAD") or not etag_matches(request, etag):
+        return None
+    return with_etag(HttpResponseNotModified(), etag)
+
+
+def progress_etag(kind: str, user_id: int, updated_at) -> str:
+    return strong_etag("progress", kind, user_id, updated_at.isoformat() if updated_at else None)
+
+
+def progress_not_modified(request, kind: str, rows):
+    """A 304 when the client holds the current tag of the user's progress row in ``rows``.
+
+    Only ``updated_at`` is read, and only when the request is conditional.
+    """
+    if not request.META.get("HTTP_IF_NONE_MATCH"):
+        return None
+    updated_at = rows.values_list("updated_at", flat=True).first()
+    return not_modified(request, progress_etag(kind, request.user.pk, updated_at))
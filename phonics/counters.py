@@ -0,0 +1,67 @@
+"""Lock-free counter updates: ``SET x = x + n`` in the database instead of read-modify-write.
+
+``increment_counters`` folds every increment and plain assignment for one row into
+a single UPDATE. PostgreSQL returns the new values from the same statement
+(``RETURNING``). Other backends run the same UPDATE and read the row back in the
+same transaction; the UPDATE's write lock keeps that read consistent.
+"""
+from __future__ import annotations
+
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F
+from django.db.models.sql import UpdateQuery
+from django.utils import timezone
+
+
+def _update_returning(queryset, updates, returning):
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        query = queryset.query.chain(UpdateQuery)
+        query.add_update_values(updates)
+        sql, params = query.get_compiler(queryset.db).as_sql()
+        opts = queryset.model._meta
+        columns = ", ".join(connection.ops.quote_name(opts.get_field(name).column) for name in returning)
+        with connection.cursor() as cursor:
+            cursor.execute(f"{sql} RETURNING {columns}", params)
+            row = cursor.fetchone()
+        return dict(zip(returning, row)) if row else None
+
+    if not queryset.update(**updates):
+        return None
+    return queryset.values(*returning).get()
+
+
+def increment_counters(model, lookup, increments, *, values=None, returning=None, defaults=None):
+    """Add ``increments`` to one row's counters and return ``(new_values, created)``.
+
+    ``values`` are plain assignments made in the same statement; ``auto_now`` fields
+    are refreshed too. A missing row is created from ``defaults``, ``values`` and the
+    increments; losing that insert race falls back to the UPDATE.
+    """
+    values = dict(values or {})
+    returning = list(returning or increments)
+    now = timezone.now()
+    for field in model._meta.concrete_fields:
+        if getattr(field, "auto_now", False):
+            values.setdefault(field.name, now)
+    updates = {name: F(name) + amount for name, amount in increments.items()}
+    updates.update(values)
+
+    queryset = model._default_manager.filter(**lookup)
+    with transaction.atomic(using=queryset.db):
+        row = _update_returning(queryset, updates, returning)
+        if row is not None:
+            return row, False
+
+        initial = {**(defaults or {}), **values}
+        for name, amount in increments.items():
+            initial[name] = initial.get(name, model._meta.get_field(name).get_default()) + amount
+        try:
+            with transaction.atomic(using=queryset.db):
+                instance = model._default_manager.create(**lookup, **initial)
+        except IntegrityError:
+            row = _update_returning(queryset, updates, returning)
+            if row is None:
+                raise
+            return row, False
+        return {name: getattr(instance, name) for name in returning}, True
@@ -0,0 +1,388 @@
+"""CVC reading progress: events folded into the ``CVCReadingProgress`` aggregate.
+
+``fold_cvc_events`` takes the row lock, applies any events still waiting in the
+append-only log and then the request's own payloads, and saves once, all in one
+transaction. Request payloads are never logged: applying them under the lock
+costs one UPDATE, where an INSERT plus a DELETE of the same event would add two
+writes and nothing else. ``record_cvc_event`` remains for producers that cannot
+take the lock; ``manage.py fold_cvc_progress_events`` folds what they leave.
+
+Payloads are parsed into a ``CVCEvent`` before the row is touched, so applying
+one cannot fail halfway. The JSON list columns are ``BoundedSetField`` values
+(O(1) membership, capped), so the save writes only the scalar fields that
+changed plus the lists marked dirty.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Max
+
+from .fields import BoundedSetField, dirty_set_fields
+from .models import CVCProgressEvent, CVCReadingProgress
+
+
+logger = logging.getLogger("abcz.performance")
+
+FOLD_BATCH_SIZE = 200
+TOTAL_PRONOUN_ITEMS = 35
+TOTAL_FLUENCY_ITEMS = 40 + 34 + 6 + 6 + 16 + 15
+WORD_EVENT_TYPES = {"word", "listen", "mic", "spelling", "quiz"}
+PRONOUN_PRACTICE_EVENT_TYPES = {"pronoun_practice", "pronoun_listen", "pronoun_mic", "pronoun_quiz", "pronoun_mastered"}
+FLUENCY_EXTRA_EVENT_TYPES = {"question_word_mastered", "conversation_complete", "action_verb_mastered", "adjective_mastered"}
+
+
+@dataclass(frozen=True)
+class ContentTotals:
+    words: int
+    sentences: int
+    stories: int
+
+    def __post_init__(self):
+        for name in ("words", "sentences", "stories"):
+            value = getattr(self, name)
+            if type(value) is not int or value < 1:
+                raise ValueError(f"ContentTotals.{name} must be a positive int, got {value!r}")
+
+
+@dataclass(frozen=True)
+class CVCEvent:
+    """One progress payload with every value the fold reads already normalized."""
+
+    payload: dict
+    event_type: str
+    item_text: str
+    level: str
+    family: str
+    lesson_id: str
+    sentence_level: str
+    story_level: str
+    pronoun_level: str
+    score: int
+    mastered: bool
+    # ``None`` means "not reported": the fold counts one more than the row has.
+    sentences_read: int | None
+    stories_completed: int | None
+    conversations_completed: int | None
+    reading_time: int
+    time_spent: int
+    wpm: int
+
+
+def _int(value, default=0):
+    try:
+        return max(0, int(float(value or default)))
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
+def _reported_count(value):
+    return _int(value) if value else None
+
+
+def _text(data, *keys, limit):
+    for key in keys:
+        if data.get(key):
+            return str(data[key]).strip()[:limit]
+    return ""
+
+
+def parse_cvc_event(data):
+    """``CVCEvent`` for one payload; ``ValueError`` when it is not a progress object."""
+    if not isinstance(data, dict):
+        raise ValueError("CVC progress payload must be an object")
+    try:
+        score = int(data.get("score") or data.get("points") or 0)
+    except (TypeError, ValueError, OverflowError):
+        score = 0
+    return CVCEvent(
+        payload=data,
+        event_type=_event_type(data),
+        item_text=_text(data, "item_text", "word", limit=80),
+        level=_text(data, "level", limit=40),
+        family=_text(data, "family", limit=40),
+        lesson_id=_text(data, "lesson_id", limit=80),
+        sentence_level=_text(data, "sentence_level", limit=40),
+        story_level=_text(data, "story_level", limit=60),
+        pronoun_level=_text(data, "pronoun_level", limit=80),
+        score=score,
+        mastered=bool(data.get("mastered", score >= 70)),
+        sentences_read=_reported_count(data.get("sentences_read")),
+        stories_completed=_reported_count(data.get("stories_completed")),
+        conversations_completed=_reported_count(data.get("conversations_completed")),
+        reading_time=_int(data.get("reading_time")),
+        time_spent=_int(data.get("reading_time") or data.get("time_spent")),
+        wpm=_int(data.get("wpm")),
+    )
+
+
+def _reported(value, current):
+    return current + 1 if value is None else value
+
+
+def _apply_event(progress, event, totals):
+    """Apply one parsed event; mirrors the historical per-request update rules."""
+    event_type = event.event_type
+    item_text = event.item_text
+    level = event.level
+    family = event.family
+    lesson_id = event.lesson_id
+    sentence_level = event.sentence_level
+    story_level = event.story_level
+    pronoun_level = event.pronoun_level
+    score = event.score
+    mastered = event.mastered
+
+    completed_lessons = progress.completed_lessons
+    is_new_lesson = bool(lesson_id and lesson_id not in completed_lessons)
+
+    if item_text and event_type in WORD_EVENT_TYPES:
+        progress.words_practiced.add(item_text)
+        if mastered:
+            progress.words_mastered.add(item_text)
+            progress.needs_review_words.discard(item_text)
+        elif event_type != "listen":
+            progress.needs_review_words.add(item_text)
+
+    if event_type in {"sentence", "sentence_mastered"}:
+        progress.sentences_read = max(progress.sentences_read, _reported(event.sentences_read, progress.sentences_read))
+    if event_type == "sentence_mastered" and item_text:
+        progress.sentences_mastered.add(item_text)
+    if event_type == "sentence_quiz":
+        progress.sentence_quiz_attempts += 1
+        if mastered:
+            progress.sentence_quiz_correct += 1
+    if event_type == "sentence_mic":
+        progress.sentence_microphone_attempts += 1
+        if mastered:
+            progress.sentence_microphone_success += 1
+    if event_type == "sentence_timer":
+        reading_time = event.reading_time
+        if reading_time:
+            progress.sentence_total_time_seconds += reading_time
+            progress.sentence_best_time_seconds = min(progress.sentence_best_time_seconds or reading_time, reading_time)
+    if event_type == "story":
+        progress.stories_completed = max(progress.stories_completed, _reported(event.stories_completed, progress.stories_completed))
+    if event_type.startswith("story"):
+        stories_started = progress.stories_started
+        story_needs_review = progress.story_needs_review
+        if item_text:
+            progress.last_story = item_text[:160]
+        progress.last_story_level = story_level or level or progress.last_story_level
+        if event_type in {"story_started", "story_listen"} and item_text:
+            stories_started.add(item_text)
+        if event_type == "story_quiz":
+            progress.story_quiz_attempts += 1
+            if mastered:
+                progress.story_quiz_correct += 1
+            elif item_text:
+                story_needs_review.add(item_text)
+        if event_type == "story_mic":
+            progress.story_microphone_attempts += 1
+            if mastered:
+                progress.story_microphone_success += 1
+            elif item_text:
+                story_needs_review.add(item_text)
+        if event_type in {"story_timer", "story_complete"}:
+            reading_time = event.time_spent
+            if reading_time:
+                progress.story_best_reading_time = min(progress.story_best_reading_time or reading_time, reading_time)
+        if event_type == "story_complete":
+            progress.stories_completed = max(progress.stories_completed, _reported(event.stories_completed, progress.stories_completed))
+            if item_text:
+                stories_started.add(item_text)
+            story_needs_review.discard(item_text)
+    if event_type.startswith("pronoun"):
+        pronouns_mastered = progress.pronouns_mastered
+        pronouns_needs_review = progress.pronouns_needs_review
+        if item_text:
+            progress.last_pronoun = item_text[:80]
+        progress.last_pronoun_level = pronoun_level or level or progress.last_pronoun_level
+        if item_text and event_type in PRONOUN_PRACTICE_EVENT_TYPES:
+            progress.pronouns_practiced.add(item_text)
+        if event_type == "pronoun_quiz":
+            progress.pronoun_quiz_attempts += 1
+            if mastered:
+                progress.pronoun_quiz_correct += 1
+            elif item_text:
+                pronouns_needs_review.add(item_text)
+        if event_type == "pronoun_mic":
+            progress.pronoun_microphone_attempts += 1
+            if mastered:
+                progress.pronoun_microphone_success += 1
+            elif item_text:
+                pronouns_needs_review.add(item_text)
+        if mastered and item_text:
+            pronouns_mastered.add(item_text)
+            pronouns_needs_review.discard(item_text)
+        elif event_type not in {"pronoun_listen", "pronoun_practice"} and item_text:
+            pronouns_needs_review.add(item_text)
+        if event_type == "pronoun_mastered" and is_new_lesson:
+            progress.pronoun_lessons_completed += 1
+    if event_type.startswith("sight_word"):
+        sight_words_mastered = progress.sight_words_mastered
+        if item_text:
+            progress.last_sight_word = item_text[:60]
+            progress.sight_words_practiced.add(item_text)
+        if event_type == "sight_word_quiz":
+            progress.sight_word_quiz_attempts += 1
+            if mastered:
+                progress.sight_word_quiz_correct += 1
+        if mastered and item_text:
+            sight_words_mastered.add(item_text)
+    if event_type.startswith("fluency"):
+        if item_text:
+            progress.last_fluency_sentence = item_text[:180]
+        if event_type in {"fluency_attempt", "fluency_mic"}:
+            progress.fluency_attempts += 1
+        if event_type == "fluency_attempt":
+            progress.fluency_sentences_read += 1
+            reading_time = event.time_spent
+            wpm = event.wpm
+            if reading_time:
+                progress.best_reading_time = min(progress.best_reading_time or reading_time, reading_time)
+            if wpm:
+                progress.best_wpm = max(progress.best_wpm, wpm)
+        if event_type == "fluency_mic":
+            progress.fluency_accuracy = max(progress.fluency_accuracy, min(100, score))
+        if score:
+            progress.fluency_score = max(progress.fluency_score, min(100, score))
+    if event_type == "question_word_mastered" and item_text:
+        progress.question_words_mastered.add(item_text)
+    if event_type == "conversation_complete":
+        if item_text:
+            progress.last_conversation = item_text[:120]
+        progress.conversations_completed = max(
+            progress.conversations_completed,
+            _reported(event.conversations_completed, progress.conversations_completed),
+        )
+    if event_type == "action_verb_mastered" and item_text:
+        progress.action_verbs_mastered.add(item_text)
+    if event_type == "adjective_mastered" and item_text:
+        progress.adjectives_mastered.add(item_text)
+    if event_type in {"quiz", "spelling"}:
+        progress.quiz_attempts += 1
+        if mastered:
+            progress.quiz_correct += 1
+    if event_type == "mic":
+        progress.mic_attempts += 1
+        if mastered:
+            progress.mic_success += 1
+
+    if level and mastered:
+        progress.completed_levels.add(level)
+    if lesson_id and mastered:
+        completed_lessons.add(lesson_id)
+    if family and mastered:
+        progress.completed_families.add(family)
+
+    if event_type.startswith("sentence"):
+        progress.last_sentence = item_text[:160] or progress.last_sentence
+        progress.last_sentence_level = sentence_level or level or progress.last_sentence_level
+        if is_new_lesson and mastered:
+            if sentence_level == "common":
+                progress.common_sentences_completed += 1
+            if sentence_level == "numbers":
+                progress.numbers_completed += 1
+            if sentence_level == "days":
+                progress.days_completed += 1
+            if sentence_level == "months":
+                progress.months_completed += 1
+        progress.sentence_mastery_percentage = min(
+            100,
+            round((len(progress.sentences_mastered) / totals.sentences) * 100),
+        )
+    if event_type.startswith("story"):
+        progress.story_mastery_percentage = min(100, round((progress.stories_completed / totals.stories) * 100))
+    if event_type.startswith("pronoun"):
+        progress.pronoun_mastery_percentage = min(
+            100,
+            round((len(progress.pronouns_mastered) / TOTAL_PRONOUN_ITEMS) * 100),
+        )
+    if event_type.startswith(("sight_word", "fluency")) or event_type in FLUENCY_EXTRA_EVENT_TYPES:
+        completed_fluency_items = (
+            len(progress.sight_words_mastered)
+            + min(progress.fluency_sentences_read, 24)
+            + len(progress.question_words_mastered)
+            + min(progress.conversations_completed, 6)
+            + len(progress.action_verbs_mastered)
+            + len(progress.adjectives_mastered)
+        )
+        progress.fluency_mastery_percentage = min(
+            100,
+            round((completed_fluency_items / TOTAL_FLUENCY_ITEMS) * 100),
+        )
+
+    progress.last_word = item_text or progress.last_word
+    progress.last_family = family or progress.last_family
+    progress.last_level = level or progress.last_level
+    progress.cvc_mastery_percentage = max(
+        progress.cvc_mastery_percentage,
+        min(100, round((len(progress.words_mastered) / totals.words) * 100)),
+    )
+    progress.last_payload = event.payload
+
+
+def _scalar_state(progress):
+    return {
+        field.attname: getattr(progress, field.attname)
+        for field in CVCReadingProgress._meta.concrete_fields
+        if not field.primary_key and not isinstance(field, BoundedSetField)
+    }
+
+
+def _event_type(data):
+    return str(data.get("event_type") or data.get("type") or "").strip()[:30]
+
+
+def record_cvc_event(user, data):
+    """Append one raw progress payload to the event log."""
+    return CVCProgressEvent.objects.create(user=user, event_type=_event_type(data), payload=data)
+
+
+def fold_cvc_events(user_id, totals, events=()):
+    """Apply the user's logged events, then ``events`` (``CVCEvent``), to their aggregate row.
+
+    Returns the up-to-date row. Concurrent requests serialize on the row lock, and
+    a request that fails rolls back with nothing recorded, so a retry applies once.
+    """
+    with transaction.atomic():
+        progress, _ = CVCReadingProgress.objects.select_for_update().get_or_create(user_id=user_id)
+        before = _scalar_state(progress)
+        pending = CVCProgressEvent.objects.filter(user_id=user_id, pk__gt=progress.last_event_id).order_by("pk")
+        while True:
+            batch = list(pending.filter(pk__gt=progress.last_event_id).values_list("pk", "payload")[:FOLD_BATCH_SIZE])
+            if not batch:
+                break
+            for event_id, payload in batch:
+                try:
+                    _apply_event(progress, parse_cvc_event(payload), totals)
+                except ValueError:
+                    # A malformed event must not block every later fold for this user.
+                    logger.warning("cvc_event_skipped event_id=%s user_id=%s", event_id, user_id)
+                progress.last_event_id = event_id
+        for event in events:
+            _apply_event(progress, event, totals)
+
+        after = _scalar_state(progress)
+        changed = [field for field, value in after.items() if before.get(field) != value]
+        changed += dirty_set_fields(progress)
+        if changed:
+            progress.save(update_fields=[*changed, "updated_at"])
+        if progress.last_event_id != before["last_event_id"]:
+            CVCProgressEvent.objects.filter(user_id=user_id, pk__lte=progress.last_event_id).delete()
+    return progress
+
+
+def pending_event_user_ids():
+    """Users with events not yet folded into their aggregate (normally empty)."""
+    folded = dict(CVCReadingProgress.objects.values_list("user_id", "last_event_id"))
+    pending = set()
+    for user_id, max_event_id in CVCProgressEvent.objects.order_by().values_list("user_id").annotate(
+        max_event_id=Max("pk"),
+    ):
+        if max_event_id > folded.get(user_id, 0):
+            pending.add(user_id)
+    return sorted(pending)
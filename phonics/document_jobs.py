@@ -0,0 +1,278 @@
+"""Document builds off the request path: a database-backed job queue with file results.
+
+A download view calls ``enqueue`` with a job kind and the parameters the document
+depends on. Identical parameters hash to the same ``job_key``, so concurrent
+requests for one certificate or one worksheet book version share a single
+``DocumentJob`` row. ``manage.py run_document_jobs`` claims pending rows with a
+conditional UPDATE, so several workers never build the same job twice. Each
+handler writes its result file and returns the path.
+
+Until the job is done the view answers ``202 Accepted`` with ``Retry-After``, and
+the client polls the ``poll`` URL (the same request with ``?poll=1``). Browser
+navigations get an HTML wait page that refreshes itself to that URL instead of
+the JSON body. Once the file exists the view streams it as an attachment.
+
+A failed job is retried while the client polls until it has used
+``DOCUMENT_JOB_MAX_ATTEMPTS``. After that, the next fresh request (not a poll)
+starts a new round of attempts. A job left ``running`` by a worker that died is
+picked up again after ``DOCUMENT_JOB_STALE_SECONDS``, or marked failed if it has
+no attempts left.
+
+With ``DOCUMENT_JOBS_EAGER`` (tests, the dev server) ``enqueue`` runs the job
+inline, so the queue behaves as a synchronous local fake.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.http import FileResponse, JsonResponse
+from django.shortcuts import render
+from django.utils import timezone
+
+from . import metrics
+from .artifacts import artifacts_root, ensure_artifact, locate_artifact, serve_artifact, write_atomically
+from .models import DocumentJob
+
+logger = logging.getLogger("abcz.performance")
+
+RESULTS_DIRNAME = "documents"
+POLL_PARAM = "poll"
+
+_handlers: dict[str, Callable[[DocumentJob], Path]] = {}
+
+
+def register_job(kind: str, handler: Callable[[DocumentJob], Path]) -> None:
+    """Register ``handler(job) -> path of the built file`` for jobs of ``kind``."""
+    _handlers[kind] = handler
+
+
+def job_key(kind: str, params: dict) -> str:
+    payload = json.dumps([kind, params], sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def results_root() -> Path:
+    return artifacts_root() / RESULTS_DIRNAME
+
+
+def store_result(job: DocumentJob, content: bytes, suffix: str) -> Path:
+    """Write a job's output under ``ARTIFACTS_ROOT/documents`` and return its path."""
+    path = results_root() / f"{job.kind}-{job.job_key}{suffix}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomically(path, content)
+    return path
+
+
+def _reset(job: DocumentJob, **changes) -> None:
+    DocumentJob.objects.filter(pk=job.pk, status=job.status).update(
+        status=DocumentJob.Status.PENDING, error="", **changes
+    )
+
+
+def _stale_before():
+    return timezone.now() - timedelta(seconds=settings.DOCUMENT_JOB_STALE_SECONDS)
+
+
+def fail_abandoned() -> int:
+    """Mark jobs left ``running`` past the stale limit with no attempts left as failed."""
+    return DocumentJob.objects.filter(
+        status=DocumentJob.Status.RUNNING,
+        started_at__lt=_stale_before(),
+        attempts__gte=settings.DOCUMENT_JOB_MAX_ATTEMPTS,
+    ).update(
+        status=DocumentJob.Status.FAILED,
+        error="Worker stopped before the job finished",
+        finished_at=timezone.now(),
+    )
+
+
+def is_poll(request) -> bool:
+    return request.GET.get(POLL_PARAM) == "1"
+
+
+def enqueue(kind: str, params: dict, *, restart_failed: bool = False) -> DocumentJob:
+    """The job building ``kind`` for ``params``, created or re-queued as needed.
+
+    ``restart_failed`` gives a job that has used all its attempts a fresh round;
+    views pass it for requests that are not polls.
+    """
+    if kind not in _handlers:
+        raise KeyError(f"Unknown document job kind: {kind}")
+    job, _ = DocumentJob.objects.get_or_create(
+        job_key=job_key(kind, params),
+        defaults={"kind": kind, "params": params},
+    )
+    stale = job.status == DocumentJob.Status.RUNNING and job.started_at < _stale_before()
+    if stale and fail_abandoned():
+        job.refresh_from_db()
+        stale = job.status == DocumentJob.Status.RUNNING
+
+    missing = job.status == DocumentJob.Status.DONE and not Path(job.result_path).exists()
+    failed = job.status == DocumentJob.Status.FAILED
+    if missing or (failed and job.attempts < settings.DOCUMENT_JOB_MAX_ATTEMPTS):
+        _reset(job)
+        job.refresh_from_db()
+    elif failed and restart_failed:
+        _reset(job, attempts=0)
+        job.refresh_from_db()
+
+    runnable = job.status == DocumentJob.Status.PENDING or stale
+    if settings.DOCUMENT_JOBS_EAGER and runnable and _claim(job):
+        run_job(job)
+    return job
+
+
+def _claim(job: DocumentJob) -> bool:
+    now = timezone.now()
+    claimed = DocumentJob.objects.filter(pk=job.pk, status=job.status, started_at=job.started_at).update(
+        status=DocumentJob.Status.RUNNING,
+        started_at=now,
+        attempts=F("attempts") + 1,
+    )
+    if claimed:
+        job.refresh_from_db()
+    return bool(claimed)
+
+
+def claim_next() -> DocumentJob | None:
+    """Mark the oldest runnable job as running and return it, or None when the queue is empty.
+
+    Jobs left ``running`` by a dead worker are reclaimed once ``started_at`` is older
+    than ``DOCUMENT_JOB_STALE_SECONDS``; those without attempts left are failed.
+    """
+    fail_abandoned()
+    runnable = Q(status=DocumentJob.Status.PENDING) | Q(
+        status=DocumentJob.Status.RUNNING,
+        started_at__lt=_stale_before(),
+        attempts__lt=settings.DOCUMENT_JOB_MAX_ATTEMPTS,
+    )
+    while True:
+        candidates = list(DocumentJob.objects.filter(runnable).order_by("id")[:10])
+        if not candidates:
+            return None
+        for job in candidates:
+            if _claim(job):
+                return job
+
+
+def run_job(job: DocumentJob) -> DocumentJob:
+    """Build a claimed job and record its result file or error."""
+    try:
+        with metrics.timed("pdf"):
+            path = _handlers[job.kind](job)
+    except Exception as exc:
+        logger.exception("document_job_failed kind=%s job=%s", job.kind, job.job_key)
+        DocumentJob.objects.filter(pk=job.pk).update(
+            status=DocumentJob.Status.FAILED,
+            error=f"{type(exc).__name__}: {exc}"[:2000],
+            finished_at=timezone.now(),
+        )
+    else:
+        DocumentJob.objects.filter(pk=job.pk).update(
+            status=DocumentJob.Status.DONE,
+            result_path=str(path),
+            error="",
+            finished_at=timezone.now(),
+        )
+    job.refresh_from_db()
+    return job
+
+
+def run_pending(limit: int | None = None) -> int:
+    """Run queued jobs until the queue is empty or ``limit`` jobs ran; returns how many ran."""
+    ran = 0
+    while limit is None or ran < limit:
+        job = claim_next()
+        if job is None:
+            break
+        run_job(job)
+        ran += 1
+    return ran
+
+
+def purge_finished() -> int:
+    """Delete jobs finished more than ``DOCUMENT_JOB_RETENTION_DAYS`` ago and their files under ``documents/``."""
+    finished = DocumentJob.objects.filter(
+        status__in=[DocumentJob.Status.DONE, DocumentJob.Status.FAILED],
+        finished_at__lt=timezone.now() - timedelta(days=settings.DOCUMENT_JOB_RETENTION_DAYS),
+    )
+    root = results_root()
+    for result_path in finished.exclude(result_path="").values_list("result_path", flat=True):
+        path = Path(result_path)
+        if path.parent == root:
+            path.unlink(missing_ok=True)
+    deleted, _ = finished.delete()
+    return deleted
+
+
+def _with_poll(request, poll: bool) -> str:
+    query = request.GET.copy()
+    query.pop(POLL_PARAM, None)
+    if poll:
+        query[POLL_PARAM] = "1"
+    return f"{request.path}?{query.urlencode()}" if query else request.path
+
+
+def wants_html(request) -> bool:
+    """Browser navigations ask for ``text/html``; ``fetch`` and API clients send ``*/*`` or JSON."""
+    return "text/html" in request.headers.get("Accept", "")
+
+
+def job_response(request, job: DocumentJob, serve: Callable[[DocumentJob], object]):
+    """``serve(job)`` once the job is done; until then a 202 the client polls via the ``poll`` URL."""
+    if job.status == DocumentJob.Status.DONE:
+        return serve(job)
+
+    poll_url = _with_poll(request, True)
+    poll_seconds = settings.DOCUMENT_JOB_POLL_SECONDS
+    failed = job.status == DocumentJob.Status.FAILED
+    if wants_html(request):
+        response = render(request, "document_job_status.html", {
+            "failed": failed,
+            "poll_url": poll_url,
+            "retry_url": _with_poll(request, False),
+            "poll_seconds": poll_seconds,
+        }, status=500 if failed else 202)
+    elif failed:
+        response = JsonResponse(
+            {"error": "Document generation failed", "status": job.status, "retry": _with_poll(request, False)},
+            status=500,
+        )
+    else:
+        response = JsonResponse(
+            {"status": job.status, "job": job.job_key, "poll": poll_url, "retry_after": poll_seconds},
+            status=202,
+        )
+    if not failed:
+        response["Retry-After"] = str(poll_seconds)
+        response["Location"] = poll_url
+    response["Cache-Control"] = "private, no-store"
+    return response
+
+
+def file_response(job: DocumentJob, filename: str, content_type: str):
+    return FileResponse(
+        Path(job.result_path).open("rb"),
+        as_attachment=True,
+        filename=filename,
+        content_type=content_type,
+    )
+
+
+def artifact_job_response(request, name: str):
+    """Stream artifact ``name`` if it is built, otherwise queue its build and answer 202."""
+    artifact, _ = locate_artifact(name)
+    if artifact.path.exists():
+        return serve_artifact(request, artifact)
+    job = enqueue("artifact", {"name": name, "digest": artifact.digest}, restart_failed=not is_poll(request))
+    return job_response(request, job, lambda job: serve_artifact(request, ensure_artifact(name)))
+
+
+register_job("artifact", lambda job: ensure_artifact(job.params["name"]).path)
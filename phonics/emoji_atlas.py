@@ -0,0 +1,141 @@
+"""Pre-rendered emoji tiles for the worksheet PDF, stored as one sprite atlas.
+
+Every emoji the worksheet book uses is rasterized once into a 120x120 RGBA tile.
+The tiles are stored back to back in ``emoji-atlas-<digest>.rgba``, and
+``emoji-atlas-<digest>.json`` maps each emoji to its tile. The digest hashes the emoji set, the font file and ``ARTIFACT_VERSION``.
+The index is written after the tile data, so an index on disk always has a
+complete atlas next to it.
+
+``manage.py build_emoji_atlas`` builds the atlas during ``build.sh`` into
+``ARTIFACTS_BUILD_ROOT``, inside the deployed code. Each process then maps the
+file once with ``mmap`` and wraps tiles as PIL images directly over the mapping,
+so drawing the PDF never opens the font. When the build step has not run, the
+first PDF build renders the atlas under ``ARTIFACTS_ROOT`` instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+
+from .artifacts import artifact_path, artifacts_root, write_atomically
+
+TILE_SIZE = 120
+GLYPH_SIZE = 72
+TILE_BYTES = TILE_SIZE * TILE_SIZE * 4
+ATLAS_PREFIX = "emoji-atlas-"
+
+_atlases: dict[str, "EmojiAtlas"] = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class EmojiAtlas:
+    digest: str
+    index: dict[str, int]
+    data: mmap.mmap | None
+
+    def image(self, emoji):
+        """A PIL image of ``emoji`` backed by the mapped atlas, or None if it has no tile."""
+        tile = self.index.get(emoji)
+        if tile is None:
+            return None
+        from PIL import Image
+
+        start = tile * TILE_BYTES
+        view = memoryview(self.data)[start:start + TILE_BYTES]
+        return Image.frombuffer("RGBA", (TILE_SIZE, TILE_SIZE), view, "raw", "RGBA", 0, 1)
+
+
+def atlas_digest(emojis, font_path) -> str:
+    font = Path(font_path)
+    stat = font.stat()
+    payload = json.dumps(
+        [sorted(emojis), str(font), stat.st_size, int(stat.st_mtime), TILE_SIZE, GLYPH_SIZE, settings.ARTIFACT_VERSION],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def atlas_paths(digest: str, root: Path | None = None) -> tuple[Path, Path]:
+    """Data and index paths; by default next to a prebuilt index if there is one, else at runtime."""
+    index_path = artifact_path(f"{ATLAS_PREFIX}{digest}.json", root)
+    return index_path.with_suffix(".rgba"), index_path
+
+
+def render_emoji_tile(emoji, font) -> bytes:
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGBA", (TILE_SIZE, TILE_SIZE), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(image)
+    bbox = draw.textbbox((0, 0), emoji, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (TILE_SIZE - text_width) / 2 - bbox[0]
+    y = (TILE_SIZE - text_height) / 2 - bbox[1] - 2
+    draw.text((x, y), emoji, font=font, fill=(30, 41, 59, 255))
+    return image.tobytes()
+
+
+def build_atlas(emojis, font_path, digest: str, root: Path | None = None) -> None:
+    from PIL import ImageFont
+
+    font = ImageFont.truetype(str(font_path), GLYPH_SIZE)
+    index = {}
+    tiles = []
+    for emoji in sorted(emojis):
+        try:
+            tiles.append(render_emoji_tile(emoji, font))
+        except Exception:
+            continue
+        index[emoji] = len(tiles) - 1
+
+    data_path, index_path = atlas_paths(digest, root or artifacts_root())
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomically(data_path, b"".join(tiles))
+    manifest = {"tile_size": TILE_SIZE, "font": str(font_path), "tiles": index}
+    write_atomically(index_path, json.dumps(manifest, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+
+
+def _map(digest: str, root: Path) -> EmojiAtlas:
+    data_path, index_path = atlas_paths(digest, root)
+    index = json.loads(index_path.read_text(encoding="utf-8"))["tiles"]
+    if not index:
+        return EmojiAtlas(digest, {}, None)
+    with data_path.open("rb") as handle:
+        data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return EmojiAtlas(digest, index, data)
+
+
+def load_atlas(emojis, font_path, root: Path | None = None) -> EmojiAtlas:
+    """The mapped atlas for ``emojis`` in ``font_path``, building it on disk if missing."""
+    emojis = {str(emoji).strip() for emoji in emojis if str(emoji or "").strip()}
+    digest = atlas_digest(emojis, font_path)
+    index_path = atlas_paths(digest, root)[1]
+    key = str(index_path)
+    atlas = _atlases.get(key)
+    if atlas is not None:
+        return atlas
+    with _lock:
+        atlas = _atlases.get(key)
+        if atlas is None:
+            if not index_path.exists():
+                build_atlas(emojis, font_path, digest, index_path.parent)
+            atlas = _atlases[key] = _map(digest, index_path.parent)
+    return atlas
+
+
+def prune_atlases(current: EmojiAtlas, root: Path) -> list[Path]:
+    """Delete the files of every other atlas in ``root``; returns what was removed."""
+    keep = set(atlas_paths(current.digest, root))
+    removed = []
+    for stale in Path(root).glob(f"{ATLAS_PREFIX}*"):
+        if stale not in keep and stale.suffix in {".rgba", ".json"}:
+            stale.unlink(missing_ok=True)
+            removed.append(stale)
+    return removed
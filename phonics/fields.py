@@ -0,0 +1,212 @@
+"""``BoundedSetField``: a JSON list column handled as an ordered, capped set in memory.
+
+Rows keep the plain JSON list format and ``deconstruct`` reports a plain
+``JSONField``, so moving a column onto this field needs no migration and old
+code can still read what new code writes.
+"""
+from __future__ import annotations
+
+import json
+
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+from django.db.models.signals import post_save
+
+
+# Once full, new items are ignored: the stored list keeps its first ``limit`` items,
+# which is what the historical ``append`` then ``[:limit]`` handling produced.
+KEEP_OLDEST = "keep_oldest"
+# Once full, the oldest item is evicted to make room for the new one.
+DROP_OLDEST = "drop_oldest"
+
+
+def _member_key(item):
+    if isinstance(item, (dict, list)):
+        return json.dumps(item, sort_keys=True)
+    return item
+
+
+class BoundedSet(list):
+    """Insertion-ordered unique items with O(1) membership and a capacity cap.
+
+    Subclassing ``list`` keeps JSON encoding, templates and comparisons with plain
+    lists unchanged. ``dirty`` is set whenever the contents change and cleared when
+    the owning row is saved.
+    """
+
+    def __init__(self, values=(), limit=None, eviction=KEEP_OLDEST):
+        super().__init__()
+        self.limit = limit
+        self.eviction = eviction
+        self._members = set()
+        self.dirty = False
+        for item in values or ():
+            self._add(item)
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self.limit, self.eviction), {"dirty": self.dirty}
+
+    def _add(self, item):
+        key = _member_key(item)
+        if key in self._members:
+            return False
+        if self.limit is not None and len(self) >= self.limit:
+            if self.eviction != DROP_OLDEST or not self.limit:
+                return False
+            self._members.discard(_member_key(super().pop(0)))
+        super().append(item)
+        self._members.add(key)
+        return True
+
+    def _replace(self, values):
+        before = list(self)
+        super().clear()
+        self._members.clear()
+        for item in values:
+            self._add(item)
+        self.dirty = self.dirty or before != list(self)
+
+    def __contains__(self, item):
+        return _member_key(item) in self._members
+
+    def add(self, item):
+        """Add ``item`` unless present or refused by the cap; returns whether it was added."""
+        added = self._add(item)
+        self.dirty = self.dirty or added
+        return added
+
+    append = add
+
+    def extend(self, items):
+        for item in items:
+            self.add(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def discard(self, item):
+        key = _member_key(item)
+        if key not in self._members:
+            return False
+        index = next(index for index, value in enumerate(self) if _member_key(value) == key)
+        super().__delitem__(index)
+        self._members.discard(key)
+        self.dirty = True
+        return True
+
+    def remove(self, item):
+        if not self.discard(item):
+            raise ValueError(f"{item!r} is not in the set")
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._members.discard(_member_key(item))
+        self.dirty = True
+        return item
+
+    def clear(self):
+        if self:
+            self.dirty = True
+        super().clear()
+        self._members.clear()
+
+    def copy(self):
+        return self.__class__(self, self.limit, self.eviction)
+
+    # Positional edits may introduce duplicates or overflow; rebuild to restore both invariants.
+    def __setitem__(self, index, value):
+        values = list(self)
+        values[index] = value
+        self._replace(values)
+
+    def __delitem__(self, index):
+        values = list(self)
+        del values[index]
+        self._replace(values)
+
+    def insert(self, index, item):
+        values = list(self)
+        values.insert(index, item)
+        self._replace(values)
+
+    def __imul__(self, count):
+        raise TypeError("BoundedSet items are unique; repetition is not supported.")
+
+    def sort(self, *, key=None, reverse=False):
+        self._replace(sorted(self, key=key, reverse=reverse))
+
+    def reverse(self):
+        self._replace(list(reversed(self)))
+
+
+class BoundedSetDescriptor(DeferredAttribute):
+    """Wraps assigned lists in a ``BoundedSet`` and marks them dirty when the contents differ."""
+
+    def __set__(self, instance, value):
+        if not isinstance(value, BoundedSet):
+            previous = instance.__dict__.get(self.field.attname)
+            value = self.field.to_bounded_set(value)
+            # Unsaved changes on the replaced value stay pending.
+            value.dirty = previous is not None and (getattr(previous, "dirty", False) or previous != value)
+        instance.__dict__[self.field.attname] = value
+
+
+class BoundedSetField(models.JSONField):
+    """JSON list column exposed as a ``BoundedSet`` capped at ``limit`` items."""
+
+    descriptor_class = BoundedSetDescriptor
+
+    def __init__(self, *args, limit=None, eviction=KEEP_OLDEST, **kwargs):
+        if eviction not in {KEEP_OLDEST, DROP_OLDEST}:
+            raise ValueError(f"Unknown eviction policy: {eviction!r}")
+        self.limit = limit
+        self.eviction = eviction
+        kwargs.setdefault("default", list)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        # Reported as a plain JSONField: the column format is unchanged, so no migration.
+        return name, "django.db.models.JSONField", args, kwargs
+
+    def to_bounded_set(self, value):
+        return BoundedSet(value if isinstance(value, (list, tuple)) else (), self.limit, self.eviction)
+
+    def from_db_value(self, value, expression, connection):
+        value = super().from_db_value(value, expression, connection)
+        # Key transforms share this output field; only whole-column lists become sets.
+        if isinstance(value, list):
+            return self.to_bounded_set(value)
+        return value
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if not cls._meta.abstract:
+            post_save.connect(
+                _mark_saved_sets_clean,
+                sender=cls,
+                weak=False,
+                dispatch_uid=f"bounded_set_clean:{cls._meta.label}",
+            )
+
+
+def _mark_saved_sets_clean(sender, instance, update_fields=None, **kwargs):
+    for field in sender._meta.concrete_fields:
+        if not isinstance(field, BoundedSetField):
+            continue
+        if update_fields is not None and field.name not in update_fields:
+            continue
+        value = instance.__dict__.get(field.attname)
+        if isinstance(value, BoundedSet):
+            value.dirty = False
+
+
+def dirty_set_fields(instance):
+    """Names of the instance's ``BoundedSetField`` columns changed since load or last save."""
+    return [
+        field.name
+        for field in instance._meta.concrete_fields
+        if isinstance(field, BoundedSetField)
+        and getattr(instance.__dict__.get(field.attname), "dirty", False)
+    ]
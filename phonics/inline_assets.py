@@ -0,0 +1,147 @@
+"""Move inline ``<style>``/``<script>`` blocks out of page templates into static files.
+
+The largest pages used to ship every byte of their CSS and JavaScript inline, so
+each hit re-rendered and re-sent hundreds of KB that browsers could never cache.
+``extract_inline_assets`` rewrites a template so each plain block becomes a
+``{% static %}`` link; ``collectstatic`` then content-hashes the files and
+WhiteNoise serves the hashed names with a far-future immutable cache header.
+
+Only blocks the browser would treat identically when loaded by URL are moved:
+``<style>`` with no attributes other than ``media``, and ``<script>`` with no
+attributes other than an executable ``type``. JSON islands, anything with
+``defer``/``async``/``id``, blocks under ``MIN_EXTRACT_BYTES`` and anything
+containing Django template syntax stay in the template, since that is the
+per-request part of the page.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+BLOCK_RE = re.compile(
+    r"(?P<indent>[ \t]*)<(?P<tag>style|script)\b(?P<attrs>[^>]*)>(?P<body>.*?)</(?P=tag)\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+ATTR_RE = re.compile(r"""([\w:-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+TEMPLATE_SYNTAX_RE = re.compile(r"\{[{%#]")
+LOAD_STATIC_RE = re.compile(r"\{%\s*load\s+[^%]*\bstatic\b[^%]*%\}")
+EXTENDS_RE = re.compile(r"^\s*\{%\s*extends\s[^%]*%\}[ \t]*\n?")
+
+EXECUTABLE_SCRIPT_TYPES = {"", "text/javascript", "application/javascript", "module"}
+# Below this a separate request costs more than the bytes it saves, so small blocks stay inline.
+MIN_EXTRACT_BYTES = 2048
+
+
+@dataclass(frozen=True)
+class PageAssets:
+    """A page template and where its extracted assets live under ``static/``."""
+
+    name: str
+    template: str
+    static_dir: str
+    stem: str
+
+
+PAGE_ASSETS = (
+    PageAssets("letters", "templates/letters.html", "letters", "app"),
+    PageAssets("sounds", "templates/sounds.html", "sounds", "sounds"),
+    PageAssets("cvc_reading", "phonics/templates/phonics/cvc_reading.html", "cvc_reading", "cvc_reading"),
+    PageAssets("top_goal_6_unit_1", "phonics/templates/phonics/top_goal_6_unit_1.html", "top_goal", "unit_1"),
+)
+
+
+@dataclass(frozen=True)
+class ExtractedAsset:
+    path: str
+    content: str
+
+
+def _attributes(raw: str) -> dict[str, str]:
+    return {
+        match.group(1).lower(): next((value for value in match.groups()[1:] if value is not None), "")
+        for match in ATTR_RE.finditer(raw)
+    }
+
+
+def _extractable(tag: str, attrs: dict[str, str], body: str, min_bytes: int) -> bool:
+    if len(body.strip()) < min_bytes or TEMPLATE_SYNTAX_RE.search(body):
+        return False
+    if tag == "style":
+        return set(attrs) <= {"media"}
+    return set(attrs) <= {"type"} and attrs.get("type", "").strip().lower() in EXECUTABLE_SCRIPT_TYPES
+
+
+def _asset_source(body: str) -> str:
+    # No dedent: it would also strip whitespace inside multi-line template literals.
+    return body.strip() + "\n"
+
+
+def extract_inline_assets(
+    html: str,
+    static_dir: str,
+    stem: str,
+    taken: Callable[[str], bool] = lambda path: False,
+    min_bytes: int = MIN_EXTRACT_BYTES,
+) -> tuple[str, list[ExtractedAsset]]:
+    """Return ``(new_html, assets)`` with every extractable block replaced by a link.
+
+    Assets are named ``css/<static_dir>/<stem>.css``, then ``<stem>-2.css`` and so
+    on; ``taken(path)`` reports names already used on disk so a second run never
+    overwrites the files from the first.
+    """
+    assets: list[ExtractedAsset] = []
+    used: set[str] = set()
+
+    def asset_path(kind: str) -> str:
+        index = 1
+        while True:
+            suffix = "" if index == 1 else f"-{index}"
+            path = f"{kind}/{static_dir}/{stem}{suffix}.{kind}"
+            if path not in used and not taken(path):
+                used.add(path)
+                return path
+            index += 1
+
+    def replace(match: re.Match) -> str:
+        tag = match.group("tag").lower()
+        attrs = _attributes(match.group("attrs"))
+        if not _extractable(tag, attrs, match.group("body"), min_bytes):
+            return match.group(0)
+
+        indent = match.group("indent")
+        if tag == "style":
+            path = asset_path("css")
+            media = f' media="{attrs["media"]}"' if attrs.get("media") else ""
+            link = f"""{indent}<link rel="stylesheet" href="{{% static '{path}' %}}"{media}>"""
+        else:
+            path = asset_path("js")
+            module = ' type="module"' if attrs.get("type", "").strip().lower() == "module" else ""
+            link = f"""{indent}<script{module} src="{{% static '{path}' %}}"></script>"""
+        assets.append(ExtractedAsset(path, _asset_source(match.group("body"))))
+        return link
+
+    new_html = BLOCK_RE.sub(replace, html)
+    if assets and not LOAD_STATIC_RE.search(new_html):
+        extends = EXTENDS_RE.match(new_html)
+        head = extends.group(0) if extends else ""
+        new_html = f"{head}{{% load static %}}\n{new_html[len(head):]}"
+    return new_html, assets
+
+
+def extract_page(page: PageAssets, base_dir: Path, static_root: Path, write: bool = True) -> list[ExtractedAsset]:
+    """Extract one registered page in place; with ``write=False`` only report what would move."""
+    template_path = base_dir / page.template
+    html = template_path.read_text(encoding="utf-8")
+    new_html, assets = extract_inline_assets(
+        html, page.static_dir, page.stem, taken=lambda path: (static_root / path).exists()
+    )
+    if write and assets:
+        for asset in assets:
+            target = static_root / asset.path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(asset.content, encoding="utf-8")
+        template_path.write_text(new_html, encoding="utf-8")
+    return assets
@@ -0,0 +1,53 @@
+"""Pre-serialized JSON for the large, immutable curriculum constants.
+
+Pages inline these blobs into ``<script type="application/json">`` islands. Each
+bundle is serialized once per process, so a request only pays for its small
+per-user payload.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class JsonBundle:
+    name: str
+    text: str
+
+
+_providers: dict[str, Callable[[], Any]] = {}
+_bundles: dict[str, JsonBundle] = {}
+_lock = threading.Lock()
+
+
+def register_bundle(name: str, provider: Callable[[], Any]) -> None:
+    _providers[name] = provider
+    _bundles.pop(name, None)
+
+
+def is_registered(name: str) -> bool:
+    return name in _providers
+
+
+def get_bundle(name: str) -> JsonBundle:
+    bundle = _bundles.get(name)
+    if bundle is None:
+        with _lock:
+            bundle = _bundles.get(name)
+            if bundle is None:
+                bundle = JsonBundle(name, json.dumps(_providers[name](), ensure_ascii=False))
+                _bundles[name] = bundle
+    return bundle
+
+
+def bundle_json(name: str) -> str:
+    return get_bundle(name).text
+
+
+def reset_bundles() -> None:
+    """Drop every serialized bundle; the next read re-serializes from the providers."""
+    with _lock:
+        _bundles.clear()
@@ -0,0 +1,516 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Collate
+from django.utils import timezone
+
+from .models import (
+    CVCProgress,
+    EnglishFoundationProgress,
+    LeaderboardEntry,
+    LetterProgress,
+    Student,
+    StudentProfile,
+)
+
+
+PERIOD_ALIASES = {"today": "daily"}
+PERIOD_FIELDS = {
+    "daily": ("day_start", "day_points"),
+    "weekly": ("week_start", "week_points"),
+    "monthly": ("month_start", "month_points"),
+}
+LETTERS_COMPLETED_THRESHOLD = 26
+REBUILD_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class LearnerScore:
+    user_id: int | None
+    student_id: int | None
+    display_name: str
+    student_name: str
+    username: str
+    grade: str
+    total_points: int
+    completed_letters: int
+    last_activity_at: datetime | None
+
+
+def normalize_leaderboard_grade(value):
+    return (value or "").strip() or "غير محدد"
+
+
+def build_achievement(completed_letters, has_certificate, total_points):
+    if has_certificate:
+        return "شهادة الحروف", True, "شهادة إتقان الحروف"
+    if completed_letters >= 26:
+        return "أنهى الحروف", False, ""
+    if total_points > 0:
+        return "الأكثر تفاعلًا", False, ""
+    return "مشارك جديد", False, ""
+
+
+def score_letter_progress(progress_entries):
+    points = 0
+    completed_letters = set()
+
+    for progress in progress_entries:
+        base_score = progress.total_score if progress.user_id else progress.score
+        points += int(base_score or 0)
+        if progress.completed or progress.passed:
+            completed_letters.add(progress.letter)
+            points += 7
+
+    if len(completed_letters) >= 26:
+        points += 100
+        points += 150
+
+    return points, len(completed_letters)
+
+
+def score_letter_summary(letter_points, completed_letters):
+    """Aggregate-query form of ``score_letter_progress``."""
+    points = int(letter_points or 0) + (completed_letters * 7)
+    if completed_letters >= 26:
+        points += 250
+    return points
+
+
+def score_sound_progress(progress):
+    if not progress:
+        return 0
+    completed_items = progress.completed_items or []
+    practiced_vowels = progress.practiced_vowels or []
+    points = len(completed_items) * 5
+    points += int(progress.quiz_attempts or 0) * 10
+    points += int(progress.mic_success or 0) * 5
+    points += int(progress.vowel_lessons_completed or 0)
+    points += len(practiced_vowels) * 5
+    points += int(progress.vowel_quiz_attempts or 0) * 10
+    points += int(progress.vowel_microphone_success or 0) * 5
+    return points
+
+
+def score_cvc_reading_progress(progress):
+    if not progress:
+        return 0
+    points = 0
+    points += len(progress.completed_lessons or []) * 5
+    points += len(progress.words_mastered or []) * 5
+    points += int(progress.sentences_read or 0) * 5
+    points += int(progress.sentence_quiz_attempts or 0) * 10
+    points += int(progress.sentence_microphone_success or 0) * 5
+    points += int(progress.stories_completed or 0) * 10
+    points += int(progress.story_quiz_attempts or 0) * 10
+    points += int(progress.story_microphone_success or 0) * 5
+    points += int(progress.pronoun_lessons_completed or 0) * 5
+    points += len(progress.pronouns_mastered or []) * 5
+    points += int(progress.fluency_attempts or 0) * 10
+    points += int(progress.conversations_completed or 0) * 10
+    points += len(progress.action_verbs_mastered or []) * 5
+    points += len(progress.adjectives_mastered or []) * 5
+    return points
+
+
+def _latest(*timestamps):
+    present = [ts for ts in timestamps if ts]
+    return max(present) if present else None
+
+
+def compute_user_scores(user_ids=None):
+    """Yield the current score of every account learner, or only ``user_ids``."""
+    letter_qs = LetterProgress.objects.filter(user__isnull=False)
+    english_qs = EnglishFoundationProgress.objects.all()
+    profile_qs = StudentProfile.objects.select_related(
+        "user",
+        "user__sound_practice_progress",
+        "user__cvc_reading_progress",
+        "user__bird_tutor_progress",
+    )
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        letter_qs = letter_qs.filter(user_id__in=user_ids)
+        english_qs = english_qs.filter(user_id__in=user_ids)
+        profile_qs = profile_qs.filter(user_id__in=user_ids)
+
+    progress_by_user = {
+        row["user_id"]: row
+        for row in letter_qs.values("user_id").annotate(
+            letter_points=Sum("total_score"),
+            completed_letters=Count("letter", filter=Q(completed=True) | Q(passed=True), distinct=True),
+            last_activity=Max("last_updated_at"),
+        )
+    }
+    english_progress_by_user = {
+        row["user_id"]: row
+        for row in english_qs.values("user_id").annotate(
+            points=Sum("points"),
+            last_activity=Max("last_activity_at"),
+        )
+    }
+
+    for profile in profile_qs.order_by("pk"):
+        letter_summary = progress_by_user.get(profile.user_id) or {}
+        sound_progress = getattr(profile.user, "sound_practice_progress", None)
+        cvc_reading_progress = getattr(profile.user, "cvc_reading_progress", None)
+        bird_progress = getattr(profile.user, "bird_tutor_progress", None)
+        english_summary = english_progress_by_user.get(profile.user_id) or {}
+
+        if not any([letter_summary, sound_progress, cvc_reading_progress, bird_progress, english_summary]):
+            continue
+
+        completed_letters = int(letter_summary.get("completed_letters") or 0)
+        total_points = score_letter_summary(letter_summary.get("letter_points"), completed_letters)
+        total_points += score_sound_progress(sound_progress)
+        total_points += score_cvc_reading_progress(cvc_reading_progress)
+        total_points += int(getattr(bird_progress, "xp", 0) or 0)
+        total_points += int(english_summary.get("points") or 0)
+
+        yield LearnerScore(
+            user_id=profile.user_id,
+            student_id=None,
+            display_name=profile.display_name or profile.student_name or profile.user.username,
+            student_name=profile.student_name,
+            username=profile.user.username,
+            grade=normalize_leaderboard_grade(profile.grade),
+            total_points=total_points,
+            completed_letters=completed_letters,
+            last_activity_at=_latest(
+                letter_summary.get("last_activity"),
+                sound_progress.updated_at if sound_progress else None,
+                cvc_reading_progress.updated_at if cvc_reading_progress else None,
+                bird_progress.updated_at if bird_progress else None,
+                english_summary.get("last_activity"),
+            ),
+        )
+
+
+def compute_student_scores(student_ids=None):
+    """Yield the current score of every legacy ``Student`` learner, or only ``student_ids``."""
+    letter_qs = LetterProgress.objects.filter(student__isnull=False)
+    cvc_qs = CVCProgress.objects.all()
+    if student_ids is not None:
+        student_ids = list(student_ids)
+        letter_qs = letter_qs.filter(student_id__in=student_ids)
+        cvc_qs = cvc_qs.filter(student_id__in=student_ids)
+
+    student_progress_qs = (
+        letter_qs
+        .values("student_id", "student__name", "student__grade")
+        .annotate(
+            letter_points=Sum("score"),
+            completed_letters=Count("letter", filter=Q(completed=True) | Q(passed=True), distinct=True),
+            last_activity=Max("timestamp"),
+        )
+    )
+    cvc_by_student = {
+        row["student_id"]: row
+        for row in cvc_qs.values("student_id", "total_score", "last_activity")
+    }
+
+    seen_students = set()
+    for summary in student_progress_qs:
+        student_id = summary["student_id"]
+        seen_students.add(student_id)
+        completed_letters = int(summary["completed_letters"] or 0)
+        cvc_progress = cvc_by_student.get(student_id) or {}
+        yield LearnerScore(
+            user_id=None,
+            student_id=student_id,
+            display_name=summary["student__name"],
+            student_name=summary["student__name"],
+            username="",
+            grade=normalize_leaderboard_grade(summary["student__grade"]),
+            total_points=(
+                score_letter_summary(summary["letter_points"], completed_letters)
+                + int(cvc_progress.get("total_score") or 0)
+            ),
+            completed_letters=completed_letters,
+            last_activity_at=_latest(summary.get("last_activity"), cvc_progress.get("last_activity")),
+        )
+
+    cvc_student_ids = set(cvc_by_student) - seen_students
+    if not cvc_student_ids:
+        return
+    for student in Student.objects.filter(id__in=cvc_student_ids).values("id", "name", "grade").order_by("id"):
+        cvc_progress = cvc_by_student[student["id"]]
+        yield LearnerScore(
+            user_id=None,
+            student_id=student["id"],
+            display_name=student["name"],
+            student_name=student["name"],
+            username="",
+            grade=normalize_leaderboard_grade(student["grade"]),
+            total_points=int(cvc_progress.get("total_score") or 0),
+            completed_letters=0,
+            last_activity_at=cvc_progress.get("last_activity"),
+        )
+
+
+def period_bucket_starts(today=None):
+    today = today or timezone.localdate()
+    return {
+        "daily": today,
+        "weekly": today - timedelta(days=today.weekday()),
+        "monthly": today.replace(day=1),
+    }
+
+
+def _apply_score(entry, score):
+    entry.display_name = str(score.display_name or "")[:200]
+    entry.student_name = str(score.student_name or "")[:200]
+    entry.username = str(score.username or "")[:150]
+    entry.grade = str(score.grade or "")[:80]
+    entry.total_points = score.total_points
+    entry.completed_letters = score.completed_letters
+    entry.last_activity_at = score.last_activity_at
+
+
+def _apply_period_delta(entry, delta, *, today=None):
+    """Credit a score change to the current day/week/month buckets."""
+    for period, bucket_start in period_bucket_starts(today).items():
+        start_field, points_field = PERIOD_FIELDS[period]
+        if getattr(entry, start_field) == bucket_start:
+            setattr(entry, points_field, max(0, getattr(entry, points_field) + delta))
+        elif delta > 0:
+            setattr(entry, start_field, bucket_start)
+            setattr(entry, points_field, delta)
+
+
+def _backfill_period_buckets(entry, *, today=None):
+    """Best-effort buckets for a new entry: credit its score where its last activity falls."""
+    if not entry.last_activity_at or entry.total_points <= 0:
+        return
+    activity_date = timezone.localdate(entry.last_activity_at)
+    for period, bucket_start in period_bucket_starts(today).items():
+        if activity_date >= bucket_start:
+            start_field, points_field = PERIOD_FIELDS[period]
+            setattr(entry, start_field, bucket_start)
+            setattr(entry, points_field, entry.total_points)
+
+
+def _refresh_entry(owner, score, member, *, today=None):
+    from . import leaderboard_redis
+
+    with transaction.atomic():
+        if score is None:
+            LeaderboardEntry.objects.filter(**owner).delete()
+            transaction.on_commit(partial(leaderboard_redis.remove_member, member))
+            return None
+        entry, _ = LeaderboardEntry.objects.select_for_update().get_or_create(**owner)
+        delta = score.total_points - entry.total_points
+        _apply_score(entry, score)
+        _apply_period_delta(entry, delta, today=today)
+        entry.save()
+        transaction.on_commit(partial(leaderboard_redis.sync_entry, entry))
+    return entry
+
+
+def refresh_user_entry(user_id, *, today=None):
+    """Recompute one account learner's entry; call inside the progress write transaction."""
+    from . import leaderboard_redis
+
+    if not user_id:
+        return None
+    with transaction.atomic():
+        # Lock the entry before scoring so concurrent writes for one learner serialize.
+        list(LeaderboardEntry.objects.select_for_update().filter(user_id=user_id))
+        score = next(compute_user_scores([user_id]), None)
+        return _refresh_entry({"user_id": user_id}, score, leaderboard_redis.user_member(user_id), today=today)
+
+
+def refresh_student_entry(student_id, *, today=None):
+    """Recompute one legacy ``Student`` entry after its letter or CVC progress changes."""
+    from . import leaderboard_redis
+
+    if not student_id:
+        return None
+    with transaction.atomic():
+        list(LeaderboardEntry.objects.select_for_update().filter(student_id=student_id))
+        score = next(compute_student_scores([student_id]), None)
+        return _refresh_entry({"student_id": student_id}, score, leaderboard_redis.student_member(student_id), today=today)
+
+
+def rebuild_entries(*, today=None):
+    """Backfill or repair every entry from the source progress tables."""
+    counts = {"created": 0, "updated": 0, "deleted": 0}
+    with transaction.atomic():
+        existing = {
+            ("user", entry.user_id) if entry.user_id else ("student", entry.student_id): entry
+            for entry in LeaderboardEntry.objects.select_for_update()
+        }
+        to_create = []
+        to_update = []
+        for score in _all_scores():
+            key = _score_key(score)
+            entry = existing.pop(key, None)
+            if entry is None:
+                entry = LeaderboardEntry(user_id=score.user_id, student_id=score.student_id)
+                _apply_score(entry, score)
+                _backfill_period_buckets(entry, today=today)
+                to_create.append(entry)
+            else:
+                _apply_score(entry, score)
+                to_update.append(entry)
+
+        LeaderboardEntry.objects.bulk_create(to_create, batch_size=REBUILD_BATCH_SIZE)
+        LeaderboardEntry.objects.bulk_update(
+            to_update,
+            ["display_name", "student_name", "username", "grade", "total_points", "completed_letters", "last_activity_at"],
+            batch_size=REBUILD_BATCH_SIZE,
+        )
+        if existing:
+            LeaderboardEntry.objects.filter(pk__in=[entry.pk for entry in existing.values()]).delete()
+        counts["created"] = len(to_create)
+        counts["updated"] = len(to_update)
+        counts["deleted"] = len(existing)
+    return counts
+
+
+def find_inconsistencies():
+    """Compare stored entries against the scoring functions; returns one dict per drifted learner."""
+    stored = {
+        ("user", entry["user_id"]) if entry["user_id"] else ("student", entry["student_id"]): entry
+        for entry in LeaderboardEntry.objects.values(
+            "user_id", "student_id", "display_name", "student_name", "username", "grade",
+            "total_points", "completed_letters",
+        )
+    }
+    problems = []
+    for score in _all_scores():
+        key = _score_key(score)
+        entry = stored.pop(key, None)
+        expected = {
+            "display_name": str(score.display_name or "")[:200],
+            "student_name": str(score.student_name or "")[:200],
+            "username": str(score.username or "")[:150],
+            "grade": str(score.grade or "")[:80],
+            "total_points": score.total_points,
+            "completed_letters": score.completed_letters,
+        }
+        if entry is None:
+            problems.append({"owner": key, "issue": "missing", "expected": expected})
+            continue
+        actual = {field: entry[field] for field in expected}
+        if actual != expected:
+            problems.append({"owner": key, "issue": "drift", "expected": expected, "actual": actual})
+    for key in stored:
+        problems.append({"owner": key, "issue": "orphan"})
+    return problems
+
+
+def name_order():
+    """``display_name`` compared by code point, the order the Redis index ranks ties in."""
+    if connection.vendor == "postgresql":
+        return Collate("display_name", "C")
+    return F("display_name")
+
+
+def period_board(period, grade, today):
+    """Entries ranked on one board, plus the field holding their points for it."""
+    period = PERIOD_ALIASES.get(period, period)
+    queryset = LeaderboardEntry.objects.all()
+    if period in PERIOD_FIELDS:
+        start_field, points_field = PERIOD_FIELDS[period]
+        queryset = queryset.filter(**{start_field: period_bucket_starts(today)[period]})
+    else:
+        points_field = "total_points"
+    if grade:
+        queryset = queryset.filter(grade=grade)
+    return queryset.alias(name_order=name_order()), points_field
+
+
+def top_entries(period="all", *, grade="", search="", letters_completed_only=False, limit=100, today=None):
+    """Top-N rows carrying the points for the requested period.
+
+    Unfiltered boards are served from the Redis index when it is available;
+    search and letter filters always use the single indexed SQL read.
+    """
+    from . import leaderboard_redis
+
+    if not search and not letters_completed_only:
+        rows = leaderboard_redis.top_entries(period, grade=grade, limit=limit, today=today)
+        if rows is not None:
+            return rows
+
+    queryset, points_field = period_board(period, grade, today)
+    if search:
+        queryset = queryset.filter(
+            Q(display_name__icontains=search)
+            | Q(student_name__icontains=search)
+            | Q(username__icontains=search)
+        )
+    if letters_completed_only:
+        queryset = queryset.filter(completed_letters__gte=LETTERS_COMPLETED_THRESHOLD)
+    return list(
+        queryset
+        .order_by(f"-{points_field}", "name_order", "pk")
+        .annotate(points=F(points_field))
+        .values("display_name", "grade", "completed_letters", "points")[:limit]
+    )
+
+
+def user_rank_context(user_id, period="all", *, grade="", radius=2, today=None):
+    """Rank of one account learner on a board plus up to ``radius`` neighbours each side."""
+    from . import leaderboard_redis
+
+    context = leaderboard_redis.rank_context(
+        leaderboard_redis.user_member(user_id), period, grade=grade, radius=radius, today=today,
+    )
+    if context is not None:
+        for row in context["neighbours"]:
+            row["is_current_user"] = row.pop("member") == leaderboard_redis.user_member(user_id)
+        return context
+
+    queryset, points_field = period_board(period, grade, today)
+    entry = queryset.annotate(points=F(points_field)).filter(user_id=user_id).first()
+    if entry is None:
+        return {"rank": None, "points": 0, "neighbours": []}
+
+    ahead = (
+        Q(**{f"{points_field}__gt": entry.points})
+        | Q(**{points_field: entry.points, "name_order__lt": entry.display_name})
+        | Q(**{points_field: entry.points, "name_order": entry.display_name, "pk__lt": entry.pk})
+    )
+    rank = queryset.filter(ahead).count() + 1
+    fields = ("pk", "display_name", "grade", "completed_letters", "points")
+    above = list(
+        queryset.filter(ahead)
+        .order_by(points_field, "-name_order", "-pk")
+        .annotate(points=F(points_field))
+        .values(*fields)[:radius]
+    )
+    below = list(
+        queryset.exclude(ahead).exclude(pk=entry.pk)
+        .order_by(f"-{points_field}", "name_order", "pk")
+        .annotate(points=F(points_field))
+        .values(*fields)[:radius]
+    )
+    current = {
+        "pk": entry.pk,
+        "display_name": entry.display_name,
+        "grade": entry.grade,
+        "completed_letters": entry.completed_letters,
+        "points": entry.points,
+    }
+    neighbours = [*reversed(above), current, *below]
+    first_rank = rank - len(above)
+    for offset, row in enumerate(neighbours):
+        row["rank"] = first_rank + offset
+        row["is_current_user"] = row.pop("pk") == entry.pk
+    return {"rank": rank, "points": entry.points, "neighbours": neighbours}
+
+
+def _all_scores():
+    yield from compute_student_scores()
+    yield from compute_user_scores()
+
+
+def _score_key(score):
+    return ("user", score.user_id) if score.user_id else ("student", score.student_id)
@@ -0,0 +1,414 @@
+"""Optional Redis sorted-set index over ``LeaderboardEntry``.
+
+One ZSET per (period bucket, grade) lives on the django-redis connection behind
+``CACHES["default"]``. Reads return ``None`` whenever Redis is not configured, the
+index has not been built yet, or Redis errors, and callers fall back to SQL.
+
+Scores are stored negated and boards are read in ascending order, so ties fall
+back to the member order; members start with ``display_name`` and the entry pk,
+which reproduces the SQL ``-points, display_name, pk`` ranking exactly.
+
+The index shares the evictable cache, so a board or the meta hash can vanish
+while the ready flag survives. Every board has a ``:count`` key written in the
+same MULTI as its members; a read whose ZCARD disagrees with it (or whose rows
+lost their meta) flags the board and is answered from SQL, without touching
+the database from Redis code. ``manage.py rebuild_leaderboard --repair-index``
+compares each current board's members and points with SQL, and rebuilds the
+flagged or drifted ones into a temporary key that is renamed over the live one.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from datetime import date
+
+from django.conf import settings
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .leaderboard import PERIOD_ALIASES, PERIOD_FIELDS, period_board, period_bucket_starts
+from .models import LeaderboardEntry
+
+
+logger = logging.getLogger("abcz.performance")
+
+INDEX_VERSION = "v2"
+ALL_GRADES = "*"
+REBUILD_BATCH_SIZE = 500
+MEMBER_SEPARATOR = "\x00"
+PERIOD_KEY_TTL_SECONDS = {
+    "daily": 2 * 24 * 60 * 60,
+    "weekly": 8 * 24 * 60 * 60,
+    "monthly": 32 * 24 * 60 * 60,
+}
+
+
+def is_enabled():
+    if not getattr(settings, "LEADERBOARD_REDIS_ENABLED", False):
+        return False
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    return backend.startswith("django_redis.")
+
+
+def get_connection():
+    try:
+        from django_redis import get_redis_connection
+    except ImportError:
+        return None
+    return get_redis_connection("default")
+
+
+def _namespace():
+    prefix = settings.CACHES.get("default", {}).get("KEY_PREFIX", "")
+    return f"{prefix}:leaderboard:{INDEX_VERSION}" if prefix else f"leaderboard:{INDEX_VERSION}"
+
+
+def _board_prefix():
+    return f"{_namespace()}:z:"
+
+
+def board_key(period, bucket_start, grade):
+    bucket = bucket_start.isoformat() if bucket_start else "all"
+    return f"{_board_prefix()}{period}:{bucket}:{grade or ALL_GRADES}"
+
+
+def count_key(key):
+    return f"{key}:count"
+
+
+def meta_key():
+    return f"{_namespace()}:meta"
+
+
+def ready_key():
+    return f"{_namespace()}:ready"
+
+
+def flagged_key():
+    return f"{_namespace()}:flagged"
+
+
+def entry_member(entry):
+    return f"u:{entry.user_id}" if entry.user_id else f"s:{entry.student_id}"
+
+
+def user_member(user_id):
+    return f"u:{user_id}"
+
+
+def student_member(student_id):
+    return f"s:{student_id}"
+
+
+def ranked_member(entry):
+    """ZSET member ordering equal scores by ``display_name`` then pk; NUL sorts before any name character."""
+    return MEMBER_SEPARATOR.join((entry.display_name, f"{entry.pk:012d}", entry_member(entry)))
+
+
+def owner_member(ranked):
+    return ranked.rsplit(MEMBER_SEPARATOR, 1)[-1]
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _entry_grades(entry):
+    return (ALL_GRADES, entry.grade) if entry.grade else (ALL_GRADES,)
+
+
+def _entry_boards(entry):
+    """Yield ``(key, points, ttl)`` for every board this entry belongs to."""
+    for grade in _entry_grades(entry):
+        yield board_key("all", None, grade), entry.total_points, None
+    for period, (start_field, points_field) in PERIOD_FIELDS.items():
+        bucket_start = getattr(entry, start_field)
+        if not bucket_start:
+            continue
+        for grade in _entry_grades(entry):
+            yield (
+                board_key(period, bucket_start, grade),
+                getattr(entry, points_field),
+                PERIOD_KEY_TTL_SECONDS[period],
+            )
+
+
+def _entry_meta(entry):
+    return json.dumps({
+        "member": ranked_member(entry),
+        "display_name": entry.display_name,
+        "grade": entry.grade,
+        "completed_letters": entry.completed_letters,
+        "boards": sorted(key for key, _, _ in _entry_boards(entry)),
+    }, ensure_ascii=False)
+
+
+def _write_entry(pipe, entry, *, previous=None):
+    member = ranked_member(entry)
+    previous = previous or {}
+    previous_member = previous.get("member")
+    previous_boards = set(previous.get("boards", [])) if previous_member else set()
+    boards = set()
+    for key, points, ttl in _entry_boards(entry):
+        boards.add(key)
+        pipe.zadd(key, {member: -points})
+        if key not in previous_boards:
+            pipe.incr(count_key(key))
+        if ttl:
+            pipe.expire(key, ttl)
+            pipe.expire(count_key(key), ttl)
+    for stale_key in previous_boards:
+        if previous_member != member or stale_key not in boards:
+            pipe.zrem(stale_key, previous_member)
+        if stale_key not in boards:
+            pipe.decr(count_key(stale_key))
+    pipe.hset(meta_key(), entry_member(entry), _entry_meta(entry))
+
+
+def _load_meta(raw):
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def sync_entry(entry):
+    """Mirror one saved entry into its boards; drops its old member from boards it left or renamed on."""
+    if not is_enabled():
+        return
+    try:
+        client = get_connection()
+        previous = _load_meta(client.hget(meta_key(), entry_member(entry)))
+        pipe = client.pipeline()
+        _write_entry(pipe, entry, previous=previous)
+        pipe.execute()
+    except Exception:
+        logger.warning("leaderboard_redis_sync_failed member=%s", entry_member(entry), exc_info=True)
+
+
+def remove_member(member):
+    if not is_enabled():
+        return
+    try:
+        client = get_connection()
+        previous = _load_meta(client.hget(meta_key(), member)) or {}
+        pipe = client.pipeline()
+        if previous.get("member"):
+            for key in previous.get("boards", []):
+                pipe.zrem(key, previous["member"])
+                pipe.decr(count_key(key))
+        pipe.hdel(meta_key(), member)
+        pipe.execute()
+    except Exception:
+        logger.warning("leaderboard_redis_remove_failed member=%s", member, exc_info=True)
+
+
+def rebuild_index():
+    """Rebuild every board from ``LeaderboardEntry``; reads use SQL until it finishes."""
+    if not is_enabled():
+        return None
+    client = get_connection()
+    client.delete(ready_key())
+    stale_keys = list(client.scan_iter(match=f"{_board_prefix()}*", count=REBUILD_BATCH_SIZE))
+    for index in range(0, len(stale_keys), REBUILD_BATCH_SIZE):
+        client.delete(*stale_keys[index:index + REBUILD_BATCH_SIZE])
+    client.delete(meta_key(), flagged_key())
+
+    indexed = 0
+    pipe = client.pipeline()
+    for entry in LeaderboardEntry.objects.order_by("pk").iterator(chunk_size=REBUILD_BATCH_SIZE):
+        _write_entry(pipe, entry)
+        indexed += 1
+        if indexed % REBUILD_BATCH_SIZE == 0:
+            pipe.execute()
+    pipe.set(ready_key(), "1")
+    pipe.execute()
+    return indexed
+
+
+def _resolve_board(period, grade, today):
+    period = PERIOD_ALIASES.get(period, period)
+    if period in PERIOD_FIELDS:
+        return board_key(period, period_bucket_starts(today)[period], grade)
+    return board_key("all", None, grade)
+
+
+def _parse_board_key(key):
+    """``(period, grade, today)`` that ``period_board`` resolves to ``key``, or ``None``."""
+    if not key.startswith(_board_prefix()):
+        return None
+    try:
+        period, bucket, grade = key[len(_board_prefix()):].split(":", 2)
+        today = None if bucket == "all" else date.fromisoformat(bucket)
+    except ValueError:
+        return None
+    if (period == "all") != (today is None) or (period != "all" and period not in PERIOD_FIELDS):
+        return None
+    return period, "" if grade == ALL_GRADES else grade, today
+
+
+def _flag(client, key, reason):
+    logger.warning("leaderboard_redis_board_flagged key=%s reason=%s", key, reason)
+    client.sadd(flagged_key(), key)
+
+
+def _readable_board(client, period, grade, today):
+    """Board key for a read, or ``None`` (after flagging it) when Redis cannot vouch for it."""
+    key = _resolve_board(period, grade, today)
+    pipe = client.pipeline(transaction=False)
+    pipe.sismember(flagged_key(), key)
+    pipe.zcard(key)
+    pipe.get(count_key(key))
+    flagged, size, expected = pipe.execute()
+    if flagged:
+        return None
+    if expected is None or int(expected) != size:
+        _flag(client, key, f"size={size} count={_decode(expected)}")
+        return None
+    return key
+
+
+def _rows(client, ranked, first_rank):
+    """Rows for ranked members, or ``None`` when any member lost its meta to eviction."""
+    if not ranked:
+        return []
+    members = [owner_member(_decode(member)) for member, _ in ranked]
+    metas = [_load_meta(raw_meta) for raw_meta in client.hmget(meta_key(), members)]
+    if any(meta is None for meta in metas):
+        return None
+    rows = []
+    for offset, (member, (_, score), meta) in enumerate(zip(members, ranked, metas)):
+        rows.append({
+            "member": member,
+            "rank": first_rank + offset,
+            "display_name": meta.get("display_name", ""),
+            "grade": meta.get("grade", ""),
+            "completed_letters": int(meta.get("completed_letters") or 0),
+            "points": -int(score),
+        })
+    return rows
+
+
+def _ready_client():
+    if not is_enabled():
+        return None
+    client = get_connection()
+    if not client.exists(ready_key()):
+        return None
+    return client
+
+
+def top_entries(period="all", *, grade="", limit=100, today=None):
+    """Top-N for a board, or ``None`` when the SQL path should answer instead."""
+    try:
+        client = _ready_client()
+        if client is None:
+            return None
+        key = _readable_board(client, period, grade, today)
+        if key is None:
+            return None
+        rows = _rows(client, client.zrange(key, 0, limit - 1, withscores=True), 1)
+        if rows is None:
+            _flag(client, key, "meta_missing")
+        return rows
+    except Exception:
+        logger.warning("leaderboard_redis_read_failed", exc_info=True)
+        return None
+
+
+def rank_context(member, period="all", *, grade="", radius=2, today=None):
+    """``{"rank", "points", "neighbours"}`` for one member in O(log n), or ``None`` to fall back."""
+    try:
+        client = _ready_client()
+        if client is None:
+            return None
+        meta = _load_meta(client.hget(meta_key(), member))
+        if meta is None:
+            return None
+        key = _readable_board(client, period, grade, today)
+        if key is None:
+            return None
+        rank = client.zrank(key, meta["member"])
+        if rank is None:
+            return {"rank": None, "points": 0, "neighbours": []}
+        start = max(0, rank - radius)
+        neighbours = _rows(client, client.zrange(key, start, rank + radius, withscores=True), start + 1)
+        if neighbours is None:
+            _flag(client, key, "meta_missing")
+            return None
+        points = next((row["points"] for row in neighbours if row["member"] == member), 0)
+        return {"rank": rank + 1, "points": points, "neighbours": neighbours}
+    except Exception:
+        logger.warning("leaderboard_redis_read_failed member=%s", member, exc_info=True)
+        return None
+
+
+def _board_drift(client, key, queryset, points_field):
+    """Why ``key`` no longer matches its SQL board, or ``""`` when members, points and count agree."""
+    expected = queryset.aggregate(count=Count("pk"), points=Coalesce(Sum(points_field), 0))
+    ranked = client.zrange(key, 0, -1, withscores=True)
+    actual_points = -int(sum(score for _, score in ranked))
+    count = client.get(count_key(key))
+    if len(ranked) != expected["count"] or actual_points != expected["points"]:
+        return f"members={len(ranked)}/{expected['count']} points={actual_points}/{expected['points']}"
+    if count is None or int(count) != expected["count"]:
+        return f"count={_decode(count)}/{expected['count']}"
+    return ""
+
+
+def _reindex_board(client, key, period, grade, today):
+    """Rebuild one board into a temporary key and rename it over the live one, so readers never see it empty."""
+    queryset, points_field = period_board(period, grade, today)
+    ttl = PERIOD_KEY_TTL_SECONDS.get(PERIOD_ALIASES.get(period, period))
+    staging = f"{key}:rebuild"
+    client.delete(staging)
+    pipe = client.pipeline()
+    members = 0
+    for entry in queryset.order_by("pk").iterator(chunk_size=REBUILD_BATCH_SIZE):
+        pipe.zadd(staging, {ranked_member(entry): -getattr(entry, points_field)})
+        pipe.hset(meta_key(), entry_member(entry), _entry_meta(entry))
+        members += 1
+        if members % REBUILD_BATCH_SIZE == 0:
+            pipe.execute()
+    if members:
+        pipe.rename(staging, key)
+    else:
+        pipe.delete(key)
+    pipe.set(count_key(key), members)
+    if ttl:
+        pipe.expire(key, ttl)
+        pipe.expire(count_key(key), ttl)
+    pipe.srem(flagged_key(), key)
+    pipe.execute()
+    return members
+
+
+def repair_index(today=None):
+    """Rebuild every current board that drifted from SQL and every board a read flagged.
+
+    Returns the rebuilt keys, or ``None`` when the index is disabled or not built.
+    """
+    client = _ready_client()
+    if client is None:
+        return None
+    today = today or timezone.localdate()
+    grades = ["", *sorted(set(LeaderboardEntry.objects.exclude(grade="").values_list("grade", flat=True)))]
+    for period in ("all", *PERIOD_FIELDS):
+        for grade in grades:
+            key = _resolve_board(period, grade, today)
+            drift = _board_drift(client, key, *period_board(period, grade, today))
+            if drift:
+                _flag(client, key, drift)
+
+    rebuilt = []
+    for key in sorted(_decode(raw) for raw in client.smembers(flagged_key())):
+        board = _parse_board_key(key)
+        if board is None:
+            client.srem(flagged_key(), key)
+            continue
+        _reindex_board(client, key, *board)
+        rebuilt.append(key)
+    return rebuilt
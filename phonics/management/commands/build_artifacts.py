@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phonics import views  # noqa: F401  (registers the artifacts)
+from phonics.artifacts import ensure_artifact, prebuilt_root, prune_artifact, registered_artifacts
+
+
+class Command(BaseCommand):
+    help = "Build the generated download files for the current content version and remove older versions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Artifacts to build (default: every registered artifact).")
+        parser.add_argument("--keep-stale", action="store_true", help="Do not delete files of older versions.")
+        parser.add_argument(
+            "--root",
+            type=Path,
+            help="Output directory (default: ARTIFACTS_BUILD_ROOT, shipped with the build).",
+        )
+
+    def handle(self, *args, **options):
+        available = registered_artifacts()
+        unknown = sorted(set(options["names"]) - set(available))
+        if unknown:
+            raise CommandError(f"Unknown artifact(s): {', '.join(unknown)}. Choose from: {', '.join(available)}.")
+
+        root = options["root"] or prebuilt_root()
+        for name in options["names"] or available:
+            artifact = ensure_artifact(name, root)
+            self.stdout.write(f"{name}: {artifact.path} ({artifact.path.stat().st_size} bytes)")
+            if not options["keep_stale"]:
+                for stale in prune_artifact(artifact):
+                    self.stdout.write(f"{name}: removed {stale.name}")
+        self.stdout.write(self.style.SUCCESS("Artifacts are up to date."))
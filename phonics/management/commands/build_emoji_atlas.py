@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from phonics.artifacts import prebuilt_root
+from phonics.emoji_atlas import atlas_paths, prune_atlases
+from phonics.views import letter_worksheet_book_items, letters_book_emoji_atlas
+
+
+class Command(BaseCommand):
+    help = "Pre-render the worksheet book emoji into the sprite atlas and remove older atlases."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep-stale", action="store_true", help="Do not delete older atlas files.")
+        parser.add_argument(
+            "--root",
+            type=Path,
+            help="Output directory (default: ARTIFACTS_BUILD_ROOT, shipped with the build).",
+        )
+
+    def handle(self, *args, **options):
+        root = options["root"] or prebuilt_root()
+        atlas = letters_book_emoji_atlas(letter_worksheet_book_items(), root)
+        if atlas is None:
+            self.stdout.write(self.style.WARNING("No emoji font is installed; worksheets will use letter badges."))
+            return
+
+        data_path = atlas_paths(atlas.digest, root)[0]
+        self.stdout.write(f"emoji atlas: {data_path} ({len(atlas.index)} tiles)")
+        if not options["keep_stale"]:
+            for stale in prune_atlases(atlas, root):
+                self.stdout.write(f"emoji atlas: removed {stale.name}")
+        self.stdout.write(self.style.SUCCESS("Emoji atlas is up to date."))
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from phonics.inline_assets import PAGE_ASSETS, extract_page
+
+
+class Command(BaseCommand):
+    help = "Move inline <style>/<script> blocks of the large page templates into static files."
+
+    def add_arguments(self, parser):
+        parser.add_argument("pages", nargs="*", help="Page names to process (default: every registered page).")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Write nothing; fail if any page still has a block that would be extracted.",
+        )
+
+    def handle(self, *args, **options):
+        pages = {page.name: page for page in PAGE_ASSETS}
+        unknown = sorted(set(options["pages"]) - set(pages))
+        if unknown:
+            raise CommandError(f"Unknown page(s): {', '.join(unknown)}. Choose from: {', '.join(pages)}.")
+        selected = [pages[name] for name in options["pages"]] or list(PAGE_ASSETS)
+
+        static_root = settings.BASE_DIR / "static"
+        pending = []
+        for page in selected:
+            assets = extract_page(page, settings.BASE_DIR, static_root, write=not options["check"])
+            for asset in assets:
+                pending.append(page.name)
+                self.stdout.write(f"{page.name}: {asset.path} ({len(asset.content.encode('utf-8'))} bytes)")
+
+        if options["check"]:
+            if pending:
+                raise CommandError(
+                    f"{len(pending)} inline block(s) still need extracting; run `manage.py extract_inline_assets`."
+                )
+            self.stdout.write(self.style.SUCCESS("No inline blocks left to extract."))
+            return
+        self.stdout.write(self.style.SUCCESS(f"Extracted {len(pending)} inline block(s)."))
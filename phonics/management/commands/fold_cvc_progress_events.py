@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from phonics.cvc_progress import ContentTotals, fold_cvc_events, pending_event_user_ids
+from phonics.leaderboard import refresh_user_entry
+from phonics.models import CVCSentence, CVCStory, CVCWord
+from phonics.views import get_cached_cvc_content_count
+
+
+class Command(BaseCommand):
+    help = "Fold CVC progress events that were recorded but not yet applied to their aggregate rows."
+
+    def handle(self, *args, **options):
+        user_ids = pending_event_user_ids()
+        if not user_ids:
+            self.stdout.write(self.style.SUCCESS("No pending CVC progress events."))
+            return
+
+        totals = ContentTotals(
+            words=get_cached_cvc_content_count("words", CVCWord),
+            sentences=get_cached_cvc_content_count("sentences", CVCSentence, extra=99),
+            stories=get_cached_cvc_content_count("stories", CVCStory, extra=9),
+        )
+        for user_id in user_ids:
+            fold_cvc_events(user_id, totals)
+            refresh_user_entry(user_id)
+        self.stdout.write(self.style.SUCCESS(f"Folded pending CVC progress events for {len(user_ids)} user(s)."))
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from phonics.progress_batch import purge_receipts
+
+
+class Command(BaseCommand):
+    help = "Delete progress batch idempotency receipts older than PROGRESS_BATCH_RECEIPT_RETENTION_DAYS."
+
+    def handle(self, *args, **options):
+        deleted = purge_receipts()
+        self.stdout.write(self.style.SUCCESS(
+            f"Purged {deleted} progress batch receipt(s) older than "
+            f"{settings.PROGRESS_BATCH_RECEIPT_RETENTION_DAYS} day(s)."
+        ))
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from phonics import leaderboard_redis
+from phonics.leaderboard import find_inconsistencies, rebuild_entries
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the materialized leaderboard (and its Redis index when enabled), "
+        "or check it against the scoring functions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Read-only: report entries that differ from the current scoring functions.",
+        )
+        parser.add_argument(
+            "--repair-index",
+            action="store_true",
+            help="Only rebuild Redis boards that reads flagged or that drifted from the materialized table.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            problems = find_inconsistencies()
+            if problems:
+                for problem in problems:
+                    owner_type, owner_id = problem["owner"]
+                    self.stderr.write(f"{problem['issue']}: {owner_type}={owner_id}")
+                raise CommandError(f"Leaderboard check found {len(problems)} inconsistent entr(ies).")
+            self.stdout.write(self.style.SUCCESS("Leaderboard check: consistent."))
+            return
+
+        if options["repair_index"]:
+            rebuilt = leaderboard_redis.repair_index()
+            if rebuilt is None:
+                self.stdout.write("Leaderboard Redis index is disabled or not built; nothing to repair.")
+                return
+            for key in rebuilt:
+                self.stdout.write(f"rebuilt: {key}")
+            self.stdout.write(self.style.SUCCESS(f"Leaderboard Redis index repaired: boards={len(rebuilt)}"))
+            return
+
+        counts = rebuild_entries()
+        self.stdout.write(self.style.SUCCESS(
+            "Leaderboard rebuilt: "
+            f"created={counts['created']} updated={counts['updated']} deleted={counts['deleted']}"
+        ))
+        indexed = leaderboard_redis.rebuild_index()
+        if indexed is not None:
+            self.stdout.write(self.style.SUCCESS(f"Leaderboard Redis index rebuilt: members={indexed}"))
+            # Boards with no entries yet still need their count key before reads trust them.
+            leaderboard_redis.repair_index()
@@ -0,0 +1,45 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from phonics import views  # noqa: F401  (registers the job handlers)
+from phonics.document_jobs import purge_finished, run_pending
+
+logger = logging.getLogger("abcz.performance")
+
+
+class Command(BaseCommand):
+    help = "Build queued certificates and worksheet books; runs until stopped unless --once is given."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit.")
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when the queue is empty.")
+        parser.add_argument("--purge-every", type=int, default=3600, help="Seconds between purges of old jobs.")
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            ran = run_pending()
+            purged = purge_finished()
+            self.stdout.write(self.style.SUCCESS(f"Ran {ran} document job(s); purged {purged} old job(s)."))
+            return
+
+        self.stdout.write("Waiting for document jobs...")
+        next_purge = 0.0
+        while True:
+            close_old_connections()
+            try:
+                if time.monotonic() >= next_purge:
+                    purge_finished()
+                    next_purge = time.monotonic() + options["purge_every"]
+                ran = run_pending()
+            except Exception:
+                # A lost database connection should not end the worker; try again shortly.
+                logger.exception("document_job_worker_error")
+                time.sleep(options["sleep"])
+                continue
+            if ran:
+                self.stdout.write(f"Ran {ran} document job(s).")
+            else:
+                time.sleep(options["sleep"])
@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from phonics.subscriptions import COMPATIBILITY_GROUPS, synchronize_user_subscription_compatibility
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh compatibility groups and profile flags from active subscriptions. "
+        "Run periodically so expirations reach users who have not logged in since."
+    )
+
+    def handle(self, *args, **options):
+        users = (
+            get_user_model().objects
+            .filter(
+                Q(subscriptions__isnull=False)
+                | Q(groups__name__in=COMPATIBILITY_GROUPS.values())
+                | Q(student_profile__is_premium=True)
+                | Q(student_profile__is_vip=True)
+            )
+            .distinct()
+            .order_by("pk")
+        )
+        synchronized = 0
+        for user in users.iterator(chunk_size=500):
+            synchronize_user_subscription_compatibility(user)
+            synchronized += 1
+        self.stdout.write(self.style.SUCCESS(f"Subscription compatibility synchronized for {synchronized} user(s)."))
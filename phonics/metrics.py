@@ -0,0 +1,345 @@
+"""Per-view request latency histograms and per-request DB/cache counters, exposed on ``/metrics``.
+
+``RequestTimingMiddleware`` opens a ``RequestStats`` for every request. A
+``connection.execute_wrapper`` counts SQL queries and their time,
+``safe_cache_get``/``safe_cache_set`` add cache time and hits/misses, and the
+template backend and PDF builders add their time through ``timed``. When the
+response is ready,
+``observe`` adds the request to this worker's series, keyed by resolved URL
+name, method and status.
+
+Each worker batches its increments in memory and flushes them at most every
+``METRICS_FLUSH_SECONDS`` into one Redis hash, with ``HINCRBYFLOAT`` in a
+pipeline. Every gunicorn worker therefore adds to the same totals.
+Without a django-redis cache the totals stay in the process, which is exact
+for the dev server and tests. ``/metrics`` renders the totals in the Prometheus
+text format. p50/p95/p99 come from ``histogram_quantile`` over the
+``abcz_request_duration_seconds`` buckets.
+
+The same registry counts the outcomes of ``cache_helpers.get_or_compute`` (hits,
+misses, waits, stale serves, early refreshes, recomputes, local-tier hits and
+misses) as ``abcz_cache_events_total{event=...}``.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+
+logger = logging.getLogger("abcz.performance")
+
+METRICS_VERSION = "v1"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+COUNTERS = (
+    ("db_queries", "abcz_request_db_queries_total", "SQL queries run while serving requests."),
+    ("db_seconds", "abcz_request_db_seconds_total", "Seconds spent in SQL while serving requests."),
+    ("cache_hits", "abcz_request_cache_hits_total", "Shared cache lookups that found a value."),
+    ("cache_misses", "abcz_request_cache_misses_total", "Shared cache lookups that found nothing."),
+    ("cache_seconds", "abcz_request_cache_seconds_total", "Seconds spent in shared cache reads and writes."),
+    ("template_seconds", "abcz_request_template_seconds_total", "Seconds spent rendering templates."),
+    ("pdf_seconds", "abcz_request_pdf_seconds_total", "Seconds spent building documents on the request path."),
+)
+CACHE_EVENTS = (
+    "hits",
+    "misses",
+    "waits",
+    "stale_serves",
+    "early_refreshes",
+    "recomputes",
+    "local_hits",
+    "local_misses",
+)
+_SEPARATOR = "|"
+
+
+@dataclass
+class RequestStats:
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_seconds: float = 0.0
+    template_seconds: float = 0.0
+    pdf_seconds: float = 0.0
+    active: set = field(default_factory=set, repr=False)
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Multi-metric ``Server-Timing`` value; durations in milliseconds."""
+        parts = [
+            f"app;dur={total_seconds * 1000:.1f}",
+            f"db;dur={self.db_seconds * 1000:.1f};desc={self.db_queries}",
+            f"cache;dur={self.cache_seconds * 1000:.1f}",
+            f"tmpl;dur={self.template_seconds * 1000:.1f}",
+        ]
+        if self.pdf_seconds:
+            parts.append(f"pdf;dur={self.pdf_seconds * 1000:.1f}")
+        return ", ".join(parts)
+
+    def log_fields(self) -> dict[str, float]:
+        return {
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_seconds * 1000, 2),
+            "cache_ms": round(self.cache_seconds * 1000, 2),
+            "tmpl_ms": round(self.template_seconds * 1000, 2),
+            "pdf_ms": round(self.pdf_seconds * 1000, 2),
+        }
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+def start_request() -> tuple[RequestStats, object]:
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def finish_request(token) -> None:
+    _request_stats.reset(token)
+
+
+def count_queries(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook adding each query's count and time to the request's stats."""
+    stats = _request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.db_queries += 1
+        stats.db_seconds += time.perf_counter() - started_at
+
+
+def record_cache_lookup(hit: bool, seconds: float = 0.0) -> None:
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    stats.cache_seconds += seconds
+    if hit:
+        stats.cache_hits += 1
+    else:
+        stats.cache_misses += 1
+
+
+def record_cache_write(seconds: float) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.cache_seconds += seconds
+
+
+@contextmanager
+def timed(name: str):
+    """Add the block's duration to ``RequestStats.<name>_seconds``; nested blocks of one name count once."""
+    stats = _request_stats.get()
+    if stats is None or name in stats.active:
+        yield
+        return
+    stats.active.add(name)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.active.discard(name)
+        setattr(stats, f"{name}_seconds", getattr(stats, f"{name}_seconds") + time.perf_counter() - started_at)
+
+
+def _series(view: str, method: str, status: int) -> str:
+    method = method if method in KNOWN_METHODS else "OTHER"
+    return _SEPARATOR.join((view or "unmatched", method, str(status)))
+
+
+def _bucket(seconds: float) -> str:
+    for bound in LATENCY_BUCKETS:
+        if seconds <= bound:
+            return repr(bound)
+    return "+Inf"
+
+
+def _redis_connection():
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    if not backend.startswith("django_redis."):
+        return None
+    try:
+        from django_redis import get_redis_connection
+    except ImportError:
+        return None
+    return get_redis_connection("default")
+
+
+def metrics_key() -> str:
+    prefix = settings.CACHES.get("default", {}).get("KEY_PREFIX", "")
+    return f"{prefix}:metrics:{METRICS_VERSION}" if prefix else f"metrics:{METRICS_VERSION}"
+
+
+class MetricsRegistry:
+    """Flat ``field -> value`` totals; fields are ``<metric>|<view>|<method>|<status>[|<le>]``."""
+
+    def __init__(self):
+        self._pending: defaultdict[str, float] = defaultdict(float)
+        self._local: defaultdict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def observe(self, view: str, method: str, status: int, seconds: float, stats: RequestStats | None) -> None:
+        series = _series(view, method, status)
+        with self._lock:
+            self._pending[f"bucket{_SEPARATOR}{series}{_SEPARATOR}{_bucket(seconds)}"] += 1
+            self._pending[f"sum{_SEPARATOR}{series}"] += seconds
+            self._pending[f"count{_SEPARATOR}{series}"] += 1
+            if stats is not None:
+                for name, _, _ in COUNTERS:
+                    value = getattr(stats, name)
+                    if value:
+                        self._pending[f"{name}{_SEPARATOR}{series}"] += value
+            due = time.monotonic() - self._flushed_at >= settings.METRICS_FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def increment(self, field: str, value: float = 1.0) -> None:
+        with self._lock:
+            self._pending[field] += value
+            due = time.monotonic() - self._flushed_at >= settings.METRICS_FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = dict(self._pending)
+            self._pending.clear()
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return
+        connection = _redis_connection()
+        if connection is None:
+            with self._lock:
+                for field, value in pending.items():
+                    self._local[field] += value
+            return
+        try:
+            pipeline = connection.pipeline(transaction=False)
+            key = metrics_key()
+            for field, value in pending.items():
+                pipeline.hincrbyfloat(key, field, value)
+            pipeline.execute()
+        except Exception:
+            # Keep the increments for the next flush rather than losing them.
+            logger.warning("metrics_flush_failed fields=%s", len(pending), exc_info=True)
+            with self._lock:
+                for field, value in pending.items():
+                    self._pending[field] += value
+
+    def totals(self) -> dict[str, float]:
+        """Totals across every worker that has flushed, including this worker's latest requests."""
+        self.flush()
+        connection = _redis_connection()
+        if connection is None:
+            with self._lock:
+                return dict(self._local)
+        raw = connection.hgetall(metrics_key())
+        return {
+            (field.decode() if isinstance(field, bytes) else field): float(value)
+            for field, value in raw.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._local.clear()
+        connection = _redis_connection()
+        if connection is not None:
+            connection.delete(metrics_key())
+
+
+registry = MetricsRegistry()
+atexit.register(registry.flush)
+
+
+def observe_request(request, response, seconds: float, stats: RequestStats | None) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    match = getattr(request, "resolver_match", None)
+    view = match.view_name if match is not None and match.view_name else "unmatched"
+    try:
+        registry.observe(view, request.method, response.status_code, seconds, stats)
+    except Exception:
+        logger.warning("metrics_observe_failed view=%s", view, exc_info=True)
+
+
+def record_cache_event(event: str) -> None:
+    """Count one ``get_or_compute`` outcome; ``event`` is one of ``CACHE_EVENTS``."""
+    if not settings.METRICS_ENABLED:
+        return
+    try:
+        registry.increment(f"cache_event{_SEPARATOR}{event}")
+    except Exception:
+        logger.warning("metrics_cache_event_failed event=%s", event, exc_info=True)
+
+
+def cache_event_totals(totals: dict[str, float] | None = None) -> dict[str, int]:
+    totals = registry.totals() if totals is None else totals
+    return {event: int(totals.get(f"cache_event{_SEPARATOR}{event}", 0)) for event in CACHE_EVENTS}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(view: str, method: str, status: str, **extra) -> str:
+    pairs = {"view": view, "method": method, "status": status, **extra}
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(totals: dict[str, float]) -> str:
+    """Prometheus text exposition (format 0.0.4) of ``totals``."""
+    buckets = defaultdict(dict)
+    by_metric = defaultdict(dict)
+    for field, value in totals.items():
+        parts = field.split(_SEPARATOR)
+        if parts[0] == "bucket" and len(parts) == 5:
+            buckets[tuple(parts[1:4])][parts[4]] = value
+        elif len(parts) == 4:
+            by_metric[parts[0]][tuple(parts[1:4])] = value
+
+    lines = [
+        "# HELP abcz_request_duration_seconds Request latency by resolved URL name, method and status.",
+        "# TYPE abcz_request_duration_seconds histogram",
+    ]
+    for series in sorted(set(buckets) | set(by_metric["count"])):
+        cumulative = 0.0
+        counts = buckets.get(series, {})
+        for bound in LATENCY_BUCKETS:
+            cumulative += counts.get(repr(bound), 0)
+            lines.append(f"abcz_request_duration_seconds_bucket{_labels(*series, le=repr(bound))} {_number(cumulative)}")
+        cumulative += counts.get("+Inf", 0)
+        lines.append(f"abcz_request_duration_seconds_bucket{_labels(*series, le='+Inf')} {_number(cumulative)}")
+        lines.append(f"abcz_request_duration_seconds_sum{_labels(*series)} {_number(by_metric['sum'].get(series, 0))}")
+        lines.append(f"abcz_request_duration_seconds_count{_labels(*series)} {_number(by_metric['count'].get(series, 0))}")
+
+    for name, metric, help_text in COUNTERS:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for series, value in sorted(by_metric[name].items()):
+            lines.append(f"{metric}{_labels(*series)} {_number(value)}")
+
+    lines.append("# HELP abcz_cache_events_total Read-through cache outcomes across the shared and per-worker tiers.")
+    lines.append("# TYPE abcz_cache_events_total counter")
+    for event, value in cache_event_totals(totals).items():
+        lines.append(f'abcz_cache_events_total{{event="{event}"}} {_number(value)}')
+    return "\n".join(lines) + "\n"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import logging
+import random
 import re
 import time
 import uuid
 from contextvars import ContextVar
 
 from django.conf import settings
+from django.db import connection
+from django.utils.functional import SimpleLazyObject
+
+from . import metrics
+from .subscriptions import get_entitlement_summary
 
 
 _current_request: ContextVar[object | None] = ContextVar("current_request", default=None)
@@ -43,14 +49,38 @@ class RequestIDMiddleware:
         return response
 
 
+class EntitlementMiddleware:
+    """Expose ``request.entitlements``, loaded from the shared cache at most once per request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.entitlements = SimpleLazyObject(lambda: get_entitlement_summary(request.user))
+        return self.get_response(request)
+
+
 class RequestTimingMiddleware:
+    """Log each request with its SQL/cache/template time and feed the ``/metrics`` histograms.
+
+    ``Server-Timing`` breaks the same time down per component. It is sent in DEBUG, when
+    ``ENABLE_SERVER_TIMING_HEADER`` is set, to staff users, and otherwise to a
+    ``SERVER_TIMING_SAMPLE_RATE`` fraction of requests.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         started_at = time.perf_counter()
-        response = self.get_response(request)
+        stats, token = metrics.start_request()
+        try:
+            with connection.execute_wrapper(metrics.count_queries):
+                response = self.get_response(request)
+        finally:
+            metrics.finish_request(token)
         duration_ms = (time.perf_counter() - started_at) * 1000
+        metrics.observe_request(request, response, duration_ms / 1000, stats)
 
         if getattr(settings, "REQUEST_LOG_ENABLED", True):
             logger.info(
@@ -61,14 +91,25 @@ class RequestTimingMiddleware:
                     "path": request.path,
                     "status_code": response.status_code,
                     "duration_ms": round(duration_ms, 2),
+                    **stats.log_fields(),
                 },
             )
 
-        if settings.DEBUG or getattr(settings, "ENABLE_SERVER_TIMING_HEADER", False):
-            response["Server-Timing"] = f"app;dur={duration_ms:.1f}"
+        if self.exposes_server_timing(request):
+            response["Server-Timing"] = stats.server_timing(duration_ms / 1000)
 
         csp_report_only = getattr(settings, "CSP_REPORT_ONLY", "")
         if csp_report_only:
             response.setdefault("Content-Security-Policy-Report-Only", csp_report_only)
 
         return response
+
+    @staticmethod
+    def exposes_server_timing(request):
+        if settings.DEBUG or getattr(settings, "ENABLE_SERVER_TIMING_HEADER", False):
+            return True
+        sample_rate = getattr(settings, "SERVER_TIMING_SAMPLE_RATE", 0.0)
+        if sample_rate > 0 and random.random() < sample_rate:
+            return True
+        user = getattr(request, "user", None)
+        return bool(user is not None and getattr(user, "is_staff", False))
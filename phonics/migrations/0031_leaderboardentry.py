@@ -0,0 +1,103 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phonics", "0030_adminauditlog"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("display_name", models.CharField(max_length=200)),
+                ("student_name", models.CharField(blank=True, max_length=200)),
+                ("username", models.CharField(blank=True, max_length=150)),
+                ("grade", models.CharField(blank=True, max_length=80)),
+                ("total_points", models.PositiveIntegerField(default=0)),
+                ("completed_letters", models.PositiveSmallIntegerField(default=0)),
+                ("last_activity_at", models.DateTimeField(blank=True, null=True)),
+                ("day_start", models.DateField(blank=True, null=True)),
+                ("day_points", models.PositiveIntegerField(default=0)),
+                ("week_start", models.DateField(blank=True, null=True)),
+                ("week_points", models.PositiveIntegerField(default=0)),
+                ("month_start", models.DateField(blank=True, null=True)),
+                ("month_points", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "student",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entry",
+                        to="phonics.student",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entry",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Leaderboard entry",
+                "verbose_name_plural": "Leaderboard entries",
+                "indexes": [
+                    models.Index(
+                        fields=["-total_points", "display_name"],
+                        name="leaderboard_total_idx",
+                    ),
+                    models.Index(
+                        fields=["grade", "-total_points"],
+                        name="leaderboard_grade_total_idx",
+                    ),
+                    models.Index(
+                        fields=["day_start", "-day_points"], name="leaderboard_day_idx"
+                    ),
+                    models.Index(
+                        fields=["week_start", "-week_points"],
+                        name="leaderboard_week_idx",
+                    ),
+                    models.Index(
+                        fields=["month_start", "-month_points"],
+                        name="leaderboard_month_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(
+                                ("student__isnull", True), ("user__isnull", False)
+                            ),
+                            models.Q(
+                                ("student__isnull", False), ("user__isnull", True)
+                            ),
+                            _connector="OR",
+                        ),
+                        name="leaderboard_entry_single_owner",
+                    )
+                ],
+            },
+        ),
+    ]
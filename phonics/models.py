@@ -11,6 +11,8 @@ from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from django.utils.text import get_valid_filename
+
+from .fields import BoundedSetField
 
 # قائمة الحروف من A إلى Z لاستخدامها كـ choices
 LETTERS = [
@@ -231,7 +233,7 @@ class SoundPracticeProgress(models.Model):
         on_delete=models.CASCADE,
         related_name="sound_practice_progress",
     )
-    completed_items = models.JSONField(default=list, blank=True)
+    completed_items = BoundedSetField(limit=300, blank=True)
     quiz_attempts = models.PositiveIntegerField(default=0)
     quiz_correct = models.PositiveIntegerField(default=0)
     mic_attempts = models.PositiveIntegerField(default=0)
@@ -240,7 +242,7 @@ class SoundPracticeProgress(models.Model):
     last_item = models.CharField(max_length=80, blank=True)
     last_payload = models.JSONField(default=dict, blank=True)
     vowel_lessons_completed = models.PositiveIntegerField(default=0)
-    practiced_vowels = models.JSONField(default=list, blank=True)
+    practiced_vowels = BoundedSetField(limit=10, blank=True)
     vowel_quiz_attempts = models.PositiveIntegerField(default=0)
     vowel_quiz_correct = models.PositiveIntegerField(default=0)
     vowel_microphone_attempts = models.PositiveIntegerField(default=0)
@@ -720,13 +722,13 @@ class CVCReadingProgress(models.Model):
         on_delete=models.CASCADE,
         related_name="cvc_reading_progress",
     )
-    completed_levels = models.JSONField(default=list, blank=True)
-    completed_lessons = models.JSONField(default=list, blank=True)
-    completed_families = models.JSONField(default=list, blank=True)
-    words_practiced = models.JSONField(default=list, blank=True)
-    words_mastered = models.JSONField(default=list, blank=True)
+    completed_levels = BoundedSetField(limit=20, blank=True)
+    completed_lessons = BoundedSetField(limit=80, blank=True)
+    completed_families = BoundedSetField(limit=60, blank=True)
+    words_practiced = BoundedSetField(limit=300, blank=True)
+    words_mastered = BoundedSetField(limit=300, blank=True)
     sentences_read = models.PositiveIntegerField(default=0)
-    sentences_mastered = models.JSONField(default=list, blank=True)
+    sentences_mastered = BoundedSetField(limit=300, blank=True)
     sentence_quiz_attempts = models.PositiveIntegerField(default=0)
     sentence_quiz_correct = models.PositiveIntegerField(default=0)
     sentence_microphone_attempts = models.PositiveIntegerField(default=0)
@@ -744,7 +746,7 @@ class CVCReadingProgress(models.Model):
     sentence_best_time_seconds = models.PositiveIntegerField(default=0)
     sentence_total_time_seconds = models.PositiveIntegerField(default=0)
     stories_completed = models.PositiveIntegerField(default=0)
-    stories_started = models.JSONField(default=list, blank=True)
+    stories_started = BoundedSetField(limit=120, blank=True)
     story_quiz_attempts = models.PositiveIntegerField(default=0)
     story_quiz_correct = models.PositiveIntegerField(default=0)
     story_microphone_attempts = models.PositiveIntegerField(default=0)
@@ -756,10 +758,10 @@ class CVCReadingProgress(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(100)],
     )
     story_best_reading_time = models.PositiveIntegerField(default=0)
-    story_needs_review = models.JSONField(default=list, blank=True)
+    story_needs_review = BoundedSetField(limit=60, blank=True)
     pronoun_lessons_completed = models.PositiveIntegerField(default=0)
-    pronouns_practiced = models.JSONField(default=list, blank=True)
-    pronouns_mastered = models.JSONField(default=list, blank=True)
+    pronouns_practiced = BoundedSetField(limit=160, blank=True)
+    pronouns_mastered = BoundedSetField(limit=160, blank=True)
     pronoun_quiz_attempts = models.PositiveIntegerField(default=0)
     pronoun_quiz_correct = models.PositiveIntegerField(default=0)
     pronoun_microphone_attempts = models.PositiveIntegerField(default=0)
@@ -770,9 +772,9 @@ class CVCReadingProgress(models.Model):
         default=0,
         validators=[MinValueValidator(0), MaxValueValidator(100)],
     )
-    pronouns_needs_review = models.JSONField(default=list, blank=True)
-    sight_words_practiced = models.JSONField(default=list, blank=True)
-    sight_words_mastered = models.JSONField(default=list, blank=True)
+    pronouns_needs_review = BoundedSetField(limit=80, blank=True)
+    sight_words_practiced = BoundedSetField(limit=120, blank=True)
+    sight_words_mastered = BoundedSetField(limit=120, blank=True)
     sight_word_quiz_attempts = models.PositiveIntegerField(default=0)
     sight_word_quiz_correct = models.PositiveIntegerField(default=0)
     fluency_sentences_read = models.PositiveIntegerField(default=0)
@@ -787,10 +789,10 @@ class CVCReadingProgress(models.Model):
         default=0,
         validators=[MinValueValidator(0), MaxValueValidator(100)],
     )
-    question_words_mastered = models.JSONField(default=list, blank=True)
+    question_words_mastered = BoundedSetField(limit=30, blank=True)
     conversations_completed = models.PositiveIntegerField(default=0)
-    action_verbs_mastered = models.JSONField(default=list, blank=True)
-    adjectives_mastered = models.JSONField(default=list, blank=True)
+    action_verbs_mastered = BoundedSetField(limit=60, blank=True)
+    adjectives_mastered = BoundedSetField(limit=60, blank=True)
     last_fluency_sentence = models.CharField(max_length=180, blank=True)
     last_sight_word = models.CharField(max_length=60, blank=True)
     last_conversation = models.CharField(max_length=120, blank=True)
@@ -809,8 +811,9 @@ class CVCReadingProgress(models.Model):
         default=0,
         validators=[MinValueValidator(0), MaxValueValidator(100)],
     )
-    needs_review_words = models.JSONField(default=list, blank=True)
+    needs_review_words = BoundedSetField(limit=50, blank=True)
     last_payload = models.JSONField(default=dict, blank=True)
+    last_event_id = models.PositiveBigIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -825,6 +828,55 @@ class CVCReadingProgress(models.Model):
         return f"{self.user.username} - CVC Reading {self.cvc_mastery_percentage}%"
 
 
+class CVCProgressEvent(models.Model):
+    """Append-only CVC reading event; folded into ``CVCReadingProgress`` in id order."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="cvc_progress_events",
+    )
+    event_type = models.CharField(max_length=30, blank=True)
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "CVC progress event"
+        verbose_name_plural = "CVC progress events"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["user", "id"], name="cvc_event_user_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.event_type or 'event'} #{self.pk}"
+
+
+class ProgressBatchReceipt(models.Model):
+    """Stored response of one ``/api/progress/batch/`` call, replayed for a repeated idempotency key."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="progress_batch_receipts",
+    )
+    idempotency_key = models.CharField(max_length=64)
+    payload_digest = models.CharField(max_length=64)
+    response = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Progress batch receipt"
+        verbose_name_plural = "Progress batch receipts"
+        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "idempotency_key"], name="unique_progress_batch_receipt"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.idempotency_key}"
+
+
 class EnglishFoundationProgress(models.Model):
     SECTION_CHOICES = [
         ("vocabulary", "Vocabulary"),
@@ -865,6 +917,94 @@ class EnglishFoundationProgress(models.Model):
         return f"{self.user.username} - {self.section} ({self.points})"
 
 
+class LeaderboardEntry(models.Model):
+    """Denormalized leaderboard score for one learner (account user or legacy student)."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="leaderboard_entry",
+        null=True,
+        blank=True,
+    )
+    student = models.OneToOneField(
+        Student,
+        on_delete=models.CASCADE,
+        related_name="leaderboard_entry",
+        null=True,
+        blank=True,
+    )
+    display_name = models.CharField(max_length=200)
+    student_name = models.CharField(max_length=200, blank=True)
+    username = models.CharField(max_length=150, blank=True)
+    grade = models.CharField(max_length=80, blank=True)
+    total_points = models.PositiveIntegerField(default=0)
+    completed_letters = models.PositiveSmallIntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+    day_start = models.DateField(null=True, blank=True)
+    day_points = models.PositiveIntegerField(default=0)
+    week_start = models.DateField(null=True, blank=True)
+    week_points = models.PositiveIntegerField(default=0)
+    month_start = models.DateField(null=True, blank=True)
+    month_points = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Leaderboard entry"
+        verbose_name_plural = "Leaderboard entries"
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(user__isnull=False, student__isnull=True)
+                    | models.Q(user__isnull=True, student__isnull=False)
+                ),
+                name="leaderboard_entry_single_owner",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["-total_points", "display_name"], name="leaderboard_total_idx"),
+            models.Index(fields=["grade", "-total_points"], name="leaderboard_grade_total_idx"),
+            models.Index(fields=["day_start", "-day_points"], name="leaderboard_day_idx"),
+            models.Index(fields=["week_start", "-week_points"], name="leaderboard_week_idx"),
+            models.Index(fields=["month_start", "-month_points"], name="leaderboard_month_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.display_name} ({self.total_points})"
+
+
+class DocumentJob(models.Model):
+    """One queued document build (certificate, worksheet book); identical requests share a row."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    kind = models.CharField(max_length=40)
+    job_key = models.CharField(max_length=64, unique=True)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    result_path = models.CharField(max_length=500, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Document job"
+        verbose_name_plural = "Document jobs"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["status", "id"], name="document_job_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.job_key[:12]} ({self.status})"
+
+
 class UserSubscription(models.Model):
     class Status(models.TextChoices):
         ACTIVE = "active", "Active"
@@ -0,0 +1,105 @@
+"""Offline support for the learning pages: the asset manifest and the service worker config.
+
+``/sw.js`` is rendered from ``phonics/service_worker.js`` with the config below
+inlined, so every manifest version is a byte-different worker and browsers
+install it as an update. The new worker precaches the whole manifest into a
+cache named after that version before it activates, then drops the previous
+caches. Clients therefore switch from one complete asset set to the next in one
+step, never to a mix of the two.
+
+The manifest lists the static CSS/JS of the letters, sounds and CVC reading pages,
+the Lottie and audio files, and (as an optional entry, because it is plan-gated)
+the NDJSON CVC corpus. Its version hashes every listed URL, the bytes of every
+listed static file and ``CVC_CONTENT_CACHE_VERSION``, so a deploy that changes
+any of them rolls out a new version.
+
+Progress POSTs to the single-event endpoints that fail for lack of a network are
+queued by the worker in IndexedDB and replayed in batches to
+``/api/progress/batch/`` under an idempotency key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import posixpath
+from functools import lru_cache
+
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.urls import reverse
+
+from .progress_batch import MAX_BATCH_EVENTS
+
+# Static files precached for the learning pages, by directory prefix or exact path.
+OFFLINE_STATIC_PREFIXES = (
+    "css/letters/",
+    "js/letters/",
+    "css/sounds/",
+    "js/sounds/",
+    "css/cvc_reading/",
+    "js/cvc_reading/",
+    "audio/",
+    "sounds/",
+)
+OFFLINE_STATIC_FILES = ("js/speech_service.js", "js/offline.js")
+OFFLINE_STATIC_EXTENSIONS = (".css", ".js", ".json", ".mp3", ".ogg", ".wav", ".m4a")
+# Pages served network-first, with the last good copy as the offline fallback.
+OFFLINE_PAGES = ("index", "sounds", "cvc_reading")
+# Single-event progress endpoints queued while offline, by their ``/api/progress/batch/`` event type.
+OFFLINE_PROGRESS_ENDPOINTS = {
+    "save_letter_progress_api": "letter",
+    "sound_progress_api": "sound",
+    "api_cvc_reading_progress": "cvc",
+    "bird_tutor_progress_api": "bird",
+    "bird_tutor_review_api": "bird_review",
+}
+
+
+def _is_offline_static(path: str) -> bool:
+    return path in OFFLINE_STATIC_FILES or (
+        path.startswith(OFFLINE_STATIC_PREFIXES) and path.endswith(OFFLINE_STATIC_EXTENSIONS)
+    )
+
+
+@lru_cache(maxsize=1)
+def offline_static_files() -> tuple[tuple[str, str], ...]:
+    """``(url, sha256)`` of every precached static file, in path order."""
+    found = {}
+    for finder in finders.get_finders():
+        for path, storage in finder.list(["CVS", ".*", "*~"]):
+            path = posixpath.join(*path.split("\\"))
+            if path in found or not _is_offline_static(path):
+                continue
+            with storage.open(path) as handle:
+                found[path] = hashlib.sha256(handle.read()).hexdigest()
+    return tuple((static(path), digest) for path, digest in sorted(found.items()))
+
+
+def offline_manifest(*, extra_assets=(), content_version: str) -> dict:
+    """The asset manifest; ``extra_assets`` are URLs served outside the static finders (Lottie files)."""
+    static_files = offline_static_files()
+    assets = sorted({url for url, _ in static_files} | set(extra_assets))
+    optional = [reverse("api_cvc_corpus_export")]
+    payload = json.dumps([static_files, assets, optional, content_version], separators=(",", ":"))
+    return {
+        "version": hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16],
+        "assets": assets,
+        "optional": optional,
+    }
+
+
+def service_worker_config(version: str) -> dict:
+    return {
+        "version": version,
+        "manifestUrl": reverse("offline_manifest"),
+        "pages": [reverse(name) for name in OFFLINE_PAGES],
+        "corpusUrl": reverse("api_cvc_corpus_export"),
+        "progressEndpoints": {reverse(name): kind for name, kind in OFFLINE_PROGRESS_ENDPOINTS.items()},
+        "batchUrl": reverse("progress_batch_api"),
+        "batchSize": MAX_BATCH_EVENTS,
+        "logoutUrl": reverse("logout"),
+    }
+
+
+def reset_offline_manifest() -> None:
+    offline_static_files.cache_clear()
@@ -0,0 +1,38 @@
+"""Fragment-cache keys for the large learning pages.
+
+The letters, sounds, CVC reading and level four pages differ between users mostly
+by plan. Their static markup sits inside ``{% cache fragment_cache_timeout <page>
+fragment_variant %}`` blocks, so it is rendered once per plan variant and reused;
+per-user values (account links, CSRF forms, profile and progress JSON islands)
+stay outside those blocks and are rendered on every request.
+
+``fragment_variant`` hashes exactly the values a fragment reads together with
+``PAGE_FRAGMENT_CACHE_VERSION``. That version defaults to the deployed commit, so
+every deploy starts from fresh fragments; bump it by hand after editing content
+without a deploy.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from django.conf import settings
+
+
+def fragment_variant(page: str, **variant) -> str:
+    """Short stable hash of ``page``, the values its fragment reads, and the content version."""
+    payload = json.dumps(
+        [page, settings.PAGE_FRAGMENT_CACHE_VERSION, variant],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def fragment_context(page: str, **variant) -> dict:
+    """Template context for a page's ``{% cache %}`` blocks."""
+    return {
+        "fragment_cache_timeout": settings.PAGE_FRAGMENT_CACHE_TIMEOUT,
+        "fragment_variant": fragment_variant(page, **variant),
+    }
@@ -0,0 +1,101 @@
+"""Shared write path for progress events: per-row locks and idempotency receipts.
+
+``LockedRows`` locks every affected progress row once per transaction, in a stable
+order, and saves each row once with the union of the fields its events changed.
+``ProgressBatchReceipt`` rows let an offline client replay a batch under the same
+idempotency key and get the original response back instead of applying it twice.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import ProgressBatchReceipt
+
+
+MAX_BATCH_EVENTS = 100
+IDEMPOTENCY_KEY_MAX_LENGTH = 64
+
+
+def _row_key(model, lookup):
+    values = tuple(sorted((name, getattr(value, "pk", value)) for name, value in lookup.items()))
+    return model._meta.label, values
+
+
+class LockedRows:
+    """Row locks and pending saves for one transaction."""
+
+    def __init__(self):
+        self._rows = {}
+        self._fresh = set()
+        self._dirty = {}
+        self.created = 0
+
+    def _acquire(self, key, model, lookup, defaults):
+        instance, created = model.objects.select_for_update().get_or_create(defaults=defaults or {}, **lookup)
+        self._rows[key] = instance
+        if created:
+            self._fresh.add(key)
+            self.created += 1
+
+    def lock_all(self, specs):
+        """Lock ``(model, lookup, defaults)`` rows sorted by key so concurrent batches never deadlock."""
+        pending = {}
+        for model, lookup, defaults in specs:
+            pending.setdefault(_row_key(model, lookup), (model, lookup, defaults))
+        for key in sorted(pending):
+            if key not in self._rows:
+                self._acquire(key, *pending[key])
+
+    def lock(self, model, lookup, defaults=None):
+        """Return ``(instance, created)``; ``created`` is only reported to the first caller."""
+        key = _row_key(model, lookup)
+        if key not in self._rows:
+            self._acquire(key, model, lookup, defaults)
+        created = key in self._fresh
+        self._fresh.discard(key)
+        return self._rows[key], created
+
+    def mark_dirty(self, instance, fields):
+        if fields:
+            self._dirty.setdefault(id(instance), (instance, set()))[1].update(fields)
+
+    def flush(self):
+        """Save each changed row once; returns the number of rows written."""
+        saved = 0
+        for instance, fields in self._dirty.values():
+            auto_now = [field.name for field in instance._meta.concrete_fields if getattr(field, "auto_now", False)]
+            instance.save(update_fields=sorted(fields.union(auto_now)))
+            saved += 1
+        self._dirty.clear()
+        return saved
+
+
+def payload_digest(events):
+    encoded = json.dumps(events, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def find_receipt(user, idempotency_key):
+    return ProgressBatchReceipt.objects.filter(user=user, idempotency_key=idempotency_key).first()
+
+
+def store_receipt(user, idempotency_key, digest, response):
+    return ProgressBatchReceipt.objects.create(
+        user=user,
+        idempotency_key=idempotency_key,
+        payload_digest=digest,
+        response=response,
+    )
+
+
+def purge_receipts(now=None):
+    """Delete receipts older than the retention window; returns the number removed."""
+    days = max(1, int(getattr(settings, "PROGRESS_BATCH_RECEIPT_RETENTION_DAYS", 14)))
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+    deleted, _ = ProgressBatchReceipt.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,109 @@
+"""N+1 query detection: fingerprint every SQL statement of a request and flag repeats.
+
+A fingerprint is the statement with literals replaced by ``?``, ``IN (...)``
+lists collapsed and whitespace normalised. So the same lookup run once per row
+(``SELECT ... FROM auth_user WHERE id = %s`` for 50 rows) shares a single
+fingerprint. A fingerprint seen more than ``QUERY_AUDIT_THRESHOLD`` times in one
+request is an offender.
+
+``QueryAuditMiddleware`` runs this on every request when ``QUERY_AUDIT_ENABLED``
+is set (staging), and logs offenders with the request ID. Tests use
+``phonics.tests.query_audit_helpers.QueryAuditMixin``, which fails the test
+instead.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+
+logger = logging.getLogger("abcz.performance")
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    normalized = _STRING_LITERAL_RE.sub("?", sql)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = normalized.replace("%s", "?")
+    normalized = _IN_LIST_RE.sub("IN (...)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+@dataclass(frozen=True)
+class Offender:
+    fingerprint: str
+    count: int
+    example: str
+
+    def __str__(self):
+        return f"{self.count}x {self.example[:300]}"
+
+
+@dataclass
+class QueryAudit:
+    counts: Counter = field(default_factory=Counter)
+    examples: dict[str, str] = field(default_factory=dict)
+
+    def __call__(self, execute, sql, params, many, context):
+        key = fingerprint(sql)
+        self.counts[key] += 1
+        self.examples.setdefault(key, sql)
+        return execute(sql, params, many, context)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def offenders(self, threshold: int | None = None) -> list[Offender]:
+        """Fingerprints run more than ``threshold`` times, most repeated first."""
+        limit = settings.QUERY_AUDIT_THRESHOLD if threshold is None else threshold
+        return [
+            Offender(key, count, self.examples[key])
+            for key, count in self.counts.most_common()
+            if count > limit
+        ]
+
+
+@contextmanager
+def audit_queries(using=None):
+    """Fingerprint every statement run on ``using`` (the default connection) inside the block."""
+    audit = QueryAudit()
+    with (using or connection).execute_wrapper(audit):
+        yield audit
+
+
+class QueryAuditMiddleware:
+    """Staging-only: log requests whose SQL repeats one statement more than ``QUERY_AUDIT_THRESHOLD`` times."""
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_AUDIT_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with audit_queries() as audit:
+            response = self.get_response(request)
+
+        for offender in audit.offenders():
+            match = getattr(request, "resolver_match", None)
+            logger.warning(
+                "n_plus_one_detected request_id=%s view=%s path=%s repeats=%s total_queries=%s sql=%s",
+                getattr(request, "request_id", ""),
+                match.view_name if match is not None else "unmatched",
+                request.path,
+                offender.count,
+                audit.total,
+                offender.example[:300],
+            )
+        return response
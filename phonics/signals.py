@@ -7,7 +7,7 @@ from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from .cache_helpers import invalidate_user_subscription_cache
-from .models import StudentProfile, UserSubscription
+from .models import CVCProgress, LetterProgress, Student, StudentProfile, UserSubscription
 
 
 def _invalidate_on_commit(user_id: int | None) -> None:
@@ -22,12 +22,53 @@ def invalidate_subscription_cache(sender, instance, **kwargs):
     _invalidate_on_commit(instance.user_id)
 
 
+@receiver(post_save, sender=UserSubscription)
+@receiver(post_delete, sender=UserSubscription)
+def synchronize_subscription_state_on_change(sender, instance, **kwargs):
+    user_id = instance.user_id
+
+    def synchronize():
+        from .subscriptions import synchronize_user_subscription_compatibility
+
+        # Deleting a user cascades to its subscriptions; there is nothing left to flag then.
+        user = get_user_model().objects.filter(pk=user_id).first()
+        if user is not None:
+            synchronize_user_subscription_compatibility(user)
+
+    if user_id:
+        transaction.on_commit(synchronize)
+
+
 @receiver(post_save, sender=StudentProfile)
 @receiver(post_delete, sender=StudentProfile)
 def invalidate_profile_subscription_cache(sender, instance, **kwargs):
     _invalidate_on_commit(instance.user_id)
 
 
+@receiver(post_save, sender=StudentProfile)
+def refresh_profile_leaderboard_entry(sender, instance, **kwargs):
+    """Names and grade are denormalized onto the entry, so every profile edit path refreshes it."""
+    from .leaderboard import refresh_user_entry
+
+    user_id = instance.user_id
+    if user_id:
+        transaction.on_commit(lambda: refresh_user_entry(user_id))
+
+
+@receiver(post_save, sender=LetterProgress)
+@receiver(post_delete, sender=LetterProgress)
+@receiver(post_save, sender=CVCProgress)
+@receiver(post_delete, sender=CVCProgress)
+@receiver(post_save, sender=Student)
+def refresh_student_leaderboard_entry(sender, instance, **kwargs):
+    """Legacy ``Student`` progress is only written outside the progress views (admin, imports)."""
+    from .leaderboard import refresh_student_entry
+
+    student_id = instance.pk if sender is Student else instance.student_id
+    if student_id:
+        transaction.on_commit(lambda: refresh_student_entry(student_id))
+
+
 @receiver(m2m_changed, sender=get_user_model().groups.through)
 def invalidate_group_membership_cache(sender, instance, action, reverse, pk_set, **kwargs):
     if action not in {"post_add", "post_remove", "post_clear", "pre_clear"}:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
 from decimal import Decimal
 from zoneinfo import ZoneInfo
 
 from django.contrib.auth.models import Group
-from django.db.models import Q
+from django.db.models import Min, Q
 from django.utils import timezone
 
+from .cache_helpers import get_cached_entitlements
 from .plans import (
     ADDON_PLAN_CODES,
     PAID_MAIN_PLAN_CODES,
@@ -23,6 +25,7 @@ from .plans import (
 
 
 ACTIVE_STATUS = "active"
+ENTITLEMENT_CACHE_VERSION = 1
 PENDING_PAYMENT_STATUSES = {
     "pending",
     "creating_invoice",
@@ -66,6 +69,37 @@ class EntitlementSnapshot:
     entitlements: frozenset
 
 
+@dataclass(frozen=True)
+class EntitlementSummary:
+    """What request-path checks need from an ``EntitlementSnapshot``, cacheable as one compact blob."""
+
+    main_plan_code: str
+    plan_codes: frozenset
+    entitlements: frozenset
+    valid_until: datetime | None = None
+
+    def to_cache_payload(self) -> dict:
+        return {
+            "v": ENTITLEMENT_CACHE_VERSION,
+            "m": self.main_plan_code,
+            "p": sorted(self.plan_codes),
+            "e": sorted(self.entitlements),
+            "u": self.valid_until.timestamp() if self.valid_until else None,
+        }
+
+    @classmethod
+    def from_cache_payload(cls, payload) -> EntitlementSummary | None:
+        if not isinstance(payload, dict) or payload.get("v") != ENTITLEMENT_CACHE_VERSION:
+            return None
+        valid_until = payload.get("u")
+        return cls(
+            main_plan_code=str(payload.get("m") or PLAN_FREE),
+            plan_codes=frozenset(payload.get("p") or ()),
+            entitlements=frozenset(payload.get("e") or ()),
+            valid_until=datetime.fromtimestamp(valid_until, tz=dt_timezone.utc) if valid_until else None,
+        )
+
+
 def _active_subscription_queryset(user, *, now=None, lock=False):
     from .models import UserSubscription
 
@@ -146,7 +180,12 @@ def synchronize_user_subscription_compatibility(user, *, snapshot=None) -> None:
         profile.save(update_fields=update_fields)
 
 
-def get_user_entitlements(user, *, now=None, synchronize=True) -> EntitlementSnapshot:
+def get_user_entitlements(user, *, now=None, synchronize=False) -> EntitlementSnapshot:
+    """Resolve what the user may access from active subscriptions; read-only by default.
+
+    Group and profile compatibility flags are written only on subscription-change
+    events (activation, subscription saves, login), never on ordinary page views.
+    """
     if not getattr(user, "is_authenticated", False):
         return EntitlementSnapshot(None, (), frozenset(), frozenset())
 
@@ -174,34 +213,106 @@ def get_user_entitlements(user, *, now=None, synchronize=True) -> EntitlementSna
     return snapshot
 
 
+def summarize_user_entitlements(user, *, now=None) -> EntitlementSummary:
+    """Resolve the summary and the moment it stops being true (next expiry or scheduled start)."""
+    from .models import UserSubscription
+
+    now = now or timezone.now()
+    snapshot = get_user_entitlements(user, now=now)
+    boundaries = [
+        subscription.expires_at
+        for subscription in (snapshot.main_subscription, *snapshot.addon_subscriptions)
+        if subscription
+    ]
+    next_start = (
+        UserSubscription.objects
+        .filter(user=user, status=UserSubscription.Status.ACTIVE, starts_at__gt=now)
+        .aggregate(next_start=Min("starts_at"))["next_start"]
+    )
+    if next_start:
+        boundaries.append(next_start)
+    return EntitlementSummary(
+        main_plan_code=snapshot.main_subscription.plan_code if snapshot.main_subscription else PLAN_FREE,
+        plan_codes=snapshot.plan_codes,
+        entitlements=snapshot.entitlements,
+        valid_until=min(boundaries) if boundaries else None,
+    )
+
+
+def _entitlement_payload_ttl(payload: dict) -> int | None:
+    valid_until = payload.get("u")
+    if not valid_until:
+        return None
+    return max(0, int(valid_until - timezone.now().timestamp()))
+
+
+def get_entitlement_summary(user) -> EntitlementSummary:
+    """Read-only, shared-cache backed entitlements; the cache entry expires exactly at ``valid_until``."""
+    if not getattr(user, "is_authenticated", False):
+        return EntitlementSummary(PLAN_FREE, frozenset(), frozenset())
+
+    payload = get_cached_entitlements(
+        user.pk,
+        lambda: summarize_user_entitlements(user).to_cache_payload(),
+        ttl_for=_entitlement_payload_ttl,
+    )
+    summary = EntitlementSummary.from_cache_payload(payload)
+    if summary is None or (summary.valid_until and summary.valid_until <= timezone.now()):
+        return summarize_user_entitlements(user)
+    return summary
+
+
 def user_has_entitlement(user, entitlement_code: str) -> bool:
-    return entitlement_code in get_user_entitlements(user).entitlements
+    return entitlement_code in get_entitlement_summary(user).entitlements
+
+
+@dataclass(frozen=True)
+class PurchaseHistory:
+    """The subscription and order rows purchase quotes read, loaded once for every quoted plan."""
 
+    active: tuple
+    latest_expired: dict
+    pending_plan_codes: frozenset
 
-def quote_plan_purchase(user, target_plan_code: str, *, now=None, lock=False) -> PurchaseQuote:
+
+def load_purchase_history(user, plan_codes, *, now=None, lock=False) -> PurchaseHistory:
     from .models import PaymentOrder, UserSubscription
 
+    now = now or timezone.now()
+    active = tuple(_active_subscription_queryset(user, now=now, lock=lock))
+    expired_query = UserSubscription.objects.filter(user=user, plan_code__in=plan_codes).filter(
+        Q(status=UserSubscription.Status.EXPIRED)
+        | Q(status=UserSubscription.Status.ACTIVE, expires_at__lte=now)
+    )
+    if lock:
+        expired_query = expired_query.select_for_update()
+    latest_expired = {}
+    for subscription in expired_query.order_by("-expires_at", "-updated_at"):
+        latest_expired.setdefault(subscription.plan_code, subscription)
+    pending_plan_codes = frozenset(
+        PaymentOrder.objects.filter(
+            user=user,
+            to_plan_code__in=plan_codes,
+            status__in=PENDING_PAYMENT_STATUSES,
+        ).values_list("to_plan_code", flat=True)
+    )
+    return PurchaseHistory(active, latest_expired, pending_plan_codes)
+
+
+def quote_plan_purchase(user, target_plan_code: str, *, now=None, lock=False, history=None) -> PurchaseQuote:
     now = now or timezone.now()
     target_code = normalize_plan_code(target_plan_code)
     target = get_plan_definition(target_code)
     if not target or target_code == PLAN_FREE:
         raise PurchaseNotAllowed("invalid_plan", "هذه الباقة غير متاحة للشراء.")
 
-    active = list(_active_subscription_queryset(user, now=now, lock=lock))
+    if history is None:
+        history = load_purchase_history(user, [target_code], now=now, lock=lock)
+    active = history.active
     current_main = _select_main_subscription(active)
     active_addons = {s.plan_code: s for s in active if s.plan_code in ADDON_PLAN_CODES}
-    expired_target_query = UserSubscription.objects.filter(user=user, plan_code=target_code).filter(
-        Q(status=UserSubscription.Status.EXPIRED)
-        | Q(status=UserSubscription.Status.ACTIVE, expires_at__lte=now)
-    )
-    if lock:
-        expired_target_query = expired_target_query.select_for_update()
-    expired_target = expired_target_query.order_by("-expires_at", "-updated_at").first()
-    pending_exists = PaymentOrder.objects.filter(
-        user=user,
-        to_plan_code=target_code,
-        status__in=PENDING_PAYMENT_STATUSES,
-    ).exists()
+    expired_target = history.latest_expired.get(target_code)
+    pending_exists = target_code in history.pending_plan_codes
 
     target_price = Decimal(target["price"])
     if target["category"] == "addon":
@@ -288,13 +399,14 @@ def quote_plan_purchase(user, target_plan_code: str, *, now=None, lock=False) ->
     )
 
 
-def purchase_options_for_user(user) -> dict:
+def purchase_options_for_user(user, *, now=None) -> dict:
+    now = now or timezone.now()
+    plan_codes = [code for code in PLAN_CATALOG if code != PLAN_FREE]
+    history = load_purchase_history(user, plan_codes, now=now)
     options = {}
-    for code in PLAN_CATALOG:
-        if code == PLAN_FREE:
-            continue
+    for code in plan_codes:
         try:
-            quote = quote_plan_purchase(user, code)
+            quote = quote_plan_purchase(user, code, now=now, history=history)
         except PurchaseNotAllowed as exc:
             if exc.code == "included_in_diamond":
                 label = "مشمولة في باقتك الحالية"
@@ -353,7 +465,7 @@ def subscription_dashboard_context(user, *, now=None) -> dict:
         status = "none"
 
     riyadh = ZoneInfo("Asia/Riyadh")
-    options = purchase_options_for_user(user)
+    options = purchase_options_for_user(user, now=now)
     upgrades = [
         {"code": code, **option}
         for code, option in options.items()
@@ -0,0 +1,28 @@
+"""Django template backend that adds render time to the current request's ``Server-Timing``.
+
+Only the outermost render of a request phase is timed, so ``{% include %}`` and
+templates rendered from inside another render are not counted twice.
+"""
+from django.template.backends.django import DjangoTemplates
+
+from . import metrics
+
+
+class TimedTemplate:
+    def __init__(self, template):
+        self._template = template
+
+    def __getattr__(self, name):
+        return getattr(self._template, name)
+
+    def render(self, context=None, request=None):
+        with metrics.timed("template"):
+            return self._template.render(context, request)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
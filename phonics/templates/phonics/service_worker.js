@@ -0,0 +1,233 @@
+/* Offline worker for the learning pages; generated by phonics.views.service_worker. */
+"use strict";
+
+const CONFIG = {{ config_json|safe }};
+const CACHE_PREFIX = "abcz-offline-";
+const ASSET_CACHE = `${CACHE_PREFIX}${CONFIG.version}`;
+const PAGE_CACHE = "abcz-pages";
+const QUEUE_DB = "abcz-progress-queue";
+const SYNC_TAG = "abcz-progress-sync";
+
+// ---------------------------------------------------------------------------
+// Install / activate: precache one manifest version, then drop the others.
+// ---------------------------------------------------------------------------
+
+self.addEventListener("install", event => {
+    event.waitUntil((async () => {
+        const response = await fetch(CONFIG.manifestUrl, { cache: "no-store", credentials: "same-origin" });
+        const manifest = await response.json();
+        if (manifest.version !== CONFIG.version) {
+            // A newer deploy is already live; its own worker will install instead.
+            throw new Error(`offline manifest ${manifest.version} does not match worker ${CONFIG.version}`);
+        }
+        const cache = await caches.open(ASSET_CACHE);
+        await cache.addAll(manifest.assets);
+        await Promise.all(manifest.optional.map(async url => {
+            try {
+                const optional = await fetch(url, { credentials: "same-origin" });
+                if (optional.ok) await cache.put(url, optional);
+            } catch (error) {
+                // Optional entries (the plan-gated CVC corpus) are cached when available.
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener("activate", event => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter(name => name.startsWith(CACHE_PREFIX) && name !== ASSET_CACHE)
+            .map(name => caches.delete(name)));
+        await self.clients.claim();
+        await flushProgress();
+    })());
+});
+
+// ---------------------------------------------------------------------------
+// IndexedDB queue of progress events waiting for a connection.
+// ---------------------------------------------------------------------------
+
+function openQueue() {
+    return new Promise((resolve, reject) => {
+        const request = indexedDB.open(QUEUE_DB, 1);
+        request.onupgradeneeded = () => {
+            request.result.createObjectStore("events", { autoIncrement: true });
+            request.result.createObjectStore("batches", { keyPath: "key" });
+            request.result.createObjectStore("meta");
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+async function withStores(names, mode, work) {
+    const db = await openQueue();
+    try {
+        return await new Promise((resolve, reject) => {
+            const transaction = db.transaction(names, mode);
+            let result;
+            Promise.resolve(work(...names.map(name => transaction.objectStore(name)))).then(value => { result = value; }, reject);
+            transaction.oncomplete = () => resolve(result);
+            transaction.onerror = () => reject(transaction.error);
+            transaction.onabort = () => reject(transaction.error);
+        });
+    } finally {
+        db.close();
+    }
+}
+
+function requestValue(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function rememberCsrfToken(request) {
+    const token = request.headers.get("X-CSRFToken");
+    if (!token) return Promise.resolve();
+    return withStores(["meta"], "readwrite", meta => { meta.put(token, "csrf"); });
+}
+
+async function queueProgressEvent(kind, request) {
+    const data = await request.json();
+    await withStores(["events"], "readwrite", events => { events.add({ type: kind, data }); });
+    if (self.registration.sync) {
+        await self.registration.sync.register(SYNC_TAG).catch(() => {});
+    }
+}
+
+function takeBatch() {
+    // Moves the oldest queued events into a batch with a fixed idempotency key, so a retry
+    // after a lost response is answered from the server's receipt instead of applied twice.
+    return withStores(["batches", "events"], "readwrite", async (batches, events) => {
+        const pending = await requestValue(batches.getAll(undefined, 1));
+        if (pending.length) return pending[0];
+        const keys = await requestValue(events.getAllKeys(undefined, CONFIG.batchSize));
+        if (!keys.length) return null;
+        const items = await requestValue(events.getAll(IDBKeyRange.bound(keys[0], keys[keys.length - 1])));
+        const batch = {
+            key: self.crypto.randomUUID(),
+            events: items.map((item, index) => ({ id: String(keys[index]), type: item.type, data: item.data })),
+        };
+        batches.add(batch);
+        events.delete(IDBKeyRange.bound(keys[0], keys[keys.length - 1]));
+        return batch;
+    });
+}
+
+let flushing = null;
+
+function flushProgress() {
+    if (!flushing) {
+        flushing = (async () => {
+            try {
+                for (let batch = await takeBatch(); batch; batch = await takeBatch()) {
+                    const csrf = await withStores(["meta"], "readonly", meta => requestValue(meta.get("csrf")));
+                    const response = await fetch(CONFIG.batchUrl, {
+                        method: "POST",
+                        credentials: "same-origin",
+                        headers: {
+                            "Content-Type": "application/json",
+                            "Idempotency-Key": batch.key,
+                            "X-CSRFToken": csrf || "",
+                        },
+                        body: JSON.stringify({ idempotency_key: batch.key, events: batch.events }),
+                    });
+                    if (response.status >= 500 || [401, 403, 429].includes(response.status)) {
+                        return; // Keep the batch; it is retried on the next sync, message or activation.
+                    }
+                    await withStores(["batches"], "readwrite", batches => { batches.delete(batch.key); });
+                }
+            } catch (error) {
+                // Still offline; the queue is kept as it is.
+            } finally {
+                flushing = null;
+            }
+        })();
+    }
+    return flushing;
+}
+
+async function clearUserData() {
+    await flushProgress();
+    await withStores(["events", "batches"], "readwrite", (events, batches) => {
+        events.clear();
+        batches.clear();
+    });
+    await caches.delete(PAGE_CACHE);
+}
+
+self.addEventListener("sync", event => {
+    if (event.tag === SYNC_TAG) event.waitUntil(flushProgress());
+});
+
+self.addEventListener("message", event => {
+    if (event.data && event.data.type === "flush-progress") event.waitUntil(flushProgress());
+});
+
+// ---------------------------------------------------------------------------
+// Fetch routing.
+// ---------------------------------------------------------------------------
+
+async function progressWrite(event, kind) {
+    const queued = event.request.clone();
+    await rememberCsrfToken(event.request);
+    try {
+        const response = await fetch(event.request);
+        event.waitUntil(flushProgress());
+        return response;
+    } catch (error) {
+        await queueProgressEvent(kind, queued);
+        return new Response(JSON.stringify({ status: "queued", queued: true }), {
+            status: 202,
+            headers: { "Content-Type": "application/json" },
+        });
+    }
+}
+
+async function networkFirst(request, cacheName) {
+    try {
+        const response = await fetch(request);
+        if (response.ok) {
+            const cache = await caches.open(cacheName);
+            await cache.put(request, response.clone());
+        }
+        return response;
+    } catch (error) {
+        const cached = await caches.match(request, { ignoreVary: true });
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+async function cacheFirst(request) {
+    const cached = await caches.match(request, { cacheName: ASSET_CACHE });
+    return cached || fetch(request);
+}
+
+self.addEventListener("fetch", event => {
+    const url = new URL(event.request.url);
+    if (url.origin !== self.location.origin) return;
+
+    if (url.pathname === CONFIG.logoutUrl) {
+        // Queued progress and cached pages belong to the signed-in learner.
+        event.respondWith(clearUserData().then(() => fetch(event.request)));
+        return;
+    }
+    if (event.request.method === "POST" && CONFIG.progressEndpoints[url.pathname]) {
+        event.respondWith(progressWrite(event, CONFIG.progressEndpoints[url.pathname]));
+        return;
+    }
+    if (event.request.method !== "GET") return;
+
+    if (event.request.mode === "navigate") {
+        if (CONFIG.pages.includes(url.pathname)) event.respondWith(networkFirst(event.request, PAGE_CACHE));
+    } else if (url.pathname === CONFIG.corpusUrl) {
+        event.respondWith(networkFirst(event.request, ASSET_CACHE));
+    } else {
+        event.respondWith(cacheFirst(event.request));
+    }
+});
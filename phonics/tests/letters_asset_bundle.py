@@ -17,6 +17,7 @@ TEMPLATES_DIR = PROJECT_ROOT / "templates"
 STATIC_DIR = PROJECT_ROOT / "static"
 LETTERS_TEMPLATE = TEMPLATES_DIR / "letters.html"
 LETTERS_JS_DIR = STATIC_DIR / "js" / "letters"
+LETTERS_APP_JS = LETTERS_JS_DIR / "app.js"
 LETTERS_CSS = STATIC_DIR / "css" / "letters" / "letters.css"
 
 # Matches both legacy hard-coded paths and the {% static %} form so the helper
@@ -111,6 +112,15 @@ def bundle_text():
     return "\n".join(parts)
 
 
+def app_text():
+    """The PhonicsGameLab application script, which used to be the template's main inline block.
+
+    Use this when a test needs *the* application's definition of something that
+    modules such as bird_tutor.js also define for themselves.
+    """
+    return read_text(LETTERS_APP_JS)
+
+
 def all_letters_js_text():
     """Every file under static/js/letters/, whether the template loads it or not."""
     parts = []
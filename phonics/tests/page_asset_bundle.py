@@ -0,0 +1,39 @@
+"""Shared helper that treats a rendered page and the local assets it links as one text.
+
+Page CSS and JavaScript now live in static files (see ``phonics.inline_assets``),
+so a test asserting on front-end behaviour has to search what the browser
+actually receives: the response plus every project-owned script and stylesheet
+it references. Nothing in here asserts anything by itself.
+"""
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+_ASSET_REF_RE = re.compile(
+    r"""<(?:script[^>]*\bsrc|link[^>]*\bhref)\s*=\s*["'](?P<ref>[^"']+)["']""",
+    re.IGNORECASE,
+)
+
+
+def linked_static_paths(html):
+    """Project-owned static files the page links, in document order."""
+    paths = []
+    for match in _ASSET_REF_RE.finditer(html):
+        ref = match.group("ref").split("?", 1)[0].split("#", 1)[0]
+        if not ref.startswith(settings.STATIC_URL):
+            continue
+        path = finders.find(ref[len(settings.STATIC_URL):])
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def shipped_text(response):
+    """Response body followed by every local script and stylesheet it links."""
+    html = response.content.decode("utf-8")
+    parts = [html]
+    for path in linked_static_paths(html):
+        with open(path, encoding="utf-8", errors="ignore") as handle:
+            parts.append(handle.read())
+    return "\n".join(parts)
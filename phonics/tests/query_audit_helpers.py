@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+
+from phonics.query_audit import audit_queries
+
+
+class QueryAuditMixin:
+    """TestCase mixin failing when a block repeats one SQL statement more than the threshold (N+1)."""
+
+    query_repeat_threshold = 5
+
+    @contextmanager
+    def assertNoRepeatedQueries(self, threshold=None):
+        limit = self.query_repeat_threshold if threshold is None else threshold
+        with audit_queries() as audit:
+            yield audit
+        offenders = audit.offenders(limit)
+        if offenders:
+            self.fail(
+                f"{len(offenders)} statement(s) repeated more than {limit} times "
+                f"({audit.total} queries in total):\n" + "\n".join(str(offender) for offender in offenders)
+            )
+
+    def get_without_repeated_queries(self, path, threshold=None, **extra):
+        with self.assertNoRepeatedQueries(threshold):
+            response = self.client.get(path, **extra)
+        self.assertLess(response.status_code, 400, path)
+        return response
@@ -0,0 +1,82 @@
+import dataclasses
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from phonics import artifacts, views
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+@override_settings(DISABLE_AUTO_SEED=True, ARTIFACT_VERSION="test")
+class GeneratedArtifactTests(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = Path(root.name)
+        settings_override = override_settings(ARTIFACTS_ROOT=self.root, ARTIFACTS_BUILD_ROOT=self.root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        user = User.objects.create_user(username="artifact-vip", password="StrongPass123!")
+        grant_active_subscription(user, "vip")
+        self.client.force_login(user)
+
+    def test_pdf_is_built_once_and_streamed_with_etag_and_length(self):
+        with mock.patch("phonics.views.draw_letters_book_pdf", wraps=views.draw_letters_book_pdf) as draw:
+            first = self.client.get("/letters/worksheets-book/pdf/")
+            first_bytes = first.getvalue()
+            second = self.client.get("/letters/worksheets-book/pdf/")
+            second_bytes = second.getvalue()
+
+        self.assertEqual(draw.call_count, 1)
+        self.assertTrue(first.streaming)
+        self.assertEqual(first_bytes, second_bytes)
+        self.assertEqual(int(first["Content-Length"]), len(first_bytes))
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertEqual(len(list(self.root.glob("letters_book_pdf-*.pdf"))), 1)
+
+        cached = self.client.get("/letters/worksheets-book/pdf/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_changed_content_gets_a_new_file_and_command_prunes_the_old_one(self):
+        original = self.client.get("/letters/worksheets-book/word/")
+        original.getvalue()
+        items = views.letter_worksheet_book_items()
+        items[0]["words"] = [{"word": "Astronaut", "translation": "رائد فضاء", "emoji": ""}]
+        spec = dataclasses.replace(artifacts._specs["letters_book_docx"], inputs=lambda: items)
+
+        with mock.patch.dict(artifacts._specs, {"letters_book_docx": spec}):
+            changed = self.client.get("/letters/worksheets-book/word/")
+            changed.getvalue()
+            self.assertEqual(len(list(self.root.glob("letters_book_docx-*.docx"))), 2)
+            output = StringIO()
+            call_command("build_artifacts", "letters_book_docx", stdout=output)
+
+        self.assertNotEqual(original["ETag"], changed["ETag"])
+        self.assertIn("removed", output.getvalue())
+        digest = changed["ETag"].strip('"')
+        remaining = [path.name for path in self.root.glob("letters_book_docx-*.docx")]
+        self.assertEqual(remaining, [f"letters_book_docx-{digest}.docx"])
+
+    def test_build_command_prebuilds_every_artifact(self):
+        call_command("build_artifacts", stdout=StringIO())
+
+        self.assertEqual(len(list(self.root.glob("letters_book_pdf-*.pdf"))), 1)
+        self.assertEqual(len(list(self.root.glob("letters_book_docx-*.docx"))), 1)
+
+    def test_downloads_use_the_files_shipped_with_the_build(self):
+        runtime = self.root / "runtime"
+        with override_settings(ARTIFACTS_ROOT=runtime):
+            call_command("build_artifacts", stdout=StringIO())
+            with mock.patch("phonics.views.draw_letters_book_pdf") as draw:
+                response = self.client.get("/letters/worksheets-book/pdf/")
+                response.getvalue()
+
+        draw.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(runtime.exists())
@@ -1,10 +1,11 @@
+import json
 from datetime import timedelta
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.db import connection
-from django.test import Client, TestCase, override_settings
+from django.test import Client, RequestFactory, TestCase, override_settings
 from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
@@ -19,7 +20,8 @@ from phonics.models import (
     StudentProfile,
     UserSubscription,
 )
-from phonics.views import PLAN_DIAMOND, PLAN_LEVEL_THREE, ensure_seed_data
+from phonics.tests.page_asset_bundle import shipped_text
+from phonics.views import PLAN_DIAMOND, PLAN_LEVEL_THREE, cvc_word_payload, ensure_seed_data, paginate_queryset
 
 
 @override_settings(DISABLE_AUTO_SEED=True)
@@ -81,6 +83,84 @@ class BigOReadPathTests(TestCase):
         self.assertIn("results", payload)
         self.assertNotIn("words", payload)
 
+    def test_cvc_words_api_walks_keyset_cursor_pages(self):
+        self.login_user("level-three-cursor", PLAN_LEVEL_THREE)
+        self.create_cvc_words(5)
+        CVCWord.objects.filter(word__in=["w001", "w003"]).update(order=0)
+
+        first = self.client.get("/api/cvc-words/?cursor=&page_size=2&count=1").json()
+        seen, cursor = [item["word"] for item in first["results"]], first["next"]
+        with CaptureQueriesContext(connection) as queries:
+            while cursor:
+                payload = self.client.get(f"/api/cvc-words/?cursor={cursor}&page_size=2&legacy=0").json()
+                seen.extend(item["word"] for item in payload["results"])
+                cursor = payload["next"]
+        page_queries = [query["sql"] for query in queries.captured_queries if "phonics_cvcword" in query["sql"]]
+
+        self.assertEqual(first["count"], 5)
+        self.assertEqual(first["results"], first["words"])
+        self.assertNotIn("count", payload)
+        self.assertNotIn("words", payload)
+        self.assertEqual(seen, ["w000", "w001", "w003", "w002", "w004"])
+        self.assertTrue(page_queries)
+        self.assertFalse([sql for sql in page_queries if "OFFSET" in sql.upper() or "COUNT(" in sql.upper()])
+
+    def test_cvc_corpus_export_streams_every_resource_as_ndjson(self):
+        self.login_user("level-three-corpus-export", PLAN_LEVEL_THREE)
+        self.create_cvc_words(3)
+        CVCSentence.objects.create(sentence="The cat sat.", arabic_translation="جلست القطة.", order=1)
+        CVCStory.objects.create(title="Cat", content="cat sat", arabic_explanation="قصة", order=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/cvc-corpus.ndjson")
+            lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        count_queries = [query for query in queries.captured_queries if "COUNT(" in query["sql"].upper()]
+        cached = self.client.get("/api/cvc-corpus.ndjson", HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["resource"] for row in rows], ["words"] * 3 + ["sentences", "stories"])
+        self.assertEqual([row["word"] for row in rows[:3]], ["w000", "w001", "w002"])
+        self.assertEqual(rows[3]["arabic_translation"], "جلست القطة.")
+        self.assertEqual(rows[4]["content"], "cat sat")
+        self.assertEqual(count_queries, [])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_cvc_words_api_rejects_tampered_cursor(self):
+        self.login_user("level-three-bad-cursor", PLAN_LEVEL_THREE)
+
+        response = self.client.get("/api/cvc-words/?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "invalid_cursor")
+
+    def test_paginated_counts_follow_the_callers_filters(self):
+        self.login_user("level-three-filtered-count", PLAN_LEVEL_THREE)
+        self.create_cvc_words(6)
+        easy = CVCWord.objects.filter(difficulty_level=1).order_by("order", "id")
+
+        def fetch(query):
+            response = paginate_queryset(
+                easy,
+                RequestFactory().get(f"/api/cvc-words/?{query}"),
+                resource="words",
+                serializer=cvc_word_payload,
+                legacy_key="words",
+                cache_extra="difficulty:1",
+            )
+            return json.loads(response.content)
+
+        unfiltered = self.client.get("/api/cvc-words/?cursor=&count=1").json()
+        paged = fetch("page_size=100")
+        cursored = fetch("cursor=&page_size=100&count=1")
+
+        self.assertEqual(paged["count"], 2)
+        self.assertEqual(paged["total_pages"], 1)
+        self.assertEqual(cursored["count"], 2)
+        self.assertEqual([item["word"] for item in cursored["results"]], ["w000", "w005"])
+        self.assertEqual(unfiltered["count"], 6)
+
     def test_cvc_words_api_clamps_invalid_pagination(self):
         self.login_user("level-three-clamp", PLAN_LEVEL_THREE)
         self.create_cvc_words(3)
@@ -158,7 +238,7 @@ class BigOReadPathTests(TestCase):
         self.login_user("level-three-cvc-template", PLAN_LEVEL_THREE)
 
         response = self.client.get("/cvc-reading/")
-        html = response.content.decode()
+        html = shipped_text(response)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn("payload.results", html)
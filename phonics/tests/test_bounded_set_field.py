@@ -0,0 +1,91 @@
+import pickle
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from phonics.fields import DROP_OLDEST, BoundedSet, dirty_set_fields
+from phonics.models import CVCReadingProgress, SoundPracticeProgress
+
+
+class BoundedSetTests(SimpleTestCase):
+    def test_keeps_first_items_once_full_by_default(self):
+        values = BoundedSet(["a", "b", "a"], limit=3)
+        values.add("c")
+        values.add("d")
+
+        self.assertEqual(values, ["a", "b", "c"])
+        self.assertIn("c", values)
+        self.assertNotIn("d", values)
+
+    def test_drop_oldest_evicts_in_insertion_order(self):
+        values = BoundedSet(["a", "b"], limit=2, eviction=DROP_OLDEST)
+        values.add("c")
+
+        self.assertEqual(values, ["b", "c"])
+        self.assertNotIn("a", values)
+
+    def test_dirty_only_when_contents_change(self):
+        values = BoundedSet(["a"], limit=5)
+        values.add("a")
+        values.discard("missing")
+        self.assertFalse(values.dirty)
+
+        values.discard("a")
+        self.assertTrue(values.dirty)
+
+    def test_list_style_edits_keep_items_unique(self):
+        values = BoundedSet(["a", "b"], limit=3)
+        values.append("a")
+        values.insert(0, "b")
+        values += ["c", "d"]
+
+        self.assertEqual(values, ["b", "a", "c"])
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class BoundedSetFieldTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="bounded-sets", password="StrongPass123!")
+
+    def test_round_trips_as_plain_json_list(self):
+        CVCReadingProgress.objects.create(user=self.user, words_mastered=["cat", "dog", "cat"])
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT words_mastered FROM phonics_cvcreadingprogress WHERE user_id = %s", [self.user.pk])
+            raw = cursor.fetchone()[0]
+        progress = CVCReadingProgress.objects.get(user=self.user)
+
+        self.assertEqual(raw.replace(" ", ""), '["cat","dog"]')
+        self.assertIsInstance(progress.words_mastered, BoundedSet)
+        self.assertEqual(progress.words_mastered.limit, 300)
+        self.assertEqual(dirty_set_fields(progress), [])
+
+    def test_assignment_caps_and_tracks_changes(self):
+        progress = SoundPracticeProgress.objects.create(user=self.user, completed_items=["a"])
+        progress = SoundPracticeProgress.objects.get(pk=progress.pk)
+
+        progress.completed_items = ["a"]
+        self.assertEqual(dirty_set_fields(progress), [])
+
+        progress.practiced_vowels = [f"V{index}" for index in range(15)]
+        self.assertEqual(len(progress.practiced_vowels), 10)
+        self.assertEqual(dirty_set_fields(progress), ["practiced_vowels"])
+
+        progress.save(update_fields=["practiced_vowels"])
+        self.assertEqual(dirty_set_fields(progress), [])
+
+    def test_only_changed_lists_are_written(self):
+        progress = CVCReadingProgress.objects.create(user=self.user, words_practiced=["cat"])
+        progress = CVCReadingProgress.objects.get(pk=progress.pk)
+        progress.words_mastered.add("cat")
+        progress.words_practiced.add("cat")
+
+        with CaptureQueriesContext(connection) as queries:
+            progress.save(update_fields=dirty_set_fields(progress))
+
+        self.assertIn('"words_mastered"', queries.captured_queries[0]["sql"])
+        self.assertNotIn('"words_practiced"', queries.captured_queries[0]["sql"])
+        self.assertEqual(CVCReadingProgress.objects.get(pk=progress.pk).words_mastered, ["cat"])
@@ -1,3 +1,5 @@
+import threading
+import time
 from datetime import timedelta
 from unittest.mock import patch
 
@@ -8,8 +10,19 @@ from django.test.utils import CaptureQueriesContext
 from django.db import connection
 from django.utils import timezone
 
-from phonics.cache_helpers import user_cache_key
+from phonics.cache_helpers import (
+    LocalCacheTier,
+    cache_tier_stats,
+    get_cached_static_value,
+    get_or_compute,
+    invalidate_static_cache,
+    local_cache,
+    reset_single_flight_counters,
+    single_flight_counters,
+    user_cache_key,
+)
 from phonics.models import StudentProfile, UserSubscription
+from phonics.subscriptions import get_entitlement_summary
 from phonics.views import PLAN_LEVEL_THREE, PLAN_SILVER, get_feature_keys
 
 
@@ -49,8 +62,9 @@ class SubscriptionCacheReadinessTests(TestCase):
             )
         return user
 
-    def test_feature_keys_are_recomputed_to_honor_subscription_expiry(self):
+    def test_entitlement_snapshot_is_cached_until_the_nearest_expiry(self):
         user = self.create_user(plan_code=PLAN_SILVER)
+        UserSubscription.objects.filter(user=user).update(expires_at=timezone.now() + timedelta(seconds=90))
 
         with CaptureQueriesContext(connection) as first_queries:
             first_keys = get_feature_keys(user)
@@ -60,7 +74,19 @@ class SubscriptionCacheReadinessTests(TestCase):
         self.assertIn("sounds_basic", first_keys)
         self.assertEqual(first_keys, second_keys)
         self.assertGreater(len(first_queries), 0)
-        self.assertGreater(len(second_queries), 0)
+        self.assertEqual(len(second_queries), 0)
+        stored = cache.get(user_cache_key("entitlements", user.pk))
+        self.assertLessEqual(stored["soft_expiry"], time.time() + 90)
+
+    def test_expired_snapshot_is_recomputed_without_invalidation(self):
+        user = self.create_user(plan_code=PLAN_SILVER)
+        self.assertIn("sounds_basic", get_feature_keys(user))
+
+        later = timezone.now() + timedelta(days=8)
+        with patch("phonics.subscriptions.timezone.now", return_value=later):
+            keys = get_feature_keys(user)
+
+        self.assertNotIn("sounds_basic", keys)
 
     def test_feature_cache_is_isolated_per_user(self):
         silver_user = self.create_user("cache-silver", PLAN_SILVER)
@@ -109,13 +135,148 @@ class SubscriptionCacheReadinessTests(TestCase):
 
         self.assertIn("sounds_basic", keys)
 
-    def test_feature_payload_is_not_persisted_in_shared_cache(self):
+    def test_entitlements_are_persisted_as_one_compact_blob(self):
         user = self.create_user(plan_code=PLAN_SILVER)
         get_feature_keys(user)
 
-        stored = cache.get(user_cache_key("feature-keys", user.pk))
+        stored = cache.get(user_cache_key("entitlements", user.pk))["value"]
+
+        self.assertEqual(stored["m"], PLAN_SILVER)
+        self.assertIn("sounds_basic", stored["e"])
+        self.assertEqual(set(stored), {"v", "m", "p", "e", "u"})
+        for legacy_kind in ("group-slugs", "active-plan-codes", "subscription-plan", "feature-keys"):
+            self.assertIsNone(cache.get(user_cache_key(legacy_kind, user.pk)))
+
+    def test_request_loads_entitlements_once(self):
+        user = self.create_user(plan_code=PLAN_SILVER)
+        self.client.force_login(user)
+
+        with patch("phonics.middleware.get_entitlement_summary", wraps=get_entitlement_summary) as load:
+            response = self.client.get("/sounds/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(load.call_count, 1)
+
+
+@override_settings(CACHES=CACHE_SETTINGS)
+class SingleFlightCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_single_flight_counters()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_concurrent_cold_misses_trigger_exactly_one_recomputation(self):
+        calls = []
+        results = []
+
+        def calculator():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        def worker():
+            results.append(get_or_compute("single-flight:cold", calculator, timeout=60))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counters = single_flight_counters()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 8)
+        self.assertEqual(counters["recomputes"], 1)
+        self.assertEqual(counters["waits"], 7)
+
+    def test_expired_value_is_served_stale_while_another_caller_holds_the_lease(self):
+        get_or_compute("single-flight:stale", lambda: "old", timeout=60)
+        cache.add("single-flight:stale:lease", "other-worker", timeout=300)
+
+        with patch("phonics.cache_helpers.time.time", return_value=time.time() + 61):
+            value = get_or_compute("single-flight:stale", lambda: "new", timeout=60)
+
+        self.assertEqual(value, "old")
+        self.assertEqual(single_flight_counters()["stale_serves"], 1)
+
+    def test_expired_value_is_recomputed_by_the_lease_winner(self):
+        get_or_compute("single-flight:refresh", lambda: "old", timeout=60)
+
+        with patch("phonics.cache_helpers.time.time", return_value=time.time() + 61):
+            value = get_or_compute("single-flight:refresh", lambda: "new", timeout=60)
+
+        self.assertEqual(value, "new")
+        self.assertEqual(get_or_compute("single-flight:refresh", lambda: "unused", timeout=60), "new")
+        self.assertIsNone(cache.get("single-flight:refresh:lease"))
+
+    def test_fresh_value_can_be_refreshed_early(self):
+        get_or_compute("single-flight:early", lambda: (time.sleep(0.01), "old")[1], timeout=60)
+
+        with patch("phonics.cache_helpers.time.time", return_value=time.time() + 59.9), patch(
+            "phonics.cache_helpers.random.random", return_value=1e-300,
+        ):
+            value = get_or_compute("single-flight:early", lambda: "new", timeout=60)
+
+        self.assertEqual(value, "new")
+        self.assertEqual(single_flight_counters()["early_refreshes"], 1)
+
+    def test_zero_timeout_bypasses_the_cache(self):
+        calls = []
+
+        get_or_compute("single-flight:off", lambda: calls.append(1) or "value", timeout=0)
+        get_or_compute("single-flight:off", lambda: calls.append(1) or "value", timeout=0)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIsNone(cache.get("single-flight:off"))
+
+
+@override_settings(CACHES=CACHE_SETTINGS, STATIC_CONTENT_CACHE_TIMEOUT=1800, LOCAL_CACHE_GENERATION_CHECK_SECONDS=60)
+class LocalCacheTierTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.bump_generation()
+        reset_single_flight_counters()
+
+    def tearDown(self):
+        cache.clear()
+        local_cache.clear()
+
+    def test_local_hit_skips_the_shared_cache_round_trip(self):
+        get_cached_static_value("tier-test", lambda: {"value": 1})
+
+        with patch("phonics.cache_helpers.cache.get", wraps=cache.get) as shared_get:
+            value = get_cached_static_value("tier-test", lambda: {"value": 2})
+
+        self.assertEqual(value, {"value": 1})
+        shared_get.assert_not_called()
+        stats = cache_tier_stats()
+        self.assertEqual(stats["local"], {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+        self.assertEqual(stats["shared"]["misses"], 1)
+
+    def test_invalidation_reaches_other_workers_through_the_generation_token(self):
+        other_worker = LocalCacheTier()
+        other_worker.set("static:tier-test:v1", "old", timeout=60)
+        self.assertEqual(other_worker.get("static:tier-test:v1"), "old")
+
+        invalidate_static_cache("tier-test")
+
+        with override_settings(LOCAL_CACHE_GENERATION_CHECK_SECONDS=0):
+            self.assertIsNone(other_worker.get("static:tier-test:v1"))
+        self.assertEqual(get_cached_static_value("tier-test", lambda: "new"), "new")
+
+    @override_settings(LOCAL_CACHE_MAX_ENTRIES=2)
+    def test_local_tier_evicts_least_recently_used_entries(self):
+        tier = LocalCacheTier()
+        tier.set("a", 1, timeout=60)
+        tier.set("b", 2, timeout=60)
+        tier.get("a")
+        tier.set("c", 3, timeout=60)
 
-        self.assertIsNone(stored)
+        self.assertEqual(tier.get("a"), 1)
+        self.assertIsNone(tier.get("b"))
+        self.assertEqual(tier.get("c"), 3)
 
 
 @override_settings(CACHES=CACHE_SETTINGS, PUBLIC_PAGE_CACHE_TIMEOUT=600)
@@ -0,0 +1,53 @@
+from datetime import date
+from io import BytesIO
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from pypdf import PdfReader
+
+from phonics import certificates
+
+
+def pdf_text(pdf_bytes):
+    return "\n".join(page.extract_text() for page in PdfReader(BytesIO(pdf_bytes)).pages)
+
+
+class CertificateRendererTests(SimpleTestCase):
+    def test_reportlab_path_fills_name_date_and_score_into_the_compiled_layout(self):
+        certificates.compiled_layout.cache_clear()
+
+        first = certificates.render_certificate_reportlab("Lina Hart", date(2026, 10, 18), 2450)
+        certificates.render_certificate_reportlab("Omar Reed", date(2026, 10, 18), 2300)
+
+        self.assertEqual(certificates.compiled_layout.cache_info().misses, 1)
+        text = pdf_text(first)
+        self.assertIn("CERTIFICATE OF COMPLETION", text)
+        self.assertIn("Lina Hart", text)
+        self.assertIn("Total score: 2450", text)
+        self.assertIn("2026", text)
+        self.assertEqual(len(PdfReader(BytesIO(first)).pages), 1)
+
+    @override_settings(CERTIFICATE_RENDERER="reportlab")
+    def test_names_outside_the_builtin_fonts_use_the_html_template(self):
+        with mock.patch.object(certificates, "render_certificate_html", return_value=b"%PDF-html") as html:
+            self.assertEqual(certificates.render_certificate("لينا", date(2026, 10, 18), 10), b"%PDF-html")
+            latin = certificates.render_certificate("Lina", date(2026, 10, 18), 10)
+
+        html.assert_called_once()
+        self.assertTrue(latin.startswith(b"%PDF"))
+
+    @override_settings(CERTIFICATE_RENDERER="reportlab")
+    def test_reportlab_failure_falls_back_to_the_html_template(self):
+        with mock.patch.object(certificates, "render_certificate_reportlab", side_effect=ValueError("bad layout")):
+            with self.assertLogs("abcz.performance", level="ERROR"):
+                pdf_bytes = certificates.render_certificate("Lina", date(2026, 10, 18), 10)
+
+        self.assertIn("Lina", pdf_text(pdf_bytes))
+
+    @override_settings(CERTIFICATE_RENDERER="html")
+    def test_html_renderer_setting_keeps_the_xhtml2pdf_path(self):
+        with mock.patch.object(certificates, "render_certificate_reportlab") as reportlab:
+            pdf_bytes = certificates.render_certificate("Lina", date(2026, 10, 18), 10)
+
+        reportlab.assert_not_called()
+        self.assertIn("Total score: 10", pdf_text(pdf_bytes))
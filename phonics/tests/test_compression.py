@@ -0,0 +1,105 @@
+import gzip
+import json
+from unittest import mock, skipIf
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from phonics import compression
+from phonics.compression import CompressionMiddleware, accepted_encoding
+from phonics.models import CVCWord
+from phonics.tests.subscription_helpers import grant_active_subscription
+from phonics.views import PLAN_LEVEL_THREE
+
+
+def run_middleware(response, accept_encoding="gzip"):
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def test_large_json_is_gzipped_with_vary(self):
+        payload = {"results": [{"word": f"w{index}"} for index in range(100)]}
+
+        response = run_middleware(JsonResponse(payload))
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertEqual(json.loads(gzip.decompress(response.content)), payload)
+
+    def test_small_disallowed_or_unaccepted_bodies_pass_through(self):
+        cases = [
+            (HttpResponse("<p>short</p>"), "gzip"),
+            (HttpResponse(b"\x89PNG" * 200, content_type="image/png"), "gzip"),
+            (HttpResponse("<p>long</p>" * 100), "identity"),
+            (HttpResponse("<p>long</p>" * 100), "gzip;q=0, br;q=0"),
+        ]
+        for response, accept in cases:
+            with self.subTest(content_type=response["Content-Type"], accept=accept):
+                self.assertFalse(run_middleware(response, accept).has_header("Content-Encoding"))
+
+    def test_streaming_ndjson_is_compressed_chunk_by_chunk(self):
+        lines = [json.dumps({"row": index}).encode() + b"\n" for index in range(50)]
+        response = StreamingHttpResponse(iter(lines), content_type="application/x-ndjson")
+
+        response = run_middleware(response)
+        chunks = list(response.streaming_content)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(gzip.decompress(b"".join(chunks)), b"".join(lines))
+
+    def test_etag_is_weakened_for_the_compressed_body(self):
+        response = HttpResponse("<p>long</p>" * 100)
+        response["ETag"] = '"abc"'
+
+        self.assertEqual(run_middleware(response)["ETag"], 'W/"abc"')
+
+    def test_accepted_encoding_honours_quality_values(self):
+        self.assertEqual(accepted_encoding("gzip, deflate"), "gzip")
+        self.assertEqual(accepted_encoding("*"), "gzip" if compression.brotli is None else "br")
+        self.assertIsNone(accepted_encoding("deflate, *;q=0"))
+        self.assertIsNone(accepted_encoding(""))
+
+    @skipIf(compression.brotli is None, "brotli is not installed")
+    def test_brotli_is_preferred_when_available(self):
+        response = run_middleware(HttpResponse("<p>long</p>" * 100), "gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(compression.brotli.decompress(response.content), b"<p>long</p>" * 100)
+
+
+@override_settings(DISABLE_AUTO_SEED=True, COMPRESSION_MIN_SIZE=200, COMPRESSION_CACHE_TIMEOUT=300)
+class SharedCompressionCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_cvc_api_page_is_compressed_once_per_cache_fill(self):
+        user = User.objects.create_user(username="compression-cvc", password="StrongPass123!")
+        grant_active_subscription(user, PLAN_LEVEL_THREE)
+        self.client.force_login(user)
+        for index in range(30):
+            CVCWord.objects.create(word=f"w{index:03d}", arabic_meaning=f"word {index}", order=index)
+
+        with mock.patch.object(compression, "compress_bytes", wraps=compression.compress_bytes) as compress:
+            first = self.client.get("/api/cvc-words/?page_size=30", HTTP_ACCEPT_ENCODING="gzip")
+            second = self.client.get("/api/cvc-words/?page_size=30", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(len(json.loads(gzip.decompress(second.content))["results"]), 30)
+
+    def test_per_user_pages_are_not_shared(self):
+        response = HttpResponse("<p>private</p>" * 100)
+        response["Cache-Control"] = "private, max-age=600"
+
+        with mock.patch.object(compression, "safe_cache_set") as cache_set:
+            run_middleware(response)
+
+        cache_set.assert_not_called()
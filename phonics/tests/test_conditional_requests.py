@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from phonics.models import CVCWord
+from phonics.tests.subscription_helpers import grant_active_subscription
+from phonics.views import PLAN_LEVEL_THREE
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def login(self, username, plan):
+        user = User.objects.create_user(username=username, password="StrongPass123!")
+        grant_active_subscription(user, plan)
+        self.client.force_login(user)
+        return user
+
+    def test_cvc_words_revalidate_without_touching_content_tables(self):
+        self.login("etag-cvc-words", PLAN_LEVEL_THREE)
+        for index in range(5):
+            CVCWord.objects.create(word=f"w{index:03d}", arabic_meaning=f"word {index}", order=index)
+
+        first = self.client.get("/api/cvc-words/?page_size=5")
+        etag = first["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get("/api/cvc-words/?page_size=5", HTTP_IF_NONE_MATCH=etag)
+        content_queries = [query for query in queries.captured_queries if "phonics_cvcword" in query["sql"]]
+        other_page = self.client.get("/api/cvc-words/?page_size=2")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("no-cache", first["Cache-Control"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(content_queries, [])
+        self.assertNotEqual(other_page["ETag"], etag)
+
+    def test_cvc_content_revalidation_skips_the_seed_check(self):
+        self.login("etag-cvc-seed", PLAN_LEVEL_THREE)
+        for url in ("/api/cvc-words/", "/api/cvc-sentences/", "/api/cvc-stories/", "/api/cvc-words/?cursor="):
+            with self.subTest(url=url), patch("phonics.views.ensure_seed_data") as seed:
+                first = self.client.get(url)
+                second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+                self.assertEqual((first.status_code, second.status_code), (200, 304))
+                self.assertEqual(seed.call_count, 1)
+
+    def test_sound_progress_is_not_modified_until_a_write(self):
+        self.login("etag-sound-progress", "silver")
+
+        first = self.client.get("/api/sounds/progress/")
+        with CaptureQueriesContext(connection) as queries:
+            unchanged = self.client.get("/api/sounds/progress/", HTTP_IF_NONE_MATCH=first["ETag"])
+        progress_queries = [
+            query["sql"] for query in queries.captured_queries if "phonics_soundpracticeprogress" in query["sql"]
+        ]
+        self.client.post(
+            "/api/sounds/progress/",
+            {"completed_items": ["digraph:sh"], "quiz_attempts": 1, "last_item": "ship"},
+            content_type="application/json",
+        )
+        changed = self.client.get("/api/sounds/progress/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(len(progress_queries), 1)
+        self.assertNotIn("completed_items", progress_queries[0])
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()["completed_items"], ["digraph:sh"])
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+
+    def test_cvc_reading_progress_etag_follows_updated_at(self):
+        self.login("etag-cvc-progress", PLAN_LEVEL_THREE)
+
+        empty = self.client.get("/api/cvc-progress/")
+        self.assertEqual(self.client.get("/api/cvc-progress/", HTTP_IF_NONE_MATCH=empty["ETag"]).status_code, 304)
+
+        self.client.post(
+            "/api/cvc-progress/",
+            {"event_type": "word", "item_text": "cat", "mastered": True},
+            content_type="application/json",
+        )
+        saved = self.client.get("/api/cvc-progress/", HTTP_IF_NONE_MATCH=empty["ETag"])
+        weak = self.client.get("/api/cvc-progress/", HTTP_IF_NONE_MATCH=f'W/{saved["ETag"]}')
+
+        self.assertEqual(saved.status_code, 200)
+        self.assertIn("cat", saved.json()["progress"]["words_mastered"])
+        self.assertEqual(weak.status_code, 304)
@@ -0,0 +1,108 @@
+import json
+import threading
+import time
+import traceback
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, close_old_connections, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from phonics.counters import increment_counters
+from phonics.models import BirdTutorProgress, EnglishFoundationProgress
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class CounterUpdateTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="counter-user", password="StrongPass123!")
+
+    def test_creates_then_increments_in_one_update(self):
+        lookup = {"user": self.user, "section": "grammar"}
+        first, created = increment_counters(EnglishFoundationProgress, lookup, {"points": 5, "actions_count": 1})
+
+        with CaptureQueriesContext(connection) as queries:
+            second, updated_created = increment_counters(
+                EnglishFoundationProgress, lookup, {"points": 7, "actions_count": 1},
+                values={"completed": True}, returning=["points", "actions_count", "completed"],
+            )
+
+        writes = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual((first, created), ({"points": 5, "actions_count": 1}, True))
+        self.assertEqual((second, updated_created), ({"points": 12, "actions_count": 2, "completed": True}, False))
+        self.assertEqual(len(writes), 1)
+        self.assertIn('"points" = ("phonics_englishfoundationprogress"."points" + ', writes[0])
+
+    def test_stale_instances_no_longer_lose_increments(self):
+        lookup = {"user": self.user, "section": "vocabulary"}
+        increment_counters(EnglishFoundationProgress, lookup, {"points": 1})
+        stale_a = EnglishFoundationProgress.objects.get(**lookup)
+        stale_b = EnglishFoundationProgress.objects.get(**lookup)
+
+        # Two requests that read the row before either wrote: the old `points += n` kept only one.
+        increment_counters(EnglishFoundationProgress, lookup, {"points": 10})
+        increment_counters(EnglishFoundationProgress, lookup, {"points": 20})
+        stale_a.refresh_from_db()
+
+        self.assertEqual(stale_b.points, 1)
+        self.assertEqual(stale_a.points, 31)
+
+    def test_english_foundation_endpoint_uses_counter_update(self):
+        grant_active_subscription(self.user, "diamond")
+        self.client.force_login(self.user)
+
+        for activity in ("game", "complete"):
+            response = self.client.post(
+                "/api/english-foundation/progress/",
+                data=json.dumps({"section": "grammar", "activity_type": activity}),
+                content_type="application/json",
+            )
+
+        payload = response.json()
+        self.assertEqual((payload["points"], payload["actions_count"], payload["completed"]), (57, 2, True))
+        progress = EnglishFoundationProgress.objects.get(user=self.user, section="grammar")
+        self.assertEqual((progress.points, progress.last_activity_type), (57, "complete"))
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class CounterConcurrencyTests(TransactionTestCase):
+    THREADS = 6
+    INCREMENTS_PER_THREAD = 25
+
+    def test_concurrent_increments_are_never_lost(self):
+        user = User.objects.create_user(username="counter-race", password="StrongPass123!")
+        BirdTutorProgress.objects.create(user=user)
+        barrier = threading.Barrier(self.THREADS)
+        errors = []
+
+        def worker():
+            close_old_connections()
+            try:
+                barrier.wait(timeout=5)
+                for _ in range(self.INCREMENTS_PER_THREAD):
+                    while True:
+                        try:
+                            increment_counters(BirdTutorProgress, {"user_id": user.pk}, {"xp": 2, "total_questions": 1})
+                            break
+                        except OperationalError:
+                            # SQLite refuses concurrent writers instead of queueing them; the
+                            # failed statement applied nothing, so retrying is safe.
+                            time.sleep(0.001)
+            except Exception as exc:
+                errors.append("".join(traceback.format_exception(exc)))
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        self.assertTrue(all(not thread.is_alive() for thread in threads))
+        self.assertFalse(errors, "Unexpected counter thread errors:\n" + "\n".join(errors))
+        progress = BirdTutorProgress.objects.get(user=user)
+        expected = self.THREADS * self.INCREMENTS_PER_THREAD
+        self.assertEqual(progress.total_questions, expected)
+        self.assertEqual(progress.xp, expected * 2)
@@ -0,0 +1,137 @@
+import json
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from phonics.cvc_progress import ContentTotals, fold_cvc_events, parse_cvc_event, record_cvc_event
+from phonics.models import CVCProgressEvent, CVCReadingProgress
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+TOTALS = ContentTotals(words=100, sentences=100, stories=10)
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class CVCProgressEventTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cvc-events", password="StrongPass123!")
+        grant_active_subscription(self.user, "diamond")
+        self.client.force_login(self.user)
+
+    def post_event(self, payload):
+        return self.client.post("/api/cvc-progress/", data=json.dumps(payload), content_type="application/json")
+
+    def test_post_applies_event_under_the_row_lock_and_returns_folded_state(self):
+        self.post_event({"event_type": "word", "item_text": "dog", "mastered": True})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_event({"event_type": "quiz", "item_text": "cat", "mastered": True})
+
+        payload = response.json()
+        writes = [
+            query["sql"] for query in queries.captured_queries
+            if "phonics_cvc" in query["sql"] and query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].startswith('UPDATE "phonics_cvcreadingprogress"'))
+        self.assertFalse(CVCProgressEvent.objects.filter(user=self.user).exists())
+        self.assertEqual(payload["progress"]["words_mastered"], ["dog", "cat"])
+        self.assertEqual(payload["progress"]["quiz_attempts"], 1)
+
+    def test_post_rejects_a_payload_that_is_not_an_object(self):
+        response = self.post_event(["quiz", "cat"])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(CVCReadingProgress.objects.filter(user=self.user).exists())
+        self.assertFalse(CVCProgressEvent.objects.filter(user=self.user).exists())
+
+    def test_fold_writes_only_changed_fields(self):
+        self.post_event({"event_type": "word", "item_text": "cat", "mastered": True})
+
+        with CaptureQueriesContext(connection) as queries:
+            self.post_event({"event_type": "mic", "item_text": "cat", "mastered": True})
+
+        update = next(
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "phonics_cvcreadingprogress"')
+        )
+        self.assertIn('"mic_attempts"', update)
+        self.assertNotIn('"last_event_id"', update)
+        self.assertNotIn('"words_practiced"', update)
+        self.assertNotIn('"pronouns_mastered"', update)
+
+    def test_fold_applies_every_pending_event_in_order(self):
+        record_cvc_event(self.user, {"event_type": "quiz", "item_text": "dog", "mastered": False})
+        record_cvc_event(self.user, {"event_type": "quiz", "item_text": "dog", "mastered": True})
+        last = record_cvc_event(self.user, {"event_type": "pronoun_mastered", "item_text": "he", "lesson_id": "p1"})
+
+        progress = fold_cvc_events(self.user.pk, TOTALS)
+
+        self.assertEqual(progress.last_event_id, last.pk)
+        self.assertEqual(progress.quiz_attempts, 2)
+        self.assertEqual(progress.words_mastered, ["dog"])
+        self.assertEqual(progress.needs_review_words, [])
+        self.assertEqual(progress.pronoun_lessons_completed, 1)
+        with self.assertNumQueries(4):
+            fold_cvc_events(self.user.pk, TOTALS)
+
+    def test_list_fields_keep_their_caps_and_uniqueness(self):
+        for index in range(55):
+            record_cvc_event(self.user, {"event_type": "quiz", "item_text": f"w{index}", "mastered": False})
+        record_cvc_event(self.user, {"event_type": "quiz", "item_text": "w0", "mastered": False})
+
+        progress = fold_cvc_events(self.user.pk, TOTALS)
+
+        self.assertEqual(len(progress.needs_review_words), 50)
+        self.assertEqual(len(set(progress.words_practiced)), 55)
+        self.assertEqual(progress.needs_review_words[0], "w0")
+
+    def test_malformed_event_is_skipped_without_blocking_later_events(self):
+        record_cvc_event(self.user, {"event_type": "sentence", "sentences_read": "many"})
+        CVCProgressEvent.objects.create(user=self.user, event_type="quiz", payload=["not", "a", "dict"])
+        last = record_cvc_event(self.user, {"event_type": "quiz", "item_text": "sun", "mastered": True})
+
+        progress = fold_cvc_events(self.user.pk, TOTALS)
+
+        self.assertEqual(progress.words_mastered, ["sun"])
+        self.assertEqual(progress.last_event_id, last.pk)
+
+    def test_payloads_are_validated_before_the_aggregate_is_touched(self):
+        with self.assertRaises(ValueError):
+            ContentTotals(words="broken", sentences=100, stories=10)
+        with self.assertRaises(ValueError):
+            parse_cvc_event(["not", "a", "dict"])
+
+        event = parse_cvc_event({"event_type": "fluency_attempt", "reading_time": "1e400", "score": "1e400"})
+        progress = fold_cvc_events(self.user.pk, TOTALS, [event])
+
+        self.assertEqual(progress.fluency_attempts, 1)
+        self.assertEqual(progress.best_reading_time, 0)
+
+    def test_folded_events_are_deleted_with_the_fold(self):
+        for word in ("cat", "dog"):
+            record_cvc_event(self.user, {"event_type": "word", "item_text": word, "mastered": True})
+        other = User.objects.create_user(username="cvc-events-other")
+        record_cvc_event(other, {"event_type": "word", "item_text": "sun"})
+
+        fold_cvc_events(self.user.pk, TOTALS)
+
+        self.assertFalse(CVCProgressEvent.objects.filter(user=self.user).exists())
+        self.assertEqual(CVCProgressEvent.objects.filter(user=other).count(), 1)
+
+    def test_command_folds_events_left_pending(self):
+        record_cvc_event(self.user, {"event_type": "story_complete", "item_text": "The Cat"})
+
+        output = StringIO()
+        call_command("fold_cvc_progress_events", stdout=output)
+
+        self.assertIn("1 user(s)", output.getvalue())
+        self.assertEqual(CVCReadingProgress.objects.get(user=self.user).stories_completed, 1)
+        output = StringIO()
+        call_command("fold_cvc_progress_events", stdout=output)
+        self.assertIn("No pending", output.getvalue())
@@ -0,0 +1,144 @@
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from phonics import document_jobs
+from phonics.models import DocumentJob, LetterProgress, Student
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+@override_settings(DISABLE_AUTO_SEED=True, ARTIFACT_VERSION="test", DOCUMENT_JOBS_EAGER=False)
+class DocumentJobQueueTests(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = Path(root.name)
+        settings_override = override_settings(ARTIFACTS_ROOT=self.root, ARTIFACTS_BUILD_ROOT=self.root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def register(self, kind, handler):
+        document_jobs.register_job(kind, handler)
+        self.addCleanup(document_jobs._handlers.pop, kind)
+
+    def test_book_download_is_queued_once_and_served_after_the_worker_runs(self):
+        user = User.objects.create_user(username="jobs-vip", password="StrongPass123!")
+        grant_active_subscription(user, "vip")
+        self.client.force_login(user)
+
+        first = self.client.get("/letters/worksheets-book/word/")
+        second = self.client.get("/letters/worksheets-book/word/")
+
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual(first["Retry-After"], "2")
+        self.assertEqual(first.json()["poll"], "/letters/worksheets-book/word/?poll=1")
+        self.assertEqual(first.json()["job"], second.json()["job"])
+        self.assertEqual(DocumentJob.objects.count(), 1)
+
+        call_command("run_document_jobs", "--once", stdout=StringIO())
+        ready = self.client.get("/letters/worksheets-book/word/")
+
+        self.assertEqual(ready.status_code, 200)
+        self.assertTrue(ready.getvalue().startswith(b"PK"))
+        self.assertEqual(DocumentJob.objects.get().status, DocumentJob.Status.DONE)
+
+    def test_certificate_is_built_by_the_worker(self):
+        staff = User.objects.create_user(username="jobs-staff", password="StrongPass123!", is_staff=True)
+        self.client.force_login(staff)
+        student = Student.objects.create(name="Queued Student")
+        LetterProgress.objects.bulk_create(
+            LetterProgress(student=student, letter=letter, score=90, passed=True)
+            for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        )
+        url = reverse("generate_certificate", args=[student.id])
+
+        pending = self.client.get(url)
+        self.assertEqual(pending.status_code, 202)
+        self.assertEqual(pending["Cache-Control"], "private, no-store")
+
+        self.assertEqual(document_jobs.run_pending(), 1)
+        ready = self.client.get(url)
+
+        self.assertEqual(ready.status_code, 200)
+        self.assertEqual(ready["Content-Type"], "application/pdf")
+        self.assertIn("certificate_Queued Student.pdf", ready["Content-Disposition"])
+        self.assertTrue(ready.getvalue().startswith(b"%PDF"))
+
+    def test_failed_jobs_are_retried_until_the_attempt_limit(self):
+        handler = mock.Mock(side_effect=RuntimeError("boom"))
+        self.register("test-broken", handler)
+
+        for _ in range(3):
+            job = document_jobs.enqueue("test-broken", {"n": 1})
+            document_jobs.run_pending()
+        job = document_jobs.enqueue("test-broken", {"n": 1})
+
+        self.assertEqual(handler.call_count, 3)
+        self.assertEqual(job.status, DocumentJob.Status.FAILED)
+        self.assertIn("boom", job.error)
+        self.assertEqual(document_jobs.run_pending(), 0)
+
+    def test_eager_mode_builds_inline_and_a_missing_result_is_rebuilt(self):
+        built = []
+
+        def handler(job):
+            built.append(job.job_key)
+            return document_jobs.store_result(job, b"result", ".txt")
+
+        self.register("test-echo", handler)
+        with override_settings(DOCUMENT_JOBS_EAGER=True):
+            job = document_jobs.enqueue("test-echo", {"n": 1})
+            self.assertEqual(job.status, DocumentJob.Status.DONE)
+            self.assertEqual(Path(job.result_path).read_bytes(), b"result")
+
+            self.assertEqual(document_jobs.enqueue("test-echo", {"n": 1}).pk, job.pk)
+            Path(job.result_path).unlink()
+            document_jobs.enqueue("test-echo", {"n": 1})
+
+        self.assertEqual(len(built), 2)
+
+    def test_browser_navigation_gets_a_refreshing_wait_page(self):
+        user = User.objects.create_user(username="jobs-browser", password="StrongPass123!")
+        grant_active_subscription(user, "vip")
+        self.client.force_login(user)
+
+        response = self.client.get("/letters/worksheets-book/pdf/", HTTP_ACCEPT="text/html,application/xhtml+xml")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response["Location"], "/letters/worksheets-book/pdf/?poll=1")
+        self.assertContains(
+            response,
+            '<meta http-equiv="refresh" content="2;url=/letters/worksheets-book/pdf/?poll=1">',
+            status_code=202,
+            html=False,
+        )
+
+    def test_a_job_abandoned_on_its_last_attempt_fails_and_a_fresh_request_restarts_it(self):
+        handler = mock.Mock(side_effect=lambda job: document_jobs.store_result(job, b"ok", ".txt"))
+        self.register("test-abandoned", handler)
+        job = document_jobs.enqueue("test-abandoned", {"n": 1})
+        DocumentJob.objects.filter(pk=job.pk).update(
+            status=DocumentJob.Status.RUNNING,
+            attempts=3,
+            started_at=timezone.now() - timedelta(hours=1),
+        )
+
+        self.assertEqual(document_jobs.run_pending(), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, DocumentJob.Status.FAILED)
+
+        polled = document_jobs.enqueue("test-abandoned", {"n": 1})
+        self.assertEqual(polled.status, DocumentJob.Status.FAILED)
+
+        restarted = document_jobs.enqueue("test-abandoned", {"n": 1}, restart_failed=True)
+        self.assertEqual((restarted.status, restarted.attempts), (DocumentJob.Status.PENDING, 0))
+        self.assertEqual(document_jobs.run_pending(), 1)
+        self.assertEqual(handler.call_count, 1)
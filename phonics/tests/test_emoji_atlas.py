@@ -0,0 +1,84 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from phonics import emoji_atlas, views
+
+
+def solid_tile(emoji, font):
+    return bytes([ord(emoji[0]) % 256, 0, 0, 255]) * (emoji_atlas.TILE_SIZE * emoji_atlas.TILE_SIZE)
+
+
+@override_settings(ARTIFACT_VERSION="test")
+class EmojiAtlasTests(SimpleTestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = Path(root.name)
+        settings_override = override_settings(ARTIFACTS_ROOT=self.root, ARTIFACTS_BUILD_ROOT=self.root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.font = self.root / "emoji.ttf"
+        self.font.write_bytes(b"font")
+        for patcher in (
+            mock.patch("PIL.ImageFont.truetype", return_value=object()),
+            mock.patch("phonics.views.letters_book_emoji_font_path", return_value=self.font),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(emoji_atlas._atlases.clear)
+
+    def test_tiles_are_rendered_once_and_read_back_from_the_mapped_atlas(self):
+        with mock.patch("phonics.emoji_atlas.render_emoji_tile", side_effect=solid_tile) as render:
+            atlas = emoji_atlas.load_atlas(["🍎", "🐝", "🍎", ""], self.font)
+            emoji_atlas._atlases.clear()
+            reloaded = emoji_atlas.load_atlas(["🐝", "🍎"], self.font)
+
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(atlas.index, reloaded.index)
+        self.assertEqual(reloaded.image("🐝").getpixel((5, 5)), (ord("🐝") % 256, 0, 0, 255))
+        self.assertIsNone(reloaded.image("🚀"))
+        data_path, index_path = emoji_atlas.atlas_paths(reloaded.digest)
+        self.assertEqual(data_path.stat().st_size, 2 * emoji_atlas.TILE_BYTES)
+        self.assertTrue(index_path.exists())
+
+    def test_pdf_draws_from_the_prebuilt_atlas_without_rasterizing(self):
+        with mock.patch("phonics.emoji_atlas.render_emoji_tile", side_effect=solid_tile):
+            call_command("build_emoji_atlas", stdout=StringIO())
+        emoji_atlas._atlases.clear()
+
+        with mock.patch("phonics.emoji_atlas.render_emoji_tile") as render:
+            pdf_bytes = views.draw_letters_book_pdf(views.letter_worksheet_book_items())
+
+        render.assert_not_called()
+        self.assertTrue(pdf_bytes.startswith(b"%PDF"))
+
+    def test_build_command_removes_older_atlases(self):
+        stale = self.root / "emoji-atlas-old.rgba"
+        stale.write_bytes(b"")
+        (self.root / "emoji-atlas-old.json").write_text("{}", encoding="utf-8")
+        output = StringIO()
+
+        with mock.patch("phonics.emoji_atlas.render_emoji_tile", side_effect=solid_tile):
+            call_command("build_emoji_atlas", stdout=output)
+
+        self.assertIn("removed emoji-atlas-old.rgba", output.getvalue())
+        self.assertEqual(len(list(self.root.glob("emoji-atlas-*"))), 2)
+
+    def test_atlas_shipped_with_the_build_is_mapped_without_a_runtime_copy(self):
+        runtime = self.root / "runtime"
+        with override_settings(ARTIFACTS_ROOT=runtime):
+            with mock.patch("phonics.emoji_atlas.render_emoji_tile", side_effect=solid_tile):
+                call_command("build_emoji_atlas", stdout=StringIO())
+            emoji_atlas._atlases.clear()
+            with mock.patch("phonics.emoji_atlas.render_emoji_tile") as render:
+                atlas = views.letters_book_emoji_atlas(views.letter_worksheet_book_items())
+
+            self.assertEqual(emoji_atlas.atlas_paths(atlas.digest)[1].parent, self.root)
+        render.assert_not_called()
+        self.assertFalse(runtime.exists())
@@ -0,0 +1,68 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from phonics.inline_assets import extract_inline_assets
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+SCRIPT = "document.body.dataset.ready = 'yes';\n" * 80
+STYLE = ".card { color: red; }\n" * 120
+
+
+class ExtractInlineAssetsTests(SimpleTestCase):
+    def test_plain_blocks_become_static_links(self):
+        html = f"<head>\n    <style>{STYLE}</style>\n</head>\n<body>\n    <script>{SCRIPT}</script>\n    <script>{SCRIPT}</script>\n</body>"
+
+        new_html, assets = extract_inline_assets(html, "demo", "page")
+
+        self.assertEqual([asset.path for asset in assets], ["css/demo/page.css", "js/demo/page.js", "js/demo/page-2.js"])
+        self.assertTrue(new_html.startswith("{% load static %}\n"))
+        self.assertIn("""    <link rel="stylesheet" href="{% static 'css/demo/page.css' %}">""", new_html)
+        self.assertIn("""    <script src="{% static 'js/demo/page-2.js' %}"></script>""", new_html)
+        self.assertEqual(assets[1].content, SCRIPT.strip() + "\n")
+
+    def test_per_request_and_special_blocks_stay_inline(self):
+        html = "\n".join([
+            "{% extends 'base.html' %}",
+            f"<script>const url = '{{% url \"sounds\" %}}';{SCRIPT}</script>",
+            f'<script id="data" type="application/json">{SCRIPT}</script>',
+            f"<script defer>{SCRIPT}</script>",
+            "<script>tiny();</script>",
+            f"<style>{STYLE}</style>",
+        ])
+
+        new_html, assets = extract_inline_assets(html, "demo", "page")
+
+        self.assertEqual([asset.path for asset in assets], ["css/demo/page.css"])
+        self.assertTrue(new_html.startswith("{% extends 'base.html' %}\n{% load static %}\n"))
+        self.assertEqual(new_html.count("<script"), 4)
+
+    def test_existing_files_are_never_overwritten(self):
+        _, assets = extract_inline_assets(f"<script>{SCRIPT}</script>", "demo", "page", taken={"js/demo/page.js"}.__contains__)
+
+        self.assertEqual(assets[0].path, "js/demo/page-2.js")
+
+    def test_registered_pages_have_nothing_left_to_extract(self):
+        output = StringIO()
+        call_command("extract_inline_assets", "--check", stdout=output)
+        self.assertIn("No inline blocks left", output.getvalue())
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class PageShellTests(TestCase):
+    def test_sounds_page_ships_a_small_shell(self):
+        user = User.objects.create_user(username="shell-silver", password="StrongPass123!")
+        grant_active_subscription(user, "silver")
+        self.client.force_login(user)
+
+        response = self.client.get("/sounds/")
+        html = response.content.decode("utf-8")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('<script src="/static/js/sounds/sounds.js"></script>', html)
+        self.assertIn('<link rel="stylesheet" href="/static/css/sounds/sounds.css">', html)
+        self.assertIn('"worksheet": "/sounds/worksheet/"', html)
+        self.assertNotIn("function renderVocabularyCategories", html)
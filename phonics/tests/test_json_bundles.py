@@ -0,0 +1,51 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from phonics import json_bundles
+from phonics.cache_helpers import invalidate_static_cache
+from phonics.tests.subscription_helpers import grant_active_subscription
+from phonics.views import SOUND_PATTERN_GROUPS, SOUNDS_PAGE_BUNDLES, get_existing_bird_lottie_files
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class JsonBundleTests(TestCase):
+    def setUp(self):
+        json_bundles.reset_bundles()
+        self.addCleanup(json_bundles.reset_bundles)
+
+    def test_bundles_are_serialized_once_per_process(self):
+        user = User.objects.create_user(username="bundle-silver", password="StrongPass123!")
+        grant_active_subscription(user, "silver")
+        self.client.force_login(user)
+
+        providers = {name: mock.Mock(wraps=SOUNDS_PAGE_BUNDLES[name]) for name in SOUNDS_PAGE_BUNDLES}
+        with mock.patch.dict(json_bundles._providers, providers):
+            first = self.client.get("/sounds/")
+            second = self.client.get("/sounds/")
+
+        self.assertEqual((first.status_code, second.status_code), (200, 200))
+        self.assertEqual({name: provider.call_count for name, provider in providers.items()}, dict.fromkeys(providers, 1))
+        self.assertContains(second, json_bundles.bundle_json("sound_pattern_groups"))
+        self.assertEqual(json.loads(json_bundles.bundle_json("sound_pattern_groups")), SOUND_PATTERN_GROUPS)
+
+    def test_placement_bundle_leaves_out_the_answers(self):
+        self.assertNotIn('"answer"', json_bundles.bundle_json("placement_questions"))
+
+    def test_disk_backed_lists_stay_on_the_invalidatable_static_cache(self):
+        self.assertFalse(json_bundles.is_registered("bird_lottie_files"))
+        with tempfile.TemporaryDirectory() as root, override_settings(BASE_DIR=Path(root)):
+            invalidate_static_cache("bird-lottie-files")
+            self.assertEqual(get_existing_bird_lottie_files(), {})
+
+            bird_dir = Path(root, "static", "animations", "bird")
+            bird_dir.mkdir(parents=True)
+            (bird_dir / "bird_idle.json").write_text("{}")
+            invalidate_static_cache("bird-lottie-files")
+
+            self.assertEqual(get_existing_bird_lottie_files(), {"idle": "/static/animations/bird/bird_idle.json"})
+        invalidate_static_cache("bird-lottie-files")
@@ -0,0 +1,413 @@
+import json
+from datetime import date, timedelta
+from fnmatch import fnmatch
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from phonics import leaderboard_redis
+from phonics.leaderboard import (
+    compute_user_scores,
+    find_inconsistencies,
+    refresh_user_entry,
+    score_cvc_reading_progress,
+    score_sound_progress,
+    top_entries,
+    user_rank_context,
+)
+from phonics.models import (
+    BirdTutorProgress,
+    CVCProgress,
+    CVCReadingProgress,
+    LeaderboardEntry,
+    LetterProgress,
+    SoundPracticeProgress,
+    Student,
+    StudentProfile,
+)
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+class InMemorySortedSets:
+    """Just enough of the redis-py client for the leaderboard index."""
+
+    def __init__(self):
+        self.zsets = {}
+        self.hashes = {}
+        self.strings = {}
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def expire(self, key, ttl):
+        return True
+
+    def _ranked(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0].encode()))
+
+    def zrange(self, key, start, end, withscores=False):
+        stop = None if end == -1 else end + 1
+        return [(member.encode(), float(score)) for member, score in self._ranked(key)[start:stop]]
+
+    def zrank(self, key, member):
+        members = [ranked_member for ranked_member, _ in self._ranked(key)]
+        return members.index(member) if member in members else None
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hmget(self, key, fields):
+        return [self.hget(key, field) for field in fields]
+
+    def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+    def set(self, key, value):
+        self.strings[key] = str(value).encode()
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def incr(self, key):
+        self.set(key, int(self.strings.get(key, 0)) + 1)
+
+    def decr(self, key):
+        self.set(key, int(self.strings.get(key, 0)) - 1)
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def sismember(self, key, member):
+        return member in self.sets.get(key, set())
+
+    def smembers(self, key):
+        return {member.encode() for member in self.sets.get(key, set())}
+
+    def rename(self, key, new_key):
+        self.zsets[new_key] = self.zsets.pop(key)
+
+    def exists(self, key):
+        return int(any(key in store for store in (self.strings, self.zsets, self.hashes, self.sets)))
+
+    def delete(self, *keys):
+        for key in keys:
+            for store in (self.zsets, self.hashes, self.strings, self.sets):
+                store.pop(key, None)
+
+    def scan_iter(self, match, count=None):
+        return [key for store in (self.zsets, self.strings) for key in list(store) if fnmatch(key, match)]
+
+
+class _Pipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        calls, self.calls = self.calls, []
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class LeaderboardEntryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def create_learner(self, username, plan_code="diamond", grade="Grade 3"):
+        user = User.objects.create_user(username=username, password="StrongPass123!")
+        StudentProfile.objects.create(user=user, student_name=username, grade=grade)
+        grant_active_subscription(user, plan_code)
+        return user
+
+    def post_json(self, url, payload):
+        return self.client.post(url, data=json.dumps(payload), content_type="application/json")
+
+    def test_progress_endpoints_update_entry_in_the_write_transaction(self):
+        user = self.create_learner("entry-writer")
+        self.client.force_login(user)
+
+        self.post_json("/api/letter-progress/save/", {"letter": "A", "total_score": 40, "completed": True})
+        self.post_json("/api/sounds/progress/", {"completed_items": ["digraph:sh"], "quiz_attempts": 1})
+        self.post_json("/api/bird-tutor/progress/", {
+            "xp_delta": 5, "question_type": "starts_with_letter", "is_correct": True, "letter": "A", "word": "ant",
+        })
+
+        entry = LeaderboardEntry.objects.get(user=user)
+        sound_points = score_sound_progress(SoundPracticeProgress.objects.get(user=user))
+        self.assertEqual(entry.total_points, 40 + 7 + sound_points + 5)
+        self.assertEqual(entry.completed_letters, 1)
+        self.assertEqual(entry.week_points, entry.total_points)
+        self.assertEqual(find_inconsistencies(), [])
+
+    def test_cvc_and_profile_updates_keep_entry_consistent(self):
+        user = self.create_learner("entry-cvc")
+        self.client.force_login(user)
+
+        self.post_json("/api/cvc-progress/", {"event_type": "word", "item_text": "cat", "mastered": True})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_json("/accounts/profile/", {"student_name": "Renamed", "display_name": "Renamed"})
+
+        entry = LeaderboardEntry.objects.get(user=user)
+        self.assertEqual(entry.total_points, score_cvc_reading_progress(CVCReadingProgress.objects.get(user=user)))
+        self.assertEqual(entry.display_name, "Renamed")
+        self.assertEqual(entry.grade, "Grade 3")
+
+    def test_profile_edits_outside_the_profile_api_refresh_the_entry(self):
+        user = self.create_learner("entry-admin-edit")
+        LetterProgress.objects.create(user=user, letter="A", total_score=10)
+        refresh_user_entry(user.pk)
+
+        profile = StudentProfile.objects.get(user=user)
+        profile.display_name = "Edited In Admin"
+        profile.grade = "Grade 5"
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+
+        entry = LeaderboardEntry.objects.get(user=user)
+        self.assertEqual((entry.display_name, entry.grade, entry.total_points), ("Edited In Admin", "Grade 5", 10))
+        self.assertEqual([row["display_name"] for row in top_entries(grade="Grade 5")], ["Edited In Admin"])
+
+    def test_leaderboard_api_is_a_single_top_n_read(self):
+        viewer = self.create_learner("entry-viewer")
+        for index in range(30):
+            user = self.create_learner(f"entry-user-{index}", grade="Grade 5")
+            LetterProgress.objects.create(user=user, letter="A", total_score=index)
+            refresh_user_entry(user.pk)
+        self.client.force_login(viewer)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/leaderboard/?grade=Grade 5")
+
+        rows = response.json()["rows"]
+        leaderboard_queries = [q for q in queries.captured_queries if "phonics_leaderboardentry" in q["sql"]]
+        self.assertEqual(len(leaderboard_queries), 1)
+        self.assertEqual(rows[0]["student_name"], "entry-user-29")
+        self.assertEqual(rows[0]["total_points"], 29)
+        self.assertEqual(rows[0]["rank"], 1)
+        self.assertEqual(len(rows), 30)
+
+    def test_period_buckets_reset_and_only_count_points_earned_in_the_period(self):
+        user = self.create_learner("entry-periods")
+        progress = LetterProgress.objects.create(user=user, letter="A", total_score=30)
+        last_week = date(2026, 3, 4)
+        refresh_user_entry(user.pk, today=last_week)
+
+        progress.total_score = 50
+        progress.save()
+        this_week = last_week + timedelta(days=7)
+        refresh_user_entry(user.pk, today=this_week)
+
+        entry = LeaderboardEntry.objects.get(user=user)
+        self.assertEqual(entry.total_points, 50)
+        self.assertEqual(entry.week_points, 20)
+        self.assertEqual(entry.month_points, 50)
+        weekly = top_entries("weekly", today=this_week)
+        self.assertEqual([row["points"] for row in weekly], [20])
+        self.assertEqual(top_entries("daily", today=this_week + timedelta(days=1)), [])
+
+    def test_rebuild_command_backfills_and_check_detects_drift(self):
+        user = self.create_learner("entry-backfill")
+        LetterProgress.objects.create(user=user, letter="A", total_score=12)
+        BirdTutorProgress.objects.create(user=user, xp=3)
+        student = Student.objects.create(name="Legacy Student", grade="Grade 2")
+        CVCProgress.objects.create(student=student, total_score=9)
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_leaderboard", "--check", stdout=StringIO(), stderr=StringIO())
+
+        output = StringIO()
+        call_command("rebuild_leaderboard", stdout=output)
+        self.assertIn("created=2", output.getvalue())
+        self.assertEqual(LeaderboardEntry.objects.get(user=user).total_points, 15)
+        self.assertEqual(LeaderboardEntry.objects.get(student=student).total_points, 9)
+
+        LeaderboardEntry.objects.filter(user=user).update(total_points=1)
+        self.assertEqual(find_inconsistencies()[0]["issue"], "drift")
+        call_command("rebuild_leaderboard", stdout=StringIO())
+        check_output = StringIO()
+        call_command("rebuild_leaderboard", "--check", stdout=check_output)
+        self.assertIn("consistent", check_output.getvalue())
+
+    def test_search_matches_student_name_and_username(self):
+        user = self.create_learner("entry-search-login")
+        StudentProfile.objects.filter(user=user).update(student_name="Huda Ahmed", display_name="Star Reader")
+        LetterProgress.objects.create(user=user, letter="A", total_score=10)
+        refresh_user_entry(user.pk)
+
+        for term in ("star", "huda", "search-login"):
+            with self.subTest(term=term):
+                self.assertEqual([row["display_name"] for row in top_entries(search=term)], ["Star Reader"])
+        self.assertEqual(top_entries(search="nobody"), [])
+
+    def test_legacy_student_progress_refreshes_its_entry(self):
+        student = Student.objects.create(name="Legacy Reader", grade="Grade 1")
+        with self.captureOnCommitCallbacks(execute=True):
+            progress = LetterProgress.objects.create(student=student, letter="B", score=20)
+        self.assertEqual(LeaderboardEntry.objects.get(student=student).total_points, 20)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CVCProgress.objects.create(student=student, total_score=5)
+            progress.delete()
+        entry = LeaderboardEntry.objects.get(student=student)
+        self.assertEqual((entry.total_points, entry.student_name), (5, "Legacy Reader"))
+        self.assertEqual(find_inconsistencies(), [])
+
+    def test_refresh_matches_batch_scoring(self):
+        user = self.create_learner("entry-batch")
+        SoundPracticeProgress.objects.create(user=user, completed_items=["a", "b"], practiced_vowels=["A"])
+        refresh_user_entry(user.pk)
+
+        batch_score = next(compute_user_scores())
+        self.assertEqual(LeaderboardEntry.objects.get(user=user).total_points, batch_score.total_points)
+
+    def test_rank_endpoint_returns_rank_and_neighbours_from_sql(self):
+        users = []
+        for index in range(6):
+            user = self.create_learner(f"rank-user-{index}")
+            LetterProgress.objects.create(user=user, letter="A", total_score=(index + 1) * 10)
+            refresh_user_entry(user.pk)
+            users.append(user)
+        self.client.force_login(users[2])
+
+        response = self.client.get("/api/leaderboard/me/")
+
+        payload = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(payload["rank"], 4)
+        self.assertEqual(payload["total_points"], 30)
+        self.assertEqual([row["rank"] for row in payload["neighbours"]], [2, 3, 4, 5, 6])
+        self.assertEqual([row["total_points"] for row in payload["neighbours"]], [50, 40, 30, 20, 10])
+        self.assertEqual([row["is_current_user"] for row in payload["neighbours"]], [False, False, True, False, False])
+
+    def test_rank_endpoint_requires_login_and_reports_unranked_learners(self):
+        self.assertEqual(self.client.get("/api/leaderboard/me/").status_code, 401)
+
+        self.client.force_login(self.create_learner("rank-none"))
+        payload = self.client.get("/api/leaderboard/me/").json()
+        self.assertIsNone(payload["rank"])
+        self.assertEqual(payload["neighbours"], [])
+
+    def test_redis_index_serves_boards_once_built_and_tracks_progress_writes(self):
+        fake_redis = InMemorySortedSets()
+        users = []
+        for index in range(3):
+            user = self.create_learner(f"redis-user-{index}")
+            LetterProgress.objects.create(user=user, letter="A", total_score=(index + 1) * 10)
+            refresh_user_entry(user.pk)
+            users.append(user)
+
+        with patch.object(leaderboard_redis, "is_enabled", return_value=True), patch.object(
+            leaderboard_redis, "get_connection", return_value=fake_redis,
+        ):
+            self.assertIsNone(leaderboard_redis.top_entries())
+            self.assertEqual(leaderboard_redis.rebuild_index(), 3)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                LetterProgress.objects.filter(user=users[0]).update(total_score=100)
+                refresh_user_entry(users[0].pk)
+
+            with CaptureQueriesContext(connection) as queries:
+                rows = top_entries("all")
+                context = user_rank_context(users[1].pk)
+
+        self.assertEqual(len(queries.captured_queries), 0)
+        self.assertEqual([row["display_name"] for row in rows], ["redis-user-0", "redis-user-2", "redis-user-1"])
+        self.assertEqual([row["points"] for row in rows], [100, 30, 20])
+        self.assertEqual(context["rank"], 3)
+        self.assertEqual([row["is_current_user"] for row in context["neighbours"]], [False, False, True])
+
+    def test_redis_index_breaks_ties_like_the_sql_board(self):
+        fake_redis = InMemorySortedSets()
+        for name in ("Zed", "Anna", "Ann", "Émile", "bea"):
+            user = self.create_learner(name)
+            LetterProgress.objects.create(user=user, letter="A", total_score=10)
+            refresh_user_entry(user.pk)
+        sql_rows = top_entries("all")
+
+        with patch.object(leaderboard_redis, "is_enabled", return_value=True), patch.object(
+            leaderboard_redis, "get_connection", return_value=fake_redis,
+        ):
+            leaderboard_redis.rebuild_index()
+            redis_rows = leaderboard_redis.top_entries()
+
+        self.assertEqual([row["display_name"] for row in sql_rows], ["Ann", "Anna", "Zed", "bea", "Émile"])
+        self.assertEqual([row["display_name"] for row in redis_rows], [row["display_name"] for row in sql_rows])
+
+    def test_redis_reads_flag_damaged_boards_and_the_repair_job_rebuilds_them(self):
+        fake_redis = InMemorySortedSets()
+        for index in range(3):
+            user = self.create_learner(f"evicted-{index}")
+            LetterProgress.objects.create(user=user, letter="A", total_score=(index + 1) * 10)
+            refresh_user_entry(user.pk)
+
+        with patch.object(leaderboard_redis, "is_enabled", return_value=True), patch.object(
+            leaderboard_redis, "get_connection", return_value=fake_redis,
+        ):
+            leaderboard_redis.rebuild_index()
+            board = leaderboard_redis.board_key("all", None, "")
+            grade_board = leaderboard_redis.board_key("all", None, "Grade 3")
+            flagged = fake_redis.sets.setdefault(leaderboard_redis.flagged_key(), set())
+
+            fake_redis.delete(board)
+            with CaptureQueriesContext(connection) as queries:
+                self.assertIsNone(leaderboard_redis.top_entries())
+            self.assertEqual(len(queries.captured_queries), 0)
+            self.assertEqual([row["points"] for row in top_entries("all")], [30, 20, 10])
+            self.assertEqual(flagged, {board})
+
+            # Right size, wrong score: only the repair job's comparison with SQL notices.
+            fake_redis.zadd(grade_board, {next(iter(fake_redis.zsets[grade_board])): -999})
+            self.assertEqual(leaderboard_redis.top_entries(grade="Grade 3")[0]["points"], 999)
+
+            self.assertCountEqual(leaderboard_redis.repair_index(), [board, grade_board])
+            self.assertEqual(flagged, set())
+            with CaptureQueriesContext(connection) as queries:
+                rows = leaderboard_redis.top_entries()
+                grade_rows = leaderboard_redis.top_entries(grade="Grade 3")
+            self.assertEqual(len(queries.captured_queries), 0)
+            self.assertEqual([row["points"] for row in rows], [30, 20, 10])
+            self.assertEqual([row["points"] for row in grade_rows], [30, 20, 10])
+
+            fake_redis.delete(leaderboard_redis.meta_key())
+            self.assertIsNone(leaderboard_redis.top_entries())
+            self.assertEqual(flagged, {board})
+
+    def test_redis_index_falls_back_to_sql_when_redis_errors(self):
+        user = self.create_learner("redis-down")
+        LetterProgress.objects.create(user=user, letter="A", total_score=10)
+        refresh_user_entry(user.pk)
+
+        with patch.object(leaderboard_redis, "is_enabled", return_value=True), patch.object(
+            leaderboard_redis, "get_connection", side_effect=ConnectionError("redis down"),
+        ):
+            rows = top_entries("all")
+            context = user_rank_context(user.pk)
+
+        self.assertEqual([row["points"] for row in rows], [10])
+        self.assertEqual(context["rank"], 1)
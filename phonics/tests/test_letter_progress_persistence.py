@@ -4,6 +4,7 @@ from django.contrib.auth.models import User
 from django.test import TestCase
 
 from phonics.models import LetterProgress, StudentProfile
+from phonics.tests.page_asset_bundle import shipped_text
 
 
 class LetterProgressPersistenceTests(TestCase):
@@ -118,4 +119,4 @@ class LetterProgressPersistenceTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "الألعاب اختيارية للتدريب ولا تمنع فتح الحرف التالي.")
-        self.assertContains(response, "this.requiredGames = [];")
+        self.assertIn("this.requiredGames = [];", shipped_text(response))
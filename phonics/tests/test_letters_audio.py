@@ -28,14 +28,14 @@ class LettersBritishAudioTests(SimpleTestCase):
         self.assertIn("speak(text, lang = 'en-GB')", self.html)
 
     def test_speaker_rate_is_within_spec_range(self):
-        match = re.search(r"utterance\.rate\s*=\s*([0-9.]+)", self.html)
+        match = re.search(r"utterance\.rate\s*=\s*([0-9.]+)", bundle.app_text())
         self.assertIsNotNone(match)
         rate = float(match.group(1))
         self.assertGreaterEqual(rate, 0.78)
         self.assertLessEqual(rate, 0.84)
 
     def test_speaker_pitch_is_within_spec_range(self):
-        match = re.search(r"utterance\.pitch\s*=\s*([0-9.]+)", self.html)
+        match = re.search(r"utterance\.pitch\s*=\s*([0-9.]+)", bundle.app_text())
         self.assertIsNotNone(match)
         pitch = float(match.group(1))
         self.assertGreaterEqual(pitch, 0.92)
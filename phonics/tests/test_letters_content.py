@@ -95,7 +95,7 @@ class LettersContentTests(SimpleTestCase):
         self.assertEqual(words, ["xray", "xmas", "xbox", "xeno", "xyst"])
 
     def test_letters_page_links_to_external_games(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
 
         self.assertIn('id="externalGamesLink"', html)
         self.assertIn('/letters/A/external-games/', html)
@@ -134,7 +134,7 @@ class LettersContentTests(SimpleTestCase):
         self.assertIn('href="/pricing/"', html)
 
     def test_letters_page_contains_bird_tutor(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
         partial = self.bird_tutor_partial.read_text(encoding="utf-8", errors="ignore")
 
         self.assertIn('{% include "letters/_bird_tutor.html" %}', html)
@@ -150,7 +150,7 @@ class LettersContentTests(SimpleTestCase):
         self.assertIn("lottie-web/5.12.2/lottie.min.js", html)
 
     def test_letter_games_are_optional_after_core_lesson(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
         progress = self.progress_js.read_text(encoding="utf-8", errors="ignore")
 
         self.assertIn("this.requiredGames = [];", html)
@@ -166,13 +166,13 @@ class LettersContentTests(SimpleTestCase):
                 self.assertIn(f'data-game="{game}"', html)
 
     def test_required_score_remains_thirteen(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
 
         self.assertIn("this.REQUIRED_SCORE = 13;", html)
         self.assertIn("(latestEntry.score || 0) < this.REQUIRED_SCORE", html)
 
     def test_letter_completion_screen_is_available_and_accessible(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
         partial = self.completion_partial.read_text(encoding="utf-8", errors="ignore")
         script = self.letter_completion_js.read_text(encoding="utf-8", errors="ignore")
 
@@ -192,7 +192,7 @@ class LettersContentTests(SimpleTestCase):
         self.assertIn("openCompletionParentReport", script)
 
     def test_letter_completion_replaces_auto_game_gate(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
 
         self.assertIn("this.showLetterCompletion(currentLetter, latestEntry);", html)
         self.assertNotIn("setTimeout(() => this.loadLetter(nextIndex), 1200);", html)
@@ -218,7 +218,7 @@ class LettersContentTests(SimpleTestCase):
         self.assertIn("@page", css)
 
     def test_letter_quiz_state_is_scoped_to_current_letter(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
         progress = self.progress_js.read_text(encoding="utf-8", errors="ignore")
 
         self.assertIn("ensureCurrentLetterQuizState", html)
@@ -230,7 +230,7 @@ class LettersContentTests(SimpleTestCase):
         self.assertIn("quizBelongsToLetter &&", progress)
 
     def test_letter_quiz_questions_are_generated_for_the_current_letter(self):
-        html = self.letters_html.read_text(encoding="utf-8", errors="ignore")
+        html = letters_asset_bundle.bundle_text()
 
         self.assertIn("const soundDistractorLetters = LETTERS", html)
         self.assertIn("soundCorrectIndex", html)
@@ -437,7 +437,7 @@ class LettersJavaScriptContractTests(SimpleTestCase):
                 block = re.search(
                     rf"recognition\.{handler}\s*=\s*(?:async\s*)?\([^)]*\)\s*=>\s*\{{"
                     rf"(?P<body>[\s\S]{{0,400}})",
-                    self.bundle,
+                    bundle.app_text(),
                 )
                 self.assertIsNotNone(block, f"recognition.{handler} was not found")
                 self.assertIn(
@@ -79,7 +79,7 @@ class LettersWorksheetsBookTests(TestCase):
         self.login_plan_user("VIP")
 
         response = self.client.get("/letters/worksheets-book/word/")
-        docx_bytes = bytes(response.content)
+        docx_bytes = response.getvalue()
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
@@ -109,7 +109,7 @@ class LettersWorksheetsBookTests(TestCase):
         self.login_plan_user("VIP")
 
         response = self.client.get("/letters/worksheets-book/pdf/")
-        pdf_bytes = bytes(response.content)
+        pdf_bytes = response.getvalue()
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/pdf")
@@ -0,0 +1,93 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from phonics import metrics
+from phonics.cache_helpers import get_or_compute, safe_cache_get, safe_cache_set
+
+
+@override_settings(METRICS_TOKEN="scrape-secret", DISABLE_AUTO_SEED=True)
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        metrics.registry.reset()
+        self.addCleanup(metrics.registry.reset)
+
+    def scrape(self, **headers):
+        return self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-secret", **headers)
+
+    def test_requests_are_counted_per_view_method_and_status(self):
+        self.client.get("/health/")
+        self.client.get("/health/")
+        self.client.post("/health/")
+
+        body = self.scrape().content.decode()
+
+        self.assertIn('abcz_request_duration_seconds_count{view="health",method="GET",status="200"} 2', body)
+        self.assertIn('abcz_request_duration_seconds_count{view="health",method="POST",status="405"} 1', body)
+        self.assertIn('abcz_request_duration_seconds_bucket{view="health",method="GET",status="200",le="+Inf"} 2', body)
+        self.assertIn("# TYPE abcz_request_duration_seconds histogram", body)
+
+    def test_db_queries_and_cache_lookups_are_attributed_to_the_view(self):
+        user = User.objects.create_user(username="metrics-user", password="StrongPass123!")
+        self.client.force_login(user)
+        self.client.get("/profile/")
+
+        body = self.scrape().content.decode()
+        db_lines = [line for line in body.splitlines() if line.startswith("abcz_request_db_queries_total")]
+
+        self.assertTrue(any('view="profile_dashboard"' in line for line in db_lines))
+        self.assertIn("# TYPE abcz_request_cache_misses_total counter", body)
+
+    def test_endpoint_requires_the_token_or_a_staff_session(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 404)
+
+        staff = User.objects.create_user(username="metrics-staff", password="StrongPass123!", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+
+    def test_cache_outcomes_are_exported(self):
+        get_or_compute("metrics:probe-value", lambda: "value", timeout=60)
+        get_or_compute("metrics:probe-value", lambda: "value", timeout=60)
+
+        self.assertEqual(metrics.cache_event_totals()["recomputes"], 1)
+        body = self.scrape().content.decode()
+        self.assertIn("# TYPE abcz_cache_events_total counter", body)
+        self.assertRegex(body, r'abcz_cache_events_total\{event="hits"\} [1-9]')
+        self.assertIn('abcz_cache_events_total{event="local_misses"}', body)
+
+
+class PrometheusRenderingTests(SimpleTestCase):
+    def test_buckets_are_cumulative_and_labels_are_escaped(self):
+        registry = metrics.MetricsRegistry()
+        stats = metrics.RequestStats(db_queries=3, db_seconds=0.004, cache_hits=1)
+        with override_settings(METRICS_FLUSH_SECONDS=60):
+            registry.observe('odd"view', "GET", 200, 0.003, stats)
+            registry.observe('odd"view', "GET", 200, 0.2, None)
+            registry.observe('odd"view', "BREW", 418, 30, None)
+
+        body = metrics.render_prometheus(registry.totals())
+
+        labels = 'view="odd\\"view",method="GET",status="200"'
+        self.assertIn(f'abcz_request_duration_seconds_bucket{{{labels},le="0.005"}} 1', body)
+        self.assertIn(f'abcz_request_duration_seconds_bucket{{{labels},le="0.1"}} 1', body)
+        self.assertIn(f'abcz_request_duration_seconds_bucket{{{labels},le="0.25"}} 2', body)
+        self.assertIn(f"abcz_request_db_queries_total{{{labels}}} 3", body)
+        self.assertIn(f"abcz_request_cache_hits_total{{{labels}}} 1", body)
+        self.assertIn('method="OTHER",status="418",le="10.0"} 0', body)
+
+    def test_cache_lookups_only_count_inside_a_request(self):
+        safe_cache_set("metrics:probe", 1)
+        stats, token = metrics.start_request()
+        try:
+            safe_cache_get("metrics:probe")
+            safe_cache_get("metrics:absent")
+        finally:
+            metrics.finish_request(token)
+        safe_cache_get("metrics:probe")
+
+        self.assertEqual((stats.cache_hits, stats.cache_misses), (1, 1))
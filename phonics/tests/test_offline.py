@@ -0,0 +1,59 @@
+import json
+import re
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from phonics.offline import reset_offline_manifest
+from phonics.tests.test_letters_javascript_syntax import NODE, check_syntax
+from phonics.views import PROGRESS_EVENT_HANDLERS
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class OfflineManifestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_offline_manifest()
+        self.addCleanup(reset_offline_manifest)
+
+    def manifest(self):
+        return self.client.get("/offline-manifest.json").json()
+
+    def test_manifest_covers_the_assets_the_learning_pages_link(self):
+        lottie = {"idle": "/static/animations/bird/bird_idle.json"}
+        with mock.patch("phonics.views.get_existing_bird_lottie_files", return_value=lottie):
+            manifest = self.manifest()
+        html = self.client.get("/").content.decode("utf-8")
+        page_assets = re.findall(r'<(?:script|link)[^>]+(?:src|href)="(/static/(?:js|css)/letters/[^"]+)"', html)
+
+        self.assertTrue(page_assets)
+        self.assertLessEqual(set(page_assets), set(manifest["assets"]))
+        self.assertIn("/static/js/offline.js", manifest["assets"])
+        self.assertIn("/static/animations/bird/bird_idle.json", manifest["assets"])
+        self.assertEqual(manifest["optional"], ["/api/cvc-corpus.ndjson"])
+
+    def test_version_follows_content_version(self):
+        before = self.manifest()["version"]
+
+        with mock.patch("phonics.views.CVC_CONTENT_CACHE_VERSION", "v2"):
+            after = self.manifest()["version"]
+
+        self.assertNotEqual(before, after)
+        self.assertEqual(self.manifest()["version"], before)
+
+    def test_service_worker_is_generated_for_the_manifest_version(self):
+        response = self.client.get("/sw.js")
+        source = response.content.decode("utf-8")
+        config = json.loads(re.search(r"const CONFIG = (\{.*?\});\n", source).group(1))
+
+        self.assertEqual(response["Content-Type"], "application/javascript; charset=utf-8")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        self.assertEqual(config["version"], self.manifest()["version"])
+        self.assertEqual(config["batchUrl"], "/api/progress/batch/")
+        self.assertLessEqual(set(config["progressEndpoints"].values()), set(PROGRESS_EVENT_HANDLERS))
+        self.assertIn("/sounds/", config["pages"])
+
+    @skipUnless(NODE, "node is not installed")
+    def test_service_worker_parses(self):
+        self.assertIsNone(check_syntax(self.client.get("/sw.js").content.decode("utf-8"), "sw.js"))
@@ -0,0 +1,53 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.test import TestCase, override_settings
+
+from phonics.page_fragments import fragment_variant
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+@override_settings(DISABLE_AUTO_SEED=True, PAGE_FRAGMENT_CACHE_TIMEOUT=300, PAGE_FRAGMENT_CACHE_VERSION="test")
+class PageFragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def login(self, username, plan):
+        user = User.objects.create_user(username=username, password="StrongPass123!")
+        grant_active_subscription(user, plan)
+        self.client.force_login(user)
+        return user
+
+    def test_sounds_markup_is_shared_while_progress_stays_per_user(self):
+        self.login("fragment-silver-a", "silver")
+        first = self.client.get("/sounds/")
+        key = make_template_fragment_key("sounds", [fragment_variant("sounds")])
+        self.assertIn('id="vocabCategoryGrid"', cache.get(key))
+
+        cache.set(key, '<section id="servedFromFragmentCache"></section>', 300)
+        self.login("fragment-silver-b", "silver")
+        second = self.client.get("/sounds/")
+
+        self.assertContains(first, 'data-student-name="fragment-silver-a"')
+        self.assertContains(second, 'id="servedFromFragmentCache"')
+        self.assertContains(second, 'data-student-name="fragment-silver-b"')
+        self.assertContains(second, 'id="soundProgressData"')
+
+    def test_letters_fragment_varies_by_plan(self):
+        self.client.get("/")
+        free_variant = self.client.get("/").context["fragment_variant"]
+
+        self.login("fragment-vip", "vip")
+        response = self.client.get("/")
+
+        self.assertNotEqual(response.context["fragment_variant"], free_variant)
+        self.assertContains(response, 'id="birdTutor"')
+
+    def test_version_bump_starts_new_fragments(self):
+        before = fragment_variant("level_four", section_mode="overview", worksheet="")
+
+        with self.settings(PAGE_FRAGMENT_CACHE_VERSION="next-deploy"):
+            after = fragment_variant("level_four", section_mode="overview", worksheet="")
+
+        self.assertNotEqual(before, after)
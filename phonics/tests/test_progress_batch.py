@@ -0,0 +1,154 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from phonics.models import (
+    BirdReviewItem,
+    BirdTutorProgress,
+    CVCReadingProgress,
+    LeaderboardEntry,
+    LetterProgress,
+    ProgressBatchReceipt,
+    SoundPracticeProgress,
+)
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+URL = "/api/progress/batch/"
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class ProgressBatchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="batch-learner", password="StrongPass123!")
+        grant_active_subscription(self.user, "diamond")
+        self.client.force_login(self.user)
+
+    def post_batch(self, events, **extra):
+        return self.client.post(
+            URL,
+            data=json.dumps({"events": events, **extra}),
+            content_type="application/json",
+        )
+
+    def test_applies_every_event_type_in_one_request(self):
+        response = self.post_batch([
+            {"type": "letter", "id": "e1", "data": {"letter": "A", "total_score": 40, "completed": True}},
+            {"type": "sound", "data": {"completed_items": ["digraph:sh"], "quiz_attempts": 2}},
+            {"type": "cvc", "data": {"event_type": "word", "item_text": "cat", "mastered": True}},
+            {"type": "bird", "data": {"xp_delta": 5, "is_correct": True, "letter": "A", "word": "ant"}},
+            {"type": "bird_review", "data": {"letter": "A", "word": "ant", "is_correct": False}},
+        ])
+
+        payload = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((payload["applied"], payload["failed"]), (5, 0))
+        self.assertEqual(payload["results"][0]["id"], "e1")
+        self.assertTrue(payload["results"][0]["created"])
+        self.assertEqual(LetterProgress.objects.get(user=self.user, letter="A").total_score, 40)
+        self.assertEqual(SoundPracticeProgress.objects.get(user=self.user).quiz_attempts, 2)
+        self.assertEqual(CVCReadingProgress.objects.get(user=self.user).words_mastered, ["cat"])
+        self.assertEqual(BirdTutorProgress.objects.get(user=self.user).xp, 5)
+        self.assertEqual(BirdReviewItem.objects.get(user=self.user).mistakes_count, 1)
+        self.assertGreater(LeaderboardEntry.objects.get(user=self.user).total_points, 40)
+
+    def test_repeated_rows_are_locked_and_saved_once(self):
+        events = [
+            {"type": "bird", "data": {"xp_delta": 3, "is_correct": index % 2 == 0, "letter": "B", "word": "bat"}}
+            for index in range(6)
+        ]
+        BirdTutorProgress.objects.create(user=self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_batch(events)
+
+        progress = BirdTutorProgress.objects.get(user=self.user)
+        bird_updates = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "phonics_birdtutorprogress"')
+        ]
+        self.assertEqual(response.json()["results"][-1]["progress"]["xp"], 18)
+        self.assertEqual((progress.xp, progress.total_questions), (18, 6))
+        self.assertEqual((progress.correct_answers, progress.wrong_answers), (3, 3))
+        self.assertEqual(len(bird_updates), 1)
+
+    def test_invalid_events_are_reported_without_blocking_the_rest(self):
+        response = self.post_batch([
+            {"type": "letter", "data": {"letter": "AB"}},
+            {"type": "teleport", "data": {}},
+            {"type": "bird", "data": "not-an-object"},
+            {"type": "letter", "data": {"letter": "C", "quiz_score": 80}},
+        ])
+
+        results = response.json()["results"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["status"] for result in results], ["error", "error", "error", "ok"])
+        self.assertEqual(results[1]["error"], "unknown_event_type")
+        self.assertEqual(results[0]["code"], 400)
+        self.assertEqual(list(LetterProgress.objects.filter(user=self.user).values_list("letter", flat=True)), ["C"])
+
+    def test_plan_gates_apply_per_event(self):
+        free_user = User.objects.create_user(username="batch-free", password="StrongPass123!")
+        self.client.force_login(free_user)
+
+        results = self.post_batch([
+            {"type": "letter", "data": {"letter": "A", "total_score": 10}},
+            {"type": "letter", "data": {"letter": "K", "total_score": 10}},
+            {"type": "bird", "data": {"xp_delta": 1, "letter": "A", "word": "ant"}},
+        ]).json()["results"]
+
+        self.assertEqual(results[0]["status"], "ok")
+        self.assertEqual(results[1]["error"], "basic_plan_required")
+        self.assertEqual(results[2]["error"], "feature_unavailable")
+        self.assertFalse(BirdTutorProgress.objects.filter(user=free_user).exists())
+
+    def test_replaying_an_idempotency_key_returns_the_stored_response(self):
+        events = [
+            {"type": "bird", "data": {"xp_delta": 4, "is_correct": True, "letter": "D", "word": "dog"}},
+            {"type": "cvc", "data": {"event_type": "quiz", "item_text": "dog", "mastered": True}},
+        ]
+        first = self.post_batch(events, idempotency_key="offline-1").json()
+        replay = self.client.post(
+            URL,
+            data=json.dumps({"events": events}),
+            content_type="application/json",
+            HTTP_IDEMPOTENCY_KEY="offline-1",
+        ).json()
+
+        self.assertFalse(first["replayed"])
+        self.assertTrue(replay["replayed"])
+        self.assertEqual(replay["results"], first["results"])
+        self.assertEqual(BirdTutorProgress.objects.get(user=self.user).xp, 4)
+        self.assertEqual(CVCReadingProgress.objects.get(user=self.user).quiz_attempts, 1)
+
+        reused = self.post_batch(events[:1], idempotency_key="offline-1")
+        self.assertEqual(reused.status_code, 409)
+
+    def test_rejects_anonymous_and_malformed_batches(self):
+        self.assertEqual(self.post_batch([]).status_code, 400)
+        self.assertEqual(self.post_batch([{}] * 101).status_code, 400)
+        self.assertEqual(self.post_batch([{}], idempotency_key="k" * 65).status_code, 400)
+        self.client.logout()
+        self.assertEqual(self.post_batch([{"type": "letter", "data": {"letter": "A"}}]).status_code, 401)
+
+    def test_purge_command_removes_expired_receipts(self):
+        self.post_batch([{"type": "letter", "data": {"letter": "A"}}], idempotency_key="old")
+        self.post_batch([{"type": "letter", "data": {"letter": "B"}}], idempotency_key="new")
+        ProgressBatchReceipt.objects.filter(idempotency_key="old").update(
+            created_at=timezone.now() - timedelta(days=30),
+        )
+
+        output = StringIO()
+        call_command("purge_progress_batch_receipts", stdout=output)
+
+        self.assertIn("Purged 1", output.getvalue())
+        self.assertEqual(list(ProgressBatchReceipt.objects.values_list("idempotency_key", flat=True)), ["new"])
@@ -0,0 +1,98 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from phonics.models import (
+    CVCProgressEvent,
+    DocumentJob,
+    ExternalGame,
+    LeaderboardEntry,
+    LetterProgress,
+    Student,
+    StudentProfile,
+)
+from phonics.query_audit import audit_queries, fingerprint
+from phonics.tests.query_audit_helpers import QueryAuditMixin
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+ROWS = 12
+
+
+class FingerprintTests(TestCase):
+    def test_literals_and_in_lists_share_one_fingerprint(self):
+        self.assertEqual(
+            fingerprint('SELECT "a"."id" FROM "a" WHERE "a"."id" = 17 AND "a"."name" = \'x\''),
+            fingerprint('SELECT "a"."id" FROM "a" WHERE "a"."id" = 4  AND "a"."name" = \'it\'\'s\''),
+        )
+        self.assertEqual(
+            fingerprint('SELECT * FROM "b" WHERE "b"."id" IN (%s, %s, %s)'),
+            fingerprint('SELECT * FROM "b" WHERE "b"."id" IN (%s)'),
+        )
+        self.assertNotEqual(fingerprint('SELECT * FROM "a"'), fingerprint('SELECT * FROM "b"'))
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class QueryAuditTests(QueryAuditMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(username=f"audit-{index}") for index in range(ROWS)]
+        for index, user in enumerate(cls.users):
+            StudentProfile.objects.create(user=user, student_name=f"Audit {index}", grade="Grade 3")
+            LetterProgress.objects.create(user=user, letter="A", score=80, total_score=80, completed=True)
+            CVCProgressEvent.objects.create(user=user, event_type="word", payload={"word": f"w{index}"})
+            student = Student.objects.create(name=f"Legacy {index}")
+            LeaderboardEntry.objects.create(student=student, display_name=f"Legacy {index}", total_points=index * 10)
+            ExternalGame.objects.create(
+                letter="A",
+                title=f"Game {index}",
+                activity_url=f"https://wordwall.net/resource/{1000 + index}",
+                review_status=ExternalGame.REVIEW_APPROVED,
+            )
+            DocumentJob.objects.create(kind="certificate", job_key=f"{index:064d}")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_mixin_fails_on_a_per_row_lookup(self):
+        with self.assertRaisesMessage(AssertionError, "repeated more than 5 times"):
+            with self.assertNoRepeatedQueries():
+                [progress.user.username for progress in LetterProgress.objects.all()]
+
+        with self.assertNoRepeatedQueries():
+            [progress.user.username for progress in LetterProgress.objects.select_related("user")]
+
+    def test_learner_pages_have_no_repeated_queries(self):
+        user = self.users[0]
+        grant_active_subscription(user, "vip")
+        self.client.force_login(user)
+
+        self.get_without_repeated_queries("/profile/")
+        self.get_without_repeated_queries("/leaderboard/")
+        self.get_without_repeated_queries("/letters/A/external-games/")
+
+    def test_admin_changelists_have_no_repeated_queries(self):
+        admin = User.objects.create_superuser(username="audit-admin", email="audit-admin@example.com", password="x")
+        self.client.force_login(admin)
+
+        for model in ("letterprogress", "studentprofile", "cvcprogressevent", "leaderboardentry", "documentjob"):
+            with self.subTest(model=model):
+                self.get_without_repeated_queries(f"/admin/phonics/{model}/")
+
+    @override_settings(QUERY_AUDIT_ENABLED=True, QUERY_AUDIT_THRESHOLD=0)
+    def test_staging_middleware_logs_offenders_with_the_request_id(self):
+        self.client.force_login(self.users[0])
+
+        with self.assertLogs("abcz.performance", level="WARNING") as logs:
+            self.client.get("/profile/", HTTP_X_REQUEST_ID="audit-request-1")
+
+        message = "\n".join(logs.output)
+        self.assertIn("n_plus_one_detected request_id=audit-request-1 view=profile_dashboard", message)
+
+    def test_audit_counts_every_statement(self):
+        with audit_queries() as audit:
+            list(Student.objects.all())
+            list(Student.objects.all())
+
+        self.assertEqual(audit.total, 2)
+        self.assertEqual(audit.offenders(threshold=1)[0].count, 2)
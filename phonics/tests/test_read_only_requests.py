@@ -0,0 +1,103 @@
+from io import StringIO
+
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from phonics.models import CVCReadingProgress, SoundPracticeProgress, StudentProfile
+from phonics.plans import PLAN_DIAMOND, PLAN_VIP
+from phonics.tests.subscription_helpers import grant_active_subscription
+
+
+WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE")
+READ_ONLY_PAGES = [
+    "/",
+    "/sounds/",
+    "/cvc-reading/",
+    "/leaderboard/",
+    "/pricing/",
+    "/profile/",
+    "/api/leaderboard/",
+    "/api/sounds/progress/",
+    "/api/cvc-progress/",
+    "/accounts/profile/",
+]
+
+
+def write_queries(queries):
+    return [query["sql"] for query in queries if query["sql"].lstrip().upper().startswith(WRITE_PREFIXES)]
+
+
+@override_settings(DISABLE_AUTO_SEED=True)
+class ReadOnlyRequestPathTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="read-only", password="StrongPass123!")
+        StudentProfile.objects.create(user=self.user, student_name="Read Only")
+        grant_active_subscription(self.user, PLAN_DIAMOND)
+        self.client.force_login(self.user)
+
+    def test_get_pages_issue_zero_writes(self):
+        for url in READ_ONLY_PAGES:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(write_queries(queries.captured_queries), [])
+
+    def test_entitlement_checks_do_not_touch_groups_on_page_views(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/sounds/")
+
+        self.assertFalse([query for query in queries.captured_queries if "auth_group" in query["sql"]])
+
+    def test_get_pages_do_not_create_missing_progress_rows(self):
+        self.client.get("/sounds/")
+        self.client.get("/cvc-reading/")
+        self.client.get("/api/sounds/progress/")
+        self.client.get("/api/cvc-progress/")
+
+        self.assertFalse(SoundPracticeProgress.objects.filter(user=self.user).exists())
+        self.assertFalse(CVCReadingProgress.objects.filter(user=self.user).exists())
+
+    def test_stale_compatibility_group_is_left_for_subscription_events(self):
+        stale_group = Group.objects.create(name="VIP")
+        self.user.groups.add(stale_group)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/")
+
+        self.assertEqual(write_queries(queries.captured_queries), [])
+        self.assertTrue(self.user.groups.filter(name="VIP").exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            grant_active_subscription(self.user, PLAN_VIP)
+
+        self.assertFalse(self.user.groups.filter(name="VIP").exists())
+        self.assertTrue(self.user.groups.filter(name="Diamond").exists())
+
+    def test_sync_command_applies_compatibility_state(self):
+        profile = self.user.student_profile
+        profile.is_premium = False
+        profile.save(update_fields=["is_premium", "updated_at"])
+
+        output = StringIO()
+        call_command("sync_subscription_compatibility", stdout=output)
+
+        profile.refresh_from_db()
+        self.assertTrue(profile.is_premium)
+        self.assertTrue(profile.is_vip)
+        self.assertIn("1 user(s)", output.getvalue())
+
+    def test_deleting_a_subscribed_user_skips_compatibility_sync(self):
+        user_id = self.user.pk
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.user.delete()
+
+        self.assertTrue(callbacks)
+        self.assertFalse(User.objects.filter(pk=user_id).exists())
+        self.assertFalse(StudentProfile.objects.filter(user_id=user_id).exists())
+        self.assertFalse(User.groups.through.objects.filter(user_id=user_id).exists())
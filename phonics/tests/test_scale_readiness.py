@@ -38,7 +38,34 @@ class ScaleReadinessMiddlewareTests(TestCase):
         response = self.client.get("/")
 
         self.assertIn("Server-Timing", response)
-        self.assertRegex(response["Server-Timing"], r"^app;dur=\d+(\.\d+)?$")
+        self.assertRegex(
+            response["Server-Timing"],
+            r"^app;dur=\d+\.\d, db;dur=\d+\.\d;desc=\d+, cache;dur=\d+\.\d, tmpl;dur=\d+\.\d$",
+        )
+
+    @override_settings(ENABLE_SERVER_TIMING_HEADER=False, SERVER_TIMING_SAMPLE_RATE=0.0)
+    def test_server_timing_is_sent_to_staff_and_sampled_requests_only(self):
+        self.assertNotIn("Server-Timing", self.client.get("/"))
+
+        with override_settings(SERVER_TIMING_SAMPLE_RATE=1.0):
+            self.assertIn("Server-Timing", self.client.get("/"))
+
+        staff = User.objects.create_user(username="timing-staff", password="StrongPass123!", is_staff=True)
+        self.client.force_login(staff)
+        timing = self.client.get("/profile/")["Server-Timing"]
+
+        queries = int(re.search(r"db;dur=[\d.]+;desc=(\d+)", timing).group(1))
+        self.assertGreater(queries, 0)
+        self.assertGreater(float(re.search(r"tmpl;dur=([\d.]+)", timing).group(1)), 0)
+
+    @override_settings(REQUEST_LOG_ENABLED=True)
+    def test_request_log_carries_component_timings(self):
+        with self.assertLogs("abcz.requests", level="INFO") as logs:
+            self.client.get("/")
+
+        record = logs.records[-1]
+        for field in ("db_queries", "db_ms", "cache_ms", "tmpl_ms", "pdf_ms"):
+            self.assertTrue(hasattr(record, field), field)
 
 
 @override_settings(DISABLE_AUTO_SEED=True, SECURE_SSL_REDIRECT=False)
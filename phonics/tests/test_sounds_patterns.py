@@ -1,6 +1,7 @@
 from django.contrib.auth.models import User
 from django.test import TestCase, override_settings
 
+from phonics.tests.page_asset_bundle import shipped_text
 from phonics.tests.subscription_helpers import grant_active_subscription
 
 from phonics.views import (
@@ -100,14 +101,15 @@ class SoundsPatternsTests(TestCase):
         response = self.client.get("/sounds/")
 
         self.assertEqual(response.status_code, 200)
+        page = shipped_text(response)
         self.assertContains(response, "مفردات التأسيس")
         self.assertContains(response, "Foundation Vocabulary")
         self.assertContains(response, 'id="foundationVocabularyData"', html=False)
         self.assertContains(response, 'data-tab="foundation-vocabulary"', html=False)
         self.assertContains(response, 'id="vocabCategoryGrid"', html=False)
         self.assertContains(response, 'id="vocabWordGrid"', html=False)
-        self.assertContains(response, 'data-vocab-listen', html=False)
-        self.assertContains(response, 'data-vocab-mic', html=False)
+        self.assertIn('data-vocab-listen', page)
+        self.assertIn('data-vocab-mic', page)
         self.assertContains(response, "الألوان")
         self.assertContains(response, "الحيوانات")
         self.assertContains(response, "العائلة")
@@ -127,6 +129,7 @@ class SoundsPatternsTests(TestCase):
         response = self.client.get("/sounds/")
 
         self.assertEqual(response.status_code, 200)
+        page = shipped_text(response)
         self.assertContains(response, "Animals")
         self.assertContains(response, "Pets")
         self.assertContains(response, "Farm Animals")
@@ -136,17 +139,18 @@ class SoundsPatternsTests(TestCase):
         self.assertContains(response, "dolphin")
         self.assertContains(response, "bee")
         self.assertContains(response, "Animal Mini Story")
-        self.assertContains(response, "data-animal-group", html=False)
-        self.assertContains(response, "data-animal-story-answer", html=False)
-        self.assertContains(response, "mastered_animals")
-        self.assertContains(response, "animal_quiz_score")
-        self.assertContains(response, "animal_mic_success")
-        self.assertContains(response, "SpeechService.startRecognition", html=False)
+        self.assertIn("data-animal-group", page)
+        self.assertIn("data-animal-story-answer", page)
+        self.assertIn("mastered_animals", page)
+        self.assertIn("animal_quiz_score", page)
+        self.assertIn("animal_mic_success", page)
+        self.assertIn("SpeechService.startRecognition", page)
 
     def test_foods_vocabulary_category_is_enhanced(self):
         response = self.client.get("/sounds/")
 
         self.assertEqual(response.status_code, 200)
+        page = shipped_text(response)
         self.assertContains(response, "Foods")
         self.assertContains(response, "Fruits")
         self.assertContains(response, "Vegetables")
@@ -159,17 +163,18 @@ class SoundsPatternsTests(TestCase):
         self.assertContains(response, "bread")
         self.assertContains(response, "cake")
         self.assertContains(response, "Food Mini Story")
-        self.assertContains(response, "data-food-group", html=False)
-        self.assertContains(response, "data-food-story-answer", html=False)
-        self.assertContains(response, "mastered_foods")
-        self.assertContains(response, "food_quiz_score")
-        self.assertContains(response, "food_mic_success")
-        self.assertContains(response, "SpeechService.startRecognition", html=False)
+        self.assertIn("data-food-group", page)
+        self.assertIn("data-food-story-answer", page)
+        self.assertIn("mastered_foods", page)
+        self.assertIn("food_quiz_score", page)
+        self.assertIn("food_mic_success", page)
+        self.assertIn("SpeechService.startRecognition", page)
 
     def test_calendar_vocabulary_category_is_enhanced(self):
         response = self.client.get("/sounds/")
 
         self.assertEqual(response.status_code, 200)
+        page = shipped_text(response)
         self.assertContains(response, "Days & Months")
         self.assertContains(response, "Days")
         self.assertContains(response, "Months")
@@ -178,12 +183,12 @@ class SoundsPatternsTests(TestCase):
         self.assertContains(response, "January")
         self.assertContains(response, "December")
         self.assertContains(response, "Calendar Mini Story")
-        self.assertContains(response, "data-calendar-group", html=False)
-        self.assertContains(response, "data-calendar-story-answer", html=False)
-        self.assertContains(response, "mastered_calendar")
-        self.assertContains(response, "calendar_quiz_score")
-        self.assertContains(response, "calendar_mic_success")
-        self.assertContains(response, "SpeechService.startRecognition", html=False)
+        self.assertIn("data-calendar-group", page)
+        self.assertIn("data-calendar-story-answer", page)
+        self.assertIn("mastered_calendar", page)
+        self.assertIn("calendar_quiz_score", page)
+        self.assertIn("calendar_mic_success", page)
+        self.assertIn("SpeechService.startRecognition", page)
 
     def test_level_two_grammar_lessons_are_available_in_sounds(self):
         lessons = {lesson["id"]: lesson for lesson in LEVEL_TWO_GRAMMAR_LESSONS}
@@ -198,6 +203,7 @@ class SoundsPatternsTests(TestCase):
         response = self.client.get("/sounds/")
 
         self.assertEqual(response.status_code, 200)
+        page = shipped_text(response)
         self.assertContains(response, 'id="levelTwoGrammarData"', html=False)
         self.assertContains(response, 'data-tab="foundation-grammar"', html=False)
         self.assertContains(response, "قواعد المستوى الثاني")
@@ -207,9 +213,9 @@ class SoundsPatternsTests(TestCase):
         self.assertContains(response, "This is my pen.")
         self.assertContains(response, "She reads books.")
         self.assertContains(response, "Ali's bag is blue.")
-        self.assertContains(response, "data-grammar-mic", html=False)
-        self.assertContains(response, "abcz-level-two-grammar-progress-v1")
-        self.assertContains(response, "SpeechService.startRecognition", html=False)
+        self.assertIn("data-grammar-mic", page)
+        self.assertIn("abcz-level-two-grammar-progress-v1", page)
+        self.assertIn("SpeechService.startRecognition", page)
 
     def test_pattern_activities_include_listen_and_mic_practice(self):
         self.assertTrue(any(activity.get("listen") for activity in SOUND_PATTERN_ACTIVITIES))
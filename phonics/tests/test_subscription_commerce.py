@@ -478,6 +478,9 @@ class SubscriptionCommercePolicyTests(TestCase):
         self.assertEqual(summary["renew_plan_code"], PLAN_BASIC)
         self.assertEqual(quote.operation_type, PaymentOrder.OperationType.RENEWAL)
         profile.refresh_from_db()
+        self.assertTrue(profile.is_premium)
+        synchronize_user_subscription_compatibility(self.user, snapshot=at_expiry)
+        profile.refresh_from_db()
         self.assertFalse(profile.is_premium)
         self.assertEqual(subscription.pk, UserSubscription.objects.get(user=self.user, plan_code=PLAN_BASIC).pk)
 
@@ -3,6 +3,7 @@ from . import views
 
 urlpatterns = [
     path('health/', views.health, name='health'),
+    path('metrics', views.metrics_exposition, name='metrics'),
     path('', views.index, name='index'),
     path('start/', views.start, name='start'),
     path('levels/', views.levels, name='levels'),
@@ -24,6 +25,8 @@ urlpatterns = [
     path('terms/', views.terms, name='terms'),
     path('sounds/', views.sounds, name='sounds'),
     path('sounds/worksheet/', views.sounds_worksheet, name='sounds_worksheet'),
+    path('sw.js', views.service_worker, name='service_worker'),
+    path('offline-manifest.json', views.offline_asset_manifest, name='offline_manifest'),
     path('accounts/login/', views.login_view, name='login'),
     path('accounts/logout/', views.logout_view, name='logout'),
     path('accounts/register/', views.register, name='register'),
@@ -63,10 +66,12 @@ urlpatterns = [
     path('api/bird-tutor/progress/', views.bird_tutor_progress_api, name='bird_tutor_progress_api'),
     path('api/bird-tutor/review/', views.bird_tutor_review_api, name='bird_tutor_review_api'),
     path('api/sounds/progress/', views.sound_progress_api, name='sound_progress_api'),
+    path('api/progress/batch/', views.progress_batch_api, name='progress_batch_api'),
     path('api/speech/', views.speech_check, name='speech_check'),
     path('certificate/<int:student_id>/', views.generate_certificate, name='generate_certificate'),
     path('leaderboard/', views.leaderboard, name='leaderboard'),
     path('api/leaderboard/', views.leaderboard_api, name='leaderboard_api'),
+    path('api/leaderboard/me/', views.leaderboard_rank_api, name='leaderboard_rank_api'),
     path('api/letter-data/<str:letter>/', views.letter_data_api, name='letter_data_api'),
     path('letters/<str:letter>/external-games/', views.external_games_by_letter, name='external_games_by_letter'),
     path('letters/worksheet/', views.letters_mastery_worksheet, name='letters_mastery_worksheet'),
@@ -79,6 +84,7 @@ urlpatterns = [
     path('api/cvc-words/', views.get_cvc_words_api, name='api_get_cvc_words'),
     path('api/cvc-sentences/', views.get_cvc_sentences_api, name='api_get_cvc_sentences'),
     path('api/cvc-stories/', views.get_cvc_stories_api, name='api_get_cvc_stories'),
+    path('api/cvc-corpus.ndjson', views.cvc_corpus_export_api, name='api_cvc_corpus_export'),
     path('api/save-cvc-progress/', views.save_cvc_progress_api, name='api_save_cvc_progress'),
     path('api/cvc-progress/', views.cvc_reading_progress_api, name='api_cvc_reading_progress'),
     path('api/check-cvc-pronunciation/', views.check_cvc_pronunciation, name='api_check_cvc_pronunciation'),
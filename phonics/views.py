@@ -8,6 +8,7 @@ Phonics App Views - SECURED & OPTIMIZED (SAFE VERSION)
 
 from __future__ import annotations
 
+import base64
 import json
 import hashlib
 import logging
@@ -15,11 +16,11 @@ import math
 import re
 import uuid
 import secrets
-from functools import lru_cache
 from io import BytesIO
 from decimal import Decimal, InvalidOperation
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Callable, NamedTuple
 from xml.sax.saxutils import escape
 from zipfile import ZIP_DEFLATED, ZipFile
 
@@ -30,10 +31,10 @@ from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.management import call_command
 from django.db import IntegrityError, models, transaction
-from django.db.models import Count, F, Max, Q, Sum
-from django.http import Http404, HttpResponse, JsonResponse
+from django.db.models import F, Q
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django.template.loader import get_template
+from django.template.loader import get_template, render_to_string
 from django.urls import reverse
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils import timezone
@@ -47,7 +48,6 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.utils import ImageReader
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
-from xhtml2pdf import pisa
 
 from .forms import SecureAuthenticationForm, StudentProfileForm, StudentRegistrationForm
 from .models import (
@@ -70,12 +70,52 @@ from .models import (
     BankTransferProof,
     activate_subscription_from_payment,
 )
+from .artifacts import ArtifactSpec, register_artifact
 from .cache_helpers import (
     get_cached_static_value,
+    get_or_compute,
     safe_cache_get,
     safe_cache_set,
 )
+from .counters import increment_counters
+from .cvc_progress import (
+    ContentTotals as CVCContentTotals,
+    fold_cvc_events,
+    parse_cvc_event,
+)
+from .leaderboard import (
+    build_achievement,
+    normalize_leaderboard_grade,
+    refresh_user_entry as refresh_leaderboard_entry,
+    top_entries as top_leaderboard_entries,
+    user_rank_context,
+)
+from .certificates import render_certificate
+from .compression import share_compressed
+from .document_jobs import (
+    artifact_job_response,
+    enqueue as enqueue_document_job,
+    file_response,
+    is_poll,
+    job_response,
+    register_job,
+    store_result,
+)
+from .emoji_atlas import load_atlas as load_emoji_atlas
+from .conditional import not_modified, progress_etag, progress_not_modified, strong_etag, with_etag
+from . import metrics
+from .json_bundles import bundle_json, register_bundle
 from .middleware import get_current_request
+from .offline import offline_manifest, service_worker_config
+from .page_fragments import fragment_context
+from .progress_batch import (
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    MAX_BATCH_EVENTS,
+    LockedRows,
+    find_receipt,
+    payload_digest,
+    store_receipt,
+)
 from .security import client_ip, login_identity, rate_limit
 from .payments.moyasar import (
     MoyasarAPIError,
@@ -108,11 +148,11 @@ from .plans import (
 )
 from .subscriptions import (
     PurchaseNotAllowed,
+    get_entitlement_summary,
     get_user_entitlements,
     purchase_options_for_user,
     quote_plan_purchase,
     subscription_dashboard_context,
-    synchronize_user_subscription_compatibility,
 )
 
 
@@ -122,6 +162,7 @@ payment_logger = logging.getLogger("abcz.payments.moyasar")
 
 LEADERBOARD_CACHE_TIMEOUT = 60
 LEADERBOARD_LIMIT = 100
+LEADERBOARD_RANK_RADIUS = 2
 CVC_API_DEFAULT_PAGE_SIZE = 100
 CVC_API_MAX_PAGE_SIZE = 100
 CVC_WORKSHEET_WORD_LIMIT = 120
@@ -130,6 +171,7 @@ CVC_WORKSHEET_STORY_LIMIT = 20
 CVC_CONTENT_CACHE_VERSION = "v1"
 CVC_COUNT_CACHE_TIMEOUT = 300
 CVC_SEED_CHECK_CACHE_TIMEOUT = 300
+CVC_EXPORT_CHUNK_SIZE = 500
 
 
 # ============================================
@@ -200,6 +242,22 @@ def health(request):
     })
 
 
+@never_cache
+@require_GET
+def metrics_exposition(request):
+    """Prometheus scrape target; needs ``Authorization: Bearer <METRICS_TOKEN>`` or a staff session."""
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    token_ok = bool(settings.METRICS_TOKEN) and secrets.compare_digest(
+        supplied.encode(), settings.METRICS_TOKEN.encode()
+    )
+    if not (token_ok or request.user.is_staff):
+        raise Http404("Not found")
+    return HttpResponse(
+        metrics.render_prometheus(metrics.registry.totals()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 def parse_json_safely(request):
     """
     Parse JSON request body safely.
@@ -405,48 +463,35 @@ def upgrade_message_for_feature(feature_key, fallback_message):
     return fallback_message
 
 
+def get_request_entitlements(user):
+    request = get_current_request()
+    if (
+        request is not None
+        and hasattr(request, "entitlements")
+        and getattr(getattr(request, "user", None), "pk", None) == getattr(user, "pk", None)
+    ):
+        return request.entitlements
+    return get_entitlement_summary(user)
+
+
 def get_active_subscription_plan_codes(user):
     if not user.is_authenticated:
         return set()
-
-    cache = get_request_feature_cache(user)
-    if cache is not None and "active_plan_codes" in cache:
-        return cache["active_plan_codes"]
-
-    active_plan_codes = set(get_user_entitlements(user).plan_codes)
-    if cache is not None:
-        cache["active_plan_codes"] = active_plan_codes
-    return active_plan_codes
+    return set(get_request_entitlements(user).plan_codes)
 
 
 def get_subscription_plan(user):
     if not user.is_authenticated:
         return PLAN_FREE
-
-    cache = get_request_feature_cache(user)
-    if cache is not None and "subscription_plan" in cache:
-        return cache["subscription_plan"]
-
-    snapshot = get_user_entitlements(user)
-    plan = snapshot.main_subscription.plan_code if snapshot.main_subscription else PLAN_FREE
-    if cache is not None:
-        cache["subscription_plan"] = plan
-    return plan
+    return get_request_entitlements(user).main_plan_code
 
 
 def get_feature_keys(user):
-    cache = get_request_feature_cache(user)
-    if cache is not None and "feature_keys" in cache:
-        return cache["feature_keys"]
-
-    feature_keys = set(get_user_entitlements(user).entitlements)
-    if cache is not None:
-        cache["feature_keys"] = feature_keys
-    return feature_keys
+    return set(get_request_entitlements(user).entitlements)
 
 
 def has_feature(user, feature_key):
-    return feature_key in get_feature_keys(user)
+    return feature_key in get_request_entitlements(user).entitlements
 
 
 def feature_unavailable_response(request, message, *, feature_key="feature_unavailable"):
@@ -1502,6 +1547,7 @@ def save_progress(request):
                 lp.passed = True
 
             lp.save(update_fields=["score", "passed"])
+            refresh_leaderboard_entry(request.user.pk)
 
         return JsonResponse({
             "status": "ok",
@@ -1515,103 +1561,166 @@ def save_progress(request):
         return _json_error("Database error", 500, request_id=getattr(request, "request_id", ""))
 
 
-@require_POST
-def save_letter_progress_api(request):
-    if not request.user.is_authenticated:
-        return _json_error("login_required", 401, detail="Please sign in to save letter progress.")
+LETTER_PROGRESS_UPDATE_FIELDS = [
+    "writing_score",
+    "words_score",
+    "quiz_score",
+    "total_score",
+    "score",
+    "completed",
+    "passed",
+    "completed_at",
+    "words_practiced_json",
+    "mistakes_json",
+]
 
-    data, error = parse_json_safely(request)
-    if error:
-        return error
 
+def parse_letter_progress_event(user, data):
     letter, error = validate_letter(data.get("letter"))
     if error:
-        return error
+        return None, error
 
-    if letter not in FREE_LEVEL_ONE_LETTERS and not is_level_one_basic_user(request.user):
-        return JsonResponse({
+    if letter not in FREE_LEVEL_ONE_LETTERS and not is_level_one_basic_user(user):
+        return None, JsonResponse({
             "error": "basic_plan_required",
             "message": "التجربة المجانية متاحة لحرفي A و B فقط.",
             "allowed_letters": sorted(FREE_LEVEL_ONE_LETTERS),
         }, status=403)
 
-    writing_score, error = validate_int(data.get("writing_score", 0), min_val=0, max_val=100, field_name="writing_score")
+    event = {"letter": letter}
+    for field_name in ("writing_score", "words_score", "quiz_score", "total_score"):
+        event[field_name], error = validate_int(data.get(field_name, 0), min_val=0, max_val=100, field_name=field_name)
+        if error:
+            return None, error
+
+    event["completed"] = bool(data.get("completed"))
+    event["words_practiced"] = safe_json_list(data.get("words_practiced"))
+    event["mistakes"] = safe_json_dict(data.get("mistakes"))
+    return event, None
+
+
+def letter_progress_row(user, event, now):
+    completed = event["completed"]
+    return LetterProgress, {"user": user, "letter": event["letter"]}, {
+        "writing_score": event["writing_score"],
+        "words_score": event["words_score"],
+        "quiz_score": event["quiz_score"],
+        "total_score": event["total_score"],
+        "score": event["total_score"],
+        "completed": completed,
+        "passed": completed,
+        "completed_at": now if completed else None,
+        "words_practiced_json": event["words_practiced"],
+        "mistakes_json": event["mistakes"],
+    }
+
+
+def apply_letter_progress_event(progress, created, event, now):
+    """Returns ``(changed_fields, finish)``; ``finish()`` builds the response once the row is saved."""
+    def finish():
+        return {"created": created, "progress": serialize_letter_progress(progress)}
+
+    if created:
+        return [], finish
+
+    completed = event["completed"]
+    progress.writing_score = event["writing_score"]
+    progress.words_score = event["words_score"]
+    progress.quiz_score = event["quiz_score"]
+    progress.total_score = event["total_score"]
+    progress.score = event["total_score"]
+    progress.completed = completed
+    progress.passed = completed
+    progress.words_practiced_json = event["words_practiced"]
+    progress.mistakes_json = event["mistakes"]
+    if completed and not progress.completed_at:
+        progress.completed_at = now
+    if not completed:
+        progress.completed_at = None
+    return LETTER_PROGRESS_UPDATE_FIELDS, finish
+
+
+def apply_single_progress_event(user, handler, event):
+    """Lock, update and save the one row behind a per-interaction progress endpoint."""
+    now = timezone.now()
+    with transaction.atomic():
+        rows = LockedRows()
+        model, lookup, defaults = handler.row(user, event, now)
+        instance, created = rows.lock(model, lookup, defaults)
+        fields, finish = handler.apply(instance, created, event, now)
+        rows.mark_dirty(instance, fields)
+        saved = rows.flush()
+        if handler.scored and (saved or created):
+            refresh_leaderboard_entry(user.pk)
+    return finish()
+
+
+@require_POST
+def save_letter_progress_api(request):
+    if not request.user.is_authenticated:
+        return _json_error("login_required", 401, detail="Please sign in to save letter progress.")
+
+    data, error = parse_json_safely(request)
     if error:
         return error
 
-    words_score, error = validate_int(data.get("words_score", 0), min_val=0, max_val=100, field_name="words_score")
+    event, error = parse_letter_progress_event(request.user, data)
     if error:
         return error
 
-    quiz_score, error = validate_int(data.get("quiz_score", 0), min_val=0, max_val=100, field_name="quiz_score")
+    try:
+        result = apply_single_progress_event(request.user, PROGRESS_EVENT_HANDLERS["letter"], event)
+        return JsonResponse({"status": "ok", **result})
+    except Exception:
+        logger.exception("account_letter_progress_save_failed request_id=%s", getattr(request, "request_id", ""))
+        return _json_error("Failed to save letter progress", 500, request_id=getattr(request, "request_id", ""))
+
+
+def parse_bird_tutor_event(user, data):
+    xp_delta, error = validate_int(data.get("xp_delta", 0), min_val=0, max_val=100, field_name="xp_delta")
     if error:
-        return error
+        return None, error
 
-    total_score, error = validate_int(data.get("total_score", 0), min_val=0, max_val=100, field_name="total_score")
+    letter, error = validate_letter(data.get("letter"))
     if error:
-        return error
+        return None, error
 
-    completed = bool(data.get("completed"))
-    words_practiced = safe_json_list(data.get("words_practiced"))
-    mistakes = safe_json_dict(data.get("mistakes"))
-    now = timezone.now()
+    word = normalize_bird_word(data.get("word"))
+    if not word:
+        return None, _json_error("word is required", 400)
 
-    try:
-        with transaction.atomic():
-            progress, created = LetterProgress.objects.select_for_update().get_or_create(
-                user=request.user,
-                letter=letter,
-                defaults={
-                    "writing_score": writing_score,
-                    "words_score": words_score,
-                    "quiz_score": quiz_score,
-                    "total_score": total_score,
-                    "score": total_score,
-                    "completed": completed,
-                    "passed": completed,
-                    "completed_at": now if completed else None,
-                    "words_practiced_json": words_practiced,
-                    "mistakes_json": mistakes,
-                },
-            )
+    return {
+        "xp_delta": xp_delta,
+        "question_type": (data.get("question_type") or "").strip()[:40],
+        "is_correct": bool(data.get("is_correct")),
+        "letter": letter,
+        "word": word,
+    }, None
 
-            if not created:
-                progress.writing_score = writing_score
-                progress.words_score = words_score
-                progress.quiz_score = quiz_score
-                progress.total_score = total_score
-                progress.score = total_score
-                progress.completed = completed
-                progress.passed = completed
-                progress.words_practiced_json = words_practiced
-                progress.mistakes_json = mistakes
-                if completed and not progress.completed_at:
-                    progress.completed_at = now
-                if not completed:
-                    progress.completed_at = None
-                progress.save(update_fields=[
-                    "writing_score",
-                    "words_score",
-                    "quiz_score",
-                    "total_score",
-                    "score",
-                    "completed",
-                    "passed",
-                    "completed_at",
-                    "words_practiced_json",
-                    "mistakes_json",
-                    "timestamp",
-                    "last_updated_at",
-                ])
 
-        return JsonResponse({
-            "status": "ok",
-            "created": created,
-            "progress": serialize_letter_progress(progress),
-        })
-    except Exception:
-        logger.exception("account_letter_progress_save_failed request_id=%s", getattr(request, "request_id", ""))
-        return _json_error("Failed to save letter progress", 500, request_id=getattr(request, "request_id", ""))
+def bird_tutor_row(user, event, now):
+    return BirdTutorProgress, {"user": user}, None
+
+
+def apply_bird_tutor_event(progress, created, event, now):
+    # Batches hold the row lock for the whole transaction, so plain increments cannot lose updates.
+    progress.xp += event["xp_delta"]
+    progress.total_questions += 1
+    if event["is_correct"]:
+        progress.correct_answers += 1
+    else:
+        progress.wrong_answers += 1
+    progress.last_used_at = now
+    snapshot = {
+        "progress": {
+            "xp": progress.xp,
+            "total_questions": progress.total_questions,
+            "correct_answers": progress.correct_answers,
+            "wrong_answers": progress.wrong_answers,
+            "last_used_at": now.isoformat(),
+        },
+    }
+    return ["xp", "total_questions", "correct_answers", "wrong_answers", "last_used_at"], lambda: snapshot
 
 
 @login_required
@@ -1625,57 +1734,74 @@ def bird_tutor_progress_api(request):
     if error:
         return error
 
-    xp_delta, error = validate_int(data.get("xp_delta", 0), min_val=0, max_val=100, field_name="xp_delta")
-    if error:
-        return error
-
-    question_type = (data.get("question_type") or "").strip()[:40]
-    is_correct = bool(data.get("is_correct"))
-    letter, error = validate_letter(data.get("letter"))
+    event, error = parse_bird_tutor_event(request.user, data)
     if error:
         return error
 
-    word = normalize_bird_word(data.get("word"))
-    if not word:
-        return _json_error("word is required", 400)
-
     now = timezone.now()
-
     try:
         with transaction.atomic():
-            progress, _ = BirdTutorProgress.objects.select_for_update().get_or_create(user=request.user)
-            progress.xp = F("xp") + xp_delta
-            progress.total_questions = F("total_questions") + 1
-            if is_correct:
-                progress.correct_answers = F("correct_answers") + 1
-            else:
-                progress.wrong_answers = F("wrong_answers") + 1
-            progress.last_used_at = now
-            progress.save(update_fields=[
-                "xp",
-                "total_questions",
-                "correct_answers",
-                "wrong_answers",
-                "last_used_at",
-                "updated_at",
-            ])
-            progress.refresh_from_db()
+            progress, _ = increment_counters(
+                BirdTutorProgress,
+                {"user": request.user},
+                {
+                    "xp": event["xp_delta"],
+                    "total_questions": 1,
+                    "correct_answers": int(event["is_correct"]),
+                    "wrong_answers": int(not event["is_correct"]),
+                },
+                values={"last_used_at": now},
+            )
+            refresh_leaderboard_entry(request.user.pk)
 
         return JsonResponse({
             "status": "ok",
-            "progress": {
-                "xp": progress.xp,
-                "total_questions": progress.total_questions,
-                "correct_answers": progress.correct_answers,
-                "wrong_answers": progress.wrong_answers,
-                "last_used_at": progress.last_used_at.isoformat() if progress.last_used_at else None,
-            },
+            "progress": {**progress, "last_used_at": now.isoformat()},
         })
     except Exception:
         logger.exception("bird_tutor_progress_save_failed request_id=%s", getattr(request, "request_id", ""))
         return _json_error("Failed to save bird tutor progress", 500, request_id=getattr(request, "request_id", ""))
 
 
+def parse_bird_review_event(user, data):
+    letter, error = validate_letter(data.get("letter"))
+    if error:
+        return None, error
+
+    word = normalize_bird_word(data.get("word"))
+    if not word:
+        return None, _json_error("word is required", 400)
+
+    return {
+        "letter": letter,
+        "word": word,
+        "question_type": (data.get("question_type") or "").strip()[:40],
+        "is_correct": bool(data.get("is_correct")),
+    }, None
+
+
+def bird_review_row(user, event, now):
+    lookup = {"user": user, "letter": event["letter"], "word": event["word"]}
+    return BirdReviewItem, lookup, {"question_type": event["question_type"]}
+
+
+def apply_bird_review_event(item, created, event, now):
+    if event["question_type"]:
+        item.question_type = event["question_type"]
+
+    if event["is_correct"]:
+        item.success_count += 1
+        if item.success_count >= 2:
+            item.mastered = True
+    else:
+        item.mistakes_count += 1
+        item.mastered = False
+
+    item.last_reviewed_at = now
+    fields = ["question_type", "mistakes_count", "success_count", "mastered", "last_reviewed_at"]
+    return fields, lambda: {"item": serialize_bird_review_item(item)}
+
+
 @login_required
 @require_http_methods(["GET", "POST"])
 def bird_tutor_review_api(request):
@@ -1695,49 +1821,13 @@ def bird_tutor_review_api(request):
     if error:
         return error
 
-    letter, error = validate_letter(data.get("letter"))
+    event, error = parse_bird_review_event(request.user, data)
     if error:
         return error
 
-    word = normalize_bird_word(data.get("word"))
-    if not word:
-        return _json_error("word is required", 400)
-
-    question_type = (data.get("question_type") or "").strip()[:40]
-    is_correct = bool(data.get("is_correct"))
-    now = timezone.now()
-
     try:
-        with transaction.atomic():
-            item, _ = BirdReviewItem.objects.select_for_update().get_or_create(
-                user=request.user,
-                letter=letter,
-                word=word,
-                defaults={"question_type": question_type},
-            )
-
-            if question_type:
-                item.question_type = question_type
-
-            if is_correct:
-                item.success_count += 1
-                if item.success_count >= 2:
-                    item.mastered = True
-            else:
-                item.mistakes_count += 1
-                item.mastered = False
-
-            item.last_reviewed_at = now
-            item.save(update_fields=[
-                "question_type",
-                "mistakes_count",
-                "success_count",
-                "mastered",
-                "last_reviewed_at",
-                "updated_at",
-            ])
-
-        return JsonResponse({"status": "ok", "item": serialize_bird_review_item(item)})
+        result = apply_single_progress_event(request.user, PROGRESS_EVENT_HANDLERS["bird_review"], event)
+        return JsonResponse({"status": "ok", **result})
     except Exception:
         logger.exception("bird_review_update_failed request_id=%s", getattr(request, "request_id", ""))
         return _json_error("Failed to update bird tutor review item", 500, request_id=getattr(request, "request_id", ""))
@@ -1784,27 +1874,22 @@ def generate_certificate(request, student_id):
                 "required": 26
             }, status=400)
 
-        template = get_template("phonics/certificate_template.html")
         total_score = (LetterProgress.objects.filter(student=student)
                        .aggregate(models.Sum("score"))["score__sum"]) or 0
-
-        html = template.render({
+        job = enqueue_document_job("certificate", {
+            "student_id": student.id,
             "name": student.name,
-            "date": datetime.now().date(),
+            "date": datetime.now().date().isoformat(),
             "total_score": total_score,
-        })
+        }, restart_failed=not is_poll(request))
 
-        response = HttpResponse(content_type="application/pdf")
-        # ط¥ط°ط§ ظ…ط§ طھط¨ظٹظ† طھط­ظ…ظٹظ„ ظ…ط¨ط§ط´ط±طŒ ط´ظٹظ„ظٹ Content-Disposition
-        response["Content-Disposition"] = f'attachment; filename="certificate_{student.name}.pdf"'
+        def serve(job):
+            response = file_response(job, f"certificate_{student.name}.pdf", "application/pdf")
+            response["Cache-Control"] = "private, no-store"
+            response["Pragma"] = "no-cache"
+            return response
 
-        pisa_status = pisa.CreatePDF(html, dest=response)
-        if pisa_status.err:
-            return _json_error("PDF generation failed", 500)
-
-        response["Cache-Control"] = "private, no-store"
-        response["Pragma"] = "no-cache"
-        return response
+        return job_response(request, job, serve)
 
     except Http404:
         raise
@@ -1813,6 +1898,18 @@ def generate_certificate(request, student_id):
         return _json_error("Certificate generation failed", 500, request_id=getattr(request, "request_id", ""))
 
 
+def build_certificate_pdf(job):
+    pdf_bytes = render_certificate(
+        job.params["name"],
+        datetime.fromisoformat(job.params["date"]).date(),
+        job.params["total_score"],
+    )
+    return store_result(job, pdf_bytes, ".pdf")
+
+
+register_job("certificate", build_certificate_pdf)
+
+
 # ============================================
 # GENERAL PAGES
 # ============================================
@@ -1944,31 +2041,26 @@ def english_foundation_progress_api(request):
         return error
     completed = bool(data.get("completed")) or activity_type == "complete"
 
-    progress, _ = EnglishFoundationProgress.objects.get_or_create(
-        user=request.user,
-        section=section,
-    )
-    progress.points += points
-    progress.actions_count += 1
-    progress.completed = progress.completed or completed
-    progress.last_activity_type = activity_type
-    progress.last_activity_at = timezone.now()
-    progress.save(update_fields=[
-        "points",
-        "actions_count",
-        "completed",
-        "last_activity_type",
-        "last_activity_at",
-        "updated_at",
-    ])
+    values = {"last_activity_type": activity_type, "last_activity_at": timezone.now()}
+    if completed:
+        values["completed"] = True
+    with transaction.atomic():
+        progress, _ = increment_counters(
+            EnglishFoundationProgress,
+            {"user": request.user, "section": section},
+            {"points": points, "actions_count": 1},
+            values=values,
+            returning=["points", "actions_count", "completed"],
+        )
+        refresh_leaderboard_entry(request.user.pk)
 
     return JsonResponse({
         "authenticated": True,
         "status": "ok",
         "section": section,
-        "points": progress.points,
-        "actions_count": progress.actions_count,
-        "completed": progress.completed,
+        "points": progress["points"],
+        "actions_count": progress["actions_count"],
+        "completed": progress["completed"],
     })
 
 
@@ -2271,39 +2363,31 @@ def letters_book_emoji_font_path():
     return None
 
 
-@lru_cache(maxsize=128)
-def letters_book_emoji_image(emoji):
-    emoji = str(emoji or "").strip()
-    if not emoji:
+def letters_book_emoji_atlas(letters, root=None):
+    """The sprite atlas of every emoji in ``letters``, or None when no emoji font is installed."""
+    font_path = letters_book_emoji_font_path()
+    if not font_path:
         return None
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        return load_emoji_atlas(
+            (word.get("emoji") for item in letters for word in item.get("words") or []),
+            font_path,
+            root,
+        )
     except Exception:
+        logger.warning("emoji_atlas_load_failed font=%s", font_path, exc_info=True)
         return None
 
-    font_path = letters_book_emoji_font_path()
-    if not font_path:
-        return None
 
-    try:
-        image = Image.new("RGBA", (120, 120), (255, 255, 255, 0))
-        draw = ImageDraw.Draw(image)
-        font = ImageFont.truetype(str(font_path), 72)
-        bbox = draw.textbbox((0, 0), emoji, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (120 - text_width) / 2 - bbox[0]
-        y = (120 - text_height) / 2 - bbox[1] - 2
-        draw.text((x, y), emoji, font=font, fill=(30, 41, 59, 255))
-        output = BytesIO()
-        image.save(output, format="PNG")
-        output.seek(0)
-        return ImageReader(output)
-    except Exception:
+def letters_book_emoji_image(atlas, emoji):
+    emoji = str(emoji or "").strip()
+    if not emoji or atlas is None:
         return None
+    image = atlas.image(emoji)
+    return ImageReader(image) if image is not None else None
 
 
-def draw_letters_book_pdf(letters):
+def draw_letters_book_pdf(letters, root=None):
     buffer = BytesIO()
     pdf = canvas.Canvas(buffer, pagesize=A4)
     width, height = A4
@@ -2315,6 +2399,7 @@ def draw_letters_book_pdf(letters):
     soft_blue = colors.HexColor("#f0f9ff")
     soft_pink = colors.HexColor("#fff0f5")
     soft_gray = colors.HexColor("#f8fafc")
+    atlas = letters_book_emoji_atlas(letters, root)
 
     def header(letter):
         pdf.setStrokeColor(blue)
@@ -2340,7 +2425,7 @@ def draw_letters_book_pdf(letters):
         pdf.setStrokeColor(line)
         pdf.setFillColor(colors.white)
         pdf.roundRect(x, y, size, size, 6 * mm, stroke=1, fill=1)
-        image = letters_book_emoji_image(word.get("emoji"))
+        image = letters_book_emoji_image(atlas, word.get("emoji"))
         if image:
             pdf.drawImage(
                 image,
@@ -2368,7 +2453,7 @@ def draw_letters_book_pdf(letters):
         pdf.setStrokeColor(line)
         pdf.setFillColor(soft_gray)
         pdf.roundRect(x, y, 74 * mm, 13 * mm, 4 * mm, stroke=1, fill=1)
-        image = letters_book_emoji_image(word.get("emoji"))
+        image = letters_book_emoji_image(atlas, word.get("emoji"))
         if image:
             pdf.drawImage(image, x + 3 * mm, y + 3 * mm, width=7 * mm, height=7 * mm, mask="auto")
             word_x = x + 13 * mm
@@ -2678,6 +2763,23 @@ def build_letters_book_docx(letters):
     return buffer.getvalue()
 
 
+register_artifact(ArtifactSpec(
+    "letters_book_pdf",
+    "english_letters_worksheets_book.pdf",
+    "application/pdf",
+    # The emoji font decides how the picture glyphs render, so it is part of the content version.
+    inputs=lambda: {"letters": letter_worksheet_book_items(), "emoji_font": str(letters_book_emoji_font_path() or "")},
+    build=lambda inputs, root: draw_letters_book_pdf(inputs["letters"], root),
+))
+register_artifact(ArtifactSpec(
+    "letters_book_docx",
+    "english_letters_worksheets_book.docx",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    inputs=letter_worksheet_book_items,
+    build=lambda inputs, root: build_letters_book_docx(inputs),
+))
+
+
 @ensure_csrf_cookie
 @require_GET
 def letters_worksheets_book_pdf(request):
@@ -2685,10 +2787,7 @@ def letters_worksheets_book_pdf(request):
     if blocked:
         return blocked
 
-    pdf_bytes = draw_letters_book_pdf(letter_worksheet_book_items())
-    response = HttpResponse(pdf_bytes, content_type="application/pdf")
-    response["Content-Disposition"] = 'attachment; filename="english_letters_worksheets_book.pdf"'
-    return response
+    return artifact_job_response(request, "letters_book_pdf")
 
 
 @ensure_csrf_cookie
@@ -2698,13 +2797,7 @@ def letters_worksheets_book_word(request):
     if blocked:
         return blocked
 
-    docx_bytes = build_letters_book_docx(letter_worksheet_book_items())
-    response = HttpResponse(
-        docx_bytes,
-        content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    )
-    response["Content-Disposition"] = 'attachment; filename="english_letters_worksheets_book.docx"'
-    return response
+    return artifact_job_response(request, "letters_book_docx")
 
 
 @ensure_csrf_cookie
@@ -2829,7 +2922,12 @@ def render_level_four_page(request, section_mode, **extra):
     if blocked:
         return blocked
 
-    context = {"section_mode": section_mode, **extra}
+    worksheet = extra.get("worksheet")
+    context = {
+        "section_mode": section_mode,
+        **extra,
+        **fragment_context("level_four", section_mode=section_mode, worksheet=worksheet["slug"] if worksheet else ""),
+    }
     return render(request, "level_four.html", context)
 
 
@@ -2897,7 +2995,6 @@ def common_sentences_worksheet(request):
 @login_required
 @require_GET
 def profile_dashboard(request):
-    synchronize_user_subscription_compatibility(request.user)
     subscription_summary = subscription_dashboard_context(request.user)
     profile = get_or_create_student_profile(request.user)
     profile.is_vip = has_feature(request.user, "parent_report_detailed")
@@ -3059,18 +3156,26 @@ def index(request):
     is_developer_vip_preview = False
     is_vip_user = has_feature(request.user, "bird_tutor")
     level_one_plan = get_subscription_plan(request.user)
+    disabled_features = level_one_disabled_features(request.user)
 
     return render(request, "letters.html", {
         "is_authenticated": request.user.is_authenticated,
         "is_premium_user": has_feature(request.user, "letters_full"),
         "is_vip_user": is_vip_user,
         "level_one_plan": level_one_plan,
-        "level_one_disabled_features": level_one_disabled_features(request.user),
+        "level_one_disabled_features": disabled_features,
         "is_developer_vip_preview": is_developer_vip_preview,
         "phonics_user_id": str(request.user.id) if request.user.is_authenticated else "",
         "phonics_user_email": request.user.email if request.user.is_authenticated else "",
         "student_profile_json": json.dumps(profile_payload, ensure_ascii=False),
         "bird_lottie_files_json": json.dumps(get_existing_bird_lottie_files(), ensure_ascii=False),
+        **fragment_context(
+            "letters",
+            level_one_disabled_features=disabled_features,
+            is_vip_user=is_vip_user,
+            is_developer_vip_preview=is_developer_vip_preview,
+            google_login_enabled=settings.GOOGLE_LOGIN_ENABLED,
+        ),
     })
 
 
@@ -6250,10 +6355,9 @@ def placement_test(request):
 
         return JsonResponse(score_placement_test(answers))
 
-    questions = public_placement_questions()
     return render(request, "placement_test.html", {
-        "questions": questions,
-        "questions_json": json.dumps(questions, ensure_ascii=False),
+        "questions": public_placement_questions(),
+        "questions_json": bundle_json("placement_questions"),
     })
 
 
@@ -6352,6 +6456,49 @@ def terms(request):
     return render(request, "terms.html")
 
 
+# Context names are "<bundle>_json"; each bundle is serialized once per process.
+SOUNDS_PAGE_BUNDLES = {
+    "syllable_rows": lambda: SOUND_SYLLABLE_ROWS,
+    "cvc_words": lambda: SOUND_CVC_WORDS,
+    "quiz_questions": lambda: SOUND_QUIZ_QUESTIONS,
+    "vowel_lessons": lambda: VOWEL_LESSONS,
+    "vowel_activities": lambda: VOWEL_ACTIVITIES,
+    "sound_pattern_groups": lambda: SOUND_PATTERN_GROUPS,
+    "sound_pattern_activities": lambda: SOUND_PATTERN_ACTIVITIES,
+    "foundation_vocabulary": lambda: FOUNDATION_VOCABULARY_CATEGORIES,
+    "level_two_grammar": lambda: LEVEL_TWO_GRAMMAR_LESSONS,
+}
+for _bundle_name, _bundle_provider in SOUNDS_PAGE_BUNDLES.items():
+    register_bundle(_bundle_name, _bundle_provider)
+register_bundle("placement_questions", public_placement_questions)
+
+
+def current_offline_manifest():
+    return offline_manifest(
+        extra_assets=get_existing_bird_lottie_files().values(),
+        content_version=CVC_CONTENT_CACHE_VERSION,
+    )
+
+
+@require_GET
+def offline_asset_manifest(request):
+    response = JsonResponse(current_offline_manifest())
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+@require_GET
+def service_worker(request):
+    """The offline worker, regenerated whenever the asset manifest version changes."""
+    config = service_worker_config(current_offline_manifest()["version"])
+    response = HttpResponse(
+        render_to_string("phonics/service_worker.js", {"config_json": json.dumps(config)}),
+        content_type="application/javascript; charset=utf-8",
+    )
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
 @ensure_csrf_cookie
 @require_GET
 def sounds(request):
@@ -6362,8 +6509,8 @@ def sounds(request):
     progress = None
     profile = None
     if request.user.is_authenticated:
-        progress, _ = SoundPracticeProgress.objects.get_or_create(user=request.user)
-        profile = get_or_create_student_profile(request.user)
+        progress = SoundPracticeProgress.objects.filter(user=request.user).first()
+        profile = StudentProfile.objects.filter(user=request.user).first()
 
     progress_payload = {
         "completed_items": progress.completed_items if progress else [],
@@ -6385,21 +6532,17 @@ def sounds(request):
     }
 
     return render(request, "sounds.html", {
-        "syllable_rows_json": json.dumps(SOUND_SYLLABLE_ROWS, ensure_ascii=False),
-        "cvc_words_json": json.dumps(SOUND_CVC_WORDS, ensure_ascii=False),
-        "quiz_questions_json": json.dumps(SOUND_QUIZ_QUESTIONS, ensure_ascii=False),
-        "vowel_lessons_json": json.dumps(VOWEL_LESSONS, ensure_ascii=False),
-        "vowel_activities_json": json.dumps(VOWEL_ACTIVITIES, ensure_ascii=False),
-        "sound_pattern_groups_json": json.dumps(SOUND_PATTERN_GROUPS, ensure_ascii=False),
-        "sound_pattern_activities_json": json.dumps(SOUND_PATTERN_ACTIVITIES, ensure_ascii=False),
-        "foundation_vocabulary_json": json.dumps(FOUNDATION_VOCABULARY_CATEGORIES, ensure_ascii=False),
-        "level_two_grammar_json": json.dumps(LEVEL_TWO_GRAMMAR_LESSONS, ensure_ascii=False),
+        **{f"{name}_json": bundle_json(name) for name in SOUNDS_PAGE_BUNDLES},
         "sound_progress_json": json.dumps(progress_payload, ensure_ascii=False),
         "student_display_name": (
-            (profile.display_name or profile.student_name or request.user.username)
-            if profile and request.user.is_authenticated
+            (
+                (profile.display_name or profile.student_name if profile else "")
+                or request.user.username
+            )
+            if request.user.is_authenticated
             else ""
         ),
+        **fragment_context("sounds"),
     })
 
 
@@ -6426,6 +6569,113 @@ def sounds_worksheet(request):
     })
 
 
+SOUND_PROGRESS_TRACKED_FIELDS = [
+    "completed_items",
+    "quiz_attempts",
+    "quiz_correct",
+    "mic_attempts",
+    "mic_success",
+    "worksheet_downloads",
+    "last_item",
+    "last_payload",
+    "vowel_lessons_completed",
+    "practiced_vowels",
+    "vowel_quiz_attempts",
+    "vowel_quiz_correct",
+    "vowel_microphone_attempts",
+    "vowel_microphone_success",
+    "last_vowel_practiced",
+    "vowel_mastery_percentage",
+]
+# Counters only ever move forward: the stored value is the max of stored and incoming.
+SOUND_PROGRESS_COUNTERS = [
+    "quiz_attempts",
+    "quiz_correct",
+    "mic_attempts",
+    "mic_success",
+    "worksheet_downloads",
+    "vowel_lessons_completed",
+    "vowel_quiz_attempts",
+    "vowel_quiz_correct",
+    "vowel_microphone_attempts",
+    "vowel_microphone_success",
+]
+
+
+def parse_sound_progress_event(user, data):
+    event = {}
+    try:
+        for field_name in SOUND_PROGRESS_COUNTERS:
+            event[field_name] = int(data.get(field_name) or 0)
+        event["vowel_mastery_percentage"] = max(0, min(100, int(data.get("vowel_mastery_percentage") or 0)))
+    except (TypeError, ValueError):
+        return None, _json_error("Sound progress counters must be integers", 400)
+
+    completed_items = data.get("completed_items")
+    event["completed_items"] = (
+        [str(item)[:80] for item in completed_items[:300]] if isinstance(completed_items, list) else None
+    )
+    practiced_vowels = data.get("practiced_vowels")
+    event["practiced_vowels"] = (
+        [
+            str(item).upper()[:2]
+            for item in practiced_vowels[:10]
+            if str(item).upper()[:1] in {"A", "E", "I", "O", "U", "Y"}
+        ]
+        if isinstance(practiced_vowels, list) else None
+    )
+    event["last_item"] = str(data.get("last_item") or "")[:80]
+    event["last_payload"] = data.get("last_payload") if isinstance(data.get("last_payload"), dict) else {}
+    event["last_vowel_practiced"] = str(data.get("last_vowel_practiced") or "")[:12]
+    return event, None
+
+
+def sound_progress_row(user, event, now):
+    return SoundPracticeProgress, {"user": user}, None
+
+
+def apply_sound_progress_event(progress, created, event, now):
+    before_state = {field: getattr(progress, field) for field in SOUND_PROGRESS_TRACKED_FIELDS}
+
+    if event["completed_items"] is not None:
+        progress.completed_items = event["completed_items"]
+    if event["practiced_vowels"] is not None:
+        progress.practiced_vowels = event["practiced_vowels"]
+    for field_name in SOUND_PROGRESS_COUNTERS + ["vowel_mastery_percentage"]:
+        setattr(progress, field_name, max(getattr(progress, field_name), event[field_name]))
+    progress.last_item = event["last_item"]
+    progress.last_payload = event["last_payload"]
+    progress.last_vowel_practiced = event["last_vowel_practiced"]
+
+    changed_fields = [
+        field
+        for field in SOUND_PROGRESS_TRACKED_FIELDS
+        if getattr(progress, field) != before_state[field]
+    ]
+    if changed_fields:
+        progress.last_used_at = now
+        changed_fields.append("last_used_at")
+
+    snapshot = {
+        "changed": bool(changed_fields),
+        "completed_items": progress.completed_items,
+        "quiz_attempts": progress.quiz_attempts,
+        "quiz_correct": progress.quiz_correct,
+        "mic_attempts": progress.mic_attempts,
+        "mic_success": progress.mic_success,
+        "worksheet_downloads": progress.worksheet_downloads,
+        "vowel_lessons_completed": progress.vowel_lessons_completed,
+        "practiced_vowels": progress.practiced_vowels,
+        "vowel_quiz_attempts": progress.vowel_quiz_attempts,
+        "vowel_quiz_correct": progress.vowel_quiz_correct,
+        "vowel_microphone_attempts": progress.vowel_microphone_attempts,
+        "vowel_microphone_success": progress.vowel_microphone_success,
+        "last_vowel_practiced": progress.last_vowel_practiced,
+        "vowel_mastery_percentage": progress.vowel_mastery_percentage,
+    }
+    return changed_fields, lambda: snapshot
+
+
 @require_http_methods(["GET", "POST"])
 def sound_progress_api(request):
     blocked = require_feature(request, "sounds_basic", UPGRADE_SILVER_OR_HIGHER_MESSAGE)
@@ -6435,10 +6685,13 @@ def sound_progress_api(request):
     if not request.user.is_authenticated:
         return JsonResponse({"authenticated": False, "message": "local_only"})
 
-    progress, _ = SoundPracticeProgress.objects.get_or_create(user=request.user)
-
     if request.method == "GET":
-        return JsonResponse({
+        rows = SoundPracticeProgress.objects.filter(user=request.user)
+        unchanged = progress_not_modified(request, "sound", rows)
+        if unchanged is not None:
+            return unchanged
+        progress = rows.first() or SoundPracticeProgress(user=request.user)
+        return with_etag(JsonResponse({
             "authenticated": True,
             "completed_items": progress.completed_items,
             "quiz_attempts": progress.quiz_attempts,
@@ -6456,90 +6709,18 @@ def sound_progress_api(request):
             "vowel_microphone_success": progress.vowel_microphone_success,
             "last_vowel_practiced": progress.last_vowel_practiced,
             "vowel_mastery_percentage": progress.vowel_mastery_percentage,
-        })
+        }), progress_etag("sound", request.user.pk, progress.updated_at))
 
     data, error = parse_json_safely(request)
     if error:
         return error
 
-    tracked_fields = [
-        "completed_items",
-        "quiz_attempts",
-        "quiz_correct",
-        "mic_attempts",
-        "mic_success",
-        "worksheet_downloads",
-        "last_item",
-        "last_payload",
-        "vowel_lessons_completed",
-        "practiced_vowels",
-        "vowel_quiz_attempts",
-        "vowel_quiz_correct",
-        "vowel_microphone_attempts",
-        "vowel_microphone_success",
-        "last_vowel_practiced",
-        "vowel_mastery_percentage",
-    ]
-    before_state = {field: getattr(progress, field) for field in tracked_fields}
-
-    completed_items = data.get("completed_items")
-    if isinstance(completed_items, list):
-        progress.completed_items = [str(item)[:80] for item in completed_items[:300]]
-
-    progress.quiz_attempts = max(progress.quiz_attempts, int(data.get("quiz_attempts") or 0))
-    progress.quiz_correct = max(progress.quiz_correct, int(data.get("quiz_correct") or 0))
-    progress.mic_attempts = max(progress.mic_attempts, int(data.get("mic_attempts") or 0))
-    progress.mic_success = max(progress.mic_success, int(data.get("mic_success") or 0))
-    progress.worksheet_downloads = max(progress.worksheet_downloads, int(data.get("worksheet_downloads") or 0))
-    progress.last_item = str(data.get("last_item") or "")[:80]
-    progress.last_payload = data.get("last_payload") if isinstance(data.get("last_payload"), dict) else {}
-    practiced_vowels = data.get("practiced_vowels")
-    if isinstance(practiced_vowels, list):
-        progress.practiced_vowels = [
-            str(item).upper()[:2]
-            for item in practiced_vowels[:10]
-            if str(item).upper()[:1] in {"A", "E", "I", "O", "U", "Y"}
-        ]
-    progress.vowel_lessons_completed = max(progress.vowel_lessons_completed, int(data.get("vowel_lessons_completed") or 0))
-    progress.vowel_quiz_attempts = max(progress.vowel_quiz_attempts, int(data.get("vowel_quiz_attempts") or 0))
-    progress.vowel_quiz_correct = max(progress.vowel_quiz_correct, int(data.get("vowel_quiz_correct") or 0))
-    progress.vowel_microphone_attempts = max(progress.vowel_microphone_attempts, int(data.get("vowel_microphone_attempts") or 0))
-    progress.vowel_microphone_success = max(progress.vowel_microphone_success, int(data.get("vowel_microphone_success") or 0))
-    progress.last_vowel_practiced = str(data.get("last_vowel_practiced") or "")[:12]
-    incoming_vowel_mastery = int(data.get("vowel_mastery_percentage") or 0)
-    progress.vowel_mastery_percentage = max(
-        progress.vowel_mastery_percentage,
-        max(0, min(100, incoming_vowel_mastery)),
-    )
-    changed_fields = [
-        field
-        for field in tracked_fields
-        if getattr(progress, field) != before_state[field]
-    ]
-    changed = bool(changed_fields)
-    if changed:
-        progress.last_used_at = timezone.now()
-        progress.save(update_fields=changed_fields + ["last_used_at", "updated_at"])
+    event, error = parse_sound_progress_event(request.user, data)
+    if error:
+        return error
 
-    return JsonResponse({
-        "status": "ok",
-        "authenticated": True,
-        "changed": changed,
-        "completed_items": progress.completed_items,
-        "quiz_attempts": progress.quiz_attempts,
-        "quiz_correct": progress.quiz_correct,
-        "mic_attempts": progress.mic_attempts,
-        "mic_success": progress.mic_success,
-        "worksheet_downloads": progress.worksheet_downloads,
-        "vowel_lessons_completed": progress.vowel_lessons_completed,
-        "practiced_vowels": progress.practiced_vowels,
-        "vowel_quiz_attempts": progress.vowel_quiz_attempts,
-        "vowel_quiz_correct": progress.vowel_quiz_correct,
-        "vowel_microphone_attempts": progress.vowel_microphone_attempts,
-        "vowel_microphone_success": progress.vowel_microphone_success,
-        "last_vowel_practiced": progress.last_vowel_practiced,
-        "vowel_mastery_percentage": progress.vowel_mastery_percentage,
-    })
+    result = apply_single_progress_event(request.user, PROGRESS_EVENT_HANDLERS["sound"], event)
+    return JsonResponse({"status": "ok", "authenticated": True, **result})
 
 
 
@@ -6586,89 +6767,32 @@ def leaderboard_api(request):
         return _json_error("Failed to load leaderboard", 500, request_id=getattr(request, "request_id", ""))
 
 
-def get_leaderboard_period_start(period):
-    now = timezone.now()
-    if period in {"daily", "today"}:
-        return now.replace(hour=0, minute=0, second=0, microsecond=0)
-    if period == "weekly":
-        return now - timedelta(days=7)
-    if period == "monthly":
-        return now - timedelta(days=30)
-    return None
-
-
-def normalize_leaderboard_grade(value):
-    return (value or "").strip() or "غير محدد"
-
-
-def build_achievement(completed_letters, has_certificate, total_points):
-    if has_certificate:
-        return "شهادة الحروف", True, "شهادة إتقان الحروف"
-    if completed_letters >= 26:
-        return "أنهى الحروف", False, ""
-    if total_points > 0:
-        return "الأكثر تفاعلًا", False, ""
-    return "مشارك جديد", False, ""
-
-
-def score_letter_progress(progress_entries):
-    points = 0
-    completed_letters = set()
-
-    for progress in progress_entries:
-        base_score = progress.total_score if progress.user_id else progress.score
-        points += int(base_score or 0)
-        if progress.completed or progress.passed:
-            completed_letters.add(progress.letter)
-            points += 7
-
-    if len(completed_letters) >= 26:
-        points += 100
-        points += 150
-
-    return points, len(completed_letters)
+@require_GET
+def leaderboard_rank_api(request):
+    if not request.user.is_authenticated:
+        return _json_error("login_required", 401, detail="Please sign in to see your leaderboard rank.")
+    blocked = require_feature(request, "leaderboard", UPGRADE_VIP_OR_FULL_MESSAGE)
+    if blocked:
+        return blocked
 
+    try:
+        context = user_rank_context(
+            request.user.pk,
+            (request.GET.get("period") or "all").strip(),
+            grade=(request.GET.get("grade") or "").strip(),
+            radius=LEADERBOARD_RANK_RADIUS,
+        )
+    except Exception:
+        logger.exception("leaderboard_rank_failed request_id=%s", getattr(request, "request_id", ""))
+        return _json_error("Failed to load leaderboard rank", 500, request_id=getattr(request, "request_id", ""))
 
-def score_sound_progress(progress):
-    if not progress:
-        return 0
-    completed_items = progress.completed_items or []
-    practiced_vowels = progress.practiced_vowels or []
-    points = len(completed_items) * 5
-    points += int(progress.quiz_attempts or 0) * 10
-    points += int(progress.mic_success or 0) * 5
-    points += int(progress.vowel_lessons_completed or 0)
-    points += len(practiced_vowels) * 5
-    points += int(progress.vowel_quiz_attempts or 0) * 10
-    points += int(progress.vowel_microphone_success or 0) * 5
-    return points
-
-
-def score_cvc_reading_progress(progress):
-    if not progress:
-        return 0
-    points = 0
-    points += len(progress.completed_lessons or []) * 5
-    points += len(progress.words_mastered or []) * 5
-    points += int(progress.sentences_read or 0) * 5
-    points += int(progress.sentence_quiz_attempts or 0) * 10
-    points += int(progress.sentence_microphone_success or 0) * 5
-    points += int(progress.stories_completed or 0) * 10
-    points += int(progress.story_quiz_attempts or 0) * 10
-    points += int(progress.story_microphone_success or 0) * 5
-    points += int(progress.pronoun_lessons_completed or 0) * 5
-    points += len(progress.pronouns_mastered or []) * 5
-    points += int(progress.fluency_attempts or 0) * 10
-    points += int(progress.conversations_completed or 0) * 10
-    points += len(progress.action_verbs_mastered or []) * 5
-    points += len(progress.adjectives_mastered or []) * 5
-    return points
-
-
-def activity_matches_period(*timestamps, period_start=None):
-    if not period_start:
-        return True
-    return any(ts and ts >= period_start for ts in timestamps)
+    neighbours = []
+    for entry in context["neighbours"]:
+        row = _leaderboard_row(entry["display_name"], entry["grade"], entry["points"], entry["completed_letters"])
+        row["rank"] = entry["rank"]
+        row["is_current_user"] = entry["is_current_user"]
+        neighbours.append(row)
+    return JsonResponse({"rank": context["rank"], "total_points": context["points"], "neighbours": neighbours})
 
 
 def leaderboard_cache_key(period, type_filter, grade_filter, search_query):
@@ -6705,173 +6829,34 @@ def build_leaderboard_rows(params):
     type_filter = (params.get("type") or "all").strip()
     grade_filter = (params.get("grade") or "").strip()
     search_query = (params.get("search") or "").strip().lower()
-    period_start = get_leaderboard_period_start(period)
-    cache_key = leaderboard_cache_key(period, type_filter, grade_filter, search_query)
-    cached = safe_cache_get(cache_key)
-    if isinstance(cached, list):
-        return cached
-
-    rows = []
-
-    student_progress_qs = (
-        LetterProgress.objects
-        .filter(student__isnull=False)
-        .values("student_id", "student__name", "student__grade")
-        .annotate(
-            letter_points=Sum("score"),
-            completed_letters=Count("letter", filter=Q(completed=True) | Q(passed=True), distinct=True),
-            last_activity=Max("timestamp"),
-        )
-    )
-    if period_start:
-        student_progress_qs = student_progress_qs.filter(timestamp__gte=period_start)
-    if grade_filter:
-        student_progress_qs = student_progress_qs.filter(student__grade=grade_filter)
-    if search_query:
-        student_progress_qs = student_progress_qs.filter(student__name__icontains=search_query)
-
-    cvc_by_student = {
-        row["student_id"]: row
-        for row in CVCProgress.objects.values("student_id", "total_score", "last_activity")
-    }
 
-    seen_students = set()
-    for summary in student_progress_qs:
-        student_id = summary["student_id"]
-        seen_students.add(student_id)
-        completed_letters = int(summary["completed_letters"] or 0)
-        letter_points = int(summary["letter_points"] or 0) + (completed_letters * 7)
-        if completed_letters >= 26:
-            letter_points += 250
-        cvc_progress = cvc_by_student.get(student_id) or {}
-        if period_start and cvc_progress and not activity_matches_period(
-            summary.get("last_activity"),
-            cvc_progress.get("last_activity"),
-            period_start=period_start,
-        ):
-            continue
-        total_points = letter_points + int(cvc_progress.get("total_score") or 0)
-        rows.append(_leaderboard_row(
-            summary["student__name"],
-            summary["student__grade"],
-            total_points,
-            completed_letters,
-        ))
-
-    cvc_student_ids = set(cvc_by_student) - seen_students
-    if cvc_student_ids:
-        cvc_students = Student.objects.filter(id__in=cvc_student_ids)
-        if grade_filter:
-            cvc_students = cvc_students.filter(grade=grade_filter)
-        if search_query:
-            cvc_students = cvc_students.filter(name__icontains=search_query)
-        student_labels = {
-            row["id"]: row
-            for row in cvc_students.values("id", "name", "grade")
-        }
-        for student_id, cvc_progress in cvc_by_student.items():
-            if student_id not in student_labels:
-                continue
-            if period_start and not activity_matches_period(cvc_progress.get("last_activity"), period_start=period_start):
-                continue
-            student = student_labels[student_id]
-            rows.append(_leaderboard_row(
-                student["name"],
-                student["grade"],
-                int(cvc_progress.get("total_score") or 0),
-                0,
-            ))
-
-    user_progress_qs = (
-        LetterProgress.objects
-        .filter(user__isnull=False)
-        .values("user_id")
-        .annotate(
-            letter_points=Sum("total_score"),
-            completed_letters=Count("letter", filter=Q(completed=True) | Q(passed=True), distinct=True),
-            last_activity=Max("last_updated_at"),
+    def calculate_rows():
+        entries = top_leaderboard_entries(
+            period,
+            grade=grade_filter,
+            search=search_query,
+            letters_completed_only=type_filter in {"letters_completed", "letters_certificate"},
+            limit=LEADERBOARD_LIMIT,
         )
+        rows = [
+            _leaderboard_row(
+                entry["display_name"],
+                entry["grade"],
+                entry["points"],
+                entry["completed_letters"],
+            )
+            for entry in entries
+        ]
+        for index, row in enumerate(rows, start=1):
+            row["rank"] = index
+        return rows
+
+    return get_or_compute(
+        leaderboard_cache_key(period, type_filter, grade_filter, search_query),
+        calculate_rows,
+        timeout=LEADERBOARD_CACHE_TIMEOUT,
+        validate=lambda value: isinstance(value, list),
     )
-    if period_start:
-        user_progress_qs = user_progress_qs.filter(last_updated_at__gte=period_start)
-    progress_by_user = {row["user_id"]: row for row in user_progress_qs}
-
-    english_progress_qs = EnglishFoundationProgress.objects.values("user_id").annotate(
-        points=Sum("points"),
-        last_activity=Max("last_activity_at"),
-    )
-    if period_start:
-        english_progress_qs = english_progress_qs.filter(last_activity_at__gte=period_start)
-    english_progress_by_user = {row["user_id"]: row for row in english_progress_qs}
-
-    profile_qs = StudentProfile.objects.select_related(
-        "user",
-        "user__sound_practice_progress",
-        "user__cvc_reading_progress",
-        "user__bird_tutor_progress",
-    )
-    if grade_filter:
-        profile_qs = profile_qs.filter(grade=grade_filter)
-    if search_query:
-        profile_qs = profile_qs.filter(
-            Q(display_name__icontains=search_query)
-            | Q(student_name__icontains=search_query)
-            | Q(user__username__icontains=search_query)
-        )
-
-    for profile in profile_qs:
-        letter_summary = progress_by_user.get(profile.user_id) or {}
-        sound_progress = getattr(profile.user, "sound_practice_progress", None)
-        cvc_reading_progress = getattr(profile.user, "cvc_reading_progress", None)
-        bird_progress = getattr(profile.user, "bird_tutor_progress", None)
-        english_summary = english_progress_by_user.get(profile.user_id) or {}
-
-        if not any([letter_summary, sound_progress, cvc_reading_progress, bird_progress, english_summary]):
-            continue
-        if not activity_matches_period(
-            letter_summary.get("last_activity"),
-            sound_progress.updated_at if sound_progress else None,
-            cvc_reading_progress.updated_at if cvc_reading_progress else None,
-            bird_progress.updated_at if bird_progress else None,
-            english_summary.get("last_activity"),
-            period_start=period_start,
-        ):
-            continue
-
-        completed_letters = int(letter_summary.get("completed_letters") or 0)
-        letter_points = int(letter_summary.get("letter_points") or 0) + (completed_letters * 7)
-        if completed_letters >= 26:
-            letter_points += 250
-        total_points = letter_points
-        total_points += score_sound_progress(sound_progress)
-        total_points += score_cvc_reading_progress(cvc_reading_progress)
-        total_points += int(getattr(bird_progress, "xp", 0) or 0)
-        total_points += int(english_summary.get("points") or 0)
-
-        rows.append(_leaderboard_row(
-            profile.display_name or profile.student_name or profile.user.username,
-            profile.grade,
-            total_points,
-            completed_letters,
-        ))
-
-    if type_filter == "letters_completed":
-        rows = [row for row in rows if row["achievement_type"] in {"أنهى الحروف", "شهادة الحروف"}]
-    elif type_filter == "letters_certificate":
-        rows = [row for row in rows if row["has_certificate"]]
-
-    if grade_filter:
-        rows = [row for row in rows if row["grade"] == grade_filter]
-    if search_query:
-        rows = [row for row in rows if search_query in row["student_name"].lower()]
-
-    rows.sort(key=lambda row: (-row["total_points"], row["student_name"]))
-    rows = rows[:LEADERBOARD_LIMIT]
-    for index, row in enumerate(rows, start=1):
-        row["rank"] = index
-
-    safe_cache_set(cache_key, rows, timeout=LEADERBOARD_CACHE_TIMEOUT)
-    return rows
 
 
 @require_GET
@@ -7066,13 +7051,14 @@ def cvc_reading_view(request):
 
     progress = None
     if request.user.is_authenticated:
-        progress, _ = CVCReadingProgress.objects.get_or_create(user=request.user)
+        progress = CVCReadingProgress.objects.filter(user=request.user).first()
 
     return render(request, "phonics/cvc_reading.html", {
         "cvc_progress_json": json.dumps(serialize_cvc_reading_progress(progress), ensure_ascii=False),
         "cvc_words_total": CVCWord.objects.count(),
         "cvc_sentences_total": CVCSentence.objects.count(),
         "cvc_stories_total": CVCStory.objects.count(),
+        **fragment_context("cvc_reading"),
     })
 
 
@@ -7125,44 +7111,146 @@ def parse_pagination_params(request):
     return page, page_size
 
 
+def cached_cvc_content_count(kind, model, *, queryset=None, filters=""):
+    """Rows of ``kind``; listings pass their filtered ``queryset`` and the ``filters`` part of their page key."""
+    source = model.objects if queryset is None else queryset
+    suffix = f":filters:{filters}" if filters else ""
+    return get_or_compute(
+        f"cvc-count:{CVC_CONTENT_CACHE_VERSION}:{kind}{suffix}",
+        source.count,
+        timeout=CVC_COUNT_CACHE_TIMEOUT,
+        validate=lambda value: isinstance(value, int) and value >= 0,
+        local=True,
+    )
+
+
 def get_cached_cvc_content_count(kind, model, *, extra=0):
-    cache_key = f"cvc-count:{CVC_CONTENT_CACHE_VERSION}:{kind}"
-    cached = safe_cache_get(cache_key)
-    if isinstance(cached, int) and cached >= 0:
-        return max(cached + extra, 1)
-    count = model.objects.count()
-    safe_cache_set(cache_key, count, timeout=CVC_COUNT_CACHE_TIMEOUT)
-    return max(count + extra, 1)
+    return max(cached_cvc_content_count(kind, model) + extra, 1)
+
+
+def encode_cvc_cursor(item):
+    raw = json.dumps([item.order, item.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cvc_cursor(token):
+    """``(order, id)`` of the last row already sent, ``None`` for the first page; ``ValueError`` if malformed."""
+    if not token:
+        return None
+    values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    if not (isinstance(values, list) and len(values) == 2 and all(type(value) is int for value in values)):
+        raise ValueError("malformed cursor")
+    return tuple(values)
 
 
 def paginate_queryset(qs, request, *, resource, serializer, legacy_key, cache_extra="", timeout=300):
-    page, page_size = parse_pagination_params(request)
+    """One page of ``qs`` (ordered by ``order``, ``id``) as cached JSON.
+
+    A request carrying ``cursor`` (empty for the first page) gets keyset
+    pagination; everything else keeps the page/page_size contract. Both
+    answer ``If-None-Match`` before ``ensure_seed_data`` touches the database.
+    """
     include_legacy = str(request.GET.get("legacy", "1")).lower() not in {"0", "false", "no"}
+    if "cursor" in request.GET:
+        return cursor_paginate_queryset(
+            qs,
+            request,
+            resource=resource,
+            serializer=serializer,
+            legacy_key=legacy_key if include_legacy else None,
+            cache_extra=cache_extra,
+            timeout=timeout,
+        )
+
+    page, page_size = parse_pagination_params(request)
     cache_key = (
         f"cvc-api:{CVC_CONTENT_CACHE_VERSION}:{resource}:"
         f"page:{page}:page_size:{page_size}:legacy:{int(include_legacy)}:filters:{cache_extra}"
     )
-    cached = safe_cache_get(cache_key)
-    if isinstance(cached, dict):
-        return JsonResponse(cached)
-
-    count = qs.count()
-    total_pages = max(1, math.ceil(count / page_size)) if count else 1
-    if page > total_pages:
-        page = total_pages
-    offset = (page - 1) * page_size
-    results = [serializer(item) for item in qs[offset:offset + page_size]]
-    payload = {
-        "count": count,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages,
-        "results": results,
-    }
-    if include_legacy:
-        payload[legacy_key] = results
-    safe_cache_set(cache_key, payload, timeout=timeout)
-    return JsonResponse(payload)
+    etag = strong_etag("cvc-api", cache_key)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    # Auto-seed if database is empty (Render Free tier solution); a revalidation never needs it.
+    ensure_seed_data()
+
+    def calculate_payload():
+        count = cached_cvc_content_count(resource, qs.model, queryset=qs, filters=cache_extra)
+        total_pages = max(1, math.ceil(count / page_size)) if count else 1
+        current_page = min(page, total_pages)
+        offset = (current_page - 1) * page_size
+        results = [serializer(item) for item in qs[offset:offset + page_size]]
+        payload = {
+            "count": count,
+            "page": current_page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "results": results,
+        }
+        if include_legacy:
+            payload[legacy_key] = results
+        return payload
+
+    return with_etag(share_compressed(JsonResponse(get_or_compute(
+        cache_key,
+        calculate_payload,
+        timeout=timeout,
+        validate=lambda value: isinstance(value, dict),
+        local=True,
+    ))), etag)
+
+
+def cursor_paginate_queryset(qs, request, *, resource, serializer, legacy_key, cache_extra, timeout):
+    """Keyset page after the ``cursor`` row, read through the ``(order, id)`` index.
+
+    The payload has an opaque ``next`` cursor (``null`` on the last page); the
+    total is added only for ``count=1``; it counts the filtered ``qs`` and is
+    cached under the same ``cache_extra`` as the pages.
+    """
+    try:
+        after = decode_cvc_cursor(request.GET.get("cursor", "").strip())
+    except ValueError:
+        return _json_error("invalid_cursor", 400, detail="Start again without a cursor.")
+    _, page_size = parse_pagination_params(request)
+    include_count = str(request.GET.get("count", "")).lower() in {"1", "true", "yes"}
+    position = "start" if after is None else "%d.%d" % after
+    cache_key = (
+        f"cvc-api:{CVC_CONTENT_CACHE_VERSION}:{resource}:"
+        f"after:{position}:page_size:{page_size}:legacy:{int(bool(legacy_key))}:filters:{cache_extra}"
+    )
+    etag = strong_etag("cvc-api", cache_key, include_count)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    ensure_seed_data()
+
+    def calculate_payload():
+        rows = qs
+        if after is not None:
+            order, pk = after
+            rows = rows.filter(order__gte=order).filter(Q(order__gt=order) | Q(order=order, id__gt=pk))
+        items = list(rows[:page_size + 1])
+        page_items = items[:page_size]
+        results = [serializer(item) for item in page_items]
+        payload = {
+            "page_size": page_size,
+            "results": results,
+            "next": encode_cvc_cursor(page_items[-1]) if len(items) > page_size else None,
+        }
+        if legacy_key:
+            payload[legacy_key] = results
+        return payload
+
+    payload = get_or_compute(
+        cache_key,
+        calculate_payload,
+        timeout=timeout,
+        validate=lambda value: isinstance(value, dict),
+        local=True,
+    )
+    if include_count:
+        payload = {**payload, "count": cached_cvc_content_count(resource, qs.model, queryset=qs, filters=cache_extra)}
+    return with_etag(share_compressed(JsonResponse(payload)), etag)
 
 
 def cvc_word_payload(w):
@@ -7226,9 +7314,6 @@ def get_cvc_words_api(request):
     Returns JSON words.
     IMPORTANT: Avoid `.only()` to prevent 500 if fields differ from expectations.
     """
-    # Auto-seed if database is empty (Render Free tier solution)
-    ensure_seed_data()
-
     try:
         qs = CVCWord.objects.all().order_by("order", "id")
         return paginate_queryset(qs, request, resource="words", serializer=cvc_word_payload, legacy_key="words")
@@ -7243,9 +7328,6 @@ def get_cvc_sentences_api(request):
     if blocked:
         return blocked
 
-    # Auto-seed if database is empty
-    ensure_seed_data()
-
     try:
         qs = CVCSentence.objects.all().order_by("order", "id")
         return paginate_queryset(qs, request, resource="sentences", serializer=cvc_sentence_payload, legacy_key="sentences")
@@ -7260,9 +7342,6 @@ def get_cvc_stories_api(request):
     if blocked:
         return blocked
 
-    # Auto-seed if database is empty
-    ensure_seed_data()
-
     try:
         summary = str(request.GET.get("summary", "")).strip().lower() in {"1", "true", "yes"}
         qs = CVCStory.objects.all().order_by("order", "id")
@@ -7279,6 +7358,58 @@ def get_cvc_stories_api(request):
         return _json_error("Failed to fetch CVC stories", 500)
 
 
+CVC_EXPORT_RESOURCES = (
+    ("cvc_words", "words", CVCWord, (
+        "id", "word", "arabic_meaning", "image_url", "emoji", "category", "word_family", "vowel_sound",
+        "difficulty_level",
+    )),
+    ("cvc_sentences", "sentences", CVCSentence, (
+        "id", "sentence", "arabic_translation", "difficulty", "time_limit", "category", "quiz_data", "emoji",
+    )),
+    ("cvc_stories", "stories", CVCStory, (
+        "id", "title", "difficulty", "image_url", "content", "arabic_explanation", "quiz_data",
+    )),
+)
+
+
+def iter_cvc_corpus_ndjson():
+    """Every CVC word, sentence and story as one JSON line each, in API order.
+
+    Rows are read with ``.values().iterator()`` and sent ``CVC_EXPORT_CHUNK_SIZE``
+    lines at a time, so memory stays flat and a compressed stream is flushed per
+    chunk rather than per line.
+    """
+    for _, resource, model, fields in CVC_EXPORT_RESOURCES:
+        rows = model.objects.order_by("order", "id").values(*fields).iterator(chunk_size=CVC_EXPORT_CHUNK_SIZE)
+        lines = []
+        for row in rows:
+            lines.append(json.dumps({"resource": resource, **row}, ensure_ascii=False, separators=(",", ":")))
+            if len(lines) >= CVC_EXPORT_CHUNK_SIZE:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+@require_GET
+def cvc_corpus_export_api(request):
+    """The whole CVC corpus as NDJSON for clients that prefetch it for offline use."""
+    for feature_key, _, _, _ in CVC_EXPORT_RESOURCES:
+        blocked = require_feature(request, feature_key, UPGRADE_LEVEL_THREE_MESSAGE)
+        if blocked:
+            return blocked
+
+    etag = strong_etag("cvc-export", CVC_CONTENT_CACHE_VERSION)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+
+    ensure_seed_data()
+    # CompressionMiddleware gzips/Brotli-compresses the stream when the client accepts it.
+    response = StreamingHttpResponse(iter_cvc_corpus_ndjson(), content_type="application/x-ndjson; charset=utf-8")
+    return with_etag(response, etag)
+
+
 @require_POST
 @login_required
 @rate_limit("legacy-cvc-progress", limit_setting="RATE_LIMIT_WRITE", default=60)
@@ -7307,278 +7438,33 @@ def cvc_reading_progress_api(request):
             "progress": serialize_cvc_reading_progress(None),
         })
 
-    progress, _ = CVCReadingProgress.objects.get_or_create(user=request.user)
-
     if request.method == "GET":
-        return JsonResponse({
+        rows = CVCReadingProgress.objects.filter(user=request.user)
+        unchanged = progress_not_modified(request, "cvc_reading", rows)
+        if unchanged is not None:
+            return unchanged
+        progress = rows.first()
+        return with_etag(JsonResponse({
             "authenticated": True,
             "progress": serialize_cvc_reading_progress(progress),
-        })
+        }), progress_etag("cvc_reading", request.user.pk, progress.updated_at if progress else None))
 
     data, error = parse_json_safely(request)
     if error:
         return error
 
-    event_type = str(data.get("event_type") or data.get("type") or "").strip()[:30]
-    item_text = str(data.get("item_text") or data.get("word") or "").strip()[:80]
-    level = str(data.get("level") or "").strip()[:40]
-    family = str(data.get("family") or "").strip()[:40]
-    lesson_id = str(data.get("lesson_id") or "").strip()[:80]
-    sentence_level = str(data.get("sentence_level") or "").strip()[:40]
-    story_level = str(data.get("story_level") or "").strip()[:60]
-    pronoun_level = str(data.get("pronoun_level") or "").strip()[:80]
-    fluency_level = str(data.get("fluency_level") or "").strip()[:80]
-    score = int(data.get("score") or data.get("points") or 0)
-    mastered = bool(data.get("mastered", score >= 70))
-
-    words_practiced = list(progress.words_practiced or [])
-    words_mastered = list(progress.words_mastered or [])
-    needs_review = list(progress.needs_review_words or [])
-    completed_levels = list(progress.completed_levels or [])
-    completed_lessons = list(progress.completed_lessons or [])
-    completed_families = list(progress.completed_families or [])
-    is_new_lesson = bool(lesson_id and lesson_id not in completed_lessons)
-
-    if item_text and event_type in {"word", "listen", "mic", "spelling", "quiz"}:
-        if item_text not in words_practiced:
-            words_practiced.append(item_text)
-        if mastered:
-            if item_text not in words_mastered:
-                words_mastered.append(item_text)
-            needs_review = [word for word in needs_review if word != item_text]
-        elif event_type != "listen" and item_text not in needs_review:
-            needs_review.append(item_text)
-
-    if event_type == "sentence":
-        progress.sentences_read = max(progress.sentences_read, int(data.get("sentences_read") or progress.sentences_read + 1))
-    if event_type == "sentence_mastered":
-        progress.sentences_read = max(progress.sentences_read, int(data.get("sentences_read") or progress.sentences_read + 1))
-        sentences_mastered = list(progress.sentences_mastered or [])
-        if item_text and item_text not in sentences_mastered:
-            sentences_mastered.append(item_text)
-        progress.sentences_mastered = sentences_mastered[:300]
-    if event_type == "sentence_quiz":
-        progress.sentence_quiz_attempts += 1
-        if mastered:
-            progress.sentence_quiz_correct += 1
-    if event_type == "sentence_mic":
-        progress.sentence_microphone_attempts += 1
-        if mastered:
-            progress.sentence_microphone_success += 1
-    if event_type == "sentence_timer":
-        try:
-            reading_time = max(0, int(float(data.get("reading_time") or 0)))
-        except (TypeError, ValueError):
-            reading_time = 0
-        if reading_time:
-            progress.sentence_total_time_seconds += reading_time
-            progress.sentence_best_time_seconds = min(
-                progress.sentence_best_time_seconds or reading_time,
-                reading_time,
-            )
-    if event_type == "story":
-        progress.stories_completed = max(progress.stories_completed, int(data.get("stories_completed") or progress.stories_completed + 1))
-    if event_type.startswith("story"):
-        stories_started = list(progress.stories_started or [])
-        story_needs_review = list(progress.story_needs_review or [])
-        if item_text:
-            progress.last_story = item_text[:160]
-        progress.last_story_level = story_level or level or progress.last_story_level
-        if event_type in {"story_started", "story_listen"} and item_text and item_text not in stories_started:
-            stories_started.append(item_text)
-        if event_type == "story_quiz":
-            progress.story_quiz_attempts += 1
-            if mastered:
-                progress.story_quiz_correct += 1
-            elif item_text and item_text not in story_needs_review:
-                story_needs_review.append(item_text)
-        if event_type == "story_mic":
-            progress.story_microphone_attempts += 1
-            if mastered:
-                progress.story_microphone_success += 1
-            elif item_text and item_text not in story_needs_review:
-                story_needs_review.append(item_text)
-        if event_type in {"story_timer", "story_complete"}:
-            try:
-                reading_time = max(0, int(float(data.get("reading_time") or data.get("time_spent") or 0)))
-            except (TypeError, ValueError):
-                reading_time = 0
-            if reading_time:
-                progress.story_best_reading_time = min(progress.story_best_reading_time or reading_time, reading_time)
-        if event_type == "story_complete":
-            progress.stories_completed = max(progress.stories_completed, int(data.get("stories_completed") or progress.stories_completed + 1))
-            if item_text and item_text not in stories_started:
-                stories_started.append(item_text)
-            story_needs_review = [story for story in story_needs_review if story != item_text]
-        progress.stories_started = stories_started[:120]
-        progress.story_needs_review = story_needs_review[:60]
-    if event_type.startswith("pronoun"):
-        pronouns_practiced = list(progress.pronouns_practiced or [])
-        pronouns_mastered = list(progress.pronouns_mastered or [])
-        pronouns_needs_review = list(progress.pronouns_needs_review or [])
-        if item_text:
-            progress.last_pronoun = item_text[:80]
-        progress.last_pronoun_level = pronoun_level or level or progress.last_pronoun_level
-        if item_text and event_type in {"pronoun_practice", "pronoun_listen", "pronoun_mic", "pronoun_quiz", "pronoun_mastered"} and item_text not in pronouns_practiced:
-            pronouns_practiced.append(item_text)
-        if event_type == "pronoun_quiz":
-            progress.pronoun_quiz_attempts += 1
-            if mastered:
-                progress.pronoun_quiz_correct += 1
-            elif item_text and item_text not in pronouns_needs_review:
-                pronouns_needs_review.append(item_text)
-        if event_type == "pronoun_mic":
-            progress.pronoun_microphone_attempts += 1
-            if mastered:
-                progress.pronoun_microphone_success += 1
-            elif item_text and item_text not in pronouns_needs_review:
-                pronouns_needs_review.append(item_text)
-        if mastered and item_text:
-            if item_text not in pronouns_mastered:
-                pronouns_mastered.append(item_text)
-            pronouns_needs_review = [item for item in pronouns_needs_review if item != item_text]
-        elif event_type not in {"pronoun_listen", "pronoun_practice"} and item_text and item_text not in pronouns_needs_review:
-            pronouns_needs_review.append(item_text)
-        if event_type == "pronoun_mastered" and is_new_lesson:
-            progress.pronoun_lessons_completed += 1
-        progress.pronouns_practiced = pronouns_practiced[:160]
-        progress.pronouns_mastered = pronouns_mastered[:160]
-        progress.pronouns_needs_review = pronouns_needs_review[:80]
-    if event_type.startswith("sight_word"):
-        sight_words_practiced = list(progress.sight_words_practiced or [])
-        sight_words_mastered = list(progress.sight_words_mastered or [])
-        if item_text:
-            progress.last_sight_word = item_text[:60]
-            if item_text not in sight_words_practiced:
-                sight_words_practiced.append(item_text)
-        if event_type == "sight_word_quiz":
-            progress.sight_word_quiz_attempts += 1
-            if mastered:
-                progress.sight_word_quiz_correct += 1
-        if mastered and item_text and item_text not in sight_words_mastered:
-            sight_words_mastered.append(item_text)
-        progress.sight_words_practiced = sight_words_practiced[:120]
-        progress.sight_words_mastered = sight_words_mastered[:120]
-    if event_type.startswith("fluency"):
-        if item_text:
-            progress.last_fluency_sentence = item_text[:180]
-        if event_type in {"fluency_attempt", "fluency_mic"}:
-            progress.fluency_attempts += 1
-        if event_type == "fluency_attempt":
-            progress.fluency_sentences_read += 1
-            try:
-                reading_time = max(0, int(float(data.get("reading_time") or data.get("time_spent") or 0)))
-            except (TypeError, ValueError):
-                reading_time = 0
-            try:
-                wpm = max(0, int(float(data.get("wpm") or 0)))
-            except (TypeError, ValueError):
-                wpm = 0
-            if reading_time:
-                progress.best_reading_time = min(progress.best_reading_time or reading_time, reading_time)
-            if wpm:
-                progress.best_wpm = max(progress.best_wpm, wpm)
-        if event_type == "fluency_mic":
-            progress.fluency_accuracy = max(progress.fluency_accuracy, min(100, score))
-        if score:
-            progress.fluency_score = max(progress.fluency_score, min(100, score))
-    if event_type == "question_word_mastered" and item_text:
-        question_words_mastered = list(progress.question_words_mastered or [])
-        if item_text not in question_words_mastered:
-            question_words_mastered.append(item_text)
-        progress.question_words_mastered = question_words_mastered[:30]
-    if event_type == "conversation_complete":
-        if item_text:
-            progress.last_conversation = item_text[:120]
-        progress.conversations_completed = max(progress.conversations_completed, int(data.get("conversations_completed") or progress.conversations_completed + 1))
-    if event_type == "action_verb_mastered" and item_text:
-        action_verbs_mastered = list(progress.action_verbs_mastered or [])
-        if item_text not in action_verbs_mastered:
-            action_verbs_mastered.append(item_text)
-        progress.action_verbs_mastered = action_verbs_mastered[:60]
-    if event_type == "adjective_mastered" and item_text:
-        adjectives_mastered = list(progress.adjectives_mastered or [])
-        if item_text not in adjectives_mastered:
-            adjectives_mastered.append(item_text)
-        progress.adjectives_mastered = adjectives_mastered[:60]
-    if event_type in {"quiz", "spelling"}:
-        progress.quiz_attempts += 1
-        if mastered:
-            progress.quiz_correct += 1
-    if event_type == "mic":
-        progress.mic_attempts += 1
-        if mastered:
-            progress.mic_success += 1
-
-    if level and level not in completed_levels and mastered:
-        completed_levels.append(level)
-    if lesson_id and lesson_id not in completed_lessons and mastered:
-        completed_lessons.append(lesson_id)
-    if family and family not in completed_families and mastered:
-        completed_families.append(family)
-
-    total_words = get_cached_cvc_content_count("words", CVCWord)
-    total_sentences = get_cached_cvc_content_count("sentences", CVCSentence, extra=99)
-    if event_type.startswith("sentence"):
-        progress.last_sentence = item_text[:160] or progress.last_sentence
-        progress.last_sentence_level = sentence_level or level or progress.last_sentence_level
-        if is_new_lesson and sentence_level == "common" and mastered:
-            progress.common_sentences_completed += 1
-        if is_new_lesson and sentence_level == "numbers" and mastered:
-            progress.numbers_completed += 1
-        if is_new_lesson and sentence_level == "days" and mastered:
-            progress.days_completed += 1
-        if is_new_lesson and sentence_level == "months" and mastered:
-            progress.months_completed += 1
-        progress.sentence_mastery_percentage = min(
-            100,
-            round((len(progress.sentences_mastered or []) / total_sentences) * 100),
-        )
-    total_stories = get_cached_cvc_content_count("stories", CVCStory, extra=9)
-    if event_type.startswith("story"):
-        progress.story_mastery_percentage = min(
-            100,
-            round((progress.stories_completed / total_stories) * 100),
-        )
-    total_pronoun_items = 35
-    if event_type.startswith("pronoun"):
-        progress.pronoun_mastery_percentage = min(
-            100,
-            round((len(progress.pronouns_mastered or []) / total_pronoun_items) * 100),
-        )
-    if (
-        event_type.startswith("sight_word")
-        or event_type.startswith("fluency")
-        or event_type in {"question_word_mastered", "conversation_complete", "action_verb_mastered", "adjective_mastered"}
-    ):
-        total_fluency_items = 40 + 34 + 6 + 6 + 16 + 15
-        completed_fluency_items = (
-            len(progress.sight_words_mastered or [])
-            + min(progress.fluency_sentences_read, 24)
-            + len(progress.question_words_mastered or [])
-            + min(progress.conversations_completed, 6)
-            + len(progress.action_verbs_mastered or [])
-            + len(progress.adjectives_mastered or [])
-        )
-        progress.fluency_mastery_percentage = min(
-            100,
-            round((completed_fluency_items / total_fluency_items) * 100),
-        )
-    progress.words_practiced = words_practiced[:300]
-    progress.words_mastered = words_mastered[:300]
-    progress.needs_review_words = needs_review[:50]
-    progress.completed_levels = completed_levels[:20]
-    progress.completed_lessons = completed_lessons[:80]
-    progress.completed_families = completed_families[:60]
-    progress.last_word = item_text or progress.last_word
-    progress.last_family = family or progress.last_family
-    progress.last_level = level or progress.last_level
-    progress.cvc_mastery_percentage = max(
-        progress.cvc_mastery_percentage,
-        min(100, round((len(progress.words_mastered) / total_words) * 100)),
+    try:
+        event = parse_cvc_event(data)
+    except ValueError:
+        return _json_error("data must be an object", 400)
+    totals = CVCContentTotals(
+        words=get_cached_cvc_content_count("words", CVCWord),
+        sentences=get_cached_cvc_content_count("sentences", CVCSentence, extra=99),
+        stories=get_cached_cvc_content_count("stories", CVCStory, extra=9),
     )
-    progress.last_payload = data
-    progress.save()
+    with transaction.atomic():
+        progress = fold_cvc_events(request.user.pk, totals, [event])
+        refresh_leaderboard_entry(request.user.pk)
 
     return JsonResponse({
         "status": "ok",
@@ -7587,6 +7473,182 @@ def cvc_reading_progress_api(request):
     })
 
 
+class ProgressEventHandler(NamedTuple):
+    feature: str | None
+    message: str
+    parse: Callable
+    row: Callable | None
+    apply: Callable | None
+    scored: bool
+
+
+def parse_cvc_progress_event(user, data):
+    try:
+        return parse_cvc_event(data), None
+    except ValueError:
+        return None, _json_error("data must be an object", 400)
+
+
+PROGRESS_EVENT_HANDLERS = {
+    "letter": ProgressEventHandler(
+        None, "", parse_letter_progress_event, letter_progress_row, apply_letter_progress_event, True,
+    ),
+    "sound": ProgressEventHandler(
+        "sounds_basic", UPGRADE_SILVER_OR_HIGHER_MESSAGE,
+        parse_sound_progress_event, sound_progress_row, apply_sound_progress_event, True,
+    ),
+    # CVC events are applied together in one fold of the aggregate row.
+    "cvc": ProgressEventHandler("cvc_words", UPGRADE_LEVEL_THREE_MESSAGE, parse_cvc_progress_event, None, None, True),
+    "bird": ProgressEventHandler(
+        "bird_tutor", UPGRADE_VIP_OR_FULL_MESSAGE, parse_bird_tutor_event, bird_tutor_row, apply_bird_tutor_event, True,
+    ),
+    "bird_review": ProgressEventHandler(
+        "bird_tutor", UPGRADE_VIP_OR_FULL_MESSAGE,
+        parse_bird_review_event, bird_review_row, apply_bird_review_event, False,
+    ),
+}
+
+
+def progress_event_error(response):
+    payload = json.loads(response.content.decode("utf-8"))
+    return {"status": "error", "code": response.status_code, **payload}
+
+
+def replay_progress_batch(receipt, digest):
+    if receipt.payload_digest != digest:
+        return _json_error(
+            "idempotency_key_reused",
+            409,
+            detail="This idempotency key was already used for a different batch.",
+        )
+    return JsonResponse({**receipt.response, "replayed": True})
+
+
+@require_POST
+@rate_limit("progress-batch", limit_setting="RATE_LIMIT_WRITE", default=60)
+def progress_batch_api(request):
+    """Apply an ordered list of typed progress events in one transaction.
+
+    Body: ``{"idempotency_key": "...", "events": [{"type": "letter", "id": "...", "data": {...}}]}``;
+    each ``data`` is what the matching single-event endpoint accepts. Invalid events are
+    reported in their result slot and skipped; the rest are applied with one lock and one
+    save per affected row. Repeating a key returns the stored response unchanged.
+    """
+    if not request.user.is_authenticated:
+        return _json_error("login_required", 401, detail="Please sign in to sync progress.")
+
+    data, error = parse_json_safely(request)
+    if error:
+        return error
+
+    events = data.get("events")
+    if not isinstance(events, list) or not events:
+        return _json_error("events must be a non-empty list", 400)
+    if len(events) > MAX_BATCH_EVENTS:
+        return _json_error(f"A batch may contain at most {MAX_BATCH_EVENTS} events", 400)
+
+    idempotency_key = str(request.headers.get("Idempotency-Key") or data.get("idempotency_key") or "").strip()
+    if len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        return _json_error(f"idempotency_key must be at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters", 400)
+    digest = payload_digest(events)
+    if idempotency_key:
+        receipt = find_receipt(request.user, idempotency_key)
+        if receipt:
+            return replay_progress_batch(receipt, digest)
+
+    # Validation and plan checks run before the transaction so row locks are held only for the writes.
+    results = []
+    planned = []
+    cvc_payloads = []
+    feature_blocks = {}
+    for index, item in enumerate(events):
+        item = item if isinstance(item, dict) else {}
+        event_type = str(item.get("type") or "")
+        result = {"index": index, "id": item.get("id"), "type": event_type}
+        results.append(result)
+
+        handler = PROGRESS_EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            result.update(progress_event_error(_json_error("unknown_event_type", 400, allowed=sorted(PROGRESS_EVENT_HANDLERS))))
+            continue
+        if not isinstance(item.get("data"), dict):
+            result.update(progress_event_error(_json_error("data must be an object", 400)))
+            continue
+        if handler.feature:
+            if handler.feature not in feature_blocks:
+                feature_blocks[handler.feature] = require_feature(request, handler.feature, handler.message)
+            if feature_blocks[handler.feature]:
+                result.update(progress_event_error(feature_blocks[handler.feature]))
+                continue
+
+        event, error = handler.parse(request.user, item["data"])
+        if error:
+            result.update(progress_event_error(error))
+            continue
+        if handler.row is None:
+            cvc_payloads.append((result, event))
+        else:
+            planned.append((result, handler, event))
+
+    totals = None
+    if cvc_payloads:
+        totals = CVCContentTotals(
+            words=get_cached_cvc_content_count("words", CVCWord),
+            sentences=get_cached_cvc_content_count("sentences", CVCSentence, extra=99),
+            stories=get_cached_cvc_content_count("stories", CVCStory, extra=9),
+        )
+
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            rows = LockedRows()
+            specs = [handler.row(request.user, event, now) for _, handler, event in planned]
+            rows.lock_all(specs)
+            finishes = []
+            scored = bool(cvc_payloads)
+            for (result, handler, event), (model, lookup, defaults) in zip(planned, specs):
+                instance, created = rows.lock(model, lookup, defaults)
+                fields, finish = handler.apply(instance, created, event, now)
+                rows.mark_dirty(instance, fields)
+                finishes.append((result, finish))
+                scored = scored or handler.scored
+            rows.flush()
+
+            if cvc_payloads:
+                cvc_progress = serialize_cvc_reading_progress(
+                    fold_cvc_events(request.user.pk, totals, [event for _, event in cvc_payloads])
+                )
+                for result, _ in cvc_payloads:
+                    result.update({"status": "ok", "progress": cvc_progress})
+            for result, finish in finishes:
+                result.update({"status": "ok", **finish()})
+            if scored:
+                refresh_leaderboard_entry(request.user.pk)
+
+            applied = sum(1 for result in results if result["status"] == "ok")
+            payload = {
+                "status": "ok",
+                "replayed": False,
+                "applied": applied,
+                "failed": len(results) - applied,
+                "results": results,
+            }
+            if idempotency_key:
+                store_receipt(request.user, idempotency_key, digest, payload)
+    except IntegrityError:
+        # A concurrent request with the same key committed first; answer with its result.
+        receipt = find_receipt(request.user, idempotency_key) if idempotency_key else None
+        if receipt:
+            return replay_progress_batch(receipt, digest)
+        logger.exception("progress_batch_failed request_id=%s", getattr(request, "request_id", ""))
+        return _json_error("Failed to save progress batch", 500, request_id=getattr(request, "request_id", ""))
+    except Exception:
+        logger.exception("progress_batch_failed request_id=%s", getattr(request, "request_id", ""))
+        return _json_error("Failed to save progress batch", 500, request_id=getattr(request, "request_id", ""))
+
+    return JsonResponse(payload)
+
+
 @csrf_exempt
 @require_POST
 @rate_limit("pronunciation", limit_setting="RATE_LIMIT_PUBLIC_API", default=30)
@@ -0,0 +1,2579 @@
+(function enhanceCvcReadingPage() {
+            const isAuthenticated = document.body.dataset.authenticated === "true";
+            const localKey = "abcz-cvc-reading-progress-v1";
+            const serverProgress = JSON.parse(document.getElementById("cvcInitialProgress")?.textContent || "{}");
+            const pageUrls = JSON.parse(document.getElementById("cvcPageUrls").textContent);
+            const localProgress = JSON.parse(localStorage.getItem(localKey) || "{}");
+            const cvcProgress = {
+                completed_levels: [...new Set([...(serverProgress.completed_levels || []), ...(localProgress.completed_levels || [])])],
+                completed_lessons: [...new Set([...(serverProgress.completed_lessons || []), ...(localProgress.completed_lessons || [])])],
+                completed_families: [...new Set([...(serverProgress.completed_families || []), ...(localProgress.completed_families || [])])],
+                words_practiced: [...new Set([...(serverProgress.words_practiced || []), ...(localProgress.words_practiced || [])])],
+                words_mastered: [...new Set([...(serverProgress.words_mastered || []), ...(localProgress.words_mastered || [])])],
+                needs_review_words: [...new Set([...(serverProgress.needs_review_words || []), ...(localProgress.needs_review_words || [])])],
+                sentences_read: Math.max(serverProgress.sentences_read || 0, localProgress.sentences_read || 0),
+                stories_completed: Math.max(serverProgress.stories_completed || 0, localProgress.stories_completed || 0),
+                quiz_attempts: Math.max(serverProgress.quiz_attempts || 0, localProgress.quiz_attempts || 0),
+                quiz_correct: Math.max(serverProgress.quiz_correct || 0, localProgress.quiz_correct || 0),
+                mic_attempts: Math.max(serverProgress.mic_attempts || 0, localProgress.mic_attempts || 0),
+                mic_success: Math.max(serverProgress.mic_success || 0, localProgress.mic_success || 0),
+                last_word: serverProgress.last_word || localProgress.last_word || "",
+                last_family: serverProgress.last_family || localProgress.last_family || "",
+                last_level: serverProgress.last_level || localProgress.last_level || "CVC",
+                cvc_mastery_percentage: Math.max(serverProgress.cvc_mastery_percentage || 0, localProgress.cvc_mastery_percentage || 0),
+                sentences_mastered: [...new Set([...(serverProgress.sentences_mastered || []), ...(localProgress.sentences_mastered || [])])],
+                sentence_quiz_attempts: Math.max(serverProgress.sentence_quiz_attempts || 0, localProgress.sentence_quiz_attempts || 0),
+                sentence_quiz_correct: Math.max(serverProgress.sentence_quiz_correct || 0, localProgress.sentence_quiz_correct || 0),
+                sentence_microphone_attempts: Math.max(serverProgress.sentence_microphone_attempts || 0, localProgress.sentence_microphone_attempts || 0),
+                sentence_microphone_success: Math.max(serverProgress.sentence_microphone_success || 0, localProgress.sentence_microphone_success || 0),
+                last_sentence: serverProgress.last_sentence || localProgress.last_sentence || "",
+                last_sentence_level: serverProgress.last_sentence_level || localProgress.last_sentence_level || "",
+                common_sentences_completed: Math.max(serverProgress.common_sentences_completed || 0, localProgress.common_sentences_completed || 0),
+                numbers_completed: Math.max(serverProgress.numbers_completed || 0, localProgress.numbers_completed || 0),
+                days_completed: Math.max(serverProgress.days_completed || 0, localProgress.days_completed || 0),
+                months_completed: Math.max(serverProgress.months_completed || 0, localProgress.months_completed || 0),
+                sentence_mastery_percentage: Math.max(serverProgress.sentence_mastery_percentage || 0, localProgress.sentence_mastery_percentage || 0),
+                sentence_best_time_seconds: Math.min(...[serverProgress.sentence_best_time_seconds, localProgress.sentence_best_time_seconds].filter(Boolean), Infinity) || 0,
+                sentence_total_time_seconds: Math.max(serverProgress.sentence_total_time_seconds || 0, localProgress.sentence_total_time_seconds || 0),
+                stories_started: [...new Set([...(serverProgress.stories_started || []), ...(localProgress.stories_started || [])])],
+                story_quiz_attempts: Math.max(serverProgress.story_quiz_attempts || 0, localProgress.story_quiz_attempts || 0),
+                story_quiz_correct: Math.max(serverProgress.story_quiz_correct || 0, localProgress.story_quiz_correct || 0),
+                story_microphone_attempts: Math.max(serverProgress.story_microphone_attempts || 0, localProgress.story_microphone_attempts || 0),
+                story_microphone_success: Math.max(serverProgress.story_microphone_success || 0, localProgress.story_microphone_success || 0),
+                last_story: serverProgress.last_story || localProgress.last_story || "",
+                last_story_level: serverProgress.last_story_level || localProgress.last_story_level || "",
+                story_mastery_percentage: Math.max(serverProgress.story_mastery_percentage || 0, localProgress.story_mastery_percentage || 0),
+                story_best_reading_time: Math.min(...[serverProgress.story_best_reading_time, localProgress.story_best_reading_time].filter(Boolean), Infinity) || 0,
+                story_needs_review: [...new Set([...(serverProgress.story_needs_review || []), ...(localProgress.story_needs_review || [])])],
+                pronoun_lessons_completed: Math.max(serverProgress.pronoun_lessons_completed || 0, localProgress.pronoun_lessons_completed || 0),
+                pronouns_practiced: [...new Set([...(serverProgress.pronouns_practiced || []), ...(localProgress.pronouns_practiced || [])])],
+                pronouns_mastered: [...new Set([...(serverProgress.pronouns_mastered || []), ...(localProgress.pronouns_mastered || [])])],
+                pronoun_quiz_attempts: Math.max(serverProgress.pronoun_quiz_attempts || 0, localProgress.pronoun_quiz_attempts || 0),
+                pronoun_quiz_correct: Math.max(serverProgress.pronoun_quiz_correct || 0, localProgress.pronoun_quiz_correct || 0),
+                pronoun_microphone_attempts: Math.max(serverProgress.pronoun_microphone_attempts || 0, localProgress.pronoun_microphone_attempts || 0),
+                pronoun_microphone_success: Math.max(serverProgress.pronoun_microphone_success || 0, localProgress.pronoun_microphone_success || 0),
+                last_pronoun: serverProgress.last_pronoun || localProgress.last_pronoun || "",
+                last_pronoun_level: serverProgress.last_pronoun_level || localProgress.last_pronoun_level || "",
+                pronoun_mastery_percentage: Math.max(serverProgress.pronoun_mastery_percentage || 0, localProgress.pronoun_mastery_percentage || 0),
+                pronouns_needs_review: [...new Set([...(serverProgress.pronouns_needs_review || []), ...(localProgress.pronouns_needs_review || [])])],
+                sight_words_practiced: [...new Set([...(serverProgress.sight_words_practiced || []), ...(localProgress.sight_words_practiced || [])])],
+                sight_words_mastered: [...new Set([...(serverProgress.sight_words_mastered || []), ...(localProgress.sight_words_mastered || [])])],
+                sight_word_quiz_attempts: Math.max(serverProgress.sight_word_quiz_attempts || 0, localProgress.sight_word_quiz_attempts || 0),
+                sight_word_quiz_correct: Math.max(serverProgress.sight_word_quiz_correct || 0, localProgress.sight_word_quiz_correct || 0),
+                fluency_sentences_read: Math.max(serverProgress.fluency_sentences_read || 0, localProgress.fluency_sentences_read || 0),
+                fluency_attempts: Math.max(serverProgress.fluency_attempts || 0, localProgress.fluency_attempts || 0),
+                best_wpm: Math.max(serverProgress.best_wpm || 0, localProgress.best_wpm || 0),
+                best_reading_time: Math.min(...[serverProgress.best_reading_time, localProgress.best_reading_time].filter(Boolean), Infinity) || 0,
+                fluency_accuracy: Math.max(serverProgress.fluency_accuracy || 0, localProgress.fluency_accuracy || 0),
+                fluency_score: Math.max(serverProgress.fluency_score || 0, localProgress.fluency_score || 0),
+                question_words_mastered: [...new Set([...(serverProgress.question_words_mastered || []), ...(localProgress.question_words_mastered || [])])],
+                conversations_completed: Math.max(serverProgress.conversations_completed || 0, localProgress.conversations_completed || 0),
+                action_verbs_mastered: [...new Set([...(serverProgress.action_verbs_mastered || []), ...(localProgress.action_verbs_mastered || [])])],
+                adjectives_mastered: [...new Set([...(serverProgress.adjectives_mastered || []), ...(localProgress.adjectives_mastered || [])])],
+                calendar_mastered: [...new Set([...(serverProgress.calendar_mastered || []), ...(localProgress.calendar_mastered || [])])],
+                last_fluency_sentence: serverProgress.last_fluency_sentence || localProgress.last_fluency_sentence || "",
+                last_sight_word: serverProgress.last_sight_word || localProgress.last_sight_word || "",
+                last_conversation: serverProgress.last_conversation || localProgress.last_conversation || "",
+                fluency_mastery_percentage: Math.max(serverProgress.fluency_mastery_percentage || 0, localProgress.fluency_mastery_percentage || 0),
+                fluency_attempt_log: localProgress.fluency_attempt_log || {}
+            };
+            const wordLevelNames = ["CVC", "Short Vowels", "Word Families", "Blends", "Digraphs"];
+            let activeCvcLevel = wordLevelNames.includes(cvcProgress.last_level) ? cvcProgress.last_level : "CVC";
+            if (activeCvcLevel === "Word Families") activeCvcLevel = "CVC";
+            let activeShortVowel = activeCvcLevel === "Short Vowels" ? "a" : "all";
+            let apiWordsLoaded = false;
+            let activeSentenceLevel = localProgress.last_sentence_level || serverProgress.last_sentence_level || "cvc";
+            let sentenceTimerInterval = null;
+            let sentenceSeconds = 0;
+            let activeStoryLevel = localProgress.last_story_level || serverProgress.last_story_level || "mini";
+            let activeStoryStep = 0;
+            let activeStorySentenceIndex = 0;
+            let activePronounLevel = localProgress.last_pronoun_level || serverProgress.last_pronoun_level || "subject";
+            let activeFluencyMode = localProgress.active_fluency_mode || "sight";
+            let fluencyTimerState = null;
+
+            function getCookie(name) {
+                return document.cookie.split(";").map(item => item.trim()).find(item => item.startsWith(`${name}=`))?.split("=")[1] || "";
+            }
+
+            function normalizeText(value) {
+                return String(value || "").toLowerCase().replace(/[^a-z\s-]/g, "").replace(/\s+/g, " ").trim();
+            }
+
+            function levenshtein(left, right) {
+                const a = normalizeText(left);
+                const b = normalizeText(right);
+                if (!a.length) return b.length;
+                if (!b.length) return a.length;
+                const matrix = Array.from({ length: a.length + 1 }, (_, i) => [i]);
+                for (let j = 1; j <= b.length; j += 1) matrix[0][j] = j;
+                for (let i = 1; i <= a.length; i += 1) {
+                    for (let j = 1; j <= b.length; j += 1) {
+                        const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+                        matrix[i][j] = Math.min(matrix[i - 1][j] + 1, matrix[i][j - 1] + 1, matrix[i - 1][j - 1] + cost);
+                    }
+                }
+                return matrix[a.length][b.length];
+            }
+
+            function similarity(heard, target) {
+                const h = normalizeText(heard);
+                const t = normalizeText(target);
+                if (!h || !t) return 0;
+                if (h === t || h.includes(t) || t.includes(h)) return 100;
+                return Math.max(0, Math.round((1 - levenshtein(h, t) / Math.max(h.length, t.length)) * 100));
+            }
+
+            const pronounLevels = [
+                { key: "subject", title: "Subject Pronouns", ar: "ضمائر الفاعل", color: "#2563eb", note: "تأتي غالبا في بداية الجملة وتخبرنا من يقوم بالفعل. Example: He can run." },
+                { key: "object", title: "Object Pronouns", ar: "ضمائر المفعول", color: "#059669", note: "تأتي بعد الفعل أو بعد حرف الجر. Example: I see him." },
+                { key: "possessive-adj", title: "Possessive Adjectives", ar: "صفات الملكية", color: "#7c3aed", note: "تأتي قبل الاسم وتدل على الملكية. Example: This is my book." },
+                { key: "possessive-pronoun", title: "Possessive Pronouns", ar: "ضمائر الملكية", color: "#ea580c", note: "تأتي وحدها ولا يأتي بعدها اسم. Example: This book is mine." },
+                { key: "mixed", title: "Mixed Practice", ar: "مراجعة شاملة", color: "#334155", note: "مراجعة تجمع كل أنواع الضمائر داخل جمل قصيرة." },
+            ];
+
+            const pronounSentenceBank = [
+                { id: "i-1", pronoun: "I", level: "subject", type: "subject", sentence: "I am happy.", ar: "أنا سعيد.", emoji: "🙂", question: "أي ضمير فاعل في الجملة؟", options: ["I", "me", "my"], answer: "I" },
+                { id: "i-2", pronoun: "I", level: "subject", type: "subject", sentence: "I can read.", ar: "أنا أستطيع القراءة.", emoji: "📖", question: "اختر الضمير الصحيح: ___ can read.", options: ["I", "him", "mine"], answer: "I" },
+                { id: "i-3", pronoun: "my", level: "possessive-adj", type: "possessive-adj", sentence: "I have a red pen.", ar: "لدي قلم أحمر.", emoji: "✏️", question: "أي كلمة تدل على الملكية قبل الاسم؟", options: ["my", "mine", "me"], answer: "my" },
+                { id: "i-4", pronoun: "my", level: "possessive-adj", type: "possessive-adj", sentence: "I like my book.", ar: "أنا أحب كتابي.", emoji: "📘", question: "my هنا نوعها؟", options: ["Possessive Adjective", "Object", "Subject"], answer: "Possessive Adjective" },
+                { id: "i-5", pronoun: "mine", level: "possessive-pronoun", type: "possessive-pronoun", sentence: "This book is mine.", ar: "هذا الكتاب ملكي.", emoji: "📗", question: "أي ضمير ملكية مستقل؟", options: ["mine", "my", "me"], answer: "mine" },
+                { id: "you-1", pronoun: "You", level: "subject", type: "subject", sentence: "You are kind.", ar: "أنت لطيف.", emoji: "🤝", question: "اختر ضمير الفاعل.", options: ["You", "your", "yours"], answer: "You" },
+                { id: "you-2", pronoun: "You", level: "subject", type: "subject", sentence: "You can run.", ar: "أنت تستطيع الركض.", emoji: "🏃", question: "___ can run.", options: ["You", "him", "their"], answer: "You" },
+                { id: "you-3", pronoun: "your", level: "possessive-adj", type: "possessive-adj", sentence: "You have a blue bag.", ar: "لديك حقيبة زرقاء.", emoji: "🎒", question: "This is ___ bag.", options: ["your", "yours", "you"], answer: "your" },
+                { id: "you-4", pronoun: "your", level: "possessive-adj", type: "possessive-adj", sentence: "This is your pen.", ar: "هذا قلمك.", emoji: "🖊️", question: "your تأتي قبل ماذا؟", options: ["noun", "verb", "period"], answer: "noun" },
+                { id: "you-5", pronoun: "yours", level: "possessive-pronoun", type: "possessive-pronoun", sentence: "This pen is yours.", ar: "هذا القلم لك.", emoji: "🖊️", question: "ضمير الملكية المستقل هو؟", options: ["yours", "your", "you"], answer: "yours" },
+                { id: "he-1", pronoun: "He", level: "subject", type: "subject", sentence: "He is a boy.", ar: "هو ولد.", emoji: "👦", question: "He يستخدم مع؟", options: ["boy", "girl", "things"], answer: "boy" },
+                { id: "he-2", pronoun: "He", level: "subject", type: "subject", sentence: "He can jump.", ar: "هو يستطيع القفز.", emoji: "🦘", question: "اختر ضمير الفاعل.", options: ["He", "him", "his"], answer: "He" },
+                { id: "he-3", pronoun: "him", level: "object", type: "object", sentence: "I see him.", ar: "أنا أراه.", emoji: "👀", question: "him هنا نوعه؟", options: ["Object", "Subject", "Possessive"], answer: "Object" },
+                { id: "he-4", pronoun: "his", level: "possessive-adj", type: "possessive-adj", sentence: "This is his dog.", ar: "هذا كلبه.", emoji: "🐶", question: "his قبل dog نوعه؟", options: ["Possessive Adjective", "Object", "Subject"], answer: "Possessive Adjective" },
+                { id: "he-5", pronoun: "his", level: "possessive-pronoun", type: "possessive-pronoun", sentence: "This dog is his.", ar: "هذا الكلب له.", emoji: "🐶", question: "his في نهاية الجملة نوعه؟", options: ["Possessive Pronoun", "Object", "Subject"], answer: "Possessive Pronoun" },
+                { id: "she-1", pronoun: "She", level: "subject", type: "subject", sentence: "She is a girl.", ar: "هي بنت.", emoji: "👧", question: "She يستخدم مع؟", options: ["girl", "boy", "things"], answer: "girl" },
+                { id: "she-2", pronoun: "She", level: "subject", type: "subject", sentence: "She can sing.", ar: "هي تستطيع الغناء.", emoji: "🎤", question: "اختر ضمير الفاعل.", options: ["She", "her", "hers"], answer: "She" },
+                { id: "she-3", pronoun: "her", level: "object", type: "object", sentence: "I help her.", ar: "أنا أساعدها.", emoji: "🤲", question: "her بعد الفعل نوعها؟", options: ["Object", "Subject", "Possessive Pronoun"], answer: "Object" },
+                { id: "she-4", pronoun: "her", level: "possessive-adj", type: "possessive-adj", sentence: "This is her hat.", ar: "هذه قبعتها.", emoji: "🎩", question: "her قبل hat نوعها؟", options: ["Possessive Adjective", "Object", "Subject"], answer: "Possessive Adjective" },
+                { id: "she-5", pronoun: "hers", level: "possessive-pronoun", type: "possessive-pronoun", sentence: "This hat is hers.", ar: "هذه القبعة لها.", emoji: "🎩", question: "ضمير الملكية المستقل هو؟", options: ["hers", "her", "she"], answer: "hers" },
+                { id: "it-1", pronoun: "It", level: "subject", type: "subject", sentence: "It is a cat.", ar: "إنها قطة.", emoji: "🐱", question: "It يستخدم غالبا مع؟", options: ["animal or thing", "only boys", "only girls"], answer: "animal or thing" },
+                { id: "it-2", pronoun: "It", level: "subject", type: "subject", sentence: "It is small.", ar: "إنه صغير.", emoji: "🔹", question: "اختر الضمير الصحيح.", options: ["It", "They", "We"], answer: "It" },
+                { id: "it-3", pronoun: "it", level: "object", type: "object", sentence: "I like it.", ar: "أنا أحبه.", emoji: "⭐", question: "it بعد like نوعه؟", options: ["Object", "Subject", "Possessive"], answer: "Object" },
+                { id: "it-4", pronoun: "its", level: "possessive-adj", type: "possessive-adj", sentence: "The cat has its bed.", ar: "القطة لديها سريرها.", emoji: "🛏️", question: "its قبل bed نوعها؟", options: ["Possessive Adjective", "Possessive Pronoun", "Object"], answer: "Possessive Adjective" },
+                { id: "it-5", pronoun: "It", level: "mixed", type: "mixed", sentence: "It can sit.", ar: "إنه يستطيع الجلوس.", emoji: "🐱", question: "رتب المعنى: It can sit.", options: ["إنه يستطيع الجلوس", "نحن نلعب", "هذا كتابي"], answer: "إنه يستطيع الجلوس" },
+                { id: "we-1", pronoun: "We", level: "subject", type: "subject", sentence: "We are friends.", ar: "نحن أصدقاء.", emoji: "👥", question: "We تعني؟", options: ["نحن", "هم", "أنا"], answer: "نحن" },
+                { id: "we-2", pronoun: "We", level: "subject", type: "subject", sentence: "We can play.", ar: "نحن نستطيع اللعب.", emoji: "🎮", question: "اختر ضمير الفاعل.", options: ["We", "us", "our"], answer: "We" },
+                { id: "we-3", pronoun: "us", level: "object", type: "object", sentence: "The teacher helps us.", ar: "المعلم يساعدنا.", emoji: "👩‍🏫", question: "us هنا نوعه؟", options: ["Object", "Subject", "Possessive"], answer: "Object" },
+                { id: "we-4", pronoun: "our", level: "possessive-adj", type: "possessive-adj", sentence: "This is our class.", ar: "هذا فصلنا.", emoji: "🏫", question: "our قبل class نوعها؟", options: ["Possessive Adjective", "Object", "Subject"], answer: "Possessive Adjective" },
+                { id: "we-5", pronoun: "ours", level: "possessive-pronoun", type: "possessive-pronoun", sentence: "This class is ours.", ar: "هذا الفصل لنا.", emoji: "🏫", question: "ضمير الملكية المستقل هو؟", options: ["ours", "our", "us"], answer: "ours" },
+                { id: "they-1", pronoun: "They", level: "subject", type: "subject", sentence: "They are students.", ar: "هم طلاب.", emoji: "🧑‍🎓", question: "They تعني؟", options: ["هم", "هو", "هي"], answer: "هم" },
+                { id: "they-2", pronoun: "They", level: "subject", type: "subject", sentence: "They can read.", ar: "هم يستطيعون القراءة.", emoji: "📚", question: "اختر ضمير الفاعل.", options: ["They", "them", "their"], answer: "They" },
+                { id: "they-3", pronoun: "them", level: "object", type: "object", sentence: "I see them.", ar: "أنا أراهم.", emoji: "👀", question: "them هنا نوعه؟", options: ["Object", "Subject", "Possessive"], answer: "Object" },
+                { id: "they-4", pronoun: "their", level: "possessive-adj", type: "possessive-adj", sentence: "This is their school.", ar: "هذه مدرستهم.", emoji: "🏫", question: "their قبل school نوعها؟", options: ["Possessive Adjective", "Object", "Subject"], answer: "Possessive Adjective" },
+                { id: "they-5", pronoun: "theirs", level: "possessive-pronoun", type: "possessive-pronoun", sentence: "This school is theirs.", ar: "هذه المدرسة لهم.", emoji: "🏫", question: "ضمير الملكية المستقل هو؟", options: ["theirs", "their", "them"], answer: "theirs" },
+            ];
+
+            const pronounMiniQuiz = [
+                { level: "subject", prompt: "____ am happy.", options: ["I", "He", "They"], answer: "I", item: "I" },
+                { level: "object", prompt: "She has a cat. I see ____.", options: ["her", "him", "us"], answer: "her", item: "her" },
+                { level: "possessive-adj", prompt: "This is ____ book.", options: ["my", "mine", "me"], answer: "my", item: "my" },
+                { level: "possessive-pronoun", prompt: "This book is ____.", options: ["mine", "my", "me"], answer: "mine", item: "mine" },
+                { level: "mixed", prompt: "Ali and Sara can play. Replace the names.", options: ["They can play.", "He can play.", "It can play."], answer: "They can play.", item: "they" },
+            ];
+
+            const fluencyModes = [
+                { key: "sight", title: "Sight Words", ar: "كلمات شائعة", color: "#0f766e", note: "تعرف سريع على الكلمات التي تتكرر كثيرًا في القراءة." },
+                { key: "fluency", title: "Reading Fluency", ar: "طلاقة القراءة", color: "#2563eb", note: "اقرأ الجملة ثلاث مرات، وسجل الوقت وWPM." },
+                { key: "questions", title: "Question Words", ar: "أدوات السؤال", color: "#7c3aed", note: "who, what, where, when, why, how." },
+                { key: "conversations", title: "Mini Conversations", ar: "محادثات قصيرة", color: "#b45309", note: "استمع للحوار ثم اقرأ كل سطر." },
+                { key: "verbs", title: "Action Verbs", ar: "أفعال يومية", color: "#dc2626", note: "أفعال تساعد المتعلم على بناء جمل مفيدة." },
+                { key: "adjectives", title: "Adjectives", ar: "صفات سهلة", color: "#0369a1", note: "صفات لوصف الأشخاص والأشياء." },
+                { key: "calendar", title: "Numbers + Calendar", ar: "الأرقام والأيام والأشهر", color: "#0891b2", note: "تدريب كتابة ونطق واستماع للأرقام والأيام والأشهر مع أمثلة وأسئلة وأوراق عمل." },
+            ];
+
+            const sightWords = [
+                ["the", "أداة تعريف", "The cat is big.", "القطة كبيرة.", "___ cat is big.", ["The", "My", "He"], "The", 1],
+                ["a", "واحد / أداة نكرة", "I see a dog.", "أرى كلبًا.", "I see ___ dog.", ["a", "the", "we"], "a", 1],
+                ["I", "أنا", "I can read.", "أنا أستطيع القراءة.", "___ can read.", ["I", "me", "my"], "I", 1],
+                ["is", "يكون", "It is big.", "إنه كبير.", "It ___ big.", ["is", "are", "we"], "is", 1],
+                ["in", "في", "The pen is in the bag.", "القلم في الحقيبة.", "The pen is ___ the bag.", ["in", "to", "my"], "in", 1],
+                ["it", "هو/هي لغير العاقل", "I like it.", "أنا أحبه.", "I like ___.", ["it", "he", "we"], "it", 1],
+                ["to", "إلى / أن", "I go to school.", "أذهب إلى المدرسة.", "I go ___ school.", ["to", "in", "said"], "to", 1],
+                ["my", "لي / الخاص بي", "My book is red.", "كتابي أحمر.", "___ book is red.", ["My", "Me", "Mine"], "My", 1],
+                ["you", "أنت", "You can run.", "أنت تستطيع الركض.", "___ can run.", ["You", "Your", "He"], "You", 1],
+                ["we", "نحن", "We can play.", "نحن نستطيع اللعب.", "___ can play.", ["We", "Us", "Our"], "We", 1],
+                ["he", "هو", "He can jump.", "هو يستطيع القفز.", "___ can jump.", ["He", "Him", "His"], "He", 2],
+                ["she", "هي", "She can sing.", "هي تستطيع الغناء.", "___ can sing.", ["She", "Her", "Hers"], "She", 2],
+                ["are", "يكونون", "They are here.", "هم هنا.", "They ___ here.", ["are", "is", "was"], "are", 2],
+                ["was", "كان", "He was happy.", "كان سعيدًا.", "He ___ happy.", ["was", "are", "can"], "was", 2],
+                ["said", "قال", "She said hello.", "قالت مرحبًا.", "She ___ hello.", ["said", "see", "go"], "said", 2],
+                ["come", "تعال", "Come and see.", "تعال وانظر.", "___ and see.", ["Come", "Can", "Like"], "Come", 2],
+                ["go", "اذهب", "I go home.", "أذهب إلى البيت.", "I ___ home.", ["go", "see", "said"], "go", 2],
+                ["see", "يرى", "I see the cat.", "أرى القطة.", "I ___ the cat.", ["see", "come", "was"], "see", 2],
+                ["can", "يستطيع", "I can read.", "أستطيع القراءة.", "I ___ read.", ["can", "are", "said"], "can", 2],
+                ["like", "يحب", "We like to play.", "نحب اللعب.", "We ___ to play.", ["like", "look", "make"], "like", 2],
+                ["have", "لديه", "I have a pen.", "لدي قلم.", "I ___ a pen.", ["have", "here", "that"], "have", 3],
+                ["here", "هنا", "They are here.", "هم هنا.", "They are ___.", ["here", "there", "with"], "here", 3],
+                ["there", "هناك", "The book is there.", "الكتاب هناك.", "The book is ___.", ["there", "here", "for"], "there", 3],
+                ["this", "هذا", "This is my book.", "هذا كتابي.", "___ is my book.", ["This", "That", "There"], "This", 3],
+                ["that", "ذلك", "That is a big dog.", "ذلك كلب كبير.", "___ is a big dog.", ["That", "This", "Have"], "That", 3],
+                ["look", "انظر", "Look at me.", "انظر إلي.", "___ at me.", ["Look", "Like", "Read"], "Look", 3],
+                ["play", "يلعب", "We play together.", "نلعب معًا.", "We ___ together.", ["play", "read", "make"], "play", 3],
+                ["with", "مع", "Play with me.", "العب معي.", "Play ___ me.", ["with", "for", "to"], "with", 3],
+                ["for", "من أجل", "This is for you.", "هذا لك.", "This is ___ you.", ["for", "with", "in"], "for", 3],
+                ["me", "ني / ي", "Help me.", "ساعدني.", "Help ___.", ["me", "my", "I"], "me", 3],
+                ["your", "الخاص بك", "Open your book.", "افتح كتابك.", "Open ___ book.", ["your", "you", "yours"], "your", 4],
+                ["they", "هم", "They can read.", "هم يستطيعون القراءة.", "___ can read.", ["They", "Them", "Their"], "They", 4],
+                ["do", "يفعل", "Do you like it?", "هل تحبه؟", "___ you like it?", ["Do", "Does", "Are"], "Do", 4],
+                ["does", "يفعل للمفرد", "Does he read?", "هل هو يقرأ؟", "___ he read?", ["Does", "Do", "Are"], "Does", 4],
+                ["little", "صغير", "The little cat can run.", "القطة الصغيرة تستطيع الركض.", "The ___ cat can run.", ["little", "big", "read"], "little", 4],
+                ["big", "كبير", "The dog is big.", "الكلب كبير.", "The dog is ___.", ["big", "little", "help"], "big", 4],
+                ["want", "يريد", "I want to read.", "أريد أن أقرأ.", "I ___ to read.", ["want", "make", "does"], "want", 4],
+                ["help", "يساعد", "I can help you.", "أستطيع مساعدتك.", "I can ___ you.", ["help", "read", "do"], "help", 4],
+                ["make", "يصنع", "We make a card.", "نصنع بطاقة.", "We ___ a card.", ["make", "want", "your"], "make", 4],
+                ["read", "يقرأ", "You can read.", "أنت تستطيع القراءة.", "You can ___.", ["read", "make", "big"], "read", 4],
+            ].map((item, index) => ({ id: `sw-${index}`, word: item[0], meaning: item[1], sentence: item[2], ar: item[3], prompt: item[4], options: item[5], answer: item[6], level: item[7] }));
+
+            const fluencySentences = [
+                ["repeated", "I can see.", "أستطيع أن أرى."], ["repeated", "I can run.", "أستطيع الركض."], ["repeated", "I can jump.", "أستطيع القفز."], ["repeated", "We can play.", "نستطيع اللعب."], ["repeated", "You can read.", "تستطيع القراءة."], ["repeated", "He can run.", "هو يستطيع الركض."], ["repeated", "She can sing.", "هي تستطيع الغناء."], ["repeated", "It is big.", "إنه كبير."], ["repeated", "The cat is big.", "القطة كبيرة."], ["repeated", "The dog can run.", "الكلب يستطيع الركض."],
+                ["cvc", "The cat sat on the mat.", "جلست القطة على الحصيرة."], ["cvc", "The dog ran to the log.", "ركض الكلب إلى جذع الشجرة."], ["cvc", "The sun is hot.", "الشمس حارة."], ["cvc", "I see a red pen.", "أرى قلمًا أحمر."], ["cvc", "The bug is on the rug.", "الحشرة على السجادة."], ["cvc", "We run and hop.", "نركض ونقفز."], ["cvc", "The pup is big.", "الجرو كبير."], ["cvc", "I sit on the mat.", "أجلس على الحصيرة."],
+                ["sight", "I see the cat.", "أرى القطة."], ["sight", "You can see the dog.", "تستطيع رؤية الكلب."], ["sight", "We like to play.", "نحب اللعب."], ["sight", "She has my book.", "لديها كتابي."], ["sight", "He can go to school.", "هو يستطيع الذهاب إلى المدرسة."], ["sight", "They are here.", "هم هنا."], ["sight", "Come and see.", "تعال وانظر."], ["sight", "I want to read.", "أريد أن أقرأ."],
+                ["mixed", "The little cat is on the mat.", "القطة الصغيرة على الحصيرة."], ["mixed", "I can see a big dog.", "أستطيع رؤية كلب كبير."], ["mixed", "She said, come here.", "قالت: تعال هنا."], ["mixed", "We go to school and read.", "نذهب إلى المدرسة ونقرأ."], ["mixed", "They play with the red ball.", "يلعبون بالكرة الحمراء."], ["mixed", "My book is on the desk.", "كتابي على المكتب."],
+                ["paragraph", "I see the cat. The cat is little. The cat can run.", "أرى القطة. القطة صغيرة. القطة تستطيع الركض."], ["paragraph", "We go to school. We read a book. We like to learn.", "نذهب إلى المدرسة. نقرأ كتابًا. نحب التعلم."],
+            ].map((item, index) => ({ id: `fl-${index}`, level: item[0], sentence: item[1], ar: item[2], words: item[1].replace(/[^\w\s]/g, "").split(/\s+/).filter(Boolean).length }));
+
+            const questionWords = [
+                ["who", "من", "Who is he?", "من هو؟"], ["what", "ماذا", "What is this?", "ما هذا؟"], ["where", "أين", "Where is the cat?", "أين القطة؟"], ["when", "متى", "When do you read?", "متى تقرأ؟"], ["why", "لماذا", "Why are you happy?", "لماذا أنت سعيد؟"], ["how", "كيف", "How are you?", "كيف حالك؟"],
+            ].map((item, index) => ({ id: `qw-${index}`, word: item[0], meaning: item[1], sentence: item[2], ar: item[3] }));
+
+            const miniConversations = [
+                ["Hello", ["A: Hello!", "B: Hello!"], "مرحبًا / مرحبًا"], ["Name", ["A: What is your name?", "B: My name is Ali."], "ما اسمك؟ اسمي علي."], ["Feeling", ["A: How are you?", "B: I am fine."], "كيف حالك؟ أنا بخير."], ["Play", ["A: Can I play?", "B: Yes, you can."], "هل أستطيع اللعب؟ نعم تستطيع."], ["Class", ["A: May I come in?", "B: Yes, come in."], "هل أستطيع الدخول؟ نعم تفضل."], ["Help", ["A: I need help.", "B: I can help you."], "أحتاج مساعدة. أستطيع مساعدتك."],
+            ].map((item, index) => ({ id: `cv-${index}`, title: item[0], lines: item[1], ar: item[2] }));
+
+            const actionVerbs = [
+                ["run", "يركض", "🏃", "I can run."], ["jump", "يقفز", "⬆️", "She can jump."], ["sit", "يجلس", "🪑", "I sit down."], ["stand", "يقف", "🧍", "Stand up."], ["read", "يقرأ", "📖", "I can read."], ["write", "يكتب", "✏️", "I write my name."], ["eat", "يأكل", "🍎", "I eat an apple."], ["drink", "يشرب", "🥤", "I drink water."], ["play", "يلعب", "🎮", "We play together."], ["open", "يفتح", "📖", "Open your book."], ["close", "يغلق", "🚪", "Close the door."], ["look", "ينظر", "👀", "Look at me."], ["listen", "يستمع", "👂", "Listen to me."], ["help", "يساعد", "🤝", "I can help you."], ["draw", "يرسم", "🎨", "I can draw."], ["sing", "يغني", "🎤", "She can sing."],
+            ].map((item, index) => ({ id: `av-${index}`, word: item[0], meaning: item[1], emoji: item[2], sentence: item[3] }));
+
+            const adjectives = [
+                ["big", "كبير", "🐶", "The dog is big."], ["small", "صغير", "🐱", "The cat is small."], ["red", "أحمر", "🔴", "The pen is red."], ["blue", "أزرق", "🔵", "The bag is blue."], ["green", "أخضر", "🟢", "The leaf is green."], ["hot", "حار", "☀️", "The sun is hot."], ["cold", "بارد", "❄️", "The water is cold."], ["happy", "سعيد", "🙂", "I am happy."], ["sad", "حزين", "🙁", "She is sad."], ["fast", "سريع", "⚡", "The car is fast."], ["slow", "بطيء", "🐢", "The bus is slow."], ["good", "جيد", "⭐", "This is good."], ["bad", "سيئ", "⛔", "This is bad."], ["tall", "طويل", "📏", "He is tall."], ["short", "قصير", "↕️", "It is short."],
+            ].map((item, index) => ({ id: `ad-${index}`, word: item[0], meaning: item[1], emoji: item[2], sentence: item[3] }));
+
+            const numberWords = [
+                [0, "zero", "صفر", "I have zero pencils.", "How many pencils do I have?", ["zero", "seven", "ten"], "zero"],
+                [1, "one", "واحد", "I have one book.", "How many books do I have?", ["one", "two", "three"], "one"],
+                [2, "two", "اثنان", "I see two cats.", "How many cats do I see?", ["three", "two", "ten"], "two"],
+                [3, "three", "ثلاثة", "There are three bags.", "How many bags are there?", ["three", "four", "six"], "three"],
+                [4, "four", "أربعة", "I draw four stars.", "How many stars do I draw?", ["five", "four", "one"], "four"],
+                [5, "five", "خمسة", "She has five pens.", "How many pens does she have?", ["five", "nine", "two"], "five"],
+                [6, "six", "ستة", "We count six ducks.", "How many ducks do we count?", ["six", "seven", "eight"], "six"],
+                [7, "seven", "سبعة", "There are seven days.", "How many days are in a week?", ["seven", "six", "twelve"], "seven"],
+                [8, "eight", "ثمانية", "I see eight balls.", "How many balls do I see?", ["nine", "eight", "three"], "eight"],
+                [9, "nine", "تسعة", "He has nine cards.", "How many cards does he have?", ["nine", "ten", "five"], "nine"],
+                [10, "ten", "عشرة", "I can count to ten.", "What number comes after nine?", ["ten", "one", "six"], "ten"],
+                [11, "eleven", "أحد عشر", "There are eleven flowers.", "How many flowers are there?", ["eleven", "twelve", "seven"], "eleven"],
+                [12, "twelve", "اثنا عشر", "There are twelve months.", "How many months are in a year?", ["ten", "twelve", "twenty"], "twelve"],
+                [13, "thirteen", "ثلاثة عشر", "I read thirteen words.", "How many words do I read?", ["thirteen", "thirty", "three"], "thirteen"],
+                [14, "fourteen", "أربعة عشر", "We have fourteen crayons.", "How many crayons do we have?", ["forty", "fourteen", "four"], "fourteen"],
+                [15, "fifteen", "خمسة عشر", "She writes fifteen numbers.", "How many numbers does she write?", ["fifty", "five", "fifteen"], "fifteen"],
+                [16, "sixteen", "ستة عشر", "I see sixteen birds.", "How many birds do I see?", ["sixteen", "sixty", "six"], "sixteen"],
+                [17, "seventeen", "سبعة عشر", "He has seventeen stickers.", "How many stickers does he have?", ["seventeen", "seven", "seventy"], "seventeen"],
+                [18, "eighteen", "ثمانية عشر", "There are eighteen apples.", "How many apples are there?", ["eight", "eighteen", "eighty"], "eighteen"],
+                [19, "nineteen", "تسعة عشر", "I count nineteen blocks.", "How many blocks do I count?", ["nineteen", "nine", "ninety"], "nineteen"],
+                [20, "twenty", "عشرون", "We have twenty minutes.", "How many minutes do we have?", ["twelve", "twenty", "two"], "twenty"],
+            ].map((item) => ({ id: `num-${item[0]}`, kind: "number", symbol: String(item[0]), word: item[1], meaning: item[2], sentence: item[3], question: item[4], options: item[5], answer: item[6] }));
+
+            const dayWords = [
+                ["Monday", "الاثنين", "I read on Monday.", "What day comes after Sunday?", ["Monday", "Friday", "June"], "Monday"],
+                ["Tuesday", "الثلاثاء", "I write on Tuesday.", "What day comes after Monday?", ["Sunday", "Tuesday", "March"], "Tuesday"],
+                ["Wednesday", "الأربعاء", "We play on Wednesday.", "What day is in the middle of the school week?", ["Wednesday", "Saturday", "July"], "Wednesday"],
+                ["Thursday", "الخميس", "I draw on Thursday.", "What day comes after Wednesday?", ["Thursday", "April", "Monday"], "Thursday"],
+                ["Friday", "الجمعة", "We rest on Friday.", "What day comes after Thursday?", ["May", "Friday", "Tuesday"], "Friday"],
+                ["Saturday", "السبت", "I visit my family on Saturday.", "What day comes before Sunday?", ["Saturday", "January", "Wednesday"], "Saturday"],
+                ["Sunday", "الأحد", "School starts on Sunday.", "What day comes after Saturday?", ["Sunday", "October", "Friday"], "Sunday"],
+            ].map((item, index) => ({ id: `day-${index}`, kind: "day", symbol: "Day", word: item[0], meaning: item[1], sentence: item[2], question: item[3], options: item[4], answer: item[5] }));
+
+            const monthWords = [
+                ["January", "يناير", "January is the first month.", "What is the first month?", ["January", "June", "Sunday"], "January"],
+                ["February", "فبراير", "February is a short month.", "Which month is short?", ["Friday", "February", "August"], "February"],
+                ["March", "مارس", "March comes after February.", "What month comes after February?", ["March", "Monday", "May"], "March"],
+                ["April", "أبريل", "April has spring days.", "Which word is a month?", ["April", "Tuesday", "seven"], "April"],
+                ["May", "مايو", "May comes before June.", "What month comes before June?", ["May", "Friday", "nine"], "May"],
+                ["June", "يونيو", "June is month number six.", "What is month number six?", ["June", "July", "Sunday"], "June"],
+                ["July", "يوليو", "July comes after June.", "What month comes after June?", ["July", "January", "Monday"], "July"],
+                ["August", "أغسطس", "August is a summer month.", "Which month is in summer?", ["August", "Tuesday", "ten"], "August"],
+                ["September", "سبتمبر", "September starts a new school year.", "Which word is a month?", ["Saturday", "September", "three"], "September"],
+                ["October", "أكتوبر", "October comes after September.", "What month comes after September?", ["October", "Sunday", "April"], "October"],
+                ["November", "نوفمبر", "November comes before December.", "What month comes before December?", ["November", "Monday", "March"], "November"],
+                ["December", "ديسمبر", "December is the last month.", "What is the last month?", ["December", "Friday", "twelve"], "December"],
+            ].map((item, index) => ({ id: `month-${index}`, kind: "month", symbol: "Month", word: item[0], meaning: item[1], sentence: item[2], question: item[3], options: item[4], answer: item[5] }));
+
+            const calendarLearningItems = [...numberWords, ...dayWords, ...monthWords];
+
+            const storyLevels = [
+                { key: "mini", title: "CVC Mini Stories", ar: "قصص CVC قصيرة", color: "#2255d8" },
+                { key: "sentence", title: "Sentence Stories", ar: "قصص الجمل", color: "#0f8b75" },
+                { key: "daily", title: "Daily Life Stories", ar: "قصص يومية", color: "#7c3aed" },
+                { key: "numbers", title: "Number Stories", ar: "قصص الأرقام", color: "#b45309" },
+                { key: "days-months", title: "Days and Months Stories", ar: "قصص الأيام والشهور", color: "#be185d" },
+                { key: "pronoun", title: "Pronoun Stories", ar: "قصص الضمائر", color: "#0369a1" },
+                { key: "mixed", title: "Mixed Review Stories", ar: "قصص مراجعة شاملة", color: "#334155" },
+            ];
+
+            const storySteps = ["Preview Words", "Listen", "Read Sentences", "Read Aloud", "Quiz", "Complete"];
+
+            const extraStoryBank = [
+                {
+                    id: "extra-cat-mat", title: "The Cat on the Mat", level: "mini", category: "CVC Mini Stories", difficulty: 1, emoji: "🐱",
+                    target_words: ["cat", "mat", "hat", "rat", "ran", "bag"],
+                    content: "The cat sat on the mat.\nThe cat had a red hat.\nThe cat saw a rat.\nThe rat ran to the bag.",
+                    arabic_explanation: "جلست القطة على الحصيرة.\nكان لدى القطة قبعة حمراء.\nرأت القطة فأرًا.\nركض الفأر إلى الحقيبة."
+                },
+                {
+                    id: "extra-big-dog", title: "The Big Dog", level: "mini", category: "CVC Mini Stories", difficulty: 1, emoji: "🐶",
+                    target_words: ["dog", "big", "run", "log", "sat", "sun"],
+                    content: "The dog is big.\nThe dog can run.\nThe dog ran to the log.\nThe dog sat in the sun.",
+                    arabic_explanation: "الكلب كبير.\nالكلب يستطيع الركض.\nركض الكلب إلى جذع الشجرة.\nجلس الكلب في الشمس."
+                },
+                {
+                    id: "extra-red-pen", title: "The Red Pen", level: "sentence", category: "Sentence Stories", difficulty: 1, emoji: "✏️",
+                    target_words: ["red", "pen", "bed", "Ben"],
+                    content: "I see a red pen.\nThe pen is on the bed.\nBen has the pen.\nBen can write.",
+                    arabic_explanation: "أرى قلمًا أحمر.\nالقلم على السرير.\nبن لديه القلم.\nبن يستطيع الكتابة."
+                },
+                {
+                    id: "extra-bug-rug", title: "The Bug on the Rug", level: "mini", category: "CVC Mini Stories", difficulty: 1, emoji: "🐛",
+                    target_words: ["bug", "rug", "run", "mug", "fun"],
+                    content: "A bug is on the rug.\nThe bug can run.\nThe bug hid in a mug.\nThe bug is fun.",
+                    arabic_explanation: "حشرة على السجادة.\nالحشرة تستطيع الركض.\nاختبأت الحشرة في كوب.\nالحشرة مرحة."
+                },
+                {
+                    id: "extra-hot-sun", title: "The Sun is Hot", level: "daily", category: "Daily Life Stories", difficulty: 1, emoji: "☀️",
+                    target_words: ["sun", "hot", "run", "bus", "red"],
+                    content: "The sun is hot.\nI run in the sun.\nI see a bus.\nThe bus is red.",
+                    arabic_explanation: "الشمس حارة.\nأركض في الشمس.\nأرى حافلة.\nالحافلة حمراء."
+                },
+                {
+                    id: "extra-two-cats", title: "Two Cats", level: "numbers", category: "Number Stories", difficulty: 1, emoji: "2️⃣",
+                    target_words: ["two", "cats", "run", "mat"],
+                    content: "I see two cats.\nThe cats run to the mat.\nOne cat has a hat.\nTwo cats sit down.",
+                    arabic_explanation: "أرى قطتين.\nتركض القطتان إلى الحصيرة.\nقطة واحدة لديها قبعة.\nجلست قطتان."
+                },
+                {
+                    id: "extra-monday", title: "Monday Reading", level: "days-months", category: "Days and Months Stories", difficulty: 2, emoji: "📅",
+                    target_words: ["Monday", "read", "book", "school"],
+                    content: "Today is Monday.\nI go to school.\nI read a book.\nMonday is a good day.",
+                    arabic_explanation: "اليوم هو الاثنين.\nأذهب إلى المدرسة.\nأقرأ كتابًا.\nالاثنين يوم جيد."
+                },
+                {
+                    id: "extra-we-play", title: "We Play", level: "pronoun", category: "Pronoun Stories", difficulty: 2, emoji: "👥",
+                    target_words: ["we", "our", "they", "us"],
+                    content: "We play in the sun.\nOur ball is red.\nThey run with us.\nWe have fun.",
+                    arabic_explanation: "نحن نلعب في الشمس.\nكرتنا حمراء.\nهم يركضون معنا.\nنحن نستمتع."
+                },
+                {
+                    id: "extra-mixed-review", title: "A Fun Review", level: "mixed", category: "Mixed Review Stories", difficulty: 2, emoji: "⭐",
+                    target_words: ["cat", "run", "dog", "sit", "we", "Monday", "two"],
+                    content: "The cat can run.\nThe dog can sit.\nWe read on Monday.\nTwo cats nap.\nIt is a fun review.",
+                    arabic_explanation: "القطة تستطيع الركض.\nالكلب يستطيع الجلوس.\nنقرأ يوم الاثنين.\nقطتان تأخذان قيلولة.\nإنها مراجعة ممتعة."
+                },
+            ];
+
+            const sentenceLevels = [
+                { key: "cvc", title: "CVC Sentences", ar: "جمل CVC", color: "#2255d8", note: "جمل قصيرة مبنية على كلمات CVC، مناسبة بعد إتقان الكلمات." },
+                { key: "common", title: "Common Sentences", ar: "الجمل الشائعة", color: "#0f8b75", note: "جمل مفيدة داخل الفصل والتواصل اليومي مع المعلم." },
+                { key: "daily", title: "Daily Life", ar: "الحياة اليومية", color: "#7c3aed", note: "جمل عن الروتين اليومي والمشاعر والاحتياجات." },
+                { key: "numbers", title: "Numbers", ar: "الأرقام", color: "#b45309", note: "قراءة الأرقام داخل جمل قصيرة من 1 إلى 20 كبداية." },
+                { key: "days", title: "Days", ar: "أيام الأسبوع", color: "#be185d", note: "جمل عن أيام الأسبوع وترتيبها." },
+                { key: "months", title: "Months", ar: "الشهور", color: "#0369a1", note: "جمل عن شهور السنة والمناسبات." },
+                { key: "mixed", title: "Mixed Reading", ar: "مراجعة مختلطة", color: "#334155", note: "مراجعة تربط كلمة ثم جملة ثم رقم أو يوم أو شهر." },
+            ];
+
+            const cvcSentenceText = [
+                ["The cat sat on the mat.", "جلست القطة على الحصيرة.", "🐱", ["cat", "sat", "mat"]],
+                ["A cat sat on a mat.", "قطة جلست على حصيرة.", "🐱", ["cat", "sat", "mat"]],
+                ["A big dog ran to the log.", "ركض كلب كبير إلى جذع الشجرة.", "🐶", ["big", "dog", "ran", "log"]],
+                ["The hen is in the pen.", "الدجاجة في الحظيرة.", "🐔", ["hen", "pen"]],
+                ["I see a red pen on the bed.", "أرى قلمًا أحمر على السرير.", "✏️", ["red", "pen", "bed"]],
+                ["A fox ran in the sun.", "ركض الثعلب تحت الشمس.", "🦊", ["fox", "ran", "sun"]],
+                ["The rat hid in a box.", "اختبأ الجرذ في صندوق.", "📦", ["rat", "hid", "box"]],
+                ["A rat hid in a pot.", "اختبأ جرذ في قدر.", "🍲", ["rat", "hid", "pot"]],
+                ["A bat can hop and run.", "يستطيع الخفاش أن يقفز ويركض.", "🦇", ["bat", "hop", "run"]],
+                ["Put on your hat and get in the bus.", "البس قبعتك واركب الحافلة.", "🚌", ["hat", "get", "bus"]],
+                ["The kid is big.", "الطفل كبير.", "🧒", ["kid", "big"]],
+                ["I can see fog on the top.", "أستطيع رؤية ضباب في الأعلى.", "🌫️", ["fog", "top"]],
+                ["The sun is hot.", "الشمس حارة.", "☀️", ["sun", "hot"]],
+                ["I run in the sun for fun.", "أركض في الشمس للمرح.", "🏃", ["run", "sun", "fun"]],
+                ["A bug is on the log.", "حشرة على جذع الشجرة.", "🐛", ["bug", "log"]],
+                ["We sat in the mud.", "جلسنا في الطين.", "🟤", ["sat", "mud"]],
+                ["Mom has a hot bun.", "أمي لديها خبز ساخن.", "🥐", ["mom", "hot", "bun"]],
+                ["Dad cut a big nut.", "قطع أبي جوزة كبيرة.", "🥜", ["dad", "cut", "nut"]],
+                ["I put jam in a can.", "وضعت المربى في علبة.", "🥫", ["jam", "can"]],
+                ["The bag is on the bed.", "الحقيبة على السرير.", "🎒", ["bag", "bed"]],
+                ["I see a red hat.", "أرى قبعة حمراء.", "🧢", ["red", "hat"]],
+                ["The pen is in the box.", "القلم في الصندوق.", "📦", ["pen", "box"]],
+                ["We run and hop.", "نحن نركض ونقفز.", "🏃", ["run", "hop"]],
+                ["Mom and Dad hug me.", "أمي وأبي يعانقانني.", "🤗", ["mom", "dad", "hug"]],
+                ["I sit on the mat.", "أجلس على الحصيرة.", "🧘", ["sit", "mat"]],
+                ["The cat has a hat.", "القطة لديها قبعة.", "🎩", ["cat", "hat"]],
+                ["The bat is in the bag.", "الخفاش في الحقيبة.", "🎒", ["bat", "bag"]],
+                ["Dad has a map.", "أبي لديه خريطة.", "🗺️", ["dad", "map"]],
+                ["The fan is on the mat.", "المروحة على الحصيرة.", "💨", ["fan", "mat"]],
+                ["I see a can.", "أرى علبة.", "🥫", ["can"]],
+                ["The man has a pan.", "الرجل لديه مقلاة.", "🍳", ["man", "pan"]],
+                ["The rat ran fast.", "ركض الجرذ بسرعة.", "🐭", ["rat", "ran"]],
+                ["The cap is red.", "القبعة حمراء.", "🧢", ["cap", "red"]],
+                ["The hen is red.", "الدجاجة حمراء.", "🐔", ["hen", "red"]],
+                ["I see ten pens.", "أرى عشرة أقلام.", "🔟", ["ten", "pens"]],
+                ["The pet is on the bed.", "الحيوان الأليف على السرير.", "🐾", ["pet", "bed"]],
+                ["The web is wet.", "الشبكة مبللة.", "🕸️", ["web", "wet"]],
+                ["The men sit.", "الرجال يجلسون.", "👥", ["men", "sit"]],
+                ["The red pen is in the net.", "القلم الأحمر في الشبكة.", "🥅", ["red", "pen", "net"]],
+                ["Ben has a pet.", "بن لديه حيوان أليف.", "🐾", ["Ben", "pet"]],
+                ["The egg is in the box.", "البيضة في الصندوق.", "🥚", ["egg", "box"]],
+                ["The kid can sit.", "الطفل يستطيع الجلوس.", "🧒", ["kid", "sit"]],
+                ["The big kid can run.", "الطفل الكبير يستطيع الركض.", "🏃", ["big", "kid", "run"]],
+                ["I see a fish.", "أرى سمكة.", "🐟", ["fish"]],
+                ["The pin is in the box.", "الدبوس في الصندوق.", "📍", ["pin", "box"]],
+                ["The wig is red.", "الباروكة حمراء.", "💇", ["wig", "red"]],
+                ["The kid has a big bag.", "الطفل لديه حقيبة كبيرة.", "🎒", ["kid", "big", "bag"]],
+                ["The lid is on the bin.", "الغطاء على السلة.", "🗑️", ["lid", "bin"]],
+                ["The bug is in the mud.", "الحشرة في الطين.", "🐛", ["bug", "mud"]],
+                ["The dog is hot.", "الكلب يشعر بالحر.", "🐶", ["dog", "hot"]],
+                ["The fox is on the log.", "الثعلب على جذع الشجرة.", "🦊", ["fox", "log"]],
+                ["The pot is on the top.", "القدر في الأعلى.", "🍲", ["pot", "top"]],
+                ["I see a box.", "أرى صندوقًا.", "📦", ["box"]],
+                ["The mop is wet.", "الممسحة مبللة.", "🧹", ["mop", "wet"]],
+                ["The dog can hop.", "الكلب يستطيع القفز.", "🐶", ["dog", "hop"]],
+                ["The fox ran to the box.", "ركض الثعلب إلى الصندوق.", "🦊", ["fox", "ran", "box"]],
+                ["Mom has a pot.", "أمي لديها قدر.", "🍲", ["mom", "pot"]],
+                ["The sun is up.", "الشمس مشرقة.", "☀️", ["sun", "up"]],
+                ["The bug is on the rug.", "الحشرة على السجادة.", "🐛", ["bug", "rug"]],
+                ["I run for fun.", "أركض للمرح.", "🏃", ["run", "fun"]],
+                ["The cup is red.", "الكوب أحمر.", "☕", ["cup", "red"]],
+                ["The bus is big.", "الحافلة كبيرة.", "🚌", ["bus", "big"]],
+                ["The pup is on the rug.", "الجرو على السجادة.", "🐶", ["pup", "rug"]],
+                ["I see a nut.", "أرى جوزة.", "🥜", ["nut"]],
+                ["The mud is wet.", "الطين مبلل.", "🟤", ["mud", "wet"]],
+            ];
+
+            const commonSentenceText = [
+                ["May I come in?", "هل يمكنني الدخول؟", "🚪"], ["May I go out?", "هل يمكنني الخروج؟", "🚶"],
+                ["Can I drink water?", "هل أستطيع شرب الماء؟", "💧"], ["Can I go to the bathroom?", "هل أستطيع الذهاب إلى الحمام؟", "🚻"],
+                ["I finished my work.", "أنهيت عملي.", "✅"], ["I need help.", "أحتاج مساعدة.", "🙋"],
+                ["I do not understand.", "أنا لا أفهم.", "❓"], ["Please repeat.", "من فضلك أعد.", "🔁"],
+                ["Open your book.", "افتح كتابك.", "📖"], ["Close your book.", "أغلق كتابك.", "📕"],
+                ["Listen carefully.", "استمع جيدًا.", "👂"], ["Raise your hand.", "ارفع يدك.", "✋"],
+                ["Sit down.", "اجلس.", "🪑"], ["Stand up.", "قف.", "🧍"],
+                ["Be quiet, please.", "كن هادئًا من فضلك.", "🤫"], ["Good job.", "عمل رائع.", "🌟"],
+                ["Try again.", "حاول مرة أخرى.", "🔄"], ["Well done.", "أحسنت.", "🏆"],
+            ];
+
+            const dailySentenceText = [
+                ["I wake up early.", "أستيقظ مبكرًا.", "⏰"], ["I eat breakfast.", "أتناول الفطور.", "🍳"],
+                ["I go to school.", "أذهب إلى المدرسة.", "🏫"], ["I play with my friends.", "ألعب مع أصدقائي.", "⚽"],
+                ["I read a book.", "أقرأ كتابًا.", "📚"], ["I drink water.", "أشرب الماء.", "💧"],
+                ["I wash my hands.", "أغسل يدي.", "🧼"], ["I brush my teeth.", "أفرش أسناني.", "🪥"],
+                ["I like apples.", "أحب التفاح.", "🍎"], ["I love my family.", "أحب عائلتي.", "👨‍👩‍👧"],
+                ["I can run.", "أستطيع الركض.", "🏃"], ["I can jump.", "أستطيع القفز.", "🦘"],
+                ["I am happy.", "أنا سعيد.", "😊"], ["I am tired.", "أنا متعب.", "😴"],
+                ["I am hungry.", "أنا جائع.", "🍽️"], ["I am thirsty.", "أنا عطشان.", "🥤"],
+            ];
+
+            const numberSentenceText = [
+                ["I have one pen.", "لدي قلم واحد.", "1️⃣", "one"], ["I see two cats.", "أرى قطتين.", "2️⃣", "two"],
+                ["I have three books.", "لدي ثلاثة كتب.", "3️⃣", "three"], ["Four dogs can run.", "أربعة كلاب تستطيع الركض.", "4️⃣", "four"],
+                ["Five birds can fly.", "خمسة طيور تستطيع الطيران.", "5️⃣", "five"], ["I see six cups.", "أرى ستة أكواب.", "6️⃣", "six"],
+                ["I have seven stars.", "لدي سبعة نجوم.", "7️⃣", "seven"], ["Eight kids can jump.", "ثمانية أطفال يستطيعون القفز.", "8️⃣", "eight"],
+                ["Nine cats sat.", "جلست تسع قطط.", "9️⃣", "nine"], ["Ten pens are red.", "عشرة أقلام حمراء.", "🔟", "ten"],
+            ];
+
+            const daySentenceText = [
+                ["Today is Monday.", "اليوم هو الاثنين.", "📅", "Monday"], ["I go to school on Sunday.", "أذهب إلى المدرسة يوم الأحد.", "🏫", "Sunday"],
+                ["I play on Friday.", "ألعب يوم الجمعة.", "⚽", "Friday"], ["We read on Tuesday.", "نقرأ يوم الثلاثاء.", "📖", "Tuesday"],
+                ["I have English on Wednesday.", "لدي إنجليزي يوم الأربعاء.", "🔤", "Wednesday"], ["I visit my family on Saturday.", "أزور عائلتي يوم السبت.", "👨‍👩‍👧", "Saturday"],
+                ["Thursday is a school day.", "الخميس يوم دراسي.", "🎒", "Thursday"],
+            ];
+
+            const monthSentenceText = [
+                ["My birthday is in January.", "عيد ميلادي في يناير.", "🎂", "January"], ["School starts in September.", "تبدأ المدرسة في سبتمبر.", "🏫", "September"],
+                ["It is hot in July.", "الجو حار في يوليو.", "☀️", "July"], ["It is cold in December.", "الجو بارد في ديسمبر.", "❄️", "December"],
+                ["Ramadan can be in different months.", "يمكن أن يأتي رمضان في أشهر مختلفة.", "🌙", "Ramadan"], ["I like March.", "أحب مارس.", "🌷", "March"],
+                ["We travel in June.", "نسافر في يونيو.", "✈️", "June"], ["The year has twelve months.", "السنة فيها اثنا عشر شهرًا.", "🗓️", "twelve"],
+            ];
+
+            function sentenceItem(level, item, index) {
+                return {
+                    id: `${level}-${index}`,
+                    sentence: item[0],
+                    arabic_translation: item[1],
+                    emoji: item[2] || "📝",
+                    target_words: item[3] ? (Array.isArray(item[3]) ? item[3] : [item[3]]) : sentenceTargets(item[0]),
+                    sentence_level: level,
+                    status: "new",
+                };
+            }
+
+            function sentenceTargets(text) {
+                return normalizeText(text).split(" ").filter(word => word.length > 2).slice(0, 4);
+            }
+
+            function buildSentenceBank() {
+                const bank = [
+                    ...cvcSentenceText.map((item, index) => sentenceItem("cvc", item, index)),
+                    ...commonSentenceText.map((item, index) => sentenceItem("common", item, index)),
+                    ...dailySentenceText.map((item, index) => sentenceItem("daily", item, index)),
+                    ...numberSentenceText.map((item, index) => sentenceItem("numbers", item, index)),
+                    ...daySentenceText.map((item, index) => sentenceItem("days", item, index)),
+                    ...monthSentenceText.map((item, index) => sentenceItem("months", item, index)),
+                ];
+                const mixed = [
+                    "The cat sat on the mat.",
+                    "I see two cats.",
+                    "Today is Monday.",
+                    "May I come in?",
+                    "My birthday is in January.",
+                    "The sun is hot.",
+                ].map((text, index) => {
+                    const found = bank.find(item => item.sentence === text);
+                    return { ...found, id: `mixed-${index}`, sentence_level: "mixed" };
+                }).filter(Boolean);
+                return [...bank, ...mixed];
+            }
+
+            const enhancedSentenceBank = buildSentenceBank();
+
+            function isTrueCvc(word) {
+                const text = normalizeText(word).replace(/-/g, "");
+                return /^[bcdfghjklmnpqrstvwxyz][aeiou][bcdfghjklmnpqrstvwxyz]$/.test(text);
+            }
+
+            function primaryLevelForWord(word) {
+                const family = String(word.family || word.word_family || "").toLowerCase();
+                const category = String(word.category || "").toLowerCase();
+                const text = normalizeText(word.word);
+                if (category.includes("digraph") || /^(sh|ch|th|wh|ph)/.test(text)) return "Digraphs";
+                if (category.includes("blend") || /^(br|cr|dr|fr|gr|pr|tr|bl|cl|fl|gl|pl|sl|sk|sn|sp|st|sw)/.test(text)) return "Blends";
+                if (isTrueCvc(text)) return "CVC";
+                return "Blends";
+            }
+
+            function levelsForWord(word) {
+                const levels = new Set([primaryLevelForWord(word)]);
+                const family = String(word.family || word.word_family || "").trim();
+                if (family && isTrueCvc(word.word)) levels.add("Word Families");
+                return [...levels];
+            }
+
+            function transformApiWord(word, index) {
+                const item = {
+                    id: word.id || `api-${index}`,
+                    word: word.word,
+                    arabic_meaning: word.arabic_meaning || "",
+                    image_url: word.image_url || "",
+                    emoji: word.emoji || "🎯",
+                    family: word.word_family || "",
+                    vowel_sound: word.vowel_sound || "",
+                    original_category: word.category || "",
+                    _source: "api",
+                };
+                item.category = primaryLevelForWord(item);
+                item._level = item.category;
+                item._levels = levelsForWord(item);
+                return item;
+            }
+
+            function visualForWord(word) {
+                if (word.image_url) {
+                    return `<img src="${word.image_url}" alt="${word.word}" style="width:100%;height:100%;object-fit:cover;border-radius:10px;" onerror="this.replaceWith(Object.assign(document.createElement('span'), {textContent: '${word.emoji || "🎯"}'}));">`;
+                }
+                return `<span style="font-size: 80px;">${word.emoji || "🎯"}</span>`;
+            }
+
+            function updateCvcStats() {
+                const total = Math.max((wordsData || []).filter(item => item._levels?.includes("CVC") || item._level === "CVC").length, 1);
+                const mastery = Math.max(cvcProgress.cvc_mastery_percentage || 0, Math.round((cvcProgress.words_mastered.length / total) * 100));
+                cvcProgress.cvc_mastery_percentage = Math.min(100, mastery);
+                document.getElementById("cvcMasteryStat").textContent = `${cvcProgress.cvc_mastery_percentage}%`;
+                document.getElementById("cvcLastLevelStat").textContent = cvcProgress.last_level || activeCvcLevel || "-";
+                document.getElementById("cvcLastWordStat").textContent = cvcProgress.last_word || "-";
+                document.getElementById("cvcMicStat").textContent = `${cvcProgress.mic_success}/${cvcProgress.mic_attempts}`;
+                const status = document.getElementById("cvcSaveStatus");
+                status.textContent = isAuthenticated ? "التقدم مرتبط بملف المتعلم عند الحفظ." : "سيتم حفظ تقدمك محليًا، وسيرتبط بملف المتعلم بعد تسجيل الدخول.";
+                localStorage.setItem(localKey, JSON.stringify(cvcProgress));
+            }
+
+            function worksheetUrlForLevel() {
+                if (activeCvcLevel === "Short Vowels" && activeShortVowel !== "all") return `${pageUrls.worksheet}?sheet=short-${activeShortVowel}`;
+                if (activeCvcLevel === "Word Families" && activeShortVowel !== "all") return `${pageUrls.worksheet}?sheet=families&family=${encodeURIComponent(activeShortVowel)}`;
+                if (activeCvcLevel === "Word Families") return `${pageUrls.worksheet}?sheet=families`;
+                if (activeCvcLevel === "CVC") return `${pageUrls.worksheet}`;
+                return `${pageUrls.worksheet}`;
+            }
+
+            function updateLevelDescription() {
+                const descriptions = {
+                    CVC: "CVC Basics يعرض كل الكلمات القصيرة الحقيقية، حتى لو كانت لها عائلة كلمات. مثال: c + a + t = cat.",
+                    "Short Vowels": "اختر short a/e/i/o/u للتدريب على صوت العلة الأوسط داخل كلمات CVC.",
+                    "Word Families": "Word Families يعرض كلمات CVC نفسها، لكن مجمعة حسب العائلة مثل -at و -en و -ig.",
+                    Blends: "Blends كلمات فيها حرفان ساكنان في البداية أو النهاية مثل flag و crab.",
+                    Digraphs: "Digraphs كلمات فيها sh/ch/th/ph/wh مثل ship و chat."
+                };
+                const description = document.getElementById("cvcLevelDescription");
+                const worksheetText = activeCvcLevel === "Word Families" && activeShortVowel !== "all" ? `ورقة عائلة -${activeShortVowel}` : "ورقة عمل هذا المستوى";
+                description.innerHTML = `${descriptions[activeCvcLevel] || descriptions.CVC} <a class="btn btn-listen" style="margin-inline-start:10px;" href="${worksheetUrlForLevel()}" target="_blank">${worksheetText}</a>`;
+            }
+
+            async function saveCvcEvent(payload) {
+                cvcProgress.last_word = payload.item_text || cvcProgress.last_word;
+                cvcProgress.last_family = payload.family || cvcProgress.last_family;
+                cvcProgress.last_level = payload.level || activeCvcLevel;
+                if (payload.event_type?.startsWith("sentence")) {
+                    cvcProgress.last_sentence = payload.item_text || cvcProgress.last_sentence;
+                    cvcProgress.last_sentence_level = payload.sentence_level || payload.level || cvcProgress.last_sentence_level;
+                }
+                const isNewLesson = payload.lesson_id && !cvcProgress.completed_lessons.includes(payload.lesson_id);
+                const wordPracticeEvents = ["word", "listen", "mic", "spelling", "quiz"];
+                if (wordPracticeEvents.includes(payload.event_type) && payload.item_text && !cvcProgress.words_practiced.includes(payload.item_text)) cvcProgress.words_practiced.push(payload.item_text);
+                if (payload.mastered && payload.item_text && !cvcProgress.words_mastered.includes(payload.item_text)) {
+                    cvcProgress.words_mastered.push(payload.item_text);
+                    cvcProgress.needs_review_words = cvcProgress.needs_review_words.filter(word => word !== payload.item_text);
+                }
+                if (!payload.mastered && !["listen", "sentence", "story"].includes(payload.event_type) && payload.item_text && !cvcProgress.needs_review_words.includes(payload.item_text)) cvcProgress.needs_review_words.push(payload.item_text);
+                if (payload.event_type === "mic") {
+                    cvcProgress.mic_attempts += 1;
+                    if (payload.mastered) cvcProgress.mic_success += 1;
+                }
+                if (payload.event_type === "sentence") {
+                    cvcProgress.sentences_read += 1;
+                }
+                if (payload.event_type === "sentence_mastered") {
+                    if (payload.item_text && !cvcProgress.sentences_mastered.includes(payload.item_text)) cvcProgress.sentences_mastered.push(payload.item_text);
+                    cvcProgress.sentences_read += 1;
+                    cvcProgress.sentence_mastery_percentage = Math.min(
+                        100,
+                        Math.round((cvcProgress.sentences_mastered.length / Math.max(sentenceDisplayData().length, 1)) * 100)
+                    );
+                }
+                if (payload.event_type === "sentence_quiz") {
+                    cvcProgress.sentence_quiz_attempts += 1;
+                    if (payload.mastered) cvcProgress.sentence_quiz_correct += 1;
+                }
+                if (payload.event_type === "sentence_mic") {
+                    cvcProgress.sentence_microphone_attempts += 1;
+                    if (payload.mastered) cvcProgress.sentence_microphone_success += 1;
+                }
+                if (payload.event_type === "sentence_timer" && payload.reading_time) {
+                    cvcProgress.sentence_total_time_seconds += Number(payload.reading_time) || 0;
+                    cvcProgress.sentence_best_time_seconds = cvcProgress.sentence_best_time_seconds
+                        ? Math.min(cvcProgress.sentence_best_time_seconds, Number(payload.reading_time))
+                        : Number(payload.reading_time);
+                }
+                if (isNewLesson && payload.sentence_level === "common" && payload.mastered) cvcProgress.common_sentences_completed += 1;
+                if (isNewLesson && payload.sentence_level === "numbers" && payload.mastered) cvcProgress.numbers_completed += 1;
+                if (isNewLesson && payload.sentence_level === "days" && payload.mastered) cvcProgress.days_completed += 1;
+                if (isNewLesson && payload.sentence_level === "months" && payload.mastered) cvcProgress.months_completed += 1;
+                if (payload.event_type === "story") {
+                    cvcProgress.stories_completed += 1;
+                }
+                if (payload.event_type?.startsWith("story")) {
+                    cvcProgress.last_story = payload.item_text || cvcProgress.last_story;
+                    cvcProgress.last_story_level = payload.story_level || cvcProgress.last_story_level;
+                    if (["story_started", "story_listen"].includes(payload.event_type) && payload.item_text && !cvcProgress.stories_started.includes(payload.item_text)) {
+                        cvcProgress.stories_started.push(payload.item_text);
+                    }
+                    if (payload.event_type === "story_quiz") {
+                        cvcProgress.story_quiz_attempts += 1;
+                        if (payload.mastered) cvcProgress.story_quiz_correct += 1;
+                        else if (payload.item_text && !cvcProgress.story_needs_review.includes(payload.item_text)) cvcProgress.story_needs_review.push(payload.item_text);
+                    }
+                    if (payload.event_type === "story_mic") {
+                        cvcProgress.story_microphone_attempts += 1;
+                        if (payload.mastered) cvcProgress.story_microphone_success += 1;
+                        else if (payload.item_text && !cvcProgress.story_needs_review.includes(payload.item_text)) cvcProgress.story_needs_review.push(payload.item_text);
+                    }
+                    if (payload.event_type === "story_timer" && payload.reading_time) {
+                        cvcProgress.story_best_reading_time = cvcProgress.story_best_reading_time
+                            ? Math.min(cvcProgress.story_best_reading_time, Number(payload.reading_time))
+                            : Number(payload.reading_time);
+                    }
+                    if (payload.event_type === "story_complete") {
+                        cvcProgress.stories_completed += 1;
+                        if (payload.reading_time) {
+                            cvcProgress.story_best_reading_time = cvcProgress.story_best_reading_time
+                                ? Math.min(cvcProgress.story_best_reading_time, Number(payload.reading_time))
+                                : Number(payload.reading_time);
+                        }
+                        cvcProgress.story_needs_review = cvcProgress.story_needs_review.filter(story => story !== payload.item_text);
+                        cvcProgress.story_mastery_percentage = Math.min(100, Math.round((cvcProgress.stories_completed / Math.max(storyDisplayData().length, 1)) * 100));
+                    }
+                }
+                if (payload.event_type?.startsWith("pronoun")) {
+                    cvcProgress.last_pronoun = payload.item_text || cvcProgress.last_pronoun;
+                    cvcProgress.last_pronoun_level = payload.pronoun_level || cvcProgress.last_pronoun_level;
+                    if (payload.item_text && ["pronoun_practice", "pronoun_listen", "pronoun_mic", "pronoun_quiz", "pronoun_mastered"].includes(payload.event_type) && !cvcProgress.pronouns_practiced.includes(payload.item_text)) {
+                        cvcProgress.pronouns_practiced.push(payload.item_text);
+                    }
+                    if (payload.event_type === "pronoun_quiz") {
+                        cvcProgress.pronoun_quiz_attempts += 1;
+                        if (payload.mastered) cvcProgress.pronoun_quiz_correct += 1;
+                    }
+                    if (payload.event_type === "pronoun_mic") {
+                        cvcProgress.pronoun_microphone_attempts += 1;
+                        if (payload.mastered) cvcProgress.pronoun_microphone_success += 1;
+                    }
+                    if (payload.mastered && payload.item_text) {
+                        if (!cvcProgress.pronouns_mastered.includes(payload.item_text)) cvcProgress.pronouns_mastered.push(payload.item_text);
+                        cvcProgress.pronouns_needs_review = cvcProgress.pronouns_needs_review.filter(item => item !== payload.item_text);
+                    } else if (!["pronoun_practice", "pronoun_listen"].includes(payload.event_type) && payload.item_text && !cvcProgress.pronouns_needs_review.includes(payload.item_text)) {
+                        cvcProgress.pronouns_needs_review.push(payload.item_text);
+                    }
+                    if (payload.event_type === "pronoun_mastered" && isNewLesson) cvcProgress.pronoun_lessons_completed += 1;
+                    cvcProgress.pronoun_mastery_percentage = Math.min(100, Math.round((cvcProgress.pronouns_mastered.length / Math.max(pronounSentenceBank.length, 1)) * 100));
+                    renderPronounSummary();
+                }
+                if (payload.event_type?.startsWith("sight_word")) {
+                    cvcProgress.last_sight_word = payload.item_text || cvcProgress.last_sight_word;
+                    if (payload.item_text && !cvcProgress.sight_words_practiced.includes(payload.item_text)) cvcProgress.sight_words_practiced.push(payload.item_text);
+                    if (payload.event_type === "sight_word_quiz") {
+                        cvcProgress.sight_word_quiz_attempts += 1;
+                        if (payload.mastered) cvcProgress.sight_word_quiz_correct += 1;
+                    }
+                    if (payload.mastered && payload.item_text && !cvcProgress.sight_words_mastered.includes(payload.item_text)) cvcProgress.sight_words_mastered.push(payload.item_text);
+                }
+                if (payload.event_type?.startsWith("fluency")) {
+                    cvcProgress.last_fluency_sentence = payload.item_text || cvcProgress.last_fluency_sentence;
+                    if (["fluency_attempt", "fluency_mic"].includes(payload.event_type)) cvcProgress.fluency_attempts += 1;
+                    if (payload.event_type === "fluency_attempt") {
+                        cvcProgress.fluency_sentences_read += 1;
+                        if (payload.reading_time) cvcProgress.best_reading_time = cvcProgress.best_reading_time ? Math.min(cvcProgress.best_reading_time, Number(payload.reading_time)) : Number(payload.reading_time);
+                        if (payload.wpm) cvcProgress.best_wpm = Math.max(cvcProgress.best_wpm || 0, Number(payload.wpm));
+                    }
+                    if (payload.event_type === "fluency_mic") cvcProgress.fluency_accuracy = Math.max(cvcProgress.fluency_accuracy || 0, Number(payload.score) || 0);
+                    cvcProgress.fluency_score = Math.max(cvcProgress.fluency_score || 0, Number(payload.score) || 0);
+                }
+                if (payload.event_type === "question_word_mastered" && payload.item_text && !cvcProgress.question_words_mastered.includes(payload.item_text)) cvcProgress.question_words_mastered.push(payload.item_text);
+                if (payload.event_type === "conversation_complete") {
+                    cvcProgress.last_conversation = payload.item_text || cvcProgress.last_conversation;
+                    cvcProgress.conversations_completed += 1;
+                }
+                if (payload.event_type === "action_verb_mastered" && payload.item_text && !cvcProgress.action_verbs_mastered.includes(payload.item_text)) cvcProgress.action_verbs_mastered.push(payload.item_text);
+                if (payload.event_type === "adjective_mastered" && payload.item_text && !cvcProgress.adjectives_mastered.includes(payload.item_text)) cvcProgress.adjectives_mastered.push(payload.item_text);
+                if (payload.event_type === "fluency_calendar_mastered" && payload.item_text && !cvcProgress.calendar_mastered.includes(payload.item_text)) cvcProgress.calendar_mastered.push(payload.item_text);
+                if (
+                    payload.event_type?.startsWith("sight_word")
+                    || payload.event_type?.startsWith("fluency")
+                    || ["question_word_mastered", "conversation_complete", "action_verb_mastered", "adjective_mastered", "fluency_calendar_mastered"].includes(payload.event_type)
+                ) {
+                    const completed = cvcProgress.sight_words_mastered.length + Math.min(cvcProgress.fluency_sentences_read, fluencySentences.length) + cvcProgress.question_words_mastered.length + Math.min(cvcProgress.conversations_completed, miniConversations.length) + cvcProgress.action_verbs_mastered.length + cvcProgress.adjectives_mastered.length + cvcProgress.calendar_mastered.length;
+                    const total = sightWords.length + fluencySentences.length + questionWords.length + miniConversations.length + actionVerbs.length + adjectives.length + calendarLearningItems.length;
+                    cvcProgress.fluency_mastery_percentage = Math.min(100, Math.round((completed / Math.max(total, 1)) * 100));
+                    renderFluencySummary();
+                }
+                if (payload.event_type === "quiz" || payload.event_type === "spelling") {
+                    cvcProgress.quiz_attempts += 1;
+                    if (payload.mastered) cvcProgress.quiz_correct += 1;
+                }
+                if (payload.level && payload.mastered && !cvcProgress.completed_levels.includes(payload.level)) cvcProgress.completed_levels.push(payload.level);
+                if (payload.family && payload.mastered && !cvcProgress.completed_families.includes(payload.family)) cvcProgress.completed_families.push(payload.family);
+                updateCvcStats();
+
+                if (!isAuthenticated) return;
+                try {
+                    const response = await fetch(pageUrls.progress, {
+                        method: "POST",
+                        headers: {
+                            "Content-Type": "application/json",
+                            "X-CSRFToken": decodeURIComponent(getCookie("csrftoken"))
+                        },
+                        body: JSON.stringify(payload)
+                    });
+                    document.getElementById("cvcSaveStatus").textContent = response.ok ? "تم حفظ تقدم CVC في ملف المتعلم." : "تعذر حفظ تقدم CVC مؤقتًا.";
+                } catch (error) {
+                    document.getElementById("cvcSaveStatus").textContent = "تعذر الاتصال لحفظ تقدم CVC.";
+                }
+            }
+
+            function escapeHtml(value) {
+                return String(value || "").replace(/[&<>"']/g, char => ({
+                    "&": "&amp;",
+                    "<": "&lt;",
+                    ">": "&gt;",
+                    "\"": "&quot;",
+                    "'": "&#39;",
+                }[char]));
+            }
+
+            function jsString(value) {
+                return JSON.stringify(String(value || ""));
+            }
+
+            function pronounLevelMeta(key) {
+                return pronounLevels.find(level => level.key === key) || pronounLevels[0];
+            }
+
+            function pronounDisplayData() {
+                if (activePronounLevel === "mixed") return pronounSentenceBank;
+                return pronounSentenceBank.filter(item => item.level === activePronounLevel);
+            }
+
+            function renderPronounTabs() {
+                const tabs = document.getElementById("pronounLessonTabs");
+                if (!tabs) return;
+                tabs.innerHTML = pronounLevels.map(level => `
+                    <button class="pronoun-tab-btn${level.key === activePronounLevel ? " active" : ""}" type="button" onclick="selectPronounLevel('${level.key}')">
+                        ${level.title}<br><small>${level.ar}</small>
+                    </button>
+                `).join("");
+            }
+
+            function renderPronounSummary() {
+                const summary = document.getElementById("pronounSummary");
+                if (!summary) return;
+                const quizRate = cvcProgress.pronoun_quiz_attempts ? Math.round((cvcProgress.pronoun_quiz_correct / cvcProgress.pronoun_quiz_attempts) * 100) : 0;
+                const micRate = cvcProgress.pronoun_microphone_attempts ? Math.round((cvcProgress.pronoun_microphone_success / cvcProgress.pronoun_microphone_attempts) * 100) : 0;
+                summary.innerHTML = `
+                    <div class="pronoun-stat"><strong>${cvcProgress.pronoun_mastery_percentage || 0}%</strong><span>Pronoun Mastery</span></div>
+                    <div class="pronoun-stat"><strong>${cvcProgress.pronouns_practiced.length}</strong><span>تدرب عليها</span></div>
+                    <div class="pronoun-stat"><strong>${cvcProgress.pronouns_mastered.length}</strong><span>متقنة</span></div>
+                    <div class="pronoun-stat"><strong>${micRate}%</strong><span>نجاح المايك</span></div>
+                `;
+                const note = document.getElementById("pronounLessonNote");
+                if (note) {
+                    const meta = pronounLevelMeta(activePronounLevel);
+                    note.textContent = `${meta.title}: ${meta.note} | Quiz Accuracy: ${quizRate}% | Last: ${cvcProgress.last_pronoun || "-"}`;
+                }
+            }
+
+            window.selectPronounLevel = function selectPronounLevel(levelKey) {
+                activePronounLevel = levelKey;
+                displayPronouns();
+            };
+
+            function pronounStatus(item) {
+                if (cvcProgress.pronouns_mastered.includes(item.pronoun)) return ["تم الإتقان", "mastered"];
+                if (cvcProgress.pronouns_needs_review.includes(item.pronoun)) return ["يحتاج مراجعة", "review"];
+                if (cvcProgress.pronouns_practiced.includes(item.pronoun)) return ["قيد التدريب", "practice"];
+                return ["جديد", "new"];
+            }
+
+            function renderPronounCard(item) {
+                const status = pronounStatus(item);
+                const meta = pronounLevelMeta(item.level);
+                return `
+                    <article class="pronoun-card" data-pronoun-id="${escapeHtml(item.id)}">
+                        <div style="display:flex;justify-content:space-between;gap:10px;align-items:center;flex-wrap:wrap;">
+                            <span class="pronoun-level-chip" style="background:${meta.color};">${meta.title}</span>
+                            <span class="pronoun-type-chip ${item.type}">${status[0]}</span>
+                        </div>
+                        <div style="font-size:3rem;">${item.emoji}</div>
+                        <div class="pronoun-sentence-main">${escapeHtml(item.sentence)}</div>
+                        <div class="pronoun-translation">${escapeHtml(item.ar)}</div>
+                        <div class="pronoun-actions">
+                            <button class="pronoun-action-btn primary" type="button" onclick='playPronounText(${jsString(item.sentence)}, ${jsString(item.pronoun)}, ${jsString(item.level)})'>استمع</button>
+                            <button class="pronoun-action-btn" type="button" onclick='recordWord(${jsString(item.sentence)}, ${jsString(`pronoun-sentence-${item.id}`)})'>مايك</button>
+                            <button class="pronoun-action-btn" type="button" onclick='masterPronounSentence(${jsString(item.id)})'>أتقنت</button>
+                            <a class="pronoun-action-btn" href="${pageUrls.worksheet}?sheet=pronouns" target="_blank">ورقة عمل</a>
+                        </div>
+                        <div class="pronoun-question">
+                            <strong>${escapeHtml(item.question)}</strong>
+                            <div class="pronoun-options" style="margin-top:10px;">
+                                ${item.options.map(option => `
+                                    <button class="pronoun-option-btn" type="button" onclick='checkPronounAnswer(this, ${jsString(item.id)}, ${jsString(option)})'>${escapeHtml(option)}</button>
+                                `).join("")}
+                            </div>
+                            <div class="quiz-feedback" id="pronoun-question-${escapeHtml(item.id)}" style="margin-top:10px;"></div>
+                        </div>
+                        <div class="feedback-area" id="feedback-pronoun-sentence-${escapeHtml(item.id)}"></div>
+                    </article>
+                `;
+            }
+
+            window.displayPronouns = function displayPronouns() {
+                renderPronounTabs();
+                renderPronounSummary();
+                const grid = document.getElementById("pronounPracticeGrid");
+                const quiz = document.getElementById("pronounQuizPanel");
+                if (!grid) return;
+                const list = pronounDisplayData();
+                grid.innerHTML = list.map(renderPronounCard).join("");
+                if (quiz) renderPronounMiniQuiz();
+            };
+
+            window.playPronounText = function playPronounText(text, pronoun, level) {
+                SpeechManager.speak(text, { rate: 0.78 });
+                saveCvcEvent({
+                    event_type: "pronoun_listen",
+                    item_text: pronoun,
+                    level: "Pronouns",
+                    pronoun_level: level,
+                    score: 10,
+                    mastered: false
+                });
+            };
+
+            window.checkPronounAnswer = function checkPronounAnswer(button, itemId, selected) {
+                const item = pronounSentenceBank.find(entry => entry.id === itemId);
+                if (!item) return;
+                const buttons = button.closest(".pronoun-options")?.querySelectorAll("button") || [];
+                buttons.forEach(option => option.disabled = true);
+                const mastered = selected === item.answer;
+                button.classList.add(mastered ? "correct" : "wrong");
+                buttons.forEach(option => {
+                    if (option.textContent.trim() === item.answer) option.classList.add("correct");
+                });
+                const feedback = document.getElementById(`pronoun-question-${item.id}`);
+                if (feedback) {
+                    feedback.innerHTML = mastered
+                        ? `<div class="mic-result excellent"><strong>ممتاز</strong><br>${item.answer} إجابة صحيحة.</div>`
+                        : `<div class="mic-result try"><strong>حاول مرة أخرى</strong><br>الإجابة الصحيحة: ${item.answer}</div>`;
+                }
+                saveCvcEvent({
+                    event_type: "pronoun_quiz",
+                    item_text: item.pronoun,
+                    level: "Pronouns",
+                    pronoun_level: item.level,
+                    lesson_id: `pronoun-quiz-${item.id}`,
+                    score: mastered ? 100 : 35,
+                    mastered
+                });
+            };
+
+            window.masterPronounSentence = function masterPronounSentence(itemId) {
+                const item = pronounSentenceBank.find(entry => entry.id === itemId);
+                if (!item) return;
+                const feedback = document.getElementById(`feedback-pronoun-sentence-${item.id}`);
+                if (feedback) {
+                    feedback.innerHTML = `<div class="mic-result excellent"><strong>تم الإتقان</strong><br>${item.pronoun} محفوظ في تقدم المتعلم.</div>`;
+                }
+                saveCvcEvent({
+                    event_type: "pronoun_mastered",
+                    item_text: item.pronoun,
+                    level: "Pronouns",
+                    pronoun_level: item.level,
+                    lesson_id: `pronoun-mastered-${item.id}`,
+                    score: 100,
+                    mastered: true
+                });
+            };
+
+            function renderPronounMiniQuiz() {
+                const panel = document.getElementById("pronounQuizPanel");
+                if (!panel) return;
+                const questions = pronounMiniQuiz.filter(item => activePronounLevel === "mixed" || item.level === activePronounLevel);
+                panel.innerHTML = `
+                    <h3 style="margin:0;color:#5b21b6;">Mini Quiz</h3>
+                    <p class="pronoun-note">اختبار سريع بعد الدرس الحالي.</p>
+                    ${questions.map((question, index) => `
+                        <div class="pronoun-question">
+                            <strong>${index + 1}. ${escapeHtml(question.prompt)}</strong>
+                            <div class="pronoun-options" style="margin-top:10px;">
+                                ${question.options.map(option => `
+                                    <button class="pronoun-option-btn" type="button" onclick='checkPronounMiniQuiz(this, ${jsString(question.item)}, ${jsString(question.level)}, ${jsString(option)}, ${jsString(question.answer)})'>${escapeHtml(option)}</button>
+                                `).join("")}
+                            </div>
+                        </div>
+                    `).join("")}
+                `;
+            }
+
+            window.checkPronounMiniQuiz = function checkPronounMiniQuiz(button, itemText, level, selected, answer) {
+                const buttons = button.closest(".pronoun-options")?.querySelectorAll("button") || [];
+                buttons.forEach(option => option.disabled = true);
+                const mastered = selected === answer;
+                button.classList.add(mastered ? "correct" : "wrong");
+                buttons.forEach(option => {
+                    if (option.textContent.trim() === answer) option.classList.add("correct");
+                });
+                saveCvcEvent({
+                    event_type: "pronoun_quiz",
+                    item_text: itemText,
+                    level: "Pronouns",
+                    pronoun_level: level,
+                    lesson_id: `pronoun-mini-${level}-${itemText}`,
+                    score: mastered ? 100 : 40,
+                    mastered
+                });
+            };
+
+            function fluencyModeMeta(key) {
+                return fluencyModes.find(mode => mode.key === key) || fluencyModes[0];
+            }
+
+            function renderFluencyTabs() {
+                const tabs = document.getElementById("fluencyModeTabs");
+                if (!tabs) return;
+                tabs.innerHTML = fluencyModes.map(mode => `
+                    <button class="fluency-tab-btn${mode.key === activeFluencyMode ? " active" : ""}" type="button" onclick="selectFluencyMode('${mode.key}')">
+                        ${mode.title}<br><small>${mode.ar}</small>
+                    </button>
+                `).join("");
+            }
+
+            function renderFluencySummary() {
+                const summary = document.getElementById("fluencySummary");
+                if (!summary) return;
+                const quizRate = cvcProgress.sight_word_quiz_attempts ? Math.round((cvcProgress.sight_word_quiz_correct / cvcProgress.sight_word_quiz_attempts) * 100) : 0;
+                summary.innerHTML = `
+                    <div class="fluency-stat"><strong>${cvcProgress.fluency_mastery_percentage || 0}%</strong><span>Fluency Mastery</span></div>
+                    <div class="fluency-stat"><strong>${cvcProgress.sight_words_mastered.length}/${sightWords.length}</strong><span>Sight Words</span></div>
+                    <div class="fluency-stat"><strong>${cvcProgress.best_wpm || 0}</strong><span>Best WPM</span></div>
+                    <div class="fluency-stat"><strong>${cvcProgress.fluency_accuracy || quizRate}%</strong><span>Accuracy</span></div>
+                    <div class="fluency-stat"><strong>${cvcProgress.calendar_mastered.length}/${calendarLearningItems.length}</strong><span>Numbers/Days/Months</span></div>
+                `;
+                const note = document.getElementById("fluencyModeNote");
+                if (note) note.textContent = `${fluencyModeMeta(activeFluencyMode).note} | Last: ${cvcProgress.last_sight_word || cvcProgress.last_fluency_sentence || "-"}`;
+            }
+
+            window.selectFluencyMode = function selectFluencyMode(mode) {
+                activeFluencyMode = mode;
+                cvcProgress.active_fluency_mode = mode;
+                displayFluency();
+            };
+
+            function fluencyStatus(value, listName) {
+                return cvcProgress[listName]?.includes(value) ? "تم الإتقان" : "جديد";
+            }
+
+            function renderSightWordCard(item) {
+                const mastered = cvcProgress.sight_words_mastered.includes(item.word);
+                return `
+                    <article class="fluency-card">
+                        <div style="display:flex;justify-content:space-between;gap:10px;align-items:center;flex-wrap:wrap;">
+                            <span class="fluency-chip">Level ${item.level}</span>
+                            <span class="fluency-chip">${mastered ? "تم الإتقان" : "Sight Word"}</span>
+                        </div>
+                        <div class="sight-word-main">${escapeHtml(item.word)}</div>
+                        <div class="pronoun-translation">${escapeHtml(item.meaning)}</div>
+                        <div class="fluency-sentence-main" style="font-size:1.45rem;">${escapeHtml(item.sentence)}</div>
+                        <div class="pronoun-translation">${escapeHtml(item.ar)}</div>
+                        <div class="fluency-actions">
+                            <button class="fluency-action-btn primary" type="button" onclick='playFluencyText(${jsString(item.word)}, "sight_word_listen", ${jsString(item.word)})'>استمع</button>
+                            <button class="fluency-action-btn" type="button" onclick='recordFluencyText(${jsString(item.word)}, "sight_word_mic", ${jsString(item.word)})'>مايك</button>
+                            <button class="fluency-action-btn" type="button" onclick='masterSightWord(${jsString(item.word)})'>أتقنت</button>
+                        </div>
+                        <div class="fluency-question">
+                            <strong>${escapeHtml(item.prompt)}</strong>
+                            <div class="fluency-options" style="margin-top:10px;">
+                                ${item.options.map(option => `<button class="fluency-option-btn" type="button" onclick='checkSightWordAnswer(this, ${jsString(item.word)}, ${jsString(option)}, ${jsString(item.answer)})'>${escapeHtml(option)}</button>`).join("")}
+                            </div>
+                        </div>
+                        <div class="feedback-area" id="feedback-fluency-${escapeHtml(item.word)}"></div>
+                    </article>
+                `;
+            }
+
+            function renderFluencySentenceCard(item) {
+                const attempts = cvcProgress.fluency_attempt_log[item.id] || [];
+                return `
+                    <article class="fluency-card">
+                        <div style="display:flex;justify-content:space-between;gap:10px;align-items:center;flex-wrap:wrap;">
+                            <span class="fluency-chip">${item.level}</span>
+                            <span class="fluency-chip">${item.words} words</span>
+                        </div>
+                        <div class="fluency-sentence-main">${escapeHtml(item.sentence)}</div>
+                        <div class="pronoun-translation">${escapeHtml(item.ar)}</div>
+                        <div class="fluency-actions">
+                            <button class="fluency-action-btn primary" type="button" onclick='playFluencyText(${jsString(item.sentence)}, "fluency_listen", ${jsString(item.sentence)})'>استمع</button>
+                            <button class="fluency-action-btn" type="button" onclick='startFluencyRead(${jsString(item.id)}, 1)'>Read 1</button>
+                            <button class="fluency-action-btn" type="button" onclick='startFluencyRead(${jsString(item.id)}, 2)'>Read 2</button>
+                            <button class="fluency-action-btn" type="button" onclick='startFluencyRead(${jsString(item.id)}, 3)'>Read 3</button>
+                            <button class="fluency-action-btn" type="button" onclick='stopFluencyRead()'>Stop</button>
+                            <button class="fluency-action-btn" type="button" onclick='recordFluencyText(${jsString(item.sentence)}, "fluency_mic", ${jsString(item.sentence)})'>مايك</button>
+                        </div>
+                        <div class="cvc-mini-note" id="fluency-timer-${escapeHtml(item.id)}">Start Reading ثم Stop لحساب الوقت وWPM.</div>
+                        <table class="fluency-attempt-table">
+                            <thead><tr><th>Read</th><th>Time</th><th>WPM</th></tr></thead>
+                            <tbody>${[1,2,3].map(num => {
+                                const attempt = attempts.find(row => row.attempt === num) || {};
+                                return `<tr><td>${num}</td><td>${attempt.time || "-"}</td><td>${attempt.wpm || "-"}</td></tr>`;
+                            }).join("")}</tbody>
+                        </table>
+                        <div class="feedback-area" id="feedback-fluency-${escapeHtml(item.id)}"></div>
+                    </article>
+                `;
+            }
+
+            function renderSimpleFluencyCard(item, type) {
+                const sentence = item.sentence || (item.lines ? item.lines.join(" ") : item.word);
+                const masteredList = type === "questions" ? "question_words_mastered" : type === "verbs" ? "action_verbs_mastered" : "adjectives_mastered";
+                const itemText = item.word || item.title;
+                return `
+                    <article class="fluency-card">
+                        <div style="display:flex;justify-content:space-between;gap:10px;align-items:center;flex-wrap:wrap;">
+                            <span class="fluency-chip">${type}</span>
+                            <span class="fluency-chip">${type === "conversations" ? (cvcProgress.last_conversation === item.title ? "آخر حوار" : "حوار") : fluencyStatus(itemText, masteredList)}</span>
+                        </div>
+                        <div style="font-size:3rem;">${item.emoji || "💬"}</div>
+                        <div class="sight-word-main" style="font-size:2.4rem;">${escapeHtml(item.word || item.title)}</div>
+                        ${item.meaning ? `<div class="pronoun-translation">${escapeHtml(item.meaning)}</div>` : ""}
+                        ${item.lines ? item.lines.map(line => `<div class="fluency-sentence-main" style="font-size:1.35rem;">${escapeHtml(line)}</div>`).join("") : `<div class="fluency-sentence-main" style="font-size:1.35rem;">${escapeHtml(sentence)}</div>`}
+                        <div class="pronoun-translation">${escapeHtml(item.ar || "")}</div>
+                        <div class="fluency-actions">
+                            <button class="fluency-action-btn primary" type="button" onclick='playFluencyText(${jsString(sentence)}, "${type}_listen", ${jsString(itemText)})'>استمع</button>
+                            <button class="fluency-action-btn" type="button" onclick='recordFluencyText(${jsString(sentence)}, "${type}_mic", ${jsString(itemText)}, ${jsString(item.id)})'>مايك</button>
+                            <button class="fluency-action-btn" type="button" onclick='masterFluencyItem(${jsString(type)}, ${jsString(itemText)}, ${jsString(sentence)})'>أتقنت</button>
+                        </div>
+                        <div class="feedback-area" id="feedback-fluency-${escapeHtml(item.id)}"></div>
+                    </article>
+                `;
+            }
+
+            function calendarKindLabel(kind) {
+                if (kind === "number") return "Number / رقم";
+                if (kind === "day") return "Day / يوم";
+                return "Month / شهر";
+            }
+
+            function renderCalendarLearningCard(item) {
+                return `
+                    <article class="fluency-card">
+                        <div style="display:flex;justify-content:space-between;gap:10px;align-items:center;flex-wrap:wrap;">
+                            <span class="fluency-chip">${calendarKindLabel(item.kind)}</span>
+                            <span class="fluency-chip">${escapeHtml(item.meaning)}</span>
+                        </div>
+                        <div style="font-size:${item.kind === "number" ? "3.4rem" : "1.2rem"};font-weight:900;color:#0891b2;text-align:center;">${escapeHtml(item.symbol)}</div>
+                        <div class="sight-word-main" style="font-size:2.4rem;">${escapeHtml(item.word)}</div>
+                        <div class="pronoun-translation">${escapeHtml(item.meaning)}</div>
+                        <div class="fluency-sentence-main" style="font-size:1.35rem;">${escapeHtml(item.sentence)}</div>
+                        <div class="pronoun-translation">اكتبها 3 مرات، استمع لها، ثم انطقها بالمايك.</div>
+                        <div class="fluency-actions">
+                            <button class="fluency-action-btn primary" type="button" onclick='playFluencyText(${jsString(item.word)}, "calendar_listen", ${jsString(item.word)})'>استماع</button>
+                            <button class="fluency-action-btn" type="button" onclick='playFluencyText(${jsString(item.sentence)}, "calendar_sentence_listen", ${jsString(item.word)})'>مثال</button>
+                            <button class="fluency-action-btn" type="button" onclick='recordFluencyText(${jsString(item.word)}, "calendar_mic", ${jsString(item.word)}, ${jsString(item.id)})'>نطق</button>
+                            <button class="fluency-action-btn" type="button" onclick='masterFluencyItem("calendar", ${jsString(item.word)}, ${jsString(item.sentence)})'>أتقنت</button>
+                        </div>
+                        <div class="fluency-question">
+                            <strong>${escapeHtml(item.question)}</strong>
+                            <div class="fluency-options" style="margin-top:10px;">
+                                ${item.options.map(option => `<button class="fluency-option-btn" type="button" onclick='checkCalendarAnswer(this, ${jsString(item.id)}, ${jsString(option)}, ${jsString(item.answer)})'>${escapeHtml(option)}</button>`).join("")}
+                            </div>
+                        </div>
+                        <div class="feedback-area" id="feedback-fluency-${escapeHtml(item.id)}"></div>
+                    </article>
+                `;
+            }
+
+            function renderCalendarWorksheetPanel() {
+                const sampleNumbers = numberWords.slice(0, 11).map(item => `${item.symbol} = ${item.word}`).join(" | ");
+                const days = dayWords.map(item => item.word).join(", ");
+                const months = monthWords.map(item => item.word).join(", ");
+                return `
+                    <h3 style="color:#0891b2;margin:0;">Numbers, Days and Months</h3>
+                    <p class="fluency-note">تدريب احترافي للكتابة والنطق والاستماع مع ورقة عمل جاهزة للطباعة.</p>
+                    <div class="fluency-actions" style="margin-top:12px;">
+                        <button class="fluency-action-btn primary" type="button" onclick="printCalendarWorksheets()">طباعة أوراق العمل</button>
+                        <button class="fluency-action-btn" type="button" onclick='playFluencyText(${jsString("zero one two three four five six seven eight nine ten")}, "calendar_listen", "numbers")'>استماع للأرقام</button>
+                        <button class="fluency-action-btn" type="button" onclick='playFluencyText(${jsString(days)}, "calendar_listen", "days")'>استماع للأيام</button>
+                        <button class="fluency-action-btn" type="button" onclick='playFluencyText(${jsString(months)}, "calendar_listen", "months")'>استماع للأشهر</button>
+                    </div>
+                    <div class="fluency-question" style="margin-top:14px;">
+                        <strong>مراجعة سريعة:</strong>
+                        <div style="margin-top:8px;line-height:1.9;">${escapeHtml(sampleNumbers)}</div>
+                        <div style="margin-top:8px;line-height:1.9;"><strong>Days:</strong> ${escapeHtml(days)}</div>
+                        <div style="margin-top:8px;line-height:1.9;"><strong>Months:</strong> ${escapeHtml(months)}</div>
+                    </div>
+                `;
+            }
+
+            window.displayFluency = function displayFluency() {
+                renderFluencyTabs();
+                renderFluencySummary();
+                const grid = document.getElementById("fluencyGrid");
+                const quiz = document.getElementById("fluencyQuizPanel");
+                if (!grid) return;
+                if (activeFluencyMode === "sight") {
+                    grid.innerHTML = sightWords.map(renderSightWordCard).join("");
+                    quiz.innerHTML = `<h3 style="color:#0f766e;margin:0;">Sight Words Mini Quiz</h3><p class="fluency-note">اختر الكلمة الناقصة داخل كل بطاقة.</p>`;
+                } else if (activeFluencyMode === "fluency") {
+                    grid.innerHTML = fluencySentences.map(renderFluencySentenceCard).join("");
+                    quiz.innerHTML = `<h3 style="color:#0f766e;margin:0;">Read 3 Times</h3><p class="fluency-note">كل جملة تحفظ ثلاث محاولات: الوقت وWPM. الهدف وضوح القراءة ثم التحسن.</p>`;
+                } else if (activeFluencyMode === "questions") {
+                    grid.innerHTML = questionWords.map(item => renderSimpleFluencyCard(item, "questions")).join("");
+                    quiz.innerHTML = `<h3 style="color:#0f766e;margin:0;">Question Words</h3><p class="fluency-note">اختر أداة السؤال المناسبة واقرأها بالمايك.</p>`;
+                } else if (activeFluencyMode === "conversations") {
+                    grid.innerHTML = miniConversations.map(item => renderSimpleFluencyCard(item, "conversations")).join("");
+                    quiz.innerHTML = `<h3 style="color:#0f766e;margin:0;">Mini Conversations</h3><p class="fluency-note">استمع للحوار كاملًا، ثم اقرأ كل دور بوضوح.</p>`;
+                } else if (activeFluencyMode === "verbs") {
+                    grid.innerHTML = actionVerbs.map(item => renderSimpleFluencyCard(item, "verbs")).join("");
+                    quiz.innerHTML = `<h3 style="color:#0f766e;margin:0;">Action Verbs</h3><p class="fluency-note">اربط الفعل بالجملة والحركة.</p>`;
+                } else if (activeFluencyMode === "adjectives") {
+                    grid.innerHTML = adjectives.map(item => renderSimpleFluencyCard(item, "adjectives")).join("");
+                    quiz.innerHTML = `<h3 style="color:#0f766e;margin:0;">Adjectives</h3><p class="fluency-note">اقرأ الصفة داخل جملة قصيرة.</p>`;
+                } else {
+                    grid.innerHTML = calendarLearningItems.map(renderCalendarLearningCard).join("");
+                    quiz.innerHTML = renderCalendarWorksheetPanel();
+                }
+            };
+
+            window.playFluencyText = function playFluencyText(text, eventType, itemText) {
+                SpeechManager.speak(text, { rate: 0.78 });
+                if (eventType === "sight_word_listen") {
+                    saveCvcEvent({ event_type: "sight_word_practice", item_text: itemText, level: "Fluency", fluency_level: activeFluencyMode, score: 10, mastered: false });
+                } else if (eventType?.startsWith("calendar")) {
+                    saveCvcEvent({ event_type: "fluency_calendar_practice", item_text: itemText, level: "Fluency", fluency_level: "calendar", score: 10, mastered: false });
+                }
+            };
+
+            window.checkSightWordAnswer = function checkSightWordAnswer(button, word, selected, answer) {
+                const buttons = button.closest(".fluency-options")?.querySelectorAll("button") || [];
+                buttons.forEach(option => option.disabled = true);
+                const mastered = selected.toLowerCase() === answer.toLowerCase();
+                button.classList.add(mastered ? "correct" : "wrong");
+                buttons.forEach(option => {
+                    if (option.textContent.trim().toLowerCase() === answer.toLowerCase()) option.classList.add("correct");
+                });
+                saveCvcEvent({ event_type: "sight_word_quiz", item_text: word, level: "Fluency", fluency_level: "sight", lesson_id: `sight-quiz-${word}`, score: mastered ? 100 : 35, mastered });
+            };
+
+            window.checkCalendarAnswer = function checkCalendarAnswer(button, itemId, selected, answer) {
+                const buttons = button.closest(".fluency-options")?.querySelectorAll("button") || [];
+                buttons.forEach(option => option.disabled = true);
+                const item = calendarLearningItems.find(row => row.id === itemId);
+                const mastered = selected.toLowerCase() === answer.toLowerCase();
+                button.classList.add(mastered ? "correct" : "wrong");
+                buttons.forEach(option => {
+                    if (option.textContent.trim().toLowerCase() === answer.toLowerCase()) option.classList.add("correct");
+                });
+                const feedback = document.getElementById(`feedback-fluency-${itemId}`);
+                if (feedback) {
+                    feedback.innerHTML = `<div class="mic-result ${mastered ? "excellent" : "try"}"><strong>${mastered ? "إجابة صحيحة" : "راجع الإجابة"}</strong><br>الإجابة الصحيحة: ${escapeHtml(answer)}</div>`;
+                }
+                saveCvcEvent({ event_type: "fluency_calendar_quiz", item_text: item?.word || answer, level: "Fluency", fluency_level: "calendar", lesson_id: `calendar-quiz-${itemId}`, score: mastered ? 100 : 40, mastered });
+            };
+
+            window.masterSightWord = function masterSightWord(word) {
+                saveCvcEvent({ event_type: "sight_word_mastered", item_text: word, level: "Fluency", fluency_level: "sight", lesson_id: `sight-mastered-${word}`, score: 100, mastered: true });
+                const feedback = document.getElementById(`feedback-fluency-${word}`);
+                if (feedback) feedback.innerHTML = `<div class="mic-result excellent"><strong>تم الإتقان</strong><br>${word} محفوظة في تقدم المتعلم.</div>`;
+            };
+
+            window.startFluencyRead = function startFluencyRead(sentenceId, attempt) {
+                const item = fluencySentences.find(row => row.id === sentenceId);
+                if (!item) return;
+                fluencyTimerState = { sentenceId, attempt, startedAt: Date.now() };
+                const timer = document.getElementById(`fluency-timer-${sentenceId}`);
+                if (timer) timer.textContent = `Read ${attempt} started. اقرأ الآن ثم اضغط Stop.`;
+            };
+
+            window.stopFluencyRead = function stopFluencyRead() {
+                if (!fluencyTimerState) return;
+                const item = fluencySentences.find(row => row.id === fluencyTimerState.sentenceId);
+                if (!item) return;
+                const seconds = Math.max(1, Math.round((Date.now() - fluencyTimerState.startedAt) / 1000));
+                const wpm = Math.max(1, Math.round((item.words / seconds) * 60));
+                const rows = cvcProgress.fluency_attempt_log[item.id] || [];
+                const nextRows = rows.filter(row => row.attempt !== fluencyTimerState.attempt);
+                nextRows.push({ attempt: fluencyTimerState.attempt, time: seconds, wpm });
+                cvcProgress.fluency_attempt_log[item.id] = nextRows.sort((a, b) => a.attempt - b.attempt);
+                saveCvcEvent({ event_type: "fluency_attempt", item_text: item.sentence, level: "Fluency", fluency_level: item.level, lesson_id: `fluency-${item.id}-${fluencyTimerState.attempt}`, reading_time: seconds, wpm, score: Math.min(100, 60 + Math.min(wpm, 40)), mastered: true });
+                fluencyTimerState = null;
+                displayFluency();
+            };
+
+            window.recordFluencyText = function recordFluencyText(targetText, eventType, itemText, uiId = "") {
+                const feedbackIdNew = uiId || (eventType === "sight_word_mic" ? itemText : (fluencySentences.find(item => item.sentence === targetText)?.id || itemText));
+                const feedbackNew = document.getElementById(`feedback-fluency-${feedbackIdNew}`);
+                SpeechService.startRecognition({
+                    targetText,
+                    type: "long_sentence",
+                    section: "cvc_reading",
+                    level: "Fluency",
+                    onStart: () => {
+                        if (feedbackNew) feedbackNew.innerHTML = `<div class="mic-result try">${SpeechService.messages.listening}</div>`;
+                    },
+                    onResult: result => {
+                        const mastered = result.status !== "retry";
+                        if (feedbackNew) {
+                            SpeechService.renderResult(feedbackNew, result);
+                            feedbackNew.classList.toggle("pronunciation-mastered", result.status === "excellent");
+                        }
+                        saveCvcEvent({
+                            event_type: eventType === "sight_word_mic" ? "sight_word_practice" : "fluency_mic",
+                            item_text: itemText,
+                            level: "Fluency",
+                            fluency_level: activeFluencyMode,
+                            score: result.score,
+                            mastered,
+                            is_mastered: result.status === "excellent",
+                            spoken_text: result.spokenText || result.spoken || "",
+                            status: result.status,
+                            failure_reason: result.failure_reason || null,
+                            browser_error: result.browser_error || null,
+                            section: "cvc_reading"
+                        });
+                    },
+                    onError: result => {
+                        if (feedbackNew) SpeechService.renderResult(feedbackNew, result);
+                        else alert(result.message || SpeechService.messages.unknown);
+                        saveCvcEvent({
+                            event_type: eventType === "sight_word_mic" ? "sight_word_practice" : "fluency_mic",
+                            item_text: itemText,
+                            level: "Fluency",
+                            fluency_level: activeFluencyMode,
+                            score: 0,
+                            mastered: false,
+                            is_mastered: false,
+                            spoken_text: "",
+                            status: "retry",
+                            failure_reason: result.failure_reason || "unknown",
+                            browser_error: result.browser_error || null,
+                            section: "cvc_reading"
+                        });
+                    }
+                });
+                return;
+                const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+                if (!SpeechRecognition) {
+                    alert("الميكروفون يعمل غالبًا على Chrome أو Edge ويحتاج السماح من المتصفح. بعد النشر يجب استخدام HTTPS.");
+                    return;
+                }
+                const recognition = new SpeechRecognition();
+                recognition.lang = "en-US";
+                recognition.continuous = false;
+                recognition.interimResults = false;
+                recognition.onresult = event => {
+                    const spokenText = event.results[0][0].transcript.trim();
+                    const score = similarity(spokenText, targetText);
+                    const mastered = score >= 65;
+                    const feedbackId = uiId || (eventType === "sight_word_mic" ? itemText : (fluencySentences.find(item => item.sentence === targetText)?.id || itemText));
+                    const feedback = document.getElementById(`feedback-fluency-${feedbackId}`);
+                    if (feedback) {
+                        const label = score >= 85 ? "ممتاز" : score >= 65 ? "جيد" : "حاول مرة أخرى";
+                        const resultClass = score >= 85 ? "excellent" : score >= 65 ? "good" : score >= 40 ? "try" : "bad";
+                        feedback.innerHTML = `<div class="mic-result ${resultClass}"><strong>${label}</strong><br>المطلوب: ${escapeHtml(targetText)}<br>ما سمعه النظام: ${escapeHtml(spokenText)}<br>نسبة التشابه: ${score}%</div>`;
+                    }
+                    saveCvcEvent({
+                        event_type: eventType === "sight_word_mic" ? "sight_word_practice" : "fluency_mic",
+                        item_text: itemText,
+                        level: "Fluency",
+                        fluency_level: activeFluencyMode,
+                        score,
+                        mastered
+                    });
+                };
+                recognition.onerror = () => alert("تعذر تشغيل المايك الآن. اسمح للمتصفح باستخدام الميكروفون ثم حاول مرة أخرى.");
+                recognition.start();
+            };
+
+            window.masterFluencyItem = function masterFluencyItem(type, itemText, sentence) {
+                const eventMap = {
+                    questions: "question_word_mastered",
+                    conversations: "conversation_complete",
+                    verbs: "action_verb_mastered",
+                    adjectives: "adjective_mastered",
+                    calendar: "fluency_calendar_mastered",
+                };
+                saveCvcEvent({ event_type: eventMap[type] || "fluency_attempt", item_text: itemText, level: "Fluency", fluency_level: type, lesson_id: `${type}-${itemText}`, score: 100, mastered: true });
+                displayFluency();
+            };
+
+            window.printCalendarWorksheets = function printCalendarWorksheets() {
+                const win = window.open("", "_blank", "width=1000,height=800");
+                if (!win) {
+                    alert("يرجى السماح بفتح النوافذ المنبثقة لطباعة أوراق العمل.");
+                    return;
+                }
+
+                const numberRows = numberWords.map(item => `
+                    <tr>
+                        <td>${escapeHtml(item.symbol)}</td>
+                        <td>${escapeHtml(item.word)}</td>
+                        <td>${escapeHtml(item.meaning)}</td>
+                        <td class="trace">${escapeHtml(item.word)} &nbsp; ${escapeHtml(item.word)} &nbsp; ${escapeHtml(item.word)}</td>
+                    </tr>
+                `).join("");
+
+                const dayRows = dayWords.map((item, index) => `
+                    <tr>
+                        <td>${index + 1}</td>
+                        <td>${escapeHtml(item.word)}</td>
+                        <td>${escapeHtml(item.meaning)}</td>
+                        <td>${escapeHtml(item.sentence)}</td>
+                    </tr>
+                `).join("");
+
+                const monthRows = monthWords.map((item, index) => `
+                    <tr>
+                        <td>${index + 1}</td>
+                        <td>${escapeHtml(item.word)}</td>
+                        <td>${escapeHtml(item.meaning)}</td>
+                        <td>${escapeHtml(item.sentence)}</td>
+                    </tr>
+                `).join("");
+
+                const quizRows = [
+                    "Write the number word: 7 = __________.",
+                    "Write the number word: 12 = __________.",
+                    "What day comes after Monday? __________.",
+                    "What day comes before Sunday? __________.",
+                    "What is the first month? __________.",
+                    "What is the last month? __________.",
+                    "Complete: I read on __________.",
+                    "Complete: January is the __________ month.",
+                    "Circle the day: March / Friday / ten.",
+                    "Circle the month: Tuesday / August / seven."
+                ].map((question, index) => `<li>${index + 1}. ${escapeHtml(question)}</li>`).join("");
+
+                win.document.open();
+                win.document.write(`
+<!DOCTYPE html>
+<html lang="ar" dir="rtl">
+<head>
+<meta charset="UTF-8">
+<title>Numbers, Days and Months Worksheets</title>
+<style>
+    * { box-sizing: border-box; }
+    body {
+        margin: 0;
+        padding: 24px;
+        font-family: "Tajawal", "Cairo", Arial, sans-serif;
+        color: #142033;
+        background: #f8fafc;
+    }
+    .sheet {
+        background: #fff;
+        border: 1px solid #cbd5e1;
+        border-radius: 10px;
+        padding: 22px;
+        margin: 0 auto 18px;
+        max-width: 980px;
+        page-break-after: always;
+    }
+    h1, h2 {
+        margin: 0 0 10px;
+        color: #0f766e;
+    }
+    .meta {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 12px;
+        margin: 12px 0 18px;
+    }
+    .line {
+        border-bottom: 1px solid #94a3b8;
+        min-height: 28px;
+    }
+    table {
+        width: 100%;
+        border-collapse: collapse;
+        margin-top: 12px;
+        direction: ltr;
+    }
+    th, td {
+        border: 1px solid #cbd5e1;
+        padding: 9px;
+        text-align: left;
+        vertical-align: top;
+    }
+    th {
+        background: #ecfeff;
+        color: #155e75;
+    }
+    .trace {
+        color: #94a3b8;
+        letter-spacing: 1px;
+    }
+    .practice-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 12px;
+        direction: ltr;
+    }
+    .box {
+        border: 1px solid #cbd5e1;
+        border-radius: 8px;
+        padding: 12px;
+        min-height: 74px;
+        background: #fff;
+    }
+    ol {
+        direction: ltr;
+        text-align: left;
+        line-height: 2;
+        font-size: 16px;
+    }
+    @media print {
+        body { background: #fff; padding: 0; }
+        .sheet { border: none; border-radius: 0; max-width: none; }
+    }
+</style>
+</head>
+<body>
+    <section class="sheet">
+        <h1>Numbers 0-20 | الأرقام</h1>
+        <div class="meta">
+            <div>Student name:<div class="line"></div></div>
+            <div>Class:<div class="line"></div></div>
+        </div>
+        <p>Listen, say, trace, then write the number word.</p>
+        <table>
+            <thead><tr><th>Number</th><th>Word</th><th>Arabic</th><th>Trace and write</th></tr></thead>
+            <tbody>${numberRows}</tbody>
+        </table>
+    </section>
+
+    <section class="sheet">
+        <h2>Days of the Week | أيام الأسبوع</h2>
+        <p>Read the day, say it aloud, then copy the sentence.</p>
+        <table>
+            <thead><tr><th>Order</th><th>Day</th><th>Arabic</th><th>Example</th></tr></thead>
+            <tbody>${dayRows}</tbody>
+        </table>
+        <h2 style="margin-top:22px;">Months of the Year | أشهر السنة</h2>
+        <table>
+            <thead><tr><th>Order</th><th>Month</th><th>Arabic</th><th>Example</th></tr></thead>
+            <tbody>${monthRows}</tbody>
+        </table>
+    </section>
+
+    <section class="sheet">
+        <h2>Practice Questions | أسئلة تدريبية</h2>
+        <ol>${quizRows}</ol>
+        <h2>Writing Practice</h2>
+        <div class="practice-grid">
+            <div class="box">Write five number words:<br><br>1. ________ 2. ________ 3. ________</div>
+            <div class="box">Write three days:<br><br>1. ________ 2. ________ 3. ________</div>
+            <div class="box">Write three months:<br><br>1. ________ 2. ________ 3. ________</div>
+            <div class="box">Make a sentence:<br><br>I read on __________.</div>
+        </div>
+    </section>
+</body>
+</html>`);
+                win.document.close();
+                setTimeout(() => win.print(), 300);
+            };
+
+            function sentenceLevelMeta(key) {
+                return sentenceLevels.find(level => level.key === key) || sentenceLevels[0];
+            }
+
+            function worksheetSheetForSentenceLevel(levelKey) {
+                return {
+                    cvc: "sentences",
+                    common: "common-sentences",
+                    daily: "common-sentences",
+                    numbers: "numbers",
+                    days: "days",
+                    months: "months",
+                    mixed: "sentences",
+                }[levelKey] || "sentences";
+            }
+
+            function sentenceDisplayData() {
+                const apiItems = (sentencesData || [])
+                    .filter(item => item.category !== "pronouns" && item.sentence)
+                    .map((item, index) => ({
+                        id: `api-${item.id || index}`,
+                        sentence: item.sentence,
+                        arabic_translation: item.arabic_translation || "تدريب قراءة جملة CVC.",
+                        emoji: item.emoji || "📝",
+                        target_words: sentenceTargets(item.sentence),
+                        sentence_level: "cvc",
+                        status: "new",
+                    }));
+                const seen = new Set();
+                return [...apiItems, ...enhancedSentenceBank].filter(item => {
+                    const key = normalizeText(item.sentence);
+                    if (seen.has(key)) return false;
+                    seen.add(key);
+                    return true;
+                });
+            }
+
+            function sentenceStatus(sentence) {
+                if (cvcProgress.sentences_mastered.includes(sentence.sentence)) return { label: "مكتملة", className: "mastered" };
+                if ((cvcProgress.needs_review_words || []).includes(sentence.sentence)) return { label: "تحتاج مراجعة", className: "review" };
+                if (cvcProgress.last_sentence === sentence.sentence) return { label: "قيد التدريب", className: "" };
+                return { label: "غير مكتملة", className: "" };
+            }
+
+            function buildSentenceQuestions(sentence) {
+                const words = normalizeText(sentence.sentence).split(" ").filter(Boolean);
+                const firstTarget = sentence.target_words?.[0] || words[0] || "word";
+                const whereAnswer = sentence.sentence.includes(" on ") ? "on" : sentence.sentence.includes(" in ") ? "in" : sentence.sentence.includes(" to ") ? "to" : "in the sentence";
+                const wrongPerson = sentence.sentence.toLowerCase().includes("cat") ? "The dog" : "The cat";
+                return [
+                    {
+                        type: "choice",
+                        title: "Who / What?",
+                        prompt: `ما الكلمة المهمة في الجملة؟`,
+                        options: [firstTarget, wrongPerson, "Monday"],
+                        answer: firstTarget,
+                    },
+                    {
+                        type: "choice",
+                        title: "Where / Meaning",
+                        prompt: "اختر معنى أو مكانًا مناسبًا للجملة.",
+                        options: [whereAnswer, "under", "behind"],
+                        answer: whereAnswer,
+                    },
+                    {
+                        type: "truefalse",
+                        title: "True or False",
+                        prompt: `الجملة تتحدث عن: ${firstTarget}`,
+                        options: ["True", "False"],
+                        answer: "True",
+                    },
+                    {
+                        type: "order",
+                        title: "Put the Words in Order",
+                        prompt: words.slice().sort(() => 0.5 - Math.random()).join(" / "),
+                        options: ["تم الترتيب", "أحتاج إعادة"],
+                        answer: "تم الترتيب",
+                    },
+                ];
+            }
+
+            function renderSentenceTabs() {
+                const container = document.getElementById("sentenceLevelTabs");
+                if (!container) return;
+                const data = sentenceDisplayData();
+                container.innerHTML = sentenceLevels.map(level => {
+                    const count = data.filter(sentence => sentence.sentence_level === level.key).length;
+                    const active = level.key === activeSentenceLevel ? " active" : "";
+                    return `<button class="sentence-level-btn${active}" type="button" style="border-color:${level.color};" onclick="selectSentenceLevel('${level.key}')">${level.title}<small>${level.ar} · ${count}</small></button>`;
+                }).join("");
+            }
+
+            function updateSentenceTimerNote() {
+                const note = document.getElementById("sentenceTimerNote");
+                if (!note) return;
+                const avg = cvcProgress.sentences_read ? Math.round((cvcProgress.sentence_total_time_seconds || 0) / Math.max(cvcProgress.sentences_read, 1)) : 0;
+                const best = cvcProgress.sentence_best_time_seconds || 0;
+                note.textContent = `الجمل المقروءة: ${cvcProgress.sentences_read} | متوسط الزمن: ${avg ? `${avg}ث` : "-"} | أفضل وقت: ${best ? `${best}ث` : "-"}`;
+            }
+
+            window.startSentenceTimer = function startSentenceTimer() {
+                if (sentenceTimerInterval) return;
+                sentenceTimerInterval = setInterval(() => {
+                    sentenceSeconds += 1;
+                    const mins = Math.floor(sentenceSeconds / 60).toString().padStart(2, "0");
+                    const secs = (sentenceSeconds % 60).toString().padStart(2, "0");
+                    document.getElementById("timer").textContent = `${mins}:${secs}`;
+                }, 1000);
+            };
+
+            window.pauseSentenceTimer = function pauseSentenceTimer() {
+                if (sentenceTimerInterval) clearInterval(sentenceTimerInterval);
+                sentenceTimerInterval = null;
+                if (sentenceSeconds > 0) {
+                    saveCvcEvent({
+                        event_type: "sentence_timer",
+                        item_text: cvcProgress.last_sentence || "sentence reading",
+                        level: "Sentences",
+                        sentence_level: activeSentenceLevel,
+                        reading_time: sentenceSeconds,
+                        mastered: false,
+                    });
+                }
+                updateSentenceTimerNote();
+            };
+
+            window.resetSentenceTimer = function resetSentenceTimer() {
+                if (sentenceTimerInterval) clearInterval(sentenceTimerInterval);
+                sentenceTimerInterval = null;
+                sentenceSeconds = 0;
+                document.getElementById("timer").textContent = "00:00";
+                updateSentenceTimerNote();
+            };
+
+            window.selectSentenceLevel = function selectSentenceLevel(levelKey) {
+                activeSentenceLevel = levelKey;
+                cvcProgress.last_sentence_level = levelKey;
+                renderSentenceTabs();
+                displaySentences();
+                updateSentenceTimerNote();
+            };
+
+            function renderSentenceCard(sentence) {
+                const meta = sentenceLevelMeta(sentence.sentence_level);
+                const status = sentenceStatus(sentence);
+                const questions = buildSentenceQuestions(sentence);
+                const chips = (sentence.target_words || []).map(word => `<span class="sentence-word-chip">${escapeHtml(word)}</span>`).join("");
+                return `
+                    <article class="sentence-card-pro" data-sentence-id="${escapeHtml(sentence.id)}">
+                        <div class="sentence-status-row">
+                            <span class="sentence-level-tag" style="background:${meta.color};">${meta.title}</span>
+                            <span class="sentence-status ${status.className}">${status.label}</span>
+                        </div>
+                        <div class="sentence-emoji">${sentence.emoji || "📝"}</div>
+                        <div class="sentence-text-main">${escapeHtml(sentence.sentence)}</div>
+                        <div class="sentence-translation">${escapeHtml(sentence.arabic_translation || "")}</div>
+                        <div class="sentence-targets">${chips}</div>
+                        <div class="sentence-actions">
+                            <button class="sentence-action-btn primary" type="button" onclick="playSentencePractice('${escapeHtml(sentence.id)}')">استمع</button>
+                            <button class="sentence-action-btn" type="button" onclick="recordWord('${escapeHtml(sentence.sentence).replace(/'/g, "\\'")}', 'sentence-${escapeHtml(sentence.id)}')">مايك</button>
+                            <button class="sentence-action-btn" type="button" onclick="masterSentence('${escapeHtml(sentence.id)}')">فهمت الجملة</button>
+                            <a class="sentence-action-btn" href="${pageUrls.worksheet}?sheet=${worksheetSheetForSentenceLevel(sentence.sentence_level)}&level=${sentence.sentence_level}" target="_blank">ورقة هذا المستوى</a>
+                        </div>
+                        <div class="feedback-area" id="feedback-sentence-${escapeHtml(sentence.id)}"></div>
+                        <div class="sentence-quiz-card">
+                            <div class="sentence-quiz-title">تدريب الأسئلة</div>
+                            ${questions.map((question, index) => `
+                                <div>
+                                    <div style="font-weight:900;margin-bottom:6px;">${question.title}: ${escapeHtml(question.prompt)}</div>
+                                    <div class="sentence-quiz-options">
+                                        ${question.options.map(option => `<button class="sentence-quiz-option" type="button" onclick="answerSentenceQuestion(this, '${escapeHtml(sentence.id)}', '${escapeHtml(option)}', '${escapeHtml(question.answer)}')">${escapeHtml(option)}</button>`).join("")}
+                                    </div>
+                                    <div id="sentence-q-${escapeHtml(sentence.id)}-${index}" class="cvc-save-status"></div>
+                                </div>
+                            `).join("")}
+                        </div>
+                    </article>
+                `;
+            }
+
+            window.displaySentences = function displaySentences() {
+                const grid = document.getElementById("sentencesGrid");
+                const loading = document.getElementById("sentencesLoading");
+                if (!grid) return;
+                if (loading) loading.style.display = "none";
+                grid.style.display = "grid";
+                renderSentenceTabs();
+                const meta = sentenceLevelMeta(activeSentenceLevel);
+                const note = document.getElementById("sentenceLevelNote");
+                if (note) note.textContent = `${meta.title}: ${meta.note}`;
+                let list = sentenceDisplayData().filter(sentence => sentence.sentence_level === activeSentenceLevel);
+                if (!list.length) list = sentenceDisplayData().filter(sentence => sentence.sentence_level === "cvc");
+                grid.innerHTML = list.map(renderSentenceCard).join("");
+                updateSentenceTimerNote();
+            };
+
+            window.playSentencePractice = function playSentencePractice(sentenceId) {
+                const sentence = sentenceDisplayData().find(item => String(item.id) === String(sentenceId));
+                if (!sentence) return;
+                playWord(sentence.sentence);
+                saveCvcEvent({
+                    event_type: "sentence",
+                    item_text: sentence.sentence,
+                    level: "Sentences",
+                    sentence_level: sentence.sentence_level,
+                    score: 10,
+                    mastered: false,
+                });
+            };
+
+            window.masterSentence = function masterSentence(sentenceId) {
+                const sentence = sentenceDisplayData().find(item => String(item.id) === String(sentenceId));
+                if (!sentence) return;
+                const feedback = document.getElementById(`feedback-sentence-${sentence.id}`);
+                if (feedback) feedback.innerHTML = `<div class="mic-result excellent"><strong>ممتاز</strong><br>تم حفظ الجملة ضمن تقدم المتعلم.</div>`;
+                saveCvcEvent({
+                    event_type: "sentence_mastered",
+                    item_text: sentence.sentence,
+                    level: "Sentences",
+                    sentence_level: sentence.sentence_level,
+                    lesson_id: `sentence-${sentence.id}`,
+                    score: 100,
+                    mastered: true,
+                });
+                displaySentences();
+            };
+
+            window.answerSentenceQuestion = function answerSentenceQuestion(button, sentenceId, selected, correct) {
+                const sentence = sentenceDisplayData().find(item => String(item.id) === String(sentenceId));
+                const ok = selected === correct;
+                button.classList.add(ok ? "correct" : "wrong");
+                Array.from(button.parentElement.children).forEach(item => {
+                    if (item.textContent === correct) item.classList.add("correct");
+                    item.disabled = true;
+                });
+                saveCvcEvent({
+                    event_type: "sentence_quiz",
+                    item_text: sentence?.sentence || sentenceId,
+                    level: "Sentences",
+                    sentence_level: sentence?.sentence_level || activeSentenceLevel,
+                    score: ok ? 100 : 0,
+                    mastered: ok,
+                });
+            };
+
+            window.startTimer = window.startSentenceTimer;
+            window.stopTimer = window.pauseSentenceTimer;
+
+            function storyLevelMeta(key) {
+                return storyLevels.find(level => level.key === key) || storyLevels[0];
+            }
+
+            function plainStoryText(story) {
+                return String(story.content || "").replace(/\[(.*?)\]/g, "$1").replace(/(\p{Emoji_Presentation}|\p{Extended_Pictographic})/gu, "").trim();
+            }
+
+            function storySentences(story) {
+                return plainStoryText(story).split(/\n+|(?<=[.!?])\s+/).map(item => item.trim()).filter(Boolean);
+            }
+
+            function storyTargets(story) {
+                if (Array.isArray(story.target_words) && story.target_words.length) return story.target_words;
+                const bracketWords = [...String(story.content || "").matchAll(/\[(.*?)\]/g)].map(match => match[1]).filter(Boolean);
+                if (bracketWords.length) return [...new Set(bracketWords)].slice(0, 8);
+                return normalizeText(story.title + " " + story.content).split(" ").filter(word => word.length > 2).slice(0, 8);
+            }
+
+            function inferStoryLevel(story) {
+                const title = normalizeText(story.title);
+                const text = normalizeText(story.content);
+                if (/(one|two|three|four|five|six|seven|eight|nine|ten)/.test(text)) return "numbers";
+                if (/(monday|tuesday|wednesday|thursday|friday|saturday|sunday|january|february|march|april|june|july|september|december)/.test(text)) return "days-months";
+                if (/(we|our|they|them|he|she|his|her)\b/.test(text)) return "pronoun";
+                if (title.includes("fun day") || title.includes("run")) return "daily";
+                if (storySentences(story).length > 4) return "sentence";
+                return "mini";
+            }
+
+            function enhanceStory(story, index) {
+                const level = story.level || inferStoryLevel(story);
+                const targets = storyTargets(story);
+                return {
+                    ...story,
+                    id: story.id || story.local_id || `story-${index}`,
+                    level,
+                    category: story.category || storyLevelMeta(level).title,
+                    emoji: story.emoji || (story.title?.includes("Dog") ? "🐶" : story.title?.includes("Sun") ? "☀️" : story.title?.includes("Cat") ? "🐱" : "📖"),
+                    target_words: targets,
+                    estimated_reading_time: Math.max(1, Math.ceil(plainStoryText(story).split(/\s+/).filter(Boolean).length / 45)),
+                    quiz_data: Array.isArray(story.quiz_data) && story.quiz_data.length ? story.quiz_data : buildStoryQuestions({ ...story, target_words: targets }),
+                };
+            }
+
+            function storyDisplayData() {
+                const apiStories = (storiesData || []).map(enhanceStory);
+                const apiKeys = new Set(apiStories.map(story => normalizeText(story.title)));
+                const extraStories = extraStoryBank.filter(story => !apiKeys.has(normalizeText(story.title))).map(enhanceStory);
+                return [...apiStories, ...extraStories];
+            }
+
+            function buildStoryQuestions(story) {
+                const targets = story.target_words || storyTargets(story);
+                const first = targets[0] || "cat";
+                const second = targets[1] || "mat";
+                return [
+                    { question: "Who or what is important in the story?", question_ar: "ما الكلمة المهمة في القصة؟", options: [first, "Monday", "school"], correct: 0 },
+                    { question: "Where does something happen?", question_ar: "أين يحدث شيء في القصة؟", options: [second, "under the sea", "in space"], correct: 0 },
+                    { question: `The story has the word ${first}.`, question_ar: "صح أو خطأ", options: ["True", "False"], correct: 0 },
+                    { question: "Choose the story picture.", question_ar: "اختر الصورة المناسبة.", options: [story.emoji || "📖", "🚗", "🌧️"], correct: 0 },
+                    { question: "Complete the missing word.", question_ar: "أكمل الكلمة الناقصة.", options: [second, "dog", "sun"], correct: 0 },
+                ];
+            }
+
+            function storyStatus(story) {
+                if (cvcProgress.completed_lessons.includes(`story-${story.id}`)) return { label: "مكتملة", className: "complete" };
+                if (cvcProgress.story_needs_review.includes(story.title)) return { label: "تحتاج مراجعة", className: "review" };
+                if (cvcProgress.stories_started.includes(story.title)) return { label: "بدأت", className: "" };
+                return { label: "جديدة", className: "" };
+            }
+
+            function renderStoryTabs() {
+                const container = document.getElementById("storyLevelTabs");
+                if (!container) return;
+                const stories = storyDisplayData();
+                container.innerHTML = storyLevels.map(level => {
+                    const count = stories.filter(story => story.level === level.key).length;
+                    return `<button class="story-level-btn${level.key === activeStoryLevel ? " active" : ""}" type="button" style="border-color:${level.color};" onclick="selectStoryLevel('${level.key}')">${level.title}<small>${level.ar} · ${count}</small></button>`;
+                }).join("");
+            }
+
+            window.selectStoryLevel = function selectStoryLevel(levelKey) {
+                activeStoryLevel = levelKey;
+                cvcProgress.last_story_level = levelKey;
+                renderStoryTabs();
+                displayStories();
+            };
+
+            function renderStoryCard(story) {
+                const meta = storyLevelMeta(story.level);
+                const status = storyStatus(story);
+                const wordCount = plainStoryText(story).split(/\s+/).filter(Boolean).length;
+                const targets = story.target_words.map(word => `<span class="story-target-chip">${escapeHtml(word)}</span>`).join("");
+                const cover = story.image_url
+                    ? `<img src="${story.image_url}" alt="${escapeHtml(story.title)}" onerror="this.replaceWith(Object.assign(document.createElement('span'), {textContent: '${story.emoji || "📖"}'}));">`
+                    : `<span>${story.emoji || "📖"}</span>`;
+                return `
+                    <article class="story-card-pro">
+                        <div class="story-cover">${cover}</div>
+                        <div class="story-status-row">
+                            <span class="story-chip" style="border-color:${meta.color};">${meta.title}</span>
+                            <span class="story-status ${status.className}">${status.label}</span>
+                        </div>
+                        <div class="story-title-main">${escapeHtml(story.title)}</div>
+                        <div class="story-meta-row">
+                            <span class="story-chip">${wordCount} كلمة</span>
+                            <span class="story-chip">${story.estimated_reading_time} دقيقة</span>
+                            <span class="story-chip">مستوى ${story.difficulty || 1}</span>
+                            <span class="story-chip">${story.quiz_data.length} أسئلة</span>
+                        </div>
+                        <div class="story-targets">${targets}</div>
+                        <div class="story-card-actions">
+                            <button class="story-action-btn primary" type="button" onclick="openStory('${story.id}')">اقرأ القصة</button>
+                            <button class="story-action-btn" type="button" onclick="playStoryFromCard('${story.id}')">استمع</button>
+                            <button class="story-action-btn" type="button" onclick="openStoryQuizFromCard('${story.id}')">اختبر فهمك</button>
+                            <a class="story-action-btn" href="${pageUrls.worksheet}?sheet=stories&story=${encodeURIComponent(story.id)}" target="_blank">ورقة عمل القصة</a>
+                        </div>
+                    </article>
+                `;
+            }
+
+            window.displayStories = function displayStories() {
+                const grid = document.getElementById("storiesGrid");
+                const loading = document.getElementById("storiesLoading");
+                if (!grid) return;
+                if (loading) loading.style.display = "none";
+                grid.style.display = "grid";
+                renderStoryTabs();
+                let list = storyDisplayData().filter(story => story.level === activeStoryLevel);
+                if (!list.length) list = storyDisplayData();
+                document.getElementById("storyListStat").textContent = list.length;
+                document.getElementById("storyLevelNote").textContent = `${storyLevelMeta(activeStoryLevel).title}: اختر قصة، استمع، اقرأ، ثم اختبر فهمك.`;
+                grid.innerHTML = list.map(renderStoryCard).join("");
+            };
+
+            window.playStoryFromCard = function playStoryFromCard(storyId) {
+                const story = storyDisplayData().find(item => String(item.id) === String(storyId));
+                if (!story) return;
+                SpeechManager.speak(plainStoryText(story), { rate: 0.8 });
+                saveCvcEvent({ event_type: "story_listen", item_text: story.title, level: "Stories", story_level: story.level, score: 10, mastered: false });
+            };
+
+            window.openStoryQuizFromCard = function openStoryQuizFromCard(storyId) {
+                openStory(storyId);
+                setTimeout(() => startStoryQuiz(), 150);
+            };
+
+            function renderStorySteps() {
+                const container = document.getElementById("storyStepTabs");
+                if (!container) return;
+                container.innerHTML = storySteps.map((step, index) => (
+                    `<button class="story-action-btn story-step-btn${index === activeStoryStep ? " active" : ""}" type="button" onclick="setStoryStep(${index})">${index + 1}. ${step}</button>`
+                )).join("");
+                const pct = Math.round(((activeStoryStep + 1) / storySteps.length) * 100);
+                document.getElementById("storyProgressFill").style.width = `${pct}%`;
+                document.getElementById("storyProgressText").textContent = `الخطوة ${activeStoryStep + 1} من ${storySteps.length}: ${storySteps[activeStoryStep]}`;
+            }
+
+            function renderStoryViewerContent() {
+                if (!window.activeEnhancedStory) return;
+                const story = window.activeEnhancedStory;
+                const sentences = storySentences(story);
+                const targets = story.target_words || [];
+                renderStorySteps();
+                const content = document.getElementById("storyViewContent");
+                if (activeStoryStep === 0) {
+                    content.innerHTML = `
+                        <div class="story-reader-card">
+                            <h3>Preview Words</h3>
+                            <p class="sentence-translation">اقرأ الكلمات المهمة قبل القصة.</p>
+                            <div class="story-targets">${targets.map(word => `<button class="story-target-chip" type="button" onclick="playWord('${escapeHtml(word)}')">${escapeHtml(word)}</button>`).join("")}</div>
+                        </div>`;
+                } else if (activeStoryStep === 1) {
+                    content.innerHTML = `
+                        <div class="story-reader-card">
+                            <h3>Listen to the Story</h3>
+                            <p class="sentence-translation">استمع للقصة كاملة ثم انتقل لقراءة كل جملة.</p>
+                            <button class="story-action-btn primary" type="button" onclick="playStoryAudio()">استمع للقصة كاملة</button>
+                        </div>`;
+                } else if (activeStoryStep === 2 || activeStoryStep === 3) {
+                    content.innerHTML = `
+                        <div class="story-reader-card">
+                            <h3>${activeStoryStep === 2 ? "Read Sentence by Sentence" : "Read Aloud"}</h3>
+                            ${sentences.map((sentence, index) => `
+                                <div class="story-sentence-row">
+                                    <div>
+                                        <div class="story-sentence-text">${highlightStoryTargets(sentence, targets)}</div>
+                                        <div class="sentence-translation">${storyArabicLine(story, index)}</div>
+                                    </div>
+                                    <div class="story-reader-actions">
+                                        <button class="story-action-btn" type="button" onclick="playWord('${escapeHtml(sentence).replace(/'/g, "\\'")}')">استمع</button>
+                                        <button class="story-action-btn" type="button" onclick="recordStorySentence(${index})">مايك</button>
+                                    </div>
+                                </div>
+                            `).join("")}
+                        </div>`;
+                } else if (activeStoryStep === 4) {
+                    startStoryQuiz();
+                    content.innerHTML = `<div class="story-reader-card"><h3>Comprehension Quiz</h3><p class="sentence-translation">أجب عن الأسئلة بالأسفل.</p></div>`;
+                } else {
+                    content.innerHTML = `
+                        <div class="story-reader-card">
+                            <h3>Story Complete</h3>
+                            <p class="sentence-translation">أحسنت. اضغط إكمال القصة لحفظ تقدمك في ملف المتعلم.</p>
+                            <button class="story-action-btn primary" type="button" onclick="completeActiveStory()">إكمال القصة</button>
+                        </div>`;
+                }
+            }
+
+            function highlightStoryTargets(sentence, targets) {
+                let output = escapeHtml(sentence);
+                targets.forEach(word => {
+                    const pattern = new RegExp(`\\b${word.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")}\\b`, "gi");
+                    output = output.replace(pattern, match => `<span class="story-word-highlight">${match}</span>`);
+                });
+                return output;
+            }
+
+            function storyArabicLine(story, index) {
+                return String(story.arabic_explanation || "").split(/\n+/)[index] || story.arabic_explanation || "";
+            }
+
+            window.setStoryStep = function setStoryStep(index) {
+                activeStoryStep = Math.max(0, Math.min(storySteps.length - 1, index));
+                renderStoryViewerContent();
+            };
+
+            window.nextStoryStep = function nextStoryStep() {
+                setStoryStep(activeStoryStep + 1);
+            };
+
+            window.previousStoryStep = function previousStoryStep() {
+                setStoryStep(activeStoryStep - 1);
+            };
+
+            window.openStory = function openStory(storyId) {
+                const story = storyDisplayData().find(item => String(item.id) === String(storyId));
+                if (!story) return;
+                window.activeEnhancedStory = story;
+                activeStoryStep = 0;
+                activeStorySentenceIndex = 0;
+                document.getElementById("storyViewTitle").textContent = story.title;
+                document.getElementById("storyViewMeta").innerHTML = `
+                    <span class="story-chip">${storyLevelMeta(story.level).title}</span>
+                    <span class="story-chip">${plainStoryText(story).split(/\s+/).filter(Boolean).length} كلمة</span>
+                    <span class="story-chip">${story.estimated_reading_time} دقيقة</span>
+                `;
+                const image = document.getElementById("storyViewImage");
+                const emoji = document.getElementById("storyViewEmoji");
+                if (story.image_url) {
+                    image.style.display = "";
+                    image.src = story.image_url;
+                    image.onerror = () => { image.style.display = "none"; emoji.style.display = "block"; emoji.textContent = story.emoji || "📖"; };
+                    emoji.style.display = "none";
+                } else {
+                    image.style.display = "none";
+                    emoji.style.display = "block";
+                    emoji.textContent = story.emoji || "📖";
+                }
+                document.getElementById("storyViewArabic").textContent = story.arabic_explanation || "";
+                document.getElementById("storyQuizArea").style.display = "none";
+                document.getElementById("storyQuizContainer").innerHTML = "";
+                document.getElementById("storyViewer").style.display = "block";
+                startStoryTimer();
+                saveCvcEvent({ event_type: "story_started", item_text: story.title, level: "Stories", story_level: story.level, score: 5, mastered: false });
+                renderStoryViewerContent();
+            };
+
+            window.playStoryAudio = function playStoryAudio() {
+                const story = window.activeEnhancedStory;
+                if (!story) return;
+                SpeechManager.speak(plainStoryText(story), { rate: 0.8 });
+                saveCvcEvent({ event_type: "story_listen", item_text: story.title, level: "Stories", story_level: story.level, score: 10, mastered: false });
+            };
+
+            window.recordStoryCurrentSentence = function recordStoryCurrentSentence() {
+                recordStorySentence(activeStorySentenceIndex || 0);
+            };
+
+            window.recordStorySentence = function recordStorySentence(index) {
+                const story = window.activeEnhancedStory;
+                if (!story) return;
+                activeStorySentenceIndex = index;
+                const sentence = storySentences(story)[index] || plainStoryText(story);
+                recordWord(sentence, `story-sentence-${story.id}-${index}`);
+            };
+
+            window.closeStory = function closeStory() {
+                document.getElementById("storyViewer").style.display = "none";
+                stopStoryTimer();
+                if (window.speechSynthesis) window.speechSynthesis.cancel();
+                window.activeEnhancedStory = null;
+            };
+
+            window.startStoryQuiz = function startStoryQuiz() {
+                const story = window.activeEnhancedStory;
+                if (!story) return;
+                const quizContainer = document.getElementById("storyQuizContainer");
+                document.getElementById("storyQuizArea").style.display = "block";
+                quizContainer.innerHTML = story.quiz_data.map((q, index) => `
+                    <div class="story-reader-card" style="margin-bottom:12px;">
+                        <h4>${index + 1}. ${escapeHtml(q.question || q.question_ar || "Question")}</h4>
+                        <div class="sentence-translation">${escapeHtml(q.question_ar || "")}</div>
+                        <div class="sentence-quiz-options">
+                            ${(q.options || []).map((option, optIndex) => `<button class="story-quiz-option" type="button" onclick="checkStoryAnswer(this, ${index}, ${optIndex})">${escapeHtml(option)}</button>`).join("")}
+                        </div>
+                        <div id="feedback-story-${index}" class="cvc-save-status"></div>
+                    </div>
+                `).join("");
+                stopStoryTimer();
+                document.getElementById("storyQuizArea").scrollIntoView({ behavior: "smooth" });
+            };
+
+            window.checkStoryAnswer = function checkStoryAnswer(btn, qIndex, optIndex) {
+                const story = window.activeEnhancedStory;
+                if (!story) return;
+                const question = story.quiz_data[qIndex];
+                const correctIndex = Number(question.correct || 0);
+                const ok = optIndex === correctIndex;
+                btn.classList.add(ok ? "correct" : "wrong");
+                Array.from(btn.parentElement.children).forEach((option, index) => {
+                    if (index === correctIndex) option.classList.add("correct");
+                    option.disabled = true;
+                });
+                const feedback = document.getElementById(`feedback-story-${qIndex}`);
+                if (feedback) feedback.textContent = ok ? "إجابة صحيحة" : "راجع القصة ثم حاول مرة أخرى";
+                saveCvcEvent({
+                    event_type: "story_quiz",
+                    item_text: story.title,
+                    level: "Stories",
+                    story_level: story.level,
+                    score: ok ? 100 : 0,
+                    mastered: ok,
+                });
+            };
+
+            window.completeActiveStory = function completeActiveStory() {
+                const story = window.activeEnhancedStory;
+                if (!story) return;
+                const lessonId = `story-${story.id}`;
+                if (!cvcProgress.completed_lessons.includes(lessonId)) cvcProgress.completed_lessons.push(lessonId);
+                saveCvcEvent({
+                    event_type: "story_complete",
+                    item_text: story.title,
+                    level: "Stories",
+                    story_level: story.level,
+                    lesson_id: lessonId,
+                    reading_time: storySeconds || 0,
+                    score: 100,
+                    mastered: true,
+                });
+                setStoryStep(5);
+            };
+
+            window.saveProgress = function saveProgress(type, points) {
+                const eventType = ["quiz", "spelling", "sentence", "story", "mic"].includes(type) ? type : "word";
+                return saveCvcEvent({
+                    event_type: eventType,
+                    item_text: cvcProgress.last_word || "",
+                    level: activeCvcLevel,
+                    family: cvcProgress.last_family || "",
+                    score: points || 0,
+                    mastered: Number(points || 0) >= 70 || eventType === "quiz" || eventType === "spelling"
+                });
+            };
+
+            window.initFilters = function initFilters() {
+                const container = document.getElementById("familyFilters");
+                if (!container) return;
+                container.innerHTML = "";
+                const filters = ["CVC", "Short Vowels"].includes(activeCvcLevel)
+                    ? [
+                        { key: "all", label: "كل CVC" },
+                        { key: "a", label: "short a" },
+                        { key: "e", label: "short e" },
+                        { key: "i", label: "short i" },
+                        { key: "o", label: "short o" },
+                        { key: "u", label: "short u" },
+                    ]
+                    : activeCvcLevel === "Word Families"
+                        ? [{ key: "all", label: "كل العائلات" }, ...[...new Set((wordsData || []).filter(word => word._levels?.includes("Word Families")).map(word => word.family).filter(Boolean))].sort().map(family => ({ key: family, label: `-${family}` }))]
+                        : [{ key: "all", label: activeCvcLevel }];
+                filters.forEach(filter => {
+                    const chip = document.createElement("div");
+                    const active = ["CVC", "Short Vowels"].includes(activeCvcLevel) || activeCvcLevel === "Word Families"
+                        ? filter.key === activeShortVowel
+                        : filter.key === "all";
+                    chip.className = `filter-chip${active ? " active" : ""}`;
+                    chip.textContent = filter.label;
+                    chip.onclick = () => {
+                        activeShortVowel = filter.key;
+                        document.querySelectorAll("#familyFilters .filter-chip").forEach(c => c.classList.remove("active"));
+                        chip.classList.add("active");
+                        displayWords();
+                        updateCvcStats();
+                    };
+                    container.appendChild(chip);
+                });
+                const titles = {
+                    CVC: "فلاتر CVC Basics",
+                    "Short Vowels": "اختر حرف العلة القصير",
+                    "Word Families": "اختر عائلة الكلمات",
+                    Blends: "Blends",
+                    Digraphs: "Digraphs"
+                };
+                document.querySelector(".section-title").textContent = titles[activeCvcLevel] || "اختر مستوى القراءة";
+                updateLevelDescription();
+            };
+
+            function matchesActiveLevel(word) {
+                if (activeCvcLevel === "Short Vowels") return word._levels?.includes("CVC") || word._level === "CVC";
+                if (activeCvcLevel === "Word Families") return word._levels?.includes("Word Families");
+                return word._levels?.includes(activeCvcLevel) || word._level === activeCvcLevel || word.category === activeCvcLevel;
+            }
+
+            function matchesShortFilter(word) {
+                if (!["CVC", "Short Vowels"].includes(activeCvcLevel)) return true;
+                return activeShortVowel === "all" || String(word.vowel_sound || "").toLowerCase() === activeShortVowel;
+            }
+
+            function renderWordCard(word, options = {}) {
+                const compact = options.compact ? "style=\"min-height: 260px;\"" : "";
+                return `
+                    <div class="word-card" data-word-id="${word.id}" ${compact}>
+                        <div class="word-image">${visualForWord(word)}</div>
+                        <div class="word-title">${word.word}</div>
+                        <div class="word-meaning">${word.arabic_meaning || ""}</div>
+                        <div style="display:flex;gap:6px;flex-wrap:wrap;justify-content:center;margin:8px 0;">
+                            <span class="word-badge">${word._level || word.category}</span>
+                            ${word.family ? `<span class="word-badge">-${word.family}</span>` : ""}
+                            ${word.vowel_sound ? `<span class="word-badge">short ${word.vowel_sound}</span>` : ""}
+                        </div>
+                        <div class="word-controls">
+                            <button class="btn btn-listen" onclick="playWord('${word.word}')">🔊 استمع</button>
+                            <button class="btn btn-record" onclick="recordWord('${word.word}', '${word.id}')">🎤 سجل</button>
+                            <button class="btn btn-listen" onclick="masterCvcWord('${word.id}')">✅ أتقنت</button>
+                        </div>
+                        <div class="feedback-area" id="feedback-${word.id}"></div>
+                    </div>
+                `;
+            }
+
+            function renderFamilyGroups(words) {
+                const groups = words.reduce((acc, word) => {
+                    const family = word.family || "mixed";
+                    acc[family] = acc[family] || [];
+                    acc[family].push(word);
+                    return acc;
+                }, {});
+                return Object.entries(groups)
+                    .sort(([a], [b]) => a.localeCompare(b))
+                    .map(([family, items]) => `
+                        <section class="family-group-card">
+                            <div style="display:flex;justify-content:space-between;gap:10px;align-items:center;flex-wrap:wrap;">
+                                <h3>عائلة -${family}</h3>
+                                <a class="btn btn-listen" href="${pageUrls.worksheet}?sheet=families" target="_blank">ورقة هذه العائلة</a>
+                            </div>
+                            <div class="family-word-grid">${items.map(word => renderWordCard(word, { compact: true })).join("")}</div>
+                        </section>
+                    `).join("");
+            }
+
+            window.displayWords = function displayWords() {
+                const grid = document.getElementById("wordsGrid");
+                document.getElementById("wordsLoading").style.display = "none";
+                grid.style.display = "grid";
+                let filtered = (wordsData || []).filter(word => matchesActiveLevel(word));
+                if (["CVC", "Short Vowels"].includes(activeCvcLevel)) filtered = filtered.filter(matchesShortFilter);
+                if (activeCvcLevel === "Word Families" && activeShortVowel !== "all") filtered = filtered.filter(word => word.family === activeShortVowel);
+                if (!filtered.length) {
+                    grid.innerHTML = '<div class="cvc-sub-note">لا توجد كلمات في هذا الاختيار. جرّب فلترًا آخر.</div>';
+                    return;
+                }
+                const intro = activeCvcLevel === "Word Families"
+                    ? '<div class="cvc-sub-note">Word Families تعرض كلمات CVC نفسها لكن مجمعة حسب العائلة.</div>'
+                    : '<div class="cvc-sub-note">ابدأ بقراءة الكلمات القصيرة: استمع، اقرأ، ثم انطق بالمايك.</div>';
+                grid.innerHTML = intro + (activeCvcLevel === "Word Families" ? renderFamilyGroups(filtered) : filtered.map(word => renderWordCard(word)).join(""));
+            };
+
+            window.recordWord = function recordWord(targetText, itemId) {
+                const speechButton = itemId?.nodeType ? itemId : (window.event?.target || null);
+                const speechItemKey = itemId?.nodeType ? itemId.closest("[data-word-id], [data-sentence-id]")?.dataset.wordId || itemId.closest("[data-word-id], [data-sentence-id]")?.dataset.sentenceId || targetText : itemId;
+                const isSentenceNew = String(speechItemKey || "").startsWith("sentence-");
+                const isStorySentenceNew = String(speechItemKey || "").startsWith("story-sentence-");
+                const isPronounSentenceNew = String(speechItemKey || "").startsWith("pronoun-sentence-");
+                const sentenceIdNew = isSentenceNew ? String(speechItemKey).replace(/^sentence-/, "") : "";
+                const sentenceNew = isSentenceNew ? sentenceDisplayData().find(item => String(item.id) === sentenceIdNew || item.sentence === targetText) : null;
+                const pronounIdNew = isPronounSentenceNew ? String(speechItemKey).replace(/^pronoun-sentence-/, "") : "";
+                const pronounItemNew = isPronounSentenceNew ? pronounSentenceBank.find(item => item.id === pronounIdNew || item.sentence === targetText) : null;
+                const wordNew = (wordsData || []).find(item => String(item.id) === String(speechItemKey) || item.word === targetText) || {};
+                const feedbackNew = document.getElementById(`feedback-${speechItemKey}`);
+                const eventTypeNew = isPronounSentenceNew ? "pronoun_mic" : (isStorySentenceNew ? "story_mic" : (isSentenceNew ? "sentence_mic" : "mic"));
+                const speechTypeNew = isStorySentenceNew ? "story" : (isSentenceNew || isPronounSentenceNew ? "sentence" : "word");
+                const basePayloadNew = () => ({
+                    event_type: eventTypeNew,
+                    item_text: isPronounSentenceNew ? (pronounItemNew?.pronoun || targetText) : (isStorySentenceNew ? (window.activeEnhancedStory?.title || targetText) : targetText),
+                    level: isPronounSentenceNew ? "Pronouns" : (isStorySentenceNew ? "Stories" : (isSentenceNew ? "Sentences" : (wordNew._level || activeCvcLevel))),
+                    family: wordNew.family || "",
+                    sentence_level: sentenceNew?.sentence_level || "",
+                    story_level: isStorySentenceNew ? (window.activeEnhancedStory?.level || "") : "",
+                    pronoun_level: pronounItemNew?.level || "",
+                    lesson_id: isSentenceNew || isPronounSentenceNew ? speechItemKey : "",
+                    section: "cvc_reading"
+                });
+                SpeechService.startRecognition({
+                    targetText,
+                    type: speechTypeNew,
+                    section: "cvc_reading",
+                    level: basePayloadNew().level,
+                    onStart: () => {
+                        if (speechButton) {
+                            speechButton.classList.add("recording");
+                            speechButton.textContent = SpeechService.messages.listening;
+                        }
+                    },
+                    onResult: result => {
+                        const mastered = result.status !== "retry";
+                        if (speechButton) {
+                            speechButton.classList.remove("recording");
+                            speechButton.textContent = result.status === "excellent" ? "✓ نطق صحيح" : "🎤 سجل";
+                            speechButton.classList.toggle("pronunciation-mastered", result.status === "excellent");
+                        }
+                        if (feedbackNew) {
+                            SpeechService.renderResult(feedbackNew, result);
+                            feedbackNew.classList.toggle("pronunciation-mastered", result.status === "excellent");
+                        }
+                        if (typeof showSuccessMessage === "function") showSuccessMessage(mastered, result.score, targetText, result.spokenText || result.spoken || "");
+                        saveCvcEvent({
+                            ...basePayloadNew(),
+                            score: result.score,
+                            mastered,
+                            is_mastered: result.status === "excellent",
+                            spoken_text: result.spokenText || result.spoken || "",
+                            status: result.status,
+                            failure_reason: result.failure_reason || null,
+                            browser_error: result.browser_error || null
+                        });
+                    },
+                    onError: result => {
+                        if (speechButton) {
+                            speechButton.classList.remove("recording");
+                            speechButton.textContent = "🎤 سجل";
+                        }
+                        if (feedbackNew) SpeechService.renderResult(feedbackNew, result);
+                        else alert(result.message || SpeechService.messages.unknown);
+                        saveCvcEvent({
+                            ...basePayloadNew(),
+                            score: 0,
+                            mastered: false,
+                            is_mastered: false,
+                            spoken_text: "",
+                            status: "retry",
+                            failure_reason: result.failure_reason || "unknown",
+                            browser_error: result.browser_error || null
+                        });
+                    }
+                });
+                return;
+                const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+                if (!SpeechRecognition) {
+                    alert("الميكروفون يعمل غالبًا على Chrome أو Edge، ويحتاج السماح من المتصفح. بعد النشر يجب استخدام HTTPS.");
+                    return;
+                }
+                const btn = itemId?.nodeType ? itemId : (window.event?.target || null);
+                const itemKey = itemId?.nodeType ? itemId.closest("[data-word-id], [data-sentence-id]")?.dataset.wordId || itemId.closest("[data-word-id], [data-sentence-id]")?.dataset.sentenceId || targetText : itemId;
+                const recognition = new SpeechRecognition();
+                recognition.lang = "en-US";
+                recognition.continuous = false;
+                recognition.interimResults = false;
+                if (btn) {
+                    btn.classList.add("recording");
+                    btn.textContent = "أستمع...";
+                }
+                recognition.onresult = event => {
+                    const spokenText = event.results[0][0].transcript.trim();
+                    const score = similarity(spokenText, targetText);
+                    const mastered = score >= 65;
+                    if (btn) {
+                        btn.classList.remove("recording");
+                        btn.textContent = "🎤 سجل";
+                    }
+                    showSuccessMessage(mastered, score, targetText, spokenText);
+                    const word = (wordsData || []).find(item => String(item.id) === String(itemKey) || item.word === targetText) || {};
+                    const feedback = document.getElementById(`feedback-${itemKey}`);
+                    if (feedback) {
+                        const label = score >= 85 ? "ممتاز" : score >= 65 ? "جيد" : "حاول مرة أخرى";
+                        const resultClass = score >= 85 ? "excellent" : score >= 65 ? "good" : score >= 40 ? "try" : "bad";
+                        feedback.innerHTML = `<div class="mic-result ${resultClass}"><strong>${label}</strong><br>الكلمة المطلوبة: ${targetText}<br>ما سمعه النظام: ${spokenText || "غير واضح"}<br>نسبة التشابه: ${score}%</div>`;
+                    }
+                    const isSentence = String(itemKey || "").startsWith("sentence-");
+                    const isStorySentence = String(itemKey || "").startsWith("story-sentence-");
+                    const isPronounSentence = String(itemKey || "").startsWith("pronoun-sentence-");
+                    const sentenceId = isSentence ? String(itemKey).replace(/^sentence-/, "") : "";
+                    const sentence = isSentence ? sentenceDisplayData().find(item => String(item.id) === sentenceId || item.sentence === targetText) : null;
+                    const pronounId = isPronounSentence ? String(itemKey).replace(/^pronoun-sentence-/, "") : "";
+                    const pronounItem = isPronounSentence ? pronounSentenceBank.find(item => item.id === pronounId || item.sentence === targetText) : null;
+                    saveCvcEvent({
+                        event_type: isPronounSentence ? "pronoun_mic" : (isStorySentence ? "story_mic" : (isSentence ? "sentence_mic" : "mic")),
+                        item_text: isPronounSentence ? (pronounItem?.pronoun || targetText) : (isStorySentence ? (window.activeEnhancedStory?.title || targetText) : targetText),
+                        level: isPronounSentence ? "Pronouns" : (isStorySentence ? "Stories" : (isSentence ? "Sentences" : (word._level || activeCvcLevel))),
+                        family: word.family || "",
+                        sentence_level: sentence?.sentence_level || "",
+                        story_level: isStorySentence ? (window.activeEnhancedStory?.level || "") : "",
+                        pronoun_level: pronounItem?.level || "",
+                        lesson_id: isSentence || isPronounSentence ? itemKey : "",
+                        score,
+                        mastered
+                    });
+                };
+                recognition.onerror = () => {
+                    if (btn) {
+                        btn.classList.remove("recording");
+                        btn.textContent = "🎤 سجل";
+                    }
+                    alert("تعذر تشغيل المايك الآن. اسمح للمتصفح باستخدام الميكروفون ثم حاول مرة أخرى.");
+                };
+                recognition.start();
+            };
+
+            const originalPlayWord = window.playWord;
+            window.playWord = function playWord(text) {
+                if (typeof originalPlayWord === "function") originalPlayWord(text);
+                else SpeechManager.speak(text, { rate: 0.75 });
+                const word = (wordsData || []).find(item => normalizeText(item.word) === normalizeText(text));
+                if (word) {
+                    saveCvcEvent({
+                        event_type: "listen",
+                        item_text: word.word,
+                        level: word._level || activeCvcLevel,
+                        family: word.family || "",
+                        score: 10,
+                        mastered: false
+                    });
+                } else if (normalizeText(text).includes(" ")) {
+                    saveCvcEvent({
+                        event_type: "sentence",
+                        item_text: text,
+                        level: "Sentences",
+                        family: "",
+                        score: 10,
+                        mastered: false
+                    });
+                }
+            };
+
+            window.masterCvcWord = function masterCvcWord(wordId) {
+                const word = (wordsData || []).find(item => String(item.id) === String(wordId));
+                if (!word) return;
+                const feedback = document.getElementById(`feedback-${word.id}`);
+                if (feedback) {
+                    feedback.innerHTML = `<div class="mic-result excellent"><strong>تم الإتقان</strong><br>${word.word} محفوظة في تقدم المتعلم.</div>`;
+                }
+                saveCvcEvent({
+                    event_type: "word",
+                    item_text: word.word,
+                    level: word._level || activeCvcLevel,
+                    family: word.family || "",
+                    score: 100,
+                    mastered: true
+                });
+            };
+
+            window.renderMatchingGame = function renderMatchingGame() {
+                const gameWords = [...(wordsData || [])].filter(word => matchesActiveLevel(word) && (activeCvcLevel === "Word Families" || matchesShortFilter(word))).sort(() => 0.5 - Math.random()).slice(0, 4);
+                const shuffledWords = [...gameWords].sort(() => 0.5 - Math.random());
+                if (!gameWords.length) {
+                    document.getElementById("exercise-container").innerHTML = '<div class="cvc-sub-note">اختر مستوى يحتوي كلمات أولًا.</div>';
+                    return;
+                }
+                document.getElementById("exercise-container").innerHTML = `
+                    <div class="matching-game">
+                        <div class="matching-column">${gameWords.map(w => `<div class="match-item" onclick="handleMatchClick(this, 'image', '${w.id}')">${w.emoji || "🎯"}</div>`).join("")}</div>
+                        <div class="matching-column">${shuffledWords.map(w => `<div class="match-item" onclick="handleMatchClick(this, 'word', '${w.id}')">${w.word}</div>`).join("")}</div>
+                    </div>
+                    <div id="match-feedback" style="text-align:center;margin-top:20px;font-weight:bold;"></div>
+                    <div style="text-align:center;margin-top:20px;"><button class="btn btn-listen" onclick="renderMatchingGame()">لعبة جديدة</button></div>
+                `;
+            };
+
+            window.renderSpellingGame = function renderSpellingGame() {
+                const pool = (wordsData || []).filter(word => matchesActiveLevel(word) && (activeCvcLevel === "Word Families" || matchesShortFilter(word)));
+                const word = pool[Math.floor(Math.random() * pool.length)] || (wordsData || [])[0];
+                if (!word) {
+                    document.getElementById("exercise-container").innerHTML = '<div class="cvc-sub-note">لا توجد كلمة للتهجئة في هذا المستوى.</div>';
+                    return;
+                }
+                document.getElementById("exercise-container").innerHTML = `
+                    <div class="quiz-container">
+                        <div class="quiz-question">اكتب الكلمة المسموعة</div>
+                        <div class="word-image" style="margin:auto;">${visualForWord(word)}</div>
+                        <button class="btn btn-listen" style="margin:10px auto;" onclick="playWord('${word.word}')">استمع للكلمة</button>
+                        <div class="spelling-container" style="margin-top:20px;">
+                            <input type="text" class="spelling-input" id="spelling-input" placeholder="اكتب هنا..." autocomplete="off">
+                            <button class="check-btn" onclick="checkSpelling('${word.word}')">تحقق</button>
+                        </div>
+                        <div id="spelling-feedback" style="margin-top:20px;font-weight:bold;"></div>
+                        <button class="btn btn-listen" style="margin:20px auto;display:none;" id="next-spell-btn" onclick="renderSpellingGame()">الكلمة التالية</button>
+                    </div>
+                `;
+            };
+
+            const originalCheckSpelling = window.checkSpelling;
+            window.checkSpelling = function checkSpelling(correctWord) {
+                originalCheckSpelling(correctWord);
+                const input = document.getElementById("spelling-input");
+                const mastered = normalizeText(input?.value) === normalizeText(correctWord);
+                saveCvcEvent({ event_type: "spelling", item_text: correctWord, level: activeCvcLevel, score: mastered ? 100 : 0, mastered });
+            };
+
+            const originalStartStoryQuiz = window.startStoryQuiz;
+            window.startStoryQuiz = function startStoryQuiz() {
+                const story = typeof activeStory !== "undefined" ? activeStory : null;
+                const hasQuiz = Boolean(story?.quiz_data?.length);
+                const result = originalStartStoryQuiz?.();
+                if (story && hasQuiz) {
+                    const lessonId = `story-${story.id || story.title}`;
+                    if (!cvcProgress.completed_lessons.includes(lessonId)) {
+                        cvcProgress.completed_lessons.push(lessonId);
+                        saveCvcEvent({
+                            event_type: "story",
+                            item_text: story.title || lessonId,
+                            level: "Stories",
+                            family: "",
+                            lesson_id: lessonId,
+                            score: 100,
+                            mastered: true
+                        });
+                    }
+                }
+                return result;
+            };
+
+            async function hydrateWordsFromApi(append = false) {
+                const staticWords = [...(cvcStaticWordsFallback.length ? cvcStaticWordsFallback : (wordsData || []))].map((word, index) => {
+                    const item = { ...word, id: word.id || `static-${index}`, _level: primaryLevelForWord(word) };
+                    item.category = item._level;
+                    item._levels = levelsForWord(item);
+                    return item;
+                });
+                try {
+                    if (!append) resetCvcPager("words");
+                    const apiWords = (await fetchCvcApiPage("words", pageUrls.words, {
+                        keyForItem: item => item.id || item.word,
+                    })).map(transformApiWord);
+                    const existingApiWords = append ? (wordsData || []).filter(word => word._source === "api") : [];
+                    const mergedApiWords = [...existingApiWords, ...apiWords].filter((word, index, list) => {
+                        const key = normalizeText(word.word);
+                        return key && list.findIndex(item => normalizeText(item.word) === key) === index;
+                    });
+                    const apiKeys = new Set(mergedApiWords.map(word => normalizeText(word.word)));
+                    const staticExtensions = staticWords.filter(word => !apiKeys.has(normalizeText(word.word)) && ["Blends", "Digraphs"].includes(word._level));
+                    wordsData = [...mergedApiWords, ...staticExtensions];
+                    apiWordsLoaded = true;
+                    initFilters();
+                    displayWords();
+                    updateCvcStats();
+                    renderCvcPager("words", "wordsGrid", "loadMoreCvcWords");
+                    document.getElementById("cvcSaveStatus").textContent = `Loaded ${cvcApiPages.words.loadedKeys.size} / ${cvcApiPages.words.count || cvcApiPages.words.loadedKeys.size} CVC word records from the database.`;
+                } catch (error) {
+                    wordsData = staticWords;
+                    initFilters();
+                    displayWords();
+                    updateCvcStats();
+                    document.getElementById("cvcSaveStatus").textContent = "تعذر تحميل API، تم استخدام بيانات احتياطية داخل الصفحة.";
+                }
+            }
+
+            window.loadMoreCvcWords = async function loadMoreCvcWords() {
+                await hydrateWordsFromApi(true);
+            };
+
+            document.addEventListener("DOMContentLoaded", () => {
+                document.querySelectorAll(".cvc-level-btn[data-cvc-level]").forEach(button => {
+                    button.classList.toggle("active", button.dataset.cvcLevel === activeCvcLevel);
+                    button.addEventListener("click", () => {
+                        activeCvcLevel = button.dataset.cvcLevel;
+                        activeShortVowel = activeCvcLevel === "Short Vowels" ? "a" : "all";
+                        cvcProgress.last_level = activeCvcLevel;
+                        document.querySelectorAll(".cvc-level-btn").forEach(btn => btn.classList.toggle("active", btn === button));
+                        initFilters();
+                        displayWords();
+                        updateCvcStats();
+                    });
+                });
+                setTimeout(hydrateWordsFromApi, 250);
+                updateCvcStats();
+            });
+        })();
@@ -0,0 +1,71 @@
+let quizScore = 0;
+                    let quizAnswered = 0;
+                    const totalQuizQuestions = 15;
+                    
+                    // Quiz answers with explanations
+                    const quizExplanations = {
+                        1: { correct: "I", explanation: "نستخدم 'I' كفاعل في الجملة - Subject pronoun" },
+                        2: { correct: "me", explanation: "نستخدم 'me' بعد حرف الجر 'to' - Object pronoun" },
+                        3: { correct: "my", explanation: "نستخدم 'my' قبل الاسم - Possessive adjective" },
+                        4: { correct: "He", explanation: "نستخدم 'He' للمذكر كفاعل - Subject pronoun (masculine)" },
+                        5: { correct: "mine", explanation: "نستخدم 'mine' للملكية بدون اسم بعدها - Possessive pronoun" },
+                        6: { correct: "him", explanation: "نستخدم 'him' كمفعول به - Object pronoun (masculine)" },
+                        7: { correct: "They", explanation: "نستخدم 'They' للجمع - Subject pronoun (plural)" },
+                        8: { correct: "yours", explanation: "نستخدم 'yours' للملكية بدون اسم - Possessive pronoun" },
+                        9: { correct: "She", explanation: "نستخدم 'She' للمؤنث كفاعل - Subject pronoun (feminine)" },
+                        10: { correct: "us", explanation: "نستخدم 'us' كمفعول به للجمع - Object pronoun (we)" },
+                        11: { correct: "Her", explanation: "نستخدم 'Her' قبل الاسم - Possessive adjective (feminine)" },
+                        12: { correct: "It", explanation: "نستخدم 'It' لغير العاقل - Pronoun for animals/things" },
+                        13: { correct: "his", explanation: "'his' تستخدم كملكية وصفة معاً - Possessive (masculine)" },
+                        14: { correct: "We", explanation: "نستخدم 'We' كفاعل للجمع المتكلم - Subject pronoun (we)" },
+                        15: { correct: "theirs", explanation: "نستخدم 'theirs' للملكية بدون اسم - Possessive pronoun (they)" }
+                    };
+                    
+                    function checkQuizAnswer(button, questionNum, isCorrect) {
+                        const allButtons = button.parentElement.querySelectorAll('.quiz-btn');
+                        const feedbackDiv = document.getElementById(`quiz-feedback-${questionNum}`);
+                        const explanation = quizExplanations[questionNum];
+                        
+                        // Disable all buttons
+                        allButtons.forEach(btn => btn.disabled = true);
+                        
+                        // Mark as answered if first time
+                        if (!button.parentElement.parentElement.classList.contains('answered')) {
+                            button.parentElement.parentElement.classList.add('answered');
+                            quizAnswered++;
+                            
+                            if (isCorrect) {
+                                quizScore++;
+                                button.classList.add('correct');
+                                feedbackDiv.innerHTML = `<div style="background:#d1fae5; color:#065f46; padding:15px; border-radius:10px;">✅ <strong>صحيح!</strong> ${explanation.explanation}</div>`;
+                            } else {
+                                button.classList.add('wrong');
+                                // Highlight correct answer
+                                allButtons.forEach(btn => {
+                                    if (btn.textContent.trim() === explanation.correct) {
+                                        btn.classList.add('correct');
+                                    }
+                                });
+                                feedbackDiv.innerHTML = `<div style="background:#fee2e2; color:#991b1b; padding:15px; border-radius:10px;">❌ <strong>خطأ!</strong> الجواب الصحيح: <strong>${explanation.correct}</strong><br>${explanation.explanation}</div>`;
+                            }
+                            
+                            feedbackDiv.style.display = 'block';
+                            
+                            // Show final score if all answered
+                            if (quizAnswered === totalQuizQuestions) {
+                                showQuizScore();
+                            }
+                        }
+                    }
+                    
+                    function showQuizScore() {
+                        const scoreDisplay = document.getElementById('quiz-score-display');
+                        const scoreText = document.getElementById('quiz-score-text');
+                        const percentage = Math.round((quizScore / totalQuizQuestions) * 100);
+                        
+                        scoreText.innerHTML = `Score: ${quizScore}/${totalQuizQuestions} (${percentage}%)`;
+                        scoreDisplay.style.display = 'block';
+                        
+                        // Scroll to score
+                        scoreDisplay.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    }
@@ -0,0 +1,3701 @@
+// نظام إدارة الصوت البريطاني المحسن
+        class BritishSoundManager {
+            constructor() {
+                this.sounds = new Map();
+                this.currentSpeech = null;
+                this.isSpeaking = false;
+                this.audioQueue = [];
+                this.isProcessing = false;
+                this.britishVoices = [];
+                this.currentBritishVoice = null;
+                this.isSpeakingEnabled = true;
+            }
+            
+            // "female".includes("male") is true, so a plain substring test picks
+            // female voices such as "Google UK English Female". Require a word
+            // boundary and exclude female explicitly.
+            isMaleVoiceName(name) {
+                const value = String(name || '');
+                return /\bmale\b/i.test(value) && !/\bfemale\b/i.test(value);
+            }
+
+            async initialize() {
+                if (window.speechSynthesis) {
+                    const loadVoices = () => {
+                        const voices = window.speechSynthesis.getVoices();
+                        
+                        // Priority 1: Specific high-quality British Male voices
+                        const preferredNames = [
+                            'Google UK English Male', 
+                            'Microsoft George', 
+                            'Microsoft Ryan',
+                            'Daniel',
+                            'Arthur',
+                            'Gordon',
+                            'Aaron'
+                        ];
+                        
+                        // Try to find exact matches first
+                        this.britishVoices = voices.filter(voice => 
+                            preferredNames.some(name => voice.name.includes(name))
+                        );
+
+                        // Priority 2: Any English Male voice (GB preferred)
+                        if (this.britishVoices.length === 0) {
+                            this.britishVoices = voices.filter(voice =>
+                                (voice.lang.includes('GB') || voice.lang.includes('UK')) &&
+                                this.isMaleVoiceName(voice.name)
+                            );
+                        }
+
+                        // Priority 3: Any English Male voice
+                        if (this.britishVoices.length === 0) {
+                            this.britishVoices = voices.filter(voice =>
+                                voice.lang.includes('en') &&
+                                this.isMaleVoiceName(voice.name)
+                            );
+                        }
+                        
+                        // Priority 4: Any British voice
+                        if (this.britishVoices.length === 0) {
+                            this.britishVoices = voices.filter(voice => 
+                                voice.lang.includes('GB') || 
+                                voice.name.includes('UK') || 
+                                voice.name.includes('British')
+                            );
+                        }
+                        
+                        this.currentBritishVoice = this.britishVoices[0] || voices.find(v => v.lang.startsWith('en') && !/(female|zira|hazel|susan|sonia|libby)/i.test(v.name)) || voices.find(v => v.lang.startsWith('en'));
+                        console.log("Selected Voice:", this.currentBritishVoice ? this.currentBritishVoice.name : "Default");
+                    };
+                    
+                    loadVoices();
+                    window.speechSynthesis.onvoiceschanged = loadVoices;
+                }
+            }
+            
+            async speak(text, lang = 'en-GB') {
+                if (!window.speechSynthesis || !this.isSpeakingEnabled) return;
+                
+                return new Promise((resolve) => {
+                    // Cancel immediately for faster response
+                    if (this.isSpeaking) {
+                        window.speechSynthesis.cancel();
+                    }
+                    
+                    const utterance = new SpeechSynthesisUtterance(text);
+                    utterance.lang = lang;
+                    utterance.rate = 0.82; // سرعة محسّنة للوضوح والسرعة
+                    utterance.pitch = 0.95; // نبرة طبيعية
+                    utterance.volume = 1.0; // أعلى مستوى صوت
+                    
+                    if (this.currentBritishVoice) {
+                        utterance.voice = this.currentBritishVoice;
+                    } else {
+                        const voices = window.speechSynthesis.getVoices();
+                        // محاولة أخيرة للعثور على صوت مناسب عند التحدث
+                        const britishVoice = voices.find(voice =>
+                            voice.name.includes('Google UK English Male') ||
+                            voice.name.includes('Microsoft George') ||
+                            (voice.lang.startsWith('en-GB') && this.isMaleVoiceName(voice.name))
+                        ) || voices.find(voice => voice.lang.startsWith('en-GB'));
+                        
+                        if (britishVoice) {
+                            utterance.voice = britishVoice;
+                        }
+                    }
+                    
+                    utterance.onstart = () => {
+                        this.isSpeaking = true;
+                        this.currentSpeech = utterance;
+                    };
+                    
+                    utterance.onend = () => {
+                        this.isSpeaking = false;
+                        this.currentSpeech = null;
+                        resolve();
+                    };
+                    
+                    utterance.onerror = () => {
+                        this.isSpeaking = false;
+                        this.currentSpeech = null;
+                        resolve();
+                    };
+                    
+                    // استجابة فورية - بدون تأخير
+                    window.speechSynthesis.speak(utterance);
+                });
+            }
+            
+            // One shared AudioContext for the whole page. Creating a fresh one per
+            // sound hit the browser's concurrent-context limit after a handful of
+            // quick taps and silenced the page; it also cost 20-50ms every time.
+            // Reusing it additionally gives the existing mobile audio-unlock code
+            // in init() a real context to resume.
+            getAudioContext() {
+                const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+                if (!AudioContextClass) return null;
+
+                if (!this.audioContext || this.audioContext.state === 'closed') {
+                    try {
+                        this.audioContext = new AudioContextClass();
+                    } catch (error) {
+                        console.warn('[LettersApp][Audio] context unavailable', error);
+                        return null;
+                    }
+                }
+
+                if (this.audioContext.state === 'suspended') {
+                    // Fire and forget: playback below still schedules correctly.
+                    this.audioContext.resume().catch(() => {});
+                }
+
+                return this.audioContext;
+            }
+
+            playSound(type) {
+                if (!this.isSpeakingEnabled) return;
+
+                const audioContext = this.getAudioContext();
+                if (!audioContext) return;
+
+                const oscillator = audioContext.createOscillator();
+                const gainNode = audioContext.createGain();
+
+                oscillator.connect(gainNode);
+                gainNode.connect(audioContext.destination);
+                
+                let frequency, duration;
+                
+                switch(type) {
+                    case 'success':
+                        frequency = [523.25, 659.25, 783.99];
+                        duration = 0.5;
+                        break;
+                    case 'error':
+                        frequency = [220, 180];
+                        duration = 0.3;
+                        break;
+                    case 'click':
+                        frequency = [440];
+                        duration = 0.1;
+                        break;
+                    case 'win':
+                        frequency = [523.25, 659.25, 783.99, 1046.50];
+                        duration = 0.8;
+                        break;
+                    case 'applause':
+                        // Fanfare sequence
+                        frequency = [523.25, 659.25, 783.99, 1046.50, 783.99, 1046.50];
+                        duration = 1.5;
+                        break;
+                    case 'fireworks':
+                        frequency = [392, 523.25, 659.25, 784];
+                        duration = 1.0;
+                        break;
+                    default:
+                        frequency = [440];
+                        duration = 0.2;
+                }
+                
+                oscillator.frequency.setValueAtTime(frequency[0], audioContext.currentTime);
+                
+                if (frequency.length > 1) {
+                    frequency.forEach((freq, index) => {
+                        oscillator.frequency.setValueAtTime(freq, audioContext.currentTime + (index * 0.15));
+                    });
+                }
+                
+                gainNode.gain.setValueAtTime(0.3, audioContext.currentTime);
+                gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + duration);
+                
+                oscillator.start(audioContext.currentTime);
+                oscillator.stop(audioContext.currentTime + duration);
+
+                // The context is shared and stays open; release only this tone's
+                // nodes once it has finished so nothing accumulates in the graph.
+                oscillator.onended = () => {
+                    try {
+                        oscillator.disconnect();
+                        gainNode.disconnect();
+                    } catch (error) {
+                        /* already torn down */
+                    }
+                };
+            }
+            
+            stopAll() {
+                if (this.isSpeaking) {
+                    window.speechSynthesis.cancel();
+                    this.isSpeaking = false;
+                }
+            }
+        }
+
+        // إنشاء مدير الصوت العالمي
+        const soundManager = new BritishSoundManager();
+        soundManager.initialize();
+
+        // دالة عامة للنطق بالإنجليزية البريطانية
+        window.speak = function(text,rate = 1) {
+            soundManager.speak(text, 'en-GB');
+        };
+
+        // بيانات الحروف والكلمات المحسنة
+        // Letter data is loaded from /static/js/letters/letter_data.js
+        const LETTER_DATA = window.LETTER_DATA || {};
+
+        function finalizeLetterData() {
+            LETTERS.forEach(letter => {
+                if (!LETTER_DATA[letter]) {
+                    LETTER_DATA[letter] = { words: [], quiz: [], type: "" };
+                }
+
+                const limitedWords = (LETTER_DATA[letter].words || [])
+                    .filter(item => String(item.word || "").trim().length <= MAX_WORD_LENGTH)
+                    .slice(0, WORDS_PER_LETTER);
+
+                const words = limitedWords.map(item => String(item.word || "").trim());
+                const emojis = limitedWords.map(item => item.emoji || "\uD83D\uDD24");
+                const translations = limitedWords.map(item => item.translation || item.word);
+
+                LETTER_DATA[letter].words = limitedWords;
+                LETTER_DATA[letter].quiz = generateQuizForLetter(letter, words, emojis, translations);
+                LETTER_DATA[letter].type = LETTER_DATA[letter].type || (["A", "E", "I", "O", "U"].includes(letter) ? "\u062d\u0631\u0641 \u0645\u062a\u062d\u0631\u0643" : "\u062d\u0631\u0641 \u0633\u0627\u0643\u0646");
+            });
+        }
+
+        finalizeLetterData();
+
+        // Republish the resolved objects so extracted modules always share the
+        // exact same references as this script, even if letter_data.js is absent
+        // and the fallbacks above were used. No-op in the normal case.
+        window.LETTERS = LETTERS;
+        window.LETTER_DATA = LETTER_DATA;
+
+        function getLetterSound(letter) {
+            const sounds = {
+                'A': 'æ', 'B': 'b', 'C': 'k', 'D': 'd', 'E': 'e', 
+                'F': 'f', 'G': 'g', 'H': 'h', 'I': 'ɪ', 'J': 'dʒ',
+                'K': 'k', 'L': 'l', 'M': 'm', 'N': 'n', 'O': 'ɒ',
+                'P': 'p', 'Q': 'kw', 'R': 'r', 'S': 's', 'T': 't',
+                'U': 'ʌ', 'V': 'v', 'W': 'w', 'X': 'ks', 'Y': 'j', 'Z': 'z'
+            };
+            return sounds[letter] || 'æ';
+        }
+
+        function generateQuizForLetter(letter, words, emojis, translations) {
+            // قائمة كلمات للتمويه (Distractors)
+            const distractorPairs = [
+                ["ant", "🐜"], ["ball", "⚽"], ["cat", "🐱"], ["dog", "🐶"], ["egg", "🥚"],
+                ["fish", "🐟"], ["goat", "🐐"], ["hat", "🎩"], ["ice", "🧊"], ["jam", "🍓"],
+                ["kite", "🪁"], ["lion", "🦁"], ["nest", "🪹"], ["sun", "☀️"], ["van", "🚐"],
+                ["box", "📦"], ["yoyo", "🪀"], ["zoo", "🐾"], ["pen", "🖊️"], ["web", "🕸️"]
+            ];
+            const commonDistractors = distractorPairs.map(pair => pair[0]);
+            const commonEmojis = distractorPairs.map(pair => pair[1]);
+            
+            // استبعاد كلمات الحرف الحالي من التمويه
+            const validDistractors = commonDistractors.filter(w => !w.toLowerCase().startsWith(letter.toLowerCase()));
+            const validEmojiDistractors = commonEmojis.filter((e, i) => !commonDistractors[i].toLowerCase().startsWith(letter.toLowerCase()));
+            
+            // خلط واختيار مموهات عشوائية
+            const getRandom = (arr, count) => arr.sort(() => 0.5 - Math.random()).slice(0, count);
+            
+            const wrongWords = getRandom(validDistractors, 3);
+            const wrongEmojis = getRandom(validEmojiDistractors, 3);
+            
+            // الكلمة الصحيحة (أول كلمة في القائمة)
+            const correctWord = words[0].toLowerCase();
+            const correctEmoji = emojis ? emojis[0] : "❓";
+            
+            // خيارات السؤال الثاني (كلمة تبدأ بالحرف)
+            const q2Options = [correctWord, ...wrongWords].sort(() => 0.5 - Math.random());
+            const q2CorrectIndex = q2Options.indexOf(correctWord);
+            
+            // خيارات السؤال الرابع (صورة تبدأ بالحرف)
+            const q4Options = [correctEmoji, ...wrongEmojis].sort(() => 0.5 - Math.random());
+            const q4CorrectIndex = q4Options.indexOf(correctEmoji);
+            
+            // خيارات السؤال السادس (معنى الكلمة)
+            // نستخدم الكلمة الثانية كهدف
+            const targetWordForTrans = words[1] ? words[1].toLowerCase() : correctWord;
+            const targetTrans = translations && translations[1] ? translations[1] : (translations ? translations[0] : "معنى");
+            
+            // مموهات للمعنى (نحتاج ترجمات عشوائية)
+            const allTranslations = ["تفاحة", "كرة", "قطة", "كلب", "بيضة", "سمكة", "ماعز", "قبعة", "ثلج", "عصير", "طائرة ورقية", "أسد", "قرد", "عش", "برتقال", "بيتزا", "ملكة", "أرنب", "شمس", "نمر", "مظلة", "شاحنة", "ساعة", "صندوق", "يويو", "حمار وحشي"];
+            const wrongTrans = getRandom(allTranslations.filter(t => t !== targetTrans), 3);
+            const q6Options = [targetTrans, ...wrongTrans].sort(() => 0.5 - Math.random());
+            const q6CorrectIndex = q6Options.indexOf(targetTrans);
+
+            const soundDistractorLetters = LETTERS
+                .filter(otherLetter => otherLetter !== letter)
+                .sort(() => 0.5 - Math.random())
+                .slice(0, 3);
+            const soundOptionsRaw = [
+                { text: `/${getLetterSound(letter)}/ كما في ${correctWord}`, correct: true },
+                ...soundDistractorLetters.map(otherLetter => {
+                    const otherWord = String(LETTER_DATA[otherLetter]?.words?.[0]?.word || otherLetter.toLowerCase()).toLowerCase();
+                    return { text: `/${getLetterSound(otherLetter)}/ كما في ${otherWord}`, correct: false };
+                })
+            ].sort(() => 0.5 - Math.random());
+            const soundOptions = soundOptionsRaw.map(item => item.text);
+            const soundCorrectIndex = soundOptionsRaw.findIndex(item => item.correct);
+
+            return [
+                {
+                    question: `ما هو الصوت الأساسي للحرف ${letter}؟`,
+                    options: soundOptions,
+                    correct: soundCorrectIndex
+                },
+                {
+                    question: `أي من هذه الكلمات تبدأ بالحرف ${letter}؟`,
+                    options: q2Options,
+                    correct: q2CorrectIndex
+                },
+                {
+                    question: `ما هو شكل الحرف ${letter} الصغير؟`,
+                    options: [letter, letter.toLowerCase(), "α", letter.toLowerCase() + letter.toLowerCase()],
+                    correct: 1
+                },
+                {
+                    question: `أي من هذه الصور تبدأ بالحرف ${letter}؟`,
+                    options: q4Options,
+                    correct: q4CorrectIndex
+                },
+                {
+                    question: `ما نوع الحرف ${letter}؟`,
+                    options: [
+                        "حرف متحرك (Vowel)",
+                        "حرف ساكن (Consonant)",
+                        "رقم",
+                        "رمز"
+                    ],
+                    correct: ["A", "E", "I", "O", "U"].includes(letter) ? 0 : 1
+                },
+                {
+                    question: `ما معنى كلمة "${targetWordForTrans}"؟`,
+                    options: q6Options,
+                    correct: q6CorrectIndex
+                }
+            ].map((question, index) => ({
+                ...question,
+                letter,
+                id: `${letter}-knowledge-${index + 1}`
+            }));
+        }
+
+        // التطبيق الرئيسي المحسن
+        class PhonicsGameLab {
+            constructor() {
+                // Performance optimization variables
+                this.maxFPS = 60;
+                this.lastFrameTime = 0;
+                this.frameInterval = 1000 / this.maxFPS;
+                this.gameRunning = false;
+                this.activeAnimations = new Set();
+                
+                this.REQUIRED_SCORE = 13;
+                this.HANDWRITING_COUNT = 2;
+                this.DRAG_WRITING_COUNT = 5;
+                this.MAX_WRITING_SCORE = (this.HANDWRITING_COUNT * 2) + (this.DRAG_WRITING_COUNT * 2);
+                this.PROGRESS_KEY_PREFIX = 'phonicsProgress';
+                this.ANONYMOUS_ID_KEY = 'phonicsAnonymousId';
+                this.userIdentifier = this.resolveCurrentUserIdentifier();
+                this.progressStorageKey = this.getProgressKey();
+                this.progress = this.loadProgressState();
+
+                // Games are optional practice rewards after the core lesson is complete.
+                this.requiredGames = [];
+                this.mandatoryGames = [];
+
+                this.syncProgressDerivedState();
+
+                this.currentLetterIndex = LETTERS.indexOf(this.progress.currentLetter) >= 0 ? LETTERS.indexOf(this.progress.currentLetter) : 0;
+                if (!this.isPremiumUser() && this.currentLetterIndex > 1) {
+                    this.currentLetterIndex = 0;
+                    this.progress.currentLetter = 'A';
+                }
+                this.currentQuizIndex = 0;
+                this.quizScore = 0;
+                this.writingScore = 0;
+                this.wordsScore = 0;
+                
+                // Game state management
+                this.isGameEnding = false;
+                this.isCelebrating = false;
+                this.isMiniCelebrating = false;
+                this.isConfettiActive = false;
+                this.gameTimeouts = [];
+                
+                // دمج letterProgress في بنية progress الرئيسية
+                // this.letterProgress = JSON.parse(localStorage.getItem('letterProgress')) || {}; // OLD: This was the cause of the bug
+
+                // Profile Data
+                const serverProfile = SERVER_STUDENT_PROFILE || {};
+                this.studentName = serverProfile.student_name || localStorage.getItem('studentName') || '';
+                this.studentCity = serverProfile.city || localStorage.getItem('studentCity') || '';
+                this.parentPhone = serverProfile.parent_phone || localStorage.getItem('parentPhone') || '';
+                this.studentEmail = window.PHONICS_USER_EMAIL || localStorage.getItem('studentEmail') || '';
+
+                this.currentGame = null;
+                this.isNightMode = localStorage.getItem('nightMode') === 'true';
+                this.gameInterval = null;
+                this.gameTimeLeft = 60;
+                this.soundEnabled = localStorage.getItem('soundEnabled') !== 'false';
+                this.speechRecognition = null;
+                this.isListening = false;
+                this.micPermissionGranted = false;
+                this.audioContext = null;
+                this.analyser = null;
+                this.microphone = null;
+                this.audioStream = null;
+                this.soundManager = new BritishSoundManager();
+                this.soundManager.isSpeakingEnabled = this.soundEnabled;
+                this.gameStats = {
+                    successCount: 0,
+                    totalAttempts: 0,
+                    accuracy: 0,
+                    difficulty: 1,
+                    gameWins: 0
+                };
+                this.isPaused = false;
+                this.touchControls = {
+                    left: false,
+                    right: false,
+                    up: false,
+                    down: false,
+                    action: false
+                };
+                this.quizCompletedFlag = false;
+                this.isAnswerSelected = false;
+                this.currentQuizAnswer = null;
+                this.quizTimeout = null;
+                this.gameObjects = [];
+                this.gameAnimationFrame = null;
+                this.currentKeyHandlers = null;
+                this.currentClickHandler = null;
+                this.currentMouseHandlers = null;
+                
+                this.init();
+            }
+            
+            init() {
+                this.cacheDOM();
+                this.applyLevelOnePlanRules();
+                if (this.initLetterCompletionScreen) {
+                    this.initLetterCompletionScreen();
+                }
+                this.bindEvents();
+                this.renderLettersNav();
+                this.loadLetter(this.currentLetterIndex);
+                this.updateProgress();
+                this.setupScrollTop();
+                this.setupTheme();
+                this.renderAchievements();
+                this.setupLetterJumpMenu();
+                
+                if (this.studentName) {
+                    const nameInput = document.getElementById('studentName');
+                    if (nameInput) nameInput.value = this.studentName;
+                }
+                
+                if (this.completedLetters.length === LETTERS.length) {
+                    this.showCompletionAnimation();
+                }
+                
+                this.setupSpeechRecognition();
+                this.setupAudioVisualizer();
+                this.checkMicrophonePermission();
+                this.setupTouchControls();
+                
+                this.soundManager.initialize();
+                this.disableCopyPaste();
+
+                // Mobile Audio Unlock & Resize Handling
+                const unlockAudio = () => {
+                    if (this.soundManager.audioContext && this.soundManager.audioContext.state === 'suspended') {
+                        this.soundManager.audioContext.resume();
+                    }
+                    if (this.audioContext && this.audioContext.state === 'suspended') {
+                        this.audioContext.resume();
+                    }
+                    document.removeEventListener('touchstart', unlockAudio);
+                    document.removeEventListener('click', unlockAudio);
+                };
+                document.addEventListener('touchstart', unlockAudio, { passive: true });
+                document.addEventListener('click', unlockAudio);
+
+                // Initial resize
+                if (this.handleResize) this.handleResize();
+            }
+
+            applyLevelOnePlanRules() {
+                document.body.dataset.levelOnePlan = LEVEL_ONE_PLAN;
+                if (this.externalGamesLink) this.externalGamesLink.hidden = true;
+                if (this.viewCertificateBtn && LEVEL_ONE_PLAN !== "basic") {
+                    this.viewCertificateBtn.hidden = true;
+                    this.viewCertificateBtn.setAttribute('aria-hidden', 'true');
+                    this.viewCertificateBtn.tabIndex = -1;
+                }
+
+                document.querySelectorAll('a[href*="external-games"], a[href*="worksheet"], a[href*="worksheets-book"], a[href*="leaderboard"]').forEach(link => {
+                    link.hidden = true;
+                    link.setAttribute('aria-hidden', 'true');
+                    link.tabIndex = -1;
+                });
+
+                document.querySelectorAll('[data-game]').forEach(card => {
+                    const game = String(card.dataset.game || '').toLowerCase();
+                    if (!LEVEL_ONE_ALLOWED_GAMES.includes(game)) {
+                        card.hidden = true;
+                        card.setAttribute('aria-hidden', 'true');
+                    }
+                });
+            }
+
+            cacheDOM() {
+                this.lettersNav = document.getElementById('lettersNav');
+                this.currentLetterEl = document.getElementById('currentLetter');
+                this.letterUpperEl = document.getElementById('letterUpper');
+                this.letterLowerEl = document.getElementById('letterLower');
+                this.letterForWordsEl = document.getElementById('letterForWords');
+                this.externalGamesLink = document.getElementById('externalGamesLink');
+                this.letterWorksheetBtn = document.getElementById('letterWorksheetBtn');
+                this.wordsGrid = document.getElementById('wordsGrid');
+                this.capitalWriting = document.getElementById('capitalWriting');
+                this.smallWriting = document.getElementById('smallWriting');
+                this.capitalDragWriting = document.getElementById('capitalDragWriting');
+                this.smallDragWriting = document.getElementById('smallDragWriting');
+                this.wordWritingList = document.getElementById('wordWritingList');
+                this.quizQuestion = document.getElementById('quizQuestion');
+                this.quizOptions = document.getElementById('quizOptions');
+                this.questionNumberEl = document.getElementById('questionNumber');
+                this.quizScoreEl = document.getElementById('quizScore');
+                this.writingScoreEl = document.getElementById('writingScore');
+                this.wordsScoreEl = document.getElementById('wordsScore');
+                this.testScoreEl = document.getElementById('testScore');
+                this.totalScoreEl = document.getElementById('totalScore');
+                this.progressValueEl = document.getElementById('progressValue');
+                this.progressBar = document.getElementById('progressBar');
+                this.achievementsContainer = document.getElementById('achievementsContainer');
+                this.quizNextBtn = document.getElementById('quizNextBtn');
+                this.quizNavigation = document.getElementById('quizNavigation');
+                
+                this.playLetterBtn = document.getElementById('playLetter');
+                this.letterInfoBtn = document.getElementById('letterInfo');
+                this.resetLetterBtn = document.getElementById('resetLetter');
+                this.prevLetterBtn = document.getElementById('prevLetter');
+                this.finishLetterBtn = document.getElementById('finishLetter');
+                // this.studentNameInput = document.getElementById('studentName'); // Removed old input
+                this.studentProfileBtn = document.getElementById('profileBtn');
+                this.studentNameDisplay = document.getElementById('studentNameDisplay');
+                this.themeToggle = document.getElementById('themeToggle');
+                
+                // New Header Elements
+                this.userMenuBtn = document.getElementById('userMenuBtn');
+                this.userDropdown = document.getElementById('userDropdown');
+                this.mobileMenuBtn = document.getElementById('mobileMenuBtn');
+                this.closeMenuBtn = document.getElementById('closeMenuBtn');
+                this.viewInstructionsBtn = document.getElementById('viewInstructions');
+                
+                this.resetProgressBtn = document.getElementById('resetProgressBtn');
+                this.viewAllLettersBtn = document.getElementById('viewAllLetters');
+                this.viewCertificateBtn = document.getElementById('viewCertificate');
+                this.toggleSoundBtn = document.getElementById('toggleSound');
+                this.testMicrophoneBtn = document.getElementById('testMicrophone');
+                this.jumpToLetterBtn = document.getElementById('jumpToLetter');
+                
+                this.motivationModal = document.getElementById('motivationModal');
+                this.parentReportModal = document.getElementById('parentReportModal');
+                this.closeParentReportBtn = document.getElementById('closeParentReport');
+                this.continueParentReportBtn = document.getElementById('continueParentReport');
+                this.parentReportLetter = document.getElementById('parentReportLetter');
+                this.parentReportWords = document.getElementById('parentReportWords');
+                this.parentReportScore = document.getElementById('parentReportScore');
+                this.parentReportChildMessage = document.getElementById('parentReportChildMessage');
+                this.parentReportParentMessage = document.getElementById('parentReportParentMessage');
+                this.parentReportPracticedWords = document.getElementById('parentReportPracticedWords');
+                this.parentReportNeedsPractice = document.getElementById('parentReportNeedsPractice');
+                this.parentReportRecommendation = document.getElementById('parentReportRecommendation');
+                this.parentReportBackBtn = document.getElementById('parentReportBack');
+                this.parentReportWhatsappBtn = document.getElementById('parentReportWhatsapp');
+                this.parentReportDownloadBtn = document.getElementById('parentReportDownload');
+                this.parentReportPrintBtn = document.getElementById('parentReportPrint');
+                this.letterPaywallModal = document.getElementById('letterPaywallModal');
+                this.closeLetterPaywallBtn = document.getElementById('closeLetterPaywall');
+                this.tryFreeLettersBtn = document.getElementById('tryFreeLetters');
+                this.lockedLetterName = document.getElementById('lockedLetterName');
+                this.gameModal = document.getElementById('gameModal');
+                this.winModal = document.getElementById('winModal');
+                this.certificateModal = document.getElementById('certificateModal');
+                this.profileModal = document.getElementById('profileModal');
+                this.instructionsModal = document.getElementById('instructionsModal');
+                this.closeInstructionsModalBtn = document.getElementById('closeInstructionsModal');
+                
+                this.closeMotivationBtn = document.getElementById('closeMotivation');
+                this.closeGameBtn = document.getElementById('closeGame');
+                this.closeWinBtn = document.getElementById('closeWin');
+                this.nextLetterBtn = document.getElementById('nextLetter');
+                this.playGamesBtn = document.getElementById('playGames');
+                this.motivationTitle = document.getElementById('motivationTitle');
+                this.motivationSubtitle = document.getElementById('motivationSubtitle');
+                this.motivationQuote = document.getElementById('motivationQuote');
+                this.gamesGrid = document.getElementById('gamesGrid');
+                
+                this.gameCanvas = document.getElementById('gameCanvas');
+                this.gameScoreEl = document.getElementById('gameScore');
+                this.gameTimerEl = document.getElementById('gameTimer');
+                this.gameTitle = document.getElementById('gameTitle');
+                this.gameInstructions = document.getElementById('gameInstructions');
+                this.touchControlsEl = document.getElementById('touchControls');
+                this.gameControlsEl = document.getElementById('gameControls');
+                this.restartGameBtn = document.getElementById('restartGame');
+                this.pauseGameBtn = document.getElementById('pauseGame');
+                this.backToSelectionBtn = document.getElementById('backToSelection');
+                this.successCountEl = document.getElementById('successCount');
+                this.difficultyLevelEl = document.getElementById('difficultyLevel');
+                this.accuracyEl = document.getElementById('accuracy');
+                this.gameStatsEl = document.getElementById('gameStats');
+                
+                this.winTitle = document.getElementById('winTitle');
+                this.winSubtitle = document.getElementById('winSubtitle');
+                this.winQuote = document.getElementById('winQuote');
+                this.winAnimation = document.getElementById('winAnimation');
+                this.finalScoreEl = document.getElementById('finalScore');
+                this.finalTimeEl = document.getElementById('finalTime');
+                this.finalAccuracyEl = document.getElementById('finalAccuracy');
+                this.playAgainBtn = document.getElementById('playAgain');
+                this.backToGamesBtn = document.getElementById('backToGames');
+                this.winNextLetterBtn = document.getElementById('winNextLetterBtn');
+                
+                this.certificateName = document.getElementById('certificateName');
+                this.certificateDate = document.getElementById('certificateDate');
+                this.printCertificateBtn = document.getElementById('printCertificate');
+                this.emailCertificateBtn = document.getElementById('emailCertificate');
+                this.whatsappCertificateBtn = document.getElementById('whatsappCertificate');
+                this.closeCertificateBtn = document.getElementById('closeCertificate');
+                
+                this.completionAnimation = document.getElementById('completionAnimation');
+                this.scrollTopBtn = document.getElementById('scrollTop');
+                this.micStatus = document.getElementById('micStatus');
+                this.micStatusText = document.getElementById('micStatusText');
+                this.letterJumpMenu = document.getElementById('letterJumpMenu');
+                this.toast = document.getElementById('toast');
+            }
+            
+            bindEvents() {
+                // Global Touch Feedback for all buttons (Static & Dynamic)
+                document.body.addEventListener('touchstart', (e) => {
+                    const btn = e.target.closest('button');
+                    if (btn && !btn.disabled) btn.classList.add('btn-touch-active');
+                }, {passive: true});
+
+                document.body.addEventListener('touchend', (e) => {
+                    const btn = e.target.closest('button');
+                    if (btn) btn.classList.remove('btn-touch-active');
+                }, {passive: true});
+
+                document.body.addEventListener('touchcancel', (e) => {
+                    const btn = e.target.closest('button');
+                    if (btn) btn.classList.remove('btn-touch-active');
+                }, {passive: true});
+
+                this.playLetterBtn.addEventListener('click', () => this.speakLetter());
+                this.letterInfoBtn.addEventListener('click', () => this.showLetterInfo());
+                this.resetLetterBtn.addEventListener('click', () => this.resetLetter());
+                
+                // Improved Previous Letter Button (Touch Support)
+                const handlePrevLetter = (e) => {
+                    if (e.cancelable) e.preventDefault();
+                    this.previousLetter();
+                };
+                this.prevLetterBtn.addEventListener('click', handlePrevLetter);
+                this.prevLetterBtn.addEventListener('touchstart', handlePrevLetter, { passive: false });
+                
+                // Robust Finish Letter Button Handler
+                const handleFinishLetter = (e) => {
+                    if (e) {
+                        e.preventDefault();
+                        e.stopPropagation();
+                    }
+                    this.finishLetter();
+                };
+
+                this.finishLetterBtn.addEventListener('click', handleFinishLetter);
+                this.finishLetterBtn.addEventListener('touchstart', handleFinishLetter, { passive: false });
+                this.finishLetterBtn.addEventListener('touchend', (e) => e.preventDefault(), { passive: false }); // Prevent ghost clicks
+                
+                this.themeToggle.addEventListener('click', () => this.toggleTheme());
+
+                if (this.closeParentReportBtn) {
+                    this.closeParentReportBtn.addEventListener('click', () => this.hideParentReport());
+                }
+
+                if (this.continueParentReportBtn) {
+                    this.continueParentReportBtn.addEventListener('click', () => this.hideParentReport());
+                }
+                if (this.parentReportBackBtn) {
+                    this.parentReportBackBtn.addEventListener('click', () => this.backFromParentReport());
+                }
+                if (this.parentReportWhatsappBtn) {
+                    this.parentReportWhatsappBtn.addEventListener('click', () => this.shareCurrentLetterReportWhatsapp());
+                }
+                if (this.parentReportDownloadBtn) {
+                    this.parentReportDownloadBtn.addEventListener('click', () => this.downloadCurrentLetterReport());
+                }
+                if (this.parentReportPrintBtn) {
+                    this.parentReportPrintBtn.addEventListener('click', () => this.printCurrentLetterReport());
+                }
+
+                if (this.closeLetterPaywallBtn) {
+                    this.closeLetterPaywallBtn.addEventListener('click', () => this.hideLetterPaywall());
+                }
+
+                if (this.tryFreeLettersBtn) {
+                    this.tryFreeLettersBtn.addEventListener('click', () => {
+                        this.hideLetterPaywall();
+                        this.goToLetter('A');
+                    });
+                }
+                
+                // Mobile Menu Events
+                if (this.mobileMenuBtn) {
+                    this.mobileMenuBtn.addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        this.userDropdown.classList.add('show');
+                        const overlay = document.getElementById('menuOverlay');
+                        if (overlay) overlay.classList.add('active');
+                    });
+                }
+
+                if (this.closeMenuBtn) {
+                    this.closeMenuBtn.addEventListener('click', () => {
+                        this.userDropdown.classList.remove('show');
+                        const overlay = document.getElementById('menuOverlay');
+                        if (overlay) overlay.classList.remove('active');
+                    });
+                }
+
+                // Close menu when clicking overlay
+                const menuOverlay = document.getElementById('menuOverlay');
+                if (menuOverlay) {
+                    menuOverlay.addEventListener('click', () => {
+                        this.userDropdown.classList.remove('show');
+                        menuOverlay.classList.remove('active');
+                    });
+                }
+
+                // Instructions Modal
+                if (this.viewInstructionsBtn) {
+                    this.viewInstructionsBtn.addEventListener('click', () => {
+                        if (this.instructionsModal) this.instructionsModal.style.display = 'flex';
+                        this.userDropdown.classList.remove('show');
+                        if (menuOverlay) menuOverlay.classList.remove('active');
+                    });
+                }
+
+                if (this.closeInstructionsModalBtn) {
+                    this.closeInstructionsModalBtn.addEventListener('click', () => {
+                        this.instructionsModal.style.display = 'none';
+                    });
+                }
+
+                // User Menu Dropdown
+                if (this.userMenuBtn) {
+                    this.userMenuBtn.addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        this.userDropdown.classList.toggle('show');
+                    });
+                }
+
+                // Close dropdown when clicking outside
+                document.addEventListener('click', (e) => {
+                    if (this.userDropdown && this.userDropdown.classList.contains('show') && !this.userMenuBtn.contains(e.target)) {
+                        this.userDropdown.classList.remove('show');
+                    }
+                });
+                
+                if (this.resetProgressBtn) {
+                    this.resetProgressBtn.addEventListener('click', () => {
+                        if (confirm('هل أنت متأكد من إعادة التقدم؟ سيتم حذف جميع إنجازاتك.')) {
+                            localStorage.clear();
+                            location.reload();
+                        }
+                        this.userDropdown.classList.remove('show');
+                    });
+                }
+                
+                if (this.viewAllLettersBtn) {
+                    this.viewAllLettersBtn.addEventListener('click', () => {
+                        document.getElementById('lettersNav').scrollIntoView({ behavior: 'smooth' });
+                        this.userDropdown.classList.remove('show');
+                    });
+                }
+                
+                if (this.jumpToLetterBtn) {
+                    this.jumpToLetterBtn.addEventListener('click', () => {
+                        this.toggleLetterJumpMenu();
+                        this.userDropdown.classList.remove('show');
+                    });
+                }
+                
+                if (this.viewCertificateBtn) {
+                    this.viewCertificateBtn.addEventListener('click', () => {
+                        if (this.completedLetters.length === LETTERS.length) {
+                            this.showCertificate();
+                        } else {
+                            this.showToast('لم تكتمل جميع الحروف بعد!');
+                        }
+                        this.userDropdown.classList.remove('show');
+                    });
+                }
+                
+                if (this.toggleSoundBtn) {
+                    this.toggleSoundBtn.addEventListener('click', () => {
+                        this.soundEnabled = !this.soundEnabled;
+                        this.soundManager.isSpeakingEnabled = this.soundEnabled;
+                        localStorage.setItem('soundEnabled', this.soundEnabled);
+                        this.toggleSoundBtn.innerHTML = this.soundEnabled ? 
+                            '<i class="fas fa-volume-up"></i> كتم الصوت' : '<i class="fas fa-volume-mute"></i> تشغيل الصوت';
+                        this.userDropdown.classList.remove('show');
+                    });
+                }
+                
+                if (this.testMicrophoneBtn) {
+                    this.testMicrophoneBtn.addEventListener('click', () => {
+                        this.testMicrophone();
+                        this.userDropdown.classList.remove('show');
+                    });
+                }
+                
+                document.addEventListener('click', (e) => {
+                    if (!e.target.closest('#letterJumpMenu') && !e.target.closest('#jumpToLetter')) {
+                        if (this.letterJumpMenu) this.letterJumpMenu.classList.remove('show');
+                    }
+                });
+                
+                // Profile Events
+                if (this.studentProfileBtn) {
+                    this.studentProfileBtn.addEventListener('click', () => {
+                        this.openProfileModal();
+                    });
+                }
+
+                document.getElementById('closeProfileModal').addEventListener('click', () => {
+                    this.profileModal.style.display = 'none';
+                });
+
+                document.getElementById('profileForm').addEventListener('submit', (e) => {
+                    e.preventDefault();
+                    this.saveProfile();
+                });
+
+                document.getElementById('googleLoginBtn').addEventListener('click', () => {
+                    if (!IS_AUTHENTICATED) {
+                        window.location.href = LOGIN_URL;
+                        return;
+                    }
+
+                    this.showToast("أنت مسجل الدخول بالفعل.", 2000, 'success');
+                });
+
+                this.closeMotivationBtn.addEventListener('click', () => this.motivationModal.style.display = 'none');
+                
+                // Improved Close Game Button (Returns to Selection)
+                const handleCloseGame = (e) => {
+                    if (e.cancelable) e.preventDefault();
+                    this.backToGames();
+                };
+                this.closeGameBtn.addEventListener('click', handleCloseGame);
+                this.closeGameBtn.addEventListener('touchstart', handleCloseGame, { passive: false });
+
+                this.closeWinBtn.addEventListener('click', () => this.winModal.style.display = 'none');
+                
+                // Improved Next Letter Button
+                const handleNextLetter = (e) => {
+                    // Prevent default only if it's a touch event to avoid double firing, 
+                    // but ensure the logic runs.
+                    if (e.type === 'touchstart') {
+                        e.preventDefault(); // Prevent mouse emulation
+                        this.nextLetter();
+                    } else {
+                        this.nextLetter();
+                    }
+                };
+                // Remove old listeners first to be safe (though not strictly necessary if replacing)
+                this.nextLetterBtn.removeEventListener('click', handleNextLetter);
+                this.nextLetterBtn.removeEventListener('touchstart', handleNextLetter);
+                
+                this.nextLetterBtn.addEventListener('click', handleNextLetter);
+                this.nextLetterBtn.addEventListener('touchstart', handleNextLetter, { passive: false });
+
+                this.playGamesBtn.addEventListener('click', () => this.showGames());
+                this.closeCertificateBtn.addEventListener('click', () => this.certificateModal.style.display = 'none');
+                this.printCertificateBtn.addEventListener('click', () => this.printCertificate());
+                this.emailCertificateBtn.addEventListener('click', () => this.sendCertificateEmail());
+                this.whatsappCertificateBtn.addEventListener('click', () => this.sendCertificateWhatsApp());
+                
+                // Improved Game Control Buttons (Touch Support)
+                const handleRestart = (e) => { 
+                    if (e.type === 'touchstart') e.preventDefault();
+                    this.restartGame(); 
+                };
+                const handlePause = (e) => { 
+                    if (e.type === 'touchstart') e.preventDefault();
+                    this.togglePause(); 
+                };
+                const handleBackToGames = (e) => { 
+                    if (e.type === 'touchstart') e.preventDefault();
+                    this.backToGames(); 
+                };
+
+                this.restartGameBtn.addEventListener('click', handleRestart);
+                this.restartGameBtn.addEventListener('touchstart', handleRestart, { passive: false });
+                
+                this.pauseGameBtn.addEventListener('click', handlePause);
+                this.pauseGameBtn.addEventListener('touchstart', handlePause, { passive: false });
+                
+                this.backToSelectionBtn.addEventListener('click', handleBackToGames);
+                this.backToSelectionBtn.addEventListener('touchstart', handleBackToGames, { passive: false });
+                
+                this.playAgainBtn.addEventListener('click', () => this.playAgain());
+                
+                this.backToGamesBtn.addEventListener('click', handleBackToGames);
+                this.backToGamesBtn.addEventListener('touchstart', handleBackToGames, { passive: false });
+                
+                this.winNextLetterBtn.addEventListener('click', () => {
+                    this.winModal.style.display = 'none';
+                    this.nextLetter();
+                });
+                this.winNextLetterBtn.addEventListener('touchstart', (e) => {
+                    if (e.cancelable) e.preventDefault();
+                    this.winModal.style.display = 'none';
+                    this.nextLetter();
+                }, { passive: false });
+                
+                // معالج ذكي للمس يميز بين التمرير والنقر
+                let touchStartY = 0;
+                let touchStartX = 0;
+                let touchStartTime = 0;
+                let isTouchScrolling = false;
+
+                this.gamesGrid.addEventListener('touchstart', (e) => {
+                    const gameCard = e.target.closest('.game-card');
+                    if (gameCard && !gameCard.classList.contains('locked')) {
+                        const touch = e.touches[0];
+                        touchStartY = touch.clientY;
+                        touchStartX = touch.clientX;
+                        touchStartTime = Date.now();
+                        isTouchScrolling = false;
+                    }
+                }, { passive: true });
+
+                this.gamesGrid.addEventListener('touchmove', (e) => {
+                    const gameCard = e.target.closest('.game-card');
+                    if (gameCard && !gameCard.classList.contains('locked')) {
+                        const touch = e.touches[0];
+                        const deltaY = Math.abs(touch.clientY - touchStartY);
+                        const deltaX = Math.abs(touch.clientX - touchStartX);
+                        
+                        // إذا تحرك المستخدم أكثر من 10 بكسل، فهو يمرر وليس ينقر
+                        if (deltaY > 10 || deltaX > 10) {
+                            isTouchScrolling = true;
+                        }
+                    }
+                }, { passive: true });
+
+                this.gamesGrid.addEventListener('touchend', (e) => {
+                    const gameCard = e.target.closest('.game-card');
+                    if (gameCard && !gameCard.classList.contains('locked')) {
+                        const touch = e.changedTouches[0];
+                        const deltaY = Math.abs(touch.clientY - touchStartY);
+                        const deltaX = Math.abs(touch.clientX - touchStartX);
+                        const deltaTime = Date.now() - touchStartTime;
+                        
+                        // فتح اللعبة فقط إذا:
+                        // 1. الحركة أقل من 10 بكسل (ليس تمرير)
+                        // 2. الوقت أقل من 300ms (نقرة سريعة)
+                        // 3. لم يتم اكتشاف تمرير أثناء الحركة
+                        if (!isTouchScrolling && deltaY < 10 && deltaX < 10 && deltaTime < 300) {
+                            e.preventDefault();
+                            const gameType = gameCard.dataset.game;
+                            this.startGame(gameType);
+                        }
+                    }
+                }, { passive: false });
+                
+                // معالج احتياطي للفأرة على الكمبيوتر
+                this.gamesGrid.addEventListener('click', (e) => {
+                    // تحقق من أنه ليس جهاز لمس
+                    if (e.pointerType === 'mouse' || !('ontouchstart' in window)) {
+                        const gameCard = e.target.closest('.game-card');
+                        if (gameCard && !gameCard.classList.contains('locked')) {
+                            const gameType = gameCard.dataset.game;
+                            this.startGame(gameType);
+                        }
+                    }
+                });
+                
+                // معالج أزرار التمرير للألعاب
+                const scrollUpBtn = document.getElementById('scrollUpBtn');
+                const scrollDownBtn = document.getElementById('scrollDownBtn');
+                
+                if (scrollUpBtn) {
+                    scrollUpBtn.addEventListener('click', (e) => {
+                        e.preventDefault();
+                        e.stopPropagation();
+                        this.gamesGrid.scrollBy({ top: -150, behavior: 'smooth' });
+                    });
+                    scrollUpBtn.addEventListener('touchend', (e) => {
+                        e.preventDefault();
+                        e.stopPropagation();
+                        this.gamesGrid.scrollBy({ top: -150, behavior: 'smooth' });
+                    }, { passive: false });
+                }
+                
+                if (scrollDownBtn) {
+                    scrollDownBtn.addEventListener('click', (e) => {
+                        e.preventDefault();
+                        e.stopPropagation();
+                        this.gamesGrid.scrollBy({ top: 150, behavior: 'smooth' });
+                    });
+                    scrollDownBtn.addEventListener('touchend', (e) => {
+                        e.preventDefault();
+                        e.stopPropagation();
+                        this.gamesGrid.scrollBy({ top: 150, behavior: 'smooth' });
+                    }, { passive: false });
+                }
+                
+                this.quizNextBtn.addEventListener('click', () => this.nextQuizQuestion());
+                
+                window.addEventListener('click', (e) => {
+                    if (e.target === this.motivationModal) {
+                        this.motivationModal.style.display = 'none';
+                    }
+                    if (e.target === this.gameModal) {
+                        this.closeGame();
+                    }
+                    if (e.target === this.winModal) {
+                        this.winModal.style.display = 'none';
+                    }
+                    if (e.target === this.certificateModal) {
+                        this.certificateModal.style.display = 'none';
+                    }
+                });
+                
+                document.addEventListener('keydown', (e) => {
+                    if (e.key === 'Escape') {
+                        this.closeGame();
+                    }
+                });
+            }
+            
+            setupTheme() {
+                if (this.isNightMode) {
+                    document.body.classList.add('night-mode');
+                    this.themeToggle.innerHTML = '<i class="fas fa-sun"></i><span>الوضع النهاري</span>';
+                } else {
+                    document.body.classList.remove('night-mode');
+                    this.themeToggle.innerHTML = '<i class="fas fa-moon"></i><span>الوضع الليلي</span>';
+                }
+            }
+            
+            toggleTheme() {
+                this.isNightMode = !this.isNightMode;
+                localStorage.setItem('nightMode', this.isNightMode);
+                this.setupTheme();
+            }
+
+            openProfileModal() {
+                document.getElementById('profileName').value = this.studentName;
+                document.getElementById('profileCity').value = this.studentCity;
+                document.getElementById('profileParentPhone').value = this.parentPhone;
+                this.profileModal.style.display = 'flex';
+            }
+
+            getCookie(name) {
+                const value = `; ${document.cookie}`;
+                const parts = value.split(`; ${name}=`);
+                if (parts.length === 2) return parts.pop().split(';').shift();
+                return '';
+            }
+
+            storeProfileLocally(profileData) {
+                localStorage.setItem('studentName', profileData.student_name);
+                localStorage.setItem('studentCity', profileData.city);
+                localStorage.setItem('parentPhone', profileData.parent_phone);
+            }
+
+            async saveProfileToServer(profileData) {
+                const response = await fetch('/accounts/profile/', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'X-CSRFToken': this.getCookie('csrftoken')
+                    },
+                    body: JSON.stringify({
+                        student_name: profileData.student_name,
+                        city: profileData.city,
+                        parent_phone: profileData.parent_phone
+                    })
+                });
+
+                const data = await response.json();
+                if (!response.ok) {
+                    throw new Error(data.error || 'profile_save_failed');
+                }
+
+                return data.profile;
+            }
+
+            async saveProfile() {
+                const profileData = {
+                    student_name: document.getElementById('profileName').value.trim(),
+                    city: document.getElementById('profileCity').value.trim(),
+                    parent_phone: document.getElementById('profileParentPhone').value.trim()
+                };
+
+                try {
+                    if (IS_AUTHENTICATED) {
+                        const savedProfile = await this.saveProfileToServer(profileData);
+                        profileData.student_name = savedProfile.student_name || profileData.student_name;
+                        profileData.city = savedProfile.city || profileData.city;
+                        profileData.parent_phone = savedProfile.parent_phone || profileData.parent_phone;
+                    }
+
+                    this.studentName = profileData.student_name;
+                    this.studentCity = profileData.city;
+                    this.parentPhone = profileData.parent_phone;
+
+                    this.storeProfileLocally(profileData);
+                    this.refreshUserIdentifier();
+                    this.updateProfileDisplay();
+                    this.profileModal.style.display = 'none';
+                    this.showToast("تم حفظ البيانات بنجاح!", 3000, 'success');
+                } catch (error) {
+                    console.error(error);
+                    this.showToast("تعذر حفظ البروفايل. حاول مرة أخرى.", 3000, 'error');
+                }
+            }
+
+            updateProfileDisplay() {
+                this.studentNameDisplay.textContent = this.studentName || 'زائر';
+                this.certificateName.textContent = this.studentName || 'الطالب المتميز';
+            }
+            
+            setupSpeechRecognition() {
+                if ('webkitSpeechRecognition' in window || 'SpeechRecognition' in window) {
+                    const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+                    this.speechRecognition = new SpeechRecognition();
+                    this.speechRecognition.continuous = false;
+                    this.speechRecognition.interimResults = false;
+                    this.speechRecognition.lang = 'en-GB'; // استخدام الإنجليزية البريطانية للتعرف على الصوت
+                    this.speechRecognition.maxAlternatives = 20; // زيادة البدائل لتحسين الدقة بشكل أكبر
+                    
+                    this.speechRecognition.onstart = () => {
+                        this.isListening = true;
+                        this.showMicStatus('🎤 جاري الاستماع...', false);
+                    };
+                    
+                    this.speechRecognition.onresult = (event) => {
+                        const transcript = event.results[0][0].transcript.trim().toLowerCase();
+                        this.showMicStatus('✅ تم الاستماع بنجاح!', false);
+                        setTimeout(() => this.hideMicStatus(), 2000);
+                        return transcript;
+                    };
+                    
+                    this.speechRecognition.onerror = (event) => {
+                        this.isListening = false;
+                        let errorMessage = 'حدث خطأ في التعرف على الصوت';
+                        
+                        switch(event.error) {
+                            case 'not-allowed':
+                            case 'permission-denied':
+                                errorMessage = 'لم يتم منح الإذن باستخدام الميكروفون';
+                                this.micPermissionGranted = false;
+                                break;
+                            case 'no-speech':
+                                errorMessage = 'لم يتم سماع الصوت، حاول التحدث بصوت أعلى 🔊';
+                                break;
+                            case 'audio-capture':
+                                errorMessage = 'لا يوجد ميكروفون متاح';
+                                break;
+                            case 'network':
+                                errorMessage = 'خطأ في الشبكة';
+                                break;
+                        }
+                        
+                        this.showMicStatus(`❌ ${errorMessage}`, true);
+                    };
+                    
+                    this.speechRecognition.onend = () => {
+                        this.isListening = false;
+                    };
+                } else {
+                    this.showMicStatus('⚠️ المتصفح لا يدعم التعرف على الصوت', true);
+                }
+            }
+            
+            setupAudioVisualizer() {
+                try {
+                    this.audioContext = new (window.AudioContext || window.webkitAudioContext)();
+                    this.analyser = this.audioContext.createAnalyser();
+                    this.analyser.fftSize = 256;
+                } catch (error) {
+                    console.log('Audio context not supported:', error);
+                }
+            }
+            
+            async checkMicrophonePermission() {
+                try {
+                    const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+                    this.micPermissionGranted = true;
+                    stream.getTracks().forEach(track => track.stop());
+                    this.showMicStatus('✅ المايكروفون جاهز للاستخدام', false);
+                    setTimeout(() => this.hideMicStatus(), 3000);
+                } catch (error) {
+                    this.micPermissionGranted = false;
+                    this.showMicStatus('❌ يرجى منح إذن المايكروفون', true);
+                }
+            }
+            
+            showMicStatus(message, isError = false) {
+                this.micStatusText.textContent = message;
+                this.micStatus.className = 'mic-status' + (isError ? ' error' : '');
+                this.micStatus.classList.add('show');
+            }
+            
+            hideMicStatus() {
+                this.micStatus.classList.remove('show');
+            }
+            
+            async testMicrophone() {
+                if (!this.micPermissionGranted) {
+                    if (!await this.requestMicrophonePermission()) {
+                        return;
+                    }
+                }
+                
+                try {
+                    this.audioStream = await navigator.mediaDevices.getUserMedia({ 
+                        audio: {
+                            echoCancellation: true,
+                            noiseSuppression: true,
+                            autoGainControl: true
+                        }
+                    });
+                    
+                    this.showMicStatus('🎤 جاري اختبار المايكروفون...', false);
+                    
+                    if (this.audioContext) {
+                        const source = this.audioContext.createMediaStreamSource(this.audioStream);
+                        source.connect(this.analyser);
+                        
+                        const bufferLength = this.analyser.frequencyBinCount;
+                        const dataArray = new Uint8Array(bufferLength);
+                        
+                        const checkAudio = () => {
+                            this.analyser.getByteFrequencyData(dataArray);
+                            const average = dataArray.reduce((a, b) => a + b) / bufferLength;
+                            
+                            if (average > 10) {
+                                this.showMicStatus('✅ المايكروفون يعمل بشكل ممتاز!', false);
+                                setTimeout(() => {
+                                    this.stopMicrophoneTest();
+                                    this.showMicStatus('🎤 جاهز للاستخدام', false);
+                                    setTimeout(() => this.hideMicStatus(), 2000);
+                                }, 1000);
+                            } else {
+                                setTimeout(checkAudio, 100);
+                            }
+                        };
+                        
+                        setTimeout(() => {
+                            this.showMicStatus('🎤 تحدث الآن...', false);
+                            checkAudio();
+                        }, 500);
+                        
+                        setTimeout(() => {
+                            if (this.isListening) {
+                                this.showMicStatus('⚠️ لم يتم اكتشاف صوت', true);
+                                this.stopMicrophoneTest();
+                            }
+                        }, 5000);
+                    }
+                    
+                } catch (error) {
+                    this.showMicStatus('❌ فشل في الوصول إلى المايكروفون', true);
+                }
+            }
+            
+            stopMicrophoneTest() {
+                if (this.audioStream) {
+                    this.audioStream.getTracks().forEach(track => track.stop());
+                    this.audioStream = null;
+                }
+            }
+            
+            async requestMicrophonePermission() {
+                try {
+                    const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+                    this.micPermissionGranted = true;
+                    stream.getTracks().forEach(track => track.stop());
+                    this.showMicStatus('✅ تم منح إذن المايكروفون', false);
+                    setTimeout(() => this.hideMicStatus(), 3000);
+                    return true;
+                } catch (error) {
+                    this.showMicStatus('❌ لم يتم منح إذن المايكروفون', true);
+                    return false;
+                }
+            }
+            
+            setupTouchControls() {
+                const controlButtons = this.touchControlsEl.querySelectorAll('.control-btn');
+                
+                controlButtons.forEach(btn => {
+                    const action = btn.dataset.action;
+                    
+                    const activate = (e) => {
+                        if (e.cancelable) e.preventDefault();
+                        this.touchControls[action] = true;
+                        btn.classList.add('btn-touch-active');
+                        // Add a small vibration if supported
+                        if (navigator.vibrate) navigator.vibrate(10);
+                        this.soundManager.playSound('click');
+                    };
+
+                    const deactivate = (e) => {
+                        if (e.cancelable) e.preventDefault();
+                        this.touchControls[action] = false;
+                        btn.classList.remove('btn-touch-active');
+                    };
+                    
+                    btn.addEventListener('touchstart', activate, { passive: false });
+                    btn.addEventListener('touchend', deactivate, { passive: false });
+                    btn.addEventListener('touchcancel', deactivate, { passive: false });
+                    
+                    btn.addEventListener('mousedown', activate);
+                    btn.addEventListener('mouseup', deactivate);
+                    btn.addEventListener('mouseleave', deactivate);
+                });
+                
+                // Check for touch support but allow fallback
+                if (!('ontouchstart' in window || navigator.maxTouchPoints > 0)) {
+                    // Optional: Hide on non-touch devices if desired, but keeping for hybrid
+                    // this.touchControlsEl.style.display = 'none';
+                }
+            }
+            
+            isPremiumUser() {
+                return Boolean(window.__PHONICS_PREMIUM_OVERRIDE__ ?? IS_PREMIUM_USER);
+            }
+
+            isFreeLetter(letter) {
+                return ['A', 'B'].includes(String(letter || '').toUpperCase());
+            }
+
+            isLetterAvailableForPlan(letter) {
+                return this.isPremiumUser() || this.isFreeLetter(letter);
+            }
+
+            showLetterPaywall(letter) {
+                if (this.lockedLetterName) {
+                    this.lockedLetterName.textContent = letter;
+                }
+
+                const title = this.letterPaywallModal?.querySelector('.modal-title');
+                const subtitle = this.letterPaywallModal?.querySelector('.modal-subtitle');
+                const copy = this.letterPaywallModal?.querySelector('.letter-paywall-copy');
+                const list = this.letterPaywallModal?.querySelector('.premium-preview-list');
+                if (title) title.textContent = 'افتح الحروف من A إلى Z';
+                if (subtitle) subtitle.innerHTML = `حرف <strong>${letter}</strong> متاح في الباقة الأساسية. التجربة المجانية تشمل A و B فقط.`;
+                if (copy) copy.textContent = 'الباقة الأساسية تفتح مسار الحروف فقط بدون Wordwall أو أوراق عمل أو لوحة صدارة أو عصفور ذكي أو تقرير إنجاز متقدم.';
+                if (list) {
+                    list.innerHTML = `
+                        <div>✓ كل الحروف A-Z</div>
+                        <div>✓ شهادة عند إنهاء الحروف</div>
+                        <div>✓ لعبتان فقط بعد الإنهاء: الذاكرة وتوصيل الكلمات</div>
+                    `;
+                }
+
+                if (this.letterPaywallModal) {
+                    this.letterPaywallModal.style.display = 'flex';
+                }
+
+                this.soundManager?.playSound('click');
+            }
+
+            hideLetterPaywall() {
+                if (this.letterPaywallModal) {
+                    this.letterPaywallModal.style.display = 'none';
+                }
+            }
+
+            setupLetterJumpMenu() {
+                this.letterJumpMenu.innerHTML = '';
+                
+                LETTERS.forEach((letter, index) => {
+                    const item = document.createElement('div');
+                    item.className = 'letter-jump-item';
+                    item.textContent = `${letter} - الحرف ${index + 1}`;
+                    item.dataset.index = index;
+                    
+                    item.addEventListener('click', () => {
+                        this.goToLetter(letter);
+                        if (this.isLetterAvailableForPlan(letter)) {
+                            this.letterJumpMenu.classList.remove('show');
+                        }
+                    });
+                    
+                    this.letterJumpMenu.appendChild(item);
+                });
+            }
+            
+            toggleLetterJumpMenu() {
+                this.letterJumpMenu.classList.toggle('show');
+            }
+            
+            checkPreviousLetter(letter) {
+                const currentIndex = LETTERS.indexOf(letter);
+                if (currentIndex === 0) return true; // الحرف A دائماً متاح
+                const prevLetter = LETTERS[currentIndex - 1];
+                return this.isLetterCompleted(prevLetter);
+            }
+
+            checkLetterCompleted(letter) {
+                return this.isLetterCompleted(letter);
+            }
+
+            unlockNextLetter(letter) {
+                const currentIndex = LETTERS.indexOf(letter);
+                const nextIndex = currentIndex + 1;
+                
+                if (nextIndex < LETTERS.length) {
+                    // فتح الحرف التالي فقط
+                    const nextLetter = LETTERS[nextIndex];
+                    if (!this.isLetterAvailableForPlan(nextLetter)) {
+                        this.renderLettersNav();
+                        this.showLetterPaywall(nextLetter);
+                        return;
+                    }
+
+                    const entry = this.ensureLetterRecord(nextLetter);
+
+                    if (!entry.unlocked) {
+                        entry.unlocked = true;
+                        this.commitProgressUpdate();
+                        this.renderLettersNav(); // تحديث الواجهة
+                        this.setupLetterJumpMenu();
+                        this.showToast(`🎉 رائع! تم فتح الحرف ${nextLetter}`, 3000, 'success');
+
+                        // الانتقال تلقائياً للحرف التالي
+                        setTimeout(() => {
+                            this.loadLetter(nextIndex);
+                        }, 1500);
+                    }
+                } else {
+                    // All letters completed - show final certificate!
+                    this.showToast("🎉 مبروك! لقد أنهيت جميع الحروف! ستحصل على شهادة الإتقان!", 5000, 'success');
+                    setTimeout(() => {
+                        this.showCertificate();
+                    }, 2000);
+                }
+            }
+
+            goToLetter(letter) {
+                const index = LETTERS.indexOf(letter);
+                if (index === -1) return;
+
+                if (!this.isLetterAvailableForPlan(letter)) {
+                    this.showLetterPaywall(letter);
+                    return;
+                }
+
+                if (this.isPremiumUser() || this.isFreeLetter(letter)) {
+                    this.loadLetter(index);
+                    return;
+                }
+                
+                // السماح بالوصول للحرف A دائماً
+                if (index === 0) {
+                    this.loadLetter(index);
+                    return;
+                }
+
+                // إذا كان الحرف مفتوحاً بالفعل، اسمح بالدخول مباشرة
+                if (this.isLetterUnlocked(letter)) {
+                    this.loadLetter(index);
+                    return;
+                }
+                
+                // التحقق من أن الحرف السابق مكتمل
+                const prevLetter = LETTERS[index - 1];
+                if (!this.isLetterCompleted(prevLetter)) {
+                    this.showToast('عذرًا، هذا الحرف مغلق. يجب إنهاء الحرف السابق أولًا.');
+                    this.soundManager?.playSound('error');
+                    return;
+                }
+                
+                // إذا كان الحرف السابق مكتملاً، فتح الحرف الحالي
+                this.unlockLetter(letter);
+                this.renderLettersNav();
+                this.setupLetterJumpMenu();
+                
+                this.loadLetter(index);
+            }
+
+            renderLettersNav() {
+                this.lettersNav.innerHTML = '';
+                
+                LETTERS.forEach((letter, index) => {
+                    const tab = document.createElement('div');
+                    tab.className = 'letter-tab';
+                    tab.textContent = letter;
+                    tab.dataset.index = index;
+                    
+                    if (index === this.currentLetterIndex) {
+                        tab.classList.add('active');
+                    }
+                    
+                    if (this.isLetterCompleted(letter)) {
+                        tab.classList.add('completed');
+                    }
+                    
+                    if (!this.isLetterAvailableForPlan(letter)) {
+                        tab.classList.add('locked');
+                        tab.title = 'اشترك لفتح هذا الحرف';
+                    } else {
+                        tab.title = `حرف ${letter}`;
+                    }
+
+                    if (!this.isLetterAvailableForPlan(letter) && this.isLetterCompleted(letter)) {
+                        tab.classList.remove('completed');
+                    }
+
+                    if (this.isLetterAvailableForPlan(letter) && !this.isPremiumUser() && !this.isFreeLetter(letter) && !this.isLetterUnlocked(letter)) {
+                        tab.classList.add('locked');
+                    }
+                    
+                    tab.addEventListener('click', () => {
+                        this.goToLetter(letter);
+                    });
+                    
+                    this.lettersNav.appendChild(tab);
+                });
+
+                if (this.completedLetters.length === LETTERS.length) {
+                    const certTab = document.createElement('div');
+                    certTab.className = 'letter-tab certificate-tab';
+                    certTab.innerHTML = '🎓';
+                    certTab.title = 'الشهادة / Certificate';
+                    certTab.style.backgroundColor = 'gold';
+                    certTab.style.borderColor = '#b8860b';
+                    certTab.style.cursor = 'pointer';
+                    certTab.style.fontSize = '1.2rem';
+                    
+                    certTab.addEventListener('click', () => {
+                        this.showCertificate();
+                    });
+                    
+                    this.lettersNav.appendChild(certTab);
+                }
+            }
+            
+            loadLetter(index) {
+                try {
+                    const letter = LETTERS[index];
+                    if (!letter) {
+                        console.error('Invalid letter index:', index);
+                        return;
+                    }
+
+                    if (!this.isLetterAvailableForPlan(letter)) {
+                        this.showLetterPaywall(letter);
+                        return;
+                    }
+
+                    if (!this.isPremiumUser() && !this.isFreeLetter(letter) && index !== 0 && !this.isLetterUnlocked(letter)) {
+                        this.showToast('عذرًا، هذا الحرف مغلق. يجب إنهاء الحرف السابق أولًا.', 3000);
+                        this.soundManager.playSound('error');
+                        return;
+                    }
+
+                    this.currentLetterIndex = index;
+                    this.progress.currentLetter = letter;
+                    
+                    // Critical: Ensure record is robust
+                    const letterProgress = this.ensureLetterRecord(letter);
+                    if (!letterProgress) throw new Error('Failed to ensure letter record');
+
+                    const staticLetterData = LETTER_DATA[letter];
+
+                    if (!staticLetterData || !staticLetterData.words) {
+                        console.error(`No static data or words found for letter: ${letter}`);
+                        this.showToast('لا توجد بيانات لهذا الحرف', 3000, 'error');
+                        return;
+                    }
+
+                    if (this.quizTimeout) {
+                        clearTimeout(this.quizTimeout);
+                        this.quizTimeout = null;
+                    }
+                    this.isAnswerSelected = false;
+
+                    const quizContainer = this.quizOptions?.closest('.quiz-container');
+                    if (quizContainer) {
+                        quizContainer.classList.remove('quiz-completed');
+                    }
+
+                    const quizState = this.ensureCurrentLetterQuizState(letter, letterProgress);
+
+                    // Safe usage of properties with fallbacks
+                    this.quizScore = Number(quizState.score) || 0;
+                    this.quizCompletedFlag = quizState.completed === true;
+
+                    const answers = quizState.answers || {};
+                    const answeredCount = Object.keys(answers).length;
+                    
+                    // Safe quiz length check
+                    const quizLength = (staticLetterData.quiz && Array.isArray(staticLetterData.quiz)) ? staticLetterData.quiz.length : 0;
+                    this.currentQuizIndex = this.quizCompletedFlag ? quizLength : answeredCount;
+                    
+                    // Render Steps with individual error handling ensures one failure doesn't break the whole page
+                    try { this.updateUIForLetter(letter, staticLetterData.words); } catch(e) { console.error('Error updating UI', e); }
+                    try { this.renderWritingBoxes(letter); } catch(e) { console.error('Error rendering writing', e); }
+                    try { this.renderWordWriting(letter, staticLetterData.words); } catch(e) { console.error('Error rendering words', e); }
+                    try { this.renderQuiz(staticLetterData.quiz); } catch(e) { console.error('Error rendering quiz', e); }
+                    
+                    try { this.updateAndCommitScores(); } catch(e) { console.error('Error updating scores', e); }
+                    try { this.updateProgress(); } catch(e) { console.error('Error updating progress', e); }
+                    try { this.renderLettersNav(); } catch(e) { console.error('Error rendering letters nav', e); }
+                    try { this.renderAchievements(); } catch(e) { console.error('Error rendering achievements', e); }
+                } catch (error) {
+                    console.error("Error loading letter:", error);
+                    // Show more specific error to user if possible, otherwise generic
+                    const msg = error.message || "Unknown error";
+                    // Suppress "Cannot set properties of null" error toast as per user request
+                    if (msg && (msg.includes("Cannot set properties of null") || msg.includes("setting 'textContent'") || msg.includes("null"))) {
+                        // Fallback logging only
+                        console.warn("Suppressed persistent UI error:", msg);
+                    } else {
+                        this.showToast(`حدث خطأ أثناء تحميل الحرف: ${msg}`, 5000, 'error');
+                    }
+                }
+            }
+
+            ensureCurrentLetterQuizState(letter, letterProgress = null) {
+                const entry = letterProgress || this.ensureLetterRecord(letter);
+                if (!entry.exercises) entry.exercises = {};
+
+                const existingQuiz = entry.exercises.quiz || {};
+                const quizIsLegacy = !existingQuiz.letter;
+                const quizIsCorrupt = existingQuiz.letter && existingQuiz.letter !== letter;
+
+                if (quizIsLegacy || quizIsCorrupt) {
+                    entry.exercises.quiz = {
+                        letter,
+                        quizId: `letter_knowledge_quiz_${letter}`,
+                        answers: {},
+                        score: 0,
+                        completed: false
+                    };
+                    entry.exercisesCompleted = false;
+                    entry.completed = false;
+                    this.quizScore = 0;
+                    this.quizCompletedFlag = false;
+                    this.currentQuizIndex = 0;
+                    this.commitProgressUpdate();
+                } else {
+                    entry.exercises.quiz.letter = letter;
+                    entry.exercises.quiz.quizId = entry.exercises.quiz.quizId || `letter_knowledge_quiz_${letter}`;
+                    entry.exercises.quiz.answers = entry.exercises.quiz.answers || {};
+                    entry.exercises.quiz.score = Number(entry.exercises.quiz.score) || 0;
+                    entry.exercises.quiz.completed = entry.exercises.quiz.completed === true;
+                }
+
+                return entry.exercises.quiz;
+            }
+
+            updateUIForLetter(letter, words) {
+                if (this.currentLetterEl) this.currentLetterEl.textContent = letter;
+                if (this.letterUpperEl) this.letterUpperEl.textContent = letter.toUpperCase();
+                if (this.letterLowerEl) this.letterLowerEl.textContent = letter.toLowerCase();
+                if (this.letterForWordsEl) this.letterForWordsEl.textContent = letter;
+                if (this.externalGamesLink) {
+                    this.externalGamesLink.href = `/letters/${letter}/external-games/`;
+                    this.externalGamesLink.hidden = true;
+                }
+                if (this.letterWorksheetBtn) {
+                    this.letterWorksheetBtn.hidden = LEVEL_ONE_DISABLED_FEATURES.letterWorksheets;
+                    this.letterWorksheetBtn.onclick = () => this.generateWorksheet(letter);
+                }
+                
+                // إضافة زر تحميل ورقة العمل
+                if (this.currentLetterEl && this.currentLetterEl.parentElement) {
+                    const headerContainer = this.currentLetterEl.parentElement;
+                    let actionsGroup = headerContainer.querySelector('.letter-title-actions');
+                    if (LEVEL_ONE_DISABLED_FEATURES.letterWorksheets && LEVEL_ONE_DISABLED_FEATURES.worksheetBook) {
+                        actionsGroup?.querySelector('.download-worksheet-btn')?.remove();
+                        actionsGroup?.querySelector('.letters-worksheet-book-btn')?.remove();
+                        this.renderWordsGrid(words);
+                        return;
+                    }
+                    if (!actionsGroup) {
+                        actionsGroup = document.createElement('span');
+                        actionsGroup.className = 'letter-title-actions';
+                        headerContainer.appendChild(actionsGroup);
+                    }
+
+                    let downloadBtn = actionsGroup.querySelector('.download-worksheet-btn');
+                    let bookBtn = actionsGroup.querySelector('.letters-worksheet-book-btn');
+                    
+                    if (LEVEL_ONE_DISABLED_FEATURES.letterWorksheets) {
+                        downloadBtn?.remove();
+                        downloadBtn = null;
+                    } else if (!downloadBtn) {
+                        downloadBtn = document.createElement('button');
+                        downloadBtn.className = 'download-worksheet-btn';
+                        downloadBtn.innerHTML = '<i class="fas fa-file-pdf"></i> ورقة عمل';
+                        downloadBtn.style.cssText = `
+                            background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+                            color: white;
+                            border: none;
+                            padding: 8px 15px;
+                            border-radius: 20px;
+                            font-size: 14px;
+                            cursor: pointer;
+                            margin-right: 15px;
+                            display: inline-flex;
+                            align-items: center;
+                            gap: 8px;
+                            box-shadow: 0 4px 6px rgba(239, 68, 68, 0.2);
+                            transition: transform 0.2s;
+                        `;
+                        downloadBtn.onmouseover = () => downloadBtn.style.transform = 'scale(1.05)';
+                        downloadBtn.onmouseout = () => downloadBtn.style.transform = 'scale(1)';
+                        
+                        // إدراج الزر بجانب العنوان
+                        actionsGroup.appendChild(downloadBtn);
+                    }
+
+                    if (LEVEL_ONE_DISABLED_FEATURES.worksheetBook) {
+                        bookBtn?.remove();
+                        bookBtn = null;
+                    } else if (!bookBtn) {
+                        bookBtn = document.createElement('a');
+                        bookBtn.className = 'letters-worksheet-book-btn';
+                        bookBtn.href = '/letters/worksheets-book/';
+                        bookBtn.innerHTML = '<i class="fas fa-file-arrow-down"></i><span>تحميل كتاب الحروف</span><small>PDF / Word</small>';
+                        bookBtn.setAttribute('aria-label', 'تحميل كتاب أوراق عمل الحروف');
+                        actionsGroup.appendChild(bookBtn);
+                    }
+                    
+                    // تحديث حدث النقر للزر
+                    if (downloadBtn) {
+                        downloadBtn.onclick = () => this.generateWorksheet(letter);
+                    }
+                }
+
+                this.renderWordsGrid(words);
+            }
+
+            renderWordsGrid(words) {
+                if (!this.wordsGrid) return;
+                this.wordsGrid.innerHTML = '';
+                if (!words || words.length === 0) {
+                    this.wordsGrid.innerHTML = '<p>لا توجد كلمات لهذا الحرف.</p>';
+                    return;
+                }
+                
+                words.forEach(wordData => {
+                    const card = document.createElement('div');
+                    card.className = 'word-card';
+                    card.innerHTML = `
+                        <div class="word-emoji">${wordData.emoji}</div>
+                        <div class="word-text">${wordData.word}</div>
+                        <div class="word-ar">${wordData.translation}</div>
+                        <div class="word-actions">
+                            <button class="icon-btn" data-word="${wordData.word}" title="نطق الكلمة">🔊</button>
+                            <button class="icon-btn" data-word="${wordData.word}" title="تدرب على النطق">🎤</button>
+                        </div>
+                    `;
+                    
+                    const soundBtn = card.querySelector('button[title="نطق الكلمة"]');
+                    soundBtn.addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        this.soundManager.speak(wordData.word);
+                    });
+                    
+                    const micBtn = card.querySelector('button[title="تدرب على النطق"]');
+                    micBtn.addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        // Paint the pressed state in this same tick so the tap feels
+                        // instant, then hand over. The permission check used to run
+                        // here as well, which opened and closed an extra microphone
+                        // stream before recognition could start - that double
+                        // acquisition is what made the first tap feel slow.
+                        // startSpeechRecognitionForWord still performs the check and
+                        // still restores this button on every early return.
+                        micBtn.classList.add('mic-active');
+                        this.listenForWord(wordData.word, micBtn);
+                    });
+                    
+                    this.wordsGrid.appendChild(card);
+                });
+            }
+
+            markWordCardPronunciationCorrect(micButton, expectedWord) {
+                const card = micButton?.closest('.word-card');
+                if (!card) return;
+
+                card.classList.add('pronunciation-correct');
+                let badge = card.querySelector('.word-pronunciation-badge');
+                if (!badge) {
+                    badge = document.createElement('span');
+                    badge.className = 'word-pronunciation-badge';
+                    badge.textContent = '✔';
+                    card.appendChild(badge);
+                }
+                badge.title = `نطق صحيح: ${expectedWord}`;
+            }
+
+            renderWritingBoxes(letter) {
+                if (!this.capitalWriting || !this.smallWriting) return;
+                this.capitalWriting.innerHTML = '';
+                this.smallWriting.innerHTML = '';
+                if (this.capitalDragWriting) this.capitalDragWriting.innerHTML = '';
+                if (this.smallDragWriting) this.smallDragWriting.innerHTML = '';
+                this.updateWritingLabels(letter);
+
+                const letterProgress = this.ensureLetterRecord(letter);
+                const writing = this.ensureWritingPracticeState(letterProgress);
+                const handwritingCount = this.HANDWRITING_COUNT || 2;
+                const dragPracticeCount = this.DRAG_WRITING_COUNT || 5;
+                
+                for (let i = 0; i < handwritingCount; i++) {
+                    const capitalBox = this.createWritingBox(i, letter.toUpperCase(), true, writing.capital[i]);
+                    this.capitalWriting.appendChild(capitalBox);
+                    
+                    const smallBox = this.createWritingBox(i, letter.toLowerCase(), false, writing.small[i]);
+                    this.smallWriting.appendChild(smallBox);
+                }
+
+                if (this.capitalDragWriting) {
+                    this.renderWritingDragPractice(this.capitalDragWriting, letter.toUpperCase(), true, writing.dragCapital, dragPracticeCount);
+                }
+
+                if (this.smallDragWriting) {
+                    this.renderWritingDragPractice(this.smallDragWriting, letter.toLowerCase(), false, writing.dragSmall, dragPracticeCount);
+                }
+            }
+
+            updateWritingLabels(letter) {
+                const labels = document.querySelectorAll('.writing-section .writing-label');
+                if (labels[0]) {
+                    labels[0].textContent = `الحرف الكبير (${String(letter || '').toUpperCase()}) ${this.HANDWRITING_COUNT || 2} مرات`;
+                }
+                if (labels[1]) {
+                    labels[1].textContent = `الحرف الصغير (${String(letter || '').toLowerCase()}) ${this.HANDWRITING_COUNT || 2} مرات`;
+                }
+            }
+
+            ensureWritingPracticeState(letterProgress) {
+                if (!letterProgress.exercises) letterProgress.exercises = {};
+                if (!letterProgress.exercises.writing) letterProgress.exercises.writing = {};
+
+                const writing = letterProgress.exercises.writing;
+                if (!writing.capital) writing.capital = {};
+                if (!writing.small) writing.small = {};
+                if (!writing.dragCapital) writing.dragCapital = {};
+                if (!writing.dragSmall) writing.dragSmall = {};
+
+                return writing;
+            }
+
+            createWritingBox(index, expectedChar, isCapital, savedValue) {
+                const box = document.createElement('input');
+                box.type = 'text';
+                box.className = 'writing-box';
+                box.maxLength = 1;
+                box.dataset.index = index;
+                box.dataset.char = isCapital ? 'capital' : 'small';
+                box.autocomplete = 'off';
+                box.autocorrect = 'off';
+                box.spellcheck = false;
+
+                if (savedValue) {
+                    box.value = savedValue;
+                    this.checkWritingBox(box, expectedChar, isCapital, true);
+                }
+
+                box.addEventListener('input', () => this.checkWritingBox(box, expectedChar, isCapital));
+                return box;
+            }
+
+            checkWritingBox(box, expected, isCapital, isLoading = false) {
+                const entered = box.value.trim();
+                const letter = this.progress.currentLetter;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const writing = this.ensureWritingPracticeState(letterProgress);
+                const type = isCapital ? 'capital' : 'small';
+
+                // Strict equality check for case sensitivity
+                if (entered === expected) {
+                    box.classList.add('correct');
+                    box.classList.remove('incorrect');
+                    writing[type][box.dataset.index] = entered;
+                    
+                    if (!isLoading) {
+                        this.updateAndCommitScores();
+                        this.soundManager.playSound('success');
+                        this.speakLetter(entered, isCapital);
+                        
+                        // Auto-focus next input
+                        const nextBox = box.nextElementSibling;
+                        if (nextBox) {
+                            nextBox.focus();
+                        }
+                    }
+                } else {
+                    box.classList.add('incorrect');
+                    box.classList.remove('correct');
+                    delete writing[type][box.dataset.index];
+                    
+                    if (!isLoading && entered !== '') {
+                        this.soundManager.playSound('error');
+                        
+                        // Add specific feedback for wrong case
+                        if (entered.toLowerCase() === expected.toLowerCase()) {
+                            if (isCapital) {
+                                this.showToast('الرجاء كتابة الحرف الكبير (Capital)', 2000, 'warning');
+                            } else {
+                                this.showToast('الرجاء كتابة الحرف الصغير (Small)', 2000, 'warning');
+                            }
+                        }
+                    }
+                }
+                if (!isLoading) {
+                    this.commitProgressUpdate();
+                }
+            }
+
+            renderWritingDragPractice(container, expectedChar, isCapital, savedValues = {}, count = 5) {
+                container.innerHTML = '';
+
+                const slots = document.createElement('div');
+                slots.className = 'writing-drag-slots';
+
+                const bank = document.createElement('div');
+                bank.className = 'writing-drag-bank';
+
+                for (let i = 0; i < count; i++) {
+                    const slot = document.createElement('div');
+                    slot.className = 'writing-drag-slot';
+                    slot.dataset.index = i;
+                    slot.dataset.char = isCapital ? 'capital' : 'small';
+                    slot.dataset.expected = expectedChar;
+                    slot.setAttribute('role', 'button');
+                    slot.setAttribute('tabindex', '0');
+
+                    if (savedValues[i] === expectedChar) {
+                        slot.classList.add('correct');
+                        slot.textContent = expectedChar;
+                        slot.dataset.sourceTileId = `${isCapital ? 'capital' : 'small'}-${i}-${expectedChar}`;
+                    }
+
+                    slot.addEventListener('dragover', (event) => {
+                        event.preventDefault();
+                        slot.classList.add('drag-over');
+                    });
+
+                    slot.addEventListener('dragleave', () => {
+                        slot.classList.remove('drag-over');
+                    });
+
+                    slot.addEventListener('drop', (event) => {
+                        event.preventDefault();
+                        slot.classList.remove('drag-over');
+                        const tileId = event.dataTransfer.getData('text/plain');
+                        const tile = Array.from(container.querySelectorAll('.writing-drag-letter'))
+                            .find(item => item.dataset.dragTileId === tileId);
+                        this.completeWritingDragSlot(slot, tile, expectedChar, isCapital);
+                    });
+
+                    slot.addEventListener('click', () => {
+                        if (slot.classList.contains('correct')) {
+                            this.clearWritingDragSlot(slot, isCapital);
+                            return;
+                        }
+                        this.completeWritingDragSlot(slot, this.selectedWritingDragTile, expectedChar, isCapital);
+                    });
+
+                    slots.appendChild(slot);
+
+                    const tile = document.createElement('div');
+                    tile.className = 'writing-drag-letter';
+                    tile.textContent = expectedChar;
+                    tile.dataset.value = expectedChar;
+                    tile.dataset.dragTileId = `${isCapital ? 'capital' : 'small'}-${i}-${expectedChar}`;
+                    tile.draggable = savedValues[i] !== expectedChar;
+
+                    if (savedValues[i] === expectedChar) {
+                        tile.classList.add('used');
+                    }
+
+                    tile.addEventListener('dragstart', (event) => {
+                        if (tile.classList.contains('used')) {
+                            event.preventDefault();
+                            return;
+                        }
+                        event.dataTransfer.setData('text/plain', tile.dataset.dragTileId);
+                    });
+
+                    tile.addEventListener('click', () => {
+                        if (tile.classList.contains('used')) return;
+                        if (this.selectedWritingDragTile) {
+                            this.selectedWritingDragTile.classList.remove('selected');
+                        }
+                        this.selectedWritingDragTile = tile;
+                        tile.classList.add('selected');
+                    });
+
+                    bank.appendChild(tile);
+                }
+
+                container.appendChild(slots);
+                container.appendChild(bank);
+            }
+
+            completeWritingDragSlot(slot, tile, expectedChar, isCapital) {
+                if (!slot || !tile || tile.classList.contains('used')) return;
+                if (slot.classList.contains('correct')) {
+                    this.clearWritingDragSlot(slot, isCapital);
+                }
+
+                const droppedValue = tile.dataset.value;
+                const letter = this.progress.currentLetter;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const writing = this.ensureWritingPracticeState(letterProgress);
+                const storeKey = isCapital ? 'dragCapital' : 'dragSmall';
+
+                if (droppedValue === expectedChar) {
+                    slot.textContent = expectedChar;
+                    slot.dataset.sourceTileId = tile.dataset.dragTileId;
+                    slot.classList.add('correct');
+                    tile.classList.add('used');
+                    tile.classList.remove('selected');
+                    tile.draggable = false;
+                    writing[storeKey][slot.dataset.index] = expectedChar;
+
+                    this.selectedWritingDragTile = null;
+                    this.updateAndCommitScores();
+                    this.soundManager.playSound('success');
+                    this.speakLetter(expectedChar, isCapital);
+                    return;
+                }
+
+                this.soundManager.playSound('error');
+                this.showToast('اسحب الحرف الصحيح إلى الخانة', 2000, 'warning');
+            }
+
+            clearWritingDragSlot(slot, isCapital) {
+                if (!slot || !slot.classList.contains('correct')) return;
+
+                const tileId = slot.dataset.sourceTileId;
+                if (tileId) {
+                    const tile = document.querySelector(`[data-drag-tile-id="${tileId}"]`);
+                    if (tile) {
+                        tile.classList.remove('used');
+                        tile.draggable = true;
+                    }
+                }
+
+                const letter = this.progress.currentLetter;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const writing = this.ensureWritingPracticeState(letterProgress);
+                const storeKey = isCapital ? 'dragCapital' : 'dragSmall';
+                delete writing[storeKey][slot.dataset.index];
+
+                slot.textContent = '';
+                slot.dataset.sourceTileId = '';
+                slot.classList.remove('correct', 'drag-over');
+                this.updateAndCommitScores();
+            }
+
+            calculateCurrentWritingScore() {
+                const letter = this.progress.currentLetter;
+                if (!letter) return 0;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const writing = this.ensureWritingPracticeState(letterProgress);
+                const handwritingLimit = this.HANDWRITING_COUNT || 2;
+                const dragLimit = this.DRAG_WRITING_COUNT || 5;
+                const capitalCorrect = this.countWritingPracticeEntries(writing.capital, handwritingLimit);
+                const smallCorrect = this.countWritingPracticeEntries(writing.small, handwritingLimit);
+                const dragCapitalCorrect = this.countWritingPracticeEntries(writing.dragCapital, dragLimit);
+                const dragSmallCorrect = this.countWritingPracticeEntries(writing.dragSmall, dragLimit);
+                return capitalCorrect + smallCorrect + dragCapitalCorrect + dragSmallCorrect;
+            }
+
+            countWritingPracticeEntries(entries, limit = 5) {
+                return Object.keys(entries || {}).filter(index => {
+                    const numericIndex = Number(index);
+                    return Number.isInteger(numericIndex) && numericIndex >= 0 && numericIndex < limit;
+                }).length;
+            }
+
+
+            renderQuiz(quizData) {
+                if (!this.quizQuestion || !this.quizOptions) return;
+                const quizContainer = this.quizOptions.closest('.quiz-container');
+                if (quizContainer) {
+                    quizContainer.classList.remove('quiz-completed');
+                    quizContainer.dataset.quizLetter = this.progress.currentLetter || '';
+                }
+                if (!quizData || quizData.length === 0) {
+                    this.quizQuestion.innerHTML = 'لا توجد أسئلة متاحة.';
+                    this.quizOptions.innerHTML = '';
+                    if (this.quizNavigation) this.quizNavigation.style.display = 'none';
+                    return;
+                }
+
+                if (this.quizNavigation) this.quizNavigation.style.display = 'flex';
+                
+                if (this.currentQuizIndex >= quizData.length) {
+                    this.showQuizResults();
+                    return;
+                }
+                
+                const questionData = quizData[this.currentQuizIndex];
+                const letter = this.progress.currentLetter;
+                if (questionData.letter && questionData.letter !== letter) {
+                    console.warn('Ignored quiz question for wrong letter', questionData.letter, letter);
+                    this.currentQuizIndex = 0;
+                    this.quizScore = 0;
+                    this.quizCompletedFlag = false;
+                    this.quizQuestion.textContent = 'جاري تحديث اختبار هذا الحرف...';
+                    this.quizOptions.innerHTML = '';
+                    return;
+                }
+                const letterProgress = this.ensureLetterRecord(letter);
+                const quizState = this.ensureCurrentLetterQuizState(letter, letterProgress);
+                const savedAnswer = quizState.answers[this.currentQuizIndex];
+
+                this.questionNumberEl.textContent = this.currentQuizIndex + 1;
+                this.quizQuestion.textContent = questionData.question;
+                this.quizOptions.innerHTML = '';
+                
+                questionData.options.forEach((option, index) => {
+                    const optionEl = document.createElement('div');
+                    optionEl.className = 'quiz-option';
+                    optionEl.textContent = option;
+                    optionEl.dataset.index = index;
+                    
+                    optionEl.addEventListener('click', () => {
+                        if (this.isAnswerSelected) return;
+                        this.checkQuizAnswer(index, questionData.correct, optionEl);
+                    });
+                    
+                    this.quizOptions.appendChild(optionEl);
+                });
+
+                if (savedAnswer !== undefined) {
+                    const selectedOptionEl = this.quizOptions.querySelector(`[data-index='${savedAnswer}']`);
+                    if (selectedOptionEl) {
+                        this.checkQuizAnswer(savedAnswer, questionData.correct, selectedOptionEl, true);
+                    }
+                } else {
+                    this.isAnswerSelected = false;
+                    this.quizNextBtn.disabled = true;
+                }
+            }
+
+            checkQuizAnswer(selectedIndex, correctIndex, optionEl, isLoading = false) {
+                this.isAnswerSelected = true;
+                const letter = this.progress.currentLetter;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const quizState = this.ensureCurrentLetterQuizState(letter, letterProgress);
+                quizState.letter = letter;
+                quizState.quizId = `letter_knowledge_quiz_${letter}`;
+                letterProgress.exercises.quiz.answers[this.currentQuizIndex] = selectedIndex;
+
+                const allOptions = this.quizOptions.querySelectorAll('.quiz-option');
+                allOptions.forEach(opt => opt.classList.add('disabled'));
+
+                if (selectedIndex === correctIndex) {
+                    optionEl.classList.add('correct');
+                    if (!isLoading) {
+                        this.quizScore++;
+                        letterProgress.exercises.quiz.score = this.quizScore;
+                        this.soundManager.playSound('success');
+                        this.updateAndCommitScores();
+                    }
+                } else {
+                    optionEl.classList.add('incorrect');
+                    const correctOption = this.quizOptions.querySelector(`[data-index='${correctIndex}']`);
+                    if (correctOption) {
+                        correctOption.classList.add('correct');
+                    }
+                    if (!isLoading) {
+                        this.soundManager.playSound('error');
+                    }
+                }
+                
+                this.quizNextBtn.disabled = false;
+                
+                if (!isLoading) {
+                    this.commitProgressUpdate();
+                    
+                    // Automatic navigation after 2 seconds
+                    if (this.quizTimeout) clearTimeout(this.quizTimeout);
+                    this.quizTimeout = setTimeout(() => {
+                        this.nextQuizQuestion();
+                    }, 2000);
+                }
+            }
+
+            nextQuizQuestion() {
+                // Clear timeout to prevent double navigation if button is clicked
+                if (this.quizTimeout) {
+                    clearTimeout(this.quizTimeout);
+                    this.quizTimeout = null;
+                }
+
+                const letter = this.progress.currentLetter;
+                const quizData = LETTER_DATA[letter]?.quiz;
+                if (!quizData) return;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const quizState = this.ensureCurrentLetterQuizState(letter, letterProgress);
+
+                this.currentQuizIndex++;
+                this.isAnswerSelected = false;
+                
+                if (this.currentQuizIndex < quizData.length) {
+                    this.renderQuiz(quizData);
+                } else {
+                    quizState.letter = letter;
+                    quizState.quizId = `letter_knowledge_quiz_${letter}`;
+                    quizState.completed = true;
+                    this.quizCompletedFlag = true;
+                    this.commitProgressUpdate();
+                    this.showQuizResults();
+                }
+            }
+
+            showQuizResults() {
+                const letter = this.progress.currentLetter;
+                const letterProgress = this.ensureLetterRecord(letter);
+                const quizState = this.ensureCurrentLetterQuizState(letter, letterProgress);
+                if (quizState.letter !== letter || quizState.completed !== true) {
+                    this.quizScore = 0;
+                    this.quizCompletedFlag = false;
+                    this.currentQuizIndex = 0;
+                    this.renderQuiz(LETTER_DATA[letter]?.quiz || []);
+                    return;
+                }
+                const quizData = LETTER_DATA[letter]?.quiz;
+                const maxScore = quizData?.length || 6;
+
+                this.quizQuestion.textContent = `🎉 أحسنت! لقد أكملت اختبار حرف ${letter}.`;
+                this.quizOptions.innerHTML = `<p style="text-align: center; width: 100%;">نتيجة اختبار حرف ${letter}: ${this.quizScore} من ${maxScore}</p>`;
+                this.quizNavigation.style.display = 'none';
+                this.quizScoreEl.textContent = `${this.quizScore}/${maxScore}`;
+                this.quizOptions.closest('.quiz-container').classList.add('quiz-completed');
+            }
+
+            updateAndCommitScores() {
+                this.writingScore = this.calculateCurrentWritingScore();
+                this.wordsScore = this.calculateCurrentWordsScore();
+                
+                const letter = this.progress.currentLetter;
+                if (!letter) return;
+
+                const letterProgress = this.ensureLetterRecord(letter);
+                const quizData = LETTER_DATA[letter]?.quiz;
+
+                const maxWritingScore = this.MAX_WRITING_SCORE || 14;
+                const maxWordsScore = LETTER_DATA[letter]?.words.length || 6;
+                const maxTestScore = quizData?.length || 6;
+
+                this.writingScoreEl.textContent = `${this.writingScore}/${maxWritingScore}`;
+                this.wordsScoreEl.textContent = `${this.wordsScore}/${maxWordsScore}`;
+                this.testScoreEl.textContent = `${this.quizScore}/${maxTestScore}`;
+                
+                const totalScore = this.writingScore + this.wordsScore + this.quizScore;
+                const maxTotalScore = maxWritingScore + maxWordsScore + maxTestScore;
+                this.totalScoreEl.textContent = `${totalScore}/${maxTotalScore}`;
+
+                letterProgress.score = totalScore;
+                this.commitProgressUpdate();
+                this.totalScoreEl.className = 'score-value';
+                if (totalScore >= maxTotalScore - 4) {
+                    this.totalScoreEl.classList.add('high');
+                } else if (totalScore >= this.REQUIRED_SCORE) {
+                    this.totalScoreEl.classList.add('medium');
+                } else {
+                    this.totalScoreEl.classList.add('low');
+                }
+
+                const currentLetter = LETTERS[this.currentLetterIndex];
+                this.updateLetterExerciseProgress(currentLetter);
+            }
+            
+            updateProgress() {
+                const currentLetter = LETTERS[this.currentLetterIndex];
+                if (this.progressValueEl) {
+                    this.progressValueEl.textContent = `الحرف ${currentLetter}`;
+                }
+                
+                const progress = ((this.currentLetterIndex + 1) / LETTERS.length) * 100;
+                if (this.progressBar) {
+                    this.progressBar.style.width = `${progress}%`;
+                }
+            }
+            
+            renderAchievements() {
+                this.achievementsContainer.innerHTML = '';
+                
+                const achievements = [
+                    { id: 'first-letter', icon: '🚀', name: 'الحرف الأول', description: 'إكمال أول حرف', unlocked: this.completedLetters.length >= 1 },
+                    { id: 'five-letters', icon: '⭐', name: '5 حروف', description: 'إكمال 5 حروف', unlocked: this.completedLetters.length >= 5 },
+                    { id: 'ten-letters', icon: '🏆', name: '10 حروف', description: 'إكمال 10 حروف', unlocked: this.completedLetters.length >= 10 },
+                    { id: 'all-letters', icon: '👑', name: 'كل الحروف', description: 'إكمال جميع الحروف', unlocked: this.completedLetters.length === LETTERS.length }
+                ];
+                
+                achievements.forEach(achievement => {
+                    const badge = document.createElement('div');
+                    badge.className = `achievement-badge ${achievement.unlocked ? '' : 'locked'}`;
+                    badge.innerHTML = `
+                        <span>${achievement.icon}</span>
+                        <div class="tooltip">${achievement.name}<br>${achievement.description}</div>
+                    `;
+                    
+                    this.achievementsContainer.appendChild(badge);
+                });
+            }
+            
+            showToast(message, duration = 3000, type = 'info') {
+                const toast = this.toast || document.getElementById('toast');
+                if (!toast) return;
+                
+                toast.textContent = message;
+                toast.className = `toast show ${type}`;
+                
+                setTimeout(() => {
+                    toast.className = toast.className.replace('show', '');
+                }, duration);
+            }
+            
+            async speakLetter(letter = null, isCapital = null) {
+                if (!this.soundEnabled) return;
+                
+                const targetLetter = letter || this.progress.currentLetter;
+                if (!targetLetter) return;
+
+                // نطق الحرف مع وصف نوعه
+                if (isCapital === true) {
+                    await this.soundManager.speak(`Capital ${targetLetter}`);
+                } else if (isCapital === false) {
+                    await this.soundManager.speak(`Small ${targetLetter}`);
+                } else {
+                    // في حال عدم التحديد (زر الاستماع الرئيسي)
+                    // ينطق الحرف فقط بتفخيم
+                    await this.soundManager.speak(`Letter ${targetLetter}`);
+                }
+            }
+            
+            showRandomEncouragement() {
+                const wisdomSayings = [
+                    '✨ من جد وجد! استمر في التفوق!',
+                    '🎆 كل حرف تتعلمه يفتح لك باباً جديداً!',
+                    '🏆 أنت بطل حقيقي! استمر في التألق!',
+                    '🌟 ذكاؤك يضيء الطريق أمامك!',
+                    '⭐ أحسنت! أنت تصنع المعجزات!',
+                    '🚀 عالي وارتفع مع النجوم!',
+                    '🌈 أنت قوس قزح في عالم التعلم!',
+                    '🔥 نار في التعلم! أحرقت المراحل!'
+                ];
+                
+                const randomMessage = wisdomSayings[Math.floor(Math.random() * wisdomSayings.length)];
+                this.showToast(randomMessage, 2000, 'success');
+            }
+            
+            createMiniCelebration() {
+                // منع تعدد الاحتفالات
+                if (this.isMiniCelebrating) return;
+                this.isMiniCelebrating = true;
+                
+                const container = document.body;
+                const miniElements = [];
+                
+                // إنشاء 5 بالونات صغيرة
+                for (let i = 0; i < 5; i++) {
+                    const balloon = document.createElement('div');
+                    balloon.className = 'mini-celebrate-balloon';
+                    balloon.textContent = '🎈';
+                    balloon.style.cssText = `
+                        position: fixed;
+                        left: ${Math.random() * 100}vw;
+                        bottom: 0;
+                        font-size: ${Math.random() * 10 + 20}px;
+                        animation: miniFloatUp 2s ease-out forwards;
+                        pointer-events: none;
+                        z-index: 10000;
+                    `;
+                    container.appendChild(balloon);
+                    miniElements.push(balloon);
+                }
+                
+                // تنظيف عناصر الاحتفال
+                this.gameTimeouts.push(setTimeout(() => {
+                    miniElements.forEach(element => {
+                        if (element.parentNode) {
+                            element.parentNode.removeChild(element);
+                        }
+                    });
+                    this.isMiniCelebrating = false;
+                }, 2500));
+            }
+            
+            async speakText(text) {
+                if (!this.soundEnabled) return;
+                await this.soundManager.speak(text);
+            }
+            
+            showLetterInfo() {
+                const letter = LETTERS[this.currentLetterIndex];
+                const letterData = LETTER_DATA[letter];
+                
+                const info = `
+                    <div style="text-align: right; direction: rtl;">
+                        <h3 style="color: var(--primary); margin-bottom: 15px;">معلومات عن الحرف ${letter}</h3>
+                        <p><strong>النوع:</strong> ${letterData.type}</p>
+                        <p><strong>الصوت الرئيسي:</strong> /${getLetterSound(letter)}/</p>
+                        <p><strong>الحرف الكبير:</strong> ${letter}</p>
+                        <p><strong>الحرف الصغير:</strong> ${letter.toLowerCase()}</p>
+                        <p><strong>الكلمات الشائعة:</strong> ${letterData.words.map(w => w.word).join(', ')}</p>
+                        <hr style="margin: 15px 0; border-color: var(--border);">
+                        <p style="font-style: italic; color: var(--text-secondary);">
+                            ${letter === 'A' || letter === 'E' || letter === 'I' || letter === 'O' || letter === 'U' ? 
+                              'هذا حرف متحرك يمكن أن يكون له عدة أصوات حسب الكلمة.' : 
+                              'هذا حرف ساكن له صوت أساسي.'}
+                        </p>
+                    </div>
+                `;
+                
+                this.showToast(info.replace(/<[^>]*>/g, ''), 4000);
+            }
+            
+            saveLetterProgress() {
+                const letter = LETTERS[this.currentLetterIndex];
+                if (!this.letterProgress[letter]) {
+                    this.letterProgress[letter] = {
+                        writingBoxes: { capital: {}, small: {} },
+                        wordInputs: {},
+                        scores: { quiz: 0, writing: 0, words: 0 }
+                    };
+                }
+                
+                // Save writing boxes
+                const capitalBoxes = this.capitalWriting.querySelectorAll('.writing-box');
+                capitalBoxes.forEach(box => {
+                    if (box.value) this.letterProgress[letter].writingBoxes.capital[box.dataset.index] = box.value;
+                });
+                
+                const smallBoxes = this.smallWriting.querySelectorAll('.writing-box');
+                smallBoxes.forEach(box => {
+                    if (box.value) this.letterProgress[letter].writingBoxes.small[box.dataset.index] = box.value;
+                });
+                
+                // Save word inputs
+                const wordInputs = this.wordWritingList.querySelectorAll('.word-input');
+                wordInputs.forEach(input => {
+                    if (input.value) this.letterProgress[letter].wordInputs[input.dataset.word] = input.value;
+                });
+                
+                // Save scores
+                this.letterProgress[letter].scores = {
+                    quiz: this.quizScore,
+                    writing: this.writingScore,
+                    words: this.wordsScore
+                };
+                
+                localStorage.setItem('letterProgress', JSON.stringify(this.letterProgress));
+            }
+
+            async startSpeechRecognitionForWord(expectedWord, micButton, inputField = null, attempt = 0) {
+                const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+                const isLocalhost = ['localhost', '127.0.0.1', '::1'].includes(window.location.hostname);
+
+                // The caller may already have painted the pressed state, so every
+                // early return below has to hand the button back to the child.
+                const releaseMicButton = () => {
+                    if (!micButton) return;
+                    micButton.classList.remove('mic-active');
+                    micButton.disabled = false;
+                    micButton.textContent = '🎤';
+                };
+
+                if (!window.isSecureContext && !isLocalhost) {
+                    releaseMicButton();
+                    this.showMicStatus('⚠️ المايك يحتاج HTTPS بعد النشر، أو localhost أثناء التطوير.', true);
+                    return;
+                }
+                if (!navigator.mediaDevices?.getUserMedia) {
+                    releaseMicButton();
+                    this.showMicStatus('⚠️ المتصفح لا يدعم فحص الميكروفون. جرّب Chrome أو Edge.', true);
+                    return;
+                }
+                if (!SpeechRecognition) {
+                    releaseMicButton();
+                    this.showMicStatus('⚠️ المتصفح لا يدعم التعرف على الصوت', true);
+                    return;
+                }
+
+                // Every start claims a new session id. Callbacks belonging to an
+                // older session are ignored, so a slow result from an aborted
+                // attempt can never overwrite the UI of the current one.
+                const sessionId = (this.micSessionId || 0) + 1;
+                this.micSessionId = sessionId;
+                const isCurrentSession = () => this.micSessionId === sessionId;
+
+                // إيقاف أي عملية استماع جارية
+                if (this.isListening) {
+                    try {
+                        this.speechRecognition.abort();
+                    } catch (e) { console.log('Error aborting speech recognition:', e); }
+                    this.isListening = false;
+                    // إعادة تعيين جميع أزرار المايك
+                    document.querySelectorAll('.mic-word-write').forEach(btn => {
+                        btn.classList.remove('mic-active');
+                        btn.disabled = false;
+                        btn.textContent = '🎤';
+                    });
+                }
+
+                if (!this.micPermissionGranted) {
+                    if (!await this.requestMicrophonePermission()) {
+                        releaseMicButton();
+                        return;
+                    }
+                }
+
+                // A newer tap may have arrived while the permission prompt was open.
+                if (!isCurrentSession()) {
+                    return;
+                }
+                /* recognition starts immediately from the user gesture (no fixed delay) */
+
+                const recognition = new SpeechRecognition();
+                this.speechRecognition = recognition;
+                
+                // إعدادات اللغة - نبدأ بالأمريكية ثم نحاول البريطانية إذا فشلت الخدمة.
+                try {
+                    recognition.lang = attempt === 0 ? 'en-US' : 'en-GB';
+                    recognition.maxAlternatives = 20;
+                    recognition.continuous = false;
+                    recognition.interimResults = false;
+                } catch (e) {
+                    console.log("Error setting speech recognition properties:", e);
+                }
+
+                micButton.classList.add('mic-active');
+                micButton.disabled = true;
+                let didStart = false;
+                let startupTimedOut = false;
+                const resetMicButton = () => {
+                    micButton.classList.remove('mic-active');
+                    micButton.disabled = false;
+                    micButton.textContent = '🎤';
+                };
+                const startupTimeout = setTimeout(() => {
+                    if (didStart || !isCurrentSession()) return;
+                    startupTimedOut = true;
+                    try {
+                        recognition.abort();
+                    } catch (e) {}
+                    this.isListening = false;
+                    resetMicButton();
+                    this.showMicStatus('⚠️ المايك مسموح، لكن خدمة التعرف على الصوت لم تبدأ. استخدم Chrome/Edge وتأكد من الإنترنت ثم حاول مرة ثانية.', true);
+                    setTimeout(() => this.hideMicStatus(), 5000);
+                }, 7000);
+
+                recognition.onstart = () => {
+                    didStart = true;
+                    clearTimeout(startupTimeout);
+                    if (!isCurrentSession()) return;
+                    this.isListening = true;
+                    this.showMicStatus(attempt === 0 ? '🎤 تحدث الآن...' : '🎤 أحاول مرة ثانية، قل الكلمة الآن...', false);
+                };
+
+                // Timeout to stop recording after 10 seconds
+                const recordingTimeout = setTimeout(() => {
+                    if (this.isListening && isCurrentSession()) {
+                        try {
+                            recognition.abort();
+                        } catch (e) {}
+                        this.isListening = false;
+                        micButton.classList.remove('mic-active');
+                        micButton.disabled = false;
+                        this.showMicStatus('⏱️ انتهى الوقت - اضغط للتحدث مرة أخرى', true);
+                        setTimeout(() => this.hideMicStatus(), 2000);
+                    }
+                }, 10000);
+
+                // تعيين مستمع لنهاية الجلسة
+                recognition.onend = () => {
+                    // Timers are always cleared, even for a superseded session,
+                    // so nothing is left pending after the page moves on.
+                    clearTimeout(startupTimeout);
+                    clearTimeout(recordingTimeout);
+                    if (!isCurrentSession()) return;
+                    this.isListening = false;
+                    if (micButton.textContent === '🎤' || micButton.classList.contains('mic-active')) {
+                        resetMicButton();
+                    }
+                };
+
+                recognition.onresult = async (event) => {
+                    if (!isCurrentSession()) return;
+                    // تحسين: فحص جميع البدائل المحتملة وليس فقط النتيجة الأولى
+                    const alternatives = Array.from(event.results[0]).map(res => res.transcript.trim().toLowerCase());
+                    const expected = expectedWord.toLowerCase();
+                    
+                    // تحديد أفضل تخمين (أول نتيجة هي الأكثر دقة عادة)
+                    const bestGuess = alternatives[0];
+                    
+                    micButton.classList.remove('mic-active');
+                    micButton.disabled = false;
+                    
+                    // البحث عن أفضل تطابق
+                    let isMatch = false;
+                    let maxSimilarity = 0;
+                    
+                    for (const transcript of alternatives) {
+                        const normalizedTranscript = this.normalizeSpeechInput(transcript);
+                        const similarity = this.calculateSimilarity(normalizedTranscript, expected);
+                        if (similarity > maxSimilarity) maxSimilarity = similarity;
+                        
+                        if (this.isClosePronunciationMatch(normalizedTranscript, expected, alternatives)) {
+                            isMatch = true;
+                            break;
+                        }
+                    }
+
+                    const speechAliases = {
+                        air: ['air', 'heir', 'ear'],
+                        ant: ['ant', 'and'],
+                        axe: ['axe', 'acts', 'ax'],
+                        art: ['art', 'heart'],
+                        bat: ['bat', 'bad', 'bet'],
+                        bag: ['bag', 'back', 'bug'],
+                        bed: ['bed', 'bad', 'bet', 'bid'],
+                        bus: ['bus', 'boss', 'buzz'],
+                        box: ['box', 'bucks']
+                    };
+                    if (!isMatch && speechAliases[expected]) {
+                        isMatch = alternatives.some(transcript => speechAliases[expected].includes(this.normalizeSpeechInput(transcript)));
+                    }
+                    
+                    if (isMatch) {
+                        if (inputField) {
+                            inputField.value = expectedWord;
+                            inputField.classList.add('correct');
+                            inputField.classList.remove('incorrect');
+                            
+                            // تحديث بيانات التقدم
+                            const letter = this.progress.currentLetter;
+                            const letterProgress = this.ensureLetterRecord(letter);
+                            letterProgress.exercises.words[expectedWord] = expectedWord;
+
+                            // إضافة علامة "مجتاز"
+                            const container = inputField.parentElement;
+                            let badge = container.querySelector('.passed-badge');
+                            if (!badge) {
+                                badge = document.createElement('span');
+                                badge.className = 'passed-badge';
+                                badge.textContent = '✅ مجتاز';
+                                badge.style.color = '#22c55e';
+                                badge.style.fontWeight = 'bold';
+                                badge.style.marginRight = '10px';
+                                badge.style.fontSize = '14px';
+                                badge.style.animation = 'fadeIn 0.5s ease';
+                                container.appendChild(badge);
+                            }
+                            
+                            // تلوين خلفية المربع بالأخضر
+                            inputField.style.backgroundColor = '#dcfce7';
+                            inputField.style.borderColor = '#22c55e';
+                            
+                            this.updateAndCommitScores();
+                        }
+
+                        micButton.textContent = '✅';
+                        this.markWordCardPronunciationCorrect(micButton, expectedWord);
+                        this.showMicStatus('🎉 نطق ممتاز!', false);
+                        this.soundManager.playSound('success');
+                        
+                        setTimeout(() => {
+                            micButton.textContent = '🎤';
+                            this.hideMicStatus();
+                        }, 2000);
+                        
+                        await this.speakText(expectedWord);
+                    } else {
+                        micButton.textContent = '❌';
+                        // عرض الكلمة التي تم سماعها لمساعدة المستخدم
+                        this.showMicStatus(`سمعت: "${bestGuess}" - حاول مرة أخرى: ${expectedWord}`, true);
+                        this.soundManager.playSound('error');
+                        
+                        setTimeout(() => {
+                            micButton.textContent = '🎤';
+                            this.hideMicStatus();
+                        }, 4000);
+                        
+                        await this.speakText(expectedWord);
+                    }
+                };
+                
+                recognition.onerror = (event) => {
+                    clearTimeout(startupTimeout);
+                    clearTimeout(recordingTimeout);
+                    if (startupTimedOut && event.error === 'aborted') return;
+                    // A superseded session must never repaint the UI of the newer one.
+                    if (!isCurrentSession()) return;
+                    resetMicButton();
+                    this.isListening = false;
+
+                    // Developer-facing detail only; no transcript, no account data.
+                    console.warn('[LettersApp][SpeechRecognition]', {
+                        error: event.error,
+                        attempt,
+                        lang: recognition.lang
+                    });
+
+                    if (attempt < 1 && ['no-speech'].includes(event.error)) {
+                        this.showMicStatus('🎤 لم ألتقط الصوت بوضوح، أعيد المحاولة الآن...', false);
+                        window.setTimeout(() => {
+                            // Only retry if no newer tap has taken over meanwhile.
+                            if (!isCurrentSession()) return;
+                            this.startSpeechRecognitionForWord(expectedWord, micButton, inputField, attempt + 1);
+                        }, 350);
+                        return;
+                    }
+
+                    if (event.error === 'no-speech') {
+                        this.showMicStatus('⚠️ لم يتم سماع الصوت، حاول التحدث بصوت أعلى 🔊', true);
+                    } else if (event.error === 'not-allowed' || event.error === 'permission-denied') {
+                        this.micPermissionGranted = false;
+                        this.showMicStatus('❌ المتصفح منع المايك. افتح إعدادات الموقع واسمح بالميكروفون.', true);
+                    } else if (event.error === 'service-not-allowed') {
+                        this.micPermissionGranted = false;
+                        this.showMicStatus('❌ خدمة التعرف على الصوت غير مسموحة في هذا المتصفح. جرّب Chrome أو Edge.', true);
+                    } else if (event.error === 'audio-capture') {
+                        this.showMicStatus('❌ لا يوجد ميكروفون متاح', true);
+                    } else if (event.error === 'network') {
+                        this.showMicStatus('⚠️ المايك نفسه مسموح، لكن خدمة التعرف على الصوت في المتصفح لم تتصل. تأكد من الإنترنت واستخدم Chrome أو Edge ثم حاول مرة ثانية.', true);
+                    } else if (event.error === 'language-not-supported') {
+                        this.showMicStatus('⚠️ لغة النطق غير مدعومة في هذا المتصفح. جرّب Chrome أو Edge.', true);
+                    } else if (event.error === 'aborted') {
+                        this.showMicStatus('⚠️ توقف الاستماع. اضغط المايك وحاول مرة ثانية.', true);
+                    } else {
+                        this.showMicStatus('⚠️ لم أتعرف على الصوت. حاول مرة ثانية بهدوء.', true);
+                    }
+
+                    setTimeout(() => this.hideMicStatus(), 3000);
+                };
+                
+                try {
+                    this.isListening = false;
+                    try { if (this.soundManager) this.soundManager.stopAll(); } catch (e) {} recognition.start();
+                } catch (error) {
+                    clearTimeout(startupTimeout);
+                    clearTimeout(recordingTimeout);
+                    this.isListening = false;
+                    resetMicButton();
+                    const startMessage = error?.name === 'InvalidStateError'
+                        ? '⚠️ المايك مشغول الآن. انتظر ثانية ثم حاول مرة أخرى.'
+                        : '❌ عذرًا، لا يمكن تشغيل الميكروفون';
+                    this.showMicStatus(startMessage, true);
+                    setTimeout(() => this.hideMicStatus(), 3000);
+                }
+            }
+            
+            normalizeSpeechInput(value) {
+                return String(value || '')
+                    .toLowerCase()
+                    .replace(/[^a-z\s]/g, ' ')
+                    .replace(/\s+/g, ' ')
+                    .trim();
+            }
+
+            isClosePronunciationMatch(transcript, expectedWord, alternatives = []) {
+                const expected = this.normalizeSpeechInput(expectedWord).replace(/\s+/g, '');
+                if (!expected) return false;
+
+                const candidates = [transcript, ...alternatives]
+                    .map(item => this.normalizeSpeechInput(item))
+                    .filter(Boolean);
+
+                return candidates.some(candidate => {
+                    const tokens = candidate.split(/\s+/).filter(Boolean);
+                    const compact = tokens.join('');
+                    const allParts = [compact, ...tokens].filter(Boolean);
+
+                    return allParts.some(part => {
+                        if (part === expected || part.includes(expected) || expected.includes(part)) return true;
+                        const distance = this.levenshteinDistance(part, expected);
+                        const similarity = this.calculateSimilarity(part, expected);
+                        const sameFirstSound = part.charAt(0) === expected.charAt(0);
+                        const allowedDistance = Math.max(1, Math.ceil(expected.length * 0.4));
+                        if (distance <= allowedDistance && similarity >= 0.5) return true;
+                        return expected.length <= 3 && sameFirstSound && Math.abs(part.length - expected.length) <= 1 && distance <= 2;
+                    });
+                });
+            }
+
+            calculateSimilarity(str1, str2) {
+                const longer = str1.length > str2.length ? str1 : str2;
+                const shorter = str1.length > str2.length ? str2 : str1;
+                
+                if (longer.length === 0) return 1.0;
+                
+                const distance = this.levenshteinDistance(longer, shorter);
+                return (longer.length - distance) / longer.length;
+            }
+            
+            levenshteinDistance(str1, str2) {
+                const matrix = [];
+                
+                for (let i = 0; i <= str2.length; i++) {
+                    matrix[i] = [i];
+                }
+                
+                for (let j = 0; j <= str1.length; j++) {
+                    matrix[0][j] = j;
+                }
+                
+                for (let i = 1; i <= str2.length; i++) {
+                    for (let j = 1; j <= str1.length; j++) {
+                        const cost = str1.charAt(j - 1) === str2.charAt(i - 1) ? 0 : 1;
+                        matrix[i][j] = Math.min(
+                            matrix[i - 1][j] + 1,
+                            matrix[i][j - 1] + 1,
+                            matrix[i - 1][j - 1] + cost
+                        );
+                    }
+                }
+                
+                return matrix[str2.length][str1.length];
+            }
+            
+            // دالة بديلة للاستماع في حالة عدم وجود startSpeechRecognitionForWord
+            async listenForWord(expectedWord, micButton, callback = null) {
+                if (this.startSpeechRecognitionForWord) {
+                    // إذا تم تمرير callback، نقوم بتعديل السلوك لاستخدامه
+                    if (callback) {
+                        // نحتفظ بالدالة الأصلية
+                        const originalOnResult = this.speechRecognition ? this.speechRecognition.onresult : null;
+                        
+                        // نستدعي الدالة الرئيسية
+                        await this.startSpeechRecognitionForWord(expectedWord, micButton);
+                        
+                        // إذا كان لدينا speechRecognition، نضيف الـ callback للنتيجة
+                        if (this.speechRecognition) {
+                            const standardOnResult = this.speechRecognition.onresult;
+                            this.speechRecognition.onresult = async (event) => {
+                                // نستدعي المعالج القياسي أولاً للحصول على التأثيرات البصرية والصوتية
+                                if (standardOnResult) await standardOnResult(event);
+                                
+                                // ثم نستدعي الـ callback مع النص المكتشف
+                                const transcript = event.results[0][0].transcript.trim().toLowerCase();
+                                callback(transcript);
+                            };
+                        }
+                    } else {
+                        await this.startSpeechRecognitionForWord(expectedWord, micButton);
+                    }
+                } else {
+                    console.error("Speech recognition function not found");
+                    this.showToast("خطأ في نظام التعرف على الصوت", 3000);
+                }
+            }
+
+            previousLetter() {
+                if (this.currentLetterIndex > 0) {
+                    this.loadLetter(this.currentLetterIndex - 1);
+                }
+            }
+            
+            finishLetter() {
+                const currentLetter = LETTERS[this.currentLetterIndex];
+                this.updateLetterExerciseProgress(currentLetter);
+                const latestEntry = this.ensureLetterRecord(currentLetter);
+
+                if (latestEntry.exercisesCompleted !== true) {
+                    this.showToast('\u0623\u0643\u0645\u0644 \u062c\u0645\u064a\u0639 \u062a\u0645\u0627\u0631\u064a\u0646 \u0627\u0644\u062d\u0631\u0641 (\u0627\u0644\u0643\u062a\u0627\u0628\u0629\u060c \u0627\u0644\u0643\u0644\u0645\u0627\u062a\u060c \u0627\u0644\u0627\u062e\u062a\u0628\u0627\u0631) \u0642\u0628\u0644 \u0627\u0644\u0627\u0646\u062a\u0642\u0627\u0644!', 4000);
+                    return;
+                }
+
+                if ((latestEntry.score || 0) < this.REQUIRED_SCORE) {
+                    this.showToast(`\u062a\u062d\u062a\u0627\u062c \u0625\u0644\u0649 \u062f\u0631\u062c\u0629 ${this.REQUIRED_SCORE} \u0639\u0644\u0649 \u0627\u0644\u0623\u0642\u0644 \u0641\u064a \u0627\u0644\u062a\u0645\u0627\u0631\u064a\u0646. \u062f\u0631\u062c\u062a\u0643 \u0627\u0644\u062d\u0627\u0644\u064a\u0629: ${latestEntry.score || 0}`, 4000);
+                    return;
+                }
+
+                this.soundManager.playSound('success');
+                this.launchBalloonsCelebration();
+
+                this.markLetterCompleted(currentLetter);
+                this.renderLettersNav();
+                this.renderAchievements();
+
+                this.motivationTitle.textContent = '\uD83C\uDFAE \u0623\u0644\u0639\u0627\u0628 \u0625\u0636\u0627\u0641\u064a\u0629 \u0644\u0644\u062a\u062f\u0631\u064a\u0628';
+                this.motivationSubtitle.textContent = '\u0627\u0644\u0623\u0644\u0639\u0627\u0628 \u0627\u062e\u062a\u064a\u0627\u0631\u064a\u0629 \u0644\u0644\u062a\u062f\u0631\u064a\u0628 \u0648\u0644\u0627 \u062a\u0645\u0646\u0639 \u0641\u062a\u062d \u0627\u0644\u062d\u0631\u0641 \u0627\u0644\u062a\u0627\u0644\u064a.';
+                this.motivationQuote.textContent = '\u064a\u0645\u0643\u0646\u0643 \u0627\u0644\u0644\u0639\u0628 \u0644\u0644\u062a\u062f\u0631\u064a\u0628 \u0648\u0627\u0644\u0645\u062a\u0639\u0629\u060c \u0623\u0648 \u0645\u062a\u0627\u0628\u0639\u0629 \u0627\u0644\u062d\u0631\u0641 \u0627\u0644\u062a\u0627\u0644\u064a \u0645\u0628\u0627\u0634\u0631\u0629.';
+                this.showToast('\u0623\u062d\u0633\u0646\u062a! \u062a\u0645 \u0641\u062a\u062d \u0627\u0644\u062d\u0631\u0641 \u0627\u0644\u062a\u0627\u0644\u064a\u060c \u0648\u0627\u0644\u0623\u0644\u0639\u0627\u0628 \u0627\u062e\u062a\u064a\u0627\u0631\u064a\u0629 \u0644\u0644\u062a\u062f\u0631\u064a\u0628.', 3000, 'success');
+
+                const nextIndex = this.currentLetterIndex + 1;
+                if (nextIndex < LETTERS.length) {
+                    const nextLetter = LETTERS[nextIndex];
+                    if (this.isLetterAvailableForPlan(nextLetter)) {
+                        const nextEntry = this.ensureLetterRecord(nextLetter);
+                        if (!nextEntry.unlocked) {
+                            nextEntry.unlocked = true;
+                            this.commitProgressUpdate();
+                        }
+                        this.renderLettersNav();
+                        this.setupLetterJumpMenu();
+                    }
+                }
+
+                if (this.showLetterCompletion) {
+                    this.showLetterCompletion(currentLetter, latestEntry);
+                } else {
+                    this.showParentReport(currentLetter, latestEntry);
+                }
+            }
+
+            showMotivationModal(totalScore) {
+                const letter = LETTERS[this.currentLetterIndex];
+                const studentName = this.studentName || 'البطل';
+                
+                const fireQuotes = [
+                    `🔥 ${studentName}، أنت نار في التعلم! ماشاء الله!`,
+                    `🚀 ${studentName} يصعد إلى القمة بسرعة الصاروخ! رهيب!`,
+                    `👑 ملك/ملكة الحروف هو/هي ${studentName}! للأبد!`,
+                    `💫 براعة ${studentName} لا مثيل لها! انطلق وحلّق!`,
+                    `🌟 ${studentName} يلمع كالنجوم في سماء التعلم! سبحان الله!`,
+                    `🏆 ${studentName} يحصد الجوائز واحدة تلو الأخرى! برافو!`,
+                    `⚡ ${studentName} سريع التعلم كالبرق! فلاش!`,
+                    `🎯 ${studentName} يصيب الهدف في كل مرة! بولز آي!`
+                ];
+                
+                const scoreQuotes = totalScore >= 30 ? [
+                    `مذهل! ${studentName} حقق ${totalScore}/${this.MAX_WRITING_SCORE + (LETTER_DATA[letter]?.words.length || 6) + (LETTER_DATA[letter]?.quiz.length || 6)}! سوبر سوبر!`,
+                    `إتقان كامل! ${studentName} ممتاز! واو واو!`,
+                    `أداء خارق! ${studentName} في القمة! أميزينج!`
+                ] : totalScore >= 25 ? [
+                    `رائع! ${studentName} يحقق نتائج ممتازة! غريت!`,
+                    `إنجاز كبير! ${studentName} يتقدم بثبات! إكسلينت!`,
+                    `ممتاز! ${studentName} على الطريق الصحيح! فانتاستيك!`
+                ] : [
+                    `جيد جداً! ${studentName} يكمل المهمة بنجاح! غود جوب!`,
+                    `مثابرة رائعة! ${studentName} يستمر في التقدم! ويل دان!`,
+                    `إنجاز مشرف! ${studentName} يبذل جهداً كبيراً! آوتستاندينج!`
+                ];
+                
+                const randomFireQuote = fireQuotes[Math.floor(Math.random() * fireQuotes.length)];
+                const randomScoreQuote = scoreQuotes[Math.floor(Math.random() * scoreQuotes.length)];
+                
+                this.motivationTitle.textContent = "سلمت يابطل! ✨";
+                this.motivationSubtitle.textContent = `لقد أتممت تعلم الحرف ${letter} بنجاح - ${randomScoreQuote}`;
+                
+                const wisdomQuotes = [
+                    "من جد وجد، ومن زرع حصد. استمر في التقدم!",
+                    "العلم نور، والجهل ظلام. أنت تنير عقلك بالمعرفة!",
+                    "كل حرف تتعلمه هو خطوة جديدة نحو إتقان اللغة الإنجليزية!",
+                    "أنت مبدع! استمر في التعلم وسوف تصل إلى القمة!",
+                    "الإصرار والعزيمة هما سر النجاح. أنت على الطريق الصحيح!",
+                    "النجاح هو مجموع الجهود الصغيرة المتكررة يومياً. أنت تفعلها بشكل رائع!",
+                    "كلما تعلمت أكثر، كلما أصبحت أكثر ثقة. أنت رائع!",
+                    "أنت بطل حقيقي، استمر في التألق! واو!",
+                    "ذكاؤك يضيء الطريق، أحسنت! بريلينت!",
+                    "كل خطوة صغيرة تقربك من الحلم الكبير!",
+                    "أنت تصنع مستقبلك بيدك، استمر!",
+                    "فخورون بك جداً، يا بطل!",
+                    "أنت تستحق كل التقدير على مجهودك الرائع!",
+                    "لا تتوقف أبداً عن التعلم، فأنت تملك عقلاً ذهبياً!"
+                ];
+                
+                const randomQuote = wisdomQuotes[Math.floor(Math.random() * wisdomQuotes.length)];
+                this.motivationQuote.textContent = `${randomFireQuote}\n${randomQuote}`;
+                
+                this.motivationModal.style.display = 'flex';
+                this.soundManager.playSound('win');
+
+                // رسائل تشجيعية محسنة بالإنجليزية
+                const superEnglishPhrases = [
+                    "Fantastic job!",
+                    "You are amazing!", 
+                    "Excellent work!",
+                    "Outstanding!",
+                    "Brilliant!",
+                    "Keep it up, superstar!",
+                    "You are a champion!",
+                    "Well done, genius!",
+                    "Marvelous!",
+                    "You rock!",
+                    "Awesome work!",
+                    "You are incredible!"
+                ];
+                const randomEnglishPhrase = superEnglishPhrases[Math.floor(Math.random() * superEnglishPhrases.length)];
+                
+                // تأخير بسيط للسماح لصوت الفوز بالانتهاء جزئياً
+                setTimeout(() => {
+                    this.soundManager.speak(randomEnglishPhrase);
+                }, 1500);
+            }
+            
+            showGames() {
+                this.motivationModal.style.display = 'none';
+                this.showGameSelection();
+            }
+            
+            showGameSelection() {
+                this.motivationModal.style.display = 'flex';
+                const optionalNote = document.getElementById('optionalGamesNote');
+                if (optionalNote) {
+                    optionalNote.innerHTML = '<strong>ألعاب التدريب</strong><span>المتاح هنا لعبتان فقط: لعبة الذاكرة وتوصيل الكلمات.</span>';
+                }
+                
+                // Update game cards status
+                const currentLetter = LETTERS[this.currentLetterIndex];
+                const passedGames = this.passedGames[currentLetter] || [];
+                const cards = this.gamesGrid.querySelectorAll('.game-card');
+                
+                cards.forEach(card => {
+                    const gameType = card.dataset.game;
+                    let badge = card.querySelector('.mandatory-badge');
+                    const isMandatory = this.mandatoryGames.includes(gameType);
+                    
+                    if (isMandatory) {
+                        if (!badge) {
+                            badge = document.createElement('div');
+                            badge.className = 'mandatory-badge';
+                            card.appendChild(badge);
+                        }
+
+                        if (passedGames.includes(gameType)) {
+                            card.classList.add('completed');
+                            badge.textContent = 'تم ✅';
+                            badge.style.background = '#22c55e';
+                        } else {
+                            card.classList.remove('completed');
+                            badge.textContent = 'مطلوب';
+                            badge.style.background = '#ef4444';
+                        }
+                    } else {
+                        if (badge) {
+                            badge.remove();
+                        }
+                        card.classList.remove('completed');
+                    }
+                });
+
+                // تحديث زر الحرف التالي
+                const nextLetterBtn = document.getElementById('nextLetter');
+                const allRequiredGamesDone = true;
+                
+                if (allRequiredGamesDone) {
+                    nextLetterBtn.style.opacity = '1';
+                    nextLetterBtn.style.cursor = 'pointer';
+                    nextLetterBtn.innerHTML = '<span>➡️</span> الحرف التالي';
+                    nextLetterBtn.title = "انتقل للحرف التالي";
+                } else {
+                    nextLetterBtn.style.opacity = '0.5';
+                    nextLetterBtn.style.cursor = 'not-allowed';
+                    nextLetterBtn.innerHTML = '<span>🔒</span> الحرف التالي';
+                    nextLetterBtn.title = "أكمل الألعاب المطلوبة أولاً";
+                }
+            }
+            
+            nextLetter() {
+                this.motivationModal.style.display = 'none';
+                
+                const nextIndex = this.currentLetterIndex + 1;
+                if (nextIndex < LETTERS.length) {
+                    const currentLetter = LETTERS[this.currentLetterIndex];
+                    const nextLetter = LETTERS[nextIndex];
+                    
+                    // التحقق من إكمال الألعاب المطلوبة لفتح الحرف التالي
+                    if (!this.isLetterAvailableForPlan(nextLetter)) {
+                        this.showLetterPaywall(nextLetter);
+                        return;
+                    }
+
+                    const entry = this.ensureLetterRecord(currentLetter);
+                    const games = entry.games || {};
+                    
+                    // تحديد الألعاب المتبقية
+                    const missingGames = [];
+                    
+                    if (missingGames.length > 0) {
+                        // تحضير رسالة مفصلة بالألعاب الناقصة
+                        const missingNames = missingGames.map(g => this.getGameName(g)).join(' و ');
+                        
+                        // إذا لم تكتمل الألعاب، أظهر رسالة وأعد فتح النافذة
+                        this.showToast(`عذراً! يجب إكمال الألعاب التالية أولاً: ${missingNames}`, 5000, 'error');
+                        this.showGameSelection();
+                        return;
+                    }
+                    
+                    // إذا اكتملت الشروط
+                    this.unlockLetter(nextLetter);
+                    this.goToLetter(nextLetter);
+                } else {
+                    this.showCertificate();
+                }
+            }
+            
+            // ============ تحسين إدارة الألعاب ============
+            
+            // Performance-optimized game loop
+            runOptimizedGameLoop(gameLoopFunction) {
+                // Each frame's id replaces the previous one. Previously every id was
+                // added and none removed, so the set grew by ~60 entries per second
+                // for as long as a game ran.
+                let previousAnimationId = null;
+
+                const track = (animationId) => {
+                    if (previousAnimationId !== null) {
+                        this.activeAnimations.delete(previousAnimationId);
+                    }
+                    previousAnimationId = animationId;
+                    this.activeAnimations.add(animationId);
+                };
+
+                const animate = (currentTime) => {
+                    if (!this.gameRunning) {
+                        this.activeAnimations.delete(previousAnimationId);
+                        return;
+                    }
+
+                    if (currentTime - this.lastFrameTime >= this.frameInterval) {
+                        gameLoopFunction();
+                        this.lastFrameTime = currentTime;
+                    }
+
+                    track(requestAnimationFrame(animate));
+                };
+
+                track(requestAnimationFrame(animate));
+            }
+            
+            // Clean up all game resources
+            cleanupGameResources() {
+                this.gameRunning = false;
+                
+                // Cancel all active animations
+                if (this.activeAnimations) {
+                    this.activeAnimations.forEach(id => {
+                        try {
+                            cancelAnimationFrame(id);
+                        } catch (e) {
+                            console.warn('Error canceling animation frame:', e);
+                        }
+                    });
+                    this.activeAnimations.clear();
+                }
+                
+                // Clear intervals and timeouts
+                if (this.gameInterval) {
+                    clearInterval(this.gameInterval);
+                    this.gameInterval = null;
+                }
+                
+                if (this.gameAnimationFrame) {
+                    cancelAnimationFrame(this.gameAnimationFrame);
+                    this.gameAnimationFrame = null;
+                }
+                
+                // Clear any pending timeouts
+                if (this.gameTimeouts && this.gameTimeouts.length > 0) {
+                    this.gameTimeouts.forEach(timeout => clearTimeout(timeout));
+                    this.gameTimeouts = [];
+                }
+                
+                // Remove event listeners
+                this.removeAllGameEventListeners();
+                
+                // Remove resize listener
+                if (this.resizeHandler) {
+                    window.removeEventListener('resize', this.resizeHandler);
+                    this.resizeHandler = null;
+                }
+                
+                // Remove hidden input if exists
+                if (this.hiddenInput) {
+                    if (this.hiddenInput.parentNode) {
+                        this.hiddenInput.parentNode.removeChild(this.hiddenInput);
+                    }
+                    this.hiddenInput = null;
+                }
+                
+                // Reset celebration flags
+                this.isCelebrating = false;
+                this.isMiniCelebrating = false;
+                this.isConfettiActive = false;
+            }
+            
+            removeAllGameEventListeners() {
+                if (this.currentClickHandler) {
+                    document.getElementById('game-canvas')?.removeEventListener('click', this.currentClickHandler);
+                    this.currentClickHandler = null;
+                }
+                
+                if (this.currentKeyHandlers) {
+                    if (this.currentKeyHandlers.keydown) {
+                        document.removeEventListener('keydown', this.currentKeyHandlers.keydown);
+                    }
+                    if (this.currentKeyHandlers.keyup) {
+                        document.removeEventListener('keyup', this.currentKeyHandlers.keyup);
+                    }
+                    this.currentKeyHandlers = null;
+                }
+            }
+            
+            startGame(gameType) {
+                // Clean up any previous game
+                this.cleanupGameResources();
+                
+                // التحقق من إنهاء التمارين
+                const currentLetter = LETTERS[this.currentLetterIndex];
+                this.updateLetterExerciseProgress(currentLetter);
+                const entry = this.ensureLetterRecord(currentLetter);
+                const exercisesReady = entry.exercisesCompleted === true || this.areExercisesCompleted();
+
+                if (!exercisesReady) {
+                    this.showToast('عذراً، يجب إكمال تمارين الحرف (الكتابة، الكلمات، الاختبار) قبل اللعب!');
+                    return;
+                }
+
+                this.gameRunning = true;
+                this.motivationModal.style.display = 'none';
+                this.gameModal.style.display = 'flex';
+                this.currentGame = gameType;
+                this.gameTimeLeft = 60; // Increased time for better gameplay
+                this.gameTimerEl.textContent = this.gameTimeLeft;
+                this.gameScoreEl.textContent = '0';
+                
+                this.gameStats = {
+                    successCount: 0,
+                    totalAttempts: 0,
+                    accuracy: 0,
+                    difficulty: Math.floor(this.completedLetters.length / 5) + 1,
+                    gameWins: 0
+                };
+                
+                this.updateGameStats();
+                this.setupGameControls();
+                
+                // Add resize listener
+                this.resizeHandler = this.handleResize.bind(this);
+                window.addEventListener('resize', this.resizeHandler);
+                
+                const instructions = {
+
+
+                    'shooting': '🎯 استخدم الأسهم لتحريك المدفع ومسافة للرمي. اصطد الأسماك التي تحمل الحرف A أو a!',
+                    'balloons': '🎈 اضغط على البالونات التي تحمل الحرف A أو a وتجنب البالونات الأخرى!',
+                    'memory': '🧠 ابحث عن البطاقات المتطابقة التي تحمل الحرف A و a!',
+                    'wordsearch': '🔍 ابحث عن الكلمات التي تبدأ بالحرف A في الشبكة!',
+                    'typing': '⌨️ اكتب الحرف A أو a الذي يظهر بسرعة قبل نفاد الوقت!',
+                    'match': '🔤 اسحب الحرف A أو a إلى الكلمات المناسبة التي تبدأ بها!'
+                };
+                
+                this.gameInstructions.textContent = instructions[gameType] || 'استمتع باللعبة!';
+                this.gameTitle.textContent = `🎮 ${this.getGameName(gameType)} - الحرف ${LETTERS[this.currentLetterIndex]}`;
+                
+                this.initGame(gameType);
+                
+                this.gameInterval = setInterval(() => {
+                    if (!this.isPaused) {
+                        this.gameTimeLeft--;
+                        this.gameTimerEl.textContent = this.gameTimeLeft;
+                        
+                        if (this.gameTimeLeft <= 0) {
+                            if (this.currentGame === 'shooting') {
+                                this.showWinGame();
+                            } else {
+                                this.endGame();
+                            }
+                        }
+                    }
+                }, 1000);
+            }
+            
+            getGameName(gameType) {
+                const names = {
+
+
+                    'shooting': 'اصطياد الحرف',
+                    'balloons': 'لعبة البالونات',
+                    'memory': 'لعبة الذاكرة',
+                    'wordsearch': 'لعبة البحث',
+                    'typing': 'الكتابة السريعة',
+                    'match': 'لعبة المطابقة'
+                };
+                return names[gameType] || 'لعبة';
+            }
+            
+            setupGameControls() {
+                if (this.currentGame === 'shooting') {
+                    this.touchControlsEl.style.display = 'flex';
+                } else {
+                    this.touchControlsEl.style.display = 'none';
+                }
+            }
+            
+            updateGameStats() {
+                this.successCountEl.textContent = this.gameStats.successCount;
+                this.difficultyLevelEl.textContent = this.gameStats.difficulty;
+                
+                if (this.gameStats.totalAttempts > 0) {
+                    this.gameStats.accuracy = Math.round((this.gameStats.successCount / this.gameStats.totalAttempts) * 100);
+                } else {
+                    this.gameStats.accuracy = 0;
+                }
+                
+                this.accuracyEl.textContent = `${this.gameStats.accuracy}%`;
+            }
+            
+            handleResize() {
+                if (this.gameCanvas && this.gameCanvas.parentElement) {
+                    const container = this.gameCanvas.parentElement;
+                    this.gameCanvas.width = container.clientWidth;
+                    this.gameCanvas.height = container.clientHeight;
+                }
+
+                // Add mobile class for CSS targeting
+                if (window.innerWidth <= 900) {
+                    document.body.classList.add('mobile-view');
+                } else {
+                    document.body.classList.remove('mobile-view');
+                }
+            }
+            
+            initGame(gameType) {
+                const canvas = this.gameCanvas;
+                const ctx = canvas.getContext('2d');
+                
+                const container = canvas.parentElement;
+                canvas.width = container.clientWidth;
+                canvas.height = container.clientHeight;
+                
+                if (this.gameAnimationFrame) {
+                    cancelAnimationFrame(this.gameAnimationFrame);
+                }
+                
+                this.gameObjects = [];
+                
+                switch(gameType) {
+
+
+                    case 'shooting':
+                        this.initShootingGame(ctx, canvas);
+                        break;
+                    case 'balloons':
+                        this.initBalloonsGame(ctx, canvas);
+                        break;
+                    case 'memory':
+                        this.initMemoryGame(ctx, canvas);
+                        break;
+                    case 'wordsearch':
+                        this.initWordSearchGame(ctx, canvas);
+                        break;
+                    case 'typing':
+                        this.initTypingGame(ctx, canvas);
+                        break;
+                    case 'match':
+                        this.initMatchGame(ctx, canvas);
+                        break;
+                    default:
+                        this.initDefaultGame(ctx, canvas);
+                }
+            }
+            
+            endGame() {
+                clearInterval(this.gameInterval);
+
+                const canvas = this.gameCanvas;
+                const ctx = canvas.getContext('2d');
+
+                ctx.clearRect(0, 0, canvas.width, canvas.height);
+
+                const gradient = ctx.createLinearGradient(0, 0, 0, canvas.height);
+                gradient.addColorStop(0, '#4cc9f0');
+                gradient.addColorStop(1, '#4895ef');
+                ctx.fillStyle = gradient;
+                ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+                ctx.fillStyle = 'white';
+                ctx.font = 'bold 36px Arial';
+                ctx.textAlign = 'center';
+                ctx.textBaseline = 'middle';
+                ctx.fillText('انتهى الوقت!', canvas.width / 2, canvas.height / 2 - 30);
+                ctx.font = '24px Arial';
+                ctx.fillText(`النقاط النهائية: ${this.gameScoreEl.textContent}`, canvas.width / 2, canvas.height / 2 + 30);
+
+                const finalScore = parseInt(this.gameScoreEl.textContent);
+                let message = 'حاول مرة أخرى!';
+                if (finalScore >= 50) message = 'مذهل! أداء رائع!';
+                else if (finalScore >= 30) message = 'جيد جداً!';
+                else if (finalScore >= 15) message = 'ليس سيئاً!';
+
+                ctx.font = '20px Arial';
+                ctx.fillText(message, canvas.width / 2, canvas.height / 2 + 70);
+
+                this.soundManager.playSound('success');
+            }
+
+            closeGame() {
+                // Ensure cleanup happens
+                this.gameRunning = false;
+                this.isGameEnding = false;
+                
+                // Hide modals
+                this.gameModal.style.display = 'none';
+                this.winModal.style.display = 'none';
+                
+                // Comprehensive cleanup
+                this.cleanupGameResources();
+                
+                // Clear canvas
+                const canvas = this.gameCanvas;
+                const ctx = canvas.getContext('2d');
+                ctx.clearRect(0, 0, canvas.width, canvas.height);
+                
+                // Reset game state
+                this.currentGame = null;
+                this.gameObjects = [];
+                
+                this.isPaused = false;
+                this.pauseGameBtn.innerHTML = '<span>⏸️</span> إيقاف';
+                
+                // Force garbage collection hint
+                if (window.gc) {
+                    window.gc();
+                }
+            }
+            
+            togglePause() {
+                this.isPaused = !this.isPaused;
+                this.pauseGameBtn.innerHTML = this.isPaused ? 
+                    '<span>▶️</span> استمرار' : 
+                    '<span>⏸️</span> إيقاف';
+            }
+            
+            restartGame() {
+                const gameToRestart = this.currentGame;
+                this.closeGame();
+                setTimeout(() => {
+                    this.startGame(gameToRestart);
+                }, 100);
+            }
+            
+            playAgain() {
+                this.winModal.style.display = 'none';
+                this.restartGame();
+            }
+            
+            backToGames() {
+                this.winModal.style.display = 'none';
+                this.closeGame();
+                this.motivationModal.style.display = 'flex';
+            }
+            
+            setupScrollTop() {
+                window.addEventListener('scroll', () => {
+                    if (window.pageYOffset > 300) {
+                        this.scrollTopBtn.classList.add('visible');
+                    } else {
+                        this.scrollTopBtn.classList.remove('visible');
+                    }
+                });
+                
+                this.scrollTopBtn.addEventListener('click', () => {
+                    window.scrollTo({
+                        top: 0,
+                        behavior: 'smooth'
+                    });
+                });
+            }
+            
+            disableCopyPaste() {
+                document.addEventListener('contextmenu', (e) => {
+                    if (e.target.classList.contains('writing-box') || 
+                        e.target.classList.contains('word-input')) {
+                        e.preventDefault();
+                        this.showToast('لا يسمح بالنسخ في هذا التمرين', 2000);
+                    }
+                });
+                
+                document.addEventListener('dragstart', (e) => {
+                    if (e.target.classList.contains('writing-box') || 
+                        e.target.classList.contains('word-input')) {
+                        e.preventDefault();
+                    }
+                });
+            }
+            
+            disableCopyPasteForElement(element) {
+                element.addEventListener('copy', (e) => {
+                    e.preventDefault();
+                    this.showToast('لا يسمح بالنسخ في هذا التمرين', 2000);
+                });
+                
+                element.addEventListener('paste', (e) => {
+                    e.preventDefault();
+                    this.showToast('لا يسمح باللصق في هذا التمرين', 2000);
+                });
+                
+                element.addEventListener('cut', (e) => {
+                    e.preventDefault();
+                    this.showToast('لا يسمح بالقص في هذا التمرين', 2000);
+                });
+                
+                element.addEventListener('dragstart', (e) => {
+                    e.preventDefault();
+                });
+                
+                element.addEventListener('drop', (e) => {
+                    e.preventDefault();
+                    this.showToast('لا يسمح بالسحب والإفلات في هذا التمرين', 2000);
+                });
+            }
+        }
+
+        if (window.installLettersProgressSystem) {
+            window.installLettersProgressSystem(PhonicsGameLab);
+        }
+
+        if (window.installLetterCompletionScreen) {
+            window.installLetterCompletionScreen(PhonicsGameLab);
+        }
+
+        if (window.installDragWordGame) {
+            window.installDragWordGame(PhonicsGameLab);
+        }
+
+        if (window.installCertificateSystem) {
+            window.installCertificateSystem(PhonicsGameLab);
+        }
+
+        if (window.installLettersAssistantSystem) {
+            window.installLettersAssistantSystem(PhonicsGameLab);
+        }
+
+        if (window.installLettersMatchGame) {
+            window.installLettersMatchGame(PhonicsGameLab);
+        }
+
+        if (window.installLettersBalloonsGame) {
+            window.installLettersBalloonsGame(PhonicsGameLab);
+        }
+
+        if (window.installBirdTutor) {
+            window.installBirdTutor(PhonicsGameLab);
+        }
+
+        if (window.installLettersCanvasGames) {
+            window.installLettersCanvasGames(PhonicsGameLab);
+        }
+
+        if (window.installLettersCelebrations) {
+            window.installLettersCelebrations(PhonicsGameLab);
+        }
+
+        if (window.installLettersWorksheet) {
+            window.installLettersWorksheet(PhonicsGameLab);
+        }
+
+        if (window.installLettersParentReport) {
+            window.installLettersParentReport(PhonicsGameLab);
+        }
+
+        document.addEventListener('DOMContentLoaded', () => {
+            new PhonicsGameLab();
+            
+            // Setup scroll arrows for games grid
+            const gamesGrid = document.getElementById('gamesGrid');
+            const scrollUpBtn = document.getElementById('scrollUpBtn');
+            const scrollDownBtn = document.getElementById('scrollDownBtn');
+            
+            if (gamesGrid && scrollUpBtn && scrollDownBtn) {
+                // Scroll up
+                scrollUpBtn.addEventListener('click', () => {
+                    gamesGrid.scrollBy({
+                        top: -150, // Scroll up by 150px
+                        behavior: 'smooth'
+                    });
+                });
+                
+                // Scroll down
+                scrollDownBtn.addEventListener('click', () => {
+                    gamesGrid.scrollBy({
+                        top: 150, // Scroll down by 150px
+                        behavior: 'smooth'
+                    });
+                });
+                
+                // Update button states based on scroll position
+                const updateScrollButtons = () => {
+                    const scrollTop = gamesGrid.scrollTop;
+                    const scrollHeight = gamesGrid.scrollHeight;
+                    const clientHeight = gamesGrid.clientHeight;
+                    
+                    // Disable scroll up if at top
+                    scrollUpBtn.disabled = scrollTop <= 0;
+                    
+                    // Disable scroll down if at bottom
+                    scrollDownBtn.disabled = scrollTop + clientHeight >= scrollHeight - 5;
+                };
+                
+                // Initial check
+                updateScrollButtons();
+                
+                // Update on scroll
+                gamesGrid.addEventListener('scroll', updateScrollButtons);
+                
+                // Update on resize
+                window.addEventListener('resize', updateScrollButtons);
+            }
+            
+            // Improve game card click detection - prevent accidental taps
+            document.querySelectorAll('.game-card').forEach(card => {
+                let touchStartTime = 0;
+                let touchStartY = 0;
+                
+                card.addEventListener('touchstart', (e) => {
+                    touchStartTime = Date.now();
+                    touchStartY = e.touches[0].clientY;
+                }, { passive: true });
+                
+                card.addEventListener('touchend', (e) => {
+                    const touchDuration = Date.now() - touchStartTime;
+                    const touchEndY = e.changedTouches[0].clientY;
+                    const touchMoveDistance = Math.abs(touchEndY - touchStartY);
+                    
+                    // Only trigger if:
+                    // 1. Touch duration is reasonable (not too quick)
+                    // 2. Touch didn't move much (not a scroll)
+                    if (touchDuration > 50 && touchDuration < 500 && touchMoveDistance < 10) {
+                        // Valid tap - the default click handler will fire
+                    } else {
+                        // Invalid tap - prevent click
+                        e.preventDefault();
+                        e.stopPropagation();
+                    }
+                }, { passive: false });
+            });
+        });
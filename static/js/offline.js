@@ -0,0 +1,25 @@
+// Registers the offline worker (/sw.js) for the learning pages and asks it to
+// sync queued progress whenever the browser comes back online.
+(function () {
+    "use strict";
+
+    const script = document.currentScript;
+    if (!script || !("serviceWorker" in navigator)) {
+        return;
+    }
+
+    function flushQueuedProgress() {
+        navigator.serviceWorker.ready.then(registration => {
+            if (registration.active) {
+                registration.active.postMessage({ type: "flush-progress" });
+            }
+        });
+    }
+
+    window.addEventListener("load", () => {
+        navigator.serviceWorker.register(script.dataset.serviceWorker, { scope: "/" })
+            .then(flushQueuedProgress)
+            .catch(error => console.warn("Offline support is unavailable:", error));
+    });
+    window.addEventListener("online", flushQueuedProgress);
+})();
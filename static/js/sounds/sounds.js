@@ -0,0 +1,3891 @@
+const syllableRows = JSON.parse(document.getElementById("syllableRowsData").textContent);
+        const cvcWords = JSON.parse(document.getElementById("cvcWordsData").textContent);
+        const quizQuestions = JSON.parse(document.getElementById("quizQuestionsData").textContent);
+        const vowelLessons = JSON.parse(document.getElementById("vowelLessonsData").textContent);
+        const vowelActivities = JSON.parse(document.getElementById("vowelActivitiesData").textContent);
+        const soundPatternGroups = JSON.parse(document.getElementById("soundPatternsData").textContent);
+        const soundPatternActivities = JSON.parse(document.getElementById("soundPatternActivitiesData").textContent);
+        const pageUrls = JSON.parse(document.getElementById("soundsPageUrls").textContent);
+        const foundationVocabulary = JSON.parse(document.getElementById("foundationVocabularyData").textContent);
+        const levelTwoGrammarLessons = JSON.parse(document.getElementById("levelTwoGrammarData").textContent);
+        const serverProgress = JSON.parse(document.getElementById("soundProgressData").textContent);
+        const isAuthenticated = document.body.dataset.authenticated === "true";
+        const storageKey = "abcz-sound-practice-progress-v2";
+        const advancedStorageKey = "abcz-sound-advanced-preview-v1";
+        const vocabularyStorageKey = "abcz-vocab-foundation-progress-v1";
+        const grammarStorageKey = "abcz-level-two-grammar-progress-v1";
+        const localCompletedItems = JSON.parse(localStorage.getItem(storageKey) || "[]");
+        const localAdvancedPreview = JSON.parse(localStorage.getItem(advancedStorageKey) || "{}");
+        const localVocabularyProgress = JSON.parse(localStorage.getItem(vocabularyStorageKey) || "{}");
+        const localGrammarProgress = JSON.parse(localStorage.getItem(grammarStorageKey) || "{}");
+        const mergedCompletedItems = [...new Set([...(serverProgress.completed_items || []), ...localCompletedItems])];
+        const savedPatternProgress = serverProgress.last_payload?.pattern_progress || {};
+        let soundProgressSyncInFlight = false;
+        let lastSoundProgressPayloadHash = "";
+
+        const state = {
+            completed: new Set(mergedCompletedItems),
+            quizAttempts: serverProgress.quiz_attempts || 0,
+            quizCorrect: serverProgress.quiz_correct || 0,
+            micAttempts: serverProgress.mic_attempts || 0,
+            micSuccess: serverProgress.mic_success || 0,
+            worksheetDownloads: serverProgress.worksheet_downloads || 0,
+            practicedVowels: new Set(serverProgress.practiced_vowels || []),
+            vowelLessonsCompleted: serverProgress.vowel_lessons_completed || 0,
+            vowelQuizAttempts: serverProgress.vowel_quiz_attempts || 0,
+            vowelQuizCorrect: serverProgress.vowel_quiz_correct || 0,
+            vowelMicAttempts: serverProgress.vowel_microphone_attempts || 0,
+            vowelMicSuccess: serverProgress.vowel_microphone_success || 0,
+            lastVowelPracticed: serverProgress.last_vowel_practiced || "",
+            lastSpeechPayload: serverProgress.last_payload?.speech || null,
+            patternMicSuccess: {
+                digraphs: savedPatternProgress.digraph_mic_success || 0,
+                ending_sounds: savedPatternProgress.ending_sound_mic_success || 0,
+                trigraphs: savedPatternProgress.trigraph_mic_success || 0,
+                advanced_patterns: savedPatternProgress.advanced_pattern_mic_success || 0
+            },
+            patternMicAttempts: {
+                digraphs: savedPatternProgress.digraph_mic_attempts || 0,
+                ending_sounds: savedPatternProgress.ending_sound_mic_attempts || 0,
+                trigraphs: savedPatternProgress.trigraph_mic_attempts || 0,
+                advanced_patterns: savedPatternProgress.advanced_pattern_mic_attempts || 0
+            },
+            digraphQuizAttempts: savedPatternProgress.digraph_quiz_attempts || 0,
+            digraphQuizBestScore: savedPatternProgress.digraph_quiz_score || 0,
+            lastDigraph: savedPatternProgress.last_digraph || "",
+            trigraphQuizAttempts: savedPatternProgress.trigraph_quiz_attempts || 0,
+            trigraphQuizBestScore: savedPatternProgress.trigraph_quiz_score || 0,
+            lastTrigraph: savedPatternProgress.last_trigraph || "",
+            advancedPatternsSeen: new Set([...(savedPatternProgress.advanced_patterns_seen || []), ...(localAdvancedPreview.seen || [])]),
+            advancedPreviewGamesCompleted: new Set([...(savedPatternProgress.advanced_patterns_preview_games_completed || []), ...(localAdvancedPreview.games || [])]),
+            lastAdvancedPattern: savedPatternProgress.last_advanced_pattern || localAdvancedPreview.last || "",
+            pendingPatternDrag: null,
+            current: null,
+            quizIndex: 0,
+            micTarget: cvcWords[0]?.word || "cat"
+        };
+
+        const vocabularyState = {
+            activeCategory: localVocabularyProgress.last_vocab_category || foundationVocabulary[0]?.id || "colors",
+            activeAnimalGroup: localVocabularyProgress.last_animal_group || "pets",
+            activeFoodGroup: localVocabularyProgress.last_food_group || "fruits",
+            activeCalendarGroup: localVocabularyProgress.last_calendar_group || "days",
+            masteredWords: new Set(localVocabularyProgress.mastered_words || []),
+            reviewWords: new Set(localVocabularyProgress.review_words || []),
+            masteredAnimals: new Set(localVocabularyProgress.mastered_animals || []),
+            reviewAnimals: new Set(localVocabularyProgress.review_animals || []),
+            masteredFoods: new Set(localVocabularyProgress.mastered_foods || []),
+            reviewFoods: new Set(localVocabularyProgress.review_foods || []),
+            masteredCalendar: new Set(localVocabularyProgress.mastered_calendar || []),
+            reviewCalendar: new Set(localVocabularyProgress.review_calendar || []),
+            categoryScores: localVocabularyProgress.category_scores || {},
+            quizAttempts: localVocabularyProgress.vocab_quiz_attempts || 0,
+            micAttempts: localVocabularyProgress.vocab_mic_attempts || 0,
+            micSuccess: localVocabularyProgress.vocab_mic_success || 0,
+            animalQuizScore: localVocabularyProgress.animal_quiz_score || "",
+            animalQuizAttempts: localVocabularyProgress.animal_quiz_attempts || 0,
+            animalMicSuccess: localVocabularyProgress.animal_mic_success || 0,
+            animalStoryCompleted: Boolean(localVocabularyProgress.animal_story_completed),
+            foodQuizScore: localVocabularyProgress.food_quiz_score || "",
+            foodQuizAttempts: localVocabularyProgress.food_quiz_attempts || 0,
+            foodMicSuccess: localVocabularyProgress.food_mic_success || 0,
+            foodStoryCompleted: Boolean(localVocabularyProgress.food_story_completed),
+            calendarQuizScore: localVocabularyProgress.calendar_quiz_score || "",
+            calendarQuizAttempts: localVocabularyProgress.calendar_quiz_attempts || 0,
+            calendarMicSuccess: localVocabularyProgress.calendar_mic_success || 0,
+            calendarStoryCompleted: Boolean(localVocabularyProgress.calendar_story_completed),
+            lastQuizScore: localVocabularyProgress.last_quiz_score || "",
+            currentQuiz: [],
+            currentQuizMode: "category",
+            currentQuizCategory: ""
+        };
+
+        const grammarState = {
+            activeLesson: localGrammarProgress.last_lesson || levelTwoGrammarLessons[0]?.id || "demonstratives",
+            masteredLessons: new Set(localGrammarProgress.mastered_lessons || []),
+            reviewLessons: new Set(localGrammarProgress.review_lessons || []),
+            masteredItems: new Set(localGrammarProgress.mastered_items || []),
+            reviewItems: new Set(localGrammarProgress.review_items || []),
+            micAttempts: localGrammarProgress.mic_attempts || 0,
+            micSuccess: localGrammarProgress.mic_success || 0,
+            practiceAttempts: localGrammarProgress.practice_attempts || 0,
+            practiceCorrect: localGrammarProgress.practice_correct || 0
+        };
+
+        const els = {
+            syllablesBody: document.getElementById("syllablesBody"),
+            cvcGrid: document.getElementById("cvcGrid"),
+            activitiesGrid: document.getElementById("activitiesGrid"),
+            doneCount: document.getElementById("doneCount"),
+            wordCount: document.getElementById("wordCount"),
+            quizScore: document.getElementById("quizScore"),
+            micScore: document.getElementById("micScore"),
+            progressText: document.getElementById("progressText"),
+            progressFill: document.getElementById("progressFill"),
+            syncStatus: document.getElementById("syncStatus"),
+            heroSound: document.getElementById("heroSound"),
+            modal: document.getElementById("practiceModal"),
+            modalText: document.getElementById("modalText"),
+            modalHint: document.getElementById("modalHint"),
+            modalTitle: document.getElementById("modalTitle"),
+            modalFeedback: document.getElementById("modalFeedback"),
+            quizQuestion: document.getElementById("quizQuestion"),
+            quizOptions: document.getElementById("quizOptions"),
+            quizFeedback: document.getElementById("quizFeedback"),
+            micWords: document.getElementById("micWords"),
+            micTarget: document.getElementById("micTarget"),
+            micFeedback: document.getElementById("micFeedback"),
+            vowelMap: document.getElementById("vowelMap"),
+            vowelLessons: document.getElementById("vowelLessons"),
+            vowelActivities: document.getElementById("vowelActivities"),
+            vowelProgressFill: document.getElementById("vowelProgressFill"),
+            vowelProgressText: document.getElementById("vowelProgressText"),
+            lastVowelText: document.getElementById("lastVowelText"),
+            vowelBadges: document.getElementById("vowelBadges"),
+            vowelCertificate: document.getElementById("vowelCertificate"),
+            digraphGroups: document.getElementById("digraphGroups"),
+            digraphActivities: document.getElementById("digraphActivities"),
+            digraphFeedback: document.getElementById("digraphFeedback"),
+            digraphProgressTitle: document.getElementById("digraphProgressTitle"),
+            digraphProgressFill: document.getElementById("digraphProgressFill"),
+            digraphCompletedCount: document.getElementById("digraphCompletedCount"),
+            digraphQuizScore: document.getElementById("digraphQuizScore"),
+            digraphMicScore: document.getElementById("digraphMicScore"),
+            digraphCertificateStatus: document.getElementById("digraphCertificateStatus"),
+            digraphFinalQuestions: document.getElementById("digraphFinalQuestions"),
+            digraphFinalScore: document.getElementById("digraphFinalScore"),
+            digraphFinalFeedback: document.getElementById("digraphFinalFeedback"),
+            digraphCertificate: document.getElementById("digraphCertificate"),
+            digraphCertificateDetails: document.getElementById("digraphCertificateDetails"),
+            endingGroups: document.getElementById("endingGroups"),
+            endingActivities: document.getElementById("endingActivities"),
+            endingFeedback: document.getElementById("endingFeedback"),
+            trigraphGroups: document.getElementById("trigraphGroups"),
+            trigraphActivities: document.getElementById("trigraphActivities"),
+            trigraphFeedback: document.getElementById("trigraphFeedback"),
+            trigraphProgressTitle: document.getElementById("trigraphProgressTitle"),
+            trigraphProgressFill: document.getElementById("trigraphProgressFill"),
+            trigraphCompletedCount: document.getElementById("trigraphCompletedCount"),
+            trigraphQuizScore: document.getElementById("trigraphQuizScore"),
+            trigraphMicScore: document.getElementById("trigraphMicScore"),
+            trigraphCertificateStatus: document.getElementById("trigraphCertificateStatus"),
+            trigraphFinalQuestions: document.getElementById("trigraphFinalQuestions"),
+            trigraphFinalScore: document.getElementById("trigraphFinalScore"),
+            trigraphFinalFeedback: document.getElementById("trigraphFinalFeedback"),
+            trigraphCertificate: document.getElementById("trigraphCertificate"),
+            trigraphCertificateDetails: document.getElementById("trigraphCertificateDetails"),
+            advancedGroups: document.getElementById("advancedGroups"),
+            advancedActivities: document.getElementById("advancedActivities"),
+            advancedFeedback: document.getElementById("advancedFeedback"),
+            advancedProgressTitle: document.getElementById("advancedProgressTitle"),
+            advancedProgressFill: document.getElementById("advancedProgressFill"),
+            advancedSeenCount: document.getElementById("advancedSeenCount"),
+            advancedGamesCount: document.getElementById("advancedGamesCount"),
+            advancedLastPattern: document.getElementById("advancedLastPattern"),
+            vocabProgressTitle: document.getElementById("vocabProgressTitle"),
+            vocabProgressFill: document.getElementById("vocabProgressFill"),
+            vocabMasteredCount: document.getElementById("vocabMasteredCount"),
+            vocabReviewCount: document.getElementById("vocabReviewCount"),
+            vocabLastCategory: document.getElementById("vocabLastCategory"),
+            vocabLastQuiz: document.getElementById("vocabLastQuiz"),
+            vocabMicScore: document.getElementById("vocabMicScore"),
+            vocabTotalWords: document.getElementById("vocabTotalWords"),
+            vocabReviewList: document.getElementById("vocabReviewList"),
+            vocabCategoryGrid: document.getElementById("vocabCategoryGrid"),
+            vocabActiveSubtitle: document.getElementById("vocabActiveSubtitle"),
+            vocabActiveTitle: document.getElementById("vocabActiveTitle"),
+            vocabWorksheetLink: document.getElementById("vocabWorksheetLink"),
+            vocabAnimalLesson: document.getElementById("vocabAnimalLesson"),
+            vocabWordGrid: document.getElementById("vocabWordGrid"),
+            vocabPracticeArea: document.getElementById("vocabPracticeArea"),
+            vocabFeedback: document.getElementById("vocabFeedback"),
+            vocabQuizTitle: document.getElementById("vocabQuizTitle"),
+            vocabQuizArea: document.getElementById("vocabQuizArea"),
+            vocabQuizFeedback: document.getElementById("vocabQuizFeedback"),
+            grammarProgressTitle: document.getElementById("grammarProgressTitle"),
+            grammarProgressFill: document.getElementById("grammarProgressFill"),
+            grammarMasteredCount: document.getElementById("grammarMasteredCount"),
+            grammarReviewCount: document.getElementById("grammarReviewCount"),
+            grammarMicScore: document.getElementById("grammarMicScore"),
+            grammarLastLesson: document.getElementById("grammarLastLesson"),
+            grammarReviewList: document.getElementById("grammarReviewList"),
+            grammarLessonGrid: document.getElementById("grammarLessonGrid"),
+            grammarActiveSubtitle: document.getElementById("grammarActiveSubtitle"),
+            grammarActiveTitle: document.getElementById("grammarActiveTitle"),
+            grammarWorksheetLink: document.getElementById("grammarWorksheetLink"),
+            grammarLessonPanel: document.getElementById("grammarLessonPanel"),
+            grammarItemGrid: document.getElementById("grammarItemGrid"),
+            grammarPracticeArea: document.getElementById("grammarPracticeArea"),
+            grammarFeedback: document.getElementById("grammarFeedback"),
+            grammarSpeakingArea: document.getElementById("grammarSpeakingArea"),
+            grammarMicFeedback: document.getElementById("grammarMicFeedback"),
+            bigMic: document.getElementById("bigMic")
+        };
+
+        const digraphCodes = ["sh", "ch", "th", "ph", "wh", "ck"];
+        const digraphColors = {
+            sh: "#2255d8",
+            ch: "#0f8b75",
+            th: "#b7791f",
+            ph: "#d94f45",
+            wh: "#6d5bd0",
+            ck: "#334155"
+        };
+        const digraphArabicOptions = ["ش", "تش", "ث / ذ", "ف", "و / هوا", "ك"];
+        const digraphFinalQuestions = [
+            { id: "sound_ship", type: "choice", prompt: "ما الصوت في كلمة ship؟", answer: "sh", options: ["sh", "ch", "th", "ph"], listen: "ship" },
+            { id: "sound_chair", type: "choice", prompt: "ما الصوت في كلمة chair؟", answer: "ch", options: ["sh", "ch", "th", "ck"], listen: "chair" },
+            { id: "sound_thin", type: "choice", prompt: "ما الصوت في كلمة thin؟", answer: "th", options: ["th", "ph", "wh", "ch"], listen: "thin" },
+            { id: "sound_photo", type: "choice", prompt: "ما الصوت في كلمة photo؟", answer: "ph", options: ["ph", "th", "sh", "ck"], listen: "photo" },
+            { id: "sound_what", type: "choice", prompt: "ما الصوت في كلمة what؟", answer: "wh", options: ["wh", "ch", "sh", "ph"], listen: "what" },
+            { id: "listen_fish", type: "listen", prompt: "استمع إلى fish ثم اختر الصوت.", answer: "sh", options: ["sh", "ch", "th", "wh"], listen: "fish" },
+            { id: "listen_lunch", type: "listen", prompt: "استمع إلى lunch ثم اختر الصوت.", answer: "ch", options: ["ch", "sh", "ck", "ph"], listen: "lunch" },
+            { id: "listen_duck", type: "listen", prompt: "استمع إلى duck ثم اختر الصوت.", answer: "ck", options: ["ck", "wh", "ph", "th"], listen: "duck" },
+            { id: "complete_ship", type: "complete", prompt: "__ip = ship", answer: "sh", options: ["sh", "ch", "th"] },
+            { id: "complete_lunch", type: "complete", prompt: "lu__ = lunch", answer: "ch", options: ["ch", "sh", "ck"] },
+            { id: "complete_duck", type: "complete", prompt: "du__ = duck", answer: "ck", options: ["ck", "ph", "wh"] },
+            { id: "position_fish", type: "position", prompt: "أين sh في fish؟", answer: "ending", options: ["beginning", "middle", "ending"], listen: "fish" },
+            { id: "position_ship", type: "position", prompt: "أين sh في ship؟", answer: "beginning", options: ["beginning", "middle", "ending"], listen: "ship" }
+        ];
+        const digraphFinalMicWords = ["chair", "whale"];
+        const trigraphCodes = ["tch", "dge", "str", "spr", "spl", "shr"];
+        const trigraphColors = {
+            tch: "#2255d8",
+            dge: "#0f8b75",
+            str: "#b7791f",
+            spr: "#d94f45",
+            spl: "#6d5bd0",
+            shr: "#334155"
+        };
+        const trigraphArabicOptions = ["تش", "ج", "ستر", "سبر", "سبل", "شر"];
+        const trigraphFinalQuestions = [
+            { id: "tri_sound_catch", type: "choice", prompt: "ما النمط في catch؟", answer: "tch", options: ["tch", "dge", "str", "spr"], listen: "catch" },
+            { id: "tri_sound_bridge", type: "choice", prompt: "ما النمط في bridge؟", answer: "dge", options: ["dge", "tch", "spl", "shr"], listen: "bridge" },
+            { id: "tri_sound_street", type: "choice", prompt: "ما النمط في street؟", answer: "str", options: ["str", "spr", "shr", "tch"], listen: "street" },
+            { id: "tri_sound_spring", type: "choice", prompt: "ما النمط في spring؟", answer: "spr", options: ["spr", "spl", "str", "dge"], listen: "spring" },
+            { id: "tri_sound_splash", type: "choice", prompt: "ما النمط في splash؟", answer: "spl", options: ["spl", "spr", "shr", "str"], listen: "splash" },
+            { id: "tri_complete_catch", type: "complete", prompt: "ca__ = catch", answer: "tch", options: ["tch", "dge", "str"] },
+            { id: "tri_complete_bridge", type: "complete", prompt: "bri__ = bridge", answer: "dge", options: ["dge", "tch", "spl"] },
+            { id: "tri_complete_street", type: "complete", prompt: "__eet = street", answer: "str", options: ["str", "spr", "shr"] },
+            { id: "tri_position_catch", type: "position", prompt: "أين tch في catch؟", answer: "ending", options: ["beginning", "middle", "ending"], listen: "catch" },
+            { id: "tri_position_bridge", type: "position", prompt: "أين dge في bridge؟", answer: "ending", options: ["beginning", "middle", "ending"], listen: "bridge" },
+            { id: "tri_position_street", type: "position", prompt: "أين str في street؟", answer: "beginning", options: ["beginning", "middle", "ending"], listen: "street" },
+            { id: "tri_listen_shrimp", type: "listen", prompt: "استمع إلى shrimp ثم اختر النمط.", answer: "shr", options: ["shr", "spl", "spr", "str"], listen: "shrimp" },
+            { id: "tri_listen_fridge", type: "listen", prompt: "استمع إلى fridge ثم اختر النمط.", answer: "dge", options: ["dge", "tch", "str", "spr"], listen: "fridge" }
+        ];
+        const trigraphFinalMicWords = ["bridge", "splash"];
+        const advancedPatternCodes = ["tion", "ture", "sion", "ssion", "ough", "augh"];
+        const advancedColors = {
+            tion: "#2255d8",
+            ture: "#0f8b75",
+            sion: "#b7791f",
+            ssion: "#d94f45",
+            ough: "#334155",
+            augh: "#6d5bd0"
+        };
+
+        function idFor(type, text) {
+            return `${type}:${String(text).toLowerCase()}`;
+        }
+
+        function getCookie(name) {
+            return document.cookie.split(";").map(item => item.trim()).find(item => item.startsWith(`${name}=`))?.split("=")[1] || "";
+        }
+
+        function totalItems() {
+            const vowelExampleCount = vowelLessons.reduce((sum, lesson) => sum + lesson.examples.length, 0);
+            const patternUnits = soundPatternGroups.reduce((sum, group) => {
+                if (group.locked) return sum;
+                return sum + group.patterns.reduce((patternSum, pattern) => patternSum + 1 + pattern.examples.length, 0);
+            }, 0);
+            const activePatternActivities = soundPatternActivities.filter(activity => !patternGroupById(activity.category)?.locked).length;
+            return syllableRows.reduce((sum, row) => sum + row.sounds.length + row.words.length, 0) + cvcWords.length + quizQuestions.length + 6 + vowelLessons.length + vowelExampleCount + vowelActivities.length + patternUnits + activePatternActivities;
+        }
+
+        function patternGroupById(id) {
+            return soundPatternGroups.find(group => group.id === id);
+        }
+
+        function digraphGroup() {
+            return patternGroupById("digraphs");
+        }
+
+        function digraphPatterns() {
+            return digraphGroup()?.patterns || [];
+        }
+
+        function masteredDigraphs() {
+            return digraphPatterns()
+                .filter(pattern => state.completed.has(idFor("pattern", pattern.pattern)))
+                .map(pattern => pattern.pattern);
+        }
+
+        function digraphMiniScore(patternCode) {
+            return [0, 1, 2].filter(index => state.completed.has(idFor("digraph-mini", `${patternCode}:${index}`))).length;
+        }
+
+        function digraphFinalCorrectCount() {
+            return digraphFinalQuestions.filter(question => state.completed.has(idFor("digraph-final", question.id))).length;
+        }
+
+        function digraphCurrentFinalScore() {
+            return digraphFinalQuestions.length ? Math.round((digraphFinalCorrectCount() / digraphFinalQuestions.length) * 100) : 0;
+        }
+
+        function digraphBestScore() {
+            return Math.max(state.digraphQuizBestScore || 0, digraphCurrentFinalScore());
+        }
+
+        function digraphMasteryPercent() {
+            const masteredPercent = digraphPatterns().length ? Math.round((masteredDigraphs().length / digraphPatterns().length) * 100) : 0;
+            return Math.max(masteredPercent, digraphBestScore());
+        }
+
+        function digraphCertificateEarned() {
+            return masteredDigraphs().length >= digraphPatterns().length || digraphBestScore() >= 80;
+        }
+
+        function trigraphGroup() {
+            return patternGroupById("trigraphs");
+        }
+
+        function trigraphPatterns() {
+            return trigraphGroup()?.patterns || [];
+        }
+
+        function masteredTrigraphs() {
+            return trigraphPatterns()
+                .filter(pattern => state.completed.has(idFor("pattern", pattern.pattern)))
+                .map(pattern => pattern.pattern);
+        }
+
+        function trigraphMiniScore(patternCode) {
+            return [0, 1, 2].filter(index => state.completed.has(idFor("trigraph-mini", `${patternCode}:${index}`))).length;
+        }
+
+        function trigraphFinalCorrectCount() {
+            return trigraphFinalQuestions.filter(question => state.completed.has(idFor("trigraph-final", question.id))).length;
+        }
+
+        function trigraphCurrentFinalScore() {
+            return trigraphFinalQuestions.length ? Math.round((trigraphFinalCorrectCount() / trigraphFinalQuestions.length) * 100) : 0;
+        }
+
+        function trigraphBestScore() {
+            return Math.max(state.trigraphQuizBestScore || 0, trigraphCurrentFinalScore());
+        }
+
+        function trigraphMasteryPercent() {
+            const masteredPercent = trigraphPatterns().length ? Math.round((masteredTrigraphs().length / trigraphPatterns().length) * 100) : 0;
+            return Math.max(masteredPercent, trigraphBestScore());
+        }
+
+        function trigraphCertificateEarned() {
+            return masteredTrigraphs().length >= trigraphPatterns().length || trigraphBestScore() >= 80;
+        }
+
+        function advancedGroup() {
+            return patternGroupById("advanced_patterns");
+        }
+
+        function advancedPatterns() {
+            return advancedGroup()?.patterns || [];
+        }
+
+        function advancedSeenCount() {
+            return advancedPatterns().filter(pattern => state.advancedPatternsSeen.has(pattern.pattern)).length;
+        }
+
+        function advancedPreviewTaskTotal() {
+            const previewActivities = soundPatternActivities.filter(activity => activity.category === "advanced_patterns").length;
+            return previewActivities + (advancedPatterns().length * 2);
+        }
+
+        function advancedPreviewPercent() {
+            const total = advancedPatterns().length + advancedPreviewTaskTotal();
+            return total ? Math.min(100, Math.round(((advancedSeenCount() + state.advancedPreviewGamesCompleted.size) / total) * 100)) : 0;
+        }
+
+        function positionText(position) {
+            return {
+                beginning: "بداية",
+                middle: "وسط",
+                ending: "نهاية"
+            }[position] || position;
+        }
+
+        function miniCheckQuestions(pattern) {
+            const examples = pattern.examples || [];
+            const firstExample = examples[0] || { word: pattern.pattern, position: "beginning" };
+            const positionExample = examples.find(example => example.position === "ending") || firstExample;
+            const distractorWords = digraphPatterns()
+                .filter(item => item.pattern !== pattern.pattern)
+                .map(item => item.examples?.[0]?.word)
+                .filter(Boolean)
+                .slice(0, 2);
+            const arabicOptions = [pattern.arabic_sound, ...digraphArabicOptions.filter(option => option !== pattern.arabic_sound).slice(0, 2)];
+            return [
+                {
+                    prompt: `ما صوت ${pattern.pattern}؟`,
+                    answer: pattern.arabic_sound,
+                    options: arabicOptions
+                },
+                {
+                    prompt: `اختر كلمة فيها ${pattern.pattern}:`,
+                    answer: firstExample.word,
+                    options: [firstExample.word, ...distractorWords].slice(0, 3)
+                },
+                {
+                    prompt: `أين ${pattern.pattern} في ${positionExample.word}؟`,
+                    answer: positionExample.position,
+                    options: ["beginning", "middle", "ending"],
+                    displayOptions: ["بداية", "وسط", "نهاية"]
+                }
+            ];
+        }
+
+        function trigraphMiniCheckQuestions(pattern) {
+            const examples = pattern.examples || [];
+            const firstExample = examples[0] || { word: pattern.pattern, position: "beginning" };
+            const positionExample = examples.find(example => example.position === "ending") || firstExample;
+            const distractorWords = trigraphPatterns()
+                .filter(item => item.pattern !== pattern.pattern)
+                .map(item => item.examples?.[0]?.word)
+                .filter(Boolean)
+                .slice(0, 2);
+            const arabicOptions = [pattern.arabic_sound, ...trigraphArabicOptions.filter(option => option !== pattern.arabic_sound).slice(0, 2)];
+            return [
+                {
+                    prompt: `ما صوت ${pattern.pattern}؟`,
+                    answer: pattern.arabic_sound,
+                    options: arabicOptions
+                },
+                {
+                    prompt: `اختر كلمة فيها ${pattern.pattern}:`,
+                    answer: firstExample.word,
+                    options: [firstExample.word, ...distractorWords].slice(0, 3)
+                },
+                {
+                    prompt: `أين يظهر ${pattern.pattern} في ${positionExample.word}؟`,
+                    answer: positionExample.position,
+                    options: ["beginning", "middle", "ending"],
+                    displayOptions: ["البداية", "الوسط", "النهاية"]
+                }
+            ];
+        }
+
+        function advancedQuickQuestions(pattern) {
+            const examples = pattern.examples || [];
+            const firstExample = examples[0] || { word: pattern.pattern, arabic: "", position: "ending" };
+            const secondExample = examples[1] || firstExample;
+            const otherPatterns = advancedPatterns()
+                .map(item => item.pattern)
+                .filter(code => code !== pattern.pattern)
+                .slice(0, 2);
+            const translationOptions = [firstExample.arabic, "محطة", "مهمة", "صورة"]
+                .filter((value, index, list) => value && list.indexOf(value) === index)
+                .slice(0, 3);
+            return [
+                {
+                    prompt: `ما النمط الموجود في ${secondExample.word}؟`,
+                    answer: pattern.pattern,
+                    options: [pattern.pattern, ...otherPatterns].slice(0, 3)
+                },
+                {
+                    prompt: `${firstExample.word} تعني:`,
+                    answer: firstExample.arabic,
+                    options: translationOptions
+                }
+            ];
+        }
+
+        function patternProgressSummary() {
+            const completedForGroup = id => {
+                const group = patternGroupById(id);
+                if (!group) return 0;
+                return group.patterns.filter(pattern => state.completed.has(idFor("pattern", pattern.pattern))).length;
+            };
+            const mastered = masteredDigraphs();
+            const masteredTri = masteredTrigraphs();
+            const bestScore = digraphBestScore();
+            const triBestScore = trigraphBestScore();
+            return {
+                digraphs_started: mastered.length > 0 || state.digraphQuizAttempts > 0 || (state.patternMicAttempts.digraphs || 0) > 0,
+                digraphs_completed: completedForGroup("digraphs"),
+                digraphs_completed_count: mastered.length,
+                mastered_digraphs: mastered,
+                digraph_quiz_attempts: state.digraphQuizAttempts || 0,
+                digraph_quiz_score: bestScore,
+                digraph_mic_attempts: state.patternMicAttempts.digraphs || 0,
+                digraph_mic_success: state.patternMicSuccess.digraphs || 0,
+                last_digraph: state.lastDigraph || "",
+                digraph_mastery_percentage: digraphMasteryPercent(),
+                digraph_certificate_earned: digraphCertificateEarned(),
+                ending_sounds_completed: completedForGroup("ending_sounds"),
+                ending_sound_mic_attempts: state.patternMicAttempts.ending_sounds || 0,
+                ending_sound_mic_success: state.patternMicSuccess.ending_sounds || 0,
+                trigraphs_started: masteredTri.length > 0 || state.trigraphQuizAttempts > 0 || (state.patternMicAttempts.trigraphs || 0) > 0,
+                trigraphs_completed: completedForGroup("trigraphs"),
+                trigraphs_completed_count: masteredTri.length,
+                mastered_trigraphs: masteredTri,
+                trigraph_quiz_attempts: state.trigraphQuizAttempts || 0,
+                trigraph_quiz_score: triBestScore,
+                trigraph_mic_attempts: state.patternMicAttempts.trigraphs || 0,
+                trigraph_mic_success: state.patternMicSuccess.trigraphs || 0,
+                last_trigraph: state.lastTrigraph || "",
+                trigraph_mastery_percentage: trigraphMasteryPercent(),
+                trigraph_certificate_earned: trigraphCertificateEarned(),
+                advanced_patterns_preview_started: state.advancedPatternsSeen.size > 0 || state.advancedPreviewGamesCompleted.size > 0,
+                advanced_patterns_seen: [...state.advancedPatternsSeen],
+                advanced_patterns_preview_games_completed: [...state.advancedPreviewGamesCompleted],
+                advanced_pattern_mic_attempts: state.patternMicAttempts.advanced_patterns || 0,
+                advanced_pattern_mic_success: state.patternMicSuccess.advanced_patterns || 0,
+                last_advanced_pattern: state.lastAdvancedPattern || "",
+                sound_quiz_score: `${state.quizCorrect}/${state.quizAttempts}`
+            };
+        }
+
+        function patternFeedbackFor(category) {
+            return {
+                digraphs: els.digraphFeedback,
+                ending_sounds: els.endingFeedback,
+                trigraphs: els.trigraphFeedback,
+                advanced_patterns: els.advancedFeedback
+            }[category] || document.querySelector(".section.active .pattern-feedback") || els.micFeedback;
+        }
+
+        function vowelMasteryPercent() {
+            return vowelLessons.length ? Math.round((state.practicedVowels.size / vowelLessons.length) * 100) : 0;
+        }
+
+        function soundTypeLabel(type) {
+            const labels = {
+                short: "short vowel",
+                long: "long vowel",
+                silent: "silent letter",
+                "silent-like": "غير واضح",
+                ending: "نهاية الكلمة",
+                "long i": "long i",
+                "long e": "long e",
+                "short i": "short i"
+            };
+            return labels[type] || type;
+        }
+
+        function positionLabel(position) {
+            return {
+                beginning: "بداية الكلمة",
+                middle: "وسط الكلمة",
+                ending: "نهاية الكلمة"
+            }[position] || position;
+        }
+
+        function escapeHtml(value) {
+            return String(value ?? "")
+                .replace(/&/g, "&amp;")
+                .replace(/</g, "&lt;")
+                .replace(/>/g, "&gt;")
+                .replace(/"/g, "&quot;");
+        }
+
+        function allVocabularyWords() {
+            return foundationVocabulary.flatMap(category =>
+                category.words.map(word => ({ ...word, category_id: category.id, category_ar: category.title_ar, category_en: category.title_en }))
+            );
+        }
+
+        function vocabularyCategory(categoryId = vocabularyState.activeCategory) {
+            return foundationVocabulary.find(category => category.id === categoryId) || foundationVocabulary[0];
+        }
+
+        function animalCategory() {
+            return foundationVocabulary.find(category => category.id === "animals");
+        }
+
+        function foodCategory() {
+            return foundationVocabulary.find(category => category.id === "foods");
+        }
+
+        function calendarCategory() {
+            return foundationVocabulary.find(category => category.id === "calendar");
+        }
+
+        function animalGroups() {
+            return animalCategory()?.groups || [];
+        }
+
+        function foodGroups() {
+            return foodCategory()?.groups || [];
+        }
+
+        function calendarGroups() {
+            return calendarCategory()?.groups || [];
+        }
+
+        function activeAnimalGroup() {
+            return animalGroups().find(group => group.id === vocabularyState.activeAnimalGroup) || animalGroups()[0];
+        }
+
+        function activeFoodGroup() {
+            return foodGroups().find(group => group.id === vocabularyState.activeFoodGroup) || foodGroups()[0];
+        }
+
+        function activeCalendarGroup() {
+            return calendarGroups().find(group => group.id === vocabularyState.activeCalendarGroup) || calendarGroups()[0];
+        }
+
+        function animalWordByText(word) {
+            const key = vocabularyWordKey(word);
+            return animalCategory()?.words.find(item => vocabularyWordKey(item.word) === key) || null;
+        }
+
+        function foodWordByText(word) {
+            const key = vocabularyWordKey(word);
+            return foodCategory()?.words.find(item => vocabularyWordKey(item.word) === key) || null;
+        }
+
+        function calendarWordByText(word) {
+            const key = vocabularyWordKey(word);
+            return calendarCategory()?.words.find(item => vocabularyWordKey(item.word) === key) || null;
+        }
+
+        function isAnimalPracticeTarget(target) {
+            const text = String(target || "");
+            return Boolean(
+                animalWordByText(text)
+                || animalCategory()?.sentences?.some(item => item.sentence === text)
+                || animalCategory()?.story?.english?.includes(text)
+                || animalCategory()?.story?.english?.join(" ") === text
+            );
+        }
+
+        function isFoodPracticeTarget(target) {
+            const text = String(target || "");
+            return Boolean(
+                foodWordByText(text)
+                || foodCategory()?.sentences?.some(item => item.sentence === text)
+                || foodCategory()?.story?.english?.includes(text)
+                || foodCategory()?.story?.english?.join(" ") === text
+            );
+        }
+
+        function isCalendarPracticeTarget(target) {
+            const text = String(target || "");
+            return Boolean(
+                calendarWordByText(text)
+                || calendarCategory()?.sentences?.some(item => item.sentence === text)
+                || calendarCategory()?.story?.english?.includes(text)
+                || calendarCategory()?.story?.english?.join(" ") === text
+            );
+        }
+
+        function vocabularyWordKey(word) {
+            return String(word || "").toLowerCase();
+        }
+
+        function saveVocabularyProgress() {
+            localStorage.setItem(vocabularyStorageKey, JSON.stringify({
+                mastered_words: [...vocabularyState.masteredWords],
+                review_words: [...vocabularyState.reviewWords],
+                mastered_animals: [...vocabularyState.masteredAnimals],
+                review_animals: [...vocabularyState.reviewAnimals],
+                mastered_foods: [...vocabularyState.masteredFoods],
+                review_foods: [...vocabularyState.reviewFoods],
+                mastered_calendar: [...vocabularyState.masteredCalendar],
+                review_calendar: [...vocabularyState.reviewCalendar],
+                category_scores: vocabularyState.categoryScores,
+                vocab_quiz_attempts: vocabularyState.quizAttempts,
+                vocab_mic_attempts: vocabularyState.micAttempts,
+                vocab_mic_success: vocabularyState.micSuccess,
+                last_vocab_category: vocabularyState.activeCategory,
+                animal_quiz_score: vocabularyState.animalQuizScore,
+                animal_quiz_attempts: vocabularyState.animalQuizAttempts,
+                animal_mic_success: vocabularyState.animalMicSuccess,
+                last_animal_group: vocabularyState.activeAnimalGroup,
+                animal_story_completed: vocabularyState.animalStoryCompleted,
+                food_quiz_score: vocabularyState.foodQuizScore,
+                food_quiz_attempts: vocabularyState.foodQuizAttempts,
+                food_mic_success: vocabularyState.foodMicSuccess,
+                last_food_group: vocabularyState.activeFoodGroup,
+                food_story_completed: vocabularyState.foodStoryCompleted,
+                calendar_quiz_score: vocabularyState.calendarQuizScore,
+                calendar_quiz_attempts: vocabularyState.calendarQuizAttempts,
+                calendar_mic_success: vocabularyState.calendarMicSuccess,
+                last_calendar_group: vocabularyState.activeCalendarGroup,
+                calendar_story_completed: vocabularyState.calendarStoryCompleted,
+                last_quiz_score: vocabularyState.lastQuizScore
+            }));
+        }
+
+        function markVocabularyMastered(word) {
+            const key = vocabularyWordKey(word);
+            vocabularyState.masteredWords.add(key);
+            vocabularyState.reviewWords.delete(key);
+            if (animalWordByText(word)) {
+                vocabularyState.masteredAnimals.add(key);
+                vocabularyState.reviewAnimals.delete(key);
+            }
+            if (foodWordByText(word)) {
+                vocabularyState.masteredFoods.add(key);
+                vocabularyState.reviewFoods.delete(key);
+            }
+            if (calendarWordByText(word)) {
+                vocabularyState.masteredCalendar.add(key);
+                vocabularyState.reviewCalendar.delete(key);
+            }
+            saveVocabularyProgress();
+            renderVocabulary();
+        }
+
+        function markVocabularyReview(word) {
+            const key = vocabularyWordKey(word);
+            if (!vocabularyState.masteredWords.has(key)) {
+                vocabularyState.reviewWords.add(key);
+            }
+            if (animalWordByText(word) && !vocabularyState.masteredAnimals.has(key)) {
+                vocabularyState.reviewAnimals.add(key);
+            }
+            if (foodWordByText(word) && !vocabularyState.masteredFoods.has(key)) {
+                vocabularyState.reviewFoods.add(key);
+            }
+            if (calendarWordByText(word) && !vocabularyState.masteredCalendar.has(key)) {
+                vocabularyState.reviewCalendar.add(key);
+            }
+            saveVocabularyProgress();
+            renderVocabulary();
+        }
+
+        function vocabularyMissingPrompt(word) {
+            const text = String(word || "");
+            if (text.length < 3 || text.includes(" ")) return `${text} = ____`;
+            const index = Math.min(2, Math.max(1, Math.floor(text.length / 2)));
+            return `${text.slice(0, index)}_${text.slice(index + 1)}`;
+        }
+
+        function vocabularyOptions(correct, source, field = "word", limit = 3) {
+            const pool = source
+                .map(item => item[field])
+                .filter(Boolean)
+                .filter(value => value !== correct);
+            return [correct, ...pool].slice(0, limit);
+        }
+
+        function animalGroupOptions(correct, limit = 4) {
+            return [correct, ...animalGroups().map(group => group.title_en).filter(title => title !== correct)].slice(0, limit);
+        }
+
+        function foodGroupOptions(correct, limit = 4) {
+            return [correct, ...foodGroups().map(group => group.title_en).filter(title => title !== correct)].slice(0, limit);
+        }
+
+        function calendarGroupOptions(correct, limit = 4) {
+            return [correct, ...calendarGroups().map(group => group.title_en).filter(title => title !== correct)].slice(0, limit);
+        }
+
+        function calendarTypeOptions(correct) {
+            const options = ["Day", "Month"].filter(option => option !== correct);
+            return [correct, ...options].slice(0, 2);
+        }
+
+        function animalHabitatOptions(correct) {
+            const options = ["sea", "farm", "house", "forest", "garden"].filter(option => option !== correct);
+            return [correct, ...options].slice(0, 4);
+        }
+
+        function foodTypeOptions(correct) {
+            const options = ["Healthy Food", "Sweets", "Snacks", "Fruits", "Vegetables"].filter(option => option !== correct);
+            return [correct, ...options].slice(0, 4);
+        }
+
+        function buildAnimalPractice(category) {
+            const words = category.words;
+            const byWord = Object.fromEntries(words.map(word => [word.word, word]));
+            const first = byWord.cat || words[0];
+            const dog = byWord.dog || words[1] || first;
+            const lion = byWord.lion || words[2] || first;
+            const dolphin = byWord.dolphin || words[3] || first;
+            const cow = byWord.cow || words[4] || first;
+            const shark = byWord.shark || words[5] || first;
+            const whale = byWord.whale || words[6] || first;
+            return [
+                {
+                    title: "اختر الحيوان",
+                    prompt: first.word,
+                    answer: first.icon,
+                    options: vocabularyOptions(first.icon, [first, dog, byWord.fish || dolphin], "icon"),
+                },
+                {
+                    title: "اختر الترجمة",
+                    prompt: lion.word,
+                    answer: lion.arabic,
+                    options: vocabularyOptions(lion.arabic, [lion, byWord.horse || cow, byWord.elephant || whale], "arabic"),
+                },
+                {
+                    title: "استمع واختر",
+                    prompt: "استمع إلى الكلمة ثم اخترها",
+                    answer: dolphin.word,
+                    options: vocabularyOptions(dolphin.word, [dolphin, byWord.tiger || lion, cow], "word"),
+                    listen: dolphin.word,
+                },
+                {
+                    title: "صنّف الحيوان",
+                    prompt: cow.word,
+                    answer: cow.group_en,
+                    options: animalGroupOptions(cow.group_en),
+                },
+                {
+                    title: "أين يعيش؟",
+                    prompt: shark.word,
+                    answer: shark.habitat,
+                    options: animalHabitatOptions(shark.habitat),
+                },
+                {
+                    title: "أكمل الكلمة",
+                    prompt: vocabularyMissingPrompt(lion.word),
+                    answer: lion.word,
+                    options: vocabularyOptions(lion.word, words, "word", 4),
+                },
+                {
+                    title: "صل الحيوان بالصورة",
+                    prompt: whale.word,
+                    answer: whale.icon,
+                    options: vocabularyOptions(whale.icon, words, "icon", 4),
+                },
+                {
+                    title: "اقرأ بالمايك",
+                    prompt: "The lion is strong.",
+                    answer: "The lion is strong.",
+                    options: [],
+                    mic: "The lion is strong.",
+                },
+            ];
+        }
+
+        function buildFoodPractice(category) {
+            const words = category.words;
+            const byWord = Object.fromEntries(words.map(word => [word.word, word]));
+            const apple = byWord.apple || words[0];
+            const bread = byWord.bread || words[1] || apple;
+            const carrot = byWord.carrot || words[2] || apple;
+            const banana = byWord.banana || words[3] || apple;
+            const salad = byWord.salad || words[4] || apple;
+            const cake = byWord.cake || words[5] || apple;
+            const rice = byWord.rice || words[6] || apple;
+            const pizza = byWord.pizza || words[7] || apple;
+            return [
+                {
+                    title: "اختر الطعام",
+                    prompt: apple.word,
+                    answer: apple.icon,
+                    options: vocabularyOptions(apple.icon, [apple, byWord.banana || banana, pizza], "icon"),
+                },
+                {
+                    title: "اختر الترجمة",
+                    prompt: bread.word,
+                    answer: bread.arabic,
+                    options: vocabularyOptions(bread.arabic, [bread, rice, byWord.cheese || cake], "arabic"),
+                },
+                {
+                    title: "استمع واختر",
+                    prompt: "استمع إلى الكلمة ثم اخترها",
+                    answer: carrot.word,
+                    options: vocabularyOptions(carrot.word, [carrot, byWord.chicken || bread, cake], "word"),
+                    listen: carrot.word,
+                },
+                {
+                    title: "صنّف الطعام",
+                    prompt: banana.word,
+                    answer: banana.group_en,
+                    options: foodGroupOptions(banana.group_en),
+                },
+                {
+                    title: "صحي أم حلوى؟",
+                    prompt: salad.word,
+                    answer: salad.group_en,
+                    options: foodTypeOptions(salad.group_en),
+                },
+                {
+                    title: "أكمل الكلمة",
+                    prompt: vocabularyMissingPrompt(cake.word),
+                    answer: cake.word,
+                    options: vocabularyOptions(cake.word, words, "word", 4),
+                },
+                {
+                    title: "صل الطعام بالصورة",
+                    prompt: rice.word,
+                    answer: rice.icon,
+                    options: vocabularyOptions(rice.icon, words, "icon", 4),
+                },
+                {
+                    title: "اقرأ بالمايك",
+                    prompt: "I like apples.",
+                    answer: "I like apples.",
+                    options: [],
+                    mic: "I like apples.",
+                },
+            ];
+        }
+
+        function buildCalendarPractice(category) {
+            const words = category.words;
+            const byWord = Object.fromEntries(words.map(word => [word.word, word]));
+            const monday = byWord.Monday || words[0];
+            const friday = byWord.Friday || words[1] || monday;
+            const sunday = byWord.Sunday || words[2] || monday;
+            const january = byWord.January || words[3] || monday;
+            const march = byWord.March || words[4] || monday;
+            const june = byWord.June || words[5] || monday;
+            const september = byWord.September || words[6] || monday;
+            const december = byWord.December || words[7] || monday;
+            return [
+                {
+                    title: "اختر اليوم",
+                    prompt: monday.word,
+                    answer: monday.icon,
+                    options: vocabularyOptions(monday.icon, [monday, friday, sunday], "icon"),
+                },
+                {
+                    title: "اختر الترجمة",
+                    prompt: january.word,
+                    answer: january.arabic,
+                    options: vocabularyOptions(january.arabic, [january, march, december], "arabic"),
+                },
+                {
+                    title: "استمع واختر",
+                    prompt: "استمع إلى الكلمة ثم اخترها",
+                    answer: friday.word,
+                    options: vocabularyOptions(friday.word, [friday, june, september], "word"),
+                    listen: friday.word,
+                },
+                {
+                    title: "صنّف الكلمة",
+                    prompt: march.word,
+                    answer: march.group_en,
+                    options: calendarGroupOptions(march.group_en),
+                },
+                {
+                    title: "يوم أم شهر؟",
+                    prompt: sunday.word,
+                    answer: sunday.time_type,
+                    options: calendarTypeOptions(sunday.time_type),
+                },
+                {
+                    title: "أكمل الكلمة",
+                    prompt: vocabularyMissingPrompt(december.word),
+                    answer: december.word,
+                    options: vocabularyOptions(december.word, words, "word", 4),
+                },
+                {
+                    title: "صل الكلمة بالرمز",
+                    prompt: september.word,
+                    answer: september.icon,
+                    options: vocabularyOptions(september.icon, words, "icon", 4),
+                },
+                {
+                    title: "اقرأ بالمايك",
+                    prompt: "Today is Monday.",
+                    answer: "Today is Monday.",
+                    options: [],
+                    mic: "Today is Monday.",
+                },
+            ];
+        }
+
+        function buildVocabularyPractice(category) {
+            if (category.id === "animals") {
+                return buildAnimalPractice(category);
+            }
+            if (category.id === "foods") {
+                return buildFoodPractice(category);
+            }
+            if (category.id === "calendar") {
+                return buildCalendarPractice(category);
+            }
+            const words = category.words;
+            const first = words[0];
+            const second = words[1] || first;
+            const third = words[2] || first;
+            const fourth = words[3] || first;
+            const sentenceParts = first.example.split(" ");
+            const shuffledSentence = sentenceParts.length > 1 ? [...sentenceParts].reverse().join(" / ") : first.example;
+            return [
+                {
+                    title: "اختر الصورة",
+                    prompt: first.word,
+                    answer: first.icon,
+                    options: vocabularyOptions(first.icon, words, "icon"),
+                },
+                {
+                    title: "اختر الترجمة",
+                    prompt: second.word,
+                    answer: second.arabic,
+                    options: vocabularyOptions(second.arabic, words, "arabic"),
+                },
+                {
+                    title: "استمع واختر",
+                    prompt: "اضغط استماع ثم اختر الكلمة",
+                    answer: third.word,
+                    options: vocabularyOptions(third.word, words, "word"),
+                    listen: third.word,
+                },
+                {
+                    title: "أكمل الكلمة",
+                    prompt: vocabularyMissingPrompt(fourth.word),
+                    answer: fourth.word,
+                    options: vocabularyOptions(fourth.word, words, "word"),
+                },
+                {
+                    title: "رتب الجملة",
+                    prompt: shuffledSentence,
+                    answer: first.example,
+                    options: [first.example, second.example, third.example].filter(Boolean),
+                },
+                {
+                    title: "صنّف الكلمة",
+                    prompt: first.word,
+                    answer: category.title_en,
+                    options: [category.title_en, ...foundationVocabulary.filter(item => item.id !== category.id).slice(0, 2).map(item => item.title_en)],
+                },
+            ];
+        }
+
+        function buildAnimalQuiz(category) {
+            const makeQuestion = (word, group, typeIndex) => {
+                if (typeIndex % 5 === 0) {
+                    return {
+                        prompt: `اختر صورة ${word.word}`,
+                        answer: word.icon,
+                        options: vocabularyOptions(word.icon, group.words, "icon", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                    };
+                }
+                if (typeIndex % 5 === 1) {
+                    return {
+                        prompt: `${word.word} = ?`,
+                        answer: word.arabic,
+                        options: vocabularyOptions(word.arabic, group.words, "arabic", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                    };
+                }
+                if (typeIndex % 5 === 2) {
+                    return {
+                        prompt: `صنّف الحيوان: ${word.word}`,
+                        answer: group.title_en,
+                        options: animalGroupOptions(group.title_en),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                        listen: word.word,
+                    };
+                }
+                if (typeIndex % 5 === 3) {
+                    return {
+                        prompt: "استمع ثم اختر الحيوان",
+                        answer: word.word,
+                        options: vocabularyOptions(word.word, category.words, "word", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                        listen: word.word,
+                    };
+                }
+                return {
+                    prompt: vocabularyMissingPrompt(word.word),
+                    answer: word.word,
+                    options: vocabularyOptions(word.word, category.words, "word", 4),
+                    word: word.word,
+                    category: category.id,
+                    group_id: group.id,
+                    group_title: group.title_en,
+                };
+            };
+
+            return (category.groups || []).flatMap(group =>
+                group.words.slice(0, 2).map((word, index) => makeQuestion(word, group, index))
+            ).slice(0, 10);
+        }
+
+        function buildFoodQuiz(category) {
+            const makeQuestion = (word, group, typeIndex) => {
+                if (typeIndex % 5 === 0) {
+                    return {
+                        prompt: `اختر صورة ${word.word}`,
+                        answer: word.icon,
+                        options: vocabularyOptions(word.icon, group.words, "icon", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                    };
+                }
+                if (typeIndex % 5 === 1) {
+                    return {
+                        prompt: `${word.word} = ?`,
+                        answer: word.arabic,
+                        options: vocabularyOptions(word.arabic, group.words, "arabic", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                    };
+                }
+                if (typeIndex % 5 === 2) {
+                    return {
+                        prompt: `صنّف الطعام: ${word.word}`,
+                        answer: group.title_en,
+                        options: foodGroupOptions(group.title_en),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                        listen: word.word,
+                    };
+                }
+                if (typeIndex % 5 === 3) {
+                    return {
+                        prompt: "استمع ثم اختر الطعام",
+                        answer: word.word,
+                        options: vocabularyOptions(word.word, category.words, "word", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                        listen: word.word,
+                    };
+                }
+                return {
+                    prompt: vocabularyMissingPrompt(word.word),
+                    answer: word.word,
+                    options: vocabularyOptions(word.word, category.words, "word", 4),
+                    word: word.word,
+                    category: category.id,
+                    group_id: group.id,
+                    group_title: group.title_en,
+                };
+            };
+
+            const distribution = {
+                fruits: 2,
+                vegetables: 2,
+                "daily-meals": 2,
+                snacks: 2,
+                sweets: 1,
+                "healthy-food": 1,
+            };
+            return (category.groups || []).flatMap(group =>
+                group.words.slice(0, distribution[group.id] || 0).map((word, index) => makeQuestion(word, group, index))
+            ).slice(0, 10);
+        }
+
+        function buildCalendarQuiz(category) {
+            const makeQuestion = (word, group, typeIndex) => {
+                if (typeIndex % 5 === 0) {
+                    return {
+                        prompt: `اختر رمز ${word.word}`,
+                        answer: word.icon,
+                        options: vocabularyOptions(word.icon, group.words, "icon", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                    };
+                }
+                if (typeIndex % 5 === 1) {
+                    return {
+                        prompt: `${word.word} = ?`,
+                        answer: word.arabic,
+                        options: vocabularyOptions(word.arabic, group.words, "arabic", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                    };
+                }
+                if (typeIndex % 5 === 2) {
+                    return {
+                        prompt: `صنّف: ${word.word}`,
+                        answer: group.title_en,
+                        options: calendarGroupOptions(group.title_en),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                        listen: word.word,
+                    };
+                }
+                if (typeIndex % 5 === 3) {
+                    return {
+                        prompt: "استمع ثم اختر اليوم أو الشهر",
+                        answer: word.word,
+                        options: vocabularyOptions(word.word, category.words, "word", 4),
+                        word: word.word,
+                        category: category.id,
+                        group_id: group.id,
+                        group_title: group.title_en,
+                        listen: word.word,
+                    };
+                }
+                return {
+                    prompt: vocabularyMissingPrompt(word.word),
+                    answer: word.word,
+                    options: vocabularyOptions(word.word, category.words, "word", 4),
+                    word: word.word,
+                    category: category.id,
+                    group_id: group.id,
+                    group_title: group.title_en,
+                };
+            };
+
+            const distribution = {
+                days: 5,
+                months: 5,
+            };
+            return (category.groups || []).flatMap(group =>
+                group.words.slice(0, distribution[group.id] || 0).map((word, index) => makeQuestion(word, group, index))
+            ).slice(0, 10);
+        }
+
+        function buildVocabularyQuiz(category, comprehensive = false) {
+            const makeQuestion = (word, sourceCategory, typeIndex) => {
+                const sourceWords = sourceCategory.words;
+                const allWords = allVocabularyWords();
+                if (typeIndex % 4 === 0) {
+                    return {
+                        prompt: `${word.word} = ?`,
+                        answer: word.arabic,
+                        options: vocabularyOptions(word.arabic, sourceWords, "arabic", 4),
+                        word: word.word,
+                        category: sourceCategory.id,
+                    };
+                }
+                if (typeIndex % 4 === 1) {
+                    return {
+                        prompt: `اختر رمز ${word.word}`,
+                        answer: word.icon,
+                        options: vocabularyOptions(word.icon, sourceWords, "icon", 4),
+                        word: word.word,
+                        category: sourceCategory.id,
+                    };
+                }
+                if (typeIndex % 4 === 2) {
+                    return {
+                        prompt: vocabularyMissingPrompt(word.word),
+                        answer: word.word,
+                        options: vocabularyOptions(word.word, sourceWords, "word", 4),
+                        word: word.word,
+                        category: sourceCategory.id,
+                    };
+                }
+                return {
+                    prompt: `صنّف: ${word.word}`,
+                    answer: sourceCategory.title_en,
+                    options: [sourceCategory.title_en, ...foundationVocabulary.filter(item => item.id !== sourceCategory.id).slice(0, 3).map(item => item.title_en)],
+                    word: word.word,
+                    category: sourceCategory.id,
+                    listen: word.word,
+                };
+            };
+
+            if (!comprehensive) {
+                if (category.id === "animals") {
+                    return buildAnimalQuiz(category);
+                }
+                if (category.id === "foods") {
+                    return buildFoodQuiz(category);
+                }
+                if (category.id === "calendar") {
+                    return buildCalendarQuiz(category);
+                }
+                return category.words.slice(0, 5).map((word, index) => makeQuestion(word, category, index));
+            }
+
+            const distribution = {
+                colors: 2,
+                animals: 3,
+                family: 3,
+                feelings: 3,
+                "daily-verbs": 3,
+                foods: 2,
+                drinks: 2,
+                numbers: 1,
+                calendar: 1,
+            };
+            return foundationVocabulary.flatMap(sourceCategory =>
+                sourceCategory.words
+                    .slice(0, distribution[sourceCategory.id] || 0)
+                    .map((word, index) => makeQuestion(word, sourceCategory, index))
+            ).slice(0, 20);
+        }
+
+        function renderVocabularyProgress() {
+            const totalWords = allVocabularyWords().length;
+            const mastered = vocabularyState.masteredWords.size;
+            const percent = totalWords ? Math.round((mastered / totalWords) * 100) : 0;
+            const active = vocabularyCategory();
+            els.vocabProgressTitle.textContent = mastered ? `${percent}% من مفردات التأسيس` : "ابدأ بأول تصنيف";
+            els.vocabProgressFill.style.width = `${percent}%`;
+            els.vocabMasteredCount.textContent = mastered;
+            els.vocabReviewCount.textContent = vocabularyState.reviewWords.size;
+            els.vocabLastCategory.textContent = active?.title_ar || "-";
+            els.vocabLastQuiz.textContent = vocabularyState.lastQuizScore || "-";
+            els.vocabMicScore.textContent = `${vocabularyState.micSuccess}/${vocabularyState.micAttempts}`;
+            els.vocabTotalWords.textContent = totalWords;
+            const reviewWords = [...vocabularyState.reviewWords].slice(0, 8);
+            els.vocabReviewList.innerHTML = reviewWords.length
+                ? reviewWords.map(word => `<span>${escapeHtml(word)}</span>`).join("")
+                : "<span>لا توجد كلمات مراجعة الآن</span>";
+        }
+
+        function renderVocabularyCategories() {
+            els.vocabCategoryGrid.innerHTML = foundationVocabulary.map(category => {
+                const masteredInCategory = category.words.filter(word => vocabularyState.masteredWords.has(vocabularyWordKey(word.word))).length;
+                const activeClass = category.id === vocabularyState.activeCategory ? " active" : "";
+                return `
+                    <article class="vocab-category-card${activeClass}">
+                        <div class="vocab-category-icon">${escapeHtml(category.icon)}</div>
+                        <h3>${escapeHtml(category.title_ar)}</h3>
+                        <strong>${escapeHtml(category.title_en)}</strong>
+                        <span>${category.words.length} كلمات · متقن ${masteredInCategory}</span>
+                        <div class="vocab-category-actions">
+                            <button class="vocab-mini-btn primary" type="button" data-vocab-category="${escapeHtml(category.id)}">ابدأ التدريب</button>
+                            <button class="vocab-mini-btn" type="button" data-vocab-category-quiz="${escapeHtml(category.id)}">اختبار التصنيف</button>
+                            <a class="vocab-mini-btn gold" href="${pageUrls.worksheet}?sheet=${escapeHtml(category.worksheet)}" target="_blank">ورقة العمل</a>
+                        </div>
+                    </article>
+                `;
+            }).join("");
+        }
+
+        function renderAnimalLesson(category) {
+            if (!els.vocabAnimalLesson) return;
+            if (category.id !== "animals") {
+                els.vocabAnimalLesson.innerHTML = "";
+                return;
+            }
+
+            const groups = category.groups || [];
+            const activeGroup = groups.find(group => group.id === vocabularyState.activeAnimalGroup) || groups[0];
+            if (activeGroup && activeGroup.id !== vocabularyState.activeAnimalGroup) {
+                vocabularyState.activeAnimalGroup = activeGroup.id;
+            }
+            const totalAnimals = category.words.length;
+            const masteredAnimals = category.words.filter(word => vocabularyState.masteredAnimals.has(vocabularyWordKey(word.word))).length;
+            const story = category.story || {};
+            const storyText = [...(story.english || [])].join(" ");
+            const reviewCount = vocabularyState.reviewAnimals.size;
+            const sentences = category.sentences || [];
+
+            els.vocabAnimalLesson.innerHTML = `
+                <div class="animal-progress-strip">
+                    <div>حيوانات متقنة<span>${masteredAnimals}/${totalAnimals}</span></div>
+                    <div>آخر اختبار<span>${escapeHtml(vocabularyState.animalQuizScore || "-")}</span></div>
+                    <div>تحتاج مراجعة<span>${reviewCount}</span></div>
+                </div>
+                <div class="animal-group-tabs" aria-label="Animal groups">
+                    ${groups.map(group => `
+                        <button class="animal-group-tab${group.id === vocabularyState.activeAnimalGroup ? " active" : ""}" type="button" data-animal-group="${escapeHtml(group.id)}">
+                            ${escapeHtml(group.icon)} ${escapeHtml(group.title_en)}
+                        </button>
+                    `).join("")}
+                </div>
+                <article class="animal-story-card">
+                    <div>
+                        <p class="eyebrow">${escapeHtml(story.title_en || "Animal Mini Story")}</p>
+                        <h3>${escapeHtml(story.title_ar || "قصة قصيرة مع الحيوانات")}</h3>
+                    </div>
+                    <div class="animal-story-lines">
+                        <div>${(story.english || []).map(line => `<p>${escapeHtml(line)}</p>`).join("")}</div>
+                        <div>${(story.arabic || []).map(line => `<p>${escapeHtml(line)}</p>`).join("")}</div>
+                    </div>
+                    <div class="animal-story-actions">
+                        <button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(storyText)}">استمع للقصة</button>
+                        <button class="vocab-mini-btn teal" type="button" data-vocab-mic="${escapeHtml(storyText)}">اقرأ بالمايك</button>
+                        <button class="vocab-mini-btn gold" type="button" data-animal-story-complete>تم فهم القصة</button>
+                    </div>
+                    <div class="digraph-final-question">
+                        <strong>${escapeHtml(story.question || "What animal can run?")}</strong>
+                        <div class="vocab-quiz-options">
+                            ${(story.options || []).map(option => `
+                                <button class="vocab-mini-btn" type="button" data-animal-story-answer="${escapeHtml(option)}" data-animal-story-correct="${escapeHtml(story.answer || "")}">
+                                    ${escapeHtml(option)}
+                                </button>
+                            `).join("")}
+                        </div>
+                    </div>
+                </article>
+                <div class="animal-sentence-grid">
+                    ${sentences.map(item => `
+                        <article class="animal-sentence-card">
+                            <strong>${escapeHtml(item.sentence)}</strong>
+                            <span>${escapeHtml(item.arabic)}</span>
+                            <div class="vocab-word-actions">
+                                <button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(item.sentence)}">استمع</button>
+                                <button class="vocab-mini-btn teal" type="button" data-vocab-mic="${escapeHtml(item.sentence)}">مايك</button>
+                            </div>
+                        </article>
+                    `).join("")}
+                </div>
+            `;
+        }
+
+        function renderSpecialVocabularyLesson(category) {
+            if (!els.vocabAnimalLesson) return;
+            const isAnimals = category.id === "animals";
+            const isFoods = category.id === "foods";
+            const isCalendar = category.id === "calendar";
+            if (!isAnimals && !isFoods && !isCalendar) {
+                els.vocabAnimalLesson.innerHTML = "";
+                return;
+            }
+
+            const groups = category.groups || [];
+            const activeGroupId = isCalendar ? vocabularyState.activeCalendarGroup : (isFoods ? vocabularyState.activeFoodGroup : vocabularyState.activeAnimalGroup);
+            const activeGroup = groups.find(group => group.id === activeGroupId) || groups[0];
+            if (activeGroup) {
+                if (isCalendar) vocabularyState.activeCalendarGroup = activeGroup.id;
+                else if (isFoods) vocabularyState.activeFoodGroup = activeGroup.id;
+                else vocabularyState.activeAnimalGroup = activeGroup.id;
+            }
+
+            const masteredSet = isCalendar ? vocabularyState.masteredCalendar : (isFoods ? vocabularyState.masteredFoods : vocabularyState.masteredAnimals);
+            const reviewSet = isCalendar ? vocabularyState.reviewCalendar : (isFoods ? vocabularyState.reviewFoods : vocabularyState.reviewAnimals);
+            const quizScore = isCalendar ? vocabularyState.calendarQuizScore : (isFoods ? vocabularyState.foodQuizScore : vocabularyState.animalQuizScore);
+            const story = category.story || {};
+            const storyText = [...(story.english || [])].join(" ");
+            const storyQuestions = story.questions || [{ question: story.question, options: story.options || [], answer: story.answer }];
+            const itemLabel = isCalendar ? "أيام وأشهر متقنة" : (isFoods ? "أطعمة متقنة" : "حيوانات متقنة");
+            const groupAria = isCalendar ? "Calendar groups" : (isFoods ? "Food groups" : "Animal groups");
+            const groupAttr = isCalendar ? "data-calendar-group" : (isFoods ? "data-food-group" : "data-animal-group");
+            const storyCompleteAttr = isCalendar ? "data-calendar-story-complete" : (isFoods ? "data-food-story-complete" : "data-animal-story-complete");
+            const storyAnswerAttr = isCalendar ? "data-calendar-story-answer" : (isFoods ? "data-food-story-answer" : "data-animal-story-answer");
+            const storyCorrectAttr = isCalendar ? "data-calendar-story-correct" : (isFoods ? "data-food-story-correct" : "data-animal-story-correct");
+            const storyTitleFallback = isCalendar ? "Calendar Mini Story" : (isFoods ? "Food Mini Story" : "Animal Mini Story");
+            const storyArabicFallback = isCalendar ? "قصة قصيرة مع الأيام والأشهر" : (isFoods ? "قصة قصيرة مع الأطعمة" : "قصة قصيرة مع الحيوانات");
+            const activeId = isCalendar ? vocabularyState.activeCalendarGroup : (isFoods ? vocabularyState.activeFoodGroup : vocabularyState.activeAnimalGroup);
+
+            els.vocabAnimalLesson.innerHTML = `
+                <div class="animal-progress-strip">
+                    <div>${itemLabel}<span>${category.words.filter(word => masteredSet.has(vocabularyWordKey(word.word))).length}/${category.words.length}</span></div>
+                    <div>آخر اختبار<span>${escapeHtml(quizScore || "-")}</span></div>
+                    <div>تحتاج مراجعة<span>${reviewSet.size}</span></div>
+                </div>
+                <div class="animal-group-tabs" aria-label="${escapeHtml(groupAria)}">
+                    ${groups.map(group => `
+                        <button class="animal-group-tab${group.id === activeId ? " active" : ""}" type="button" ${groupAttr}="${escapeHtml(group.id)}">
+                            ${escapeHtml(group.icon)} ${escapeHtml(group.title_en)}
+                        </button>
+                    `).join("")}
+                </div>
+                <article class="animal-story-card">
+                    <div>
+                        <p class="eyebrow">${escapeHtml(story.title_en || storyTitleFallback)}</p>
+                        <h3>${escapeHtml(story.title_ar || storyArabicFallback)}</h3>
+                    </div>
+                    <div class="animal-story-lines">
+                        <div>${(story.english || []).map(line => `<p>${escapeHtml(line)}</p>`).join("")}</div>
+                        <div>${(story.arabic || []).map(line => `<p>${escapeHtml(line)}</p>`).join("")}</div>
+                    </div>
+                    <div class="animal-story-actions">
+                        <button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(storyText)}">استمع للقصة</button>
+                        <button class="vocab-mini-btn teal" type="button" data-vocab-mic="${escapeHtml(storyText)}">اقرأ بالمايك</button>
+                        <button class="vocab-mini-btn gold" type="button" ${storyCompleteAttr}>تم فهم القصة</button>
+                    </div>
+                    ${storyQuestions.map(question => `
+                        <div class="digraph-final-question">
+                            <strong>${escapeHtml(question.question || "")}</strong>
+                            <div class="vocab-quiz-options">
+                                ${(question.options || []).map(option => `
+                                    <button class="vocab-mini-btn" type="button" ${storyAnswerAttr}="${escapeHtml(option)}" ${storyCorrectAttr}="${escapeHtml(question.answer || "")}">
+                                        ${escapeHtml(option)}
+                                    </button>
+                                `).join("")}
+                            </div>
+                        </div>
+                    `).join("")}
+                </article>
+                <div class="animal-sentence-grid">
+                    ${(category.sentences || []).map(item => `
+                        <article class="animal-sentence-card">
+                            <strong>${escapeHtml(item.sentence)}</strong>
+                            <span>${escapeHtml(item.arabic)}</span>
+                            <div class="vocab-word-actions">
+                                <button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(item.sentence)}">استمع</button>
+                                <button class="vocab-mini-btn teal" type="button" data-vocab-mic="${escapeHtml(item.sentence)}">مايك</button>
+                            </div>
+                        </article>
+                    `).join("")}
+                </div>
+            `;
+        }
+
+        function renderVocabularyWords() {
+            const category = vocabularyCategory();
+            if (!category) return;
+            els.vocabActiveTitle.textContent = category.title_ar;
+            els.vocabActiveSubtitle.textContent = category.title_en;
+            els.vocabWorksheetLink.href = `${pageUrls.worksheet}?sheet=${category.worksheet}`;
+            renderSpecialVocabularyLesson(category);
+            const activeGroup = category.id === "animals" ? activeAnimalGroup() : (category.id === "foods" ? activeFoodGroup() : (category.id === "calendar" ? activeCalendarGroup() : null));
+            const visibleWords = activeGroup?.words || category.words;
+            els.vocabWordGrid.innerHTML = visibleWords.map(item => {
+                const key = vocabularyWordKey(item.word);
+                const stateClass = vocabularyState.masteredWords.has(key) ? " mastered" : (vocabularyState.reviewWords.has(key) ? " review" : "");
+                return `
+                    <article class="vocab-word-card${stateClass}">
+                        <div class="vocab-word-icon">${escapeHtml(item.icon)}</div>
+                        <div class="vocab-word-meta">
+                            <strong>${escapeHtml(item.word)}</strong>
+                            <span>${escapeHtml(item.arabic)}</span>
+                        </div>
+                        ${item.group_en ? `<div class="animal-card-badge">${escapeHtml(item.group_en)}</div>` : ""}
+                        <div class="vocab-example">
+                            <div>${escapeHtml(item.example)}</div>
+                            <div>${escapeHtml(item.example_ar)}</div>
+                        </div>
+                        <div class="vocab-word-actions">
+                            <button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(item.word)}">استمع</button>
+                            <button class="vocab-mini-btn" type="button" data-vocab-listen="${escapeHtml(item.example)}">استمع للجملة</button>
+                            <button class="vocab-mini-btn teal" type="button" data-vocab-mic="${escapeHtml(item.word)}">جرّب النطق</button>
+                            <button class="vocab-mini-btn gold" type="button" data-vocab-review="${escapeHtml(item.word)}">أضف للمراجعة</button>
+                            <button class="vocab-mini-btn" type="button" data-vocab-master="${escapeHtml(item.word)}">أتقنت</button>
+                        </div>
+                    </article>
+                `;
+            }).join("");
+        }
+
+        function renderVocabularyPractice() {
+            const category = vocabularyCategory();
+            const activities = buildVocabularyPractice(category);
+            els.vocabPracticeArea.innerHTML = activities.map((activity, index) => `
+                <div class="digraph-final-question">
+                    <strong>${escapeHtml(activity.title)}</strong>
+                    <p>${escapeHtml(activity.prompt)}</p>
+                    ${activity.listen ? `<button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(activity.listen)}">استمع</button>` : ""}
+                    ${activity.mic ? `<button class="vocab-mini-btn teal" type="button" data-vocab-mic="${escapeHtml(activity.mic)}">اقرأ بالمايك</button>` : ""}
+                    ${activity.options.length ? `
+                        <div class="vocab-quiz-options">
+                            ${activity.options.map(option => `<button class="vocab-mini-btn" type="button" data-vocab-practice-answer="${escapeHtml(option)}" data-vocab-practice-correct="${escapeHtml(activity.answer)}" data-vocab-practice-index="${index}">${escapeHtml(option)}</button>`).join("")}
+                        </div>
+                    ` : ""}
+                </div>
+            `).join("");
+        }
+
+        function renderVocabularyQuiz() {
+            if (!vocabularyState.currentQuiz.length) {
+                els.vocabQuizArea.innerHTML = `<p>اختر اختبار التصنيف أو الاختبار الشامل لعرض الأسئلة.</p>`;
+                return;
+            }
+            els.vocabQuizArea.innerHTML = vocabularyState.currentQuiz.map((question, index) => `
+                <div class="digraph-final-question">
+                    <strong>${index + 1}. ${escapeHtml(question.prompt)}</strong>
+                    ${question.listen ? `<button class="vocab-mini-btn primary" type="button" data-vocab-listen="${escapeHtml(question.listen)}">استمع</button>` : ""}
+                    <div class="vocab-quiz-options">
+                        ${question.options.map(option => {
+                            const className = question.answered
+                                ? (option === question.answer ? " correct" : (option === question.selected_answer ? " wrong" : ""))
+                                : "";
+                            return `<button class="vocab-mini-btn${className}" type="button" data-vocab-quiz-answer="${escapeHtml(option)}" data-vocab-quiz-index="${index}">${escapeHtml(option)}</button>`;
+                        }).join("")}
+                    </div>
+                </div>
+            `).join("");
+        }
+
+        function renderVocabulary() {
+            renderVocabularyProgress();
+            renderVocabularyCategories();
+            renderVocabularyWords();
+            renderVocabularyPractice();
+            renderVocabularyQuiz();
+        }
+
+        function grammarLesson(lessonId = grammarState.activeLesson) {
+            return levelTwoGrammarLessons.find(lesson => lesson.id === lessonId) || levelTwoGrammarLessons[0];
+        }
+
+        function grammarItemsFor(lesson) {
+            return (lesson?.groups || []).flatMap(group =>
+                (group.entries || []).map(item => ({ ...item, group_id: group.id, group_ar: group.title_ar, group_en: group.title_en }))
+            );
+        }
+
+        function grammarItemKey(value) {
+            return String(value || "").toLowerCase();
+        }
+
+        function saveGrammarProgress() {
+            localStorage.setItem(grammarStorageKey, JSON.stringify({
+                last_lesson: grammarState.activeLesson,
+                mastered_lessons: [...grammarState.masteredLessons],
+                review_lessons: [...grammarState.reviewLessons],
+                mastered_items: [...grammarState.masteredItems],
+                review_items: [...grammarState.reviewItems],
+                mic_attempts: grammarState.micAttempts,
+                mic_success: grammarState.micSuccess,
+                practice_attempts: grammarState.practiceAttempts,
+                practice_correct: grammarState.practiceCorrect
+            }));
+        }
+
+        function markGrammarItemMastered(term, lessonId = grammarState.activeLesson) {
+            const key = grammarItemKey(term);
+            grammarState.masteredItems.add(key);
+            grammarState.reviewItems.delete(key);
+            const lesson = grammarLesson(lessonId);
+            const lessonItems = grammarItemsFor(lesson);
+            const masteredCount = lessonItems.filter(item => grammarState.masteredItems.has(grammarItemKey(item.term))).length;
+            if (lessonItems.length && masteredCount >= Math.ceil(lessonItems.length * 0.7)) {
+                grammarState.masteredLessons.add(lesson.id);
+                grammarState.reviewLessons.delete(lesson.id);
+            }
+            saveGrammarProgress();
+            renderLevelTwoGrammar();
+        }
+
+        function markGrammarItemReview(term, lessonId = grammarState.activeLesson) {
+            const key = grammarItemKey(term);
+            if (!grammarState.masteredItems.has(key)) grammarState.reviewItems.add(key);
+            if (!grammarState.masteredLessons.has(lessonId)) grammarState.reviewLessons.add(lessonId);
+            saveGrammarProgress();
+            renderLevelTwoGrammar();
+        }
+
+        function renderGrammarProgress() {
+            if (!els.grammarProgressTitle) return;
+            const totalLessons = levelTwoGrammarLessons.length || 1;
+            const percent = Math.round((grammarState.masteredLessons.size / totalLessons) * 100);
+            const active = grammarLesson();
+            els.grammarProgressTitle.textContent = grammarState.masteredLessons.size ? `${percent}% من قواعد المستوى الثاني` : "ابدأ بأسماء الإشارة";
+            els.grammarProgressFill.style.width = `${percent}%`;
+            els.grammarMasteredCount.textContent = `${grammarState.masteredLessons.size}/${totalLessons}`;
+            els.grammarReviewCount.textContent = grammarState.reviewLessons.size;
+            els.grammarMicScore.textContent = `${grammarState.micSuccess}/${grammarState.micAttempts}`;
+            els.grammarLastLesson.textContent = active?.title_ar || "-";
+            const review = [...grammarState.reviewItems].slice(0, 8);
+            els.grammarReviewList.innerHTML = review.length
+                ? review.map(item => `<span>${escapeHtml(item)}</span>`).join("")
+                : "<span>لا توجد عناصر مراجعة الآن</span>";
+        }
+
+        function renderGrammarLessonCards() {
+            if (!els.grammarLessonGrid) return;
+            els.grammarLessonGrid.innerHTML = levelTwoGrammarLessons.map(lesson => {
+                const items = grammarItemsFor(lesson);
+                const mastered = items.filter(item => grammarState.masteredItems.has(grammarItemKey(item.term))).length;
+                const activeClass = lesson.id === grammarState.activeLesson ? " active" : "";
+                return `
+                    <article class="vocab-category-card${activeClass}">
+                        <div class="vocab-category-icon">${escapeHtml(lesson.icon)}</div>
+                        <h3>${escapeHtml(lesson.title_ar)}</h3>
+                        <strong>${escapeHtml(lesson.title_en)}</strong>
+                        <span>${items.length} عناصر · متقن ${mastered}</span>
+                        <div class="vocab-category-actions">
+                            <button class="vocab-mini-btn primary" type="button" data-grammar-lesson="${escapeHtml(lesson.id)}">ابدأ الدرس</button>
+                            <a class="vocab-mini-btn gold" href="${pageUrls.worksheet}?sheet=${escapeHtml(lesson.worksheet)}" target="_blank">ورقة العمل</a>
+                        </div>
+                    </article>
+                `;
+            }).join("");
+        }
+
+        function renderGrammarLessonContent() {
+            const lesson = grammarLesson();
+            if (!lesson || !els.grammarLessonPanel) return;
+            const items = grammarItemsFor(lesson);
+            els.grammarActiveTitle.textContent = lesson.title_ar;
+            els.grammarActiveSubtitle.textContent = lesson.title_en;
+            els.grammarWorksheetLink.href = `${pageUrls.worksheet}?sheet=${lesson.worksheet}`;
+            els.grammarLessonPanel.innerHTML = `
+                <div class="animal-progress-strip">
+                    <div>العناصر<span>${items.filter(item => grammarState.masteredItems.has(grammarItemKey(item.term))).length}/${items.length}</span></div>
+                    <div>التدريب<span>${grammarState.practiceCorrect}/${grammarState.practiceAttempts}</span></div>
+                    <div>المايك<span>${grammarState.micSuccess}/${grammarState.micAttempts}</span></div>
+                </div>
+                <article class="animal-story-card">
+                    <div>
+                        <p class="eyebrow">${escapeHtml(lesson.title_en)}</p>
+                        <h3>${escapeHtml(lesson.title_ar)}</h3>
+                    </div>
+                    <div class="animal-story-lines">
+                        <div>
+                            <p>${escapeHtml(lesson.rule_en)}</p>
+                            <p><strong>${escapeHtml(lesson.structure)}</strong></p>
+                        </div>
+                        <div>
+                            <p>${escapeHtml(lesson.summary_ar)}</p>
+                            <p>استمع إلى الأمثلة ثم اقرأها بالمايك.</p>
+                        </div>
+                    </div>
+                    <div class="animal-story-actions">
+                        <button class="vocab-mini-btn primary" type="button" data-grammar-listen="${escapeHtml(items[0]?.example || lesson.title_en)}">استمع لأول مثال</button>
+                        <button class="vocab-mini-btn teal" type="button" data-grammar-mic="${escapeHtml(items[0]?.example || lesson.title_en)}" data-grammar-mic-term="${escapeHtml(items[0]?.term || lesson.title_en)}">اقرأ بالمايك</button>
+                    </div>
+                </article>
+                <div class="animal-group-tabs" aria-label="Level two grammar groups">
+                    ${(lesson.groups || []).map(group => `
+                        <span class="animal-group-tab active">${escapeHtml(group.title_en)} · ${escapeHtml(group.title_ar)}</span>
+                    `).join("")}
+                </div>
+            `;
+            els.grammarItemGrid.innerHTML = items.map(item => {
+                const key = grammarItemKey(item.term);
+                const stateClass = grammarState.masteredItems.has(key) ? " mastered" : (grammarState.reviewItems.has(key) ? " review" : "");
+                return `
+                    <article class="vocab-word-card${stateClass}">
+                        <div class="vocab-word-icon">${escapeHtml(lesson.icon)}</div>
+                        <div class="vocab-word-meta">
+                            <strong>${escapeHtml(item.term)}</strong>
+                            <span>${escapeHtml(item.arabic)}</span>
+                        </div>
+                        <div class="animal-card-badge">${escapeHtml(item.group_en)}</div>
+                        <div class="vocab-example">
+                            <div>${escapeHtml(item.example)}</div>
+                            <div>${escapeHtml(item.example_ar)}</div>
+                            <small>${escapeHtml(item.use_ar)}</small>
+                        </div>
+                        <div class="vocab-word-actions">
+                            <button class="vocab-mini-btn primary" type="button" data-grammar-listen="${escapeHtml(item.term)}">استمع</button>
+                            <button class="vocab-mini-btn" type="button" data-grammar-listen="${escapeHtml(item.example)}">استمع للجملة</button>
+                            <button class="vocab-mini-btn teal" type="button" data-grammar-mic="${escapeHtml(item.example)}" data-grammar-mic-term="${escapeHtml(item.term)}">مايك</button>
+                            <button class="vocab-mini-btn gold" type="button" data-grammar-review="${escapeHtml(item.term)}">مراجعة</button>
+                            <button class="vocab-mini-btn" type="button" data-grammar-master="${escapeHtml(item.term)}">أتقنت</button>
+                        </div>
+                    </article>
+                `;
+            }).join("");
+        }
+
+        function renderGrammarPractice() {
+            const lesson = grammarLesson();
+            if (!lesson || !els.grammarPracticeArea) return;
+            els.grammarPracticeArea.innerHTML = (lesson.activities || []).map((activity, index) => `
+                <div class="digraph-final-question">
+                    <strong>${escapeHtml(activity.title)}</strong>
+                    <p>${escapeHtml(activity.prompt)}</p>
+                    ${activity.listen ? `<button class="vocab-mini-btn primary" type="button" data-grammar-listen="${escapeHtml(activity.listen)}">استمع</button>` : ""}
+                    ${activity.mic ? `<button class="vocab-mini-btn teal" type="button" data-grammar-mic="${escapeHtml(activity.mic)}" data-grammar-mic-term="${escapeHtml(activity.answer)}">اقرأ بالمايك</button>` : ""}
+                    ${activity.options.length ? `
+                        <div class="vocab-quiz-options">
+                            ${activity.options.map(option => `<button class="vocab-mini-btn" type="button" data-grammar-answer="${escapeHtml(option)}" data-grammar-correct="${escapeHtml(activity.answer)}" data-grammar-index="${index}">${escapeHtml(option)}</button>`).join("")}
+                        </div>
+                    ` : ""}
+                </div>
+            `).join("");
+
+            const speakingItems = grammarItemsFor(lesson).slice(0, 4);
+            els.grammarSpeakingArea.innerHTML = speakingItems.map(item => `
+                <article class="animal-sentence-card">
+                    <strong>${escapeHtml(item.example)}</strong>
+                    <span>${escapeHtml(item.example_ar)}</span>
+                    <div class="vocab-word-actions">
+                        <button class="vocab-mini-btn primary" type="button" data-grammar-listen="${escapeHtml(item.example)}">استمع</button>
+                        <button class="vocab-mini-btn teal" type="button" data-grammar-mic="${escapeHtml(item.example)}" data-grammar-mic-term="${escapeHtml(item.term)}">مايك</button>
+                    </div>
+                </article>
+            `).join("");
+        }
+
+        function renderLevelTwoGrammar() {
+            renderGrammarProgress();
+            renderGrammarLessonCards();
+            renderGrammarLessonContent();
+            renderGrammarPractice();
+        }
+
+        function startGrammarRecognition(target, term, button = null) {
+            grammarState.micAttempts += 1;
+            saveGrammarProgress();
+            renderGrammarProgress();
+            const original = button?.innerHTML || "";
+            if (button) {
+                button.classList.add("listening");
+                button.innerHTML = '<i class="fas fa-microphone-lines"></i> جاري الاستماع';
+            }
+            setFeedback(els.grammarMicFeedback, `${SpeechService.messages.listening} ${target}`, "warn");
+            SpeechService.startRecognition({
+                targetText: target,
+                type: "sentence",
+                section: "sounds",
+                level: "level_two_grammar",
+                onResult: result => {
+                    SpeechService.renderResult(els.grammarMicFeedback, result);
+                    if (result.status === "excellent" || result.status === "good") {
+                        grammarState.micSuccess += 1;
+                        markGrammarItemMastered(term || target);
+                    } else {
+                        markGrammarItemReview(term || target);
+                    }
+                    if (button) {
+                        button.classList.remove("listening");
+                        button.innerHTML = original;
+                    }
+                    saveGrammarProgress();
+                    renderGrammarProgress();
+                },
+                onError: result => {
+                    SpeechService.renderResult(els.grammarMicFeedback, result);
+                    markGrammarItemReview(term || target);
+                    if (button) {
+                        button.classList.remove("listening");
+                        button.innerHTML = original;
+                    }
+                    saveGrammarProgress();
+                    renderGrammarProgress();
+                },
+                onEnd: () => {
+                    if (button) {
+                        button.classList.remove("listening");
+                        button.innerHTML = original;
+                    }
+                }
+            });
+        }
+
+        function startVocabularyQuiz(categoryId = vocabularyState.activeCategory, comprehensive = false) {
+            const category = vocabularyCategory(categoryId);
+            vocabularyState.activeCategory = category.id;
+            vocabularyState.currentQuizMode = comprehensive ? "comprehensive" : "category";
+            vocabularyState.currentQuizCategory = category.id;
+            vocabularyState.currentQuiz = buildVocabularyQuiz(category, comprehensive).map(question => ({ ...question, answered: false, correct: false }));
+            vocabularyState.quizAttempts += 1;
+            if (!comprehensive && category.id === "animals") {
+                vocabularyState.animalQuizAttempts += 1;
+            }
+            if (!comprehensive && category.id === "foods") {
+                vocabularyState.foodQuizAttempts += 1;
+            }
+            if (!comprehensive && category.id === "calendar") {
+                vocabularyState.calendarQuizAttempts += 1;
+            }
+            els.vocabQuizTitle.textContent = comprehensive ? "اختبار مفردات التأسيس" : `اختبار ${category.title_ar}`;
+            setFeedback(els.vocabQuizFeedback, comprehensive ? "اختبار شامل من 20 سؤالًا." : "اختبار قصير من 5 أسئلة.");
+            if (!comprehensive && category.id === "animals") {
+                setFeedback(els.vocabQuizFeedback, "اختبار الحيوانات من 10 أسئلة.");
+            }
+            if (!comprehensive && category.id === "foods") {
+                setFeedback(els.vocabQuizFeedback, "اختبار الأطعمة من 10 أسئلة.");
+            }
+            if (!comprehensive && category.id === "calendar") {
+                setFeedback(els.vocabQuizFeedback, "اختبار الأيام والأشهر من 10 أسئلة.");
+            }
+            saveVocabularyProgress();
+            renderVocabulary();
+        }
+
+        function summarizeVocabularyQuiz() {
+            const answered = vocabularyState.currentQuiz.filter(question => question.answered);
+            const correct = answered.filter(question => question.correct);
+            if (answered.length < vocabularyState.currentQuiz.length) {
+                setFeedback(els.vocabQuizFeedback, `تمت الإجابة عن ${answered.length}/${vocabularyState.currentQuiz.length}.`, "warn");
+                return;
+            }
+
+            const percent = vocabularyState.currentQuiz.length ? Math.round((correct.length / vocabularyState.currentQuiz.length) * 100) : 0;
+            const status = percent >= 80 ? "ممتاز" : (percent >= 60 ? "جيد" : "يحتاج مراجعة");
+            const byCategory = {};
+            const animalQuiz = vocabularyState.currentQuizMode === "category" && vocabularyState.currentQuizCategory === "animals";
+            const foodQuiz = vocabularyState.currentQuizMode === "category" && vocabularyState.currentQuizCategory === "foods";
+            const calendarQuiz = vocabularyState.currentQuizMode === "category" && vocabularyState.currentQuizCategory === "calendar";
+            vocabularyState.currentQuiz.forEach(question => {
+                const scoreKey = (animalQuiz || foodQuiz || calendarQuiz) ? (question.group_id || question.category) : question.category;
+                byCategory[scoreKey] = byCategory[scoreKey] || {
+                    correct: 0,
+                    total: 0,
+                    label: question.group_title || vocabularyCategory(question.category)?.title_ar || question.category
+                };
+                byCategory[scoreKey].total += 1;
+                if (question.correct) byCategory[scoreKey].correct += 1;
+            });
+            Object.entries(byCategory).forEach(([categoryId, score]) => {
+                vocabularyState.categoryScores[categoryId] = score;
+            });
+            const ranked = Object.entries(byCategory).sort((a, b) => (b[1].correct / b[1].total) - (a[1].correct / a[1].total));
+            const strongest = ranked[0]?.[1]?.label || vocabularyCategory(ranked[0]?.[0])?.title_ar || "-";
+            const weakest = ranked[ranked.length - 1]?.[1]?.label || vocabularyCategory(ranked[ranked.length - 1]?.[0])?.title_ar || "-";
+            vocabularyState.lastQuizScore = `${percent}% - ${status}`;
+            if (animalQuiz) {
+                vocabularyState.animalQuizScore = `${percent}% - ${status}`;
+            }
+            if (foodQuiz) {
+                vocabularyState.foodQuizScore = `${percent}% - ${status}`;
+            }
+            if (calendarQuiz) {
+                vocabularyState.calendarQuizScore = `${percent}% - ${status}`;
+            }
+            setFeedback(els.vocabQuizFeedback, `${status}: ${correct.length}/${vocabularyState.currentQuiz.length}. الأقوى: ${strongest}. يحتاج مراجعة: ${weakest}.`, percent >= 80 ? "good" : (percent >= 60 ? "warn" : "bad"));
+            saveVocabularyProgress();
+            renderVocabularyProgress();
+        }
+
+        function handleVocabularyQuizAnswer(button) {
+            const index = Number(button.dataset.vocabQuizIndex);
+            const question = vocabularyState.currentQuiz[index];
+            if (!question || question.answered) return;
+            const isCorrect = button.dataset.vocabQuizAnswer === question.answer;
+            question.answered = true;
+            question.correct = isCorrect;
+            question.selected_answer = button.dataset.vocabQuizAnswer;
+            button.classList.add(isCorrect ? "correct" : "wrong");
+            if (isCorrect) {
+                markVocabularyMastered(question.word);
+            } else {
+                markVocabularyReview(question.word);
+            }
+            summarizeVocabularyQuiz();
+        }
+
+        function startVocabularyRecognition(target, button = null) {
+            vocabularyState.micAttempts += 1;
+            const trackableWord = allVocabularyWords().some(item => vocabularyWordKey(item.word) === vocabularyWordKey(target));
+            const animalTarget = isAnimalPracticeTarget(target);
+            const foodTarget = isFoodPracticeTarget(target);
+            const calendarTarget = isCalendarPracticeTarget(target);
+            saveVocabularyProgress();
+            renderVocabularyProgress();
+            const original = button?.innerHTML || "";
+            if (button) {
+                button.classList.add("listening");
+                button.innerHTML = '<i class="fas fa-microphone-lines"></i> جاري الاستماع';
+            }
+            setFeedback(els.vocabFeedback, `${SpeechService.messages.listening} ${target}`, "warn");
+            SpeechService.startRecognition({
+                targetText: target,
+                type: String(target).includes(" ") ? "sentence" : "word",
+                section: "sounds",
+                level: "foundation_vocabulary",
+                onResult: result => {
+                    SpeechService.renderResult(els.vocabFeedback, result);
+                    if (result.status === "excellent") {
+                        vocabularyState.micSuccess += 1;
+                        if (animalTarget) vocabularyState.animalMicSuccess += 1;
+                        if (foodTarget) vocabularyState.foodMicSuccess += 1;
+                        if (calendarTarget) vocabularyState.calendarMicSuccess += 1;
+                        if (trackableWord) markVocabularyMastered(target);
+                    } else if (result.status === "good") {
+                        vocabularyState.micSuccess += 1;
+                        if (animalTarget) vocabularyState.animalMicSuccess += 1;
+                        if (foodTarget) vocabularyState.foodMicSuccess += 1;
+                        if (calendarTarget) vocabularyState.calendarMicSuccess += 1;
+                        if (trackableWord) markVocabularyReview(target);
+                    } else {
+                        if (trackableWord) markVocabularyReview(target);
+                    }
+                    if (button) {
+                        button.classList.remove("listening");
+                        button.innerHTML = original;
+                    }
+                    saveVocabularyProgress();
+                    renderVocabularyProgress();
+                },
+                onError: result => {
+                    SpeechService.renderResult(els.vocabFeedback, result);
+                    if (trackableWord) markVocabularyReview(target);
+                    if (button) {
+                        button.classList.remove("listening");
+                        button.innerHTML = original;
+                    }
+                    saveVocabularyProgress();
+                    renderVocabularyProgress();
+                },
+                onEnd: () => {
+                    if (button) {
+                        button.classList.remove("listening");
+                        button.innerHTML = original;
+                    }
+                }
+            });
+        }
+
+        function highlightVowel(word, vowel, soundType, silentLetter = "") {
+            const lowerVowel = String(vowel || "").toLowerCase();
+            const silent = String(silentLetter || "").toLowerCase();
+            return String(word).split("").map(char => {
+                const lower = char.toLowerCase();
+                if (silent && lower === silent) {
+                    return `<span class="silent-letter">${escapeHtml(char)}</span>`;
+                }
+                if (lower === lowerVowel) {
+                    const markClass = soundType === "long" || soundType === "long i" || soundType === "long e" ? "long" : (soundType === "silent" || soundType === "silent-like" ? "silent" : "short");
+                    return `<span class="vowel-mark ${markClass}">${escapeHtml(char)}</span>`;
+                }
+                return escapeHtml(char);
+            }).join("");
+        }
+
+        function localSave() {
+            localStorage.setItem(storageKey, JSON.stringify([...state.completed]));
+            localStorage.setItem(advancedStorageKey, JSON.stringify({
+                seen: [...state.advancedPatternsSeen],
+                games: [...state.advancedPreviewGamesCompleted],
+                last: state.lastAdvancedPattern || ""
+            }));
+            saveVocabularyProgress();
+        }
+
+        async function syncProgress() {
+            localSave();
+            if (!isAuthenticated) {
+                els.syncStatus.textContent = "محفوظ محليا. سجل الدخول لربطه بملف المتعلم.";
+                return;
+            }
+
+            const payload = {
+                completed_items: [...state.completed],
+                quiz_attempts: state.quizAttempts,
+                quiz_correct: state.quizCorrect,
+                mic_attempts: state.micAttempts,
+                mic_success: state.micSuccess,
+                worksheet_downloads: state.worksheetDownloads,
+                last_item: state.current?.text || state.micTarget || "",
+                vowel_lessons_completed: Math.max(state.vowelLessonsCompleted, state.practicedVowels.size),
+                practiced_vowels: [...state.practicedVowels],
+                vowel_quiz_attempts: state.vowelQuizAttempts,
+                vowel_quiz_correct: state.vowelQuizCorrect,
+                vowel_microphone_attempts: state.vowelMicAttempts,
+                vowel_microphone_success: state.vowelMicSuccess,
+                last_vowel_practiced: state.lastVowelPracticed,
+                vowel_mastery_percentage: vowelMasteryPercent(),
+                last_payload: {
+                    page: "sounds",
+                    completed_count: state.completed.size,
+                    vowel_mastery_percentage: vowelMasteryPercent(),
+                    pattern_progress: patternProgressSummary(),
+                    speech: state.lastSpeechPayload
+                }
+            };
+            const payloadHash = JSON.stringify(payload);
+            if (soundProgressSyncInFlight || payloadHash === lastSoundProgressPayloadHash) {
+                els.syncStatus.textContent = "التقدم محفوظ.";
+                return;
+            }
+
+            soundProgressSyncInFlight = true;
+            try {
+                const response = await fetch(pageUrls.progress, {
+                    method: "POST",
+                    headers: {
+                        "Content-Type": "application/json",
+                        "X-CSRFToken": decodeURIComponent(getCookie("csrftoken"))
+                    },
+                    body: payloadHash
+                });
+                if (response.ok) {
+                    lastSoundProgressPayloadHash = payloadHash;
+                }
+                els.syncStatus.textContent = response.ok ? "تمت المزامنة مع ملف المتعلم." : "تعذر حفظ التقدم الآن.";
+            } catch (error) {
+                els.syncStatus.textContent = "تعذر الاتصال لحفظ التقدم.";
+            } finally {
+                soundProgressSyncInFlight = false;
+            }
+        }
+
+        function setFeedback(element, text, type = "") {
+            element.className = `feedback ${type}`.trim();
+            element.textContent = text;
+        }
+
+        function speak(text, slow = false) {
+            if (window.SpeechService?.speakText) {
+                SpeechService.speakText(text, {
+                    lang: "en-US",
+                    rate: slow ? 0.78 : (String(text).length <= 3 ? 0.8 : 0.86),
+                    pitch: 1
+                }).then(result => {
+                    if (!result.ok && window.ABCZ_DEBUG_SPEECH) console.debug("[sounds]", "speech synthesis failed", result);
+                });
+                return true;
+            }
+            if (!("speechSynthesis" in window)) {
+                return false;
+            }
+            window.speechSynthesis.cancel();
+            const utterance = new SpeechSynthesisUtterance(text);
+            utterance.lang = "en-US";
+            utterance.rate = slow ? 0.78 : (text.length <= 3 ? 0.8 : 0.86);
+            utterance.pitch = 1;
+            const voices = window.speechSynthesis.getVoices();
+            const englishVoice = voices.find(voice => voice.lang?.toLowerCase().startsWith("en"));
+            if (englishVoice) utterance.voice = englishVoice;
+            window.speechSynthesis.speak(utterance);
+            return true;
+        }
+
+        function listenOrWarn(text, feedbackElement = null, slow = false) {
+            const ok = speak(text, slow);
+            if (!ok && feedbackElement) {
+                setFeedback(feedbackElement, "المتصفح لا يدعم النطق الصوتي. جرّب Chrome أو Edge.", "bad");
+            }
+            return ok;
+        }
+
+        function openPractice(item) {
+            state.current = item;
+            els.modalText.textContent = item.text;
+            els.modalHint.textContent = item.hint;
+            els.modalTitle.textContent = item.type === "word" ? "تدريب كلمة CVC" : "تدريب مقطع صوتي";
+            setFeedback(els.modalFeedback, "استمع ثم كرر الصوت.");
+            els.modal.classList.add("open");
+            els.modal.setAttribute("aria-hidden", "false");
+            els.heroSound.textContent = item.text;
+            listenOrWarn(item.text, els.modalFeedback, item.type === "sound");
+        }
+
+        function closePractice() {
+            els.modal.classList.remove("open");
+            els.modal.setAttribute("aria-hidden", "true");
+            window.speechSynthesis?.cancel();
+        }
+
+        function complete(type, text) {
+            state.completed.add(idFor(type, text));
+            render();
+            updateStats();
+            syncProgress();
+        }
+
+        function updateStats() {
+            const total = totalItems();
+            const percent = total ? Math.round((state.completed.size / total) * 100) : 0;
+            els.doneCount.textContent = state.completed.size;
+            els.wordCount.textContent = cvcWords.length;
+            els.quizScore.textContent = `${state.quizCorrect}/${state.quizAttempts}`;
+            els.micScore.textContent = `${state.micSuccess}/${state.micAttempts}`;
+            els.progressText.textContent = `${percent}%`;
+            els.progressFill.style.width = `${percent}%`;
+            const vowelPercent = vowelMasteryPercent();
+            els.vowelProgressText.textContent = `${vowelPercent}% · ${state.practicedVowels.size}/${vowelLessons.length}`;
+            els.vowelProgressFill.style.width = `${vowelPercent}%`;
+            els.lastVowelText.textContent = state.lastVowelPracticed ? `آخر حرف: ${state.lastVowelPracticed}` : "ابدأ بحرف A أو اختر أي حرف.";
+            els.vowelBadges.innerHTML = vowelLessons.map(lesson => {
+                const earned = state.practicedVowels.has(lesson.letter);
+                return earned ? `<span class="vowel-badge"><i class="fas fa-award"></i> ${lesson.badge}</span>` : `<span class="vowel-badge" style="opacity:.55">${lesson.letter}</span>`;
+            }).join("");
+            els.vowelCertificate.classList.toggle("show", state.practicedVowels.size >= vowelLessons.length);
+            renderDigraphProgress();
+            renderTrigraphProgress();
+            renderAdvancedProgress();
+            renderVocabularyProgress();
+        }
+
+        function renderSyllables() {
+            els.syllablesBody.innerHTML = syllableRows.map(row => {
+                const cells = row.sounds.map(sound => {
+                    const done = state.completed.has(idFor("sound", sound)) ? " done" : "";
+                    return `<td><button class="sound-cell${done}" type="button" data-type="sound" data-text="${sound}" data-hint="${row.arabic} + ${sound.slice(1)}"><span>${sound}</span><small>${row.arabic} + ${sound.slice(1)}</small></button></td>`;
+                }).join("");
+                const tags = row.words.map(word => `<button class="tag" type="button" data-type="word" data-text="${word}" data-hint="كلمة تدريب">${word}</button>`).join("");
+                return `<tr><td class="letter-cell">${row.letter}<br><small>${row.arabic}</small></td>${cells}<td><div class="word-tags">${tags}</div></td></tr>`;
+            }).join("");
+        }
+
+        function renderWords() {
+            els.cvcGrid.innerHTML = cvcWords.map(item => {
+                const done = state.completed.has(idFor("word", item.word)) ? " done" : "";
+                return `
+                    <article class="word-card${done}">
+                        <div class="word-image" aria-hidden="true">${item.image}</div>
+                        <strong>${item.word}</strong>
+                        <span>${item.arabic}</span>
+                        <small>${item.family} · ${item.sound}</small>
+                        <div class="card-actions">
+                            <button class="btn tiny-btn primary" type="button" data-listen-word="${item.word}"><i class="fas fa-volume-high"></i> استمع</button>
+                            <button class="btn tiny-btn teal" type="button" data-mic-direct="${item.word}"><i class="fas fa-microphone"></i> مايك</button>
+                            <button class="btn tiny-btn gold" type="button" data-type="word" data-text="${item.word}" data-hint="${item.arabic} · ${item.prompt}"><i class="fas fa-check"></i> تدرب</button>
+                        </div>
+                    </article>
+                `;
+            }).join("");
+        }
+
+        function renderActivities() {
+            const activities = [
+                {
+                    title: "Sound Hunter",
+                    prompt: "اختر كلمة فيها short a",
+                    answer: "cat",
+                    options: ["cat", "pen", "dog", "sun"]
+                },
+                {
+                    title: "Word Family Match",
+                    prompt: "أي كلمة عائلتها -en؟",
+                    answer: "pen",
+                    options: ["pen", "cat", "bug", "top"]
+                },
+                {
+                    title: "Listen and Choose",
+                    prompt: "استمع ثم اختر الكلمة",
+                    answer: "fox",
+                    listen: "fox",
+                    options: ["box", "fox", "fan", "fun"]
+                },
+                {
+                    title: "Build the Word",
+                    prompt: "رتب الحروف: t / c / a",
+                    answer: "cat",
+                    options: ["cat", "act", "tac", "atc"]
+                },
+                {
+                    title: "Odd One Out",
+                    prompt: "اختر الكلمة المختلفة صوتيًا",
+                    answer: "dog",
+                    options: ["cat", "hat", "mat", "dog"]
+                },
+                {
+                    title: "Read Aloud",
+                    prompt: "اقرأ الكلمة بالمايك",
+                    answer: state.micTarget,
+                    mic: true,
+                    options: [state.micTarget, "تغيير الكلمة", "استمع", "ابدأ المايك"]
+                }
+            ];
+
+            els.activitiesGrid.innerHTML = activities.map((activity, index) => `
+                <article class="activity-card">
+                    <h3>${activity.title}</h3>
+                    <p>${activity.prompt}</p>
+                    <div class="activity-options">
+                        ${activity.options.map(option => `<button class="activity-option" type="button" data-activity="${index}" data-activity-answer="${option}" data-correct="${activity.answer}" data-mic-activity="${activity.mic ? "true" : "false"}">${option}</button>`).join("")}
+                    </div>
+                    ${activity.listen ? `<button class="btn primary tiny-btn" type="button" data-listen-word="${activity.listen}"><i class="fas fa-volume-high"></i> استمع</button>` : ""}
+                </article>
+            `).join("");
+        }
+
+        function renderMicWords() {
+            els.micWords.innerHTML = cvcWords.slice(0, 12).map(item => {
+                const active = item.word === state.micTarget ? " primary" : "";
+                return `<button class="mic-word${active}" type="button" data-mic-word="${item.word}">${item.image} ${item.word}</button>`;
+            }).join("");
+            els.micTarget.textContent = state.micTarget;
+        }
+
+        function renderQuiz() {
+            const question = quizQuestions[state.quizIndex % quizQuestions.length];
+            els.quizQuestion.textContent = question.question;
+            els.quizOptions.innerHTML = question.options.map(option => `<button class="quiz-option" type="button" data-answer="${option}">${option}</button>`).join("");
+            setFeedback(els.quizFeedback, question.listen ? "اضغط الاستماع ثم اختر الإجابة." : "اختر الإجابة الصحيحة.");
+            if (question.listen) listenOrWarn(question.listen, els.quizFeedback);
+        }
+
+        function renderVowels() {
+            els.vowelMap.innerHTML = vowelLessons.map(lesson => `
+                <button class="vowel-map-tile" type="button" data-scroll-vowel="${lesson.letter}">
+                    <strong>${lesson.letter}</strong>
+                    <span>${lesson.short_sound}</span>
+                    <span>${lesson.long_sound}</span>
+                </button>
+            `).join("");
+
+            els.vowelLessons.innerHTML = vowelLessons.map(lesson => {
+                const mastered = state.practicedVowels.has(lesson.letter);
+                const shortExamples = lesson.examples.filter(item => item.sound_type === "short").slice(0, 5).map(item => item.word).join(", ");
+                const longExamples = lesson.examples.filter(item => String(item.sound_type).startsWith("long")).slice(0, 5).map(item => item.word).join(", ");
+                const silentExamples = lesson.examples.filter(item => item.sound_type === "silent" || item.sound_type === "silent-like").slice(0, 4).map(item => item.word).join(", ");
+                const exampleCards = lesson.examples.map(example => `
+                    <article class="vowel-example">
+                        <div class="vowel-example-top">
+                            <div class="vowel-emoji" aria-hidden="true">${example.visual_hint}</div>
+                            <div>
+                                <div class="vowel-word">${highlightVowel(example.word, example.vowel, example.sound_type, example.silent)}</div>
+                                <strong>${example.arabic}</strong>
+                                <div class="position-label">${positionLabel(example.position)} · ${soundTypeLabel(example.sound_type)}</div>
+                            </div>
+                        </div>
+                        <div class="vowel-mini-actions">
+                            <button class="btn tiny-btn primary" type="button" data-vowel-listen="${example.word}" data-vowel-letter="${lesson.letter}"><i class="fas fa-volume-high"></i> استمع</button>
+                            <button class="btn tiny-btn teal" type="button" data-vowel-mic="${example.word}" data-vowel-letter="${lesson.letter}"><i class="fas fa-microphone"></i> مايك</button>
+                        </div>
+                        <small>${example.question}</small>
+                    </article>
+                `).join("");
+                const magicPairs = (lesson.magic_pairs || []).map(pair => `<span class="sound-pill long">${pair.from} → ${pair.to}</span>`).join("");
+                return `
+                    <article class="vowel-lesson${mastered ? " done" : ""}" id="vowel-${lesson.letter}">
+                        <div class="vowel-headline">
+                            <div class="vowel-letter">${lesson.letter}</div>
+                            <div>
+                                <p class="eyebrow">${lesson.name}</p>
+                                <h3>${lesson.letter === "Y" ? "Y أحيانًا يعمل كحرف علة" : `شرح حرف ${lesson.letter}`}</h3>
+                                <div class="sound-pills">
+                                    <span class="sound-pill short">${lesson.short_sound}</span>
+                                    <span class="sound-pill long">${lesson.long_sound}</span>
+                                    <span class="sound-pill silent">${lesson.silent_note}</span>
+                                </div>
+                            </div>
+                        </div>
+                        <div class="example-row" style="margin-bottom:10px;">
+                            <span class="sound-pill short">بداية: ${lesson.examples.filter(item => item.position === "beginning").slice(0, 3).map(item => item.word).join(", ") || "-"}</span>
+                            <span class="sound-pill long">وسط: ${lesson.examples.filter(item => item.position === "middle").slice(0, 3).map(item => item.word).join(", ") || "-"}</span>
+                            <span class="sound-pill silent">نهاية: ${lesson.examples.filter(item => item.position === "ending").slice(0, 3).map(item => item.word).join(", ") || "-"}</span>
+                        </div>
+                        <div class="example-row" style="margin-bottom:10px;">
+                            <span class="sound-pill short">Short: ${shortExamples || "-"}</span>
+                            <span class="sound-pill long">Long: ${longExamples || "-"}</span>
+                            <span class="sound-pill silent">Silent/weak: ${silentExamples || "-"}</span>
+                        </div>
+                        ${magicPairs ? `<div class="magic-note">Silent E Magic: ${magicPairs}</div>` : ""}
+                        <div class="vowel-word-list">${exampleCards}</div>
+                        <div class="vowel-quiz-box">
+                            <strong>${lesson.question.text}</strong>
+                            <div class="activity-options">
+                                ${lesson.question.options.map(option => `<button class="activity-option" type="button" data-vowel-answer="${option}" data-vowel-correct="${lesson.question.answer}" data-vowel-letter="${lesson.letter}">${option}</button>`).join("")}
+                            </div>
+                        </div>
+                        <div class="sound-actions">
+                            <button class="btn primary" type="button" data-vowel-listen="${lesson.letter}" data-vowel-letter="${lesson.letter}"><i class="fas fa-volume-high"></i> استمع للحرف</button>
+                            <button class="btn teal" type="button" data-vowel-mic="${lesson.letter}" data-vowel-letter="${lesson.letter}"><i class="fas fa-microphone"></i> انطق الحرف</button>
+                            <button class="btn gold" type="button" data-master-vowel="${lesson.letter}"><i class="fas fa-award"></i> أتقنت هذا الحرف</button>
+                        </div>
+                    </article>
+                `;
+            }).join("");
+        }
+
+        function renderVowelActivities() {
+            els.vowelActivities.innerHTML = vowelActivities.map(activity => `
+                <article class="vowel-activity">
+                    <h3>${activity.title}</h3>
+                    <p>${activity.prompt}</p>
+                    ${activity.note ? `<div class="magic-note">${activity.note}</div>` : ""}
+                    <div class="activity-options">
+                        ${activity.options.map(option => `<button class="activity-option" type="button" data-vowel-activity="${activity.id}" data-vowel-activity-answer="${option}" data-vowel-activity-correct="${activity.answer}" data-vowel-activity-listen="${activity.listen || ""}" data-vowel-activity-mic="${activity.mic ? "true" : "false"}">${option}</button>`).join("")}
+                    </div>
+                    ${activity.listen ? `<button class="btn tiny-btn primary" type="button" data-vowel-listen="${activity.listen}" data-vowel-letter=""><i class="fas fa-volume-high"></i> استمع</button>` : ""}
+                </article>
+            `).join("");
+        }
+
+        function renderDigraphProgress() {
+            if (!els.digraphProgressFill) return;
+            const mastered = masteredDigraphs();
+            const percent = digraphMasteryPercent();
+            const bestScore = digraphBestScore();
+            els.digraphProgressTitle.textContent = mastered.length ? `آخر صوت: ${state.lastDigraph || mastered[mastered.length - 1]}` : "لم يبدأ بعد";
+            els.digraphProgressFill.style.width = `${percent}%`;
+            els.digraphCompletedCount.textContent = `${mastered.length}/${digraphPatterns().length || 6}`;
+            els.digraphQuizScore.textContent = `${bestScore}%`;
+            els.digraphMicScore.textContent = `${state.patternMicSuccess.digraphs || 0}/${state.patternMicAttempts.digraphs || 0}`;
+            els.digraphCertificateStatus.textContent = digraphCertificateEarned() ? "مفتوحة" : "مقفلة";
+            if (els.digraphFinalScore) els.digraphFinalScore.textContent = `${bestScore}%`;
+            renderDigraphCertificate();
+        }
+
+        function renderDigraphCertificate() {
+            if (!els.digraphCertificate || !els.digraphCertificateDetails) return;
+            const earned = digraphCertificateEarned();
+            els.digraphCertificate.classList.toggle("show", earned);
+            if (!earned) return;
+            const mastered = masteredDigraphs();
+            const studentName = document.body.dataset.studentName || "طالب ABCZ";
+            const today = new Date().toLocaleDateString("ar-SA");
+            const localNote = isAuthenticated ? "" : `<div class="magic-note">شهادة محلية مؤقتة. سجل الدخول لحفظ الشهادة في ملف المتعلم.</div>`;
+            els.digraphCertificateDetails.innerHTML = `
+                <div class="digraph-progress-grid">
+                    <div class="digraph-stat">اسم الطالب<span>${escapeHtml(studentName)}</span></div>
+                    <div class="digraph-stat">المستوى<span>Digraphs Level</span></div>
+                    <div class="digraph-stat">نسبة الإتقان<span>${digraphMasteryPercent()}%</span></div>
+                    <div class="digraph-stat">تاريخ الإتمام<span>${escapeHtml(today)}</span></div>
+                </div>
+                <div class="magic-note">الأصوات المكتملة: ${escapeHtml(mastered.join(", ") || digraphCodes.join(", "))}</div>
+                ${localNote}
+            `;
+        }
+
+        function renderTrigraphProgress() {
+            if (!els.trigraphProgressFill) return;
+            const mastered = masteredTrigraphs();
+            const percent = trigraphMasteryPercent();
+            const bestScore = trigraphBestScore();
+            els.trigraphProgressTitle.textContent = mastered.length ? `آخر نمط: ${state.lastTrigraph || mastered[mastered.length - 1]}` : "لم يبدأ بعد";
+            els.trigraphProgressFill.style.width = `${percent}%`;
+            els.trigraphCompletedCount.textContent = `${mastered.length}/${trigraphPatterns().length || 6}`;
+            els.trigraphQuizScore.textContent = `${bestScore}%`;
+            els.trigraphMicScore.textContent = `${state.patternMicSuccess.trigraphs || 0}/${state.patternMicAttempts.trigraphs || 0}`;
+            els.trigraphCertificateStatus.textContent = trigraphCertificateEarned() ? "مفتوحة" : "مقفلة";
+            if (els.trigraphFinalScore) els.trigraphFinalScore.textContent = `${bestScore}%`;
+            renderTrigraphCertificate();
+        }
+
+        function renderTrigraphCertificate() {
+            if (!els.trigraphCertificate || !els.trigraphCertificateDetails) return;
+            const earned = trigraphCertificateEarned();
+            els.trigraphCertificate.classList.toggle("show", earned);
+            if (!earned) return;
+            const mastered = masteredTrigraphs();
+            const studentName = document.body.dataset.studentName || "طالب ABCZ";
+            const today = new Date().toLocaleDateString("ar-SA");
+            const localNote = isAuthenticated ? "" : `<div class="magic-note">شهادة محلية مؤقتة. سجّل الدخول لحفظ الشهادة في ملف المتعلم.</div>`;
+            els.trigraphCertificateDetails.innerHTML = `
+                <div class="digraph-progress-grid">
+                    <div class="digraph-stat">اسم الطالب<span>${escapeHtml(studentName)}</span></div>
+                    <div class="digraph-stat">المستوى<span>Trigraphs Level</span></div>
+                    <div class="digraph-stat">نسبة الإتقان<span>${trigraphMasteryPercent()}%</span></div>
+                    <div class="digraph-stat">تاريخ الإتمام<span>${escapeHtml(today)}</span></div>
+                </div>
+                <div class="magic-note">الأنماط المكتملة: ${escapeHtml(mastered.join(", ") || trigraphCodes.join(", "))}</div>
+                ${localNote}
+            `;
+        }
+
+        function renderAdvancedProgress() {
+            if (!els.advancedProgressFill) return;
+            const patterns = advancedPatterns();
+            const percent = advancedPreviewPercent();
+            els.advancedProgressTitle.textContent = state.lastAdvancedPattern ? `آخر معاينة: ${state.lastAdvancedPattern}` : "لم تبدأ المعاينة بعد";
+            els.advancedProgressFill.style.width = `${percent}%`;
+            els.advancedSeenCount.textContent = `${advancedSeenCount()}/${patterns.length || 6}`;
+            els.advancedGamesCount.textContent = `${state.advancedPreviewGamesCompleted.size}/${advancedPreviewTaskTotal()}`;
+            els.advancedLastPattern.textContent = state.lastAdvancedPattern || "-";
+        }
+
+        function renderAdvancedQuickCheck(pattern) {
+            const questions = advancedQuickQuestions(pattern);
+            return `
+                <div class="advanced-quick-check" data-advanced-quick="${escapeHtml(pattern.pattern)}">
+                    <strong>Preview Check: ${escapeHtml(pattern.pattern)}</strong>
+                    ${questions.map((question, index) => `
+                        <div class="mini-check-question">
+                            <span>${escapeHtml(question.prompt)}</span>
+                            <div class="mini-check-options">
+                                ${question.options.map(option => {
+                                    const doneClass = state.advancedPreviewGamesCompleted.has(`quick:${pattern.pattern}:${index}`) && option === question.answer ? " correct" : "";
+                                    return `<button class="${doneClass}" type="button" data-advanced-check-answer="${escapeHtml(option)}" data-advanced-check-correct="${escapeHtml(question.answer)}" data-advanced-check-pattern="${escapeHtml(pattern.pattern)}" data-advanced-check-index="${index}">${escapeHtml(option)}</button>`;
+                                }).join("")}
+                            </div>
+                        </div>
+                    `).join("")}
+                </div>
+            `;
+        }
+
+        function renderAdvancedPreviewCards(group, container) {
+            const orderedPatterns = [...group.patterns].sort((first, second) => {
+                const firstIndex = advancedPatternCodes.indexOf(first.pattern);
+                const secondIndex = advancedPatternCodes.indexOf(second.pattern);
+                return (firstIndex === -1 ? 99 : firstIndex) - (secondIndex === -1 ? 99 : secondIndex);
+            });
+            container.innerHTML = `
+                <section class="pattern-group" id="pattern-group-${escapeHtml(group.id)}">
+                    <div class="pattern-group-head">
+                        <div>
+                            <p class="eyebrow">${escapeHtml(group.subtitle)} · خريطة طريق</p>
+                            <h3>${escapeHtml(group.title)}</h3>
+                            <div class="pattern-subtitle">${escapeHtml(group.explanation)}</div>
+                        </div>
+                        <span class="pattern-chip"><i class="fas fa-lock"></i> معاينة فقط</span>
+                    </div>
+                    <div class="pattern-grid">
+                        ${orderedPatterns.map(pattern => {
+                            const seen = state.advancedPatternsSeen.has(pattern.pattern);
+                            const color = advancedColors[pattern.pattern] || "#334155";
+                            return `
+                                <article class="pattern-card advanced-preview-card${seen ? " done" : ""}" style="--pattern-color:${color};">
+                                    <div class="pattern-card-top">
+                                        <div class="pattern-sound">
+                                            <span class="pattern-symbol">${escapeHtml(pattern.pattern)}</span>
+                                            <span class="pattern-chip">${escapeHtml(pattern.sound)}</span>
+                                            <span class="pattern-chip">${escapeHtml(pattern.arabic_sound)}</span>
+                                            <span class="advanced-preview-badge"><i class="fas fa-lock"></i> Preview</span>
+                                        </div>
+                                        <span class="pattern-mastered-mark">${seen ? "✓" : ""}</span>
+                                    </div>
+                                    <h4>${escapeHtml(pattern.pattern)} pattern</h4>
+                                    <div class="pattern-rule">${escapeHtml(pattern.rule)}</div>
+                                    ${pattern.note ? `<div class="magic-note">${escapeHtml(pattern.note)}</div>` : ""}
+                                    <div class="pattern-examples">
+                                        ${(pattern.examples || []).map(example => `
+                                            <div class="pattern-example">
+                                                <div class="pattern-example-icon" aria-hidden="true">${example.visual_hint || "🔎"}</div>
+                                                <div>
+                                                    <div class="pattern-word">${escapeHtml(example.word)}</div>
+                                                    <strong>${escapeHtml(example.arabic)}</strong>
+                                                    <div class="pattern-example-note">
+                                                        <span class="position-chip">${positionText(example.position)}</span>
+                                                        ${escapeHtml(example.note || "")}
+                                                    </div>
+                                                    <div class="card-actions">
+                                                        <button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="advanced_patterns"><i class="fas fa-volume-high"></i> استمع</button>
+                                                        <button class="btn tiny-btn teal" type="button" data-pattern-mic="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="advanced_patterns"><i class="fas fa-microphone"></i> جرّب النطق</button>
+                                                    </div>
+                                                </div>
+                                            </div>
+                                        `).join("")}
+                                    </div>
+                                    ${renderAdvancedQuickCheck(pattern)}
+                                    <div class="advanced-card-actions">
+                                        <button class="btn" type="button" data-advanced-preview="${escapeHtml(pattern.pattern)}"><i class="fas fa-lock"></i> معاينة فقط</button>
+                                        <button class="btn gold" type="button" data-advanced-seen="${escapeHtml(pattern.pattern)}"><i class="fas fa-eye"></i> شاهدت النمط</button>
+                                        <button class="btn" type="button" data-advanced-review="${escapeHtml(pattern.pattern)}"><i class="fas fa-bookmark"></i> للمراجعة لاحقًا</button>
+                                    </div>
+                                </article>
+                            `;
+                        }).join("")}
+                    </div>
+                </section>
+            `;
+        }
+
+        function renderMiniCheck(pattern) {
+            const questions = miniCheckQuestions(pattern);
+            const score = digraphMiniScore(pattern.pattern);
+            const feedbackText = score >= 2 ? `أحسنت! أتقنت ${pattern.pattern}.` : "أجب عن سؤالين من ثلاثة لإتقان الصوت.";
+            return `
+                <div class="mini-check" data-mini-check="${escapeHtml(pattern.pattern)}">
+                    <strong>Mini Check: ${escapeHtml(pattern.pattern)}</strong>
+                    ${questions.map((question, index) => `
+                        <div class="mini-check-question">
+                            <span>${escapeHtml(question.prompt)}</span>
+                            <div class="mini-check-options">
+                                ${question.options.map((option, optionIndex) => {
+                                    const label = question.displayOptions?.[optionIndex] || option;
+                                    const doneClass = state.completed.has(idFor("digraph-mini", `${pattern.pattern}:${index}`)) && option === question.answer ? " correct" : "";
+                                    return `<button class="${doneClass}" type="button" data-mini-check-answer="${escapeHtml(option)}" data-mini-check-correct="${escapeHtml(question.answer)}" data-mini-check-pattern="${escapeHtml(pattern.pattern)}" data-mini-check-index="${index}">${escapeHtml(label)}</button>`;
+                                }).join("")}
+                            </div>
+                        </div>
+                    `).join("")}
+                    <div class="pattern-example-note">${feedbackText} (${score}/3)</div>
+                </div>
+            `;
+        }
+
+        function renderTrigraphMiniCheck(pattern) {
+            const questions = trigraphMiniCheckQuestions(pattern);
+            const score = trigraphMiniScore(pattern.pattern);
+            const feedbackText = score >= 2 ? `أحسنت! أتقنت ${pattern.pattern}.` : "أجب عن سؤالين من ثلاثة لإتقان النمط.";
+            return `
+                <div class="mini-check" data-mini-check="${escapeHtml(pattern.pattern)}">
+                    <strong>Mini Check: ${escapeHtml(pattern.pattern)}</strong>
+                    ${questions.map((question, index) => `
+                        <div class="mini-check-question">
+                            <span>${escapeHtml(question.prompt)}</span>
+                            <div class="mini-check-options">
+                                ${question.options.map((option, optionIndex) => {
+                                    const label = question.displayOptions?.[optionIndex] || option;
+                                    const doneClass = state.completed.has(idFor("trigraph-mini", `${pattern.pattern}:${index}`)) && option === question.answer ? " correct" : "";
+                                    return `<button class="${doneClass}" type="button" data-trigraph-mini-answer="${escapeHtml(option)}" data-trigraph-mini-correct="${escapeHtml(question.answer)}" data-trigraph-mini-pattern="${escapeHtml(pattern.pattern)}" data-trigraph-mini-index="${index}">${escapeHtml(label)}</button>`;
+                                }).join("")}
+                            </div>
+                        </div>
+                    `).join("")}
+                    <div class="pattern-example-note">${feedbackText} (${score}/3)</div>
+                </div>
+            `;
+        }
+
+        function renderDigraphCards(group, container) {
+            container.innerHTML = `
+                <section class="pattern-group" id="pattern-group-${escapeHtml(group.id)}">
+                    <div class="pattern-group-head">
+                        <div>
+                            <p class="eyebrow">${escapeHtml(group.subtitle)} · بعد CVC</p>
+                            <h3>${escapeHtml(group.title)}</h3>
+                            <div class="pattern-subtitle">${escapeHtml(group.explanation)}</div>
+                        </div>
+                        <span class="pattern-chip">6 أنماط</span>
+                    </div>
+                    <div class="pattern-grid">
+                        ${group.patterns.map(pattern => {
+                            const mastered = state.completed.has(idFor("pattern", pattern.pattern));
+                            const miniScore = digraphMiniScore(pattern.pattern);
+                            const progress = mastered ? 100 : Math.round((miniScore / 3) * 75);
+                            const color = digraphColors[pattern.pattern] || "#2255d8";
+                            return `
+                                <article class="pattern-card${mastered ? " done" : ""}" style="--pattern-color:${color};">
+                                    <div class="pattern-card-top">
+                                        <div class="pattern-sound">
+                                            <span class="pattern-symbol">${escapeHtml(pattern.pattern)}</span>
+                                            <span class="pattern-chip">${escapeHtml(pattern.sound)}</span>
+                                            <span class="pattern-chip">${escapeHtml(pattern.arabic_sound)}</span>
+                                        </div>
+                                        <span class="pattern-mastered-mark">${mastered ? "✓" : ""}</span>
+                                    </div>
+                                    <h4>${escapeHtml(pattern.pattern)} pattern</h4>
+                                    <div class="pattern-rule">${escapeHtml(pattern.rule)}</div>
+                                    <div class="pattern-progress">
+                                        <div class="pattern-progress-label">
+                                            <span>تقدم البطاقة</span>
+                                            <span>${progress}%</span>
+                                        </div>
+                                        <div class="progress-track"><div class="progress-fill" style="width:${progress}%"></div></div>
+                                    </div>
+                                    <div class="pattern-examples">
+                                        ${(pattern.examples || []).map(example => `
+                                            <div class="pattern-example">
+                                                <div class="pattern-example-icon" aria-hidden="true">${example.visual_hint || "🔊"}</div>
+                                                <div>
+                                                    <div class="pattern-word">${escapeHtml(example.word)}</div>
+                                                    <strong>${escapeHtml(example.arabic)}</strong>
+                                                    <div class="pattern-example-note">
+                                                        <span class="position-chip">${positionText(example.position)}</span>
+                                                        ${escapeHtml(example.note || "")}
+                                                    </div>
+                                                    <div class="card-actions">
+                                                        <button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="digraphs"><i class="fas fa-volume-high"></i> استمع</button>
+                                                        <button class="btn tiny-btn teal" type="button" data-pattern-mic="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="digraphs"><i class="fas fa-microphone"></i> مايك</button>
+                                                    </div>
+                                                </div>
+                                            </div>
+                                        `).join("")}
+                                    </div>
+                                    ${renderMiniCheck(pattern)}
+                                    <button class="btn gold" type="button" data-pattern-complete="${escapeHtml(pattern.pattern)}" data-pattern-category="digraphs"><i class="fas fa-check"></i> أتقنت هذا الصوت</button>
+                                </article>
+                            `;
+                        }).join("")}
+                    </div>
+                </section>
+            `;
+        }
+
+        function renderTrigraphCards(group, container) {
+            const orderedPatterns = [...group.patterns].sort((first, second) => {
+                const firstIndex = trigraphCodes.indexOf(first.pattern);
+                const secondIndex = trigraphCodes.indexOf(second.pattern);
+                return (firstIndex === -1 ? 99 : firstIndex) - (secondIndex === -1 ? 99 : secondIndex);
+            });
+            container.innerHTML = `
+                <section class="pattern-group" id="pattern-group-${escapeHtml(group.id)}">
+                    <div class="pattern-group-head">
+                        <div>
+                            <p class="eyebrow">${escapeHtml(group.subtitle)} · بعد Ending Sounds</p>
+                            <h3>${escapeHtml(group.title)}</h3>
+                            <div class="pattern-subtitle">${escapeHtml(group.explanation)}</div>
+                        </div>
+                        <span class="pattern-chip">6 أنماط</span>
+                    </div>
+                    <div class="pattern-grid">
+                        ${orderedPatterns.map(pattern => {
+                            const mastered = state.completed.has(idFor("pattern", pattern.pattern));
+                            const miniScore = trigraphMiniScore(pattern.pattern);
+                            const progress = mastered ? 100 : Math.round((miniScore / 3) * 75);
+                            const color = trigraphColors[pattern.pattern] || "#2255d8";
+                            return `
+                                <article class="pattern-card${mastered ? " done" : ""}" style="--pattern-color:${color};">
+                                    <div class="pattern-card-top">
+                                        <div class="pattern-sound">
+                                            <span class="pattern-symbol">${escapeHtml(pattern.pattern)}</span>
+                                            <span class="pattern-chip">${escapeHtml(pattern.sound)}</span>
+                                            <span class="pattern-chip">${escapeHtml(pattern.arabic_sound)}</span>
+                                        </div>
+                                        <span class="pattern-mastered-mark">${mastered ? "✓" : ""}</span>
+                                    </div>
+                                    <h4>${escapeHtml(pattern.pattern)} pattern</h4>
+                                    <div class="pattern-rule">${escapeHtml(pattern.rule)}</div>
+                                    <div class="pattern-progress">
+                                        <div class="pattern-progress-label">
+                                            <span>تقدم البطاقة</span>
+                                            <span>${progress}%</span>
+                                        </div>
+                                        <div class="progress-track"><div class="progress-fill" style="width:${progress}%"></div></div>
+                                    </div>
+                                    <div class="pattern-examples">
+                                        ${(pattern.examples || []).map(example => `
+                                            <div class="pattern-example">
+                                                <div class="pattern-example-icon" aria-hidden="true">${example.visual_hint || "🔊"}</div>
+                                                <div>
+                                                    <div class="pattern-word">${escapeHtml(example.word)}</div>
+                                                    <strong>${escapeHtml(example.arabic)}</strong>
+                                                    <div class="pattern-example-note">
+                                                        <span class="position-chip">${positionText(example.position)}</span>
+                                                        ${escapeHtml(example.note || "")}
+                                                    </div>
+                                                    <div class="card-actions">
+                                                        <button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="trigraphs"><i class="fas fa-volume-high"></i> استمع</button>
+                                                        <button class="btn tiny-btn teal" type="button" data-pattern-mic="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="trigraphs"><i class="fas fa-microphone"></i> مايك</button>
+                                                    </div>
+                                                </div>
+                                            </div>
+                                        `).join("")}
+                                    </div>
+                                    ${renderTrigraphMiniCheck(pattern)}
+                                    <button class="btn gold" type="button" data-pattern-complete="${escapeHtml(pattern.pattern)}" data-pattern-category="trigraphs"><i class="fas fa-check"></i> أتقنت هذا النمط</button>
+                                </article>
+                            `;
+                        }).join("")}
+                    </div>
+                </section>
+            `;
+        }
+
+        function renderPatternCards(category, container) {
+            const group = patternGroupById(category);
+            if (!group || !container) return;
+            if (category === "digraphs") {
+                renderDigraphCards(group, container);
+                return;
+            }
+            if (category === "trigraphs") {
+                renderTrigraphCards(group, container);
+                return;
+            }
+            if (category === "advanced_patterns") {
+                renderAdvancedPreviewCards(group, container);
+                return;
+            }
+            const locked = group.locked ? " locked" : "";
+            container.innerHTML = `
+                <section class="pattern-group" id="pattern-group-${escapeHtml(group.id)}">
+                    <div class="pattern-group-head">
+                        <div>
+                            <p class="eyebrow">${escapeHtml(group.subtitle)}</p>
+                            <h3>${escapeHtml(group.title)}</h3>
+                            <div class="pattern-subtitle">${escapeHtml(group.stage || "")}</div>
+                            <div class="pattern-subtitle">${escapeHtml(group.explanation)}</div>
+                        </div>
+                        <span class="pattern-chip">${group.locked ? "لاحقا" : `${group.patterns.length} أنماط`}</span>
+                    </div>
+                    <div class="pattern-grid">
+                        ${group.patterns.map(pattern => {
+                            const done = state.completed.has(idFor("pattern", pattern.pattern)) ? " done" : "";
+                            return `
+                                <article class="pattern-card${done}${locked}">
+                                    <div class="pattern-sound">
+                                        <span class="pattern-symbol">${escapeHtml(pattern.pattern)}</span>
+                                        <span class="pattern-chip">${escapeHtml(pattern.sound)}</span>
+                                        <span class="pattern-chip">${escapeHtml(pattern.arabic_sound)}</span>
+                                    </div>
+                                    <h4>${escapeHtml(pattern.pattern)} pattern</h4>
+                                    <div class="pattern-rule">${escapeHtml(pattern.rule)}</div>
+                                    <div class="pattern-examples">
+                                        ${(pattern.examples || []).map(example => `
+                                            <div class="pattern-example">
+                                                <div class="pattern-example-icon" aria-hidden="true">${example.visual_hint || "🔊"}</div>
+                                                <div>
+                                                    <div class="pattern-word">${escapeHtml(example.word)}</div>
+                                                    <strong>${escapeHtml(example.arabic)}</strong>
+                                                    <div class="pattern-example-note">${escapeHtml(example.note || "")}</div>
+                                                    <div class="card-actions">
+                                                        <button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(example.word)}" data-pattern-category="${escapeHtml(category)}"><i class="fas fa-volume-high"></i> استمع</button>
+                                                        <button class="btn tiny-btn teal" type="button" data-pattern-mic="${escapeHtml(example.word)}" data-pattern-id="${escapeHtml(pattern.pattern)}" data-pattern-category="${escapeHtml(category)}"><i class="fas fa-microphone"></i> مايك</button>
+                                                    </div>
+                                                </div>
+                                            </div>
+                                        `).join("") || `<div class="pattern-example-note">سيتم فتح التدريب العملي لهذا النمط في مستوى أعلى.</div>`}
+                                    </div>
+                                    ${group.locked ? "" : `<button class="btn gold" type="button" data-pattern-complete="${escapeHtml(pattern.pattern)}" data-pattern-category="${escapeHtml(category)}"><i class="fas fa-check"></i> أتقنت ${escapeHtml(pattern.pattern)}</button>`}
+                                </article>
+                            `;
+                        }).join("")}
+                    </div>
+                </section>
+            `;
+        }
+
+        function renderPatternActivity(activity) {
+            if (activity.mode === "drag") {
+                return `
+                    <article class="pattern-activity-card">
+                        <h3>${escapeHtml(activity.title)}</h3>
+                        <p>${escapeHtml(activity.prompt)}</p>
+                        <div class="pattern-drag-board" data-pattern-drag-activity="${escapeHtml(activity.id)}" data-pattern-category="${escapeHtml(activity.category)}">
+                            <div class="pattern-drag-words">
+                                ${activity.items.map(item => `<button class="pattern-drag-word" type="button" draggable="true" data-drag-word="${escapeHtml(item.word)}" data-drag-answer="${escapeHtml(item.answer)}" data-pattern-category="${escapeHtml(activity.category)}">${escapeHtml(item.word)}</button>`).join("")}
+                            </div>
+                            <div class="pattern-drop-zones">
+                                ${activity.targets.map(target => `<button class="pattern-drop-zone" type="button" data-drop-target="${escapeHtml(target)}" data-pattern-category="${escapeHtml(activity.category)}">${escapeHtml(target)}</button>`).join("")}
+                            </div>
+                        </div>
+                    </article>
+                `;
+            }
+
+            return `
+                <article class="pattern-activity-card">
+                    <h3>${escapeHtml(activity.title)}</h3>
+                    <p>${escapeHtml(activity.prompt)}</p>
+                    <div class="activity-options">
+                        ${activity.options.map(option => `<button class="activity-option" type="button" data-pattern-activity="${escapeHtml(activity.id)}" data-pattern-category="${escapeHtml(activity.category)}" data-pattern-activity-answer="${escapeHtml(option)}" data-pattern-activity-correct="${escapeHtml(activity.answer)}" data-pattern-activity-listen="${escapeHtml(activity.listen || "")}" data-pattern-activity-mic="${activity.mic ? "true" : "false"}">${escapeHtml(option)}</button>`).join("")}
+                    </div>
+                    ${activity.listen ? `<button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(activity.listen)}" data-pattern-category="${escapeHtml(activity.category)}"><i class="fas fa-volume-high"></i> استمع</button>` : ""}
+                </article>
+            `;
+        }
+
+        function renderPatternActivitiesFor(category, container) {
+            if (!container) return;
+            container.innerHTML = soundPatternActivities
+                .filter(activity => activity.category === category)
+                .map(renderPatternActivity)
+                .join("");
+        }
+
+        function renderDigraphFinalQuiz() {
+            if (!els.digraphFinalQuestions) return;
+            const questionCards = digraphFinalQuestions.map((question, index) => {
+                const completed = state.completed.has(idFor("digraph-final", question.id));
+                return `
+                    <article class="digraph-final-question">
+                        <strong>${index + 1}. ${escapeHtml(question.prompt)}</strong>
+                        <div class="digraph-final-options">
+                            ${question.options.map(option => {
+                                const doneClass = completed && option === question.answer ? " correct" : "";
+                                return `<button class="${doneClass}" type="button" data-digraph-final-answer="${escapeHtml(option)}" data-digraph-final-correct="${escapeHtml(question.answer)}" data-digraph-final-id="${escapeHtml(question.id)}" data-digraph-final-listen="${escapeHtml(question.listen || "")}">${escapeHtml(positionText(option))}</button>`;
+                            }).join("")}
+                        </div>
+                        ${question.listen ? `<button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(question.listen)}" data-pattern-category="digraphs"><i class="fas fa-volume-high"></i> استمع</button>` : ""}
+                    </article>
+                `;
+            }).join("");
+            const micCards = digraphFinalMicWords.map((word, index) => `
+                <article class="digraph-final-question">
+                    <strong>مايك اختياري ${index + 1}: اقرأ ${escapeHtml(word)}</strong>
+                    <div class="digraph-final-options">
+                        <button type="button" data-pattern-listen="${escapeHtml(word)}" data-pattern-category="digraphs">استمع</button>
+                        <button type="button" data-pattern-mic="${escapeHtml(word)}" data-pattern-id="${escapeHtml(word === "chair" ? "ch" : "wh")}" data-pattern-category="digraphs">ابدأ المايك</button>
+                    </div>
+                </article>
+            `).join("");
+            els.digraphFinalQuestions.innerHTML = questionCards + micCards;
+            renderDigraphProgress();
+        }
+
+        function renderTrigraphFinalQuiz() {
+            if (!els.trigraphFinalQuestions) return;
+            const questionCards = trigraphFinalQuestions.map((question, index) => {
+                const completed = state.completed.has(idFor("trigraph-final", question.id));
+                return `
+                    <article class="digraph-final-question">
+                        <strong>${index + 1}. ${escapeHtml(question.prompt)}</strong>
+                        <div class="digraph-final-options">
+                            ${question.options.map(option => {
+                                const doneClass = completed && option === question.answer ? " correct" : "";
+                                return `<button class="${doneClass}" type="button" data-trigraph-final-answer="${escapeHtml(option)}" data-trigraph-final-correct="${escapeHtml(question.answer)}" data-trigraph-final-id="${escapeHtml(question.id)}" data-trigraph-final-listen="${escapeHtml(question.listen || "")}">${escapeHtml(positionText(option))}</button>`;
+                            }).join("")}
+                        </div>
+                        ${question.listen ? `<button class="btn tiny-btn primary" type="button" data-pattern-listen="${escapeHtml(question.listen)}" data-pattern-category="trigraphs"><i class="fas fa-volume-high"></i> استمع</button>` : ""}
+                    </article>
+                `;
+            }).join("");
+            const micCards = trigraphFinalMicWords.map((word, index) => `
+                <article class="digraph-final-question">
+                    <strong>مايك اختياري ${index + 1}: اقرأ ${escapeHtml(word)}</strong>
+                    <div class="digraph-final-options">
+                        <button type="button" data-pattern-listen="${escapeHtml(word)}" data-pattern-category="trigraphs">استمع</button>
+                        <button type="button" data-pattern-mic="${escapeHtml(word)}" data-pattern-id="${escapeHtml(word === "bridge" ? "dge" : "spl")}" data-pattern-category="trigraphs">ابدأ المايك</button>
+                    </div>
+                </article>
+            `).join("");
+            els.trigraphFinalQuestions.innerHTML = questionCards + micCards;
+            renderTrigraphProgress();
+        }
+
+        function renderSoundPatterns() {
+            renderPatternCards("digraphs", els.digraphGroups);
+            renderPatternCards("ending_sounds", els.endingGroups);
+            renderPatternCards("trigraphs", els.trigraphGroups);
+            renderPatternCards("advanced_patterns", els.advancedGroups);
+            renderPatternActivitiesFor("digraphs", els.digraphActivities);
+            renderPatternActivitiesFor("ending_sounds", els.endingActivities);
+            renderPatternActivitiesFor("trigraphs", els.trigraphActivities);
+            renderPatternActivitiesFor("advanced_patterns", els.advancedActivities);
+            renderDigraphFinalQuiz();
+            renderDigraphProgress();
+            renderTrigraphFinalQuiz();
+            renderTrigraphProgress();
+            renderAdvancedProgress();
+        }
+
+        function render() {
+            renderSyllables();
+            renderWords();
+            renderActivities();
+            renderMicWords();
+            renderQuiz();
+            renderVowels();
+            renderVowelActivities();
+            renderSoundPatterns();
+            renderVocabulary();
+            renderLevelTwoGrammar();
+        }
+
+        function normalizeSpeechText(value) {
+            return String(value || "")
+                .toLowerCase()
+                .replace(/[^a-z\s-]/g, "")
+                .replace(/\s+/g, " ")
+                .trim();
+        }
+
+        function levenshtein(a, b) {
+            const left = normalizeSpeechText(a);
+            const right = normalizeSpeechText(b);
+            if (!left.length) return right.length;
+            if (!right.length) return left.length;
+            const matrix = Array.from({ length: left.length + 1 }, (_, i) => [i]);
+            for (let j = 1; j <= right.length; j += 1) matrix[0][j] = j;
+            for (let i = 1; i <= left.length; i += 1) {
+                for (let j = 1; j <= right.length; j += 1) {
+                    const cost = left[i - 1] === right[j - 1] ? 0 : 1;
+                    matrix[i][j] = Math.min(
+                        matrix[i - 1][j] + 1,
+                        matrix[i][j - 1] + 1,
+                        matrix[i - 1][j - 1] + cost
+                    );
+                }
+            }
+            return matrix[left.length][right.length];
+        }
+
+        function similarityScore(heard, target) {
+            const h = normalizeSpeechText(heard);
+            const t = normalizeSpeechText(target);
+            if (!h || !t) return 0;
+            if (h === t || h.includes(t) || t.includes(h)) return 100;
+            const distance = levenshtein(h, t);
+            return Math.max(0, Math.round((1 - distance / Math.max(h.length, t.length)) * 100));
+        }
+
+        function startRecognition(target, feedbackElement, options = {}) {
+            const triggerButton = options.triggerButton || null;
+            const originalButtonHtml = triggerButton?.innerHTML || "";
+            const isAdvancedPatternPreview = options.scope === "pattern" && options.patternCategory === "advanced_patterns";
+            if (!isAdvancedPatternPreview) state.micAttempts += 1;
+            if (options.scope === "vowel") {
+                state.vowelMicAttempts += 1;
+                if (options.vowelLetter) state.lastVowelPracticed = options.vowelLetter;
+            }
+            if (options.scope === "pattern" && options.patternCategory) {
+                state.patternMicAttempts[options.patternCategory] = (state.patternMicAttempts[options.patternCategory] || 0) + 1;
+                if (options.patternCategory === "digraphs" && options.patternCode) {
+                    state.lastDigraph = options.patternCode;
+                }
+                if (options.patternCategory === "trigraphs" && options.patternCode) {
+                    state.lastTrigraph = options.patternCode;
+                }
+                if (options.patternCategory === "advanced_patterns" && options.patternCode) {
+                    state.lastAdvancedPattern = options.patternCode;
+                }
+            }
+            updateStats();
+            els.bigMic.classList.add("listening");
+            if (triggerButton) {
+                triggerButton.classList.remove("correct", "wrong");
+                triggerButton.classList.add("listening");
+                triggerButton.setAttribute("aria-busy", "true");
+                triggerButton.innerHTML = '<i class="fas fa-microphone-lines"></i> جاري الاستماع';
+            }
+            setFeedback(feedbackElement, `${SpeechService.messages.listening} ${target}`, "warn");
+
+            SpeechService.startRecognition({
+                targetText: target,
+                type: options.scope === "vowel" ? "sound" : "word",
+                section: "sounds",
+                level: options.scope || "cvc",
+                onResult: result => {
+                    const masteredForProgress = result.status !== "retry";
+                    state.lastSpeechPayload = {
+                        event_type: options.scope === "vowel" ? "vowel_mic" : (options.scope === "pattern" ? "pattern_mic" : "word_mic"),
+                        target,
+                        spoken_text: result.spokenText || result.spoken || "",
+                        score: result.score,
+                        status: result.status,
+                        is_mastered: result.status === "excellent",
+                        failure_reason: result.failure_reason || null,
+                        browser_error: result.browser_error || null,
+                        section: "sounds",
+                        level: options.scope || "cvc"
+                    };
+                    SpeechService.renderResult(feedbackElement, result);
+                    if (options.scope === "pattern") {
+                        if (result.status !== "retry") {
+                            feedbackElement.insertAdjacentHTML("afterbegin", `<strong>✅ نطق صحيح</strong>`);
+                            if (triggerButton) {
+                                triggerButton.classList.remove("listening");
+                                triggerButton.classList.add("correct");
+                                triggerButton.removeAttribute("aria-busy");
+                                triggerButton.innerHTML = '<i class="fas fa-check"></i> نطق صحيح';
+                            }
+                        } else {
+                            feedbackElement.insertAdjacentHTML("beforeend", `<div class="speech-note">استمع للكلمة ثم حاول مرة أخرى.</div>`);
+                            if (triggerButton) {
+                                triggerButton.classList.remove("listening");
+                                triggerButton.classList.add("wrong");
+                                triggerButton.removeAttribute("aria-busy");
+                                triggerButton.innerHTML = originalButtonHtml;
+                                window.setTimeout(() => triggerButton.classList.remove("wrong"), 1200);
+                            }
+                        }
+                    }
+                    feedbackElement.classList.toggle("pronunciation-mastered", result.status === "excellent");
+                    if (result.status === "excellent") els.bigMic.innerHTML = '<i class="fas fa-check"></i>';
+                    if (masteredForProgress) {
+                        if (!isAdvancedPatternPreview) state.micSuccess += 1;
+                        if (options.scope === "vowel") {
+                            state.vowelMicSuccess += 1;
+                            if (options.vowelLetter) {
+                                state.practicedVowels.add(options.vowelLetter);
+                                state.lastVowelPracticed = options.vowelLetter;
+                            }
+                        }
+                        if (options.scope === "pattern" && options.patternCategory) {
+                            state.patternMicSuccess[options.patternCategory] = (state.patternMicSuccess[options.patternCategory] || 0) + 1;
+                        }
+                        if (options.scope === "pattern") {
+                            if (options.patternCategory === "advanced_patterns") {
+                                const code = options.patternCode || target;
+                                state.advancedPatternsSeen.add(code);
+                                state.lastAdvancedPattern = code;
+                            } else {
+                                state.completed.add(idFor(options.completeType || "pattern-word", target));
+                            }
+                        } else {
+                            complete(options.completeType || "word", target);
+                        }
+                    }
+                    els.bigMic.classList.remove("listening");
+                    updateStats();
+                    syncProgress();
+                },
+                onError: result => {
+                    state.lastSpeechPayload = {
+                        event_type: options.scope === "vowel" ? "vowel_mic" : (options.scope === "pattern" ? "pattern_mic" : "word_mic"),
+                        target,
+                        spoken_text: "",
+                        score: 0,
+                        status: "retry",
+                        is_mastered: false,
+                        failure_reason: result.failure_reason || "unknown",
+                        browser_error: result.browser_error || null,
+                        section: "sounds",
+                        level: options.scope || "cvc"
+                    };
+                    els.bigMic.classList.remove("listening");
+                    if (triggerButton) {
+                        triggerButton.classList.remove("listening");
+                        triggerButton.classList.add("wrong");
+                        triggerButton.removeAttribute("aria-busy");
+                        triggerButton.innerHTML = originalButtonHtml;
+                        window.setTimeout(() => triggerButton.classList.remove("wrong"), 1200);
+                    }
+                    SpeechService.renderResult(feedbackElement, result);
+                    syncProgress();
+                },
+                onEnd: () => {
+                    els.bigMic.classList.remove("listening");
+                    if (triggerButton) {
+                        triggerButton.classList.remove("listening");
+                        triggerButton.removeAttribute("aria-busy");
+                    }
+                    if (els.bigMic.innerHTML.includes("fa-check")) {
+                        window.setTimeout(() => { els.bigMic.innerHTML = '<i class="fas fa-microphone"></i>'; }, 1600);
+                    }
+                }
+            });
+        }
+
+        function handlePatternDrop(zone, payload = {}) {
+            if (!zone || !payload.word) return;
+            const category = zone.dataset.patternCategory || payload.category || "digraphs";
+            const feedback = patternFeedbackFor(category);
+            const isCorrect = zone.dataset.dropTarget === payload.answer;
+            zone.classList.remove("correct", "wrong");
+            zone.classList.add(isCorrect ? "correct" : "wrong");
+            if (category === "advanced_patterns") {
+                state.lastAdvancedPattern = payload.answer;
+                state.advancedPatternsSeen.add(payload.answer);
+                if (isCorrect) {
+                    state.advancedPreviewGamesCompleted.add(`drag:${payload.word}:${payload.answer}`);
+                    setFeedback(feedback, `صحيح: ${payload.word} → ${payload.answer}. هذه لعبة معاينة فقط.`, "good");
+                } else {
+                    setFeedback(feedback, `معاينة فقط. ${payload.word} يذهب إلى ${payload.answer}.`, "warn");
+                }
+                updateStats();
+                syncProgress();
+                return;
+            }
+            state.quizAttempts += 1;
+            if (isCorrect) {
+                state.quizCorrect += 1;
+                state.completed.add(idFor("pattern-drag", `${payload.word}:${payload.answer}`));
+                setFeedback(feedback, `صحيح: ${payload.word} → ${payload.answer}`, "good");
+            } else {
+                setFeedback(feedback, `حاول مرة أخرى. ${payload.word} يذهب إلى ${payload.answer}.`, "warn");
+            }
+            updateStats();
+            syncProgress();
+        }
+
+        document.addEventListener("click", event => {
+            const listenWord = event.target.closest("[data-listen-word]");
+            if (listenWord) {
+                listenOrWarn(listenWord.dataset.listenWord, els.modalFeedback);
+                return;
+            }
+
+            const vocabStart = event.target.closest("[data-vocab-start]");
+            if (vocabStart) {
+                document.querySelector(`[data-vocab-category="${vocabularyState.activeCategory}"]`)?.click();
+                document.getElementById("vocabWordGrid")?.scrollIntoView({ behavior: "smooth", block: "start" });
+                return;
+            }
+
+            const grammarStart = event.target.closest("[data-grammar-start]");
+            if (grammarStart) {
+                document.querySelector(`[data-grammar-lesson="${grammarState.activeLesson}"]`)?.click();
+                document.getElementById("grammarLessonPanel")?.scrollIntoView({ behavior: "smooth", block: "start" });
+                return;
+            }
+
+            const grammarLessonButton = event.target.closest("[data-grammar-lesson]");
+            if (grammarLessonButton) {
+                grammarState.activeLesson = grammarLessonButton.dataset.grammarLesson;
+                saveGrammarProgress();
+                renderLevelTwoGrammar();
+                setFeedback(els.grammarFeedback, `تم اختيار درس ${grammarLesson()?.title_ar || "القواعد"}. استمع ثم اقرأ بالمايك.`, "good");
+                return;
+            }
+
+            const grammarListen = event.target.closest("[data-grammar-listen]");
+            if (grammarListen) {
+                listenOrWarn(grammarListen.dataset.grammarListen, els.grammarFeedback, false);
+                setFeedback(els.grammarFeedback, `استمع إلى: ${grammarListen.dataset.grammarListen}`, "good");
+                return;
+            }
+
+            const grammarMic = event.target.closest("[data-grammar-mic]");
+            if (grammarMic) {
+                startGrammarRecognition(grammarMic.dataset.grammarMic, grammarMic.dataset.grammarMicTerm, grammarMic);
+                return;
+            }
+
+            const grammarMaster = event.target.closest("[data-grammar-master]");
+            if (grammarMaster) {
+                markGrammarItemMastered(grammarMaster.dataset.grammarMaster);
+                setFeedback(els.grammarFeedback, `تم إتقان ${grammarMaster.dataset.grammarMaster}.`, "good");
+                return;
+            }
+
+            const grammarReview = event.target.closest("[data-grammar-review]");
+            if (grammarReview) {
+                markGrammarItemReview(grammarReview.dataset.grammarReview);
+                setFeedback(els.grammarFeedback, `تمت إضافة ${grammarReview.dataset.grammarReview} للمراجعة.`, "warn");
+                return;
+            }
+
+            const grammarAnswer = event.target.closest("[data-grammar-answer]");
+            if (grammarAnswer) {
+                const isCorrect = grammarAnswer.dataset.grammarAnswer === grammarAnswer.dataset.grammarCorrect;
+                grammarState.practiceAttempts += 1;
+                if (isCorrect) {
+                    grammarState.practiceCorrect += 1;
+                    grammarAnswer.classList.add("correct");
+                    markGrammarItemMastered(grammarAnswer.dataset.grammarCorrect);
+                } else {
+                    grammarAnswer.classList.add("wrong");
+                    markGrammarItemReview(grammarAnswer.dataset.grammarCorrect);
+                }
+                setFeedback(
+                    els.grammarFeedback,
+                    isCorrect ? "إجابة صحيحة في تدريب القواعد." : `ليست صحيحة. الإجابة: ${grammarAnswer.dataset.grammarCorrect}`,
+                    isCorrect ? "good" : "warn"
+                );
+                saveGrammarProgress();
+                renderGrammarProgress();
+                return;
+            }
+
+            const vocabCategory = event.target.closest("[data-vocab-category]");
+            if (vocabCategory) {
+                vocabularyState.activeCategory = vocabCategory.dataset.vocabCategory;
+                saveVocabularyProgress();
+                renderVocabulary();
+                setFeedback(els.vocabFeedback, `تم اختيار ${vocabularyCategory().title_ar}. استمع ثم جرّب النطق.`, "good");
+                return;
+            }
+
+            const animalGroup = event.target.closest("[data-animal-group]");
+            if (animalGroup) {
+                vocabularyState.activeAnimalGroup = animalGroup.dataset.animalGroup;
+                saveVocabularyProgress();
+                renderVocabulary();
+                setFeedback(els.vocabFeedback, `تم اختيار مجموعة ${activeAnimalGroup()?.title_en || "Animals"}.`, "good");
+                return;
+            }
+
+            const foodGroup = event.target.closest("[data-food-group]");
+            if (foodGroup) {
+                vocabularyState.activeFoodGroup = foodGroup.dataset.foodGroup;
+                saveVocabularyProgress();
+                renderVocabulary();
+                setFeedback(els.vocabFeedback, `تم اختيار مجموعة ${activeFoodGroup()?.title_en || "Foods"}.`, "good");
+                return;
+            }
+
+            const calendarGroup = event.target.closest("[data-calendar-group]");
+            if (calendarGroup) {
+                vocabularyState.activeCalendarGroup = calendarGroup.dataset.calendarGroup;
+                saveVocabularyProgress();
+                renderVocabulary();
+                setFeedback(els.vocabFeedback, `تم اختيار مجموعة ${activeCalendarGroup()?.title_en || "Calendar"}.`, "good");
+                return;
+            }
+
+            const animalStoryComplete = event.target.closest("[data-animal-story-complete]");
+            if (animalStoryComplete) {
+                vocabularyState.animalStoryCompleted = true;
+                saveVocabularyProgress();
+                renderVocabularyProgress();
+                animalStoryComplete.classList.add("correct");
+                setFeedback(els.vocabFeedback, "تم حفظ فهم قصة الحيوانات.", "good");
+                return;
+            }
+
+            const foodStoryComplete = event.target.closest("[data-food-story-complete]");
+            if (foodStoryComplete) {
+                vocabularyState.foodStoryCompleted = true;
+                saveVocabularyProgress();
+                renderVocabularyProgress();
+                foodStoryComplete.classList.add("correct");
+                setFeedback(els.vocabFeedback, "تم حفظ فهم قصة الأطعمة.", "good");
+                return;
+            }
+
+            const calendarStoryComplete = event.target.closest("[data-calendar-story-complete]");
+            if (calendarStoryComplete) {
+                vocabularyState.calendarStoryCompleted = true;
+                saveVocabularyProgress();
+                renderVocabularyProgress();
+                calendarStoryComplete.classList.add("correct");
+                setFeedback(els.vocabFeedback, "تم حفظ فهم قصة الأيام والأشهر.", "good");
+                return;
+            }
+
+            const animalStoryAnswer = event.target.closest("[data-animal-story-answer]");
+            if (animalStoryAnswer) {
+                const isCorrect = animalStoryAnswer.dataset.animalStoryAnswer === animalStoryAnswer.dataset.animalStoryCorrect;
+                animalStoryAnswer.classList.add(isCorrect ? "correct" : "wrong");
+                if (isCorrect) {
+                    vocabularyState.animalStoryCompleted = true;
+                    markVocabularyMastered("dog");
+                    setFeedback(els.vocabFeedback, "إجابة صحيحة: dog يستطيع الركض.", "good");
+                } else {
+                    markVocabularyReview("dog");
+                    setFeedback(els.vocabFeedback, "الإجابة الصحيحة: dog.", "warn");
+                }
+                saveVocabularyProgress();
+                return;
+            }
+
+            const foodStoryAnswer = event.target.closest("[data-food-story-answer]");
+            if (foodStoryAnswer) {
+                const isCorrect = foodStoryAnswer.dataset.foodStoryAnswer === foodStoryAnswer.dataset.foodStoryCorrect;
+                foodStoryAnswer.classList.add(isCorrect ? "correct" : "wrong");
+                if (isCorrect) {
+                    vocabularyState.foodStoryCompleted = true;
+                    markVocabularyMastered(foodStoryAnswer.dataset.foodStoryCorrect);
+                    setFeedback(els.vocabFeedback, `إجابة صحيحة: ${foodStoryAnswer.dataset.foodStoryCorrect}.`, "good");
+                } else {
+                    markVocabularyReview(foodStoryAnswer.dataset.foodStoryCorrect);
+                    setFeedback(els.vocabFeedback, `الإجابة الصحيحة: ${foodStoryAnswer.dataset.foodStoryCorrect}.`, "warn");
+                }
+                saveVocabularyProgress();
+                return;
+            }
+
+            const calendarStoryAnswer = event.target.closest("[data-calendar-story-answer]");
+            if (calendarStoryAnswer) {
+                const isCorrect = calendarStoryAnswer.dataset.calendarStoryAnswer === calendarStoryAnswer.dataset.calendarStoryCorrect;
+                calendarStoryAnswer.classList.add(isCorrect ? "correct" : "wrong");
+                if (isCorrect) {
+                    vocabularyState.calendarStoryCompleted = true;
+                    markVocabularyMastered(calendarStoryAnswer.dataset.calendarStoryCorrect);
+                    setFeedback(els.vocabFeedback, `إجابة صحيحة: ${calendarStoryAnswer.dataset.calendarStoryCorrect}.`, "good");
+                } else {
+                    markVocabularyReview(calendarStoryAnswer.dataset.calendarStoryCorrect);
+                    setFeedback(els.vocabFeedback, `الإجابة الصحيحة: ${calendarStoryAnswer.dataset.calendarStoryCorrect}.`, "warn");
+                }
+                saveVocabularyProgress();
+                return;
+            }
+
+            const vocabCategoryQuiz = event.target.closest("[data-vocab-category-quiz], [data-vocab-quiz-current]");
+            if (vocabCategoryQuiz) {
+                const categoryId = vocabCategoryQuiz.dataset.vocabCategoryQuiz || vocabularyState.activeCategory;
+                startVocabularyQuiz(categoryId, false);
+                document.getElementById("vocabQuizArea")?.scrollIntoView({ behavior: "smooth", block: "start" });
+                return;
+            }
+
+            const vocabComprehensive = event.target.closest("[data-vocab-comprehensive]");
+            if (vocabComprehensive) {
+                startVocabularyQuiz(vocabularyState.activeCategory, true);
+                document.getElementById("vocabQuizArea")?.scrollIntoView({ behavior: "smooth", block: "start" });
+                return;
+            }
+
+            const vocabListen = event.target.closest("[data-vocab-listen]");
+            if (vocabListen) {
+                listenOrWarn(vocabListen.dataset.vocabListen, els.vocabFeedback, false);
+                setFeedback(els.vocabFeedback, `استمع إلى: ${vocabListen.dataset.vocabListen}`, "good");
+                return;
+            }
+
+            const vocabMic = event.target.closest("[data-vocab-mic]");
+            if (vocabMic) {
+                startVocabularyRecognition(vocabMic.dataset.vocabMic, vocabMic);
+                return;
+            }
+
+            const vocabMaster = event.target.closest("[data-vocab-master]");
+            if (vocabMaster) {
+                markVocabularyMastered(vocabMaster.dataset.vocabMaster);
+                setFeedback(els.vocabFeedback, `تم إتقان ${vocabMaster.dataset.vocabMaster}.`, "good");
+                return;
+            }
+
+            const vocabReview = event.target.closest("[data-vocab-review]");
+            if (vocabReview) {
+                markVocabularyReview(vocabReview.dataset.vocabReview);
+                setFeedback(els.vocabFeedback, `تمت إضافة ${vocabReview.dataset.vocabReview} للمراجعة.`, "warn");
+                return;
+            }
+
+            const vocabPracticeAnswer = event.target.closest("[data-vocab-practice-answer]");
+            if (vocabPracticeAnswer) {
+                const isCorrect = vocabPracticeAnswer.dataset.vocabPracticeAnswer === vocabPracticeAnswer.dataset.vocabPracticeCorrect;
+                vocabPracticeAnswer.classList.add(isCorrect ? "correct" : "wrong");
+                setFeedback(
+                    els.vocabFeedback,
+                    isCorrect ? "إجابة صحيحة في تدريب المفردات." : `ليست صحيحة. الإجابة: ${vocabPracticeAnswer.dataset.vocabPracticeCorrect}`,
+                    isCorrect ? "good" : "warn"
+                );
+                if (!isCorrect) markVocabularyReview(vocabPracticeAnswer.dataset.vocabPracticeCorrect);
+                return;
+            }
+
+            const vocabQuizAnswer = event.target.closest("[data-vocab-quiz-answer]");
+            if (vocabQuizAnswer) {
+                handleVocabularyQuizAnswer(vocabQuizAnswer);
+                return;
+            }
+
+            const vowelListen = event.target.closest("[data-vowel-listen]");
+            if (vowelListen) {
+                const text = vowelListen.dataset.vowelListen;
+                state.lastVowelPracticed = vowelListen.dataset.vowelLetter || state.lastVowelPracticed;
+                listenOrWarn(text, els.lastVowelText, text.length <= 2);
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const vowelMic = event.target.closest("[data-vowel-mic]");
+            if (vowelMic) {
+                const letter = vowelMic.dataset.vowelLetter || "";
+                state.lastVowelPracticed = letter || state.lastVowelPracticed;
+                startRecognition(vowelMic.dataset.vowelMic, els.lastVowelText, {
+                    scope: "vowel",
+                    vowelLetter: letter,
+                    completeType: letter ? `vowel-${letter.toLowerCase()}` : "vowel-word"
+                });
+                return;
+            }
+
+            const patternListen = event.target.closest("[data-pattern-listen]");
+            if (patternListen) {
+                const category = patternListen.dataset.patternCategory || "digraphs";
+                const feedback = patternFeedbackFor(category);
+                if (category === "digraphs" && patternListen.dataset.patternId) {
+                    state.lastDigraph = patternListen.dataset.patternId;
+                }
+                if (category === "trigraphs" && patternListen.dataset.patternId) {
+                    state.lastTrigraph = patternListen.dataset.patternId;
+                }
+                if (category === "advanced_patterns" && patternListen.dataset.patternId) {
+                    state.lastAdvancedPattern = patternListen.dataset.patternId;
+                    state.advancedPatternsSeen.add(patternListen.dataset.patternId);
+                }
+                listenOrWarn(patternListen.dataset.patternListen, feedback);
+                setFeedback(feedback, `استمع إلى: ${patternListen.dataset.patternListen}`, "good");
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const patternMic = event.target.closest("[data-pattern-mic]");
+            if (patternMic) {
+                const target = patternMic.dataset.patternMic;
+                const category = patternMic.dataset.patternCategory || "digraphs";
+                startRecognition(target, patternFeedbackFor(category), {
+                    scope: "pattern",
+                    completeType: "pattern-word",
+                    patternCategory: category,
+                    patternCode: patternMic.dataset.patternId || "",
+                    triggerButton: patternMic
+                });
+                return;
+            }
+
+            const patternComplete = event.target.closest("[data-pattern-complete]");
+            if (patternComplete) {
+                const pattern = patternComplete.dataset.patternComplete;
+                const category = patternComplete.dataset.patternCategory || "digraphs";
+                if (category === "digraphs") state.lastDigraph = pattern;
+                if (category === "trigraphs") state.lastTrigraph = pattern;
+                state.completed.add(idFor("pattern", pattern));
+                setFeedback(patternFeedbackFor(category), `تم حفظ إتقان نمط ${pattern}.`, "good");
+                renderSoundPatterns();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const miniCheck = event.target.closest("[data-mini-check-answer]");
+            if (miniCheck) {
+                const pattern = miniCheck.dataset.miniCheckPattern;
+                const index = miniCheck.dataset.miniCheckIndex;
+                const correct = miniCheck.dataset.miniCheckCorrect;
+                state.lastDigraph = pattern;
+                const isCorrect = miniCheck.dataset.miniCheckAnswer === correct;
+                miniCheck.classList.add(isCorrect ? "correct" : "wrong");
+                if (isCorrect) {
+                    state.completed.add(idFor("digraph-mini", `${pattern}:${index}`));
+                }
+                if (digraphMiniScore(pattern) >= 2) {
+                    state.completed.add(idFor("pattern", pattern));
+                    setFeedback(els.digraphFeedback, `أحسنت! أتقنت ${pattern}.`, "good");
+                } else {
+                    setFeedback(els.digraphFeedback, isCorrect ? "إجابة صحيحة. أكمل سؤالين لإتقان الصوت." : "راجع الأمثلة ثم حاول مرة أخرى.", isCorrect ? "good" : "warn");
+                }
+                renderSoundPatterns();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const trigraphMiniCheck = event.target.closest("[data-trigraph-mini-answer]");
+            if (trigraphMiniCheck) {
+                const pattern = trigraphMiniCheck.dataset.trigraphMiniPattern;
+                const index = trigraphMiniCheck.dataset.trigraphMiniIndex;
+                const correct = trigraphMiniCheck.dataset.trigraphMiniCorrect;
+                state.lastTrigraph = pattern;
+                const isCorrect = trigraphMiniCheck.dataset.trigraphMiniAnswer === correct;
+                trigraphMiniCheck.classList.add(isCorrect ? "correct" : "wrong");
+                if (isCorrect) {
+                    state.completed.add(idFor("trigraph-mini", `${pattern}:${index}`));
+                }
+                if (trigraphMiniScore(pattern) >= 2) {
+                    state.completed.add(idFor("pattern", pattern));
+                    setFeedback(els.trigraphFeedback, `أحسنت! أتقنت ${pattern}.`, "good");
+                } else {
+                    setFeedback(els.trigraphFeedback, isCorrect ? "إجابة صحيحة. أكمل سؤالين لإتقان النمط." : "راجع الأمثلة ثم حاول مرة أخرى.", isCorrect ? "good" : "warn");
+                }
+                renderSoundPatterns();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const vowelAnswer = event.target.closest("[data-vowel-answer]");
+            if (vowelAnswer) {
+                state.vowelQuizAttempts += 1;
+                state.lastVowelPracticed = vowelAnswer.dataset.vowelLetter || state.lastVowelPracticed;
+                if (vowelAnswer.dataset.vowelAnswer === vowelAnswer.dataset.vowelCorrect) {
+                    state.vowelQuizCorrect += 1;
+                    state.completed.add(idFor("vowel-quiz", `${vowelAnswer.dataset.vowelLetter}:${vowelAnswer.dataset.vowelCorrect}`));
+                    vowelAnswer.classList.add("correct");
+                    setFeedback(els.lastVowelText, "إجابة صحيحة في تدريب حروف العلة.", "good");
+                } else {
+                    vowelAnswer.classList.add("wrong");
+                    setFeedback(els.lastVowelText, `حاول مرة أخرى. الإجابة: ${vowelAnswer.dataset.vowelCorrect}`, "warn");
+                }
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const advancedSeen = event.target.closest("[data-advanced-seen], [data-advanced-review], [data-advanced-preview]");
+            if (advancedSeen) {
+                const pattern = advancedSeen.dataset.advancedSeen || advancedSeen.dataset.advancedReview || advancedSeen.dataset.advancedPreview;
+                state.advancedPatternsSeen.add(pattern);
+                state.lastAdvancedPattern = pattern;
+                const message = advancedSeen.dataset.advancedPreview
+                    ? `${pattern} مفتوح للمعاينة فقط الآن، ولن يحسب كشهادة إتقان.`
+                    : (advancedSeen.dataset.advancedReview ? `تمت إضافة ${pattern} للمراجعة لاحقًا.` : `شاهدت ${pattern}. هذه معاينة فقط وليست شرط إتقان.`);
+                setFeedback(
+                    els.advancedFeedback,
+                    message,
+                    "good"
+                );
+                renderSoundPatterns();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const advancedCheck = event.target.closest("[data-advanced-check-answer]");
+            if (advancedCheck) {
+                const pattern = advancedCheck.dataset.advancedCheckPattern;
+                const index = advancedCheck.dataset.advancedCheckIndex;
+                const isCorrect = advancedCheck.dataset.advancedCheckAnswer === advancedCheck.dataset.advancedCheckCorrect;
+                advancedCheck.classList.add(isCorrect ? "correct" : "wrong");
+                state.advancedPatternsSeen.add(pattern);
+                state.lastAdvancedPattern = pattern;
+                if (isCorrect) {
+                    state.advancedPreviewGamesCompleted.add(`quick:${pattern}:${index}`);
+                    setFeedback(els.advancedFeedback, `صحيح. لاحظت نمط ${pattern}.`, "good");
+                } else {
+                    setFeedback(els.advancedFeedback, `هذه معاينة فقط. الإجابة: ${advancedCheck.dataset.advancedCheckCorrect}`, "warn");
+                }
+                renderAdvancedProgress();
+                syncProgress();
+                return;
+            }
+
+            const patternActivity = event.target.closest("[data-pattern-activity-answer]");
+            if (patternActivity) {
+                const listenText = patternActivity.dataset.patternActivityListen;
+                const category = patternActivity.dataset.patternCategory || "digraphs";
+                const feedback = patternFeedbackFor(category);
+                if (patternActivity.dataset.patternActivityAnswer === "استمع" && listenText) {
+                    listenOrWarn(listenText, feedback);
+                    return;
+                }
+                if (patternActivity.dataset.patternActivityAnswer === "ابدأ المايك" || patternActivity.dataset.patternActivityMic === "true") {
+                    startRecognition(patternActivity.dataset.patternActivityCorrect, feedback, {
+                        scope: "pattern",
+                        completeType: "pattern-activity",
+                        patternCategory: category,
+                        patternCode: (category === "digraphs" || category === "trigraphs" || category === "advanced_patterns") ? patternActivity.dataset.patternActivityCorrect : "",
+                        triggerButton: patternActivity
+                    });
+                    return;
+                }
+
+                if (category === "advanced_patterns") {
+                    const isCorrect = patternActivity.dataset.patternActivityAnswer === patternActivity.dataset.patternActivityCorrect;
+                    patternActivity.classList.add(isCorrect ? "correct" : "wrong");
+                    state.lastAdvancedPattern = patternActivity.dataset.patternActivityCorrect;
+                    state.advancedPatternsSeen.add(patternActivity.dataset.patternActivityCorrect);
+                    if (isCorrect) {
+                        state.advancedPreviewGamesCompleted.add(patternActivity.dataset.patternActivity);
+                        setFeedback(feedback, "إجابة صحيحة في لعبة معاينة Advanced. هذا لا يحسب كشهادة إتقان.", "good");
+                    } else {
+                        setFeedback(feedback, `معاينة فقط. الإجابة: ${patternActivity.dataset.patternActivityCorrect}`, "warn");
+                    }
+                    renderAdvancedProgress();
+                    syncProgress();
+                    return;
+                }
+
+                state.quizAttempts += 1;
+                if (patternActivity.dataset.patternActivityAnswer === patternActivity.dataset.patternActivityCorrect) {
+                    state.quizCorrect += 1;
+                    state.completed.add(idFor("pattern-activity", patternActivity.dataset.patternActivity));
+                    patternActivity.classList.add("correct");
+                    setFeedback(feedback, "إجابة صحيحة في تدريب الصوتيات.", "good");
+                } else {
+                    patternActivity.classList.add("wrong");
+                    setFeedback(feedback, `ليست صحيحة. الإجابة: ${patternActivity.dataset.patternActivityCorrect}`, "warn");
+                }
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const digraphFinalAnswer = event.target.closest("[data-digraph-final-answer]");
+            if (digraphFinalAnswer) {
+                const questionId = digraphFinalAnswer.dataset.digraphFinalId;
+                const isCorrect = digraphFinalAnswer.dataset.digraphFinalAnswer === digraphFinalAnswer.dataset.digraphFinalCorrect;
+                if (digraphFinalAnswer.dataset.digraphFinalListen) {
+                    listenOrWarn(digraphFinalAnswer.dataset.digraphFinalListen, els.digraphFinalFeedback);
+                }
+                digraphFinalAnswer.classList.add(isCorrect ? "correct" : "wrong");
+                state.digraphQuizAttempts += 1;
+                if (isCorrect) {
+                    state.completed.add(idFor("digraph-final", questionId));
+                }
+                state.digraphQuizBestScore = digraphBestScore();
+                const score = digraphBestScore();
+                setFeedback(
+                    els.digraphFinalFeedback,
+                    score >= 90 ? `ممتاز! نتيجة Digraphs ${score}%. الشهادة مفتوحة.` : (score >= 80 ? `ناجح! نتيجة Digraphs ${score}%. الشهادة مفتوحة.` : `نتيجتك الحالية ${score}%. تحتاج 80% لفتح الشهادة.`),
+                    score >= 80 ? "good" : "warn"
+                );
+                renderSoundPatterns();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const trigraphFinalAnswer = event.target.closest("[data-trigraph-final-answer]");
+            if (trigraphFinalAnswer) {
+                const questionId = trigraphFinalAnswer.dataset.trigraphFinalId;
+                const isCorrect = trigraphFinalAnswer.dataset.trigraphFinalAnswer === trigraphFinalAnswer.dataset.trigraphFinalCorrect;
+                if (trigraphFinalAnswer.dataset.trigraphFinalListen) {
+                    listenOrWarn(trigraphFinalAnswer.dataset.trigraphFinalListen, els.trigraphFinalFeedback);
+                }
+                trigraphFinalAnswer.classList.add(isCorrect ? "correct" : "wrong");
+                state.trigraphQuizAttempts += 1;
+                if (isCorrect) {
+                    state.completed.add(idFor("trigraph-final", questionId));
+                }
+                state.trigraphQuizBestScore = trigraphBestScore();
+                const score = trigraphBestScore();
+                setFeedback(
+                    els.trigraphFinalFeedback,
+                    score >= 90 ? `ممتاز! نتيجة Trigraphs ${score}%. الشهادة مفتوحة.` : (score >= 80 ? `ناجح! نتيجة Trigraphs ${score}%. الشهادة مفتوحة.` : `نتيجتك الحالية ${score}%. تحتاج 80% لفتح الشهادة.`),
+                    score >= 80 ? "good" : "warn"
+                );
+                renderSoundPatterns();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const printDigraphCertificate = event.target.closest("[data-print-digraph-certificate]");
+            if (printDigraphCertificate) {
+                window.print();
+                return;
+            }
+
+            const printTrigraphCertificate = event.target.closest("[data-print-trigraph-certificate]");
+            if (printTrigraphCertificate) {
+                window.print();
+                return;
+            }
+
+            const dragWord = event.target.closest("[data-drag-word]");
+            if (dragWord) {
+                const category = dragWord.dataset.patternCategory || "digraphs";
+                document.querySelectorAll(".pattern-drag-word.selected").forEach(button => button.classList.remove("selected"));
+                dragWord.classList.add("selected");
+                state.pendingPatternDrag = {
+                    word: dragWord.dataset.dragWord,
+                    answer: dragWord.dataset.dragAnswer,
+                    category
+                };
+                setFeedback(patternFeedbackFor(category), `اختر صندوق ${dragWord.dataset.dragAnswer} لكلمة ${dragWord.dataset.dragWord}.`, "warn");
+                return;
+            }
+
+            const dropZone = event.target.closest("[data-drop-target]");
+            if (dropZone && state.pendingPatternDrag) {
+                handlePatternDrop(dropZone, state.pendingPatternDrag);
+                document.querySelectorAll(".pattern-drag-word.selected").forEach(button => button.classList.remove("selected"));
+                state.pendingPatternDrag = null;
+                return;
+            }
+
+            const masterVowel = event.target.closest("[data-master-vowel]");
+            if (masterVowel) {
+                const letter = masterVowel.dataset.masterVowel;
+                state.practicedVowels.add(letter);
+                state.vowelLessonsCompleted = Math.max(state.vowelLessonsCompleted, state.practicedVowels.size);
+                state.lastVowelPracticed = letter;
+                state.completed.add(idFor("vowel", letter));
+                renderVowels();
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const scrollVowel = event.target.closest("[data-scroll-vowel]");
+            if (scrollVowel) {
+                document.getElementById(`vowel-${scrollVowel.dataset.scrollVowel}`)?.scrollIntoView({ behavior: "smooth", block: "start" });
+                return;
+            }
+
+            const vowelActivity = event.target.closest("[data-vowel-activity-answer]");
+            if (vowelActivity) {
+                const spoken = vowelActivity.dataset.vowelActivityListen;
+                if (vowelActivity.dataset.vowelActivityAnswer === "استمع" && spoken) {
+                    listenOrWarn(spoken, els.lastVowelText);
+                    return;
+                }
+                if (vowelActivity.dataset.vowelActivityAnswer === "ابدأ المايك" || vowelActivity.dataset.vowelActivityMic === "true") {
+                    startRecognition(vowelActivity.dataset.vowelActivityCorrect, els.lastVowelText, {
+                        scope: "vowel",
+                        completeType: "vowel-activity"
+                    });
+                    return;
+                }
+                state.vowelQuizAttempts += 1;
+                if (vowelActivity.dataset.vowelActivityAnswer === vowelActivity.dataset.vowelActivityCorrect) {
+                    state.vowelQuizCorrect += 1;
+                    state.completed.add(idFor("vowel-activity", vowelActivity.dataset.vowelActivity));
+                    vowelActivity.classList.add("correct");
+                    setFeedback(els.lastVowelText, "إجابة صحيحة في نشاط حروف العلة.", "good");
+                } else {
+                    vowelActivity.classList.add("wrong");
+                    setFeedback(els.lastVowelText, `ليست صحيحة. الإجابة: ${vowelActivity.dataset.vowelActivityCorrect}`, "warn");
+                }
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const micDirect = event.target.closest("[data-mic-direct]");
+            if (micDirect) {
+                state.micTarget = micDirect.dataset.micDirect;
+                renderMicWords();
+                document.querySelector(`[data-tab="mic"]`)?.click();
+                startRecognition(state.micTarget, els.micFeedback);
+                return;
+            }
+
+            const activityAnswer = event.target.closest("[data-activity-answer]");
+            if (activityAnswer) {
+                if (activityAnswer.dataset.activityAnswer === "استمع") {
+                    listenOrWarn(activityAnswer.dataset.correct, els.quizFeedback);
+                    return;
+                }
+                if (activityAnswer.dataset.activityAnswer === "ابدأ المايك" || activityAnswer.dataset.micActivity === "true") {
+                    startRecognition(activityAnswer.dataset.correct, els.micFeedback);
+                    return;
+                }
+                if (activityAnswer.dataset.activityAnswer === "تغيير الكلمة") {
+                    const next = cvcWords[(cvcWords.findIndex(item => item.word === state.micTarget) + 1) % cvcWords.length];
+                    state.micTarget = next.word;
+                    render();
+                    return;
+                }
+                if (activityAnswer.dataset.activityAnswer === activityAnswer.dataset.correct) {
+                    activityAnswer.classList.add("correct");
+                    state.completed.add(idFor("activity", `${activityAnswer.dataset.activity}:${activityAnswer.dataset.correct}`));
+                    updateStats();
+                    syncProgress();
+                } else {
+                    activityAnswer.classList.add("wrong");
+                }
+                return;
+            }
+
+            const tab = event.target.closest("[data-tab]");
+            if (tab) {
+                document.querySelectorAll(".tab-btn").forEach(button => button.classList.toggle("active", button === tab));
+                document.querySelectorAll(".section").forEach(section => section.classList.toggle("active", section.id === tab.dataset.tab));
+                if (["syllables", "cvc", "activities", "quiz", "mic", "vowels", "digraphs", "ending-sounds", "trigraphs", "advanced-patterns", "foundation-vocabulary", "foundation-grammar"].includes(tab.dataset.tab)) {
+                    history.replaceState(null, "", `#${tab.dataset.tab}`);
+                }
+                return;
+            }
+
+            const jump = event.target.closest("[data-tab-jump]");
+            if (jump) {
+                document.querySelector(`[data-tab="${jump.dataset.tabJump}"]`)?.click();
+                document.querySelector(".workbench")?.scrollIntoView({ behavior: "smooth", block: "start" });
+                return;
+            }
+
+            const practice = event.target.closest("[data-type]");
+            if (practice) {
+                openPractice({
+                    type: practice.dataset.type,
+                    text: practice.dataset.text,
+                    hint: practice.dataset.hint
+                });
+                return;
+            }
+
+            const quizOption = event.target.closest("[data-answer]");
+            if (quizOption) {
+                const question = quizQuestions[state.quizIndex % quizQuestions.length];
+                state.quizAttempts += 1;
+                if (quizOption.dataset.answer === question.answer) {
+                    state.quizCorrect += 1;
+                    state.completed.add(idFor("quiz", question.id));
+                    quizOption.classList.add("correct");
+                    setFeedback(els.quizFeedback, "إجابة صحيحة، رائع!", "good");
+                } else {
+                    quizOption.classList.add("wrong");
+                    setFeedback(els.quizFeedback, `ليست صحيحة. الإجابة: ${question.answer}`, "warn");
+                }
+                updateStats();
+                syncProgress();
+                return;
+            }
+
+            const micWord = event.target.closest("[data-mic-word]");
+            if (micWord) {
+                state.micTarget = micWord.dataset.micWord;
+                renderMicWords();
+                listenOrWarn(state.micTarget, els.micFeedback);
+            }
+        });
+
+        document.addEventListener("dragstart", event => {
+            const dragWord = event.target.closest("[data-drag-word]");
+            if (!dragWord || !event.dataTransfer) return;
+            const payload = {
+                word: dragWord.dataset.dragWord,
+                answer: dragWord.dataset.dragAnswer,
+                category: dragWord.dataset.patternCategory || "digraphs"
+            };
+            event.dataTransfer.setData("application/json", JSON.stringify(payload));
+            event.dataTransfer.setData("text/plain", payload.word);
+            event.dataTransfer.effectAllowed = "move";
+        });
+
+        document.addEventListener("dragover", event => {
+            if (event.target.closest("[data-drop-target]")) {
+                event.preventDefault();
+                event.dataTransfer.dropEffect = "move";
+            }
+        });
+
+        document.addEventListener("drop", event => {
+            const dropZone = event.target.closest("[data-drop-target]");
+            if (!dropZone || !event.dataTransfer) return;
+            event.preventDefault();
+            let payload = null;
+            try {
+                payload = JSON.parse(event.dataTransfer.getData("application/json") || "{}");
+            } catch (error) {
+                payload = null;
+            }
+            if (payload?.word) handlePatternDrop(dropZone, payload);
+        });
+
+        document.getElementById("listenBtn").addEventListener("click", () => {
+            if (state.current) listenOrWarn(state.current.text, els.modalFeedback, state.current.type === "sound");
+        });
+        document.getElementById("completeBtn").addEventListener("click", () => {
+            if (!state.current) return;
+            complete(state.current.type, state.current.text);
+            setFeedback(els.modalFeedback, "تم حفظ التدريب كمكتمل.", "good");
+        });
+        document.getElementById("modalMicBtn").addEventListener("click", () => {
+            if (state.current) startRecognition(state.current.text, els.modalFeedback);
+        });
+        document.getElementById("bigMic").addEventListener("click", () => startRecognition(state.micTarget, els.micFeedback));
+        document.getElementById("closeModal").addEventListener("click", closePractice);
+        document.getElementById("practiceModal").addEventListener("click", event => {
+            if (event.target.id === "practiceModal") closePractice();
+        });
+        document.getElementById("nextQuiz").addEventListener("click", () => {
+            state.quizIndex += 1;
+            renderQuiz();
+        });
+        document.getElementById("worksheetLink").addEventListener("click", () => {
+            state.worksheetDownloads += 1;
+            updateStats();
+            syncProgress();
+        });
+        document.addEventListener("keydown", event => {
+            if (event.key === "Escape") closePractice();
+        });
+
+        render();
+        updateStats();
+        const initialTab = new URLSearchParams(window.location.search).get("tab") || window.location.hash.replace("#", "");
+        if (["syllables", "cvc", "activities", "quiz", "mic", "vowels", "digraphs", "ending-sounds", "trigraphs", "advanced-patterns", "foundation-vocabulary", "foundation-grammar"].includes(initialTab)) {
+            document.querySelector(`[data-tab="${initialTab}"]`)?.click();
+        }
+        syncProgress();
+        if (!(window.SpeechRecognition || window.webkitSpeechRecognition)) {
+            setFeedback(els.micFeedback, "الميكروفون يعمل على Chrome أو Edge، ويحتاج السماح من المتصفح. بعد النشر يجب أن يكون الموقع HTTPS.", "warn");
+        }
+        window.speechSynthesis?.getVoices();
@@ -0,0 +1,857 @@
+// --- DATA ---
+        const vocabList = [
+            { en: "fairy tale", ar: "حكاية خيالية", icon: "🧚‍♀️" },
+            { en: "animation", ar: "رسوم متحركة", icon: "🎨" },
+            { en: "western", ar: "أفلام الغرب", icon: "🤠" },
+            { en: "mystery", ar: "غموض", icon: "🕵️‍♂️" },
+            { en: "comedy", ar: "كوميديا", icon: "😂" },
+            { en: "cartoon", ar: "كرتون", icon: "📺" },
+            { en: "documentary", ar: "وثائقي", icon: "🌍" },
+            { en: "drama", ar: "دراما", icon: "🎭" },
+            { en: "horror", ar: "رعب", icon: "👻" },
+            { en: "sci-fi", ar: "خيال علمي", icon: "👽" },
+            { en: "play", ar: "مسرحية", icon: "🎬" },
+            { en: "musical", ar: "موسيقي", icon: "🎵" },
+            { en: "thriller", ar: "إثارة", icon: "😱" }
+        ];
+
+        const quizQuestions = [
+            { q: "What genre is about space and aliens?", options: ["western", "sci-fi", "comedy", "drama"], correct: 1 },
+            { q: "A funny movie is called a __________.", options: ["horror", "thriller", "comedy", "mystery"], correct: 2 },
+            { q: "A movie about cowboys and horses.", options: ["western", "fairy tale", "musical", "play"], correct: 0 },
+            { q: "A story with magic and princesses.", options: ["documentary", "fairy tale", "sci-fi", "thriller"], correct: 1 },
+            { q: "A film that gives facts about real life.", options: ["cartoon", "animation", "documentary", "horror"], correct: 2 },
+            { q: "Cinderella is a __________.", options: ["fairy tale", "western", "sci-fi", "documentary"], correct: 0 },
+            { q: "Which genre makes you scared?", options: ["comedy", "musical", "horror", "play"], correct: 2 },
+            { q: "A movie with lots of singing and dancing.", options: ["western", "musical", "mystery", "drama"], correct: 1 },
+            { q: "Sherlock Holmes is a __________ movie.", options: ["sci-fi", "mystery", "comedy", "cartoon"], correct: 1 },
+            { q: "SpongeBob is a __________.", options: ["documentary", "cartoon", "thriller", "horror"], correct: 1 }
+        ];
+
+        const fillBlanksData = [
+            { sentence: "I like _____ movies because they are funny.", options: ["horror", "comedy"], correct: "comedy" },
+            { sentence: "_____ movies are about real life.", options: ["documentary", "sci-fi"], correct: "documentary" },
+            { sentence: "Aliens are in _____ movies.", options: ["western", "sci-fi"], correct: "sci-fi" },
+            { sentence: "I watched a scary _____ last night.", options: ["musical", "horror"], correct: "horror" }
+        ];
+
+        // --- LESSON 2 GRAMMAR DATA ---
+        const pronounData = {
+            "was": ["I", "He", "She", "It"],
+            "were": ["You", "We", "They"]
+        };
+
+        const grammarQuestions = [
+            { q: "I _____ reading a book yesterday.", options: ["was", "were", "is", "are"], correct: 0 },
+            { q: "They _____ playing football.", options: ["was", "were", "am", "is"], correct: 1 },
+            { q: "_____ she sleeping?", options: ["Were", "Was", "Are", "Do"], correct: 1 },
+            { q: "We were _____ TV.", options: ["watch", "watched", "watching", "watches"], correct: 2 },
+            { q: "Why _____ you crying?", options: ["was", "were", "is", "did"], correct: 1 },
+            { q: "He was _____ his homework.", options: ["doing", "do", "did", "done"], correct: 0 },
+            { q: "The boys _____ not listening.", options: ["was", "were", "is", "am"], correct: 1 },
+            { q: "It _____ raining all night.", options: ["were", "was", "are", "be"], correct: 1 },
+            { q: "What were you _____?", options: ["eating", "ate", "eat", "eats"], correct: 0 },
+            { q: "I _____ not feeling well.", options: ["were", "was", "are", "can"], correct: 1 }
+        ];
+
+        let gQuizIndex = 0;
+        let gQuizScore = 0;
+
+        // --- PREPARE GAMES DATA ---
+        
+        // Missing Letter Data Generator (Fixes space issue)
+        const missingLetterData = vocabList.map(item => {
+            const originalWord = item.en;
+            const targetWord = originalWord; // Keep lowercase
+            
+            // Find indices that are NOT spaces
+            const validIndices = [];
+            for (let i = 0; i < targetWord.length; i++) {
+                if (targetWord[i] !== ' ') validIndices.push(i);
+            }
+            
+            // Pick random valid index
+            const missingIndex = validIndices[Math.floor(Math.random() * validIndices.length)];
+            const correctChar = targetWord[missingIndex];
+            
+            // Generate options
+            const options = [correctChar];
+            while(options.length < 3) {
+                const randChar = String.fromCharCode(97 + Math.floor(Math.random() * 26)); // Lowercase a-z
+                if(!options.includes(randChar)) options.push(randChar);
+            }
+            
+            // Generate display string
+            let displayString = "";
+            for (let i = 0; i < targetWord.length; i++) {
+                if (i === missingIndex) displayString += "_";
+                else displayString += targetWord[i];
+            }
+
+            return {
+                word: targetWord,
+                correct: correctChar,
+                options: options.sort(() => Math.random() - 0.5),
+                displayWord: displayString
+            };
+        });
+
+        // --- STATE ---
+        let currentQuizIndex = 0;
+        let quizScore = 0;
+        let currentMissingIndex = 0;
+        let currentUnscrambleIndex = 0;
+        
+        let matchingRound = 0;
+        const matchingItemsPerRound = 5;
+        let currentRoundMatches = 0; // successfully matched pairs in current round
+        let totalRoundItems = 0;
+
+        // --- INIT ---
+        document.addEventListener('DOMContentLoaded', () => {
+            renderVocab();
+            renderMissingLetter();
+            renderUnscramble();
+            renderMatching(0);
+            renderFillBlanks();
+            renderQuiz();
+            initDraggablePronouns(); // Init Grammar Game
+            renderGrammarQuiz();     // Init Grammar Quiz
+        });
+
+        // --- NAV ---
+        function toggleNav() {
+            const dropdown = document.getElementById('navDropdown');
+            dropdown.style.display = dropdown.style.display === 'none' ? 'block' : 'none';
+        }
+
+        function switchTab(tabId) {
+            document.querySelectorAll('.tab-content').forEach(el => el.style.display = 'none');
+            document.querySelectorAll('.nav-tab').forEach(el => el.classList.remove('active'));
+            
+            const selectedContent = document.getElementById(tabId + '-section');
+            selectedContent.style.display = 'block';
+            document.getElementById('tab-' + tabId).classList.add('active');
+            
+            // Re-trigger animation
+            selectedContent.classList.remove('animate__fadeIn');
+            void selectedContent.offsetWidth; 
+            selectedContent.classList.add('animate__fadeIn');
+        }
+
+        // --- RENDER VOCAB ---
+        function renderVocab() {
+            const container = document.getElementById('vocab-grid-container');
+            container.innerHTML = vocabList.map(item => `
+                <div class="vocab-card">
+                    <div class="card-icon">${item.icon}</div>
+                    <div class="card-word">${item.en}</div>
+                    <div class="card-trans">${item.ar}</div>
+                    <div class="card-actions">
+                        <button onclick="speak('${item.en}')" class="btn-icon" title="Listen">🔊</button>
+                        <button onclick="checkPronunciation('${item.en}', this)" class="btn-icon btn-mic" title="Speak">🎤</button>
+                    </div>
+                </div>
+            `).join('');
+        }
+
+        // --- SPEECH ---
+        function speak(text) {
+            if ('speechSynthesis' in window) {
+                window.speechSynthesis.cancel();
+                const utterance = new SpeechSynthesisUtterance(text);
+                utterance.lang = 'en-US';
+                utterance.rate = 0.9;
+                window.speechSynthesis.speak(utterance);
+            }
+        }
+
+        function checkPronunciation(targetWord, btn) {
+            if (!('webkitSpeechRecognition' in window) && !('SpeechRecognition' in window)) {
+                alert("Speech recognition is not supported in this browser. Please use Google Chrome or Edge.");
+                return;
+            }
+            const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+            const recognition = new SpeechRecognition();
+            recognition.lang = 'en-US';
+            recognition.interimResults = false;
+            recognition.maxAlternatives = 1;
+
+            btn.classList.add('listening');
+            recognition.start();
+
+            recognition.onresult = (event) => {
+                const transcript = event.results[0][0].transcript.toLowerCase();
+                const target = targetWord.toLowerCase();
+                btn.classList.remove('listening');
+                console.log(`Heard: ${transcript}, Target: ${target}`);
+
+                if (transcript.includes(target) || target.includes(transcript)) { 
+                    btn.classList.add('correct');
+                    playSound('success');
+                    setTimeout(() => { btn.classList.remove('correct'); }, 2000);
+                } else {
+                    btn.classList.add('wrong');
+                    playSound('error');
+                    setTimeout(() => { btn.classList.remove('wrong'); }, 2000);
+                }
+            };
+
+            recognition.onerror = (e) => {
+                btn.classList.remove('listening');
+                console.error(e.error);
+            };
+        }
+
+        function speakWord(el) { speak(el.innerText); }
+        function playReading() { speak(document.getElementById('reading-text').innerText); }
+
+        // --- GAME UTIL ---
+        function showGame(gameId) {
+            document.querySelectorAll('.game-container').forEach(el => {
+                el.classList.remove('active');
+                setTimeout(() => { if(!el.classList.contains('active')) el.style.display = 'none'; }, 200);
+            });
+            document.querySelectorAll('.game-select-btn').forEach(el => el.classList.remove('active'));
+            
+            const target = document.getElementById('game-' + gameId);
+            target.style.display = 'block';
+            setTimeout(() => target.classList.add('active'), 10);
+            
+            document.querySelector(`button[onclick="showGame('${gameId}')"]`).classList.add('active');
+        }
+
+        function showCelebration() {
+            const overlay = document.getElementById('celebration-overlay');
+            overlay.style.display = 'flex';
+            playSound('win');
+            createBalloons();
+        }
+
+        function closeCelebration() {
+            document.getElementById('celebration-overlay').style.display = 'none';
+            // Clear balloons
+            document.querySelectorAll('.balloon').forEach(el => el.remove());
+        }
+
+        function createBalloons() {
+            const colors = ['#f72585', '#7209b7', '#3a0ca3', '#4361ee', '#4cc9f0', '#ffd166', '#06d6a0'];
+            for(let i=0; i<30; i++) {
+                const b = document.createElement('div');
+                b.className = 'balloon';
+                b.style.left = Math.random() * 100 + 'vw';
+                b.style.backgroundColor = colors[Math.floor(Math.random() * colors.length)];
+                b.style.animationDuration = (Math.random() * 2 + 3) + 's';
+                b.style.animationDelay = Math.random() + 's';
+                document.getElementById('celebration-overlay').appendChild(b);
+            }
+        }
+
+        function playSound(type) {
+            const ctx = new (window.AudioContext || window.webkitAudioContext)();
+            const osc = ctx.createOscillator();
+            const gain = ctx.createGain();
+            osc.connect(gain);
+            gain.connect(ctx.destination);
+            
+            if (type === 'success') {
+                // Happy high pitch
+                osc.type = 'triangle';
+                osc.frequency.setValueAtTime(600, ctx.currentTime);
+                osc.frequency.exponentialRampToValueAtTime(1200, ctx.currentTime + 0.1);
+                gain.gain.setValueAtTime(0.1, ctx.currentTime);
+                gain.gain.exponentialRampToValueAtTime(0.001, ctx.currentTime + 0.5);
+                osc.start();
+                osc.stop(ctx.currentTime + 0.5);
+            } else if (type === 'pop') {
+                // Bubble pop sound (New)
+                osc.type = 'sine';
+                osc.frequency.setValueAtTime(800, ctx.currentTime);
+                osc.frequency.exponentialRampToValueAtTime(400, ctx.currentTime + 0.05);
+                gain.gain.setValueAtTime(0.1, ctx.currentTime);
+                gain.gain.exponentialRampToValueAtTime(0.001, ctx.currentTime + 0.1);
+                osc.start();
+                osc.stop(ctx.currentTime + 0.1);
+            } else if (type === 'win') {
+                // Victory fanfare
+                const now = ctx.currentTime;
+                // Note 1
+                const osc1 = ctx.createOscillator();
+                const gain1 = ctx.createGain();
+                osc1.connect(gain1); gain1.connect(ctx.destination);
+                osc1.frequency.setValueAtTime(523.25, now); // C
+                gain1.gain.setValueAtTime(0.2, now); gain1.gain.linearRampToValueAtTime(0, now+2);
+                osc1.start(now); osc1.stop(now+2);
+                
+                // Note 3
+                 const osc2 = ctx.createOscillator();
+                const gain2 = ctx.createGain();
+                osc2.connect(gain2); gain2.connect(ctx.destination);
+                osc2.frequency.setValueAtTime(659.25, now+0.2); // E
+                gain2.gain.setValueAtTime(0.2, now+0.2); gain2.gain.linearRampToValueAtTime(0, now+2.2);
+                osc2.start(now+0.2); osc2.stop(now+2.2);
+
+                 // Note 5
+                 const osc3 = ctx.createOscillator();
+                const gain3 = ctx.createGain();
+                osc3.connect(gain3); gain3.connect(ctx.destination);
+                osc3.frequency.setValueAtTime(783.99, now+0.4); // G
+                gain3.gain.setValueAtTime(0.2, now+0.4); gain3.gain.linearRampToValueAtTime(0, now+2.4);
+                osc3.start(now+0.4); osc3.stop(now+2.4);
+
+            } else {
+                // Error (low buzz)
+                osc.type = 'sawtooth';
+                osc.frequency.setValueAtTime(150, ctx.currentTime);
+                osc.frequency.exponentialRampToValueAtTime(100, ctx.currentTime + 0.2);
+                gain.gain.setValueAtTime(0.1, ctx.currentTime);
+                gain.gain.exponentialRampToValueAtTime(0.001, ctx.currentTime + 0.4);
+                osc.start();
+                osc.stop(ctx.currentTime + 0.5);
+            }
+        }
+
+        // --- GAME 1: MISSING LETTER ---
+        function renderMissingLetter() {
+            const container = document.getElementById('missing-letter-area');
+            if (currentMissingIndex >= missingLetterData.length) {
+                container.innerHTML = `<div class="quiz-final"><h3>Done!</h3></div>`; // Temp placeholder, real celebration triggered below
+                showCelebration();
+                // Reset for next time
+                container.innerHTML = `
+                    <div class="quiz-final">
+                        <span class="trophy">🏆</span>
+                        <h3>Complete!</h3>
+                        <button onclick="currentMissingIndex=0;renderMissingLetter()" class="retry-btn">Play Again</button>
+                    </div>`;
+                return;
+            }
+
+            const data = missingLetterData[currentMissingIndex];
+            container.innerHTML = `
+                <div class="word-display animate__animated animate__fadeIn">${data.displayWord}</div>
+                <div class="options-container">
+                    ${data.options.map(opt => `
+                        <button onclick="checkMissing('${opt}')" class="option-btn ripple">${opt}</button>
+                    `).join('')}
+                </div>
+                <div style="margin-top:30px; color:#aaa; font-size:0.9rem;">Word ${currentMissingIndex + 1} / ${missingLetterData.length}</div>
+            `;
+        }
+
+        window.checkMissing = function(selected) {
+            const data = missingLetterData[currentMissingIndex];
+            if (selected === data.correct) {
+                playSound('success');
+                currentMissingIndex++;
+                setTimeout(renderMissingLetter, 300);
+            } else {
+                playSound('error');
+            }
+        };
+
+        // --- GAME 1.5: UNSCRAMBLE ---
+        
+        // Prepare Unscramble Data
+        const unscrambleData = vocabList.map(item => {
+            const word = item.en; // already lowercase
+            // Create tiles: split by character, keep spaces as placeholders
+            const letters = word.split('').filter(c => c !== ' ');
+            const scrambled = [...letters].sort(() => Math.random() - 0.5);
+            return {
+                target: word,
+                scrambled: scrambled
+            };
+        });
+
+        let currentInput = []; // array of {char, tileIndex}
+
+        function renderUnscramble() {
+            const container = document.getElementById('unscramble-area');
+            if (currentUnscrambleIndex >= unscrambleData.length) {
+                showCelebration();
+                container.innerHTML = `
+                    <div class="quiz-final">
+                        <span class="trophy">🎉</span>
+                        <h3>All Words Arranged!</h3>
+                        <button onclick="currentUnscrambleIndex=0;renderUnscramble()" class="retry-btn">Play Again</button>
+                    </div>`;
+                return;
+            }
+
+            const data = unscrambleData[currentUnscrambleIndex];
+            currentInput = [];
+            
+            // Build Slots
+            let slotsHtml = '';
+            for (let char of data.target) {
+                if (char === ' ') {
+                    slotsHtml += `<div class="letter-slot space"></div>`;
+                } else {
+                    slotsHtml += `<div class="letter-slot" id="slot-${currentInput.length + document.querySelectorAll('.letter-slot:not(.space)').length}"></div>`; 
+                    // This ID logic is tricky in template literal loop, simplified below
+                }
+            }
+            
+            // Simpler slot generation
+            const targetChars = data.target.split('');
+            const slots = targetChars.map((char, i) => {
+                if (char === ' ') return `<div class="letter-slot space"></div>`;
+                return `<div class="letter-slot" data-index="${i}"></div>`;
+            }).join('');
+
+            // Build Tiles
+            const tiles = data.scrambled.map((char, i) => `
+                <button onclick="clickTile('${char}', ${i}, this)" class="tile-btn" id="tile-${i}">${char}</button>
+            `).join('');
+
+            container.innerHTML = `
+                <div class="scramble-slots" id="u-slots">
+                    ${slots}
+                </div>
+                <div class="letter-pool" id="u-pool">
+                    ${tiles}
+                </div>
+                <div style="margin-top:30px; color:#aaa; font-size:0.9rem;">Word ${currentUnscrambleIndex + 1} / ${unscrambleData.length}</div>
+                <button onclick="resetUnscramble()" style="margin-top:15px; padding:8px 20px; border-radius:15px; border:1px solid #ddd; background:#fff; cursor:pointer;">Reset Word</button>
+            `;
+        }
+
+        window.clickTile = function(char, tileIdx, btn) {
+            if (btn.classList.contains('used')) return;
+            
+            const data = unscrambleData[currentUnscrambleIndex];
+            const targetArray = data.target.split('');
+            
+            // Find next empty slot (skipping spaces)
+            const slots = document.querySelectorAll('#u-slots .letter-slot:not(.space)');
+            let nextSlotIndex = currentInput.length;
+            
+            if (nextSlotIndex < slots.length) {
+                // Add to input
+                currentInput.push({ char: char, tileIdx: tileIdx });
+                
+                // Update UI
+                const slot = slots[nextSlotIndex];
+                slot.textContent = char;
+                slot.classList.add('filled');
+                btn.classList.add('used');
+                playSound('pop'); // New sound
+
+                // Check if full
+                if (currentInput.length === slots.length) {
+                    checkUnscrambleResult();
+                }
+            }
+        };
+
+        window.resetUnscramble = function() {
+            currentInput = [];
+             renderUnscramble();
+        };
+
+        function checkUnscrambleResult() {
+            const data = unscrambleData[currentUnscrambleIndex];
+            const userInput = currentInput.map(x => x.char).join('');
+            const targetNoSpaces = data.target.replace(/ /g, '');
+            
+            if (userInput === targetNoSpaces) {
+                playSound('success');
+                currentUnscrambleIndex++;
+                setTimeout(renderUnscramble, 1000);
+            } else {
+                playSound('error');
+                // Shake slots
+                const slots = document.getElementById('u-slots');
+                slots.style.animation = 'shake 0.4s';
+                setTimeout(() => {
+                    slots.style.animation = '';
+                    resetUnscramble();
+                }, 600);
+            }
+        }
+
+        // --- GAME 2: MATCHING (ROUNDS) ---
+        function renderMatching(round) {
+            matchingRound = round;
+            const startIdx = round * matchingItemsPerRound;
+            const endIdx = startIdx + matchingItemsPerRound;
+            const items = vocabList.slice(startIdx, endIdx);
+            
+            if (items.length === 0) {
+                 showCelebration();
+                 document.getElementById('matching-area').parentElement.innerHTML = `
+                    <div class="quiz-final">
+                        <span class="trophy">🏆</span>
+                        <h3>Matching Completed!</h3>
+                        <button onclick="location.reload()" class="retry-btn">Reset</button>
+                    </div>
+                 `;
+                 return;
+            }
+
+            totalRoundItems = items.length;
+            currentRoundMatches = 0;
+            
+            const totalRounds = Math.ceil(vocabList.length / matchingItemsPerRound);
+            document.getElementById('matching-level-indicator').innerText = `Round ${round + 1} / ${totalRounds}`;
+
+            const enItems = [...items].sort(() => Math.random() - 0.5);
+            const arItems = [...items].sort(() => Math.random() - 0.5);
+
+            const html = `
+                <div class="col-wrapper">
+                    ${enItems.map(i => `<div class="match-card en" data-id="${i.en}" onclick="selectMatch(this, 'en')">${i.en}</div>`).join('')}
+                </div>
+                <div class="col-wrapper">
+                    ${arItems.map(i => `<div class="match-card ar" data-id="${i.en}" onclick="selectMatch(this, 'ar')">${i.ar}</div>`).join('')}
+                </div>
+            `;
+            document.getElementById('matching-area').innerHTML = html;
+        }
+
+        let selectedEn = null;
+        let selectedAr = null;
+
+        window.selectMatch = function(btn, type) {
+            if (btn.classList.contains('matched')) return;
+
+            if (type === 'en') {
+                if (selectedEn) selectedEn.classList.remove('selected');
+                selectedEn = btn;
+            } else {
+                if (selectedAr) selectedAr.classList.remove('selected');
+                selectedAr = btn;
+            }
+            btn.classList.add('selected');
+
+            if (selectedEn && selectedAr) {
+                if (selectedEn.dataset.id === selectedAr.dataset.id) {
+                    // MATCH!
+                    selectedEn.classList.add('matched');
+                    selectedAr.classList.add('matched');
+                    playSound('success');
+                    selectedEn = null;
+                    selectedAr = null;
+                    currentRoundMatches++;
+                    if (currentRoundMatches === totalRoundItems) {
+                        setTimeout(() => {
+                            playSound('success');
+                            renderMatching(matchingRound + 1);
+                        }, 1000);
+                    }
+                } else {
+                    // NO MATCH
+                    playSound('error');
+                    setTimeout(() => {
+                        if (selectedEn) selectedEn.classList.remove('selected');
+                        if (selectedAr) selectedAr.classList.remove('selected');
+                        selectedEn = null;
+                        selectedAr = null;
+                    }, 600);
+                }
+            }
+        };
+
+        // --- GAME 3: FILL BLANKS ---
+        function renderFillBlanks() {
+            const container = document.getElementById('fill-blanks-area');
+            container.innerHTML = fillBlanksData.map((item, idx) => `
+                <div class="fill-blank-card" id="fb-${idx}">
+                    <p class="sentence">${item.sentence.replace('_____', '<span class="blank">____</span>')}</p>
+                    <div class="fb-options">
+                        ${item.options.map(opt => `
+                            <button onclick="checkFillBlank(${idx}, '${opt}', this)" class="fb-btn">${opt}</button>
+                        `).join('')}
+                    </div>
+                </div>
+            `).join('');
+        }
+
+        window.checkFillBlank = function(idx, selected, btn) {
+            const data = fillBlanksData[idx];
+            const card = document.getElementById(`fb-${idx}`);
+            const blank = card.querySelector('.blank');
+            if (selected === data.correct) {
+                blank.textContent = selected;
+                blank.classList.add('filled');
+                btn.classList.add('correct');
+                playSound('success');
+                // Disable all buttons in this card
+                card.querySelectorAll('.fb-btn').forEach(b => b.disabled = true);
+            } else {
+                btn.classList.add('wrong');
+                playSound('error');
+            }
+        };
+
+        // --- QUIZ ---
+        function renderQuiz() {
+            if (currentQuizIndex >= quizQuestions.length) {
+                document.getElementById('quiz-question-container').innerHTML = `
+                    <div class="quiz-final">
+                        <span class="trophy">🏆</span>
+                        <h3 class="final-title">Quiz Completed!</h3>
+                        <div class="final-score">Score: ${quizScore} / ${quizQuestions.length}</div>
+                        <button onclick="location.reload()" class="retry-btn">Reset Lesson</button>
+                    </div>
+                `;
+                return;
+            }
+            const q = quizQuestions[currentQuizIndex];
+            const html = `
+                <h3 class="q-text animate__animated animate__fadeIn">${q.q}</h3>
+                <div class="q-options animate__animated animate__fadeInUp">
+                    ${q.options.map((opt, idx) => `
+                        <button onclick="answerQuiz(${idx}, this)" class="q-btn">${opt}</button>
+                    `).join('')}
+                </div>
+            `;
+            document.getElementById('quiz-question-container').innerHTML = html;
+            document.getElementById('q-current').textContent = currentQuizIndex + 1;
+        }
+
+        window.answerQuiz = function(idx, btn) {
+            const q = quizQuestions[currentQuizIndex];
+            const buttons = document.querySelectorAll('.q-btn');
+            buttons.forEach(b => b.disabled = true);
+            
+            if (idx === q.correct) {
+                btn.classList.add('correct');
+                quizScore++;
+                document.getElementById('q-score').textContent = quizScore;
+                playSound('success');
+            } else {
+                btn.classList.add('wrong');
+                buttons[q.correct].classList.add('correct');
+                playSound('error');
+            }
+            setTimeout(() => {
+                currentQuizIndex++;
+                renderQuiz();
+            }, 1500);
+        };
+
+        // --- LESSON 2 JS ---
+
+        // 1. Pronoun Sorter
+        // 1. Pronoun Sorter (Mobile & Desktop)
+        function initDraggablePronouns() {
+            const draggables = document.querySelectorAll('.draggable-item');
+            const buckets = document.querySelectorAll('.sort-bucket');
+
+            // --- DESKTOP EVENTS ---
+            draggables.forEach(draggable => {
+                draggable.addEventListener('dragstart', () => { draggable.classList.add('dragging'); });
+                draggable.addEventListener('dragend', () => { draggable.classList.remove('dragging'); });
+                
+                // --- MOBILE TOUCH EVENTS ---
+                draggable.addEventListener('touchstart', handleTouchStart, {passive: false});
+                draggable.addEventListener('touchmove', handleTouchMove, {passive: false});
+                draggable.addEventListener('touchend', handleTouchEnd);
+            });
+
+            buckets.forEach(bucket => {
+                bucket.addEventListener('dragover', e => {
+                    e.preventDefault();
+                    bucket.classList.add('drag-over');
+                });
+                bucket.addEventListener('dragleave', () => { bucket.classList.remove('drag-over'); });
+                bucket.addEventListener('drop', e => {
+                    e.preventDefault();
+                    bucket.classList.remove('drag-over');
+                    const draggable = document.querySelector('.dragging');
+                    if(draggable) {
+                        bucket.querySelector('.bucket-content').appendChild(draggable);
+                        playSound('pop');
+                    }
+                });
+            });
+
+            // --- TOUCH LOGIC ---
+            let touchDragItem = null;
+            let touchStartX = 0;
+            let touchStartY = 0;
+            let initialTransform = '';
+
+            function handleTouchStart(e) {
+                if (!e.target.classList.contains('draggable-item')) return;
+                
+                touchDragItem = e.target;
+                e.preventDefault(); // Stop scrolling
+                
+                // Visual feedback
+                touchDragItem.classList.add('dragging');
+                touchDragItem.style.position = 'relative'; 
+                touchDragItem.style.zIndex = '1000';
+                touchDragItem.style.transition = 'none'; // Instant movement
+                
+                const touch = e.touches[0];
+                touchStartX = touch.clientX;
+                touchStartY = touch.clientY;
+                initialTransform = touchDragItem.style.transform;
+            }
+
+            function handleTouchMove(e) {
+                if (!touchDragItem) return;
+                e.preventDefault();
+                
+                const touch = e.touches[0];
+                const deltaX = touch.clientX - touchStartX;
+                const deltaY = touch.clientY - touchStartY;
+                
+                // Move element
+                touchDragItem.style.transform = `translate(${deltaX}px, ${deltaY}px)`;
+            }
+
+            function handleTouchEnd(e) {
+                if (!touchDragItem) return;
+                
+                // 1. Temporarily hide to find element below
+                touchDragItem.style.display = 'none';
+                const touch = e.changedTouches[0];
+                const elemBelow = document.elementFromPoint(touch.clientX, touch.clientY);
+                touchDragItem.style.display = 'inline-block'; // Restore (was flex/block etc based on CSS)
+                
+                // 2. Check overlap
+                const bucket = elemBelow ? elemBelow.closest('.sort-bucket') : null;
+                
+                if (bucket) {
+                    // SUCCESS DROP
+                    bucket.querySelector('.bucket-content').appendChild(touchDragItem);
+                    playSound('pop');
+                    
+                    // Add nice interaction
+                    bucket.classList.add('drag-over');
+                    setTimeout(() => bucket.classList.remove('drag-over'), 300);
+                }
+                
+                // 3. Cleanup Styles
+                touchDragItem.classList.remove('dragging');
+                touchDragItem.style.position = '';
+                touchDragItem.style.zIndex = '';
+                touchDragItem.style.transform = '';
+                touchDragItem.style.transition = '';
+                
+                touchDragItem = null;
+            }
+        }
+
+        function checkPronounSort() {
+            let correct = 0;
+            const wasContainer = document.getElementById('bucket-was').querySelector('.bucket-content');
+            const wereContainer = document.getElementById('bucket-were').querySelector('.bucket-content');
+            
+            // Check WAS
+            [...wasContainer.children].forEach(el => {
+                if (pronData.was.includes(el.innerText)) correct++;
+                else el.style.backgroundColor = '#ef476f';
+            });
+             // Check WERE
+            [...wereContainer.children].forEach(el => {
+                if (pronData.were.includes(el.innerText)) correct++;
+                else el.style.backgroundColor = '#ef476f';
+            });
+
+            const pronData = {
+                "was": ["I", "He", "She", "It"],
+                "were": ["You", "We", "They"]
+            };
+            
+            // Reset colors if correct
+            const allItems = document.querySelectorAll('.draggable-item');
+            let isAllCorrect = true;
+            allItems.forEach(el => {
+                const parentId = el.parentElement.parentElement.id; // bucket-was or bucket-were
+                const word = el.innerText;
+                const shouldBe = pronData.was.includes(word) ? 'bucket-was' : 'bucket-were';
+                
+                if (parentId === shouldBe) {
+                    el.style.backgroundColor = '#06d6a0'; // green
+                    el.style.color = 'white';
+                } else {
+                    el.style.backgroundColor = '#ef476f'; // red
+                    el.style.color = 'white';
+                    isAllCorrect = false;
+                }
+            });
+
+            if (isAllCorrect) {
+                 document.getElementById('sort-feedback').innerHTML = '<span style="color:green; font-weight:bold;">Excellent! All Correct!</span>';
+                 playSound('success');
+            } else {
+                 document.getElementById('sort-feedback').innerHTML = '<span style="color:red; font-weight:bold;">Some mistakes. Try again!</span>';
+                 playSound('error');
+            }
+        }
+
+        // 2. Dialogue
+        function checkDialogue() {
+            let allCorrect = true;
+            document.querySelectorAll('.d-input').forEach(inp => {
+                if (inp.value.toLowerCase().trim() === inp.dataset.ans) {
+                    inp.classList.add('correct');
+                    inp.classList.remove('wrong');
+                } else {
+                    inp.classList.add('wrong');
+                    inp.classList.remove('correct');
+                    allCorrect = false;
+                }
+            });
+            if (allCorrect) {
+                playSound('success');
+                showCelebration();
+            } else {
+                playSound('error');
+            }
+        }
+
+        // 3. Grammar Quiz
+        function renderGrammarQuiz() {
+            if (gQuizIndex >= grammarQuestions.length) {
+                const percentage = (gQuizScore / grammarQuestions.length) * 10;
+                document.getElementById('grammar-quiz-container').innerHTML = `
+                    <div class="quiz-final">
+                        <span class="trophy">🎓</span>
+                        <h3 class="final-title">Grammar Master!</h3>
+                        <div class="final-score">Score: ${gQuizScore} / 10</div>
+                        <p class="celeb-msg">You know your Past Progressive!</p>
+                        <button onclick="location.reload()" class="retry-btn">Finish Lesson</button>
+                    </div>
+                `;
+                showCelebration();
+                return;
+            }
+            const q = grammarQuestions[gQuizIndex];
+            const html = `
+                <h3 class="q-text animate__animated animate__fadeIn" style="font-size:1.8rem;">${gQuizIndex+1}. ${q.q}</h3>
+                <div class="q-options animate__animated animate__fadeInUp">
+                    ${q.options.map((opt, idx) => `
+                        <button onclick="answerGrammarQuiz(${idx}, this)" class="q-btn">${opt}</button>
+                    `).join('')}
+                </div>
+            `;
+            document.getElementById('grammar-quiz-container').innerHTML = html;
+            document.getElementById('gq-current').textContent = gQuizIndex + 1;
+        }
+
+        window.answerGrammarQuiz = function(idx, btn) {
+            const q = grammarQuestions[gQuizIndex];
+            const buttons = document.querySelectorAll('#grammar-quiz-container .q-btn');
+            buttons.forEach(b => b.disabled = true);
+            
+            if (idx === q.correct) {
+                btn.classList.add('correct');
+                gQuizScore++;
+                document.getElementById('gq-score').textContent = gQuizScore;
+                playSound('success');
+            } else {
+                btn.classList.add('wrong');
+                buttons[q.correct].classList.add('correct');
+                playSound('error');
+            }
+            setTimeout(() => {
+                gQuizIndex++;
+                renderGrammarQuiz();
+            }, 1500);
+        };